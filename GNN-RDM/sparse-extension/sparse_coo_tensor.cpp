@@ -11,6 +11,9 @@
 
 #include <pybind11/pybind11.h>
 
+#include <algorithm>
+#include <vector>
+
 #include <THC/THCGeneral.hpp>
 
 #include <torch/extension.h>
@@ -111,6 +114,81 @@ void printCusparseSpMat(int32_t rows, int32_t cols, int32_t nnz, int32_t *row_in
   delete [] col_indices_host;
 }
 
+// C += A * B on the CPU, with the same arguments and accumulate semantics as spmm_gpu.
+// A is an n x m COO matrix whose entries are sorted by row (i.e. coalesced), as cusparseXcoo2csr
+// also requires. Rows of C are independent, so they are split across threads with parallel_for.
+void spmm_cpu(const at::Tensor& A_rowindices, 
+                        const at::Tensor& A_colindices,
+                        const at::Tensor& A_values, 
+                        int32_t n,
+                        int32_t m,
+                        at::Tensor& B,
+                        at::Tensor& C) {
+
+    TORCH_CHECK(A_rowindices.device().is_cpu() && A_colindices.device().is_cpu() && A_values.device().is_cpu(),
+                    "spmm_cpu: A must be on the CPU");
+    TORCH_CHECK(B.device().is_cpu() && C.device().is_cpu(), "spmm_cpu: B and C must be on the CPU");
+    TORCH_CHECK(A_rowindices.scalar_type() == at::kInt && A_colindices.scalar_type() == at::kInt,
+                    "spmm_cpu: A indices must be int32, got ", A_rowindices.scalar_type(), " / ",
+                    A_colindices.scalar_type());
+    TORCH_CHECK(A_values.scalar_type() == at::kFloat && B.scalar_type() == at::kFloat &&
+                    C.scalar_type() == at::kFloat, "spmm_cpu: A values, B and C must be float32");
+    TORCH_CHECK(A_rowindices.numel() == A_values.numel() && A_colindices.numel() == A_values.numel(),
+                    "spmm_cpu: A indices and values differ in length");
+    TORCH_CHECK(B.dim() == 2 && C.dim() == 2 && B.size(0) == m && C.size(0) == n && B.size(1) == C.size(1),
+                    "spmm_cpu: expected B of ", m, " x k and C of ", n, " x k, got ", B.sizes(), " and ", C.sizes());
+
+    int64_t nnz = A_values.size(0);
+
+    at::Tensor rowindices = A_rowindices.contiguous();
+    at::Tensor colindices = A_colindices.contiguous();
+    at::Tensor values = A_values.contiguous();
+    at::Tensor B_loc = B.contiguous();
+    at::Tensor C_loc = C.is_contiguous() ? C : C.contiguous();
+
+    const int32_t *a_rows = rowindices.data_ptr<int32_t>();
+    const int32_t *a_cols = colindices.data_ptr<int32_t>();
+    const float *a_vals = values.data_ptr<float>();
+    const float *b = B_loc.data_ptr<float>();
+    float *c = C_loc.data_ptr<float>();
+
+    int64_t k = C_loc.size(1);
+
+    // coo2csr: count entries per row, then prefix sum into row offsets. The offsets only
+    // address each row's entries if they are contiguous, so unsorted rows are rejected
+    std::vector<int64_t> csrrows(n + 1, 0);
+    for (int64_t i = 0; i < nnz; i++) {
+        TORCH_CHECK(a_rows[i] >= 0 && a_rows[i] < n, "spmm_cpu: row index ", a_rows[i], " out of range [0, ", n, ")");
+        TORCH_CHECK(i == 0 || a_rows[i - 1] <= a_rows[i], "spmm_cpu: A must be sorted by row (coalesced), entry ",
+                        i, " has row ", a_rows[i], " after row ", a_rows[i - 1]);
+        csrrows[a_rows[i] + 1]++;
+    }
+    for (int64_t r = 0; r < n; r++) {
+        csrrows[r + 1] += csrrows[r];
+    }
+
+    // Aim for roughly 32K multiply-adds per task so tiny blocks stay on one thread
+    int64_t avg_row_work = std::max<int64_t>(1, (nnz / std::max<int32_t>(n, 1)) * k);
+    int64_t grain_size = std::max<int64_t>(1, 32768 / avg_row_work);
+
+    at::parallel_for(0, n, grain_size, [&](int64_t begin, int64_t end) {
+        for (int64_t r = begin; r < end; r++) {
+            float *c_row = c + r * k;
+            for (int64_t j = csrrows[r]; j < csrrows[r + 1]; j++) {
+                const float val = a_vals[j];
+                const float *b_row = b + static_cast<int64_t>(a_cols[j]) * k;
+                for (int64_t t = 0; t < k; t++) {
+                    c_row[t] += val * b_row[t];
+                }
+            }
+        }
+    });
+
+    if (!C.is_contiguous()) {
+        C.copy_(C_loc);
+    }
+}
+
 // at::Tensor spmm_gpu(const at::Tensor& A_rowindices, 
 void spmm_gpu(const at::Tensor& A_rowindices, 
                         const at::Tensor& A_colindices,
@@ -120,6 +198,12 @@ void spmm_gpu(const at::Tensor& A_rowindices,
                         at::Tensor& B,
                         at::Tensor& C) {
 
+    // CPU ranks (e.g. gloo runs without GPUs) take the CPU kernel, callers don't need to change
+    if (!C.is_cuda()) {
+        spmm_cpu(A_rowindices, A_colindices, A_values, n, m, B, C);
+        return;
+    }
+
     // cusparseHandle_t handle;
     // CHECK_CUSPARSE(cusparseCreate(&handle));
     auto state = at::globalContext().lazyInitCUDA();
@@ -228,5 +312,6 @@ void spmm_gpu(const at::Tensor& A_rowindices,
 
 PYBIND11_MODULE(TORCH_EXTENSION_NAME, m) {
     m.def("sparse_coo_tensor_gpu", &sparse_coo_tensor_gpu, "Sparse Tensor GPU-only constructor");
-    m.def("spmm_gpu", &spmm_gpu, "SpMM wrapper for cusparse");
+    m.def("spmm_gpu", &spmm_gpu, "SpMM wrapper for cusparse, falls back to spmm_cpu for CPU tensors");
+    m.def("spmm_cpu", &spmm_cpu, "Multithreaded CSR SpMM for CPU tensors");
 }
@@ -0,0 +1,84 @@
+import argparse
+import time
+
+import numpy as np
+import scipy.sparse as sp
+
+from graphsaint_norm import estimate_norm
+
+# The per-vertex loop Minibatch.set_sampler used before estimate_norm, kept here as the baseline
+def estimate_norm_loop(adj_train, node_train, node_val, node_test, subgraph_nodes, subgraph_edge_index):
+    norm_loss_train = np.zeros(adj_train.shape[0])
+    norm_aggr_train = np.zeros(adj_train.size).astype(np.float32)
+    num_subg = len(subgraph_nodes)
+    for i in range(num_subg):
+        norm_aggr_train[subgraph_edge_index[i]] += 1
+        norm_loss_train[subgraph_nodes[i]] += 1
+    assert norm_loss_train[node_val].sum() + norm_loss_train[node_test].sum() == 0
+    for v in range(adj_train.shape[0]):
+        i_s = adj_train.indptr[v]
+        i_e = adj_train.indptr[v + 1]
+        val = np.clip(norm_loss_train[v] / norm_aggr_train[i_s : i_e], 0, 1e4)
+        val[np.isnan(val)] = 0.1
+        norm_aggr_train[i_s : i_e] = val
+    norm_loss_train[np.where(norm_loss_train==0)[0]] = 0.1
+    norm_loss_train[node_val] = 0
+    norm_loss_train[node_test] = 0
+    norm_loss_train[node_train] = num_subg / norm_loss_train[node_train] / node_train.size
+    return norm_loss_train, norm_aggr_train
+
+def random_training_graph(nodes, degree, train_frac, seed=0):
+    # Edges only between training nodes, as in adj_train
+    rng = np.random.default_rng(seed)
+    perm = rng.permutation(nodes)
+    node_train = np.sort(perm[:int(nodes * train_frac)])
+    node_val, node_test = np.array_split(np.sort(perm[int(nodes * train_frac):]), 2)
+    nnz = node_train.size * degree
+    row = node_train[rng.integers(0, node_train.size, nnz)]
+    col = node_train[rng.integers(0, node_train.size, nnz)]
+    adj_train = sp.csr_matrix((np.ones(nnz), (row, col)), shape=(nodes, nodes))
+    adj_train.sum_duplicates()
+    return adj_train, node_train, node_val, node_test
+
+def node_subgraphs(adj_train, node_train, num_subg, size, seed=0):
+    # Induced subgraphs of random training nodes, edge_index being positions in adj_train.indices
+    rng = np.random.default_rng(seed)
+    row = np.repeat(np.arange(adj_train.shape[0]), np.diff(adj_train.indptr))
+    subgraph_nodes = []
+    subgraph_edge_index = []
+    for _ in range(num_subg):
+        nodes = np.sort(rng.choice(node_train, size, replace=False))
+        member = np.zeros(adj_train.shape[0], dtype=bool)
+        member[nodes] = True
+        subgraph_nodes.append(nodes)
+        subgraph_edge_index.append(np.nonzero(member[row] & member[adj_train.indices])[0])
+    return subgraph_nodes, subgraph_edge_index
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--nodes", type=int, default=1000000)
+    parser.add_argument("--degree", type=int, default=20)
+    parser.add_argument("--trainfrac", type=float, default=0.6)
+    parser.add_argument("--subgraphs", type=int, default=50)
+    parser.add_argument("--subgsize", type=int, default=50000)
+    args = parser.parse_args()
+
+    adj_train, node_train, node_val, node_test = random_training_graph(args.nodes, args.degree, args.trainfrac)
+    subgraph_nodes, subgraph_edge_index = node_subgraphs(adj_train, node_train, args.subgraphs, args.subgsize)
+    print(f"nodes: {args.nodes} nnz: {adj_train.nnz} subgraphs: {args.subgraphs}", flush=True)
+
+    inputs = (adj_train, node_train, node_val, node_test, subgraph_nodes, subgraph_edge_index)
+    tstart = time.time()
+    with np.errstate(divide='ignore', invalid='ignore'):
+        old_loss, old_aggr = estimate_norm_loop(*inputs)
+    old_t = time.time() - tstart
+
+    tstart = time.time()
+    new_loss, new_aggr = estimate_norm(*inputs)
+    new_t = time.time() - tstart
+
+    same = np.array_equal(old_loss, new_loss) and np.array_equal(old_aggr, new_aggr)
+    print(f"loop: {old_t:.4f}s vectorized: {new_t:.4f}s speedup: {old_t / new_t:.2f}x identical: {same}", flush=True)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,68 @@
+import argparse
+import time
+
+import torch
+
+from partition_utils import vtx_boundaries, split_coo_blocks
+
+# The mask-based split the drivers used before partition_utils, kept here as the baseline
+def split_coo_masked(adj_matrix, node_count, n_per_proc, dim):
+    vtx_indices = list(range(0, node_count, n_per_proc))
+    vtx_indices.append(node_count)
+
+    am_partitions = []
+    for i in range(len(vtx_indices) - 1):
+        am_part = adj_matrix[:,(adj_matrix[dim,:] >= vtx_indices[i]).nonzero().squeeze(1)]
+        am_part = am_part[:,(am_part[dim,:] < vtx_indices[i + 1]).nonzero().squeeze(1)]
+        am_part[dim] -= vtx_indices[i]
+        am_partitions.append(am_part)
+
+    return am_partitions, vtx_indices
+
+def powerlaw_coo(node_count, nnz, seed=0):
+    # Zipf-like endpoints so the blocks are as skewed as on the real graphs
+    gen = torch.Generator().manual_seed(seed)
+    weights = torch.arange(1, node_count + 1, dtype=torch.float).pow(-0.8)
+    src = torch.multinomial(weights, nnz, replacement=True, generator=gen)
+    dst = torch.randint(0, node_count, (nnz,), generator=gen)
+    perm = torch.randperm(node_count, generator=gen)
+    return torch.stack((perm[src], perm[dst]))
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--nodes", type=int, default=1000000)
+    parser.add_argument("--nnz", type=int, default=20000000)
+    parser.add_argument("--sizes", type=str, default="4,16,32,64")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    adj_matrix = powerlaw_coo(args.nodes, args.nnz)
+    print(f"nodes: {args.nodes} nnz: {adj_matrix.size(1)}", flush=True)
+
+    for size in [int(s) for s in args.sizes.split(',')]:
+        n_per_proc = (args.nodes + size - 1) // size
+        rank = size // 2
+
+        old_times = []
+        new_times = []
+        for _ in range(args.repeat):
+            tstart = time.time()
+            am_partitions, _ = split_coo_masked(adj_matrix, args.nodes, n_per_proc, 1)
+            am_pbyp, _ = split_coo_masked(am_partitions[rank], args.nodes, n_per_proc, 0)
+            old_times.append(time.time() - tstart)
+
+            tstart = time.time()
+            vtx_indices = vtx_boundaries(args.nodes, n_per_proc)
+            new_partitions, new_pbyp = split_coo_blocks(adj_matrix, vtx_indices, vtx_indices, rank)
+            new_times.append(time.time() - tstart)
+
+        same = all(torch.equal(a, b) for a, b in zip(am_partitions, new_partitions)) and \
+                    all(torch.equal(a, b) for a, b in zip(am_pbyp, new_pbyp))
+
+        old_t = min(old_times)
+        new_t = min(new_times)
+        print(f"size: {size} split_coo: {old_t:.4f}s bucket: {new_t:.4f}s "
+                f"speedup: {old_t / new_t:.2f}x identical: {same}", flush=True)
+
+if __name__ == '__main__':
+    main()
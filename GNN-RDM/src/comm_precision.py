@@ -0,0 +1,184 @@
+import torch
+import torch.distributed as dist
+
+COMM_DTYPES = dict(fp32=torch.float, fp16=torch.half, bf16=torch.bfloat16)
+
+# Smallest normal fp32 magnitude, keeps the exponent of an all-zero block finite
+_TINY = 2.0 ** -126
+
+
+def block_exponent(flat):
+    # Power-of-two scale that maps the block into [-1, 1]; computed on the device, no host sync
+    amax = flat.abs().amax().reshape(1) if flat.numel() > 0 else flat.new_zeros(1)
+    return torch.ceil(torch.log2(amax.clamp_min(_TINY)))
+
+
+class _PendingUnpack:
+    """
+    Async work handle whose wait() also upcasts the received wire buffer.
+    """
+    def __init__(self, work, finish):
+        self.work = work
+        self.finish = finish
+
+    def wait(self):
+        self.work.wait()
+        self.finish()
+        return True
+
+
+class CommPrecision:
+    """
+    Wire format for the dense traffic of the distributed kernels.
+
+    Operands stay fp32 in compute; pack() casts a block to the comm dtype
+    right before it is sent and unpack() upcasts it into the caller's fp32
+    buffer (the SpMM/GEMM accumulators never see reduced precision). fp32
+    is a no-op, so the kernels can call through unconditionally.
+
+    With scale=True every block is divided by a power of two so that its
+    largest magnitude is at most 1, and the exponent travels as one extra
+    wire element at the end of the block. This keeps fp16 from overflowing
+    (max 65504) or flushing small activations/gradients to zero; powers of
+    two make the scaling itself exact. Split exchanges (all-to-all) carry
+    one exponent per peer block, all-reduces agree on a single exponent
+    with a max-reduction first so the partial sums stay comparable.
+
+    Wire buffers come from `workspace.get_flex` when a workspace and a key
+    are given.
+    """
+    def __init__(self, name="fp32", scale=False, workspace=None):
+        if name not in COMM_DTYPES:
+            raise ValueError(f"unknown comm dtype {name}, expected one of {list(COMM_DTYPES)}")
+        self.name = name
+        self.dtype = COMM_DTYPES[name]
+        self.scale = scale and self.dtype != torch.float
+        self.workspace = workspace
+
+    @property
+    def enabled(self):
+        return self.dtype != torch.float
+
+    def __repr__(self):
+        return f"{self.name}{'+scale' if self.scale else ''}"
+
+    def wire_numel(self, numel):
+        return numel + 1 if self.scale else numel
+
+    def wire_splits(self, splits):
+        return [self.wire_numel(s) for s in splits]
+
+    def buffer(self, key, numel, device):
+        if self.workspace is None or key is None:
+            return torch.empty(numel, dtype=self.dtype, device=device)
+        return self.workspace.get_flex((key, "wire"), (numel,), device, self.dtype)
+
+    def pack(self, x, key=None, out=None):
+        flat = x.contiguous().view(-1)
+        wire = out if out is not None else self.buffer(key, self.wire_numel(flat.numel()), x.device)
+        if self.scale:
+            exp = block_exponent(flat)
+            wire[:-1].copy_(flat * torch.exp2(-exp))
+            wire[-1:].copy_(exp)
+        else:
+            wire.copy_(flat)
+        return wire
+
+    def unpack(self, wire, out):
+        flat = out.view(-1)
+        if self.scale:
+            flat.copy_(wire[:-1])
+            flat.mul_(torch.exp2(wire[-1:].float()))
+        else:
+            flat.copy_(wire)
+        return out
+
+    def pack_splits(self, flat, splits, key=None):
+        if not self.scale:
+            return self.pack(flat, key)
+        wire = self.buffer(key, sum(self.wire_splits(splits)), flat.device)
+        offset = wire_offset = 0
+        for s in splits:
+            self.pack(flat[offset:offset + s], out=wire[wire_offset:wire_offset + s + 1])
+            offset += s
+            wire_offset += s + 1
+        return wire
+
+    def unpack_splits(self, wire, splits, out):
+        if not self.scale:
+            return self.unpack(wire, out)
+        flat = out.view(-1)
+        offset = wire_offset = 0
+        for s in splits:
+            self.unpack(wire[wire_offset:wire_offset + s + 1], flat[offset:offset + s])
+            offset += s
+            wire_offset += s + 1
+        return out
+
+    def broadcast(self, tensor, src, group=None, key=None, async_op=False):
+        """
+        dist.broadcast of an fp32 tensor through the wire format. On src
+        `tensor` is the data, elsewhere the (contiguous) receive buffer it is
+        upcast into; with async_op the upcast happens in the handle's wait().
+        """
+        if not self.enabled:
+            return dist.broadcast(tensor, src, group=group, async_op=async_op)
+
+        if dist.get_rank() == src:
+            wire = self.pack(tensor, key)
+            return dist.broadcast(wire, src, group=group, async_op=async_op)
+
+        wire = self.buffer(key, self.wire_numel(tensor.numel()), tensor.device)
+        work = dist.broadcast(wire, src, group=group, async_op=async_op)
+        if async_op:
+            return _PendingUnpack(work, lambda: self.unpack(wire, tensor))
+        self.unpack(wire, tensor)
+        return work
+
+    def all_to_all(self, output, inputs, output_splits, input_splits, group=None, key=None):
+        """
+        dist.all_to_all_single of flat fp32 tensors (splits in elements)
+        through the wire format, one scale per peer block.
+        """
+        if not self.enabled:
+            return dist.all_to_all_single(output, inputs, output_splits, input_splits, group=group)
+
+        send = self.pack_splits(inputs, input_splits, (key, "send"))
+        recv = self.buffer((key, "recv"), sum(self.wire_splits(output_splits)), output.device)
+        dist.all_to_all_single(recv, send, self.wire_splits(output_splits), self.wire_splits(input_splits),
+                                group=group)
+        self.unpack_splits(recv, output_splits, output)
+
+    def all_reduce(self, tensor, group=None, key=None, async_op=False):
+        """
+        In-place sum of an fp32 tensor through the wire format. The scale is
+        the global max times the group size, so the sum cannot overflow.
+        With async_op only the (one element) max-reduction is blocking, the
+        handle's wait() finishes the sum and the upcast.
+        """
+        if not self.enabled:
+            return dist.all_reduce(tensor, op=dist.ReduceOp.SUM, group=group, async_op=async_op)
+
+        flat = tensor.view(-1)
+        wire = self.buffer(key, flat.numel(), tensor.device)
+        if self.scale:
+            amax = flat.abs().amax().reshape(1)
+            dist.all_reduce(amax, op=dist.ReduceOp.MAX, group=group)
+            exp = torch.ceil(torch.log2((amax * dist.get_world_size(group)).clamp_min(_TINY)))
+            wire.copy_(flat * torch.exp2(-exp))
+        else:
+            wire.copy_(flat)
+        work = dist.all_reduce(wire, op=dist.ReduceOp.SUM, group=group, async_op=async_op)
+
+        def finish():
+            flat.copy_(wire)
+            if self.scale:
+                flat.mul_(torch.exp2(exp))
+
+        if async_op:
+            return _PendingUnpack(work, finish)
+        finish()
+        return tensor
+
+    def bytes(self, numel):
+        return self.wire_numel(numel) * torch.empty(0, dtype=self.dtype).element_size()
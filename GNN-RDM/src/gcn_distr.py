@@ -26,36 +26,40 @@ from torch_scatter import scatter_add
 import torch_sparse
 
 from sparse_coo_tensor_cpp import sparse_coo_tensor_gpu, spmm_gpu
+from partition_utils import split_coo_blocks, norm_factors, scale_elements, partition_boundaries, \
+                                block_counts, distributed_accuracy
+from partition_cache import cached_partition
+from reorder import reorder_graph
+from workspace import Workspace
+from profiler import Profiler, aggregate, print_stats
+from comm_precision import CommPrecision
+from grad_reduce import GradReducer
 
 import socket
 import statistics
 import time
 import numpy as np
 
-# comp_time = 0.0
-# comm_time = 0.0
-# scomp_time = 0.0
-# dcomp_time = 0.0
-# bcast_comm_time = 0.0
-# bcast_words = 0
-# op1_comm_time = 0.0
-# op2_comm_time = 0.0
 total_time = dict()
-comp_time = dict()
-comm_time = dict()
-scomp_time = dict()
-dcomp_time = dict()
-bcast_comm_time = dict()
-barrier_time = dict()
-barrier_subset_time = dict()
-op1_comm_time = dict()
-op2_comm_time = dict()
+# Peak allocated device memory of each run
+peak_memory = dict()
+# Timers and counters of the current run (comm_time, bcast_comm_time, bcast_words, ...),
+# replaced in run(); per-run summaries are kept in run_stats for the median-run breakdown
+prof = Profiler(enabled=False)
+run_stats = dict()
+
+# Persistent buffers for broad_func, reused across layers and epochs
+workspace = Workspace()
+# Wire format of the broadcasts, exchanges and weight-gradient all-reduce
+comm = CommPrecision(workspace=workspace)
 
 epochs = 0
 graphname = ""
 mid_layer = 0
 timing = True
 normalization = False
+norm_type = "sym"
+partition_cache = ""
 activations = False
 accuracy = False
 device = None
@@ -63,36 +67,25 @@ acc_per_rank = 0
 run_count = 0
 run = 0
 download = False
-
-def start_time(group, rank, subset=False, src=None):
-    global barrier_time
-    global barrier_subset_time
-
-    if not timing:
-        return 0.0
-
-    barrier_tstart = time.time()
-
-    dist.barrier(group)
-    barrier_tstop = time.time()
-    barrier_time[run][rank] += barrier_tstop - barrier_tstart
-    if subset:
-        barrier_subset_time[run][rank] += barrier_tstop - barrier_tstart
-
-    tstart = 0.0
-    tstart = time.time()
-    return tstart
-
-def stop_time(group, rank, tstart):
-    if not timing:
-        return 0.0
-    dist.barrier(group)
-    devid = rank_to_devid(rank, acc_per_rank)
-    device = torch.device('cuda:{}'.format(devid))
-    # torch.cuda.synchronize(device=device)
-
-    tstop = time.time()
-    return tstop - tstart
+reorder_type = "none"
+# Row block boundaries: equal vertex counts, or equal nnz / nnz + rows (--balance)
+partition_balance = "vertex"
+# Rows of every rank's block, set in run()
+row_count = []
+use_cpu = False
+recompute = False
+pipeline = False
+sparse_comm = False
+# Set by sparse_exchange_plan when --sparsecomm is on, used by broad_func_sparse
+exchange_plan = None
+timing_sync = False
+profile_dir = ""
+comm_dtype = "fp32"
+comm_scale = False
+# Bucketed async weight-gradient all-reduce (--asyncgrad), set up in run() for each run's weights
+async_grad = False
+grad_bucket_mb = 25.0
+grad_reducer = None
 
 def normalize(adj_matrix):
     adj_matrix = adj_matrix + torch.eye(adj_matrix.size(0))
@@ -106,8 +99,7 @@ def block_row(adj_matrix, am_partitions, inputs, weight, rank, size):
     # n_per_proc = int(adj_matrix.size(1) / size)
     # am_partitions = list(torch.split(adj_matrix, n_per_proc, dim=1))
 
-    z_loc = torch.cuda.FloatTensor(n_per_proc, inputs.size(1)).fill_(0)
-    # z_loc = torch.zeros(adj_matrix.size(0), inputs.size(1))
+    z_loc = torch.zeros(n_per_proc, inputs.size(1), device=inputs.device)
 
     inputs_recv = torch.zeros(inputs.size())
 
@@ -142,32 +134,24 @@ def block_row(adj_matrix, am_partitions, inputs, weight, rank, size):
     return z_loc
 
 def outer_product(adj_matrix, grad_output, rank, size, group):
-    global comm_time
-    global comp_time
-    global dcomp_time
-    global op1_comm_time
     global run
 
 
     n_per_proc = math.ceil(float(adj_matrix.size(0)) / size)
 
-    tstart_comp = start_time(group, rank)
+    tstart_comp = prof.start()
 
     # A * G^l
     ag = torch.mm(adj_matrix, grad_output)
 
-    dur = stop_time(group, rank, tstart_comp)
-    comp_time[run][rank] += dur
-    dcomp_time[run][rank] += dur
+    prof.stop(tstart_comp, "comp_time", "dcomp_time")
 
-    tstart_comm = start_time(group, rank)
+    tstart_comm = prof.start()
 
     # reduction on A * G^l low-rank matrices
     dist.all_reduce(ag, op=dist.reduce_op.SUM, group=group)
 
-    dur = stop_time(group, rank, tstart_comm)
-    comm_time[run][rank] += dur
-    op1_comm_time[run][rank] += dur
+    prof.stop(tstart_comm, "comm_time", "op1_comm_time")
 
     # partition A * G^l by block rows and get block row for this process
     # TODO: this might not be space-efficient
@@ -176,82 +160,213 @@ def outer_product(adj_matrix, grad_output, rank, size, group):
 
     return grad_input
 
-def outer_product2(inputs, ag, rank, size, group):
-    global comm_time
-    global comp_time
-    global dcomp_time
-    global op2_comm_time
+def outer_product2(inputs, ag, rank, size, group, weight=None):
     global run
 
-    tstart_comp = start_time(group, rank)
+    tstart_comp = prof.start()
     # (H^(l-1))^T * (A * G^l)
     grad_weight = torch.mm(inputs, ag)
 
-    dur = stop_time(group, rank, tstart_comp)
-    comp_time[run][rank] += dur
-    dcomp_time[run][rank] += dur
+    prof.stop(tstart_comp, "comp_time", "dcomp_time")
+
+    if grad_reducer is not None:
+        # Summed with the rest of its bucket while backward goes on, train() waits before the step
+        grad_reducer.push(weight, grad_weight)
+        return None
 
-    tstart_comm = start_time(group, rank)
+    tstart_comm = prof.start()
     # reduction on grad_weight low-rank matrices
-    dist.all_reduce(grad_weight, op=dist.reduce_op.SUM, group=group)
+    comm.all_reduce(grad_weight, group=group, key="op2_reduce")
 
-    dur = stop_time(group, rank, tstart_comm)
-    comm_time[run][rank] += dur
-    op2_comm_time[run][rank] += dur
+    prof.stop(tstart_comm, "comm_time", "op2_comm_time")
 
     return grad_weight
 
-def broad_func(node_count, am_partitions, inputs, rank, size, group):
+def broad_func(node_count, am_partitions, inputs, rank, size, group, key=None):
     global device
-    global comm_time
-    global comp_time
-    global scomp_time
-    global bcast_comm_time
     global run
 
-    # n_per_proc = math.ceil(float(adj_matrix.size(1)) / size)
-    n_per_proc = math.ceil(float(node_count) / size)
+    if exchange_plan is not None:
+        return broad_func_sparse(node_count, am_partitions, inputs, rank, size, group, key)
+    if pipeline:
+        return broad_func_pipelined(node_count, am_partitions, inputs, rank, size, group, key)
 
     # z_loc = torch.cuda.FloatTensor(adj_matrix.size(0), inputs.size(1), device=device).fill_(0)
-    z_loc = torch.cuda.FloatTensor(am_partitions[0].size(0), inputs.size(1), device=device).fill_(0)
-    # z_loc = torch.zeros(adj_matrix.size(0), inputs.size(1))
-
-    inputs_recv = torch.cuda.FloatTensor(n_per_proc, inputs.size(1), device=device).fill_(0)
-    # inputs_recv = torch.zeros(n_per_proc, inputs.size(1))
+    # z_loc is the only buffer that is accumulated into, so it is the only one zeroed
+    z_loc = workspace.get((key, "z_loc"), (am_partitions[0].size(0), inputs.size(1)), device, zero=True)
 
     for i in range(size):
         if i == rank:
-            inputs_recv = inputs.clone()
-        elif i == size - 1:
-            inputs_recv = torch.cuda.FloatTensor(am_partitions[i].size(1), inputs.size(1), device=device).fill_(0)
-            # inputs_recv = torch.zeros(list(am_partitions[i].t().size())[1], inputs.size(1))
+            # The broadcast only reads the source block, so no copy is needed
+            inputs_recv = inputs.contiguous()
+        else:
+            # Each stage's SpMM consumes the block before the next broadcast, one buffer per shape is enough
+            inputs_recv = workspace.get((key, "bcast_recv"), (am_partitions[i].size(1), inputs.size(1)),
+                                            device)
+
+        tstart_comm = prof.start()
+
+        comm.broadcast(inputs_recv, src=i, group=group, key=(key, "bcast_wire"))
+
+        prof.stop(tstart_comm, "comm_time", "bcast_comm_time", f"stage_comm_time/{i}")
+        if i != rank:
+            prof.count("bcast_words", inputs_recv.numel())
+            prof.count("bcast_bytes", comm.bytes(inputs_recv.numel()))
+
+        tstart_comp = prof.start()
+
+        spmm_gpu(am_partitions[i].indices()[0].int(), am_partitions[i].indices()[1].int(),
+                        am_partitions[i].values(), am_partitions[i].size(0),
+                        am_partitions[i].size(1), inputs_recv, z_loc)
+
+        prof.stop(tstart_comp, "comp_time", "scomp_time", f"stage_comp_time/{i}")
+
+    return z_loc
 
-        tstart_comm = start_time(group, rank)
+def broad_func_pipelined(node_count, am_partitions, inputs, rank, size, group, key=None):
+    """
+    broad_func with the broadcast of block i + 1 in flight while block i's
+    SpMM runs. Receive buffers alternate between two workspace slots, so the
+    broadcast posted after stage i's SpMM never overwrites the block that
+    SpMM is still reading.
+
+    The stage regions never synchronize, so they record what each stage
+    actually waits for: stage_comm_time is the broadcast time left exposed
+    after the overlap and stage_comp_time is the SpMM time. pipeline_time
+    covers the whole call.
+    """
+    z_loc = workspace.get((key, "z_loc"), (am_partitions[0].size(0), inputs.size(1)), device, zero=True)
+
+    def post_bcast(i):
+        if i == rank:
+            inputs_recv = inputs.contiguous()
+        else:
+            inputs_recv = workspace.get((key, "bcast_recv", i % 2), (am_partitions[i].size(1), inputs.size(1)),
+                                            device)
+        return inputs_recv, comm.broadcast(inputs_recv, src=i, group=group, key=(key, "bcast_wire", i % 2),
+                                            async_op=True)
 
-        dist.broadcast(inputs_recv, src=i, group=group)
+    tstart = prof.start()
 
-        dur = stop_time(group, rank, tstart_comm)
-        comm_time[run][rank] += dur
-        bcast_comm_time[run][rank] += dur
+    inputs_recv, work = post_bcast(0)
+    for i in range(size):
+        tstart_comm = prof.start(sync=False)
+        work.wait()
+        prof.stop(tstart_comm, "comm_time", "bcast_comm_time", f"stage_comm_time/{i}", sync=False)
+        if i != rank:
+            prof.count("bcast_words", inputs_recv.numel())
+            prof.count("bcast_bytes", comm.bytes(inputs_recv.numel()))
 
-        tstart_comp = start_time(group, rank)
+        if i + 1 < size:
+            next_recv, work = post_bcast(i + 1)
 
+        tstart_comp = prof.start(sync=False)
         spmm_gpu(am_partitions[i].indices()[0].int(), am_partitions[i].indices()[1].int(),
                         am_partitions[i].values(), am_partitions[i].size(0),
                         am_partitions[i].size(1), inputs_recv, z_loc)
+        prof.stop(tstart_comp, "comp_time", "scomp_time", f"stage_comp_time/{i}", sync=False)
+
+        if i + 1 < size:
+            inputs_recv = next_recv
+
+    prof.stop(tstart, "pipeline_time")
+    return z_loc
+
+def sparse_exchange_plan(am_pbyp, rank, size, group):
+    """
+    Precompute which rows of H each rank needs from every other rank.
+
+    am_pbyp[i] (already transposed, n_rank x n_i) only reads the rows of H_i
+    that appear in its column indices. Those rows are listed once per
+    partition, their counts and ids are swapped with two all-to-alls so that
+    every rank knows what to send, and the columns of am_pbyp[i] are
+    renumbered to index the compacted block of received rows.
+    """
+    recv_rows = []
+    am_compact = []
+    for i in range(size):
+        if i == rank:
+            recv_rows.append(torch.zeros(0, dtype=torch.long, device=device))
+            am_compact.append(am_pbyp[i])
+            continue
+
+        indices = am_pbyp[i]._indices()
+        cols, local_cols = torch.unique(indices[1], sorted=True, return_inverse=True)
+        recv_rows.append(cols)
+        am_compact.append(torch.sparse_coo_tensor(torch.stack((indices[0], local_cols)),
+                                                    am_pbyp[i]._values(),
+                                                    size=(am_pbyp[i].size(0), cols.size(0)),
+                                                    requires_grad=False).coalesce())
+
+    recv_counts = torch.tensor([r.size(0) for r in recv_rows], dtype=torch.long, device=device)
+    send_counts = torch.zeros(size, dtype=torch.long, device=device)
+    dist.all_to_all_single(send_counts, recv_counts, group=group)
+    recv_counts = recv_counts.tolist()
+    send_counts = send_counts.tolist()
+
+    send_rows = torch.zeros(sum(send_counts), dtype=torch.long, device=device)
+    dist.all_to_all_single(send_rows, torch.cat(recv_rows), send_counts, recv_counts, group=group)
+
+    full_rows = sum(am_pbyp[i].size(1) for i in range(size) if i != rank)
+    print(f"rank: {rank} sparse_comm rows: {sum(recv_counts)} / {full_rows}", flush=True)
+
+    return dict(am=am_compact, send_rows=send_rows, send_counts=send_counts,
+                    recv_counts=recv_counts)
+
+def broad_func_sparse(node_count, am_partitions, inputs, rank, size, group, key=None):
+    """
+    broad_func with the P broadcasts replaced by a single all-to-all-v that
+    only moves the rows of H each rank's SpMMs read (see sparse_exchange_plan).
+    The local block is used in place, the remote blocks are multiplied with
+    the column-compacted partitions of the plan.
+    """
+
+    plan = exchange_plan
+    am_compact = plan["am"]
+
+    z_loc = workspace.get((key, "z_loc"), (am_compact[0].size(0), inputs.size(1)), device, zero=True)
+    send_buf = workspace.get((key, "a2a_send"), (plan["send_rows"].size(0), inputs.size(1)), device)
+    recv_buf = workspace.get((key, "a2a_recv"), (sum(plan["recv_counts"]), inputs.size(1)), device)
+    torch.index_select(inputs, 0, plan["send_rows"], out=send_buf)
+
+    tstart_comm = prof.start()
+
+    f = inputs.size(1)
+    comm.all_to_all(recv_buf.view(-1), send_buf.view(-1), [c * f for c in plan["recv_counts"]],
+                        [c * f for c in plan["send_counts"]], group=group, key=(key, "a2a_wire"))
+
+    prof.stop(tstart_comm, "comm_time", "bcast_comm_time")
+    prof.count("bcast_words", recv_buf.numel())
+    prof.count("bcast_bytes", sum(comm.bytes(c * f) for c in plan["recv_counts"]))
+
+    tstart_comp = prof.start()
+
+    recv_parts = torch.split(recv_buf, plan["recv_counts"], dim=0)
+    for i in range(size):
+        inputs_recv = inputs.contiguous() if i == rank else recv_parts[i]
+        if am_compact[i]._nnz() == 0:
+            continue
+
+        spmm_gpu(am_compact[i].indices()[0].int(), am_compact[i].indices()[1].int(),
+                        am_compact[i].values(), am_compact[i].size(0),
+                        am_compact[i].size(1), inputs_recv, z_loc)
 
-        dur = stop_time(group, rank, tstart_comp)
-        comp_time[run][rank] += dur
-        scomp_time[run][rank] += dur
+    prof.stop(tstart_comp, "comp_time", "scomp_time")
 
     return z_loc
 
+def activation_grad(func, h, grad_output):
+    # Derivative of the activation expressed through its output h = func(z), so z need not be kept
+    if func is F.log_softmax:
+        return grad_output - h.exp() * grad_output.sum(dim=1, keepdim=True)
+    elif func is F.relu:
+        return grad_output * (h > 0)
+    else:
+        return grad_output
+
 class GCNFunc(torch.autograd.Function):
     @staticmethod
-    def forward(ctx, inputs, weight, adj_matrix, am_partitions, rank, size, group, func):
-        global comm_time
-        global comp_time
-        global dcomp_time
+    def forward(ctx, inputs, weight, adj_matrix, am_partitions, rank, size, group, func, layer):
         global run
 
         # inputs: H
@@ -260,27 +375,26 @@ class GCNFunc(torch.autograd.Function):
         # func: sigma
 
         # adj_matrix = adj_matrix.to_dense()
-        ctx.save_for_backward(inputs, weight, adj_matrix)
         ctx.am_partitions = am_partitions
         ctx.rank = rank
         ctx.size = size
         ctx.group = group
 
         ctx.func = func
+        ctx.layer = layer
 
         # z = block_row(adj_matrix.t(), am_partitions, inputs, weight, rank, size)
-        z = broad_func(adj_matrix.size(0), am_partitions, inputs, rank, size, group)
+        z = broad_func(adj_matrix.size(0), am_partitions, inputs, rank, size, group, (layer, "fwd"))
 
-        tstart_comp = start_time(group, rank)
+        tstart_comp = prof.start()
 
         z = torch.mm(z, weight)
 
-        dur = stop_time(group, rank, tstart_comp)
-        comp_time[run][rank] += dur
-        dcomp_time[run][rank] += dur
+        prof.stop(tstart_comp, "comp_time", "dcomp_time")
 
-        z.requires_grad = True
-        ctx.z = z
+        if not recompute:
+            z.requires_grad = True
+            ctx.z = z
 
         if activations:
             if func is F.log_softmax:
@@ -289,28 +403,35 @@ class GCNFunc(torch.autograd.Function):
                 h = func(z)
             else:
                 h = z
+        else:
+            h = z
 
-            return h
+        if recompute:
+            # Keep the output instead of z: it is the next layer's input anyway
+            ctx.save_for_backward(inputs, weight, adj_matrix, h)
         else:
-            return z
+            ctx.save_for_backward(inputs, weight, adj_matrix)
+        return h
 
     @staticmethod
     def backward(ctx, grad_output):
-        global comm_time
-        global comp_time
-        global dcomp_time
         global run
 
-        inputs, weight, adj_matrix = ctx.saved_tensors
+        if recompute:
+            inputs, weight, adj_matrix, h = ctx.saved_tensors
+        else:
+            inputs, weight, adj_matrix = ctx.saved_tensors
         am_partitions = ctx.am_partitions
         rank = ctx.rank
         size = ctx.size
         group = ctx.group
 
         func = ctx.func
-        z = ctx.z
 
-        if activations:
+        if activations and recompute:
+            grad_output = activation_grad(func, h, grad_output)
+        elif activations:
+            z = ctx.z
             with torch.set_grad_enabled(True):
                 if func is F.log_softmax:
                     func_eval = func(z, dim=1)
@@ -323,28 +444,27 @@ class GCNFunc(torch.autograd.Function):
                 grad_output = sigmap
 
         # First backprop equation
-        ag = broad_func(adj_matrix.size(0), am_partitions, grad_output, rank, size, group)
+        ag = broad_func(adj_matrix.size(0), am_partitions, grad_output, rank, size, group,
+                            (ctx.layer, "bwd"))
 
-        tstart_comp = start_time(group, rank)
+        tstart_comp = prof.start()
 
         grad_input = torch.mm(ag, weight.t())
 
-        dur = stop_time(group, rank, tstart_comp)
-        comp_time[run][rank] += dur
-        dcomp_time[run][rank] += dur
+        prof.stop(tstart_comp, "comp_time", "dcomp_time")
 
         # Second backprop equation (reuses the A * G^l computation)
-        grad_weight = outer_product2(inputs.t(), ag, rank, size, group)
+        grad_weight = outer_product2(inputs.t(), ag, rank, size, group, weight)
 
-        return grad_input, grad_weight, None, None, None, None, None, None
+        return grad_input, grad_weight, None, None, None, None, None, None, None
 
 def train(inputs, weight1, weight2, adj_matrix, am_partitions, optimizer, data, rank, size, group):
-    outputs = GCNFunc.apply(inputs, weight1, adj_matrix, am_partitions, rank, size, group, F.relu)
-    outputs = GCNFunc.apply(outputs, weight2, adj_matrix, am_partitions, rank, size, group, F.log_softmax)
+    outputs = GCNFunc.apply(inputs, weight1, adj_matrix, am_partitions, rank, size, group, F.relu, 0)
+    outputs = GCNFunc.apply(outputs, weight2, adj_matrix, am_partitions, rank, size, group, F.log_softmax, 1)
 
     optimizer.zero_grad()
-    rank_train_mask = torch.split(data.train_mask.bool(), outputs.size(0), dim=0)[rank]
-    datay_rank = torch.split(data.y, outputs.size(0), dim=0)[rank]
+    rank_train_mask = torch.split(data.train_mask.bool(), row_count, dim=0)[rank]
+    datay_rank = torch.split(data.y, row_count, dim=0)[rank]
 
     # Note: bool type removes warnings, unsure of perf penalty
     # loss = F.nll_loss(outputs[data.train_mask.bool()], data.y[data.train_mask.bool()])
@@ -354,118 +474,19 @@ def train(inputs, weight1, weight2, adj_matrix, am_partitions, optimizer, data,
         # loss = F.nll_loss(outputs, torch.max(datay_rank, 1)[1])
         loss.backward()
     else:
-        fake_loss = (outputs * torch.cuda.FloatTensor(outputs.size(), device=device).fill_(0)).sum()
+        fake_loss = (outputs * torch.zeros(outputs.size(), device=device)).sum()
         # fake_loss = (outputs * torch.zeros(outputs.size())).sum()
         fake_loss.backward()
 
+    if grad_reducer is not None:
+        tstart_comm = prof.start()
+        grad_reducer.finish()
+        prof.stop(tstart_comm, "comm_time", "op2_comm_time")
+
     optimizer.step()
 
     return outputs
 
-def test(outputs, data, vertex_count, rank):
-    logits, accs = outputs, []
-    for _, mask in data('train_mask', 'val_mask', 'test_mask'):
-        pred = logits[mask].max(1)[1]
-        acc = pred.eq(data.y[mask]).sum().item() / mask.sum().item()
-        accs.append(acc)
-
-    if len(accs) == 1:
-        accs.append(0)
-        accs.append(0)
-
-    return accs
-    # logits, accs = outputs, []
-    # datay_rank = torch.split(data.y, vertex_count)[rank]
-    # for _, mask in data('train_mask', 'val_mask', 'test_mask'):
-    #     mask_rank = torch.split(mask, vertex_count)[rank]
-    #     count = mask_rank.nonzero().size(0)
-    #     if count > 0:
-    #         pred = logits[mask_rank].max(1)[1]
-    #         acc = pred.eq(datay_rank[mask_rank]).sum().item() / mask_rank.sum().item()
-    #         # pred = logits[mask].max(1)[1]
-    #         # acc = pred.eq(data.y[mask]).sum().item() / mask.sum().item()
-    #     else:
-    #         acc = -1
-    #     accs.append(acc)
-    # return accs
-
-
-# Split a COO into partitions of size n_per_proc
-# Basically torch.split but for Sparse Tensors since pytorch doesn't support that.
-def split_coo(adj_matrix, node_count, n_per_proc, dim):
-    vtx_indices = list(range(0, node_count, n_per_proc))
-    vtx_indices.append(node_count)
-
-    am_partitions = []
-    for i in range(len(vtx_indices) - 1):
-        am_part = adj_matrix[:,(adj_matrix[dim,:] >= vtx_indices[i]).nonzero().squeeze(1)]
-        am_part = am_part[:,(am_part[dim,:] < vtx_indices[i + 1]).nonzero().squeeze(1)]
-        am_part[dim] -= vtx_indices[i]
-        am_partitions.append(am_part)
-
-    return am_partitions, vtx_indices
-
-# Normalize all elements according to KW's normalization rule
-def scale_elements(adj_matrix, adj_part, node_count, row_vtx, col_vtx):
-    if not normalization:
-        return adj_part
-
-    # Scale each edge (u, v) by 1 / (sqrt(u) * sqrt(v))
-    # indices = adj_part._indices()
-    # values = adj_part._values()
-
-    # deg_map = dict()
-    # for i in range(adj_part._nnz()):
-    #     u = indices[0][i] + row_vtx
-    #     v = indices[1][i] + col_vtx
-
-    #     if u.item() in deg_map:
-    #         degu = deg_map[u.item()]
-    #     else:
-    #         degu = (adj_matrix[0] == u).sum().item()
-    #         deg_map[u.item()] = degu
-
-    #     if v.item() in deg_map:
-    #         degv = deg_map[v.item()]
-    #     else:
-    #         degv = (adj_matrix[0] == v).sum().item()
-    #         deg_map[v.item()] = degv
-
-    #     values[i] = values[i] / (math.sqrt(degu) * math.sqrt(degv))
-
-    adj_part = adj_part.coalesce()
-    deg = torch.histc(adj_matrix[0].double(), bins=node_count)
-    deg = deg.pow(-0.5)
-
-    row_len = adj_part.size(0)
-    col_len = adj_part.size(1)
-
-    dleft = torch.sparse_coo_tensor([np.arange(0, row_len).tolist(),
-                                     np.arange(0, row_len).tolist()],
-                                     deg[row_vtx:(row_vtx + row_len)].float(),
-                                     size=(row_len, row_len),
-                                     requires_grad=False, device=torch.device("cpu"))
-
-    dright = torch.sparse_coo_tensor([np.arange(0, col_len).tolist(),
-                                     np.arange(0, col_len).tolist()],
-                                     deg[col_vtx:(col_vtx + col_len)].float(),
-                                     size=(col_len, col_len),
-                                     requires_grad=False, device=torch.device("cpu"))
-    # adj_part = torch.sparse.mm(torch.sparse.mm(dleft, adj_part), dright)
-    ad_ind, ad_val = torch_sparse.spspmm(adj_part._indices(), adj_part._values(),
-                                            dright._indices(), dright._values(),
-                                            adj_part.size(0), adj_part.size(1), dright.size(1))
-
-    adj_part_ind, adj_part_val = torch_sparse.spspmm(dleft._indices(), dleft._values(),
-                                                        ad_ind, ad_val,
-                                                        dleft.size(0), dleft.size(1), adj_part.size(1))
-
-    adj_part = torch.sparse_coo_tensor(adj_part_ind, adj_part_val,
-                                                size=(adj_part.size(0), adj_part.size(1)),
-                                                requires_grad=False, device=torch.device("cpu"))
-
-    return adj_part
-
 def symmetric(adj_matrix):
     print(adj_matrix)
     # not sure whether the following is needed
@@ -483,7 +504,6 @@ def symmetric(adj_matrix):
 
 def oned_partition(rank, size, inputs, adj_matrix, data, features, classes, device):
     node_count = inputs.size(0)
-    n_per_proc = math.ceil(float(node_count) / size)
 
     am_partitions = None
     am_pbyp = None
@@ -494,27 +514,21 @@ def oned_partition(rank, size, inputs, adj_matrix, data, features, classes, devi
     # Compute the adj_matrix and inputs partitions for this process
     # TODO: Maybe I do want grad here. Unsure.
     with torch.no_grad():
-        # Column partitions
-        am_partitions, vtx_indices = split_coo(adj_matrix, node_count, n_per_proc, 1)
+        # Degrees are computed once for the whole graph, each block only gathers them
+        norm = norm_factors(adj_matrix, node_count, norm_type if normalization else "none")
+
+        # Column partitions and the row blocks of this process' column in one bucket sort each
+        vtx_indices = partition_boundaries(adj_matrix, node_count, size, partition_balance)
+        am_partitions, am_pbyp = split_coo_blocks(adj_matrix, vtx_indices, vtx_indices, rank)
 
         proc_node_count = vtx_indices[rank + 1] - vtx_indices[rank]
-        am_pbyp, _ = split_coo(am_partitions[rank], node_count, n_per_proc, 0)
         for i in range(len(am_pbyp)):
-            if i == size - 1:
-                last_node_count = vtx_indices[i + 1] - vtx_indices[i]
-                am_pbyp[i] = torch.sparse_coo_tensor(am_pbyp[i], torch.ones(am_pbyp[i].size(1)),
-                                                        size=(last_node_count, proc_node_count),
-                                                        requires_grad=False)
-
-                am_pbyp[i] = scale_elements(adj_matrix, am_pbyp[i], node_count, vtx_indices[i],
-                                                vtx_indices[rank])
-            else:
-                am_pbyp[i] = torch.sparse_coo_tensor(am_pbyp[i], torch.ones(am_pbyp[i].size(1)),
-                                                        size=(n_per_proc, proc_node_count),
-                                                        requires_grad=False)
+            block_node_count = vtx_indices[i + 1] - vtx_indices[i]
+            am_pbyp[i] = torch.sparse_coo_tensor(am_pbyp[i], torch.ones(am_pbyp[i].size(1)),
+                                                    size=(block_node_count, proc_node_count),
+                                                    requires_grad=False)
 
-                am_pbyp[i] = scale_elements(adj_matrix, am_pbyp[i], node_count, vtx_indices[i],
-                                                vtx_indices[rank])
+            am_pbyp[i] = scale_elements(am_pbyp[i], norm, vtx_indices[i], vtx_indices[rank])
 
         for i in range(len(am_partitions)):
             proc_node_count = vtx_indices[i + 1] - vtx_indices[i]
@@ -522,9 +536,9 @@ def oned_partition(rank, size, inputs, adj_matrix, data, features, classes, devi
                                                     torch.ones(am_partitions[i].size(1)),
                                                     size=(node_count, proc_node_count),
                                                     requires_grad=False)
-            am_partitions[i] = scale_elements(adj_matrix, am_partitions[i], node_count,  0, vtx_indices[i])
+            am_partitions[i] = scale_elements(am_partitions[i], norm, 0, vtx_indices[i])
 
-        input_partitions = torch.split(inputs, math.ceil(float(inputs.size(0)) / size), dim=0)
+        input_partitions = torch.split(inputs, block_counts(vtx_indices), dim=0)
 
         adj_matrix_loc = am_partitions[rank]
         inputs_loc = input_partitions[rank]
@@ -537,7 +551,6 @@ def run(rank, size, inputs, adj_matrix, data, features, classes, device):
     global epochs
     global mid_layer
     global run
-    global timing
 
     best_val_acc = test_acc = 0
     outputs = None
@@ -549,14 +562,30 @@ def run(rank, size, inputs, adj_matrix, data, features, classes, device):
     # adj_matrix_loc = torch.rand(node_count, n_per_proc)
     # inputs_loc = torch.rand(n_per_proc, inputs.size(1))
 
-    inputs_loc, adj_matrix_loc, am_pbyp = oned_partition(rank, size, inputs, adj_matrix, data,
-                                                                features, classes, device)
+    inputs_loc, adj_matrix_loc, am_pbyp = cached_partition(partition_cache, graphname, "1d", rank, size,
+                                        adj_matrix, inputs,
+                                        lambda: oned_partition(rank, size, inputs, adj_matrix, data,
+                                                                features, classes, device),
+                                        norm_type if normalization else "none", partition_balance)
 
     inputs_loc = inputs_loc.to(device)
     adj_matrix_loc = adj_matrix_loc.to(device)
     for i in range(len(am_pbyp)):
         am_pbyp[i] = am_pbyp[i].t().coalesce().to(device)
 
+    # Block i of H has as many rows as the columns of am_pbyp[i]
+    global row_count
+    row_count = [am_pbyp[i].size(1) for i in range(len(am_pbyp))]
+    print(f"rank: {rank} balance: {partition_balance} rows: {row_count[rank]} nnz: {adj_matrix_loc._nnz()}",
+            flush=True)
+
+    global comm
+    comm = CommPrecision(comm_dtype, comm_scale, workspace)
+
+    global exchange_plan
+    if sparse_comm:
+        exchange_plan = sparse_exchange_plan(am_pbyp, rank, size, group)
+
     for i in range(run_count):
         run = i
         torch.manual_seed(0)
@@ -572,39 +601,28 @@ def run(rank, size, inputs, adj_matrix, data, features, classes, device):
         weight2 = Parameter(weight2_nonleaf)
 
         optimizer = torch.optim.Adam([weight1, weight2], lr=0.01)
+
+        global grad_reducer
+        if async_grad:
+            grad_reducer = GradReducer([weight1, weight2], group, grad_bucket_mb, comm, workspace)
         dist.barrier(group)
 
         tstart = 0.0
         tstop = 0.0
 
         total_time[i] = dict()
-        comm_time[i] = dict()
-        comp_time[i] = dict()
-        scomp_time[i] = dict()
-        dcomp_time[i] = dict()
-        bcast_comm_time[i] = dict()
-        barrier_time[i] = dict()
-        barrier_subset_time[i] = dict()
-        op1_comm_time[i] = dict()
-        op2_comm_time[i] = dict()
-
         total_time[i][rank] = 0.0
-        comm_time[i][rank] = 0.0
-        comp_time[i][rank] = 0.0
-        scomp_time[i][rank] = 0.0
-        dcomp_time[i][rank] = 0.0
-        bcast_comm_time[i][rank] = 0.0
-        barrier_time[i][rank] = 0.0
-        barrier_subset_time[i][rank] = 0.0
-        op1_comm_time[i][rank] = 0.0
-        op2_comm_time[i][rank] = 0.0
-
-        timing_on = timing == True
-        timing = False
+        if not use_cpu:
+            torch.cuda.reset_peak_memory_stats(device)
+
+        global prof
+        prof = Profiler(rank, device, enabled=False, trace=bool(profile_dir),
+                            sync_group=group if timing_sync else None)
+
+        # Warm-up epoch, not profiled
         outputs = train(inputs_loc, weight1, weight2, adj_matrix_loc, am_pbyp, optimizer, data,
                                 rank, size, group)
-        if timing_on:
-            timing = True
+        prof.enabled = timing
 
         dist.barrier(group)
         tstart = time.time()
@@ -622,26 +640,9 @@ def run(rank, size, inputs, adj_matrix, data, features, classes, device):
             print("Epoch: {:03d}".format(epoch), flush=True)
             cumulative_time += time.time()-ep_s
             if len(args.acc_csv)>2:
-                # All-gather outputs to test accuracy
-                output_parts = []
-                n_per_proc = math.ceil(float(inputs.size(0)) / size)
-                # print(f"rows: {am_pbyp[-1].size(0)} cols: {classes}", flush=True)
-                for i in range(size):
-                    output_parts.append(torch.cuda.FloatTensor(n_per_proc, classes, device=device).fill_(0))
-
-                if outputs.size(0) != n_per_proc:
-                    pad_row = n_per_proc - outputs.size(0)
-                    outputs = torch.cat((outputs, torch.cuda.FloatTensor(pad_row, classes, device=device)), dim=0)
-
-                dist.all_gather(output_parts, outputs)
-                output_parts[rank] = outputs
-
-                padding = inputs.size(0) - n_per_proc * (size - 1)
-                output_parts[size - 1] = output_parts[size - 1][:padding,:]
-
-                outputs = torch.cat(output_parts, dim=0)
-
-                train_acc, val_acc, tmp_test_acc = test(outputs, data, am_pbyp[0].size(1), rank)
+                # Each rank counts its own rows, only the counts are all-reduced
+                train_acc, val_acc, tmp_test_acc = distributed_accuracy(outputs, data, sum(row_count[:rank]),
+                                                                            group)
                 if val_acc > best_val_acc:
                     best_val_acc = val_acc
                     test_acc = tmp_test_acc
@@ -661,6 +662,12 @@ def run(rank, size, inputs, adj_matrix, data, features, classes, device):
         # dist.barrier(group)
         tstop = time.time()
         total_time[i][rank] = tstop - tstart
+        peak_memory[i] = torch.cuda.max_memory_allocated(device) if not use_cpu else 0
+
+        run_stats[run] = prof.summary()
+        if profile_dir:
+            prof.write_json(osp.join(profile_dir, f"run{run}", f"rank{rank}.json"))
+            prof.write_trace(osp.join(profile_dir, f"run{run}", f"rank{rank}.trace.json"))
 
     # Get median runtime according to rank0 and print that run's breakdown
     dist.barrier(group)
@@ -672,23 +679,33 @@ def run(rank, size, inputs, adj_matrix, data, features, classes, device):
         print(f"total_times_r0: {total_times_r0}")
         median_run_time = statistics.median(total_times_r0)
         median_idx = total_times_r0.index(median_run_time)
-        median_idx = torch.cuda.LongTensor([median_idx])
+        median_idx = torch.tensor([median_idx], device=device)
     else:
-        median_idx = torch.cuda.LongTensor([0])
+        median_idx = torch.tensor([0], device=device)
 
     dist.broadcast(median_idx, src=0, group=group)
     median_idx = median_idx.item()
     print(f"rank: {rank} median_run: {median_idx}")
     print(f"rank: {rank} total_time: {total_time[median_idx][rank]}")
-    print(f"rank: {rank} comm_time: {comm_time[median_idx][rank]}")
-    print(f"rank: {rank} comp_time: {comp_time[median_idx][rank]}")
-    print(f"rank: {rank} scomp_time: {scomp_time[median_idx][rank]}")
-    print(f"rank: {rank} dcomp_time: {dcomp_time[median_idx][rank]}")
-    print(f"rank: {rank} bcast_comm_time: {bcast_comm_time[median_idx][rank]}")
-    print(f"rank: {rank} barrier_time: {barrier_time[median_idx][rank]}")
-    print(f"rank: {rank} barrier_subset_time: {barrier_subset_time[median_idx][rank]}")
-    print(f"rank: {rank} op1_comm_time: {op1_comm_time[median_idx][rank]}")
-    print(f"rank: {rank} op2_comm_time: {op2_comm_time[median_idx][rank]}")
+    print(f"rank: {rank} peak_memory_bytes: {peak_memory[median_idx]} recompute: {recompute}")
+    totals = run_stats[median_idx]["totals"]
+    counters = run_stats[median_idx]["counters"]
+    for name in ["comm_time", "comp_time", "scomp_time", "dcomp_time", "bcast_comm_time"]:
+        print(f"rank: {rank} {name}: {totals.get(name, 0.0)}")
+    print(f"rank: {rank} bcast_words: {counters.get('bcast_words', 0)}")
+    print(f"rank: {rank} bcast_words_per_epoch: {counters.get('bcast_words', 0) // max(epochs, 1)}")
+    print(f"rank: {rank} bcast_bytes: {counters.get('bcast_bytes', 0)} comm_precision: {comm}")
+    for name in ["op1_comm_time", "op2_comm_time", "pipeline_time"]:
+        print(f"rank: {rank} {name}: {totals.get(name, 0.0)}")
+    print(f"rank: {rank} async_grad: {async_grad} grad_bucket_mb: {grad_bucket_mb}")
+    for name in ["stage_comm_time", "stage_comp_time"]:
+        print(f"rank: {rank} {name}: {[totals.get(f'{name}/{j}', 0.0) for j in range(size)]}")
+    workspace.report(rank)
+
+    # Cross-rank min/mean/max of the median run, one collective for the whole breakdown
+    _, stats = aggregate(run_stats[median_idx], group)
+    if rank == 0:
+        print_stats(stats)
     print(f"rank: {rank} {outputs}")
 
     if len(args.csv)>1 and rank==0:
@@ -703,26 +720,8 @@ def run(rank, size, inputs, adj_matrix, data, features, classes, device):
 
 
     if accuracy:
-        # All-gather outputs to test accuracy
-        output_parts = []
-        n_per_proc = math.ceil(float(inputs.size(0)) / size)
-        # print(f"rows: {am_pbyp[-1].size(0)} cols: {classes}", flush=True)
-        for i in range(size):
-            output_parts.append(torch.cuda.FloatTensor(n_per_proc, classes, device=device).fill_(0))
-
-        if outputs.size(0) != n_per_proc:
-            pad_row = n_per_proc - outputs.size(0)
-            outputs = torch.cat((outputs, torch.cuda.FloatTensor(pad_row, classes, device=device)), dim=0)
-
-        dist.all_gather(output_parts, outputs)
-        output_parts[rank] = outputs
-
-        padding = inputs.size(0) - n_per_proc * (size - 1)
-        output_parts[size - 1] = output_parts[size - 1][:padding,:]
-
-        outputs = torch.cat(output_parts, dim=0)
-
-        train_acc, val_acc, tmp_test_acc = test(outputs, data, am_pbyp[0].size(1), rank)
+        # Each rank counts its own rows, only the counts are all-reduced
+        train_acc, val_acc, tmp_test_acc = distributed_accuracy(outputs, data, sum(row_count[:rank]), group)
         if val_acc > best_val_acc:
             best_val_acc = val_acc
             test_acc = tmp_test_acc
@@ -764,19 +763,22 @@ def main():
         #    os.environ["MASTER_ADDR"] = "127.0.0.1"
 
         #os.environ["MASTER_PORT"] = "1234"
-        dist.init_process_group(backend='nccl')
+        # CPU ranks communicate over gloo, spmm_gpu dispatches to the CPU kernel for CPU tensors
+        dist.init_process_group(backend='gloo' if use_cpu else 'nccl')
         rank = dist.get_rank()
         size = dist.get_world_size()
         print("Processes: " + str(size))
 
-        # device = torch.device('cpu')
-        devid = rank_to_devid(rank, acc_per_rank)
-        device = torch.device('cuda:{}'.format(devid))
+        if use_cpu:
+            device = torch.device('cpu')
+        else:
+            devid = rank_to_devid(rank, acc_per_rank)
+            device = torch.device('cuda:{}'.format(devid))
+            torch.cuda.set_device(device)
+            curr_devid = torch.cuda.current_device()
+            # print(f"curr_devid: {curr_devid}", flush=True)
+            devcount = torch.cuda.device_count()
         print(f"device: {device}")
-        torch.cuda.set_device(device)
-        curr_devid = torch.cuda.current_device()
-        # print(f"curr_devid: {curr_devid}", flush=True)
-        devcount = torch.cuda.device_count()
 
     if graphname == "Cora":
         path = osp.join(osp.dirname(osp.realpath(__file__)), '..', 'data', graphname)
@@ -938,6 +940,10 @@ def main():
     else:
         adj_matrix = edge_index
 
+    # Renumber the vertices for locality before they are cut into contiguous blocks
+    adj_matrix, inputs, _ = reorder_graph(reorder_type, adj_matrix, inputs, data,
+                                              size, rank)
+
 
     init_process(rank, size, inputs, adj_matrix, data, num_features, num_classes, device, outputs,
                     run)
@@ -955,9 +961,25 @@ if __name__ == '__main__':
     parser.add_argument("--midlayer", type=int)
     parser.add_argument("--runcount", type=int)
     parser.add_argument("--normalization", type=str)
+    parser.add_argument("--normtype", type=str, default="sym")
+    parser.add_argument("--partcache", type=str, default="")
+    parser.add_argument("--reorder", type=str, default="none")
+    parser.add_argument("--balance", type=str, default="vertex")
     parser.add_argument("--activations", type=str)
     parser.add_argument("--accuracy", type=str)
     parser.add_argument("--download", type=bool)
+    parser.add_argument("--cpu", type=str, default="False",
+                            help="run on CPU ranks over gloo; only this 1D driver supports it, the 1.5D, 2D, 3D "
+                                    "and RDM drivers allocate their buffers on the GPU")
+    parser.add_argument("--recompute", type=str, default="False")
+    parser.add_argument("--pipeline", type=str, default="False")
+    parser.add_argument("--sparsecomm", type=str, default="False")
+    parser.add_argument("--timingsync", type=str, default="False")
+    parser.add_argument("--profiledir", type=str, default="")
+    parser.add_argument("--commdtype", type=str, default="fp32")
+    parser.add_argument("--commscale", type=str, default="False")
+    parser.add_argument("--asyncgrad", type=str, default="False")
+    parser.add_argument("--gradbucket", type=float, default=25.0)
     parser.add_argument("--csv", type=str, default='')
     parser.add_argument("--acc_csv", type=str, default='')
 
@@ -972,9 +994,23 @@ if __name__ == '__main__':
     mid_layer = args.midlayer
     run_count = args.runcount
     normalization = args.normalization == "True"
+    norm_type = args.normtype
+    partition_cache = args.partcache
+    reorder_type = args.reorder
+    partition_balance = args.balance
     activations = args.activations == "True"
     accuracy = args.accuracy == "True"
     download = args.download
+    use_cpu = args.cpu == "True"
+    recompute = args.recompute == "True"
+    pipeline = args.pipeline == "True"
+    sparse_comm = args.sparsecomm == "True"
+    timing_sync = args.timingsync == "True"
+    profile_dir = args.profiledir
+    comm_dtype = args.commdtype
+    comm_scale = args.commscale == "True"
+    async_grad = args.asyncgrad == "True"
+    grad_bucket_mb = args.gradbucket
 
     if not download:
         if (epochs is None) or (graphname is None) or (timing is None) or (mid_layer is None) or (run_count is None):
@@ -26,36 +26,31 @@ from torch_scatter import scatter_add
 import torch_sparse
 
 from sparse_coo_tensor_cpp import sparse_coo_tensor_gpu, spmm_gpu
+from partition_utils import split_coo_blocks, norm_factors, scale_elements, partition_boundaries, \
+                                block_counts, distributed_accuracy
+from partition_cache import cached_partition
+from reorder import reorder_graph
+from grad_reduce import GradReducer
+from profiler import Profiler
 
 import socket
 import statistics
 import time
 import numpy as np
 
-# comp_time = 0.0
-# comm_time = 0.0
-# scomp_time = 0.0
-# dcomp_time = 0.0
-# bcast_comm_time = 0.0
-# bcast_words = 0
-# op1_comm_time = 0.0
-# op2_comm_time = 0.0
 total_time = dict()
-comp_time = dict()
-comm_time = dict()
-scomp_time = dict()
-dcomp_time = dict()
-bcast_comm_time = dict()
-bcast_words = dict()
-reduce_comm_time = dict()
-op_comm_time = dict()
-barrier_time = dict()
+# Timers and counters of the current run (comm_time, bcast_comm_time, bcast_words, ...),
+# replaced in run(); per-run summaries are kept in run_stats for the median-run breakdown
+prof = Profiler(enabled=False)
+run_stats = dict()
 
 epochs = 0
 graphname = ""
 mid_layer = 0
 timing = True
 normalization = False
+norm_type = "sym"
+partition_cache = ""
 activations = False
 accuracy = False
 device = None
@@ -64,40 +59,17 @@ run_count = 0
 run = 0
 replication = 0
 download = False
-
-def start_time(group, rank, subset=False, src=None):
-    global barrier_time
-    global run
-
-    if not timing:
-        return 0.0
-    if group is not None:
-        barrier_tstart = time.time()
-        # dist.barrier(group)
-        torch.cuda.synchronize(device=device)
-        barrier_tstop = time.time()
-        barrier_time[run][rank] += barrier_tstop - barrier_tstart
-    tstart = 0.0
-    if rank == 0:
-        tstart = time.time()
-    return tstart
-
-def stop_time(group, rank, tstart):
-    global barrier_time
-    global run
-
-    if not timing:
-        return 0.0
-    if group is not None:
-        barrier_tstart = time.time()
-        # dist.barrier(group)
-        torch.cuda.synchronize(device=device)
-        barrier_tstop = time.time()
-        barrier_time[run][rank] += barrier_tstop - barrier_tstart
-    tstop = 0.0
-    if rank == 0:
-        tstop = time.time()
-    return tstop - tstart
+reorder_type = "none"
+# Row block boundaries: equal vertex counts, or equal nnz / nnz + rows (--balance)
+partition_balance = "vertex"
+# Rows of every process row's block, set in run()
+row_count = []
+# Bucketed async weight-gradient all-reduce (--asyncgrad), set up in run() for each run's weights
+async_grad = False
+grad_bucket_mb = 25.0
+grad_reducer = None
+timing_sync = False
+profile_dir = ""
 
 def normalize(adj_matrix):
     adj_matrix = adj_matrix + torch.eye(adj_matrix.size(0))
@@ -146,39 +118,31 @@ def block_row(adj_matrix, am_partitions, inputs, weight, rank, size):
     # z_loc = torch.mm(z_loc, weight)
     return z_loc
 
-def outer_product2(inputs, ag, rank, size, group):
-    global comm_time
-    global comp_time
-    global dcomp_time
+def outer_product2(inputs, ag, rank, size, group, weight=None):
     global op_comm_time
     global run
 
-    tstart_comp = start_time(group, rank)
+    tstart_comp = prof.start()
     # (H^(l-1))^T * (A * G^l)
     grad_weight = torch.mm(inputs, ag)
 
-    dur = stop_time(group, rank, tstart_comp)
-    comp_time[run][rank] += dur
-    dcomp_time[run][rank] += dur
+    prof.stop(tstart_comp, "comp_time", "dcomp_time")
 
-    tstart_comm = start_time(group, rank)
+    if grad_reducer is not None:
+        # Summed with the rest of its bucket while backward goes on, train() waits before the step
+        grad_reducer.push(weight, grad_weight)
+        return None
+
+    tstart_comm = prof.start()
     # reduction on grad_weight low-rank matrices
     dist.all_reduce(grad_weight, op=dist.reduce_op.SUM, group=group)
 
-    dur = stop_time(group, rank, tstart_comm)
-    comm_time[run][rank] += dur
-    op_comm_time[run][rank] += dur
+    prof.stop(tstart_comm, "comm_time", "op_comm_time")
 
     return grad_weight
 
 def broad_func(node_count, am_partitions, inputs, rank, size, row_groups, col_groups, group):
     global device
-    global comm_time
-    global comp_time
-    global scomp_time
-    global bcast_comm_time
-    global bcast_words
-    global reduce_comm_time
     global run
     global replication
 
@@ -189,7 +153,7 @@ def broad_func(node_count, am_partitions, inputs, rank, size, row_groups, col_gr
     z_loc = torch.cuda.FloatTensor(am_partitions[0].size(0), inputs.size(1), device=device).fill_(0)
     # z_loc = torch.zeros(adj_matrix.size(0), inputs.size(1))
 
-    inputs_recv = torch.cuda.FloatTensor(n_per_proc, inputs.size(1), device=device).fill_(0)
+    # inputs_recv = torch.cuda.FloatTensor(n_per_proc, inputs.size(1), device=device).fill_(0)
     # inputs_recv = torch.zeros(n_per_proc, inputs.size(1))
 
     rank_c = rank // replication
@@ -210,48 +174,38 @@ def broad_func(node_count, am_partitions, inputs, rank, size, row_groups, col_gr
 
         if q == rank:
             inputs_recv = inputs.clone()
-        elif q_c == size // replication - 1:
+        else:
+            # Blocks differ in size with --balance nnz/cost, so every receive is sized by its partition
             inputs_recv = torch.cuda.FloatTensor(am_partitions[am_partid].size(1), inputs.size(1), device=device).fill_(0)
             # inputs_recv = torch.zeros(list(am_partitions[i].t().size())[1], inputs.size(1))
 
-        tstart_comm = start_time(col_groups[rank_col], rank)
+        tstart_comm = prof.start()
 
         inputs_recv = inputs_recv.contiguous()
-        bcast_words[run][rank] += inputs_recv.size(0) * inputs_recv.size(1)
+        prof.count("bcast_words", inputs_recv.numel())
         dist.broadcast(inputs_recv, src=q, group=col_groups[rank_col])
 
-        dur = stop_time(col_groups[rank_col], rank, tstart_comm)
+        prof.stop(tstart_comm, "comm_time", "bcast_comm_time")
 
-        comm_time[run][rank] += dur
-        bcast_comm_time[run][rank] += dur
-
-        tstart_comp = start_time(col_groups[rank_col], rank)
+        tstart_comp = prof.start()
 
         spmm_gpu(am_partitions[am_partid].indices()[0].int(), am_partitions[am_partid].indices()[1].int(),
                         am_partitions[am_partid].values(), am_partitions[am_partid].size(0),
                         am_partitions[am_partid].size(1), inputs_recv, z_loc)
 
-        dur = stop_time(col_groups[rank_col], rank, tstart_comp)
-        comp_time[run][rank] += dur
-        scomp_time[run][rank] += dur
+        prof.stop(tstart_comp, "comp_time", "scomp_time")
 
     z_loc = z_loc.contiguous()
 
-    tstart_comm = start_time(row_groups[rank_c], rank)
+    tstart_comm = prof.start()
     dist.all_reduce(z_loc, op=dist.reduce_op.SUM, group=row_groups[rank_c])
-    dur = stop_time(row_groups[rank_c], rank, tstart_comm)
-
-    comm_time[run][rank] += dur
-    reduce_comm_time[run][rank] += dur
+    prof.stop(tstart_comm, "comm_time", "reduce_comm_time")
 
     return z_loc
 
 class GCNFunc(torch.autograd.Function):
     @staticmethod
     def forward(ctx, inputs, weight, adj_matrix, am_partitions, rank, size, group, row_groups, col_groups, func):
-        global comm_time
-        global comp_time
-        global dcomp_time
         global run
 
         # inputs: H
@@ -273,13 +227,11 @@ class GCNFunc(torch.autograd.Function):
         # z = block_row(adj_matrix.t(), am_partitions, inputs, weight, rank, size)
         z = broad_func(adj_matrix.size(0), am_partitions, inputs, rank, size, row_groups, col_groups, group)
 
-        tstart_comp = start_time(row_groups[0], rank)
+        tstart_comp = prof.start()
 
         z = torch.mm(z, weight)
 
-        dur = stop_time(row_groups[0], rank, tstart_comp)
-        comp_time[run][rank] += dur
-        dcomp_time[run][rank] += dur
+        prof.stop(tstart_comp, "comp_time", "dcomp_time")
 
         z.requires_grad = True
         ctx.z = z
@@ -298,9 +250,6 @@ class GCNFunc(torch.autograd.Function):
 
     @staticmethod
     def backward(ctx, grad_output):
-        global comm_time
-        global comp_time
-        global dcomp_time
         global run
 
         inputs, weight, adj_matrix = ctx.saved_tensors
@@ -332,17 +281,15 @@ class GCNFunc(torch.autograd.Function):
         # ag = outer_product(adj_matrix, grad_output, rank, size, group)
         ag = broad_func(adj_matrix.size(0), am_partitions, grad_output, rank, size, row_groups, col_groups, group)
 
-        tstart_comp = start_time(group, rank)
+        tstart_comp = prof.start()
 
         grad_input = torch.mm(ag, weight.t())
 
-        dur = stop_time(group, rank, tstart_comp)
-        comp_time[run][rank] += dur
-        dcomp_time[run][rank] += dur
+        prof.stop(tstart_comp, "comp_time", "dcomp_time")
 
         # Second backprop equation (reuses the A * G^l computation)
         # grad_weight = outer_product2(inputs.t(), ag, rank, size, group)
-        grad_weight = outer_product2(inputs.t(), ag, rank, size, col_groups[rank_col])
+        grad_weight = outer_product2(inputs.t(), ag, rank, size, col_groups[rank_col], weight)
 
         return grad_input, grad_weight, None, None, None, None, None, None, None, None
 
@@ -355,8 +302,8 @@ def train(inputs, weight1, weight2, adj_matrix, am_partitions, optimizer, data,
 
     rank_c = rank // replication
 
-    rank_train_mask = torch.split(data.train_mask.bool(), outputs.size(0), dim=0)[rank_c]
-    datay_rank = torch.split(data.y, outputs.size(0), dim=0)[rank_c]
+    rank_train_mask = torch.split(data.train_mask.bool(), row_count, dim=0)[rank_c]
+    datay_rank = torch.split(data.y, row_count, dim=0)[rank_c]
 
     # Note: bool type removes warnings, unsure of perf penalty
     # loss = F.nll_loss(outputs[data.train_mask.bool()], data.y[data.train_mask.bool()])
@@ -370,33 +317,15 @@ def train(inputs, weight1, weight2, adj_matrix, am_partitions, optimizer, data,
         # fake_loss = (outputs * torch.zeros(outputs.size())).sum()
         fake_loss.backward()
 
+    if grad_reducer is not None:
+        tstart_comm = prof.start()
+        grad_reducer.finish()
+        prof.stop(tstart_comm, "comm_time", "op_comm_time")
+
     optimizer.step()
 
     return outputs
 
-def test(outputs, data, vertex_count, rank):
-    logits, accs = outputs, []
-    for _, mask in data('train_mask', 'val_mask', 'test_mask'):
-        mask = mask.bool()
-        pred = logits[mask].max(1)[1]
-        acc = pred.eq(data.y[mask]).sum().item() / mask.sum().item()
-        accs.append(acc)
-    return accs
-    # logits, accs = outputs, []
-    # datay_rank = torch.split(data.y, vertex_count)[rank]
-    # for _, mask in data('train_mask', 'val_mask', 'test_mask'):
-    #     mask_rank = torch.split(mask, vertex_count)[rank]
-    #     count = mask_rank.nonzero().size(0)
-    #     if count > 0:
-    #         pred = logits[mask_rank].max(1)[1]
-    #         acc = pred.eq(datay_rank[mask_rank]).sum().item() / mask_rank.sum().item()
-    #         # pred = logits[mask].max(1)[1]
-    #         # acc = pred.eq(data.y[mask]).sum().item() / mask.sum().item()
-    #     else:
-    #         acc = -1
-    #     accs.append(acc)
-    # return accs
-
 def get_proc_groups(rank, size):
     global replication
 
@@ -420,82 +349,6 @@ def get_proc_groups(rank, size):
 
     return row_groups, col_groups
 
-# Split a COO into partitions of size n_per_proc
-# Basically torch.split but for Sparse Tensors since pytorch doesn't support that.
-def split_coo(adj_matrix, node_count, n_per_proc, dim):
-    vtx_indices = list(range(0, node_count, n_per_proc))
-    vtx_indices.append(node_count)
-
-    am_partitions = []
-    for i in range(len(vtx_indices) - 1):
-        am_part = adj_matrix[:,(adj_matrix[dim,:] >= vtx_indices[i]).nonzero().squeeze(1)]
-        am_part = am_part[:,(am_part[dim,:] < vtx_indices[i + 1]).nonzero().squeeze(1)]
-        am_part[dim] -= vtx_indices[i]
-        am_partitions.append(am_part)
-
-    return am_partitions, vtx_indices
-
-# Normalize all elements according to KW's normalization rule
-def scale_elements(adj_matrix, adj_part, node_count, row_vtx, col_vtx):
-    if not normalization:
-        return adj_part
-
-    # Scale each edge (u, v) by 1 / (sqrt(u) * sqrt(v))
-    # indices = adj_part._indices()
-    # values = adj_part._values()
-
-    # deg_map = dict()
-    # for i in range(adj_part._nnz()):
-    #     u = indices[0][i] + row_vtx
-    #     v = indices[1][i] + col_vtx
-
-    #     if u.item() in deg_map:
-    #         degu = deg_map[u.item()]
-    #     else:
-    #         degu = (adj_matrix[0] == u).sum().item()
-    #         deg_map[u.item()] = degu
-
-    #     if v.item() in deg_map:
-    #         degv = deg_map[v.item()]
-    #     else:
-    #         degv = (adj_matrix[0] == v).sum().item()
-    #         deg_map[v.item()] = degv
-
-    #     values[i] = values[i] / (math.sqrt(degu) * math.sqrt(degv))
-
-    adj_part = adj_part.coalesce()
-    deg = torch.histc(adj_matrix[0].double(), bins=node_count)
-    deg = deg.pow(-0.5)
-
-    row_len = adj_part.size(0)
-    col_len = adj_part.size(1)
-
-    dleft = torch.sparse_coo_tensor([np.arange(0, row_len).tolist(),
-                                     np.arange(0, row_len).tolist()],
-                                     deg[row_vtx:(row_vtx + row_len)].float(),
-                                     size=(row_len, row_len),
-                                     requires_grad=False, device=torch.device("cpu"))
-
-    dright = torch.sparse_coo_tensor([np.arange(0, col_len).tolist(),
-                                     np.arange(0, col_len).tolist()],
-                                     deg[col_vtx:(col_vtx + col_len)].float(),
-                                     size=(col_len, col_len),
-                                     requires_grad=False, device=torch.device("cpu"))
-    # adj_part = torch.sparse.mm(torch.sparse.mm(dleft, adj_part), dright)
-    ad_ind, ad_val = torch_sparse.spspmm(adj_part._indices(), adj_part._values(),
-                                            dright._indices(), dright._values(),
-                                            adj_part.size(0), adj_part.size(1), dright.size(1))
-
-    adj_part_ind, adj_part_val = torch_sparse.spspmm(dleft._indices(), dleft._values(),
-                                                        ad_ind, ad_val,
-                                                        dleft.size(0), dleft.size(1), adj_part.size(1))
-
-    adj_part = torch.sparse_coo_tensor(adj_part_ind, adj_part_val,
-                                                size=(adj_part.size(0), adj_part.size(1)),
-                                                requires_grad=False, device=torch.device("cpu"))
-
-    return adj_part
-
 def symmetric(adj_matrix):
     print(adj_matrix)
     # not sure whether the following is needed
@@ -516,7 +369,7 @@ def symmetric(adj_matrix):
 def oned_partition(rank, size, inputs, adj_matrix, data, features, classes, device):
     node_count = inputs.size(0)
     # n_per_proc = math.ceil(float(node_count) / size)
-    n_per_proc = math.ceil(float(node_count) / (size / replication))
+    # n_per_proc = math.ceil(float(node_count) / (size / replication))
 
     am_partitions = None
     am_pbyp = None
@@ -528,27 +381,21 @@ def oned_partition(rank, size, inputs, adj_matrix, data, features, classes, devi
     # Compute the adj_matrix and inputs partitions for this process
     # TODO: Maybe I do want grad here. Unsure.
     with torch.no_grad():
-        # Column partitions
-        am_partitions, vtx_indices = split_coo(adj_matrix, node_count, n_per_proc, 1)
+        # Degrees are computed once for the whole graph, each block only gathers them
+        norm = norm_factors(adj_matrix, node_count, norm_type if normalization else "none")
+
+        # Column partitions and the row blocks of this process' column in one bucket sort each
+        vtx_indices = partition_boundaries(adj_matrix, node_count, size // replication, partition_balance)
+        am_partitions, am_pbyp = split_coo_blocks(adj_matrix, vtx_indices, vtx_indices, rank_c)
 
         proc_node_count = vtx_indices[rank_c + 1] - vtx_indices[rank_c]
-        am_pbyp, _ = split_coo(am_partitions[rank_c], node_count, n_per_proc, 0)
         for i in range(len(am_pbyp)):
-            if i == size // replication - 1:
-                last_node_count = vtx_indices[i + 1] - vtx_indices[i]
-                am_pbyp[i] = torch.sparse_coo_tensor(am_pbyp[i], torch.ones(am_pbyp[i].size(1)),
-                                                        size=(last_node_count, proc_node_count),
-                                                        requires_grad=False)
-
-                am_pbyp[i] = scale_elements(adj_matrix, am_pbyp[i], node_count, vtx_indices[i],
-                                                vtx_indices[rank_c])
-            else:
-                am_pbyp[i] = torch.sparse_coo_tensor(am_pbyp[i], torch.ones(am_pbyp[i].size(1)),
-                                                        size=(n_per_proc, proc_node_count),
-                                                        requires_grad=False)
+            block_node_count = vtx_indices[i + 1] - vtx_indices[i]
+            am_pbyp[i] = torch.sparse_coo_tensor(am_pbyp[i], torch.ones(am_pbyp[i].size(1)),
+                                                    size=(block_node_count, proc_node_count),
+                                                    requires_grad=False)
 
-                am_pbyp[i] = scale_elements(adj_matrix, am_pbyp[i], node_count, vtx_indices[i],
-                                                vtx_indices[rank_c])
+            am_pbyp[i] = scale_elements(am_pbyp[i], norm, vtx_indices[i], vtx_indices[rank_c])
 
         for i in range(len(am_partitions)):
             proc_node_count = vtx_indices[i + 1] - vtx_indices[i]
@@ -556,9 +403,9 @@ def oned_partition(rank, size, inputs, adj_matrix, data, features, classes, devi
                                                     torch.ones(am_partitions[i].size(1)),
                                                     size=(node_count, proc_node_count),
                                                     requires_grad=False)
-            am_partitions[i] = scale_elements(adj_matrix, am_partitions[i], node_count,  0, vtx_indices[i])
+            am_partitions[i] = scale_elements(am_partitions[i], norm, 0, vtx_indices[i])
 
-        input_partitions = torch.split(inputs, math.ceil(float(inputs.size(0)) / (size / replication)), dim=0)
+        input_partitions = torch.split(inputs, block_counts(vtx_indices), dim=0)
 
         adj_matrix_loc = am_partitions[rank_c]
         inputs_loc = input_partitions[rank_c]
@@ -570,7 +417,6 @@ def oned_partition(rank, size, inputs, adj_matrix, data, features, classes, devi
 def run(rank, size, inputs, adj_matrix, data, features, classes, device):
     global epochs
     global mid_layer
-    global timing
     global run
 
     best_val_acc = test_acc = 0
@@ -587,14 +433,23 @@ def run(rank, size, inputs, adj_matrix, data, features, classes, device):
     if rank_c >= (size // replication):
         return
 
-    inputs_loc, adj_matrix_loc, am_pbyp = oned_partition(rank, size, inputs, adj_matrix, data,
-                                                                features, classes, device)
+    inputs_loc, adj_matrix_loc, am_pbyp = cached_partition(partition_cache, graphname,
+                                        f"15d-c{replication}", rank, size, adj_matrix, inputs,
+                                        lambda: oned_partition(rank, size, inputs, adj_matrix, data,
+                                                                features, classes, device),
+                                        norm_type if normalization else "none", partition_balance)
 
     inputs_loc = inputs_loc.to(device)
     adj_matrix_loc = adj_matrix_loc.to(device)
     for i in range(len(am_pbyp)):
         am_pbyp[i] = am_pbyp[i].t().coalesce().to(device)
 
+    # Block i of H has as many rows as the columns of am_pbyp[i]
+    global row_count
+    row_count = [am_pbyp[i].size(1) for i in range(len(am_pbyp))]
+    print(f"rank: {rank} balance: {partition_balance} rows: {row_count[rank_c]} nnz: {adj_matrix_loc._nnz()}",
+            flush=True)
+
     adj_matrix_loc.coalesce()
     dist.barrier(group)
 
@@ -614,36 +469,22 @@ def run(rank, size, inputs, adj_matrix, data, features, classes, device):
 
         optimizer = torch.optim.Adam([weight1, weight2], lr=0.01)
 
-        total_time[i] = dict()
-        comm_time[i] = dict()
-        comp_time[i] = dict()
-        scomp_time[i] = dict()
-        dcomp_time[i] = dict()
-        bcast_comm_time[i] = dict()
-        bcast_words[i] = dict()
-        reduce_comm_time[i] = dict()
-        op_comm_time[i] = dict()
-        barrier_time[i] = dict()
+        global grad_reducer
+        if async_grad:
+            # Every row block holds the share of its rows, summed over the column group (one rank per block)
+            grad_reducer = GradReducer([weight1, weight2], col_groups[rank_col], grad_bucket_mb)
 
+        total_time[i] = dict()
         total_time[i][rank] = 0.0
-        comm_time[i][rank] = 0.0
-        comp_time[i][rank] = 0.0
-        scomp_time[i][rank] = 0.0
-        dcomp_time[i][rank] = 0.0
-        bcast_comm_time[i][rank] = 0.0
-        bcast_words[i][rank] = 0
-        reduce_comm_time[i][rank] = 0.0
-        op_comm_time[i][rank] = 0.0
-        barrier_time[i][rank] = 0.0
 
-        # Do not time first epoch
-        timing_on = timing == True
-        timing = False
+        global prof
+        prof = Profiler(rank, device, enabled=False, trace=bool(profile_dir),
+                            sync_group=group if timing_sync else None)
 
+        # Do not time first epoch
         outputs = train(inputs_loc, weight1, weight2, adj_matrix_loc, am_pbyp, optimizer, data,
                                     rank, size, group, row_groups, col_groups)
-        if timing_on:
-            timing = True
+        prof.enabled = timing
 
         dist.barrier(group)
         tstart = time.time()
@@ -661,29 +502,9 @@ def run(rank, size, inputs, adj_matrix, data, features, classes, device):
             print("Epoch: {:03d}".format(epoch), flush=True)
             cumulative_time += time.time()-ep_s
             if len(args.acc_csv)>20000:
-                # All-gather outputs to test accuracy
-                output_parts = []
-                # n_per_proc = math.ceil(float(inputs.size(0)) / size)
-                n_per_proc = math.ceil(float(inputs.size(0)) / (size / replication))
-                # print(f"rows: {am_pbyp[-1].size(0)} cols: {classes}", flush=True)
-                for i in range(size // replication):
-                    output_parts.append(torch.cuda.FloatTensor(n_per_proc, classes, device=device).fill_(0))
-
-                if outputs.size(0) != n_per_proc:
-                    pad_row = n_per_proc - outputs.size(0)
-                    outputs = torch.cat((outputs, torch.cuda.FloatTensor(pad_row, classes, device=device)), dim=0)
-
-                # dist.all_gather(output_parts, outputs)
-                dist.all_gather(output_parts, outputs, group=col_groups[rank_col])
-                # output_parts[rank] = outputs
-                output_parts[rank_c] = outputs
-
-                padding = inputs.size(0) - n_per_proc * ((size // replication) - 1)
-                output_parts[(size // replication) - 1] = output_parts[(size // replication) - 1][:padding,:]
-
-                outputs = torch.cat(output_parts, dim=0)
-
-                #train_acc, val_acc, tmp_test_acc = test(outputs, data, am_pbyp[0].size(1), rank)
+                # Each rank counts its own rows, only the counts are all-reduced over the replicas' column group
+                train_acc, val_acc, tmp_test_acc = distributed_accuracy(outputs, data, sum(row_count[:rank_c]),
+                                                                            col_groups[rank_col])
                 if val_acc > best_val_acc:
                     best_val_acc = val_acc
                     test_acc = tmp_test_acc
@@ -703,6 +524,11 @@ def run(rank, size, inputs, adj_matrix, data, features, classes, device):
         tstop = time.time()
         total_time[0][rank] = tstop - tstart
 
+        run_stats[i] = prof.summary()
+        if profile_dir:
+            prof.write_json(osp.join(profile_dir, f"run{i}", f"rank{rank}.json"))
+            prof.write_trace(osp.join(profile_dir, f"run{i}", f"rank{rank}.trace.json"))
+
     # Get median runtime according to rank0 and print that run's breakdown
     dist.barrier(group)
 
@@ -724,26 +550,25 @@ def run(rank, size, inputs, adj_matrix, data, features, classes, device):
     if rank==0:
         print(f"rank: {rank} median_run: {median_idx}")
         print(f"rank: {rank} total_time: {total_time[median_idx][rank]}")
-        print(f"rank: {rank} comm_time: {comm_time[median_idx][rank]}")
-        print(f"rank: {rank} comp_time: {comp_time[median_idx][rank]}")
-        print(f"rank: {rank} scomp_time: {scomp_time[median_idx][rank]}")
-        print(f"rank: {rank} dcomp_time: {dcomp_time[median_idx][rank]}")
-        print(f"rank: {rank} bcast_comm_time: {bcast_comm_time[median_idx][rank]}")
-        print(f"rank: {rank} bcast_words: {bcast_words[median_idx][rank]}")
-        print(f"rank: {rank} reduce_comm_time: {reduce_comm_time[median_idx][rank]}")
-        print(f"rank: {rank} op_comm_time: {op_comm_time[median_idx][rank]}")
-        print(f"rank: {rank} barrier_time: {barrier_time[median_idx][rank]}")
+        totals = run_stats[median_idx]["totals"]
+        for name in ["comm_time", "comp_time", "scomp_time", "dcomp_time", "bcast_comm_time"]:
+            print(f"rank: {rank} {name}: {totals.get(name, 0.0)}")
+        print(f"rank: {rank} bcast_words: {run_stats[median_idx]['counters'].get('bcast_words', 0)}")
+        for name in ["reduce_comm_time", "op_comm_time"]:
+            print(f"rank: {rank} {name}: {totals.get(name, 0.0)}")
+        print(f"rank: {rank} async_grad: {async_grad} grad_bucket_mb: {grad_bucket_mb}")
         print(f"rank: {rank} {outputs}")
         # total,comm,comp,scomp,dcomp,bcast,reduce,opcomm,barrier
         total = total_time[median_idx][rank] / 10
-        comm = comm_time[median_idx][rank]/10
-        comp = comp_time[median_idx][rank]/10
-        scomp = scomp_time[median_idx][rank]/10
-        dcomp = dcomp_time[median_idx][rank]/10
-        bcast = bcast_comm_time[median_idx][rank]/10
-        red = reduce_comm_time[median_idx][rank]/10
-        opcomm = op_comm_time[median_idx][rank]/10
-        bar = barrier_time[median_idx][rank]/10
+        comm = totals.get("comm_time", 0.0)/10
+        comp = totals.get("comp_time", 0.0)/10
+        scomp = totals.get("scomp_time", 0.0)/10
+        dcomp = totals.get("dcomp_time", 0.0)/10
+        bcast = totals.get("bcast_comm_time", 0.0)/10
+        red = totals.get("reduce_comm_time", 0.0)/10
+        opcomm = totals.get("op_comm_time", 0.0)/10
+        # Regions no longer wait on a barrier before they start, see --timingsync
+        bar = 0.0
         ws = os.environ['WORLD_SIZE']
         stats = f'CAGNET-1.5D,{graphname},{ws},{1.0/total},{total},{comm},{comp},{scomp},{dcomp},{bcast},{red},{opcomm},{bar}\n'
         with open(args.stats,'a') as f:
@@ -762,29 +587,9 @@ def run(rank, size, inputs, adj_matrix, data, features, classes, device):
             f.write(logline)
 
     if accuracy:
-        # All-gather outputs to test accuracy
-        output_parts = []
-        # n_per_proc = math.ceil(float(inputs.size(0)) / size)
-        n_per_proc = math.ceil(float(inputs.size(0)) / (size / replication))
-        # print(f"rows: {am_pbyp[-1].size(0)} cols: {classes}", flush=True)
-        for i in range(size // replication):
-            output_parts.append(torch.cuda.FloatTensor(n_per_proc, classes, device=device).fill_(0))
-
-        if outputs.size(0) != n_per_proc:
-            pad_row = n_per_proc - outputs.size(0)
-            outputs = torch.cat((outputs, torch.cuda.FloatTensor(pad_row, classes, device=device)), dim=0)
-
-        # dist.all_gather(output_parts, outputs)
-        dist.all_gather(output_parts, outputs, group=col_groups[rank_col])
-        # output_parts[rank] = outputs
-        output_parts[rank_c] = outputs
-
-        padding = inputs.size(0) - n_per_proc * ((size // replication) - 1)
-        output_parts[(size // replication) - 1] = output_parts[(size // replication) - 1][:padding,:]
-
-        outputs = torch.cat(output_parts, dim=0)
-
-        train_acc, val_acc, tmp_test_acc = test(outputs, data, am_pbyp[0].size(1), rank)
+        # Each rank counts its own rows, only the counts are all-reduced over the replicas' column group
+        train_acc, val_acc, tmp_test_acc = distributed_accuracy(outputs, data, sum(row_count[:rank_c]),
+                                                                    col_groups[rank_col])
         if val_acc > best_val_acc:
             best_val_acc = val_acc
             test_acc = tmp_test_acc
@@ -1008,6 +813,10 @@ def main():
     else:
         adj_matrix = edge_index
 
+    # Renumber the vertices for locality before they are cut into contiguous blocks
+    adj_matrix, inputs, _ = reorder_graph(reorder_type, adj_matrix, inputs, data,
+                                              size // replication, rank)
+
 
     init_process(rank, size, inputs, adj_matrix, data, num_features, num_classes, device, outputs,
                     run)
@@ -1026,12 +835,20 @@ if __name__ == '__main__':
     parser.add_argument("--runcount", type=int)
     parser.add_argument("--replication", type=int)
     parser.add_argument("--normalization", type=str)
+    parser.add_argument("--normtype", type=str, default="sym")
+    parser.add_argument("--partcache", type=str, default="")
+    parser.add_argument("--reorder", type=str, default="none")
+    parser.add_argument("--balance", type=str, default="vertex")
+    parser.add_argument("--asyncgrad", type=str, default="False")
+    parser.add_argument("--gradbucket", type=float, default=25.0)
     parser.add_argument("--activations", type=str)
     parser.add_argument("--accuracy", type=str)
     parser.add_argument("--download", type=bool)
     parser.add_argument("--csv", type=str, default='')
     parser.add_argument("--acc_csv", type=str, default='log.csv')
     parser.add_argument("--stats", type=str, default='')
+    parser.add_argument("--timingsync", type=str, default="False")
+    parser.add_argument("--profiledir", type=str, default="")
 
     args = parser.parse_args()
     print(args)
@@ -1044,6 +861,14 @@ if __name__ == '__main__':
     mid_layer = args.midlayer
     run_count = args.runcount
     normalization = args.normalization == "True"
+    norm_type = args.normtype
+    partition_cache = args.partcache
+    reorder_type = args.reorder
+    partition_balance = args.balance
+    async_grad = args.asyncgrad == "True"
+    timing_sync = args.timingsync == "True"
+    profile_dir = args.profiledir
+    grad_bucket_mb = args.gradbucket
     activations = args.activations == "True"
     accuracy = args.accuracy == "True"
     replication = args.replication
@@ -36,62 +36,45 @@ import time
 import numpy as np
 
 from sparse_coo_tensor_cpp import sparse_coo_tensor_gpu, spmm_gpu
+from partition_utils import split_coo, norm_factors, scale_elements
+from partition_cache import cached_partition
+from reorder import reorder_graph, restore_order
+from comm_precision import CommPrecision
+from grad_reduce import GradReducer
+from profiler import Profiler
 
-# comp_time = 0.0
-# comm_time = 0.0
-# summa_sparse_bcast1 = 0.0
-# summa_sparse_bcast1_words = 0
-# summa_sparse_bcast2_words = 0
-# summa_sparse_bcast2 = 0.0
-# summa_sparse_bcast2_fwd = 0.0
-# summa_sparse_bcast2_bwd = 0.0
-# summa_bcast1 = 0.0
-# summa_bcast2 = 0.0
-# summa_sparse_comp = 0.0
-# summa_comp = 0.0
-# summa_loc_bcast = 0.0
-# fwd_time = 0.0
-# bwd_time = 0.0
-# transpose_time = 0.0
-# grad_weight_time = 0.0
-# loss_calc_time = 0.0
-# summa_sparse_time = 0.0
-# summa_time = 0.0
-# summa_loc_time = 0.0
 total_time = dict()
-comp_time = dict()
-comm_time = dict()
-summa_sparse_bcast1 = dict()
-summa_sparse_bcast1_words = dict()
-summa_sparse_bcast2_words = dict()
-summa_sparse_bcast2 = dict()
-summa_sparse_bcast2_fwd = dict()
-summa_sparse_bcast2_bwd = dict()
-summa_bcast1 = dict()
-summa_bcast2 = dict()
-summa_sparse_comp = dict()
-summa_comp = dict()
-summa_loc_bcast = dict()
-fwd_time = dict()
-bwd_time = dict()
-transpose_time = dict()
-grad_weight_time = dict()
-loss_calc_time = dict()
-summa_sparse_time = dict()
-summa_time = dict()
-summa_loc_time = dict()
+# Timers and counters of the current run (comm_time, summa_bcast1, summa_sparse_bcast1_words, ...),
+# replaced in run(); per-run summaries are kept in run_stats for the median-run breakdown
+prof = Profiler(enabled=False)
+run_stats = dict()
 
 epochs = 0
 graphname = ""
 mid_layer = 0
 timing = False
 normalization = False
+norm_type = "sym"
+partition_cache = ""
 activations = False
 accuracy = False
 no_occur_val = 42.1234
 run_count = 0
 run = 0
 download = False
+reorder_type = "none"
+# perm[new_id] = old_id of the --reorder renumbering, None when vertices keep their ids
+vertex_perm = None
+comm_dtype = "fp32"
+comm_scale = False
+# Wire format of the dense SUMMA broadcasts, set up in run()
+comm = CommPrecision()
+# Bucketed async weight-gradient reduction (--asyncgrad), set up in run() for each run's weights
+async_grad = False
+grad_bucket_mb = 25.0
+grad_reducer = None
+timing_sync = False
+profile_dir = ""
 
 def sync_and_sleep(rank, device):
     torch.cuda.synchronize(device=device)
@@ -106,30 +89,6 @@ def normalize(adj_matrix):
     d = torch.diag(d)
     return torch.mm(d, torch.mm(adj_matrix, d))
 
-def start_time(group, rank):
-    device = torch.device('cuda:{}'.format(rank_to_devid(rank, acc_per_rank)))
-    if not timing:
-        return 0.0
-    if group is not None:
-        # dist.barrier(group)
-        torch.cuda.synchronize(device=device)
-    tstart = 0.0
-    if rank == 0:
-        tstart = time.time()
-    return tstart
-
-def stop_time(group, rank, tstart):
-    device = torch.device('cuda:{}'.format(rank_to_devid(rank, acc_per_rank)))
-    if not timing:
-        return 0.0
-    if group is not None:
-       # dist.barrier(group)
-       torch.cuda.synchronize(device=device)
-    tstop = 0.0
-    if rank == 0:
-        tstop = time.time()
-    return tstop - tstart
-
 def transpose(mat, row, col, height, width, size, acc_per_rank, transpose_group):
     proc_row = proc_row_size(size)
     proc_col = proc_col_size(size)
@@ -184,18 +143,6 @@ def transpose(mat, row, col, height, width, size, acc_per_rank, transpose_group)
 def summa(adj_matrix, inputs, rank, row, col, size, acc_per_rank, row_groups, col_groups, height, 
             middim, width):
 
-    global comm_time
-    global comp_time
-
-    global summa_bcast1
-    global summa_bcast2
-
-    global summa_comp
-    global summa_time
-    global run
-
-    # tstart_summa_time = start_time(row_groups[0], rank)
-
     proc_row = proc_row_size(size)
     proc_col = proc_col_size(size)
 
@@ -244,15 +191,13 @@ def summa(adj_matrix, inputs, rank, row, col, size, acc_per_rank, row_groups, co
             acol = acol_tens
             # acol = torch.cuda.FloatTensor(height_per_proc, middim_per_proc, device=device)
         
-        tstart = start_time(row_groups[row], rank)
+        tstart = prof.start()
 
         acol = acol.contiguous()
         # dist.broadcast_multigpu([acol], row_src_rank, row_groups[row])
-        dist.broadcast(acol, row_src_rank, row_groups[row])
+        comm.broadcast(acol, row_src_rank, row_groups[row])
 
-        dur = stop_time(row_groups[row], rank, tstart)
-        comm_time[run][rank] += dur
-        summa_bcast1[run][rank] += dur
+        prof.stop(tstart, "comm_time", "summa_bcast1")
 
         if col_src_rank == rank:
             brow = inputs
@@ -260,46 +205,25 @@ def summa(adj_matrix, inputs, rank, row, col, size, acc_per_rank, row_groups, co
             brow = brow_tens
             # brow = torch.cuda.FloatTensor(middim_per_proc, width_per_proc, device=device)
 
-        tstart = start_time(col_groups[col], rank)
+        tstart = prof.start()
 
         brow = brow.contiguous()
         # dist.broadcast_multigpu([brow], col_src_rank, col_groups[col])
-        dist.broadcast(brow, col_src_rank, col_groups[col])
+        comm.broadcast(brow, col_src_rank, col_groups[col])
 
-        dur = stop_time(col_groups[col], rank, tstart)
-        comm_time[run][rank] += dur
-        summa_bcast2[run][rank] += dur
+        prof.stop(tstart, "comm_time", "summa_bcast2")
 
-        # tstart = start_time(row_groups[0], rank)
-        tstart = start_time(None, rank)
+        tstart = prof.start()
 
         z_loc += torch.mm(acol.float(), brow)
 
-        # dur = stop_time(row_groups[0], rank, tstart)
-        dur = stop_time(None, rank, tstart)
-        comp_time[run][rank] += dur
-        summa_comp[run][rank] += dur
+        prof.stop(tstart, "comp_time", "summa_comp")
 
-    # summa_time += stop_time(row_groups[0], rank, tstart_summa_time)
     return z_loc
 
 def summa_sparse(adj_matrix, inputs, rank, row, col, size, acc_per_rank, row_groups, col_groups, 
-                    height, middim, width):
-
-    global comm_time
-    global comp_time
-
-    global summa_sparse_bcast1
-    global summa_sparse_bcast2
-
-    global summa_sparse_bcast1_words
-    global summa_sparse_bcast2_words
-
-    global summa_sparse_comp
-    global summa_sparse_time
-    global run
-
-    # tstart_summa_sparse_time = start_time(row_groups[0], rank)
+                    height, middim, width, phase="fwd"):
+    # phase (fwd/bwd) splits the dense broadcast time into summa_sparse_bcast2_fwd / _bwd
 
     proc_row = proc_row_size(size)
     proc_col = proc_col_size(size)
@@ -368,16 +292,13 @@ def summa_sparse(adj_matrix, inputs, rank, row, col, size, acc_per_rank, row_gro
 
         acol = torch.cat((acol_indices.float(), acol_values.unsqueeze(0)), dim=0).contiguous()
 
-        tstart = start_time(row_groups[row], rank)
+        tstart = prof.start()
 
         # dist.broadcast_multigpu([acol], row_src_rank, row_groups[row])
         dist.broadcast(acol, row_src_rank, row_groups[row])
 
-        dur = stop_time(row_groups[row], rank, tstart)
-        comm_time[run][rank] += dur
-        summa_sparse_bcast1[run][rank] += dur
-        if rank == 0:
-            summa_sparse_bcast1_words[run][rank] += 3 * acol_values_len
+        prof.stop(tstart, "comm_time", "summa_sparse_bcast1")
+        prof.count("summa_sparse_bcast1_words", 3 * acol_values_len)
 
         acol_indices = acol[:2].long()
         acol_values = acol[2].squeeze(0)
@@ -396,47 +317,27 @@ def summa_sparse(adj_matrix, inputs, rank, row, col, size, acc_per_rank, row_gro
 
         brow = brow.contiguous()
 
-        tstart = start_time(row_groups[0], rank)
-        # tstart = start_time(col_groups[col], rank)
+        tstart = prof.start()
 
         # dist.broadcast_multigpu([brow], col_src_rank, col_groups[col])
-        dist.broadcast(brow, col_src_rank, col_groups[col])
-
-        dur = stop_time(row_groups[0], rank, tstart)
-        # dur = stop_time(col_groups[col], rank, tstart)
+        # acol above carries its indices as floats, so only the dense brow goes through the comm dtype
+        comm.broadcast(brow, col_src_rank, col_groups[col])
 
-        comm_time[run][rank] += dur
-        summa_sparse_bcast2[run][rank] += dur
-        if rank == 0:
-            summa_sparse_bcast2_words[run][rank] += brow.size(0) * brow.size(1)
+        prof.stop(tstart, "comm_time", "summa_sparse_bcast2", f"summa_sparse_bcast2_{phase}")
+        prof.count("summa_sparse_bcast2_words", brow.size(0) * brow.size(1))
 
-        # tstart = start_time(row_groups[0], rank)
-        tstart = start_time(None, rank)
+        tstart = prof.start()
 
         spmm_gpu(acol_indices[0].int(), acol_indices[1].int(), acol_values, 
                         height_per_proc, middim_per_proc, brow, z_loc)
 
-        # dur = stop_time(row_groups[0], rank, tstart)
-        dur = stop_time(None, rank, tstart)
-        # dur = stop_time(col_groups[col], rank, tstart)
-        comp_time[run][rank] += dur
-        summa_sparse_comp[run][rank] += dur
+        prof.stop(tstart, "comp_time", "summa_sparse_comp")
 
-    # summa_sparse_time += stop_time(row_groups[0], rank, tstart_summa_sparse_time)
     return z_loc
 
 def summa_loc(mata, matb, rank, row, col, size, acc_per_rank, row_groups, col_groups, 
                     height, middim, width):
 
-    global comm_time
-    global comp_time
-
-    global summa_loc_bcast
-    global summa_loc_time
-    global run
-
-    # tstart_summa_loc_time = start_time(row_groups[0], rank)
-
     proc_row = proc_row_size(size)
     proc_col = proc_col_size(size)
 
@@ -482,15 +383,13 @@ def summa_loc(mata, matb, rank, row, col, size, acc_per_rank, row_groups, col_gr
             acol = torch.cuda.FloatTensor(height_per_proc, matb[col_src_rank].size(0), 
                                             device=device)
         
-        tstart = start_time(row_groups[row], rank)
+        tstart = prof.start()
 
         acol = acol.contiguous()
         # dist.broadcast_multigpu([acol], row_src_rank, row_groups[row])
         dist.broadcast(acol, row_src_rank, row_groups[row])
 
-        dur = stop_time(row_groups[row], rank, tstart)
-        comm_time[run][rank] += dur
-        summa_loc_bcast[run][rank] += dur
+        prof.stop(tstart, "comm_time", "summa_loc_bcast")
 
         # if col_src_rank == rank:
         #     brow = matb.clone()
@@ -501,16 +400,12 @@ def summa_loc(mata, matb, rank, row, col, size, acc_per_rank, row_groups, col_gr
 
         brow = matb[col_src_rank]
 
-        # tstart = start_time(row_groups[0], rank)
-        tstart = start_time(None, rank)
+        tstart = prof.start()
 
         z_loc += torch.mm(acol, brow)
 
-        # dur = stop_time(row_groups[0], rank, tstart)
-        dur = stop_time(None, rank, tstart)
-        comp_time[run][rank] += dur
+        prof.stop(tstart, "comp_time")
 
-    # summa_loc_time += stop_time(row_groups[0], rank, tstart_summa_loc_time)
     return z_loc
 
 def get_proc_groups(rank, size, group):
@@ -653,14 +548,6 @@ class GCNFunc(torch.autograd.Function):
         # weight: W
         # func: sigma
 
-        global summa_sparse_bcast2
-        global summa_sparse_bcast2_fwd
-        global fwd_time
-        global grad_weight_time
-        global run
-
-        # tstart = start_time(row_groups[0], rank)
-
         proc_row = proc_row_size(size)
         proc_col = proc_col_size(size)
         
@@ -682,13 +569,10 @@ class GCNFunc(torch.autograd.Function):
 
         adj_matrix_t = adj_matrix # Only true for undirected graphs
 
-        tmp_summa_sparse_bcast2 = summa_sparse_bcast2[run][rank]
-
         # TODO: will need to change height argument when n % sqrt(P) != 0 and non-square grid
         z = summa_sparse(adj_matrix_t, inputs, rank, rank_row, rank_col, size, acc_per_rank, 
-                            row_groups, col_groups, node_count, node_count, weight.size(0))
+                            row_groups, col_groups, node_count, node_count, weight.size(0), "fwd")
 
-        # tstart_grad_weight = start_time(row_groups[0], rank)
         chunk_sizes_row = []
         chunk_sizes_col = []
         weight_per_row = weight.size(0) // proc_row
@@ -712,7 +596,6 @@ class GCNFunc(torch.autograd.Function):
             # weight_cols = torch.split(i, math.ceil(float(weight.size(1)) / proc_col), dim=1)
             weight_cols = torch.split(i, chunk_sizes_col, dim=1)
             weight_parts.extend(weight_cols)
-        # grad_weight_time += stop_time(row_groups[0], rank, tstart_grad_weight)
 
         # z = torch.mm(z, weight)
         z = summa_loc(z, weight_parts, rank, rank_row, rank_col, size, acc_per_rank, row_groups, 
@@ -721,8 +604,6 @@ class GCNFunc(torch.autograd.Function):
         z.requires_grad = True
         ctx.z = z
 
-        summa_sparse_bcast2_fwd[run][rank] += summa_sparse_bcast2[run][rank] - tmp_summa_sparse_bcast2
-
         if activations:
             if func is F.log_softmax:
                 h = dist_log_softmax(z, rank, size, acc_per_rank, row_groups[rank_row])
@@ -734,20 +615,10 @@ class GCNFunc(torch.autograd.Function):
         else:
             return z
 
-        # dur = stop_time(row_groups[0], rank, tstart)
-        # fwd_time += dur
-
         # return z
 
     @staticmethod
     def backward(ctx, grad_output):
-        global summa_sparse_bcast2
-        global summa_sparse_bcast2_bwd
-        global bwd_time
-        global transpose_time
-        global grad_weight_time
-        global run
-
         inputs, weight, adj_matrix = ctx.saved_tensors
         rank = ctx.rank
         size = ctx.size
@@ -768,7 +639,6 @@ class GCNFunc(torch.autograd.Function):
         rank_col = rank % proc_col
         device = torch.device('cuda:{}'.format(rank_to_devid(rank, acc_per_rank)))
 
-        # tstart = start_time(row_groups[0], rank)
             
         if activations:
             with torch.set_grad_enabled(True):
@@ -805,14 +675,11 @@ class GCNFunc(torch.autograd.Function):
                     grad_output = sigmap
 
 
-        tmp_summa_sparse_bcast2 = summa_sparse_bcast2[run][rank]
-
         # First backprop equation
         # TODO: will need to change height argument when n % sqrt(P) != 0 and non-square grid
         ag = summa_sparse(adj_matrix, grad_output, rank, rank_row, rank_col, size, acc_per_rank, 
-                            row_groups, col_groups, node_count, node_count, weight.t().size(0))
+                            row_groups, col_groups, node_count, node_count, weight.t().size(0), "bwd")
 
-        # tstart_grad_weight = start_time(row_groups[0], rank)
         chunk_sizes_row = []
         chunk_sizes_col = []
         weight_per_row = weight.t().size(0) // proc_row
@@ -841,23 +708,32 @@ class GCNFunc(torch.autograd.Function):
         grad_input = summa_loc(ag, weight_parts, rank, rank_row, rank_col, size, acc_per_rank, 
                                     row_groups, col_groups, node_count, weight.t().size(0), 
                                     weight.t().size(1))
-        # grad_weight_time += stop_time(row_groups[0], rank, tstart_grad_weight)
 
         # Second backprop equation (reuses the A * G^l computation)
         # col_groups twice because of transpose
         # TODO: will need to change height argument when n % sqrt(P) != 0 and non-square grid
 
-        # tstart_transpose = start_time(row_groups[0], rank)
-        tstart_transpose = start_time(transpose_group, rank)
+        tstart_transpose = prof.start()
         inputs_t = transpose(inputs, rank_row, rank_col, node_count, weight.size(0), size,
                                 acc_per_rank, transpose_group)
-        # transpose_time[run][rank] += stop_time(row_groups[0], rank, tstart_transpose)
-        transpose_time[run][rank] += stop_time(transpose_group, rank, tstart_transpose)
+        prof.stop(tstart_transpose, "transpose_time")
 
         grad_weight = summa(inputs_t, ag, rank, rank_row, rank_col, size, acc_per_rank, row_groups,
                                 col_groups, weight.size(0), node_count, weight.size(1))
 
-        # tstart_grad_weight = start_time(row_groups[0], rank)
+        if grad_reducer is not None:
+            # Tiles are disjoint: each rank writes its own into a zeroed full-size slot and the
+            # bucket's sum assembles grad_weight on every rank while backward goes on
+            row_start = rank_row * (weight.size(0) // proc_row)
+            col_start = rank_col * (weight.size(1) // proc_col)
+            grad_weight_fin = grad_reducer.view(weight)
+            grad_weight_fin.zero_()
+            grad_weight_fin[row_start:row_start + grad_weight.size(0),
+                            col_start:col_start + grad_weight.size(1)] = grad_weight
+            grad_reducer.push(weight, grad_weight_fin)
+
+            return grad_input, None, None, None, None, None, None, None, None, None, None, None, None
+
         # Collect grad_weight's across processes
         grad_weight_recv = []
         max_row_chunk = max(chunk_sizes_col) #transpose
@@ -908,21 +784,11 @@ class GCNFunc(torch.autograd.Function):
                 grad_weight_row = torch.cat((grad_weight_row, grad_weight_recv[rank_wt]), dim=1)
             grad_weight_fin = torch.cat((grad_weight_fin, grad_weight_row), dim=0)
 
-        summa_sparse_bcast2_bwd[run][rank] += summa_sparse_bcast2[run][rank] - tmp_summa_sparse_bcast2
-
-        # dur = stop_time(row_groups[0], rank, tstart)
-        # bwd_time += dur
-
-        # grad_weight_time += stop_time(row_groups[0], rank, tstart_grad_weight)
-
         return grad_input, grad_weight_fin, None, None, None, None, None, None, None, None, None, None, None
 
 def train(inputs, weight1, weight2, node_count, adj_matrix, am_partitions, optimizer, data, rank, 
                 size, acc_per_rank, group, row_groups, col_groups, transpose_group):
 
-    global loss_calc_time
-    global run
-
     outputs = GCNFunc.apply(inputs, weight1, node_count, adj_matrix, am_partitions, rank, size, 
                                     acc_per_rank, group, row_groups, col_groups, transpose_group, 
                                     F.relu)
@@ -957,7 +823,6 @@ def train(inputs, weight1, weight2, node_count, adj_matrix, am_partitions, optim
     if list(datay_rank[rank_train_mask].size())[0] > 0:
     # if datay_rank.size(0) > 0:
         # datay_ids = datay_rank[rank_train_mask].long().view(-1, 1)
-        # tstart_loss_calc = start_time(row_groups[0], rank)
 
         datay_ids = datay_rank[rank_train_mask].long()
 
@@ -984,7 +849,6 @@ def train(inputs, weight1, weight2, node_count, adj_matrix, am_partitions, optim
         vertex_train_count = (data.train_mask.size(0) - (data.train_mask == 0).sum(dim=0))
         loss_calc = -loss_calc / vertex_train_count
 
-        # loss_calc_time[run][rank] += stop_time(row_groups[0], rank, tstart_loss_calc)
 
         loss_calc.backward()
         # print("loss_calc: " + str(loss_calc), flush=True)
@@ -996,6 +860,11 @@ def train(inputs, weight1, weight2, node_count, adj_matrix, am_partitions, optim
         # fake_loss = (outputs * torch.zeros(outputs.size())).sum()
         fake_loss.backward()
 
+    if grad_reducer is not None:
+        tstart_grad_weight = prof.start()
+        grad_reducer.finish()
+        prof.stop(tstart_grad_weight, "grad_weight_time")
+
     optimizer.step()
 
     return outputs
@@ -1027,63 +896,6 @@ def test(outputs, data, vertex_count, rank):
     # return accs
 
 
-# Split a COO into partitions of size n_per_proc
-# Basically torch.split but for Sparse Tensors since pytorch doesn't support that.
-def split_coo(adj_matrix, node_count, n_per_proc, dim, size):
-    proc_row = proc_row_size(size)
-    proc_col = proc_col_size(size)
-
-    vtx_indices = list(range(0, node_count, n_per_proc))
-    vtx_indices = vtx_indices[:proc_row]
-    vtx_indices.append(node_count)
-
-    am_partitions = []
-    for i in range(len(vtx_indices) - 1):
-        am_part = adj_matrix[:,(adj_matrix[dim,:] >= vtx_indices[i]).nonzero().squeeze(1)]
-        am_part = am_part[:,(am_part[dim,:] < vtx_indices[i + 1]).nonzero().squeeze(1)]
-        am_part[dim] -= vtx_indices[i]
-        am_partitions.append(am_part)
-
-    return am_partitions, vtx_indices
-
-# Normalize all elements according to KW's normalization rule
-def scale_elements(adj_matrix, adj_part, node_count, row_vtx, col_vtx):
-    if not normalization:
-        return adj_part
-
-    adj_part = adj_part.coalesce()
-    deg = torch.histc(adj_matrix[0].double(), bins=node_count)
-    deg = deg.pow(-0.5)
-
-    row_len = adj_part.size(0)
-    col_len = adj_part.size(1)
-
-    dleft = torch.sparse_coo_tensor([np.arange(0, row_len).tolist(),
-                                     np.arange(0, row_len).tolist()],
-                                     deg[row_vtx:(row_vtx + row_len)].float(),
-                                     size=(row_len, row_len),
-                                     requires_grad=False, device=torch.device("cpu"))
-
-    dright = torch.sparse_coo_tensor([np.arange(0, col_len).tolist(),
-                                     np.arange(0, col_len).tolist()],
-                                     deg[col_vtx:(col_vtx + col_len)].float(),
-                                     size=(col_len, col_len),
-                                     requires_grad=False, device=torch.device("cpu"))
-    # adj_part = torch.sparse.mm(torch.sparse.mm(dleft, adj_part), dright)
-    ad_ind, ad_val = torch_sparse.spspmm(adj_part._indices(), adj_part._values(), 
-                                            dright._indices(), dright._values(),
-                                            adj_part.size(0), adj_part.size(1), dright.size(1))
-
-    adj_part_ind, adj_part_val = torch_sparse.spspmm(dleft._indices(), dleft._values(), 
-                                                        ad_ind, ad_val,
-                                                        dleft.size(0), dleft.size(1), adj_part.size(1))
-
-    adj_part = torch.sparse_coo_tensor(adj_part_ind, adj_part_val, 
-                                                size=(adj_part.size(0), adj_part.size(1)),
-                                                requires_grad=False, device=torch.device("cpu"))
-
-    return adj_part
-
 def proc_row_size(size):
     return math.floor(math.sqrt(size))
 
@@ -1110,11 +922,14 @@ def twod_partition(rank, size, inputs, adj_matrix, data, features, classes, devi
     # Compute the adj_matrix and inputs partitions for this process
     # TODO: Maybe I do want grad here. Unsure.
     with torch.no_grad():
+        # Degrees are computed once for the whole graph, each block only gathers them
+        norm = norm_factors(adj_matrix, node_count, norm_type if normalization else "none")
+
         # Column partitions
-        am_partitions, vtx_indices = split_coo(adj_matrix, node_count, n_per_proc, 1, size)
+        am_partitions, vtx_indices = split_coo(adj_matrix, node_count, n_per_proc, 1, proc_row)
 
         proc_node_count = vtx_indices[rank_col + 1] - vtx_indices[rank_col]
-        am_pbyp, _ = split_coo(am_partitions[rank_col], node_count, n_per_proc, 0, size)
+        am_pbyp, _ = split_coo(am_partitions[rank_col], node_count, n_per_proc, 0, proc_row)
         for i in range(len(am_pbyp)):
             if i == proc_row - 1:
                 last_node_count = vtx_indices[i + 1] - vtx_indices[i]
@@ -1122,15 +937,13 @@ def twod_partition(rank, size, inputs, adj_matrix, data, features, classes, devi
                                                         size=(last_node_count, proc_node_count),
                                                         requires_grad=False)
 
-                am_pbyp[i] = scale_elements(adj_matrix, am_pbyp[i], node_count, vtx_indices[i], 
-                                                    vtx_indices[rank_col])
+                am_pbyp[i] = scale_elements(am_pbyp[i], norm, vtx_indices[i], vtx_indices[rank_col])
             else:
                 am_pbyp[i] = torch.sparse_coo_tensor(am_pbyp[i], torch.ones(am_pbyp[i].size(1)), 
                                                         size=(n_per_proc, proc_node_count),
                                                         requires_grad=False)
 
-                am_pbyp[i] = scale_elements(adj_matrix, am_pbyp[i], node_count, vtx_indices[i], 
-                                                    vtx_indices[rank_col])
+                am_pbyp[i] = scale_elements(am_pbyp[i], norm, vtx_indices[i], vtx_indices[rank_col])
 
         # input_rowparts = torch.split(inputs, math.ceil(float(inputs.size(0)) / proc_row), dim=0)
         inputs_per_row = inputs.size(0) // proc_row
@@ -1167,8 +980,6 @@ def rank_to_devid(rank, acc_per_rank):
     return rank % acc_per_rank
 
 def run(rank, size, inputs, adj_matrix, data, features, mid_layer, classes, device, acc_per_rank):
-    global comm_time
-    global comp_time
     global epochs
     global timing
     global run
@@ -1176,6 +987,9 @@ def run(rank, size, inputs, adj_matrix, data, features, mid_layer, classes, devi
     best_val_acc = test_acc = 0
     outputs = None
 
+    global comm
+    comm = CommPrecision(comm_dtype, comm_scale)
+
     group = dist.new_group(list(range(size)))
     row_groups, col_groups = get_proc_groups(rank, size, group)
 
@@ -1225,8 +1039,15 @@ def run(rank, size, inputs, adj_matrix, data, features, mid_layer, classes, devi
 
         optimizer = torch.optim.Adam([weight1, weight2], lr=0.01)
 
-        inputs_loc, adj_matrix_loc, _ = twod_partition(rank, size, inputs, adj_matrix, data, features,
-                                                            classes, device)
+        global grad_reducer
+        if async_grad:
+            grad_reducer = GradReducer([weight1, weight2], group, grad_bucket_mb)
+
+        inputs_loc, adj_matrix_loc, _ = cached_partition(partition_cache, graphname, "2d", rank, size,
+                                            adj_matrix, inputs,
+                                            lambda: twod_partition(rank, size, inputs, adj_matrix, data,
+                                                                    features, classes, device),
+                                            norm_type if normalization else "none")
 
         adj_matrix_loc = adj_matrix_loc.coalesce()
 
@@ -1236,50 +1057,11 @@ def run(rank, size, inputs, adj_matrix, data, features, mid_layer, classes, devi
         print(f"rank: {rank} adj_matrix_loc.nnz: {adj_matrix_loc._nnz()}")
 
         total_time[i] = dict()
-        comp_time[i] = dict()
-        comm_time[i] = dict()
-        summa_sparse_bcast1[i] = dict()
-        summa_sparse_bcast1_words[i] = dict()
-        summa_sparse_bcast2_words[i] = dict()
-        summa_sparse_bcast2[i] = dict()
-        summa_sparse_bcast2_fwd[i] = dict()
-        summa_sparse_bcast2_bwd[i] = dict()
-        summa_bcast1[i] = dict()
-        summa_bcast2[i] = dict()
-        summa_sparse_comp[i] = dict()
-        summa_comp[i] = dict()
-        summa_loc_bcast[i] = dict()
-        fwd_time[i] = dict()
-        bwd_time[i] = dict()
-        transpose_time[i] = dict()
-        grad_weight_time[i] = dict()
-        loss_calc_time[i] = dict()
-        summa_sparse_time[i] = dict()
-        summa_time[i] = dict()
-        summa_loc_time[i] = dict()
-
         total_time[i][rank] = 0.0
-        comp_time[i][rank] = 0.0
-        comm_time[i][rank] = 0.0
-        summa_sparse_bcast1[i][rank] = 0.0
-        summa_sparse_bcast1_words[i][rank] = 0.0
-        summa_sparse_bcast2_words[i][rank] = 0.0
-        summa_sparse_bcast2[i][rank] = 0.0
-        summa_sparse_bcast2_fwd[i][rank] = 0.0
-        summa_sparse_bcast2_bwd[i][rank] = 0.0
-        summa_bcast1[i][rank] = 0.0
-        summa_bcast2[i][rank] = 0.0
-        summa_sparse_comp[i][rank] = 0.0
-        summa_comp[i][rank] = 0.0
-        summa_loc_bcast[i][rank] = 0.0
-        fwd_time[i][rank] = 0.0
-        bwd_time[i][rank] = 0.0
-        transpose_time[i][rank] = 0.0
-        grad_weight_time[i][rank] = 0.0
-        loss_calc_time[i][rank] = 0.0
-        summa_sparse_time[i][rank] = 0.0
-        summa_time[i][rank] = 0.0
-        summa_loc_time[i][rank] = 0.0
+
+        global prof
+        prof = Profiler(rank, device, enabled=timing, trace=bool(profile_dir),
+                            sync_group=group if timing_sync else None)
 
         # Do not time first epoch
         # timing_on = timing == True
@@ -1290,7 +1072,6 @@ def run(rank, size, inputs, adj_matrix, data, features, mid_layer, classes, devi
         # if timing_on:
         #     timing = True
 
-        # # tstart = start_time(group, rank)
         dist.barrier(group)
         tstart = time.time()
 
@@ -1301,10 +1082,14 @@ def run(rank, size, inputs, adj_matrix, data, features, mid_layer, classes, devi
                                     col_groups, transpose_group)
             print("Epoch: {:03d}".format(epoch), flush=True)
 
-        # dur = stop_time(group, rank, tstart)
         tstop = time.time()
         total_time[i][rank] = tstop - tstart
 
+        run_stats[run] = prof.summary()
+        if profile_dir:
+            prof.write_json(osp.join(profile_dir, f"run{run}", f"rank{rank}.json"))
+            prof.write_trace(osp.join(profile_dir, f"run{run}", f"rank{rank}.trace.json"))
+
     # Get median runtime according to rank0 and print that run's breakdown
     dist.barrier(group)
     if rank == 0:
@@ -1323,25 +1108,19 @@ def run(rank, size, inputs, adj_matrix, data, features, mid_layer, classes, devi
     median_idx = median_idx.item()
     print(f"rank: {rank} median_idx: {median_idx}")
     print(f"rank: {rank} Time: {total_time[median_idx][rank]}")
-    print(f"rank: {rank} comm_time: {comm_time[median_idx][rank]}")
-    print(f"rank: {rank} comp_time: {comp_time[median_idx][rank]}")
-    print(f"rank: {rank} summa_sparse_comp: {summa_sparse_comp[median_idx][rank]}")
-    print(f"rank: {rank} summa_sparse_bcast1: {summa_sparse_bcast1[median_idx][rank]}")
-    print(f"rank: {rank} summa_sparse_bcast1_words: {summa_sparse_bcast1_words[median_idx][rank]}")
-    print(f"rank: {rank} summa_sparse_bcast2: {summa_sparse_bcast2[median_idx][rank]}")
-    print(f"rank: {rank} summa_sparse_bcast2_fwd: {summa_sparse_bcast2_fwd[median_idx][rank]}")
-    print(f"rank: {rank} summa_sparse_bcast2_bwd: {summa_sparse_bcast2_bwd[median_idx][rank]}")
-    print(f"rank: {rank} summa_sparse_bcast2_words: {summa_sparse_bcast2_words[median_idx][rank]}")
-    print(f"rank: {rank} summa_comp: {summa_comp[median_idx][rank]}")
-    print(f"rank: {rank} summa_bcast1: {summa_bcast1[median_idx][rank]}")
-    print(f"rank: {rank} summa_bcast2: {summa_bcast2[median_idx][rank]}")
-    print(f"rank: {rank} summa_loc_bcast: {summa_loc_bcast[median_idx][rank]}")
-    print(f"rank: {rank} transpose_time: {transpose_time[median_idx][rank]}")
-    print(f"rank: {rank} grad_weight_time: {grad_weight_time[median_idx][rank]}")
-    print(f"rank: {rank} loss_calc_time: {loss_calc_time[median_idx][rank]}")
-    print(f"rank: {rank} summa_sparse_time: {summa_sparse_time[median_idx][rank]}")
-    print(f"rank: {rank} summa_time: {summa_time[median_idx][rank]}")
-    print(f"rank: {rank} summa_loc_time: {summa_loc_time[median_idx][rank]}")
+    totals = run_stats[median_idx]["totals"]
+    counters = run_stats[median_idx]["counters"]
+    for name in ["comm_time", "comp_time", "summa_sparse_comp", "summa_sparse_bcast1"]:
+        print(f"rank: {rank} {name}: {totals.get(name, 0.0)}")
+    print(f"rank: {rank} summa_sparse_bcast1_words: {counters.get('summa_sparse_bcast1_words', 0)}")
+    for name in ["summa_sparse_bcast2", "summa_sparse_bcast2_fwd", "summa_sparse_bcast2_bwd"]:
+        print(f"rank: {rank} {name}: {totals.get(name, 0.0)}")
+    print(f"rank: {rank} summa_sparse_bcast2_words: {counters.get('summa_sparse_bcast2_words', 0)}")
+    for name in ["summa_comp", "summa_bcast1", "summa_bcast2", "summa_loc_bcast", "transpose_time",
+                    "grad_weight_time"]:
+        print(f"rank: {rank} {name}: {totals.get(name, 0.0)}")
+    print(f"rank: {rank} comm_precision: {comm}")
+    print(f"rank: {rank} async_grad: {async_grad} grad_bucket_mb: {grad_bucket_mb}")
     print(f"rank: {rank} {outputs}")
     
     # All-gather outputs to test accuracy
@@ -1385,6 +1164,9 @@ def run(rank, size, inputs, adj_matrix, data, features, mid_layer, classes, devi
         log = 'Epoch: {:03d}, Train: {:.4f}, Val: {:.4f}, Test: {:.4f}'
 
         print(log.format(200, train_acc, best_val_acc, test_acc))
+
+        # Gathered outputs back in the original vertex order
+        outputs = restore_order(outputs, vertex_perm)
     return outputs
 
 def init_process(rank, size, inputs, adj_matrix, data, features, mid_layer, classes, device, 
@@ -1398,6 +1180,7 @@ def init_process(rank, size, inputs, adj_matrix, data, features, mid_layer, clas
 def main():
     # graphname = 'Reddit'
     global graphname
+    global vertex_perm
     global mid_layer
 
     path = osp.join(osp.dirname(osp.realpath(__file__)), '..', 'data', graphname)
@@ -1525,6 +1308,10 @@ def main():
     else:
         adj_matrix = edge_index
 
+    # Renumber the vertices for locality before they are cut into contiguous blocks
+    adj_matrix, inputs, vertex_perm = reorder_graph(reorder_type, adj_matrix, inputs, data,
+                                                        proc_row_size(size), rank)
+
     outputs = None
     print("Processes: " + str(size), flush=True)
 
@@ -1545,9 +1332,19 @@ if __name__ == '__main__':
     parser.add_argument("--midlayer", type=int)
     parser.add_argument("--runcount", type=int)
     parser.add_argument("--normalization", type=str)
+    parser.add_argument("--normtype", type=str, default="sym")
+    parser.add_argument("--partcache", type=str, default="")
+    parser.add_argument("--reorder", type=str, default="none")
+    parser.add_argument("--balance", type=str, default="vertex")
     parser.add_argument("--activations", type=str)
     parser.add_argument("--accuracy", type=str)
     parser.add_argument("--download", type=bool)
+    parser.add_argument("--commdtype", type=str, default="fp32")
+    parser.add_argument("--commscale", type=str, default="False")
+    parser.add_argument("--asyncgrad", type=str, default="False")
+    parser.add_argument("--gradbucket", type=float, default=25.0)
+    parser.add_argument("--timingsync", type=str, default="False")
+    parser.add_argument("--profiledir", type=str, default="")
     args = parser.parse_args()
     print(args)
 
@@ -1561,15 +1358,31 @@ if __name__ == '__main__':
     mid_layer = args.midlayer
     run_count = args.runcount
     normalization = args.normalization == "True"
+    norm_type = args.normtype
+    partition_cache = args.partcache
+    reorder_type = args.reorder
+    partition_balance = args.balance
     activations = args.activations == "True"
     accuracy = args.accuracy == "True"
     download = args.download
+    comm_dtype = args.commdtype
+    comm_scale = args.commscale == "True"
+    async_grad = args.asyncgrad == "True"
+    grad_bucket_mb = args.gradbucket
+    timing_sync = args.timingsync == "True"
+    profile_dir = args.profiledir
 
     if not download:
         if (epochs is None) or (graphname is None) or (timing is None) or (mid_layer is None) or (run_count is None):
             print(f"Error: missing argument {epochs} {graphname} {timing} {mid_layer}")
             exit()
 
+    # SUMMA cuts both grid dimensions at equal vertex counts, the nnz/cost row
+    # boundaries of the 1D and 1.5D algorithms are not threaded through it
+    if partition_balance != "vertex":
+        print(f"Error: --balance {partition_balance} is not supported by the 2D algorithm, only vertex")
+        exit(1)
+
     print(f"Arguments: epochs: {epochs} graph: {graphname} timing: {timing} mid: {mid_layer} norm: {normalization} act: {activations} acc: {accuracy}")
     
     print(main())
@@ -34,37 +34,31 @@ import time
 import numpy as np
 
 from sparse_coo_tensor_cpp import sparse_coo_tensor_gpu, spmm_gpu
+from partition_utils import split_coo, norm_factors, scale_elements
+from partition_cache import cached_partition
+from reorder import reorder_graph
+from grad_reduce import GradReducer
+from profiler import Profiler, aggregate, print_stats
 
-comp_time = 0.0
-comm_time = 0.0
-summa_sparse_bcast1 = 0.0
-summa_sparse_bcast1_words = 0
-summa_sparse_bcast2_words = 0
-summa_sparse_bcast2 = 0.0
-summa_sparse_bcast2_fwd = 0.0
-summa_sparse_bcast2_bwd = 0.0
-summa_sparse_reduce = 0.0
-summa_bcast1 = 0.0
-summa_bcast2 = 0.0
-summa_reduce = 0.0
-summa_sparse_comp = 0.0
-summa_comp = 0.0
-summa_loc_bcast = 0.0
-fwd_time = 0.0
-bwd_time = 0.0
-transpose_time = 0.0
-grad_weight_time = 0.0
-loss_calc_time = 0.0
-summa_sparse_time = 0.0
-summa_time = 0.0
-summa_loc_time = 0.0
+# Timers and counters of the training run (comm_time, summa_bcast1, summa_sparse_bcast1_words, ...),
+# replaced in run()
+prof = Profiler(enabled=False)
 
 epochs = 0
 graphname = ""
 mid_layer = 0
 timing = False
 normalization = False
+norm_type = "sym"
+partition_cache = ""
+reorder_type = "none"
 no_occur_val = 42.1234
+# Bucketed async weight-gradient reduction (--asyncgrad), set up in run()
+async_grad = False
+grad_bucket_mb = 25.0
+grad_reducer = None
+timing_sync = False
+profile_dir = ""
 
 def sync_and_sleep(rank, device):
     torch.cuda.synchronize(device=device)
@@ -80,28 +74,6 @@ def normalize(adj_matrix):
     d = torch.diag(d)
     return torch.mm(d, torch.mm(adj_matrix, d))
 
-def start_time(group, rank):
-    device = torch.device('cuda:{}'.format(rank_to_devid(rank, acc_per_rank)))
-    if not timing:
-        return 0.0
-    # dist.barrier(group)
-    torch.cuda.synchronize(device=device)
-    tstart = 0.0
-    if rank == 0:
-     tstart = time.time()
-    return tstart
-
-def stop_time(group, rank, tstart):
-    device = torch.device('cuda:{}'.format(rank_to_devid(rank, acc_per_rank)))
-    if not timing:
-        return 0.0
-    # dist.barrier(group)
-    torch.cuda.synchronize(device=device)
-    tstop = 0.0
-    if rank == 0:
-        tstop = time.time()
-    return tstop - tstart
-
 def transpose(mat, rank, height, width, height_c, width_c, size, acc_per_rank, c_groups, transpose_group):
     proc_row = proc_row_size(size)
     proc_col = proc_col_size(size)
@@ -179,15 +151,8 @@ def split3dspmm_dense(adj_matrix, inputs, rank, row, col, rank_c, size, acc_per_
                             row_groups, col_groups, c_groups, 
                             height, middim, width):
 
-    global comm_time
-    global comp_time
 
-    global summa_bcast1
-    global summa_bcast2
-    global summa_reduce
 
-    global summa_comp
-    global summa_sparse_time
 
     proc_row = proc_row_size(size)
     proc_col = proc_col_size(size)
@@ -261,14 +226,12 @@ def split3dspmm_dense(adj_matrix, inputs, rank, row, col, rank_c, size, acc_per_
         else:
             acol = torch.cuda.FloatTensor(height_per_proc, middim_per_proc, device=device).fill_(0)
         
-        tstart = start_time(row_groups[row][rank_c], rank)
+        tstart = prof.start()
 
         acol = acol.contiguous()
         dist.broadcast(acol, row_src_rank, row_groups[row][rank_c])
 
-        dur = stop_time(row_groups[row][rank_c], rank, tstart)
-        comm_time += dur
-        summa_bcast1 += dur
+        prof.stop(tstart, "comm_time", "summa_bcast1")
 
         if col_src_rank == rank:
             brow = inputs
@@ -276,38 +239,30 @@ def split3dspmm_dense(adj_matrix, inputs, rank, row, col, rank_c, size, acc_per_
             brow = torch.cuda.FloatTensor(middim_per_proc, width_per_proc, device=device).fill_(0)
             # brow = torch.FloatTensor(middim_per_proc, width_per_proc, device=device).fill_(0)
 
-        tstart = start_time(row_groups[0][0], rank)
+        tstart = prof.start()
 
         brow = brow.contiguous()
         dist.broadcast(brow, col_src_rank, col_groups[col][rank_c])
 
-        dur = stop_time(row_groups[0][0], rank, tstart)
-        comm_time += dur
-        summa_bcast2 += dur
+        prof.stop(tstart, "comm_time", "summa_bcast2")
 
-        tstart = start_time(row_groups[0][0], rank)
+        tstart = prof.start()
 
         z_loc += torch.mm(acol, brow)
 
-        dur = stop_time(row_groups[0][0], rank, tstart)
-        comp_time += dur
-        summa_comp += dur
+        prof.stop(tstart, "comp_time", "summa_comp")
 
         del acol
         del brow
 
-    # tstart = start_time(row_groups[0][0], rank)
-    tstart = start_time(c_groups[0], rank)
+    tstart = prof.start()
 
     dist.all_reduce(z_loc, group=c_groups[int(rank // proc_c)])
     z_loc = torch.split(z_loc, chunk_sizes_row, dim=0)
     z_loc = z_loc[rank_c].contiguous()
 
 
-    # dur = stop_time(row_groups[0][0], rank, tstart)
-    dur = stop_time(c_groups[0], rank, tstart)
-    comm_time += dur
-    summa_reduce += dur
+    prof.stop(tstart, "comm_time", "summa_reduce")
     # dist.all_gather(z_tmp_recv, z_tmp, group=c_groups[int(rank // proc_c)])
     # z_tmp_recv[rank_c] = z_tmp
 
@@ -326,18 +281,9 @@ def split3dspmm_sparse(adj_matrix, inputs, rank, row, col, rank_c, size, acc_per
                             row_groups, col_groups, c_groups, 
                             height, middim, width):
 
-    global comm_time
-    global comp_time
 
-    global summa_sparse_bcast1
-    global summa_sparse_bcast2
-    global summa_sparse_reduce
 
-    global summa_sparse_bcast1_words
-    global summa_sparse_bcast2_words
 
-    global summa_sparse_comp
-    global summa_sparse_time
 
     proc_row = proc_row_size(size)
     proc_col = proc_col_size(size)
@@ -429,15 +375,12 @@ def split3dspmm_sparse(adj_matrix, inputs, rank, row, col, rank_c, size, acc_per
 
         acol = torch.cat((acol_indices.float(), acol_values.unsqueeze(0)), dim=0)
 
-        tstart = start_time(row_groups[row][rank_c], rank)
+        tstart = prof.start()
 
         dist.broadcast(acol.contiguous(), row_src_rank, row_groups[row][rank_c])
 
-        dur = stop_time(row_groups[row][rank_c], rank, tstart)
-        comm_time += dur
-        summa_sparse_bcast1 += dur
-        if rank == 0:
-            summa_sparse_bcast1_words += 3 * acol_values_len
+        prof.stop(tstart, "comm_time", "summa_sparse_bcast1")
+        prof.count("summa_sparse_bcast1_words", 3 * acol_values_len)
 
         acol_indices = acol[:2].long()
         acol_values = acol[2].squeeze(0)
@@ -459,43 +402,34 @@ def split3dspmm_sparse(adj_matrix, inputs, rank, row, col, rank_c, size, acc_per
             # brow = torch.FloatTensor(middim_per_proc, width_per_proc, device=device)
 
 
-        tstart = start_time(row_groups[0][0], rank)
+        tstart = prof.start()
 
         brow = brow.contiguous()
         dist.broadcast(brow, col_src_rank, col_groups[col][rank_c])
 
-        dur = stop_time(row_groups[0][0], rank, tstart)
-        comm_time += dur
-        summa_sparse_bcast2 += dur
-        if rank == 0:
-            summa_sparse_bcast2_words += brow.size(0) * brow.size(1)
+        prof.stop(tstart, "comm_time", "summa_sparse_bcast2")
+        prof.count("summa_sparse_bcast2_words", brow.size(0) * brow.size(1))
 
-        tstart = start_time(row_groups[0][0], rank)
+        tstart = prof.start()
 
         # z_tmp = torch.cuda.FloatTensor(height_per_proc, width_per_proc, device=device).fill_(0)
         spmm_gpu(acol_indices[0].int(), acol_indices[1].int(), acol_values, 
                         height_per_proc, middim_per_proc, brow, z_loc)
         # z_loc += torch.sparse.mm(acol, brow)
 
-        dur = stop_time(row_groups[0][0], rank, tstart)
-        comp_time += dur
-        summa_sparse_comp += dur
+        prof.stop(tstart, "comp_time", "summa_sparse_comp")
 
         # del acol
         # del brow
 
-    # tstart = start_time(row_groups[0][0], rank)
     z_loc = z_loc.contiguous()
-    tstart = start_time(c_groups[0], rank)
+    tstart = prof.start()
 
     dist.all_reduce(z_loc, group=c_groups[int(rank // proc_c)])
     z_loc = torch.split(z_loc, chunk_sizes_col, dim=1)
     z_loc = z_loc[rank_c].contiguous()
 
-    # dur = stop_time(row_groups[0][0], rank, tstart)
-    dur = stop_time(c_groups[0], rank, tstart)
-    comm_time += dur
-    summa_sparse_reduce += dur
+    prof.stop(tstart, "comm_time", "summa_sparse_reduce")
 
     return z_loc, chunk_sizes_col
 
@@ -505,15 +439,8 @@ def split3dspmm_loc(mata, matb, rank, row, col, rank_c, size, acc_per_rank,
                             height, middim, width):
 
 
-    global comm_time
-    global comp_time
 
-    global summa_bcast1
-    global summa_bcast2
-    global summa_reduce
 
-    global summa_comp
-    global summa_sparse_time
 
     proc_row = proc_row_size(size)
     proc_col = proc_col_size(size)
@@ -574,13 +501,11 @@ def split3dspmm_loc(mata, matb, rank, row, col, rank_c, size, acc_per_rank,
             # acol = torch.FloatTensor(height_per_proc, matb[col_src_rank].size(0), 
             #                                 device=device)
         
-        tstart = start_time(row_groups[row][rank_c], rank)
+        tstart = prof.start()
 
         dist.broadcast(acol.contiguous(), row_src_rank, row_groups[row][rank_c])
 
-        dur = stop_time(row_groups[row][rank_c], rank, tstart)
-        comm_time += dur
-        summa_bcast1 += dur
+        prof.stop(tstart, "comm_time", "summa_bcast1")
 
         # if col_src_rank == rank:
         #     brow = matb.clone()
@@ -591,25 +516,19 @@ def split3dspmm_loc(mata, matb, rank, row, col, rank_c, size, acc_per_rank,
 
         brow = matb[col_src_rank]
 
-        tstart = start_time(row_groups[0][0], rank)
+        tstart = prof.start()
 
         z_tmp = torch.mm(acol, brow)
 
-        dur = stop_time(row_groups[0][0], rank, tstart)
-        summa_comp += dur
-        comp_time += dur
+        prof.stop(tstart, "comp_time", "summa_comp")
 
-        # tstart = start_time(row_groups[0][0], rank)
-        tstart = start_time(c_groups[0], rank)
+        tstart = prof.start()
 
         dist.all_reduce(z_tmp, group=c_groups[int(rank // proc_c)])
 
         z_loc += z_tmp
 
-        # dur = stop_time(row_groups[0][0], rank, tstart)
-        dur = stop_time(c_groups[0], rank, tstart)
-        summa_reduce += dur
-        comm_time += dur
+        prof.stop(tstart, "comm_time", "summa_reduce")
 
         # del acol
         # del z_tmp
@@ -842,17 +761,11 @@ class GCNFunc(torch.autograd.Function):
         # else:
         #     h = z
 
-        # fwd_time += dur
 
         return z
 
     @staticmethod
     def backward(ctx, grad_output):
-        global summa_sparse_bcast2
-        global summa_sparse_bcast2_bwd
-        global bwd_time
-        global transpose_time
-        global grad_weight_time
 
         inputs, weight, adj_matrix = ctx.saved_tensors
         rank = ctx.rank
@@ -878,7 +791,6 @@ class GCNFunc(torch.autograd.Function):
         device = torch.device('cuda:{}'.format(rank_to_devid(rank, acc_per_rank)))
         # device = torch.device('cpu')
 
-        # tstart = start_time(row_groups[0], rank)
             
         # Worry about activation later
         # with torch.set_grad_enabled(True):
@@ -894,8 +806,6 @@ class GCNFunc(torch.autograd.Function):
         #     print(f"rank: {rank} sigmap: {sigmap}", flush=True)
         #     grad_output = sigmap
 
-        tmp_summa_sparse_bcast2 = summa_sparse_bcast2
-
         # First backprop equation
         # TODO: will need to change height argument when n % sqrt(P) != 0 and non-square grid
         ag, chunk_sizes_loc = split3dspmm_sparse(adj_matrix, grad_output, 
@@ -909,7 +819,6 @@ class GCNFunc(torch.autograd.Function):
         dist.all_gather(chunk_sizes, chunk_sizes_loc_tens, group=row_groups[rank_row][rank_c])
         chunk_sizes = torch.cat(chunk_sizes).tolist()
 
-        # tstart_grad_weight = start_time(row_groups[0], rank)
         chunk_sizes_row = []
         chunk_sizes_col = []
         weight_per_row = weight.t().size(0) // (proc_row * proc_c)
@@ -954,7 +863,6 @@ class GCNFunc(torch.autograd.Function):
                                         row_groups, col_groups, c_groups, 
                                         node_count, weight.t().size(0), weight.size(1))
 
-        # grad_weight_time += stop_time(row_groups[0], rank, tstart_grad_weight)
 
         # Second backprop equation (reuses the A * G^l computation)
         # col_groups twice because of transpose
@@ -968,20 +876,38 @@ class GCNFunc(torch.autograd.Function):
         if rank_col == proc_col - 1:
             width_c = weight.size(1) - width_c * (proc_col - 1)
 
-        tstart_transpose = start_time(row_groups[0][0], rank)
+        tstart_transpose = prof.start()
 
         ag_t = transpose(ag, rank, node_count, weight.size(1), height_c, width_c, size, acc_per_rank, 
                                 c_groups, transpose_group)
 
-        transpose_time += stop_time(row_groups[0][0], rank, tstart_transpose)
+        prof.stop(tstart_transpose, "transpose_time")
 
         # grad_weight = summa(inputs_t, ag, rank, rank_row, rank_col, size, acc_per_rank, row_groups,
         #                         col_groups, weight.size(0), node_count, weight.size(1))
         grad_weight = split3dspmm_dense(ag_t, inputs, 
                                 rank, rank_row, rank_col, rank_c, size, acc_per_rank, 
                                 row_groups, col_groups, c_groups, weight.size(1), node_count, weight.size(0))
+
+        if grad_reducer is not None:
+            # Tiles of grad_weight^T are disjoint: rank (i, j, k) holds row chunk k of block (i, j). Each
+            # rank writes its own into a zeroed full-size slot and the bucket's sum assembles grad_weight
+            # on every rank while backward goes on
+            height_i = weight.size(1) // proc_row
+            row_start = rank_row * height_i
+            if rank_row == proc_row - 1:
+                height_i = weight.size(1) - height_i * (proc_row - 1)
+            row_start += rank_c * (height_i // proc_c)
+            col_start = rank_col * (weight.size(0) // proc_col)
+            grad_weight_fin = grad_reducer.view(weight)
+            grad_weight_fin.zero_()
+            grad_weight_fin.t()[row_start:row_start + grad_weight.size(0),
+                                col_start:col_start + grad_weight.size(1)] = grad_weight
+            grad_reducer.push(weight, grad_weight_fin)
+
+            del ag
+            return grad_input, None, None, None, None, None, None, None, None, None, None, None, None, None
         
-        # tstart_grad_weight = start_time(row_groups[0], rank)
         # Collect grad_weight's across processes
         grad_weight_recv = []
         # max_row_chunk = max(chunk_sizes_col) #transpose
@@ -1042,10 +968,7 @@ class GCNFunc(torch.autograd.Function):
                 grad_weight_row = torch.cat((grad_weight_row, grad_weight_col), dim=1)
             grad_weight_fin = torch.cat((grad_weight_fin, grad_weight_row), dim=0)
 
-        # dur = stop_time(row_groups[0], rank, tstart)
-        # bwd_time += dur
 
-        # grad_weight_time += stop_time(row_groups[0], rank, tstart_grad_weight)
         grad_weight_fin = grad_weight_fin.t()
 
         del ag
@@ -1054,7 +977,6 @@ class GCNFunc(torch.autograd.Function):
 def train(inputs, weight1, weight2, node_count, adj_matrix, am_partitions, optimizer, data, rank, 
                 size, acc_per_rank, group, row_groups, col_groups, transpose_group, c_groups):
 
-    global loss_calc_time
 
     device = torch.device('cuda:{}'.format(rank_to_devid(rank, acc_per_rank)))
 
@@ -1094,7 +1016,7 @@ def train(inputs, weight1, weight2, node_count, adj_matrix, am_partitions, optim
     if list(datay_rank[rank_train_mask].size())[0] > 0:
     # if datay_rank.size(0) > 0:
         # datay_ids = datay_rank[rank_train_mask].long().view(-1, 1)
-        tstart_loss_calc = start_time(row_groups[0][0], rank)
+        tstart_loss_calc = prof.start()
 
         datay_ids = datay_rank[rank_train_mask].long()
 
@@ -1117,7 +1039,7 @@ def train(inputs, weight1, weight2, node_count, adj_matrix, am_partitions, optim
         vertex_train_count = (data.train_mask.size(0) - (data.train_mask == 0).sum(dim=0))
         loss_calc = -loss_calc / vertex_train_count
 
-        loss_calc_time += stop_time(row_groups[0][0], rank, tstart_loss_calc)
+        prof.stop(tstart_loss_calc, "loss_calc_time")
 
         loss_calc.backward()
 
@@ -1136,6 +1058,11 @@ def train(inputs, weight1, weight2, node_count, adj_matrix, am_partitions, optim
         # fake_loss = (outputs * torch.zeros(outputs.size())).sum()
         fake_loss.backward()
 
+    if grad_reducer is not None:
+        tstart_grad_weight = prof.start()
+        grad_reducer.finish()
+        prof.stop(tstart_grad_weight, "grad_weight_time")
+
     optimizer.step()
 
     return outputs
@@ -1158,90 +1085,6 @@ def test(outputs, data, vertex_count, rank):
     return accs
 
 
-# Split a COO into partitions of size n_per_proc
-# Basically torch.split but for Sparse Tensors since pytorch doesn't support that.
-def split_coo(adj_matrix, node_count, n_per_proc, dim, size):
-    proc_row = proc_row_size(size)
-    proc_col = proc_col_size(size)
-    proc_c = proc_c_size(size)
-
-    vtx_indices = list(range(0, node_count, n_per_proc))
-    vtx_indices = vtx_indices[:proc_c]
-    vtx_indices.append(node_count)
-
-    am_partitions = []
-    for i in range(len(vtx_indices) - 1):
-        am_part = adj_matrix[:,(adj_matrix[dim,:] >= vtx_indices[i]).nonzero().squeeze(1)]
-        am_part = am_part[:,(am_part[dim,:] < vtx_indices[i + 1]).nonzero().squeeze(1)]
-        am_part[dim] -= vtx_indices[i]
-        am_partitions.append(am_part)
-
-    return am_partitions, vtx_indices
-    # proc_row = proc_row_size(size)
-    # proc_col = proc_col_size(size)
-
-    # vtx_indices = list(range(0, node_count, n_per_proc))
-    # vtx_indices = vtx_indices[:proc_row]
-    # vtx_indices.append(node_count)
-
-    # am_partitions = []
-    # for i in range(len(vtx_indices) - 1):
-    #     am_part = adj_matrix[:,(adj_matrix[dim,:] >= vtx_indices[i]).nonzero().squeeze(1)]
-    #     am_part = am_part[:,(am_part[dim,:] < vtx_indices[i + 1]).nonzero().squeeze(1)]
-    #     am_part[dim] -= vtx_indices[i]
-    #     am_partitions.append(am_part)
-
-    # return am_partitions, vtx_indices
-
-# Normalize all elements according to KW's normalization rule
-def scale_elements(adj_matrix, adj_part, node_count, row_vtx, col_vtx):
-    if not normalization:
-        return
-
-    # Scale each edge (u, v) by 1 / (sqrt(u) * sqrt(v))
-    indices = adj_part._indices()
-    values = adj_part._values()
-
-    deg_map = dict()
-    for i in range(adj_part._nnz()):
-        u = indices[0][i] + row_vtx
-        v = indices[1][i] + col_vtx
-
-        if u.item() in deg_map:
-            degu = deg_map[u.item()]
-        else:
-            degu = (adj_matrix[0] == u).sum().item()
-            deg_map[u.item()] = degu
-
-        if v.item() in deg_map:
-            degv = deg_map[v.item()]
-        else:
-            degv = (adj_matrix[0] == v).sum().item()
-            deg_map[v.item()] = degv
-
-        values[i] = values[i] / (math.sqrt(degu) * math.sqrt(degv))
-    
-    # deg = torch.histc(adj_matrix[0].float(), bins=node_count)
-    # deg = deg.pow(-0.5)
-
-    # row_len = adj_part.size(0)
-    # col_len = adj_part.size(1)
-
-    # dleft = torch.sparse_coo_tensor([np.arange(row_vtx, row_vtx + row_len).tolist(),
-    #                                  np.arange(row_vtx, row_vtx + row_len).tolist()],
-    #                                  deg[row_vtx:(row_vtx + row_len)],
-    #                                  size=(row_len, row_len),
-    #                                  requires_grad=False)
-
-    # dright = torch.sparse_coo_tensor([np.arange(col_vtx, col_vtx + col_len).tolist(),
-    #                                  np.arange(col_vtx, col_vtx + col_len).tolist()],
-    #                                  deg[row_vtx:(col_vtx + col_len)],
-    #                                  size=(col_len, col_len),
-    #                                  requires_grad=False)
-
-    # adj_part = torch.sparse.mm(torch.sparse.mm(dleft, adj_part), dright)
-    # return adj_part
-
 def proc_row_size(size):
     cube_root = int(size ** (1./ 3.))
     if cube_root ** 3 == size:
@@ -1287,11 +1130,14 @@ def twod_partition(rank, size, inputs, adj_matrix, data, features, classes, devi
     # Compute the adj_matrix and inputs partitions for this process
     # TODO: Maybe I do want grad here. Unsure.
     with torch.no_grad():
+        # Degrees are computed once for the whole graph, each block only gathers them
+        norm = norm_factors(adj_matrix, node_count, norm_type if normalization else "none")
+
         # Column partitions
-        am_partitions, vtx_indices = split_coo(adj_matrix, node_count, n_per_proc, 1, size)
+        am_partitions, vtx_indices = split_coo(adj_matrix, node_count, n_per_proc, 1, proc_c)
 
         proc_node_count = vtx_indices[rank_col + 1] - vtx_indices[rank_col]
-        am_pbyp, _ = split_coo(am_partitions[rank_col], node_count, n_per_proc, 0, size)
+        am_pbyp, _ = split_coo(am_partitions[rank_col], node_count, n_per_proc, 0, proc_c)
         for i in range(len(am_pbyp)):
             if i == proc_row - 1:
                 last_node_count = vtx_indices[i + 1] - vtx_indices[i]
@@ -1299,15 +1145,13 @@ def twod_partition(rank, size, inputs, adj_matrix, data, features, classes, devi
                                                         size=(last_node_count, proc_node_count),
                                                         requires_grad=False)
 
-                scale_elements(adj_matrix, am_pbyp[i], node_count, vtx_indices[i], 
-                                    vtx_indices[rank_col])
+                am_pbyp[i] = scale_elements(am_pbyp[i], norm, vtx_indices[i], vtx_indices[rank_col])
             else:
                 am_pbyp[i] = torch.sparse_coo_tensor(am_pbyp[i], torch.ones(am_pbyp[i].size(1)), 
                                                         size=(n_per_proc, proc_node_count),
                                                         requires_grad=False)
 
-                scale_elements(adj_matrix, am_pbyp[i], node_count, vtx_indices[i], 
-                                    vtx_indices[rank_col])
+                am_pbyp[i] = scale_elements(am_pbyp[i], norm, vtx_indices[i], vtx_indices[rank_col])
 
         # input_rowparts = torch.split(inputs, math.ceil(float(inputs.size(0)) / proc_row), dim=0)
         inputs_per_row = inputs.size(0) // proc_row
@@ -1349,7 +1193,7 @@ def threed_partition_loc(rank, size, inputs, adj_matrix, height, width, data, fe
     rank_col = int((rank // proc_c) % proc_col)  # j in process grid
     rank_c = rank - (rank_row * (proc_col * proc_c) + rank_col * proc_c) # k in process grid
     
-    am_partitions, vtx_indices = split_coo(adj_matrix, width, n_per_proc, 1, size)
+    am_partitions, vtx_indices = split_coo(adj_matrix, width, n_per_proc, 1, proc_c)
 
     for i in range(len(am_partitions)):
         if i == proc_c - 1:
@@ -1401,15 +1245,18 @@ def threed_partition(rank, size, inputs, adj_matrix, data, features, classes, de
     # Compute the adj_matrix and inputs partitions for this process
     # TODO: Maybe I do want grad here. Unsure.
     with torch.no_grad():
+        # Degrees are computed once for the whole graph, each block only gathers them
+        norm = norm_factors(adj_matrix, node_count, norm_type if normalization else "none")
+
         # Compute column partitions
-        am_partitions, vtx_indices_col = split_coo(adj_matrix, node_count, n_per_proc_col, 1, size)
+        am_partitions, vtx_indices_col = split_coo(adj_matrix, node_count, n_per_proc_col, 1, proc_c)
 
         proc_node_count = vtx_indices_col[rank_col * proc_c + rank_c + 1] -  \
                                         vtx_indices_col[rank_col * proc_c + rank_c]
 
         # Compute row partitions
         am_pbyp, vtx_indices_row = split_coo(am_partitions[rank_col * proc_c + rank_c], node_count, 
-                                                    n_per_proc_row, 0, size)
+                                                    n_per_proc_row, 0, proc_c)
 
         for i in range(len(am_pbyp)):
             if i == proc_row - 1:
@@ -1418,15 +1265,13 @@ def threed_partition(rank, size, inputs, adj_matrix, data, features, classes, de
                                                         size=(last_node_count, proc_node_count),
                                                         requires_grad=False)
 
-                scale_elements(adj_matrix, am_pbyp[i], node_count, vtx_indices_row[i], 
-                                    vtx_indices_col[rank_col * proc_c + rank_c])
+                am_pbyp[i] = scale_elements(am_pbyp[i], norm, vtx_indices_row[i], vtx_indices_col[rank_col * proc_c + rank_c])
             else:
                 am_pbyp[i] = torch.sparse_coo_tensor(am_pbyp[i], torch.ones(am_pbyp[i].size(1)), 
                                                         size=(n_per_proc_row, proc_node_count),
                                                         requires_grad=False)
 
-                scale_elements(adj_matrix, am_pbyp[i], node_count, vtx_indices_row[i], 
-                                    vtx_indices_col[rank_col * proc_c + rank_c])
+                am_pbyp[i] = scale_elements(am_pbyp[i], norm, vtx_indices_row[i], vtx_indices_col[rank_col * proc_c + rank_c])
 
         # input_rowparts = torch.split(inputs, math.ceil(float(inputs.size(0)) / proc_row), dim=0)
         inputs_per_row = inputs.size(0) // (proc_row * proc_c)
@@ -1463,10 +1308,7 @@ def rank_to_devid(rank, acc_per_rank):
     return rank % acc_per_rank
 
 def run(rank, size, inputs, adj_matrix, data, features, mid_layer, classes, device, acc_per_rank):
-    global comm_time
-    global comp_time
     global epochs
-    global timing
 
     best_val_acc = test_acc = 0
     outputs = None
@@ -1527,16 +1369,25 @@ def run(rank, size, inputs, adj_matrix, data, features, mid_layer, classes, devi
 
     optimizer = torch.optim.Adam([weight1, weight2], lr=0.01)
 
+    global grad_reducer
+    if async_grad:
+        grad_reducer = GradReducer([weight1, weight2], bucket_mb=grad_bucket_mb)
+
     # inputs_loc, adj_matrix_loc, _ = threed_partition(rank, size, inputs, adj_matrix, data, features,
     #                                                     classes, device)
-    print(f"Before partitioning...", flush=True)
-    inputs_loc, adj_matrix_loc, _ = twod_partition(rank, size, inputs, adj_matrix, data, features,
-                                                        classes, device)
-    adj_matrix_loc = adj_matrix_loc.coalesce()
+    def partition():
+        inputs_loc, adj_matrix_loc, _ = twod_partition(rank, size, inputs, adj_matrix, data, features,
+                                                            classes, device)
+        adj_matrix_loc = adj_matrix_loc.coalesce()
+
+        return threed_partition_loc(rank, size, inputs_loc, adj_matrix_loc.indices(), 
+                                        adj_matrix_loc.size(0), adj_matrix_loc.size(1),
+                                        data, features, classes, device)
 
-    inputs_loc, adj_matrix_loc = threed_partition_loc(rank, size, inputs_loc, adj_matrix_loc.indices(), 
-                                                                adj_matrix_loc.size(0), adj_matrix_loc.size(1),
-                                                                data, features, classes, device)
+    print(f"Before partitioning...", flush=True)
+    inputs_loc, adj_matrix_loc = cached_partition(partition_cache, graphname, "3d", rank, size,
+                                                    adj_matrix, inputs, partition,
+                                                    norm_type if normalization else "none")
     print(f"After partitioning...", flush=True)
 
     adj_matrix_loc = adj_matrix_loc.coalesce()
@@ -1544,17 +1395,18 @@ def run(rank, size, inputs, adj_matrix, data, features, mid_layer, classes, devi
     inputs_loc = inputs_loc.to(device)
     adj_matrix_loc = adj_matrix_loc.to(device)
 
+    global prof
+    prof = Profiler(rank, device, enabled=False, trace=bool(profile_dir),
+                        sync_group=group if timing_sync else None)
+
     print(f"rank: {rank} Before first epoch...", flush=True)
     # Do not time first epoch
-    timing_on = timing == True
-    timing = False
     outputs = train(inputs_loc, weight1, weight2, inputs.size(0), adj_matrix_loc, None, 
                             optimizer, data, rank, size, acc_per_rank, group, row_groups, 
                             col_groups, transpose_group, c_groups)
     print(f"After first epoch...", flush=True)
 
-    if timing_on:
-        timing = True
+    prof.enabled = timing
 
     dist.barrier(group)
     if rank == 0:
@@ -1604,31 +1456,31 @@ def run(rank, size, inputs, adj_matrix, data, features, mid_layer, classes, devi
         tstop = time.time()
         print("Time: " + str(tstop - tstart))
 
+    run_stats = prof.summary()
+    if profile_dir:
+        prof.write_json(osp.join(profile_dir, "run0", f"rank{rank}.json"))
+        prof.write_trace(osp.join(profile_dir, "run0", f"rank{rank}.trace.json"))
+
     if rank == 0:
-        print("comm_time: " + str(comm_time))
-        print("comp_time: " + str(comp_time))
-        print(f"summa_sparse_comp: {summa_sparse_comp}")
-        print(f"summa_sparse_bcast1: {summa_sparse_bcast1}")
-        print(f"summa_sparse_bcast1_words: {summa_sparse_bcast1_words}")
-        print(f"summa_sparse_bcast2: {summa_sparse_bcast2}")
-        print(f"summa_sparse_reduce: {summa_sparse_reduce}")
-        print(f"summa_sparse_bcast2_fwd: {summa_sparse_bcast2_fwd}")
-        print(f"summa_sparse_bcast2_bwd: {summa_sparse_bcast2_bwd}")
-        print(f"summa_sparse_bcast2_words: {summa_sparse_bcast2_words}")
-        print(f"summa_comp: {summa_comp}")
-        print(f"summa_bcast1: {summa_bcast1}")
-        print(f"summa_bcast2: {summa_bcast2}")
-        print(f"summa_reduce: {summa_reduce}")
-        print(f"summa_loc_bcast: {summa_loc_bcast}")
-        print(f"fwd_time: {fwd_time}")
-        print(f"bwd_time: {bwd_time}")
-        print(f"transpose_time: {transpose_time}")
-        print(f"grad_weight_time: {grad_weight_time}")
-        print(f"loss_calc_time: {loss_calc_time}")
-        print(f"summa_sparse_time: {summa_sparse_time}")
-        print(f"summa_time: {summa_time}")
-        print(f"summa_loc_time: {summa_loc_time}")
-    
+        totals = run_stats["totals"]
+        counters = run_stats["counters"]
+        for name in ["comm_time", "comp_time", "summa_sparse_comp", "summa_sparse_bcast1"]:
+            print(f"{name}: {totals.get(name, 0.0)}")
+        print(f"summa_sparse_bcast1_words: {counters.get('summa_sparse_bcast1_words', 0)}")
+        for name in ["summa_sparse_bcast2", "summa_sparse_reduce"]:
+            print(f"{name}: {totals.get(name, 0.0)}")
+        print(f"summa_sparse_bcast2_words: {counters.get('summa_sparse_bcast2_words', 0)}")
+        for name in ["summa_comp", "summa_bcast1", "summa_bcast2", "summa_reduce", "transpose_time",
+                        "grad_weight_time"]:
+            print(f"{name}: {totals.get(name, 0.0)}")
+        print(f"async_grad: {async_grad} grad_bucket_mb: {grad_bucket_mb}")
+        print(f"loss_calc_time: {totals.get('loss_calc_time', 0.0)}")
+
+    # Cross-rank min/mean/max of the breakdown, one collective for all timers
+    _, stats = aggregate(run_stats, group)
+    if rank == 0:
+        print_stats(stats)
+
     # All-gather outputs to test accuracy
     # output_parts = []
     # for i in range(size):
@@ -1768,6 +1620,10 @@ def main():
     else:
         adj_matrix = edge_index
 
+    # Renumber the vertices for locality before they are cut into contiguous blocks
+    adj_matrix, inputs, _ = reorder_graph(reorder_type, adj_matrix, inputs, data,
+                                              proc_row_size(size), rank)
+
     outputs = None
     print("Processes: " + str(size), flush=True)
 
@@ -1786,6 +1642,13 @@ if __name__ == '__main__':
     parser.add_argument("--graphname", type=str)
     parser.add_argument("--timing", type=str)
     parser.add_argument("--midlayer", type=int)
+    parser.add_argument("--partcache", type=str, default="")
+    parser.add_argument("--reorder", type=str, default="none")
+    parser.add_argument("--balance", type=str, default="vertex")
+    parser.add_argument("--asyncgrad", type=str, default="False")
+    parser.add_argument("--gradbucket", type=float, default=25.0)
+    parser.add_argument("--timingsync", type=str, default="False")
+    parser.add_argument("--profiledir", type=str, default="")
     args = parser.parse_args()
     print(args)
 
@@ -1797,11 +1660,24 @@ if __name__ == '__main__':
     graphname = args.graphname
     timing = args.timing == "True"
     mid_layer = args.midlayer
+    partition_cache = args.partcache
+    reorder_type = args.reorder
+    partition_balance = args.balance
+    async_grad = args.asyncgrad == "True"
+    grad_bucket_mb = args.gradbucket
+    timing_sync = args.timingsync == "True"
+    profile_dir = args.profiledir
 
     if (epochs is None) or (graphname is None) or (timing is None) or (mid_layer is None):
         print(f"Error: missing argument {epochs} {graphname} {timing} {mid_layer}")
         exit()
 
+    # SUMMA cuts both grid dimensions at equal vertex counts, the nnz/cost row
+    # boundaries of the 1D and 1.5D algorithms are not threaded through it
+    if partition_balance != "vertex":
+        print(f"Error: --balance {partition_balance} is not supported by the 3D algorithm, only vertex")
+        exit(1)
+
     print(f"Arguments: epochs: {epochs} graph: {graphname} timing: {timing} mid: {mid_layer}")
     
     print(main())
@@ -1,5 +1,6 @@
 import os
 import os.path as osp
+import sys
 import argparse
 
 import math
@@ -26,6 +27,13 @@ from torch_scatter import scatter_add
 import torch_sparse
 
 from sparse_coo_tensor_cpp import sparse_coo_tensor_gpu, spmm_gpu
+from partition_utils import split_coo, norm_factors, scale_elements
+from workspace import Workspace
+from redistribute import alltoall_transpose
+# subgraph_loader is shared by the RDM, PyG and DGL scripts and lives in common/ at the top of the repo
+sys.path.insert(0, osp.join(osp.dirname(osp.abspath(__file__)), "..", "..", "common"))
+from subgraph_loader import SubgraphPrefetcher
+from profiler import Profiler, aggregate, print_stats
 
 import socket
 import statistics
@@ -38,30 +46,21 @@ from tqdm import tqdm
 #exit()
 
 
-# comp_time = 0.0
-# comm_time = 0.0
-# scomp_time = 0.0
-# dcomp_time = 0.0
-# bcast_comm_time = 0.0
-# bcast_words = 0
-# op1_comm_time = 0.0
-# op2_comm_time = 0.0
 total_time = dict()
-comp_time = dict()
-comm_time = dict()
-scomp_time = dict()
-dcomp_time = dict()
-bcast_comm_time = dict()
-barrier_time = dict()
-barrier_subset_time = dict()
-op1_comm_time = dict()
-op2_comm_time = dict()
+# Timers of the current run (comm_time, bcast_comm_time, ...), replaced in run(). Per-run
+# summaries are kept in run_stats for the median-run breakdown
+prof = Profiler(enabled=False)
+run_stats = dict()
+
+# Staging buffers for transpose_input, reused across layers and epochs
+workspace = Workspace()
 
 epochs = 0
 graphname = ""
 mid_layer = 0
 timing = True
 normalization = False
+norm_type = "sym"
 activations = False
 accuracy = False
 device = None
@@ -70,36 +69,12 @@ run_count = 0
 run = 0
 download = False
 ht = True
-
-def start_time(group, rank, subset=False, src=None):
-    global barrier_time
-    global barrier_subset_time
-
-    if not timing:
-        return 0.0
-
-    barrier_tstart = time.time()
-
-    dist.barrier(group)
-    barrier_tstop = time.time()
-    barrier_time[run][rank] += barrier_tstop - barrier_tstart
-    if subset:
-        barrier_subset_time[run][rank] += barrier_tstop - barrier_tstart
-
-    tstart = 0.0
-    tstart = time.time()
-    return tstart
-
-def stop_time(group, rank, tstart):
-    if not timing:
-        return 0.0
-    dist.barrier(group)
-    devid = rank_to_devid(rank, acc_per_rank)
-    device = torch.device('cuda:{}'.format(devid))
-    # torch.cuda.synchronize(device=device)
-
-    tstop = time.time()
-    return tstop - tstart
+sample_workers = 0
+sample_queue = 8
+# Minibatch that run() draws each later epoch's subgraphs from, set with --sampleworkers
+epoch_sampler = None
+timing_sync = False
+profile_dir = ""
 
 def normalize(adj_matrix):
     adj_matrix = adj_matrix + torch.eye(adj_matrix.size(0))
@@ -149,32 +124,24 @@ def block_row(adj_matrix, am_partitions, inputs, weight, rank, size):
     return z_loc
 
 def outer_product(adj_matrix, grad_output, rank, size, group):
-    global comm_time
-    global comp_time
-    global dcomp_time
-    global op1_comm_time
     global run
 
 
     n_per_proc = math.ceil(float(adj_matrix.size(0)) / size)
 
-    tstart_comp = start_time(group, rank)
+    tstart_comp = prof.start()
 
     # A * G^l
     ag = torch.mm(adj_matrix, grad_output)
 
-    dur = stop_time(group, rank, tstart_comp)
-    comp_time[run][rank] += dur
-    dcomp_time[run][rank] += dur
+    prof.stop(tstart_comp, "comp_time", "dcomp_time")
 
-    tstart_comm = start_time(group, rank)
+    tstart_comm = prof.start()
 
     # reduction on A * G^l low-rank matrices
     dist.all_reduce(ag, op=dist.reduce_op.SUM, group=group)
 
-    dur = stop_time(group, rank, tstart_comm)
-    comm_time[run][rank] += dur
-    op1_comm_time[run][rank] += dur
+    prof.stop(tstart_comm, "comm_time", "op1_comm_time")
 
     # partition A * G^l by block rows and get block row for this process
     # TODO: this might not be space-efficient
@@ -184,117 +151,31 @@ def outer_product(adj_matrix, grad_output, rank, size, group):
     return grad_input
 
 def outer_product2(inputs, ag, rank, size, group):
-    global comm_time
-    global comp_time
-    global dcomp_time
-    global op2_comm_time
     global run
 
-    tstart_comp = start_time(group, rank)
+    tstart_comp = prof.start()
     # (H^(l-1))^T * (A * G^l)
     grad_weight = torch.mm(inputs, ag)
 
-    dur = stop_time(group, rank, tstart_comp)
-    comp_time[run][rank] += dur
-    dcomp_time[run][rank] += dur
+    prof.stop(tstart_comp, "comp_time", "dcomp_time")
 
-    tstart_comm = start_time(group, rank)
+    tstart_comm = prof.start()
     # reduction on grad_weight low-rank matrices
     dist.all_reduce(grad_weight, op=dist.reduce_op.SUM, group=group)
 
-    dur = stop_time(group, rank, tstart_comm)
-    comm_time[run][rank] += dur
-    op2_comm_time[run][rank] += dur
+    prof.stop(tstart_comm, "comm_time", "op2_comm_time")
 
     return grad_weight
 
 def transpose_input(node_count,inputs,rank,size,dim):
-    #print('in transpose '+str(rank)+' at dim '+str(dim))
-    global device
-    global comm_time
-    global comp_time
-    global scomp_time
-    global bcast_comm_time
-    global run
     global ht
 
     ht = not ht
-    if dim == 0:
-        #horizontal_tiled = False
-        # Horizontal to Vertical
-        input_2d = torch.split(inputs, math.ceil(float(inputs.size(1-dim)) / size), dim=1-dim)
-        #if len(col_count) == 0:  for i in input_2d:    col_count += [input_2d[rank].size(1)]
-        recv = [0]*size
-        for i in range(size):
-            col_count[i] = input_2d[i].size(1)
-        for ii in range(size):
-            i = ii^rank
-            if i == rank:
-                recv[i] = input_2d[rank]
-                continue
-            '''
-            print('inside h2v transpose')
-            print(size)
-            print(i)
-            print(rank)
-            print(inputs.size())
-            '''
-            input_recv = torch.zeros(row_count[i], col_count[rank], device=device)
-
-            #print('buffer size '+str(input_recv.size()))
-            if i < rank :
-                dist.send(tensor=input_2d[i].contiguous(), dst=i)
-                dist.recv(tensor=input_recv, src=i)
-            else:
-                dist.recv(tensor=input_recv, src=i)
-                dist.send(tensor=input_2d[i].contiguous(), dst=i)
-
-            recv[i] = input_recv
-        inputs = torch.cat(recv,0)
-        #print('size after transpose')
-        #print(inputs.size())
-        #print('after tp ht: '+str(horizontal_tiled)+' in rank '+str(rank))
-        return inputs
-    elif dim == 1:
-        # Vertical to Horizontal
-        #horizontal_tiled = True
-        # print('Transpose '+str(inputs.size()))
-        # print(row_count)
-        input_2d = torch.split(inputs, math.ceil(float(inputs.size(1-dim)) / size), dim=1-dim)
-        recv = [0]*size
-        for ii in range(size):
-            i = ii ^ rank
-            if i == rank:
-                recv[i] = input_2d[rank]
-                continue
-            '''
-            print('inside v2h transpose')
-            print(size)
-            print(i)
-            print(rank)
-            print(inputs.size())
-            '''
-            input_recv = torch.zeros(row_count[rank], col_count[i], device=device)
-            #print('buffer size '+str(input_recv.size()))
-            if i < rank :
-                dist.send(tensor=input_2d[i].contiguous(), dst=i)
-                dist.recv(tensor=input_recv, src=i)
-            else:
-                dist.recv(tensor=input_recv, src=i)
-                dist.send(tensor=input_2d[i].contiguous(), dst=i)
-            recv[i] = input_recv
-        #for t in recv:            print('concat tensors '+str(t.size()))
-        inputs = torch.cat(recv,1)
-        #print('size after transpose')
-        #print(inputs.size())
-        return inputs
+    # One all-to-all with row_count/col_count split sizes instead of P - 1 pairwise send/recv rounds
+    return alltoall_transpose(inputs, row_count, col_count, rank, size, dim, workspace)
 
 def broad_func(node_count, am_partitions, inputs, rank, size, group, horizontal_tiled):
     global device
-    global comm_time
-    global comp_time
-    global scomp_time
-    global bcast_comm_time
     global run
 
 
@@ -317,11 +198,9 @@ def broad_func(node_count, am_partitions, inputs, rank, size, group, horizontal_
             # inputs_recv = torch.zeros(list(am_partitions[i].t().size())[1], inputs.size(1))
         transpose = True
         if horizontal_tiled:
-            tstart_comm = start_time(group, rank)
+            tstart_comm = prof.start()
             inputs_recv = transpose_input(node_count,inputs,rank,size,0)
-            dur = stop_time(group, rank, tstart_comm)
-            comm_time[run][rank] += dur
-            bcast_comm_time[run][rank] += dur
+            prof.stop(tstart_comm, "comm_time", "bcast_comm_time")
             transpose = False
         else:
             #Hacked a solution here but we need a better way to do this
@@ -332,7 +211,7 @@ def broad_func(node_count, am_partitions, inputs, rank, size, group, horizontal_
         #print('SpMM started at rank '+str(rank))
         z_loc = torch.cuda.FloatTensor(am_partitions[0].size(0), inputs_recv.size(1), device=device).fill_(0)
         # print('size of output '+ str(z_loc.size()))
-        tstart_comp = start_time(group, rank)
+        tstart_comp = prof.start()
 
         '''
         print(am_partitions[i].size(0))
@@ -349,26 +228,18 @@ def broad_func(node_count, am_partitions, inputs, rank, size, group, horizontal_
         #print('first SpMM was OK!')
         #print(z_loc)
         #exit()
-        dur = stop_time(group, rank, tstart_comp)
-        # print('SpMM time '+str(dur))
-        comp_time[run][rank] += dur
-        scomp_time[run][rank] += dur
+        prof.stop(tstart_comp, "comp_time", "scomp_time")
 
         if transpose:
-            tstart_comm = start_time(group, rank)
+            tstart_comm = prof.start()
             z_loc = transpose_input(node_count,z_loc,rank,size,1)
-            dur = stop_time(group, rank, tstart_comm)
-            comm_time[run][rank] += dur
-            bcast_comm_time[run][rank] += dur
+            prof.stop(tstart_comm, "comm_time", "bcast_comm_time")
 
     return z_loc
 
 class GCNFunc(torch.autograd.Function):
     @staticmethod
     def forward(ctx, inputs, weight, adj_matrix, am_partitions, rank, size, group, func):
-        global comm_time
-        global comp_time
-        global dcomp_time
         global run
         #lobal x1
         global ht
@@ -389,11 +260,9 @@ class GCNFunc(torch.autograd.Function):
         z = 0
         if ht:
             #if rank == 0: print('forw horizontal '+str(rank))
-            tstart_comp = start_time(group, rank)
+            tstart_comp = prof.start()
             z = torch.mm(inputs, weight)
-            dur = stop_time(group, rank, tstart_comp)
-            comp_time[run][rank] += dur
-            dcomp_time[run][rank] += dur
+            prof.stop(tstart_comp, "comp_time", "dcomp_time")
             z = broad_func(adj_matrix.size(0), am_partitions, z, rank, size, group, ht)
 
         else:
@@ -401,11 +270,9 @@ class GCNFunc(torch.autograd.Function):
             #if rank == 0: print('forw vertical '+str(rank))
             # z = block_row(adj_matrix.t(), am_partitions, inputs, weight, rank, size)
             x1 = broad_func(adj_matrix.size(0), am_partitions, inputs, rank, size, group, ht)
-            tstart_comp = start_time(group, rank)
+            tstart_comp = prof.start()
             z = torch.mm(x1, weight)
-            dur = stop_time(group, rank, tstart_comp)
-            comp_time[run][rank] += dur
-            dcomp_time[run][rank] += dur
+            prof.stop(tstart_comp, "comp_time", "dcomp_time")
 
         z.requires_grad = True
         ctx.z = z
@@ -425,9 +292,6 @@ class GCNFunc(torch.autograd.Function):
 
     @staticmethod
     def backward(ctx, grad_output):
-        global comm_time
-        global comp_time
-        global dcomp_time
         global run
         global ht
         global x1
@@ -459,11 +323,9 @@ class GCNFunc(torch.autograd.Function):
         grad_weight=None
         if ht:
             #if rank == 0: print('hor back '+str(rank))
-            tstart_comp = start_time(group, rank)
+            tstart_comp = prof.start()
             x2 = torch.mm(grad_output, weight.t())
-            dur = stop_time(group, rank, tstart_comp)
-            comp_time[run][rank] += dur
-            dcomp_time[run][rank] += dur
+            prof.stop(tstart_comp, "comp_time", "dcomp_time")
             grad_input = broad_func(adj_matrix.size(0), am_partitions, x2 , rank, size, group, ht)
             # Second backprop equation (reuses the A * H^(l-1) computation)
             grad_weight = outer_product2(x1.t(), grad_output, rank, size, group)
@@ -471,11 +333,9 @@ class GCNFunc(torch.autograd.Function):
         else:
             #if rank == 0: print('ver back '+str(rank))
             ag = broad_func(adj_matrix.size(0), am_partitions, grad_output, rank, size, group, ht)
-            tstart_comp = start_time(group, rank)
+            tstart_comp = prof.start()
             grad_input = torch.mm(ag, weight.t())
-            dur = stop_time(group, rank, tstart_comp)
-            comp_time[run][rank] += dur
-            dcomp_time[run][rank] += dur
+            prof.stop(tstart_comp, "comp_time", "dcomp_time")
             # Second backprop equation (reuses the A * G^l computation)
             grad_weight = outer_product2(inputs.t(), ag, rank, size, group)
 
@@ -557,6 +417,9 @@ def oned_partition_old(rank, size, inputs, adj_matrix, data, features, classes,
     # Compute the adj_matrix and inputs partitions for this process
     # TODO: Maybe I do want grad here. Unsure.
     with torch.no_grad():
+        # Degrees are computed once for the whole graph, each block only gathers them
+        norm = norm_factors(adj_matrix, node_count, norm_type if normalization else "none")
+
         rankf = 0
         # Column partitions
         am_partitions, vtx_indices = split_coo(adj_matrix, node_count, n_per_proc, 1)
@@ -570,15 +433,13 @@ def oned_partition_old(rank, size, inputs, adj_matrix, data, features, classes,
                                                         size=(last_node_count, proc_node_count),
                                                         requires_grad=False)
 
-                am_pbyp[i] = scale_elements(adj_matrix, am_pbyp[i], node_count, vtx_indices[i],
-                                                vtx_indices[rankf])
+                am_pbyp[i] = scale_elements(am_pbyp[i], norm, vtx_indices[i], vtx_indices[rankf])
             else:
                 am_pbyp[i] = torch.sparse_coo_tensor(am_pbyp[i], torch.ones(am_pbyp[i].size(1)),
                                                         size=(n_per_proc, proc_node_count),
                                                         requires_grad=False)
 
-                am_pbyp[i] = scale_elements(adj_matrix, am_pbyp[i], node_count, vtx_indices[i],
-                                                vtx_indices[rankf])
+                am_pbyp[i] = scale_elements(am_pbyp[i], norm, vtx_indices[i], vtx_indices[rankf])
 
         for i in range(len(am_partitions)):
             proc_node_count = vtx_indices[i + 1] - vtx_indices[i]
@@ -586,7 +447,7 @@ def oned_partition_old(rank, size, inputs, adj_matrix, data, features, classes,
                                                     torch.ones(am_partitions[i].size(1)),
                                                     size=(node_count, proc_node_count),
                                                     requires_grad=False)
-            am_partitions[i] = scale_elements(adj_matrix, am_partitions[i], node_count,  0, vtx_indices[i])
+            am_partitions[i] = scale_elements(am_partitions[i], norm, 0, vtx_indices[i])
 
         print(inputs.size(0))
         print(inputs.size(1))
@@ -638,82 +499,6 @@ def full_test(inputs, weight1, weight2, adj_matrix, am_partitions, data, rank, s
     print(f'full test acc is {acc}')
     
     return acc
-# Split a COO into partitions of size n_per_proc
-# Basically torch.split but for Sparse Tensors since pytorch doesn't support that.
-def split_coo(adj_matrix, node_count, n_per_proc, dim):
-    vtx_indices = list(range(0, node_count, n_per_proc))
-    vtx_indices.append(node_count)
-
-    am_partitions = []
-    for i in range(len(vtx_indices) - 1):
-        am_part = adj_matrix[:,(adj_matrix[dim,:] >= vtx_indices[i]).nonzero().squeeze(1)]
-        am_part = am_part[:,(am_part[dim,:] < vtx_indices[i + 1]).nonzero().squeeze(1)]
-        am_part[dim] -= vtx_indices[i]
-        am_partitions.append(am_part)
-
-    return am_partitions, vtx_indices
-
-# Normalize all elements according to KW's normalization rule
-def scale_elements(adj_matrix, adj_part, node_count, row_vtx, col_vtx):
-    if not normalization:
-        return adj_part
-
-    # Scale each edge (u, v) by 1 / (sqrt(u) * sqrt(v))
-    # indices = adj_part._indices()
-    # values = adj_part._values()
-
-    # deg_map = dict()
-    # for i in range(adj_part._nnz()):
-    #     u = indices[0][i] + row_vtx
-    #     v = indices[1][i] + col_vtx
-
-    #     if u.item() in deg_map:
-    #         degu = deg_map[u.item()]
-    #     else:
-    #         degu = (adj_matrix[0] == u).sum().item()
-    #         deg_map[u.item()] = degu
-
-    #     if v.item() in deg_map:
-    #         degv = deg_map[v.item()]
-    #     else:
-    #         degv = (adj_matrix[0] == v).sum().item()
-    #         deg_map[v.item()] = degv
-
-    #     values[i] = values[i] / (math.sqrt(degu) * math.sqrt(degv))
-
-    adj_part = adj_part.coalesce()
-    deg = torch.histc(adj_matrix[0].double(), bins=node_count)
-    deg = deg.pow(-0.5)
-
-    row_len = adj_part.size(0)
-    col_len = adj_part.size(1)
-
-    dleft = torch.sparse_coo_tensor([np.arange(0, row_len).tolist(),
-                                     np.arange(0, row_len).tolist()],
-                                     deg[row_vtx:(row_vtx + row_len)].float(),
-                                     size=(row_len, row_len),
-                                     requires_grad=False, device=torch.device("cpu"))
-
-    dright = torch.sparse_coo_tensor([np.arange(0, col_len).tolist(),
-                                     np.arange(0, col_len).tolist()],
-                                     deg[col_vtx:(col_vtx + col_len)].float(),
-                                     size=(col_len, col_len),
-                                     requires_grad=False, device=torch.device("cpu"))
-    # adj_part = torch.sparse.mm(torch.sparse.mm(dleft, adj_part), dright)
-    ad_ind, ad_val = torch_sparse.spspmm(adj_part._indices(), adj_part._values(),
-                                            dright._indices(), dright._values(),
-                                            adj_part.size(0), adj_part.size(1), dright.size(1))
-
-    adj_part_ind, adj_part_val = torch_sparse.spspmm(dleft._indices(), dleft._values(),
-                                                        ad_ind, ad_val,
-                                                        dleft.size(0), dleft.size(1), adj_part.size(1))
-
-    adj_part = torch.sparse_coo_tensor(adj_part_ind, adj_part_val,
-                                                size=(adj_part.size(0), adj_part.size(1)),
-                                                requires_grad=False, device=torch.device("cpu"))
-
-    return adj_part
-
 def symmetric(adj_matrix):
     # print(adj_matrix)
     # not sure whether the following is needed
@@ -738,8 +523,8 @@ def symmetric(adj_matrix):
 
 
 def oned_partition(rank, size, inputs, adj_matrix, data, features, classes, device):
-    global row_count
-    global col_count
+    # row_count/col_count are returned rather than set globally, partitions of later
+    # epochs are built on a loader thread while the current subgraph trains
     node_count = inputs.size(0)
     n_per_proc = math.ceil(float(node_count) / 1)
 
@@ -753,6 +538,9 @@ def oned_partition(rank, size, inputs, adj_matrix, data, features, classes, devi
     # Compute the adj_matrix and inputs partitions for this process
     # TODO: Maybe I do want grad here. Unsure.
     with torch.no_grad():
+        # Degrees are computed once for the whole graph, each block only gathers them
+        norm = norm_factors(adj_matrix, node_count, norm_type if normalization else "none")
+
         rankf = 0
         # Column partitions
         am_partitions, vtx_indices = split_coo(adj_matrix, node_count, n_per_proc, 1)
@@ -766,15 +554,13 @@ def oned_partition(rank, size, inputs, adj_matrix, data, features, classes, devi
                                                         size=(last_node_count, proc_node_count),
                                                         requires_grad=False)
 
-                am_pbyp[i] = scale_elements(adj_matrix, am_pbyp[i], node_count, vtx_indices[i],
-                                                vtx_indices[rankf])
+                am_pbyp[i] = scale_elements(am_pbyp[i], norm, vtx_indices[i], vtx_indices[rankf])
             else:
                 am_pbyp[i] = torch.sparse_coo_tensor(am_pbyp[i], torch.ones(am_pbyp[i].size(1)),
                                                         size=(n_per_proc, proc_node_count),
                                                         requires_grad=False)
 
-                am_pbyp[i] = scale_elements(adj_matrix, am_pbyp[i], node_count, vtx_indices[i],
-                                                vtx_indices[rankf])
+                am_pbyp[i] = scale_elements(am_pbyp[i], norm, vtx_indices[i], vtx_indices[rankf])
 
         for i in range(len(am_partitions)):
             proc_node_count = vtx_indices[i + 1] - vtx_indices[i]
@@ -782,7 +568,7 @@ def oned_partition(rank, size, inputs, adj_matrix, data, features, classes, devi
                                                     torch.ones(am_partitions[i].size(1)),
                                                     size=(node_count, proc_node_count),
                                                     requires_grad=False)
-            am_partitions[i] = scale_elements(adj_matrix, am_partitions[i], node_count,  0, vtx_indices[i])
+            am_partitions[i] = scale_elements(am_partitions[i], norm, 0, vtx_indices[i])
 
         print(inputs.size(0))
         print(inputs.size(1))
@@ -808,6 +594,60 @@ def oned_partition(rank, size, inputs, adj_matrix, data, features, classes, devi
     print(f"rank: {rankf} inputs.size: {inputs.size()}", flush=True)
     return inputs_loc, adj_matrix_loc, am_pbyp, horizontal_tiled, row_count, col_count
 
+def sample_epoch(minibatch, rank, group, device):
+    """
+    One epoch of training subgraphs. Rank 0 draws them from the minibatch, the
+    pre-sampled ones first and then those of the --sampleworkers producers, and
+    broadcasts each one, so every rank trains on the same (node_ids, adj, norm_loss).
+    """
+    minibatch.shuffle()
+    subgraphs = []
+    while not minibatch.end():
+        if rank == 0:
+            (node_ids, adj_subg, _, norm_loss) = minibatch.one_batch(mode='train')
+            node_ids = torch.from_numpy(node_ids).long().to(device)
+            adj_subg = adj_subg.long().to(device)
+            norm_loss = norm_loss.float().to(device)
+            sizes = torch.Tensor([node_ids.shape[0], adj_subg.shape[1]]).to(device)
+        else:
+            # Only rank 0 samples, the others count the batch and receive its subgraph
+            minibatch.batch_num += 1
+            sizes = torch.zeros(2, device=device)
+        dist.broadcast(sizes, src=0, group=group)
+        n, m = int(sizes[0].item()), int(sizes[1].item())
+        if rank > 0:
+            node_ids = torch.zeros(n, dtype=torch.long, device=device)
+            adj_subg = torch.zeros(2, m, dtype=torch.long, device=device)
+            norm_loss = torch.zeros(n, device=device)
+        dist.broadcast(node_ids, src=0, group=group)
+        dist.broadcast(adj_subg, src=0, group=group)
+        dist.broadcast(norm_loss, src=0, group=group)
+
+        host = torch.device("cpu")
+        subgraphs.append((node_ids.to(host), adj_subg.to(host), norm_loss.to(host)))
+    return subgraphs
+
+def partition_subgraph(rank, size, inputs, graph, data, features, classes, device):
+    nodes_subg, subg, norm_loss = graph
+    # nodes_subg <- subg[sub_nodeid]
+    #sug = symmetric(subg)
+    inputs_subg = inputs[nodes_subg.long()]
+    inputs_loc, adj_matrix_loc, am_pbyp, horizontal_tiled, rowcount, colcount = oned_partition(rank, size, inputs_subg, subg, data,
+                                                                features, classes, device)
+
+    labels_subg = data.y[nodes_subg.long()]
+    inputs_loc = inputs_loc.to(device)
+    adj_matrix_loc = adj_matrix_loc.to(device)
+    for i in range(len(am_pbyp)):            am_pbyp[i] = am_pbyp[i].t().coalesce().to(device)
+
+
+    #am_pbyp = [am_pbyp[0].t().coalesce().to(device)]
+    return (inputs_loc, adj_matrix_loc, am_pbyp, horizontal_tiled, norm_loss, labels_subg, rowcount, colcount)
+
+def partition_subgraphs(rank, size, inputs, graphs, data, features, classes, device):
+    # train_loader has partitioned graphs at each rank
+    return [partition_subgraph(rank, size, inputs, graph, data, features, classes, device) for graph in graphs]
+
 def run(rank, size, inputs, graphs, data, features, classes, device, orig_adj=None, group=None):
     # inputs: node feature
     # features: input feature shape
@@ -815,7 +655,6 @@ def run(rank, size, inputs, graphs, data, features, classes, device, orig_adj=No
     global epochs
     global mid_layer
     global run
-    global timing
     global row_count
     global col_count
 
@@ -838,27 +677,8 @@ def run(rank, size, inputs, graphs, data, features, classes, device, orig_adj=No
 
 
     # TODO if input is a set/list of graphs, partition them in a loop?
-    # train_loader has partitioned graphs at each rank
-    train_loader = []
     print('Preprocessing - partitioning graph')
-    for (nodes_subg, subg, norm_loss) in tqdm(graphs):
-        # nodes_subg <- subg[sub_nodeid]
-        #sug = symmetric(subg)
-        inputs_subg = inputs[nodes_subg.long()]
-        inputs_loc, adj_matrix_loc, am_pbyp, horizontal_tiled, rowcount, colcount = oned_partition(rank, size, inputs_subg, subg, data,
-                                                                    features, classes, device)
-
-        labels_subg = data.y[nodes_subg.long()]
-        inputs_loc = inputs_loc.to(device)
-        adj_matrix_loc = adj_matrix_loc.to(device)
-        for i in range(len(am_pbyp)):            am_pbyp[i] = am_pbyp[i].t().coalesce().to(device)
-        
-        
-        #am_pbyp = [am_pbyp[0].t().coalesce().to(device)]
-        train_loader.append((inputs_loc, adj_matrix_loc, am_pbyp, horizontal_tiled, norm_loss, labels_subg, rowcount, colcount))
-        print(inputs.shape)
-        print(inputs_subg.shape)
-        print(inputs_loc.shape)
+    train_loader = partition_subgraphs(rank, size, inputs, tqdm(graphs), data, features, classes, device)
     #inputs_loc, adj_matrix_loc, am_pbyp, horizontal_tiled = oned_partition(rank, size, inputs, adj_matrix, data,
     #                                                            features, classes, device)
     #print('Preprocessing done')
@@ -894,33 +714,15 @@ def run(rank, size, inputs, graphs, data, features, classes, device, orig_adj=No
         
         
         total_time[i] = dict()
-        comm_time[i] = dict()
-        comp_time[i] = dict()
-        scomp_time[i] = dict()
-        dcomp_time[i] = dict()
-        bcast_comm_time[i] = dict()
-        barrier_time[i] = dict()
-        barrier_subset_time[i] = dict()
-        op1_comm_time[i] = dict()
-        op2_comm_time[i] = dict()
-
         total_time[i][rank] = 0.0
-        comm_time[i][rank] = 0.0
-        comp_time[i][rank] = 0.0
-        scomp_time[i][rank] = 0.0
-        dcomp_time[i][rank] = 0.0
-        bcast_comm_time[i][rank] = 0.0
-        barrier_time[i][rank] = 0.0
-        barrier_subset_time[i][rank] = 0.0
-        op1_comm_time[i][rank] = 0.0
-        op2_comm_time[i][rank] = 0.0
-
-        timing_on = timing == True
-        timing = False
+
+        global prof
+        prof = Profiler(rank, device, enabled=False, trace=bool(profile_dir),
+                            sync_group=group if timing_sync else None)
+
         #outputs = train(inputs_loc, weight1, weight2, adj_matrix_loc, am_pbyp, optimizer, data,
         #                        rank, size, group, horizontal_tiled)
-        if timing_on:
-            timing = True
+        prof.enabled = timing
 
         dist.barrier(group)
         tstart = time.time()
@@ -932,6 +734,15 @@ def run(rank, size, inputs, graphs, data, features, classes, device, orig_adj=No
         for epoch in range(epochs):
             #if cumulative_time>200:
             #    break
+            if epoch > 0 and epoch_sampler is not None:
+                # Fresh subgraphs every epoch, sampled ahead by the producers once the pre-sampled ones run out.
+                # Only the broadcast runs here, the subgraphs are partitioned on the loader's threads while
+                # the earlier ones train; both are reported apart from the training breakdown
+                tstart_refill = prof.start()
+                graphs = sample_epoch(epoch_sampler, rank, group, device)
+                prof.stop(tstart_refill, "refill_comm_time")
+                train_loader = SubgraphPrefetcher(graphs, lambda graph: partition_subgraph(rank, size, inputs, graph,
+                                                        data, features, classes, device))
             
             # TODO test adding a loop for subgraphs in an epoch
             #print(f'{len(train_loader)} batches')
@@ -982,6 +793,8 @@ def run(rank, size, inputs, graphs, data, features, classes, device, orig_adj=No
                             ff.write(logline)
                     #print(log.format(900, train_acc, best_val_acc, test_acc))
                     '''
+            if isinstance(train_loader, SubgraphPrefetcher):
+                prof.count("loader_wait_time", train_loader.wait_time)
             if rank == 0 : print(f"\nEpoch: {epoch:03d} total_time {cumulative_time}", flush=True)
             if epoch % 10 == 9:
                 train_acc, val_acc, tmp_test_acc = full_test(inputs_big, weight1, weight2, adj_matrix_loc, am_pbyp, data,
@@ -998,6 +811,11 @@ def run(rank, size, inputs, graphs, data, features, classes, device, orig_adj=No
         tstop = time.time()
         total_time[run][rank] = tstop - tstart
 
+        run_stats[run] = prof.summary()
+        if profile_dir:
+            prof.write_json(osp.join(profile_dir, f"run{run}", f"rank{rank}.json"))
+            prof.write_trace(osp.join(profile_dir, f"run{run}", f"rank{rank}.trace.json"))
+
     # Get median runtime according to rank0 and print that run's breakdown
     dist.barrier(group)
     if rank == 0:
@@ -1017,17 +835,19 @@ def run(rank, size, inputs, graphs, data, features, classes, device, orig_adj=No
     if rank == 0:
         print(f"rank: {rank} median_run: {median_idx}")
         print(f"rank: {rank} total_time: {total_time[median_idx][rank]}")
-        print(f"rank: {rank} comm_time: {comm_time[median_idx][rank]}")
-        print(f"rank: {rank} comp_time: {comp_time[median_idx][rank]}")
-        print(f"rank: {rank} scomp_time: {scomp_time[median_idx][rank]}")
-        print(f"rank: {rank} dcomp_time: {dcomp_time[median_idx][rank]}")
-        print(f"rank: {rank} bcast_comm_time: {bcast_comm_time[median_idx][rank]}")
-        print(f"rank: {rank} barrier_time: {barrier_time[median_idx][rank]}")
-        print(f"rank: {rank} barrier_subset_time: {barrier_subset_time[median_idx][rank]}")
-        print(f"rank: {rank} op1_comm_time: {op1_comm_time[median_idx][rank]}")
-        print(f"rank: {rank} op2_comm_time: {op2_comm_time[median_idx][rank]}")
+        totals = run_stats[median_idx]["totals"]
+        for name in ["comm_time", "comp_time", "scomp_time", "dcomp_time", "bcast_comm_time",
+                        "op1_comm_time", "op2_comm_time", "refill_comm_time"]:
+            print(f"rank: {rank} {name}: {totals.get(name, 0.0)}")
+        # Time the trainer sat waiting on a subgraph the loader had not partitioned yet
+        print(f"rank: {rank} loader_wait_time: {run_stats[median_idx]['counters'].get('loader_wait_time', 0.0)}")
         print(f"rank: {rank} {outputs}")
 
+    # Cross-rank min/mean/max of the median run, one collective for the whole breakdown
+    _, stats = aggregate(run_stats[median_idx], group)
+    if rank == 0:
+        print_stats(stats)
+
 
     if accuracy:
         
@@ -1055,6 +875,7 @@ def init_process(rank, size, inputs, adj_matrix, data, features, classes, device
 def main():
     global device
     global graphname
+    global epoch_sampler
 
     print(socket.gethostname())
     seed = 0
@@ -1149,65 +970,19 @@ def main():
         minibatch = Minibatch(adj_full_norm, adj_train, role, train_params)
         minibatch.set_sampler(train_phases[0])
         print('sampler set!')
+        if rank == 0 and sample_workers > 0:
+            minibatch.start_producers(sample_workers, sample_queue)
         #exit()
         num_batches = minibatch.num_training_batches()
         print(f'{num_batches} subgraphs')
-        subgraphs = []
         group = dist.new_group(list(range(size)))
         if rank >= size:
             return
         print()
-        while not minibatch.end():
-            (node_ids, adj_subg, norm_loss) = minibatch.one_batch(mode='train')
-            
-            # adj_subg is in torch.sparse_coo format, needs to be in torch.tensor
-            
-            node_ids = torch.from_numpy(node_ids)
-            node_ids = node_ids.to(device)
-            adj_subg = adj_subg.to(device)
-            norm_loss = norm_loss.to(device)
-            if rank == 0:  print('copied to device')
-            sizeX = torch.Tensor([node_ids.shape[0]]).to(device)
-            dist.broadcast(sizeX, src=0, group=group)
-            if rank > 0: 
-                node_ids = torch.zeros(sizeX[0].int(), dtype=torch.int32, device=device)
-            print(f'rank {rank} node_ids {node_ids.shape} {sizeX}')
-            dist.broadcast(node_ids, src=0, group=group)
-            if rank == 0:  print('bcast 1')
-            dist.barrier(group)
-            #dist.broadcast(adj_subg, src=0, group=group)
-            sizeX = torch.Tensor([adj_subg.shape[0],adj_subg.shape[1]]).to(device)
-            #sizeY = torch.from_numpy(adj_subg.shape(1))
-            dist.broadcast(sizeX, src=0, group=group)            
-            if rank > 0: 
-                adj_subg = torch.zeros(sizeX[0].int(),sizeX[1].int(),dtype=torch.int32,  device=device)
-            dist.broadcast(adj_subg, src=0, group=group)
-            #dist.broadcast(adj_subg.indices, src=0, group=group)
-            if rank == 0:  print('bcast 2')
-            dist.barrier(group)
-            sizeX = torch.Tensor([norm_loss.shape[0]]).to(device)
-            dist.broadcast(sizeX, src=0, group=group)                        
-            if rank > 0: 
-                norm_loss = torch.zeros(sizeX[0].int(), device=device)
-            dist.broadcast(norm_loss, src=0, group=group)
-            if rank == 0:  print('bcast 3')
-            dist.barrier(group)
-            host = torch.device("cpu")
-            node_ids = node_ids.to(host)
-            adj_subg = adj_subg.to(host)
-            norm_loss = norm_loss.to(host)
-            if rank == 0: print('copied to device')
-            
-            print(f'rank {rank} node_ids {node_ids}')
-            print(f'rank {rank} adj_subg {adj_subg}')
-            print(f'rank {rank} norm_loss {norm_loss}')
-            #subgraphs.append((torch.from_numpy(node_ids), adj_subg, norm_loss))
-            subgraphs.append((node_ids, adj_subg, norm_loss))
-    
-            #print(adj_subg.shape)
-            #exit()
-            
-        
+        if sample_workers > 0:
+            # Later epochs draw fresh subgraphs, see run()
+            epoch_sampler = minibatch
+        subgraphs = sample_epoch(minibatch, rank, group, device)
         print(f'{len(subgraphs)} subgraphs')
         print(subgraphs[0])
         num_nodes = len(inputs)
@@ -1236,6 +1011,10 @@ def main():
         print(data)
         init_process(rank, size, inputs, subgraphs, data, num_features, num_classes, device, outputs
                     , run, adj_full_norm, group)
+        if minibatch.producer is not None:
+            for name, value in minibatch.producer.stats().items():
+                print(f"rank: {rank} sampler_{name}: {value}")
+            minibatch.stop_producers()
         return outputs
 
     elif graphname == "Reddit":
@@ -1404,9 +1183,14 @@ if __name__ == '__main__':
     parser.add_argument("--midlayer", type=int)
     parser.add_argument("--runcount", type=int)
     parser.add_argument("--normalization", type=str)
+    parser.add_argument("--normtype", type=str, default="sym")
     parser.add_argument("--activations", type=str)
     parser.add_argument("--accuracy", type=str)
     parser.add_argument("--download", type=bool)
+    parser.add_argument("--sampleworkers", type=int, default=0)
+    parser.add_argument("--samplequeue", type=int, default=8)
+    parser.add_argument("--timingsync", type=str, default="False")
+    parser.add_argument("--profiledir", type=str, default="")
 
     args = parser.parse_args()
     print(args)
@@ -1419,9 +1203,14 @@ if __name__ == '__main__':
     mid_layer = args.midlayer
     run_count = args.runcount
     normalization = args.normalization == "True"
+    norm_type = args.normtype
     activations = args.activations == "True"
     accuracy = args.accuracy == "True"
     download = args.download
+    sample_workers = args.sampleworkers
+    sample_queue = args.samplequeue
+    timing_sync = args.timingsync == "True"
+    profile_dir = args.profiledir
 
     if not download:
         if (epochs is None) or (graphname is None) or (timing is None) or (mid_layer is None) or (run_count is None):
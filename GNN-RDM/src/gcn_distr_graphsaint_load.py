@@ -1,4 +1,5 @@
 import os
+import sys
 import os.path as osp
 import argparse
 
@@ -27,6 +28,13 @@ from torch_scatter import scatter_add
 import torch_sparse
 
 from sparse_coo_tensor_cpp import sparse_coo_tensor_gpu, spmm_gpu
+from partition_utils import split_coo, norm_factors, scale_elements, distributed_accuracy
+from workspace import Workspace
+from redistribute import alltoall_transpose
+# subgraph_loader is shared by the RDM, PyG and DGL scripts and lives in common/ at the top of the repo
+sys.path.insert(0, osp.join(osp.dirname(osp.abspath(__file__)), "..", "..", "common"))
+from subgraph_loader import FeatureStore, SubgraphPrefetcher, load_subgraph, load_tensor, open_feature_store, open_subgraphs
+from profiler import Profiler, aggregate, print_stats
 
 import socket
 import statistics
@@ -41,30 +49,21 @@ def coo_scipy2stack(adj):
     values = torch.from_numpy(adj.data)
     indices = torch.stack((torch.from_numpy(adj.row), torch.from_numpy(adj.col)))
     return (indices, values)
-# comp_time = 0.0
-# comm_time = 0.0
-# scomp_time = 0.0
-# dcomp_time = 0.0
-# bcast_comm_time = 0.0
-# bcast_words = 0
-# op1_comm_time = 0.0
-# op2_comm_time = 0.0
 total_time = dict()
-comp_time = dict()
-comm_time = dict()
-scomp_time = dict()
-dcomp_time = dict()
-bcast_comm_time = dict()
-barrier_time = dict()
-barrier_subset_time = dict()
-op1_comm_time = dict()
-op2_comm_time = dict()
+# Timers of the current run (comm_time, bcast_comm_time, ...), replaced in run(). Per-run
+# summaries are kept in run_stats for the median-run breakdown
+prof = Profiler(enabled=False)
+run_stats = dict()
+
+# Staging buffers for transpose_input, reused across layers and epochs
+workspace = Workspace()
 
 epochs = 0
 graphname = ""
 mid_layer = 0
 timing = True
 normalization = False
+norm_type = "sym"
 activations = False
 accuracy = False
 device = None
@@ -73,41 +72,15 @@ run_count = 0
 run = 0
 download = False
 ht = True
-
-def start_time(group, rank, subset=False, src=None):
-    global barrier_time
-    global barrier_subset_time
-
-    if not timing:
-        return 0.0
-
-    barrier_tstart = time.time()
-
-    dist.barrier(group)
-    barrier_tstop = time.time()
-    if not run in barrier_time.keys():
-        barrier_time[run] = {}
-    if not rank in barrier_time[run].keys():
-        barrier_time[run][rank] = 0 
-    
-    barrier_time[run][rank] += barrier_tstop - barrier_tstart
-    if subset:
-        barrier_subset_time[run][rank] += barrier_tstop - barrier_tstart
-
-    tstart = 0.0
-    tstart = time.time()
-    return tstart
-
-def stop_time(group, rank, tstart):
-    if not timing:
-        return 0.0
-    dist.barrier(group)
-    devid = rank_to_devid(rank, acc_per_rank)
-    device = torch.device('cuda:{}'.format(devid))
-    # torch.cuda.synchronize(device=device)
-
-    tstop = time.time()
-    return tstop - tstart
+# Full graph partitioned for full_test, see eval_partition
+eval_graph = None
+# Subgraphs loaded and partitioned ahead of training by a background pool (--prefetch), 0 loads all up front
+prefetch = 0
+load_workers = 2
+# Reload the subgraphs from disk every epoch instead of keeping the partitioned ones on the device
+stream_subgraphs = False
+timing_sync = False
+profile_dir = ""
 
 def normalize(adj_matrix):
     adj_matrix = adj_matrix + torch.eye(adj_matrix.size(0))
@@ -157,32 +130,24 @@ def block_row(adj_matrix, am_partitions, inputs, weight, rank, size):
     return z_loc
 
 def outer_product(adj_matrix, grad_output, rank, size, group):
-    global comm_time
-    global comp_time
-    global dcomp_time
-    global op1_comm_time
     global run
 
 
     n_per_proc = math.ceil(float(adj_matrix.size(0)) / size)
 
-    tstart_comp = start_time(group, rank)
+    tstart_comp = prof.start()
 
     # A * G^l
     ag = torch.mm(adj_matrix, grad_output)
 
-    dur = stop_time(group, rank, tstart_comp)
-    comp_time[run][rank] += dur
-    dcomp_time[run][rank] += dur
+    prof.stop(tstart_comp, "comp_time", "dcomp_time")
 
-    tstart_comm = start_time(group, rank)
+    tstart_comm = prof.start()
 
     # reduction on A * G^l low-rank matrices
     dist.all_reduce(ag, op=dist.reduce_op.SUM, group=group)
 
-    dur = stop_time(group, rank, tstart_comm)
-    comm_time[run][rank] += dur
-    op1_comm_time[run][rank] += dur
+    prof.stop(tstart_comm, "comm_time", "op1_comm_time")
 
     # partition A * G^l by block rows and get block row for this process
     # TODO: this might not be space-efficient
@@ -192,117 +157,31 @@ def outer_product(adj_matrix, grad_output, rank, size, group):
     return grad_input
 
 def outer_product2(inputs, ag, rank, size, group):
-    global comm_time
-    global comp_time
-    global dcomp_time
-    global op2_comm_time
     global run
 
-    tstart_comp = start_time(group, rank)
+    tstart_comp = prof.start()
     # (H^(l-1))^T * (A * G^l)
     grad_weight = torch.mm(inputs, ag)
 
-    dur = stop_time(group, rank, tstart_comp)
-    comp_time[run][rank] += dur
-    dcomp_time[run][rank] += dur
+    prof.stop(tstart_comp, "comp_time", "dcomp_time")
 
-    tstart_comm = start_time(group, rank)
+    tstart_comm = prof.start()
     # reduction on grad_weight low-rank matrices
     dist.all_reduce(grad_weight, op=dist.reduce_op.SUM, group=group)
 
-    dur = stop_time(group, rank, tstart_comm)
-    comm_time[run][rank] += dur
-    op2_comm_time[run][rank] += dur
+    prof.stop(tstart_comm, "comm_time", "op2_comm_time")
 
     return grad_weight
 
 def transpose_input(node_count,inputs,rank,size,dim):
-    #print('in transpose '+str(rank)+' at dim '+str(dim))
-    global device
-    global comm_time
-    global comp_time
-    global scomp_time
-    global bcast_comm_time
-    global run
     global ht
 
     ht = not ht
-    if dim == 0:
-        #horizontal_tiled = False
-        # Horizontal to Vertical
-        input_2d = torch.split(inputs, math.ceil(float(inputs.size(1-dim)) / size), dim=1-dim)
-        #if len(col_count) == 0:  for i in input_2d:    col_count += [input_2d[rank].size(1)]
-        recv = [0]*size
-        for i in range(size):
-            col_count[i] = input_2d[i].size(1)
-        for ii in range(size):
-            i = ii^rank
-            if i == rank:
-                recv[i] = input_2d[rank]
-                continue
-            '''
-            print('inside h2v transpose')
-            print(size)
-            print(i)
-            print(rank)
-            print(inputs.size())
-            '''
-            input_recv = torch.zeros(row_count[i], col_count[rank], device=device)
-
-            #print('buffer size '+str(input_recv.size()))
-            if i < rank :
-                dist.send(tensor=input_2d[i].contiguous(), dst=i)
-                dist.recv(tensor=input_recv, src=i)
-            else:
-                dist.recv(tensor=input_recv, src=i)
-                dist.send(tensor=input_2d[i].contiguous(), dst=i)
-
-            recv[i] = input_recv
-        inputs = torch.cat(recv,0)
-        #print('size after transpose')
-        #print(inputs.size())
-        #print('after tp ht: '+str(horizontal_tiled)+' in rank '+str(rank))
-        return inputs
-    elif dim == 1:
-        # Vertical to Horizontal
-        #horizontal_tiled = True
-        # print('Transpose '+str(inputs.size()))
-        # print(row_count)
-        input_2d = torch.split(inputs, math.ceil(float(inputs.size(1-dim)) / size), dim=1-dim)
-        recv = [0]*size
-        for ii in range(size):
-            i = ii ^ rank
-            if i == rank:
-                recv[i] = input_2d[rank]
-                continue
-            '''
-            print('inside v2h transpose')
-            print(size)
-            print(i)
-            print(rank)
-            print(inputs.size())
-            '''
-            input_recv = torch.zeros(row_count[rank], col_count[i], device=device)
-            #print('buffer size '+str(input_recv.size()))
-            if i < rank :
-                dist.send(tensor=input_2d[i].contiguous(), dst=i)
-                dist.recv(tensor=input_recv, src=i)
-            else:
-                dist.recv(tensor=input_recv, src=i)
-                dist.send(tensor=input_2d[i].contiguous(), dst=i)
-            recv[i] = input_recv
-        #for t in recv:            print('concat tensors '+str(t.size()))
-        inputs = torch.cat(recv,1)
-        #print('size after transpose')
-        #print(inputs.size())
-        return inputs
+    # One all-to-all with row_count/col_count split sizes instead of P - 1 pairwise send/recv rounds
+    return alltoall_transpose(inputs, row_count, col_count, rank, size, dim, workspace)
 
 def broad_func(node_count, am_partitions, inputs, rank, size, group, horizontal_tiled):
     global device
-    global comm_time
-    global comp_time
-    global scomp_time
-    global bcast_comm_time
     global run
 
 
@@ -325,19 +204,9 @@ def broad_func(node_count, am_partitions, inputs, rank, size, group, horizontal_
             # inputs_recv = torch.zeros(list(am_partitions[i].t().size())[1], inputs.size(1))
         transpose = True
         if horizontal_tiled:
-            tstart_comm = start_time(group, rank)
+            tstart_comm = prof.start()
             inputs_recv = transpose_input(node_count,inputs,rank,size,0)
-            dur = stop_time(group, rank, tstart_comm)
-            if not run in comm_time.keys():
-                comm_time[run] = {}
-            if not rank in comm_time[run].keys():
-                comm_time[run][rank] = 0 
-            if not run in bcast_comm_time.keys():
-                bcast_comm_time[run] = {}
-            if not rank in bcast_comm_time[run].keys():
-                bcast_comm_time[run][rank] = 0 
-            comm_time[run][rank] += dur
-            bcast_comm_time[run][rank] += dur
+            prof.stop(tstart_comm, "comm_time", "bcast_comm_time")
             transpose = False
         else:
             #Hacked a solution here but we need a better way to do this
@@ -348,7 +217,7 @@ def broad_func(node_count, am_partitions, inputs, rank, size, group, horizontal_
         #print('SpMM started at rank '+str(rank))
         z_loc = torch.cuda.FloatTensor(am_partitions[0].size(0), inputs_recv.size(1), device=device).fill_(0)
         # print('size of output '+ str(z_loc.size()))
-        tstart_comp = start_time(group, rank)
+        tstart_comp = prof.start()
 
         '''
         print(am_partitions[i].size(0))
@@ -364,34 +233,18 @@ def broad_func(node_count, am_partitions, inputs, rank, size, group, horizontal_
 
         #print('first SpMM was OK!')
         #print(z_loc)
-        dur = stop_time(group, rank, tstart_comp)
-        # print('SpMM time '+str(dur))
-        if not run in comp_time.keys():
-            comp_time[run] = {}
-        if not rank in comp_time[run].keys():
-            comp_time[run][rank] = 0 
-        if not run in scomp_time.keys():
-            scomp_time[run] = {}
-        if not rank in scomp_time[run].keys():
-            scomp_time[run][rank] = 0 
-        comp_time[run][rank] += dur
-        scomp_time[run][rank] += dur
+        prof.stop(tstart_comp, "comp_time", "scomp_time")
 
         if transpose:
-            tstart_comm = start_time(group, rank)
+            tstart_comm = prof.start()
             z_loc = transpose_input(node_count,z_loc,rank,size,1)
-            dur = stop_time(group, rank, tstart_comm)
-            comm_time[run][rank] += dur
-            bcast_comm_time[run][rank] += dur
+            prof.stop(tstart_comm, "comm_time", "bcast_comm_time")
 
     return z_loc
 
 class GCNFunc(torch.autograd.Function):
     @staticmethod
     def forward(ctx, inputs, weight, adj_matrix, am_partitions, rank, size, group, func, test=False):
-        global comm_time
-        global comp_time
-        global dcomp_time
         global run
         #lobal x1
         global ht
@@ -413,7 +266,7 @@ class GCNFunc(torch.autograd.Function):
         if ht:
             #if rank == 0: print('forw horizontal '+str(rank))
             if not test:
-                tstart_comp = start_time(group, rank)
+                tstart_comp = prof.start()
             #inputs = inputs.float()
             #weight = weight.float()
             z = torch.mm(inputs, weight)
@@ -421,17 +274,7 @@ class GCNFunc(torch.autograd.Function):
             #print('mm weight:', weight)
             #print('x after mm:',z)
             if not test:
-                dur = stop_time(group, rank, tstart_comp)
-                if not run in comp_time.keys():
-                    comp_time[run] = {}
-                if not rank in comp_time[run].keys():
-                    comp_time[run][rank] = 0 
-                if not run in dcomp_time.keys():
-                    dcomp_time[run] = {}
-                if not rank in dcomp_time[run].keys():
-                    dcomp_time[run][rank] = 0 
-                comp_time[run][rank] += dur
-                dcomp_time[run][rank] += dur
+                prof.stop(tstart_comp, "comp_time", "dcomp_time")
             z = broad_func(adj_matrix.size(0), am_partitions, z, rank, size, group, ht)
             #print('x after spmm:',z)
 
@@ -442,13 +285,11 @@ class GCNFunc(torch.autograd.Function):
             x1 = broad_func(adj_matrix.size(0), am_partitions, inputs, rank, size, group, ht)
             #print('x after spmm:',x1)
             if not test:
-                tstart_comp = start_time(group, rank)
+                tstart_comp = prof.start()
             z = torch.mm(x1, weight)
             #print('x after mm:',z)
             if not test:
-                dur = stop_time(group, rank, tstart_comp)
-                comp_time[run][rank] += dur
-                dcomp_time[run][rank] += dur
+                prof.stop(tstart_comp, "comp_time", "dcomp_time")
 
         z.requires_grad = True
         ctx.z = z
@@ -470,9 +311,6 @@ class GCNFunc(torch.autograd.Function):
 
     @staticmethod
     def backward(ctx, grad_output):
-        global comm_time
-        global comp_time
-        global dcomp_time
         global run
         global ht
         global x1
@@ -504,11 +342,9 @@ class GCNFunc(torch.autograd.Function):
         grad_weight=None
         if ht:
             #if rank == 0: print('hor back '+str(rank))
-            tstart_comp = start_time(group, rank)
+            tstart_comp = prof.start()
             x2 = torch.mm(grad_output, weight.t())
-            dur = stop_time(group, rank, tstart_comp)
-            comp_time[run][rank] += dur
-            dcomp_time[run][rank] += dur
+            prof.stop(tstart_comp, "comp_time", "dcomp_time")
             grad_input = broad_func(adj_matrix.size(0), am_partitions, x2 , rank, size, group, ht)
             # Second backprop equation (reuses the A * H^(l-1) computation)
             grad_weight = outer_product2(x1.t(), grad_output, rank, size, group)
@@ -516,11 +352,9 @@ class GCNFunc(torch.autograd.Function):
         else:
             #if rank == 0: print('ver back '+str(rank))
             ag = broad_func(adj_matrix.size(0), am_partitions, grad_output, rank, size, group, ht)
-            tstart_comp = start_time(group, rank)
+            tstart_comp = prof.start()
             grad_input = torch.mm(ag, weight.t())
-            dur = stop_time(group, rank, tstart_comp)
-            comp_time[run][rank] += dur
-            dcomp_time[run][rank] += dur
+            prof.stop(tstart_comp, "comp_time", "dcomp_time")
             # Second backprop equation (reuses the A * G^l computation)
             grad_weight = outer_product2(inputs.t(), ag, rank, size, group)
 
@@ -639,6 +473,9 @@ def oned_partition_old(rank, size, inputs, adj_matrix, data, features, classes,
     # Compute the adj_matrix and inputs partitions for this process
     # TODO: Maybe I do want grad here. Unsure.
     with torch.no_grad():
+        # Degrees are computed once for the whole graph, each block only gathers them
+        norm = norm_factors(adj_matrix, node_count, norm_type if normalization else "none")
+
         rankf = 0
         # Column partitions
         am_partitions, vtx_indices = split_coo(adj_matrix, node_count, n_per_proc, 1)
@@ -659,8 +496,7 @@ def oned_partition_old(rank, size, inputs, adj_matrix, data, features, classes,
                     am_pbyp[i] = torch.sparse_coo_tensor(am_pbyp[i], torch.ones(am_pbyp[i].size(1)),
                                                             size=(last_node_count, proc_node_count),
                                                             requires_grad=False)
-                #am_pbyp[i] = scale_elements(adj_matrix, am_pbyp[i], node_count, vtx_indices[i],
-                #                                vtx_indices[rankf])
+                #am_pbyp[i] = scale_elements(am_pbyp[i], norm, vtx_indices[i], vtx_indices[rankf])
             else:
                 if edge_w is not None:
                     am_pbyp[i] = torch.sparse_coo_tensor(am_pbyp[i], edge_w_part[i],
@@ -671,8 +507,7 @@ def oned_partition_old(rank, size, inputs, adj_matrix, data, features, classes,
                                                             size=(n_per_proc, proc_node_count),
                                                             requires_grad=False)
 
-                #am_pbyp[i] = scale_elements(adj_matrix, am_pbyp[i], node_count, vtx_indices[i],
-                #                                vtx_indices[rankf])
+                #am_pbyp[i] = scale_elements(am_pbyp[i], norm, vtx_indices[i], vtx_indices[rankf])
 
         for i in range(len(am_partitions)):
             proc_node_count = vtx_indices[i + 1] - vtx_indices[i]
@@ -681,7 +516,7 @@ def oned_partition_old(rank, size, inputs, adj_matrix, data, features, classes,
                                                     size=(node_count, proc_node_count),
                                                     requires_grad=False)
             if edge_w is None:
-                am_partitions[i] = scale_elements(adj_matrix, am_partitions[i], node_count,  0, vtx_indices[i])
+                am_partitions[i] = scale_elements(am_partitions[i], norm, 0, vtx_indices[i])
 
         print(inputs.size(0))
         print(inputs.size(1))
@@ -708,134 +543,58 @@ def oned_partition_old(rank, size, inputs, adj_matrix, data, features, classes,
     return inputs_loc, adj_matrix_loc, am_pbyp, horizontal_tiled
 
 
+def eval_partition(rank, size, inputs, adj_mat, data, features, classes):
+    """
+    The full graph partitioned across all ranks the same way oned_partition
+    splits a training subgraph: this rank's row block of the features, the
+    normalized adjacency and the row/column counts. Built on the first
+    evaluation and kept for the rest of the run.
+    """
+    global eval_graph
+    if eval_graph is None:
+        edge_w = data.edge_weight if not normalization else None
+        inputs_loc, adj_matrix_loc, am_pbyp, horizontal_tiled, rowcount, colcount = \
+                oned_partition(rank, size, inputs, adj_mat, data, features, classes, device, edge_w=edge_w)
+        am_pbyp = [am.t().coalesce().to(device) for am in am_pbyp]
+        eval_graph = (inputs_loc.float().to(device), adj_matrix_loc.to(device), am_pbyp, horizontal_tiled,
+                        rowcount, colcount)
+    return eval_graph
+
 def full_test(inputs, weight1, weight2, adj_matrix, am_partitions, data, rank, size,
           group, horizontal_tiled, adj_mat, features, classes):
+    """
+    Full-graph accuracy with every rank doing its share: the forward pass
+    runs on the cached partition of eval_partition with the training
+    kernels, each rank counts the correct predictions of its own rows and
+    a single all-reduce of (correct, total) per mask gives the accuracies
+    on all ranks.
+    """
     global ht
-    # use gcn_norm ?
-    #one d partition
-    if not normalization:
-        edge_w = data.edge_weight
-    else: 
-        edge_w = None
-    #adj_matrix, edge_w = gcn_norm(adj_matrix, num_nodes=len(data.x))
-    #print(inputs)
-    #exit()
-    #if isinstance(inputs, np.array):
-    #inputs = torch.from_numpy(inputs)
-    #print(adj_matrix)
-    #print('Device for testing:', device)
-    inputs_loc, adj_matrix_loc, am_pbyp, ht = oned_partition_old(0, 1, inputs, adj_mat, data,
-                                                                features, classes, device, edge_w=edge_w)
-    #inputs_loc, adj_matrix_loc, am_pbyp, ht = oned_partition_old(0, 1, inputs, adj_mat, data,
-    #                                                            features, classes, device, edge_w=edge_w)
-
-    #print('Partition done')
-    inputs = inputs_loc.to(device)
-    #print('1')
-    ht = horizontal_tiled
-    #print('2')
-    adj_matrix = adj_matrix_loc.to(device)
-    #print('3')
+    global row_count
+    global col_count
 
-    am_partitions = [am_pbyp[0].coalesce().to(device)]
-    #print('4')
-    # TODO
-    rankog = rank
-    rank = 0
-    size = 1
-    group = dist.new_group([0])
-    #print('5')
-    if rank >= size:
-        return None, None, None
+    inputs_loc, adj_matrix_loc, am_pbyp, eval_ht, rowcount, colcount = \
+            eval_partition(rank, size, inputs, adj_mat, data, features, classes)
 
-    outputs = GCNFunc.apply(inputs, weight1, adj_matrix, am_partitions, rank, size, group, F.relu)
-    #outputs = GCNFunc.apply(inputs, weight1, adj_matrix, am_partitions, rank, size, group, F.relu, True)
-    #outputs = F.dropout(outputs, 0.5, training=True)
-    #print('6')
-    outputs = GCNFunc.apply(outputs, weight2, adj_matrix, am_partitions, rank, size, group, F.log_softmax)
-    #outputs = GCNFunc.apply(outputs, weight2, adj_matrix, am_partitions, rank, size, group, F.log_softmax, True)
-    #print('7')
-    #if rankog==0:
-    acc = test(outputs,data,adj_matrix.size(1),rank)
-    print(f'full test acc is {acc}')
+    # The training loop sets the counts of each subgraph before using them, so they can be swapped here
+    row_count = rowcount
+    col_count = colcount
+    ht = eval_ht
 
-    return acc
-# Split a COO into partitions of size n_per_proc
-# Basically torch.split but for Sparse Tensors since pytorch doesn't support that.
-def split_coo(adj_matrix, node_count, n_per_proc, dim):
-    vtx_indices = list(range(0, node_count, n_per_proc))
-    vtx_indices.append(node_count)
-
-    am_partitions = []
-    for i in range(len(vtx_indices) - 1):
-        am_part = adj_matrix[:,(adj_matrix[dim,:] >= vtx_indices[i]).nonzero().squeeze(1)]
-        am_part = am_part[:,(am_part[dim,:] < vtx_indices[i + 1]).nonzero().squeeze(1)]
-        am_part[dim] -= vtx_indices[i]
-        am_partitions.append(am_part)
-
-    return am_partitions, vtx_indices
-
-# Normalize all elements according to KW's normalization rule
-def scale_elements(adj_matrix, adj_part, node_count, row_vtx, col_vtx):
-    if not normalization:
-        return adj_part
-
-    # Scale each edge (u, v) by 1 / (sqrt(u) * sqrt(v))
-    # indices = adj_part._indices()
-    # values = adj_part._values()
-
-    # deg_map = dict()
-    # for i in range(adj_part._nnz()):
-    #     u = indices[0][i] + row_vtx
-    #     v = indices[1][i] + col_vtx
-
-    #     if u.item() in deg_map:
-    #         degu = deg_map[u.item()]
-    #     else:
-    #         degu = (adj_matrix[0] == u).sum().item()
-    #         deg_map[u.item()] = degu
-
-    #     if v.item() in deg_map:
-    #         degv = deg_map[v.item()]
-    #     else:
-    #         degv = (adj_matrix[0] == v).sum().item()
-    #         deg_map[v.item()] = degv
-
-    #     values[i] = values[i] / (math.sqrt(degu) * math.sqrt(degv))
-
-    adj_part = adj_part.coalesce()
-    deg = torch.histc(adj_matrix[0].double(), bins=node_count)
-    deg = deg.pow(-0.5)
-
-    row_len = adj_part.size(0)
-    col_len = adj_part.size(1)
-
-    dleft = torch.sparse_coo_tensor([np.arange(0, row_len).tolist(),
-                                     np.arange(0, row_len).tolist()],
-                                     deg[row_vtx:(row_vtx + row_len)].float(),
-                                     size=(row_len, row_len),
-                                     requires_grad=False, device=torch.device("cpu"))
-
-    dright = torch.sparse_coo_tensor([np.arange(0, col_len).tolist(),
-                                     np.arange(0, col_len).tolist()],
-                                     deg[col_vtx:(col_vtx + col_len)].float(),
-                                     size=(col_len, col_len),
-                                     requires_grad=False, device=torch.device("cpu"))
-    # adj_part = torch.sparse.mm(torch.sparse.mm(dleft, adj_part), dright)
-    ad_ind, ad_val = torch_sparse.spspmm(adj_part._indices(), adj_part._values(),
-                                            dright._indices(), dright._values(),
-                                            adj_part.size(0), adj_part.size(1), dright.size(1))
-
-    adj_part_ind, adj_part_val = torch_sparse.spspmm(dleft._indices(), dleft._values(),
-                                                        ad_ind, ad_val,
-                                                        dleft.size(0), dleft.size(1), adj_part.size(1))
-
-    adj_part = torch.sparse_coo_tensor(adj_part_ind, adj_part_val,
-                                                size=(adj_part.size(0), adj_part.size(1)),
-                                                requires_grad=False, device=torch.device("cpu"))
-
-    return adj_part
+    # Evaluation is not part of the training breakdown
+    timing_on = prof.enabled
+    prof.enabled = False
+    with torch.no_grad():
+        outputs = GCNFunc.apply(inputs_loc, weight1, adj_matrix_loc, am_pbyp, rank, size, group, F.relu, True)
+        outputs = GCNFunc.apply(outputs, weight2, adj_matrix_loc, am_pbyp, rank, size, group, F.log_softmax,
+                                    True)
+    prof.enabled = timing_on
+
+    acc = distributed_accuracy(outputs, data, sum(row_count[:rank]), group)
+    if rank == 0:
+        print(f'full test acc is {acc}')
 
+    return acc
 def gcn_norm(edge_index, edge_weight=None, num_nodes=None, improved=False,
              add_self_loops=True, dtype=None):
     fill_value = 2. if improved else 1.
@@ -879,8 +638,8 @@ def symmetric(adj_matrix):
 
 
 def oned_partition(rank, size, inputs, adj_matrix, data, features, classes, device, edge_w=None):
-    global row_count
-    global col_count
+    # row_count/col_count are returned, not set: subgraphs may be partitioned in a background
+    # thread while the training loop uses the globals for another one
     node_count = inputs.size(0)
     n_per_proc = math.ceil(float(node_count) / 1)
 
@@ -895,6 +654,9 @@ def oned_partition(rank, size, inputs, adj_matrix, data, features, classes, devi
     # Compute the adj_matrix and inputs partitions for this process
     # TODO: Maybe I do want grad here. Unsure.
     with torch.no_grad():
+        # Degrees are computed once for the whole graph, each block only gathers them
+        norm = norm_factors(adj_matrix, node_count, norm_type if normalization else "none")
+
         rankf = 0
         # Column partitions
         am_partitions, vtx_indices = split_coo(adj_matrix, node_count, n_per_proc, 1)
@@ -917,8 +679,7 @@ def oned_partition(rank, size, inputs, adj_matrix, data, features, classes, devi
                                                             size=(last_node_count, proc_node_count),
                                                             requires_grad=False)
 
-                    am_pbyp[i] = scale_elements(adj_matrix, am_pbyp[i], node_count, vtx_indices[i],
-                                                    vtx_indices[rankf])
+                    am_pbyp[i] = scale_elements(am_pbyp[i], norm, vtx_indices[i], vtx_indices[rankf])
             else:
                 if edge_w is not None:
                     am_pbyp[i] = torch.sparse_coo_tensor(am_pbyp[i], edge_w_part[i],
@@ -929,8 +690,7 @@ def oned_partition(rank, size, inputs, adj_matrix, data, features, classes, devi
                                                             size=(n_per_proc, proc_node_count),
                                                             requires_grad=False)
 
-                    am_pbyp[i] = scale_elements(adj_matrix, am_pbyp[i], node_count, vtx_indices[i],
-                                                    vtx_indices[rankf])
+                    am_pbyp[i] = scale_elements(am_pbyp[i], norm, vtx_indices[i], vtx_indices[rankf])
 
         for i in range(len(am_partitions)):
             proc_node_count = vtx_indices[i + 1] - vtx_indices[i]
@@ -939,7 +699,7 @@ def oned_partition(rank, size, inputs, adj_matrix, data, features, classes, devi
                                                     size=(node_count, proc_node_count),
                                                     requires_grad=False)
             if edge_w is None:
-                am_partitions[i] = scale_elements(adj_matrix, am_partitions[i], node_count,  0, vtx_indices[i])
+                am_partitions[i] = scale_elements(am_partitions[i], norm, 0, vtx_indices[i])
 
         print(inputs.size(0))
         print(inputs.size(1))
@@ -972,7 +732,6 @@ def run(rank, size, inputs, graphs, data, features, classes, device, orig_adj=No
     global epochs
     global mid_layer
     global run
-    global timing
     global row_count
     global col_count
 
@@ -996,35 +755,26 @@ def run(rank, size, inputs, graphs, data, features, classes, device, orig_adj=No
 
     # TODO if input is a set/list of graphs, partition them in a loop?
     # train_loader has partitioned graphs at each rank
-    train_loader = []
-    print('Preprocessing - partitioning graph')
-    for (nodes_subg, subg, inputs_subg, labels, edgew_subg) in tqdm(graphs):
-        # nodes_subg <- subg[sub_nodeid]
-        #sug = symmetric(subg)
-#        inputs_subg = inputs[nodes_subg.long()]
-        #print('Input subg:', subg)
-        #inputs_subg = torch.from_numpy(inputs_subg)#.double()
-        #print('Input feat:', inputs_subg)
-        #print('Edge w:', edge_w)
+    def partition_subgraph(graph):
+        (nodes_subg, subg, inputs_subg, labels, edgew_subg) = graph
         inputs_loc, adj_matrix_loc, am_pbyp, horizontal_tiled, rowcount, colcount = oned_partition(rank, size, inputs_subg, subg, data,
                                                                     features, classes, device, edge_w=edgew_subg)
 
         print('moving to device:', device)
         labels_subg = labels.to(device)#data.y[nodes_subg.long()]
         inputs_loc = inputs_loc.float().to(device)
-        #print('inputsloc:', inputs_loc.dtype)
         adj_matrix_loc = adj_matrix_loc.to(device)
         for i in range(len(am_pbyp)):            
             am_pbyp[i] = am_pbyp[i].t().coalesce().to(device)
-        #am_pbyp = [am_pbyp[0].t().coalesce().to(device)]
-        train_loader.append((inputs_loc, adj_matrix_loc, am_pbyp, horizontal_tiled,  labels_subg, rowcount, colcount))
-        #print(inputs.shape)
-        #print(inputs_subg.shape)
-        #print(inputs_loc.shape)
-        #print('Inputs subg:', inputs_subg)
-        #print('Inputs loc:', inputs_loc)
-        #exit()
+        return (inputs_loc, adj_matrix_loc, am_pbyp, horizontal_tiled,  labels_subg, rowcount, colcount)
 
+    # train_loader has partitioned graphs at each rank
+    print('Preprocessing - partitioning graph')
+    if isinstance(graphs, SubgraphPrefetcher):
+        # Partitioned on the load pool, overlapping with training on the previous subgraph
+        train_loader = graphs.map(partition_subgraph)
+    else:
+        train_loader = [partition_subgraph(graph) for graph in tqdm(graphs)]
 
     #inputs_loc, adj_matrix_loc, am_pbyp, horizontal_tiled = oned_partition(rank, size, inputs, adj_matrix, data,
     #                                                            features, classes, device)
@@ -1038,7 +788,8 @@ def run(rank, size, inputs, graphs, data, features, classes, device, orig_adj=No
     #adj_matrix_loc = adj_matrix_loc.to(device)
     #for i in range(len(am_pbyp)):
     #    am_pbyp[i] = am_pbyp[i].t().coalesce().to(device)
-    print(train_loader[0])
+    if isinstance(train_loader, list):
+        print(train_loader[0])
 #    exit()
 
     for i in range(run_count):
@@ -1072,33 +823,15 @@ def run(rank, size, inputs, graphs, data, features, classes, device, orig_adj=No
 
 
         total_time[i] = dict()
-        comm_time[i] = dict()
-        comp_time[i] = dict()
-        scomp_time[i] = dict()
-        dcomp_time[i] = dict()
-        bcast_comm_time[i] = dict()
-        barrier_time[i] = dict()
-        barrier_subset_time[i] = dict()
-        op1_comm_time[i] = dict()
-        op2_comm_time[i] = dict()
-
         total_time[i][rank] = 0.0
-        comm_time[i][rank] = 0.0
-        comp_time[i][rank] = 0.0
-        scomp_time[i][rank] = 0.0
-        dcomp_time[i][rank] = 0.0
-        bcast_comm_time[i][rank] = 0.0
-        barrier_time[i][rank] = 0.0
-        barrier_subset_time[i][rank] = 0.0
-        op1_comm_time[i][rank] = 0.0
-        op2_comm_time[i][rank] = 0.0
-
-        timing_on = timing == True
-        timing = False
+
+        global prof
+        prof = Profiler(rank, device, enabled=False, trace=bool(profile_dir),
+                            sync_group=group if timing_sync else None)
+
         #outputs = train(inputs_loc, weight1, weight2, adj_matrix_loc, am_pbyp, optimizer, data,
         #                        rank, size, group, horizontal_tiled)
-        if timing_on:
-            timing = True
+        prof.enabled = timing
 
         dist.barrier(group)
         tstart = time.time()
@@ -1200,6 +933,11 @@ def run(rank, size, inputs, graphs, data, features, classes, device, orig_adj=No
         tstop = time.time()
         total_time[run][rank] = tstop - tstart
 
+        run_stats[run] = prof.summary()
+        if profile_dir:
+            prof.write_json(osp.join(profile_dir, f"run{run}", f"rank{rank}.json"))
+            prof.write_trace(osp.join(profile_dir, f"run{run}", f"rank{rank}.trace.json"))
+
     # Get median runtime according to rank0 and print that run's breakdown
     dist.barrier(group)
     if rank == 0:
@@ -1219,17 +957,19 @@ def run(rank, size, inputs, graphs, data, features, classes, device, orig_adj=No
     if rank == 0:
         print(f"rank: {rank} median_run: {median_idx}")
         print(f"rank: {rank} total_time: {total_time[median_idx][rank]}")
-        print(f"rank: {rank} comm_time: {comm_time[median_idx][rank]}")
-        print(f"rank: {rank} comp_time: {comp_time[median_idx][rank]}")
-        print(f"rank: {rank} scomp_time: {scomp_time[median_idx][rank]}")
-        print(f"rank: {rank} dcomp_time: {dcomp_time[median_idx][rank]}")
-        print(f"rank: {rank} bcast_comm_time: {bcast_comm_time[median_idx][rank]}")
-        print(f"rank: {rank} barrier_time: {barrier_time[median_idx][rank]}")
-        print(f"rank: {rank} barrier_subset_time: {barrier_subset_time[median_idx][rank]}")
-        print(f"rank: {rank} op1_comm_time: {op1_comm_time[median_idx][rank]}")
-        print(f"rank: {rank} op2_comm_time: {op2_comm_time[median_idx][rank]}")
+        totals = run_stats[median_idx]["totals"]
+        for name in ["comm_time", "comp_time", "scomp_time", "dcomp_time", "bcast_comm_time",
+                        "op1_comm_time", "op2_comm_time"]:
+            print(f"rank: {rank} {name}: {totals.get(name, 0.0)}")
+        if isinstance(train_loader, SubgraphPrefetcher):
+            print(f"rank: {rank} loader_wait_time: {train_loader.wait_time}")
         print(f"rank: {rank} {outputs}")
 
+    # Cross-rank min/mean/max of the median run, one collective for the whole breakdown
+    _, stats = aggregate(run_stats[median_idx], group)
+    if rank == 0:
+        print_stats(stats)
+
 
     if accuracy:
 
@@ -1423,19 +1163,21 @@ def main():
        #         torch.save(norm_loss, 'subgs-reddit/norm_loss_{}.pt'.format(i))
        #         print('subg {} saved'.format(i))
        #     print('subgs saved')
+        feature_store = None
         if graphname in ['meta', 'arctic25', 'oral','mag']:
             if graphname=='mag':
                 graphname1 = 'ogbn-mag'
             else:
                 graphname1 = graphname
             pref = '/scratch/general/nfs1/u1320844/dataset/asplos/{}_subgs/'.format(graphname1)
-            adj_full = torch.load(pref+'adj_full.pt')
-            x_full = torch.load(pref+'x_full.pt')
-            y_full = torch.load(pref+'y_full.pt')
+            src = open_subgraphs(pref)
+            adj_full = load_tensor(src, 'adj_full')
+            x_full = load_tensor(src, 'x_full')
+            y_full = load_tensor(src, 'y_full')
             print(f'{graphname}, {len(adj_full[0])}, {len(x_full)}, {len(adj_full[0])/len(x_full)}')
-            train_mask_full = torch.load(pref+'train_mask_full.pt')
-            val_mask_full = torch.load(pref+'val_mask_full.pt')
-            test_mask_full = torch.load(pref+'test_mask_full.pt')
+            train_mask_full = load_tensor(src, 'train_mask_full')
+            val_mask_full = load_tensor(src, 'val_mask_full')
+            test_mask_full = load_tensor(src, 'test_mask_full')
             data = Data()
             data.edge_index = adj_full
             data.x = x_full
@@ -1444,6 +1186,8 @@ def main():
             data.train_mask = train_mask_full
             data.val_mask = val_mask_full
             data.test_mask = test_mask_full
+            # Subgraphs saved as node ids gather their rows from these instead of a second copy
+            feature_store = FeatureStore(dict(x=x_full, y=y_full), pin=device.type == "cuda")
             inputs = data.x.to(device)
             data.y = data.y.to(device)
             edge_index = data.edge_index
@@ -1517,29 +1261,41 @@ def main():
         #pref = '/uufs/chpc.utah.edu/common/home/u1320844/OGB_models/ogb/examples/nodeproppred/new/{}_subgs/'.format(gg.lower())
         #pref = '/uufs/chpc.utah.edu/common/home/u1320844/OGB_models/ogb/examples/nodeproppred/new/asplos/pyg/{}_subgs/'.format(gg.lower())
         pref = '/scratch/general/nfs1/u1320844/dataset/asplos/{}_subgs/'.format(gg.lower())
-        for i in range(32):
-                node_ids = torch.load(pref+'train_mask_{}.pt'.format(i))
-                adj_subg = torch.load(pref+'adj_{}.pt'.format(i))
-                inputs_subg = torch.load(pref+'x_{}.pt'.format(i))
-                label = torch.load(pref+'y_{}.pt'.format(i))
-                # TODO add edge_w
-                if not normalization:
-                    _, edgew_subg = gcn_norm(adj_subg, num_nodes=num_nodes)
-                else:
-                    edgew_subg = torch.ones(adj_subg[0].shape) 
+        src = open_subgraphs(pref)
+        if feature_store is None:
+            feature_store = open_feature_store(src, pin=device.type == "cuda")
+        def load_graph(i):
+            parts = load_subgraph(src, i, ("train_mask", "adj", "x", "y"), feature_store)
+            node_ids = parts["train_mask"]
+            adj_subg = parts["adj"]
+            inputs_subg = parts["x"]
+            label = parts["y"]
+            # TODO add edge_w
+            if not normalization:
+                _, edgew_subg = gcn_norm(adj_subg, num_nodes=num_nodes)
+            else:
+                edgew_subg = torch.ones(adj_subg[0].shape) 
+
+            #edgew_subg = gcn_norm(adj_subg, num_nodes=node_ids.sum())
 
-                #edgew_subg = gcn_norm(adj_subg, num_nodes=node_ids.sum())
+            #if graphname == 'products':
+            #    label = torch.squeeze(label, dim=1)
 
-                #if graphname == 'products':
-                #    label = torch.squeeze(label, dim=1)
+            #edge_w = torch.load('subgs-reddit/edge_w_{}.pt'.format(i))
+            #norm_loss = torch.load('subgs-reddit/norm_loss_{}.pt'.format(i))
+            #subgraphs.append((node_ids, adj_subg, inputs_subg, edge_w, norm_loss))
+            return (node_ids, adj_subg, inputs_subg, label, edgew_subg)
 
-                #edge_w = torch.load('subgs-reddit/edge_w_{}.pt'.format(i))
-                #norm_loss = torch.load('subgs-reddit/norm_loss_{}.pt'.format(i))
-                #subgraphs.append((node_ids, adj_subg, inputs_subg, edge_w, norm_loss))
-                subgraphs.append((node_ids, adj_subg, inputs_subg, label, edgew_subg))
+        if prefetch > 0:
+            # Loaded (and partitioned, see run) in the background while earlier subgraphs train
+            subgraphs = SubgraphPrefetcher(range(32), load_graph, prefetch, load_workers,
+                                            cache=not stream_subgraphs)
+        else:
+            subgraphs = [load_graph(i) for i in range(32)]
 
         print(f'{len(subgraphs)} subgraphs')
-        print(subgraphs[0])
+        if prefetch == 0:
+            print(subgraphs[0])
         # inputs = data.x
         # data.y = data.y.to(device)
 
@@ -1732,9 +1488,15 @@ if __name__ == '__main__':
     parser.add_argument("--midlayer", type=int)
     parser.add_argument("--runcount", type=int)
     parser.add_argument("--normalization", type=str)
+    parser.add_argument("--normtype", type=str, default="sym")
     parser.add_argument("--activations", type=str)
     parser.add_argument("--accuracy", type=str)
     parser.add_argument("--download", type=bool)
+    parser.add_argument("--prefetch", type=int, default=0)
+    parser.add_argument("--loadworkers", type=int, default=2)
+    parser.add_argument("--stream", type=str, default="False")
+    parser.add_argument("--timingsync", type=str, default="False")
+    parser.add_argument("--profiledir", type=str, default="")
 
     args = parser.parse_args()
     print(args)
@@ -1750,9 +1512,15 @@ if __name__ == '__main__':
     mid_layer = args.midlayer
     run_count = args.runcount
     normalization = args.normalization == "True"
+    norm_type = args.normtype
     activations = args.activations == "True"
     accuracy = args.accuracy == "True"
     download = args.download
+    prefetch = args.prefetch
+    load_workers = args.loadworkers
+    stream_subgraphs = args.stream == "True"
+    timing_sync = args.timingsync == "True"
+    profile_dir = args.profiledir
 
     if not download:
         if (epochs is None) or (graphname is None) or (timing is None) or (mid_layer is None) or (run_count is None):
@@ -26,6 +26,9 @@ from torch_scatter import scatter_add
 import torch_sparse
 
 from sparse_coo_tensor_cpp import sparse_coo_tensor_gpu, spmm_gpu
+from workspace import Workspace
+from redistribute import alltoall_transpose
+from profiler import Profiler, aggregate, print_stats
 
 import socket
 import statistics
@@ -40,29 +43,21 @@ def coo_scipy2stack(adj):
     values = torch.from_numpy(adj.data)
     indices = torch.stack((torch.from_numpy(adj.row), torch.from_numpy(adj.col)))
     return (indices, values)
-# comp_time = 0.0
-# comm_time = 0.0
-# scomp_time = 0.0
-# dcomp_time = 0.0
-# bcast_comm_time = 0.0
-# bcast_words = 0
-# op1_comm_time = 0.0
-# op2_comm_time = 0.0
 total_time = dict()
-comp_time = dict()
-comm_time = dict()
-scomp_time = dict()
-dcomp_time = dict()
-bcast_comm_time = dict()
-barrier_time = dict()
-barrier_subset_time = dict()
-op1_comm_time = dict()
-op2_comm_time = dict()
+# Timers of the current run (comm_time, bcast_comm_time, ...), replaced in run();
+# per-run summaries are kept in run_stats for the median-run breakdown
+prof = Profiler(enabled=False)
+run_stats = dict()
+
+# Staging buffers for transpose_input, reused across layers and epochs
+workspace = Workspace()
 
 epochs = 0
 graphname = ""
 mid_layer = 0
 timing = True
+timing_sync = False
+profile_dir = ""
 normalization = False
 activations = False
 accuracy = False
@@ -73,41 +68,6 @@ run = 0
 download = False
 ht = True
 
-def start_time(group, rank, subset=False, src=None):
-    global barrier_time
-    global barrier_subset_time
-
-    if not timing:
-        return 0.0
-
-    barrier_tstart = time.time()
-
-    dist.barrier(group)
-    barrier_tstop = time.time()
-    if not run in barrier_time.keys():
-        barrier_time[run] = {}
-    if not rank in barrier_time[run].keys():
-        barrier_time[run][rank] = 0 
-    
-    barrier_time[run][rank] += barrier_tstop - barrier_tstart
-    if subset:
-        barrier_subset_time[run][rank] += barrier_tstop - barrier_tstart
-
-    tstart = 0.0
-    tstart = time.time()
-    return tstart
-
-def stop_time(group, rank, tstart):
-    if not timing:
-        return 0.0
-    dist.barrier(group)
-    devid = rank_to_devid(rank, acc_per_rank)
-    device = torch.device('cuda:{}'.format(devid))
-    # torch.cuda.synchronize(device=device)
-
-    tstop = time.time()
-    return tstop - tstart
-
 def normalize(adj_matrix):
     adj_matrix = adj_matrix + torch.eye(adj_matrix.size(0))
     d = torch.sum(adj_matrix, dim=1)
@@ -156,32 +116,24 @@ def block_row(adj_matrix, am_partitions, inputs, weight, rank, size):
     return z_loc
 
 def outer_product(adj_matrix, grad_output, rank, size, group):
-    global comm_time
-    global comp_time
-    global dcomp_time
-    global op1_comm_time
     global run
 
 
     n_per_proc = math.ceil(float(adj_matrix.size(0)) / size)
 
-    tstart_comp = start_time(group, rank)
+    tstart_comp = prof.start()
 
     # A * G^l
     ag = torch.mm(adj_matrix, grad_output)
 
-    dur = stop_time(group, rank, tstart_comp)
-    comp_time[run][rank] += dur
-    dcomp_time[run][rank] += dur
+    prof.stop(tstart_comp, "comp_time", "dcomp_time")
 
-    tstart_comm = start_time(group, rank)
+    tstart_comm = prof.start()
 
     # reduction on A * G^l low-rank matrices
     dist.all_reduce(ag, op=dist.reduce_op.SUM, group=group)
 
-    dur = stop_time(group, rank, tstart_comm)
-    comm_time[run][rank] += dur
-    op1_comm_time[run][rank] += dur
+    prof.stop(tstart_comm, "comm_time", "op1_comm_time")
 
     # partition A * G^l by block rows and get block row for this process
     # TODO: this might not be space-efficient
@@ -191,117 +143,31 @@ def outer_product(adj_matrix, grad_output, rank, size, group):
     return grad_input
 
 def outer_product2(inputs, ag, rank, size, group):
-    global comm_time
-    global comp_time
-    global dcomp_time
-    global op2_comm_time
     global run
 
-    tstart_comp = start_time(group, rank)
+    tstart_comp = prof.start()
     # (H^(l-1))^T * (A * G^l)
     grad_weight = torch.mm(inputs, ag)
 
-    dur = stop_time(group, rank, tstart_comp)
-    comp_time[run][rank] += dur
-    dcomp_time[run][rank] += dur
+    prof.stop(tstart_comp, "comp_time", "dcomp_time")
 
-    tstart_comm = start_time(group, rank)
+    tstart_comm = prof.start()
     # reduction on grad_weight low-rank matrices
     dist.all_reduce(grad_weight, op=dist.reduce_op.SUM, group=group)
 
-    dur = stop_time(group, rank, tstart_comm)
-    comm_time[run][rank] += dur
-    op2_comm_time[run][rank] += dur
+    prof.stop(tstart_comm, "comm_time", "op2_comm_time")
 
     return grad_weight
 
 def transpose_input(node_count,inputs,rank,size,dim):
-    #print('in transpose '+str(rank)+' at dim '+str(dim))
-    global device
-    global comm_time
-    global comp_time
-    global scomp_time
-    global bcast_comm_time
-    global run
     global ht
 
     ht = not ht
-    if dim == 0:
-        #horizontal_tiled = False
-        # Horizontal to Vertical
-        input_2d = torch.split(inputs, math.ceil(float(inputs.size(1-dim)) / size), dim=1-dim)
-        #if len(col_count) == 0:  for i in input_2d:    col_count += [input_2d[rank].size(1)]
-        recv = [0]*size
-        for i in range(size):
-            col_count[i] = input_2d[i].size(1)
-        for ii in range(size):
-            i = ii^rank
-            if i == rank:
-                recv[i] = input_2d[rank]
-                continue
-            '''
-            print('inside h2v transpose')
-            print(size)
-            print(i)
-            print(rank)
-            print(inputs.size())
-            '''
-            input_recv = torch.zeros(row_count[i], col_count[rank], device=device)
-
-            #print('buffer size '+str(input_recv.size()))
-            if i < rank :
-                dist.send(tensor=input_2d[i].contiguous(), dst=i)
-                dist.recv(tensor=input_recv, src=i)
-            else:
-                dist.recv(tensor=input_recv, src=i)
-                dist.send(tensor=input_2d[i].contiguous(), dst=i)
-
-            recv[i] = input_recv
-        inputs = torch.cat(recv,0)
-        #print('size after transpose')
-        #print(inputs.size())
-        #print('after tp ht: '+str(horizontal_tiled)+' in rank '+str(rank))
-        return inputs
-    elif dim == 1:
-        # Vertical to Horizontal
-        #horizontal_tiled = True
-        # print('Transpose '+str(inputs.size()))
-        # print(row_count)
-        input_2d = torch.split(inputs, math.ceil(float(inputs.size(1-dim)) / size), dim=1-dim)
-        recv = [0]*size
-        for ii in range(size):
-            i = ii ^ rank
-            if i == rank:
-                recv[i] = input_2d[rank]
-                continue
-            '''
-            print('inside v2h transpose')
-            print(size)
-            print(i)
-            print(rank)
-            print(inputs.size())
-            '''
-            input_recv = torch.zeros(row_count[rank], col_count[i], device=device)
-            #print('buffer size '+str(input_recv.size()))
-            if i < rank :
-                dist.send(tensor=input_2d[i].contiguous(), dst=i)
-                dist.recv(tensor=input_recv, src=i)
-            else:
-                dist.recv(tensor=input_recv, src=i)
-                dist.send(tensor=input_2d[i].contiguous(), dst=i)
-            recv[i] = input_recv
-        #for t in recv:            print('concat tensors '+str(t.size()))
-        inputs = torch.cat(recv,1)
-        #print('size after transpose')
-        #print(inputs.size())
-        return inputs
+    # One all-to-all with row_count/col_count split sizes instead of P - 1 pairwise send/recv rounds
+    return alltoall_transpose(inputs, row_count, col_count, rank, size, dim, workspace)
 
 def broad_func(node_count, am_partitions, inputs, rank, size, group, horizontal_tiled):
     global device
-    global comm_time
-    global comp_time
-    global scomp_time
-    global bcast_comm_time
     global run
 
 
@@ -324,19 +190,9 @@ def broad_func(node_count, am_partitions, inputs, rank, size, group, horizontal_
             # inputs_recv = torch.zeros(list(am_partitions[i].t().size())[1], inputs.size(1))
         transpose = True
         if horizontal_tiled:
-            tstart_comm = start_time(group, rank)
+            tstart_comm = prof.start()
             inputs_recv = transpose_input(node_count,inputs,rank,size,0)
-            dur = stop_time(group, rank, tstart_comm)
-            if not run in comm_time.keys():
-                comm_time[run] = {}
-            if not rank in comm_time[run].keys():
-                comm_time[run][rank] = 0 
-            if not run in bcast_comm_time.keys():
-                bcast_comm_time[run] = {}
-            if not rank in bcast_comm_time[run].keys():
-                bcast_comm_time[run][rank] = 0 
-            comm_time[run][rank] += dur
-            bcast_comm_time[run][rank] += dur
+            prof.stop(tstart_comm, "comm_time", "bcast_comm_time")
             transpose = False
         else:
             #Hacked a solution here but we need a better way to do this
@@ -347,7 +203,7 @@ def broad_func(node_count, am_partitions, inputs, rank, size, group, horizontal_
         #print('SpMM started at rank '+str(rank))
         z_loc = torch.cuda.FloatTensor(am_partitions[0].size(0), inputs_recv.size(1), device=device).fill_(0)
         # print('size of output '+ str(z_loc.size()))
-        tstart_comp = start_time(group, rank)
+        tstart_comp = prof.start()
 
         '''
         print(am_partitions[i].size(0))
@@ -363,34 +219,18 @@ def broad_func(node_count, am_partitions, inputs, rank, size, group, horizontal_
 
         #print('first SpMM was OK!')
         #print(z_loc)
-        dur = stop_time(group, rank, tstart_comp)
-        # print('SpMM time '+str(dur))
-        if not run in comp_time.keys():
-            comp_time[run] = {}
-        if not rank in comp_time[run].keys():
-            comp_time[run][rank] = 0 
-        if not run in scomp_time.keys():
-            scomp_time[run] = {}
-        if not rank in scomp_time[run].keys():
-            scomp_time[run][rank] = 0 
-        comp_time[run][rank] += dur
-        scomp_time[run][rank] += dur
+        prof.stop(tstart_comp, "comp_time", "scomp_time")
 
         if transpose:
-            tstart_comm = start_time(group, rank)
+            tstart_comm = prof.start()
             z_loc = transpose_input(node_count,z_loc,rank,size,1)
-            dur = stop_time(group, rank, tstart_comm)
-            comm_time[run][rank] += dur
-            bcast_comm_time[run][rank] += dur
+            prof.stop(tstart_comm, "comm_time", "bcast_comm_time")
 
     return z_loc
 
 class GCNFunc(torch.autograd.Function):
     @staticmethod
     def forward(ctx, inputs, weight, adj_matrix, am_partitions, rank, size, group, func, test=False):
-        global comm_time
-        global comp_time
-        global dcomp_time
         global run
         #lobal x1
         global ht
@@ -412,7 +252,7 @@ class GCNFunc(torch.autograd.Function):
         if ht:
             #if rank == 0: print('forw horizontal '+str(rank))
             if not test:
-                tstart_comp = start_time(group, rank)
+                tstart_comp = prof.start()
             #inputs = inputs.float()
             #weight = weight.float()
             z = torch.mm(inputs, weight)
@@ -420,17 +260,7 @@ class GCNFunc(torch.autograd.Function):
             #print('mm weight:', weight)
             #print('x after mm:',z)
             if not test:
-                dur = stop_time(group, rank, tstart_comp)
-                if not run in comp_time.keys():
-                    comp_time[run] = {}
-                if not rank in comp_time[run].keys():
-                    comp_time[run][rank] = 0 
-                if not run in dcomp_time.keys():
-                    dcomp_time[run] = {}
-                if not rank in dcomp_time[run].keys():
-                    dcomp_time[run][rank] = 0 
-                comp_time[run][rank] += dur
-                dcomp_time[run][rank] += dur
+                prof.stop(tstart_comp, "comp_time", "dcomp_time")
             z = broad_func(adj_matrix.size(0), am_partitions, z, rank, size, group, ht)
             #print('x after spmm:',z)
 
@@ -441,13 +271,11 @@ class GCNFunc(torch.autograd.Function):
             x1 = broad_func(adj_matrix.size(0), am_partitions, inputs, rank, size, group, ht)
             #print('x after spmm:',x1)
             if not test:
-                tstart_comp = start_time(group, rank)
+                tstart_comp = prof.start()
             z = torch.mm(x1, weight)
             #print('x after mm:',z)
             if not test:
-                dur = stop_time(group, rank, tstart_comp)
-                comp_time[run][rank] += dur
-                dcomp_time[run][rank] += dur
+                prof.stop(tstart_comp, "comp_time", "dcomp_time")
 
         z.requires_grad = True
         ctx.z = z
@@ -469,9 +297,6 @@ class GCNFunc(torch.autograd.Function):
 
     @staticmethod
     def backward(ctx, grad_output):
-        global comm_time
-        global comp_time
-        global dcomp_time
         global run
         global ht
         global x1
@@ -503,11 +328,9 @@ class GCNFunc(torch.autograd.Function):
         grad_weight=None
         if ht:
             #if rank == 0: print('hor back '+str(rank))
-            tstart_comp = start_time(group, rank)
+            tstart_comp = prof.start()
             x2 = torch.mm(grad_output, weight.t())
-            dur = stop_time(group, rank, tstart_comp)
-            comp_time[run][rank] += dur
-            dcomp_time[run][rank] += dur
+            prof.stop(tstart_comp, "comp_time", "dcomp_time")
             grad_input = broad_func(adj_matrix.size(0), am_partitions, x2 , rank, size, group, ht)
             # Second backprop equation (reuses the A * H^(l-1) computation)
             grad_weight = outer_product2(x1.t(), grad_output, rank, size, group)
@@ -515,11 +338,9 @@ class GCNFunc(torch.autograd.Function):
         else:
             #if rank == 0: print('ver back '+str(rank))
             ag = broad_func(adj_matrix.size(0), am_partitions, grad_output, rank, size, group, ht)
-            tstart_comp = start_time(group, rank)
+            tstart_comp = prof.start()
             grad_input = torch.mm(ag, weight.t())
-            dur = stop_time(group, rank, tstart_comp)
-            comp_time[run][rank] += dur
-            dcomp_time[run][rank] += dur
+            prof.stop(tstart_comp, "comp_time", "dcomp_time")
             # Second backprop equation (reuses the A * G^l computation)
             grad_weight = outer_product2(inputs.t(), ag, rank, size, group)
 
@@ -968,7 +789,6 @@ def run(rank, size, inputs, graphs, data, features, classes, device, orig_adj=No
     global epochs
     global mid_layer
     global run
-    global timing
     global row_count
     global col_count
 
@@ -1067,33 +887,16 @@ def run(rank, size, inputs, graphs, data, features, classes, device, orig_adj=No
 
 
         total_time[i] = dict()
-        comm_time[i] = dict()
-        comp_time[i] = dict()
-        scomp_time[i] = dict()
-        dcomp_time[i] = dict()
-        bcast_comm_time[i] = dict()
-        barrier_time[i] = dict()
-        barrier_subset_time[i] = dict()
-        op1_comm_time[i] = dict()
-        op2_comm_time[i] = dict()
 
         total_time[i][rank] = 0.0
-        comm_time[i][rank] = 0.0
-        comp_time[i][rank] = 0.0
-        scomp_time[i][rank] = 0.0
-        dcomp_time[i][rank] = 0.0
-        bcast_comm_time[i][rank] = 0.0
-        barrier_time[i][rank] = 0.0
-        barrier_subset_time[i][rank] = 0.0
-        op1_comm_time[i][rank] = 0.0
-        op2_comm_time[i][rank] = 0.0
-
-        timing_on = timing == True
-        timing = False
+
+        global prof
+        prof = Profiler(rank, device, enabled=False, trace=bool(profile_dir),
+                            sync_group=group if timing_sync else None)
+
         #outputs = train(inputs_loc, weight1, weight2, adj_matrix_loc, am_pbyp, optimizer, data,
         #                        rank, size, group, horizontal_tiled)
-        if timing_on:
-            timing = True
+        prof.enabled = timing
 
         dist.barrier(group)
         tstart = time.time()
@@ -1179,6 +982,11 @@ def run(rank, size, inputs, graphs, data, features, classes, device, orig_adj=No
         tstop = time.time()
         total_time[run][rank] = tstop - tstart
 
+        run_stats[run] = prof.summary()
+        if profile_dir:
+            prof.write_json(osp.join(profile_dir, f"run{run}", f"rank{rank}.json"))
+            prof.write_trace(osp.join(profile_dir, f"run{run}", f"rank{rank}.trace.json"))
+
     # Get median runtime according to rank0 and print that run's breakdown
     dist.barrier(group)
     if rank == 0:
@@ -1195,18 +1003,15 @@ def run(rank, size, inputs, graphs, data, features, classes, device, orig_adj=No
 
     dist.broadcast(median_idx, src=0, group=group)
     median_idx = median_idx.item()
+    # Cross-rank min/mean/max of the median run, one collective for the whole breakdown
+    _, run_agg = aggregate(run_stats[median_idx], group)
     if rank == 0:
         print(f"rank: {rank} median_run: {median_idx}")
         print(f"rank: {rank} total_time: {total_time[median_idx][rank]}")
-        print(f"rank: {rank} comm_time: {comm_time[median_idx][rank]}")
-        print(f"rank: {rank} comp_time: {comp_time[median_idx][rank]}")
-        print(f"rank: {rank} scomp_time: {scomp_time[median_idx][rank]}")
-        print(f"rank: {rank} dcomp_time: {dcomp_time[median_idx][rank]}")
-        print(f"rank: {rank} bcast_comm_time: {bcast_comm_time[median_idx][rank]}")
-        print(f"rank: {rank} barrier_time: {barrier_time[median_idx][rank]}")
-        print(f"rank: {rank} barrier_subset_time: {barrier_subset_time[median_idx][rank]}")
-        print(f"rank: {rank} op1_comm_time: {op1_comm_time[median_idx][rank]}")
-        print(f"rank: {rank} op2_comm_time: {op2_comm_time[median_idx][rank]}")
+        totals = run_stats[median_idx]["totals"]
+        for name in ["comm_time", "comp_time", "scomp_time", "dcomp_time", "bcast_comm_time", "op1_comm_time", "op2_comm_time"]:
+            print(f"rank: {rank} {name}: {totals.get(name, 0.0)}")
+        print_stats(run_agg)
         print(f"rank: {rank} {outputs}")
 
 
@@ -1692,6 +1497,8 @@ if __name__ == '__main__':
     parser.add_argument("--accuracy", type=str)
     parser.add_argument("--download", type=bool)
 
+    parser.add_argument("--timingsync", type=str, default="False")
+    parser.add_argument("--profiledir", type=str, default="")
     args = parser.parse_args()
     print(args)
 
@@ -1703,6 +1510,8 @@ if __name__ == '__main__':
     epochs = args.epochs
     graphname = args.graphname
     timing = args.timing == "True"
+    timing_sync = args.timingsync == "True"
+    profile_dir = args.profiledir
     mid_layer = args.midlayer
     run_count = args.runcount
     normalization = args.normalization == "True"
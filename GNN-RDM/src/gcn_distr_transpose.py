@@ -26,36 +26,39 @@ from torch_scatter import scatter_add
 import torch_sparse
 
 from sparse_coo_tensor_cpp import sparse_coo_tensor_gpu, spmm_gpu
+from partition_utils import vtx_boundaries, split_coo_blocks, norm_factors, scale_elements, distributed_accuracy
+from partition_cache import cached_partition
+from workspace import Workspace
+from profiler import Profiler, aggregate, print_stats
+from redistribute import alltoall_transpose
+from comm_precision import CommPrecision
+from grad_reduce import GradReducer
 
 import socket
 import statistics
 import time
 import numpy as np
 
-# comp_time = 0.0
-# comm_time = 0.0
-# scomp_time = 0.0
-# dcomp_time = 0.0
-# bcast_comm_time = 0.0
-# bcast_words = 0
-# op1_comm_time = 0.0
-# op2_comm_time = 0.0
 total_time = dict()
-comp_time = dict()
-comm_time = dict()
-scomp_time = dict()
-dcomp_time = dict()
-bcast_comm_time = dict()
-barrier_time = dict()
-barrier_subset_time = dict()
-op1_comm_time = dict()
-op2_comm_time = dict()
+# Peak allocated device memory of each run
+peak_memory = dict()
+# Timers of the current run (comm_time, bcast_comm_time, ...), replaced in run();
+# per-run summaries are kept in run_stats for the median-run breakdown
+prof = Profiler(enabled=False)
+run_stats = dict()
+
+# Persistent buffers for transpose_input and broad_func, reused across layers and epochs
+workspace = Workspace()
+# Wire format of the redistributions and weight-gradient all-reduce
+comm = CommPrecision(workspace=workspace)
 
 epochs = 0
 graphname = ""
 mid_layer = 0
 timing = True
 normalization = False
+norm_type = "sym"
+partition_cache = ""
 activations = False
 accuracy = False
 device = None
@@ -64,36 +67,15 @@ run_count = 0
 run = 0
 download = False
 ht = True
-
-def start_time(group, rank, subset=False, src=None):
-    global barrier_time
-    global barrier_subset_time
-
-    if not timing:
-        return 0.0
-
-    barrier_tstart = time.time()
-
-    dist.barrier(group)
-    barrier_tstop = time.time()
-    barrier_time[run][rank] += barrier_tstop - barrier_tstart
-    if subset:
-        barrier_subset_time[run][rank] += barrier_tstop - barrier_tstart
-
-    tstart = 0.0
-    tstart = time.time()
-    return tstart
-
-def stop_time(group, rank, tstart):
-    if not timing:
-        return 0.0
-    dist.barrier(group)
-    devid = rank_to_devid(rank, acc_per_rank)
-    device = torch.device('cuda:{}'.format(devid))
-    # torch.cuda.synchronize(device=device)
-
-    tstop = time.time()
-    return tstop - tstart
+recompute = False
+timing_sync = False
+profile_dir = ""
+comm_dtype = "fp32"
+comm_scale = False
+# Bucketed async weight-gradient all-reduce (--asyncgrad), set up in run() for each run's weights
+async_grad = False
+grad_bucket_mb = 25.0
+grad_reducer = None
 
 def normalize(adj_matrix):
     adj_matrix = adj_matrix + torch.eye(adj_matrix.size(0))
@@ -143,32 +125,24 @@ def block_row(adj_matrix, am_partitions, inputs, weight, rank, size):
     return z_loc
 
 def outer_product(adj_matrix, grad_output, rank, size, group):
-    global comm_time
-    global comp_time
-    global dcomp_time
-    global op1_comm_time
     global run
 
 
     n_per_proc = math.ceil(float(adj_matrix.size(0)) / size)
 
-    tstart_comp = start_time(group, rank)
+    tstart_comp = prof.start()
 
     # A * G^l
     ag = torch.mm(adj_matrix, grad_output)
 
-    dur = stop_time(group, rank, tstart_comp)
-    comp_time[run][rank] += dur
-    dcomp_time[run][rank] += dur
+    prof.stop(tstart_comp, "comp_time", "dcomp_time")
 
-    tstart_comm = start_time(group, rank)
+    tstart_comm = prof.start()
 
     # reduction on A * G^l low-rank matrices
     dist.all_reduce(ag, op=dist.reduce_op.SUM, group=group)
 
-    dur = stop_time(group, rank, tstart_comm)
-    comm_time[run][rank] += dur
-    op1_comm_time[run][rank] += dur
+    prof.stop(tstart_comm, "comm_time", "op1_comm_time")
 
     # partition A * G^l by block rows and get block row for this process
     # TODO: this might not be space-efficient
@@ -177,118 +151,37 @@ def outer_product(adj_matrix, grad_output, rank, size, group):
 
     return grad_input
 
-def outer_product2(inputs, ag, rank, size, group):
-    global comm_time
-    global comp_time
-    global dcomp_time
-    global op2_comm_time
+def outer_product2(inputs, ag, rank, size, group, weight=None):
     global run
 
-    tstart_comp = start_time(group, rank)
+    tstart_comp = prof.start()
     # (H^(l-1))^T * (A * G^l)
     grad_weight = torch.mm(inputs, ag)
 
-    dur = stop_time(group, rank, tstart_comp)
-    comp_time[run][rank] += dur
-    dcomp_time[run][rank] += dur
+    prof.stop(tstart_comp, "comp_time", "dcomp_time")
+
+    if grad_reducer is not None:
+        # Summed with the rest of its bucket while backward goes on, train() waits before the step
+        grad_reducer.push(weight, grad_weight)
+        return None
 
-    tstart_comm = start_time(group, rank)
+    tstart_comm = prof.start()
     # reduction on grad_weight low-rank matrices
-    dist.all_reduce(grad_weight, op=dist.reduce_op.SUM, group=group)
+    comm.all_reduce(grad_weight, group=group, key="op2_reduce")
 
-    dur = stop_time(group, rank, tstart_comm)
-    comm_time[run][rank] += dur
-    op2_comm_time[run][rank] += dur
+    prof.stop(tstart_comm, "comm_time", "op2_comm_time")
 
     return grad_weight
 
-def transpose_input(node_count,inputs,rank,size,dim):
-    #print('in transpose '+str(rank)+' at dim '+str(dim))
-    global device
-    global comm_time
-    global comp_time
-    global scomp_time
-    global bcast_comm_time
-    global run
+def transpose_input(node_count,inputs,rank,size,dim,key=None):
     global ht
 
     ht = not ht
-    if dim == 0:
-        #horizontal_tiled = False
-        # Horizontal to Vertical
-        input_2d = torch.split(inputs, math.ceil(float(inputs.size(1-dim)) / size), dim=1-dim)
-        #if len(col_count) == 0:  for i in input_2d:    col_count += [input_2d[rank].size(1)]
-        recv = [0]*size
-        for i in range(size):
-            col_count[i] = input_2d[i].size(1)
-        for ii in range(size):
-            i = ii^rank
-            if i == rank:
-                recv[i] = input_2d[rank]
-                continue
-            '''
-            print('inside h2v transpose')
-            print(size)
-            print(i)
-            print(rank)
-            print(inputs.size())
-            '''
-            input_recv = torch.zeros(row_count[i], col_count[rank], device=device)
-
-            #print('buffer size '+str(input_recv.size()))
-            if i < rank :
-                dist.send(tensor=input_2d[i].contiguous(), dst=i)
-                dist.recv(tensor=input_recv, src=i)
-            else:
-                dist.recv(tensor=input_recv, src=i)
-                dist.send(tensor=input_2d[i].contiguous(), dst=i)
-
-            recv[i] = input_recv
-        inputs = torch.cat(recv,0)
-        #print('size after transpose')
-        #print(inputs.size())
-        #print('after tp ht: '+str(horizontal_tiled)+' in rank '+str(rank))
-        return inputs
-    elif dim == 1:
-        # Vertical to Horizontal
-        #horizontal_tiled = True
-        # print('Transpose '+str(inputs.size()))
-        # print(row_count)
-        input_2d = torch.split(inputs, math.ceil(float(inputs.size(1-dim)) / size), dim=1-dim)
-        recv = [0]*size
-        for ii in range(size):
-            i = ii ^ rank
-            if i == rank:
-                recv[i] = input_2d[rank]
-                continue
-            '''
-            print('inside v2h transpose')
-            print(size)
-            print(i)
-            print(rank)
-            print(inputs.size())
-            '''
-            input_recv = torch.zeros(row_count[rank], col_count[i], device=device)
-            #print('buffer size '+str(input_recv.size()))
-            if i < rank :
-                dist.send(tensor=input_2d[i].contiguous(), dst=i)
-                dist.recv(tensor=input_recv, src=i)
-            else:
-                dist.recv(tensor=input_recv, src=i)
-                dist.send(tensor=input_2d[i].contiguous(), dst=i)
-            recv[i] = input_recv
-        #for t in recv:            print('concat tensors '+str(t.size()))
-        inputs = torch.cat(recv,1)
-        #print('size after transpose')
-        #print(inputs.size())
-        return inputs
-
-def broad_func(node_count, am_partitions, inputs, rank, size, group, horizontal_tiled):
+    # One all-to-all with row_count/col_count split sizes instead of P - 1 pairwise send/recv rounds
+    return alltoall_transpose(inputs, row_count, col_count, rank, size, dim, workspace, key, comm=comm)
+
+def broad_func(node_count, am_partitions, inputs, rank, size, group, horizontal_tiled, key=None):
     global device
-    global comm_time
-    global comp_time
-    global scomp_time
-    global bcast_comm_time
     global run
 
 
@@ -300,8 +193,6 @@ def broad_func(node_count, am_partitions, inputs, rank, size, group, horizontal_
     # z_loc = torch.cuda.FloatTensor(am_partitions[0].size(0), inputs.size(1), device=device).fill_(0)
     # z_loc = torch.zeros(adj_matrix.size(0), inputs.size(1))
 
-    inputs_recv = torch.cuda.FloatTensor(n_per_proc, inputs.size(1), device=device).fill_(0)
-    # inputs_recv = torch.zeros(n_per_proc, inputs.size(1))
 
 
 
@@ -311,11 +202,9 @@ def broad_func(node_count, am_partitions, inputs, rank, size, group, horizontal_
             # inputs_recv = torch.zeros(list(am_partitions[i].t().size())[1], inputs.size(1))
         transpose = True
         if horizontal_tiled:
-            tstart_comm = start_time(group, rank)
-            inputs_recv = transpose_input(node_count,inputs,rank,size,0)
-            dur = stop_time(group, rank, tstart_comm)
-            comm_time[run][rank] += dur
-            bcast_comm_time[run][rank] += dur
+            tstart_comm = prof.start()
+            inputs_recv = transpose_input(node_count,inputs,rank,size,0,key)
+            prof.stop(tstart_comm, "comm_time", "bcast_comm_time")
             transpose = False
         else:
             #Hacked a solution here but we need a better way to do this
@@ -324,9 +213,10 @@ def broad_func(node_count, am_partitions, inputs, rank, size, group, horizontal_
             #print(inputs_recv)
 
         #print('SpMM started at rank '+str(rank))
-        z_loc = torch.cuda.FloatTensor(am_partitions[0].size(0), inputs_recv.size(1), device=device).fill_(0)
+        z_loc = workspace.get((key, "z_loc"), (am_partitions[0].size(0), inputs_recv.size(1)), device,
+                                zero=True)
         # print('size of output '+ str(z_loc.size()))
-        tstart_comp = start_time(group, rank)
+        tstart_comp = prof.start()
 
         '''
         print(am_partitions[i].size(0))
@@ -343,26 +233,27 @@ def broad_func(node_count, am_partitions, inputs, rank, size, group, horizontal_
         #print('first SpMM was OK!')
         #print(z_loc)
         #exit()
-        dur = stop_time(group, rank, tstart_comp)
-        # print('SpMM time '+str(dur))
-        comp_time[run][rank] += dur
-        scomp_time[run][rank] += dur
+        prof.stop(tstart_comp, "comp_time", "scomp_time")
 
         if transpose:
-            tstart_comm = start_time(group, rank)
-            z_loc = transpose_input(node_count,z_loc,rank,size,1)
-            dur = stop_time(group, rank, tstart_comm)
-            comm_time[run][rank] += dur
-            bcast_comm_time[run][rank] += dur
+            tstart_comm = prof.start()
+            z_loc = transpose_input(node_count,z_loc,rank,size,1,key)
+            prof.stop(tstart_comm, "comm_time", "bcast_comm_time")
 
     return z_loc
 
+def activation_grad(func, h, grad_output):
+    # Derivative of the activation expressed through its output h = func(z), so z need not be kept
+    if func is F.log_softmax:
+        return grad_output - h.exp() * grad_output.sum(dim=1, keepdim=True)
+    elif func is F.relu:
+        return grad_output * (h > 0)
+    else:
+        return grad_output
+
 class GCNFunc(torch.autograd.Function):
     @staticmethod
-    def forward(ctx, inputs, weight, adj_matrix, am_partitions, rank, size, group, func):
-        global comm_time
-        global comp_time
-        global dcomp_time
+    def forward(ctx, inputs, weight, adj_matrix, am_partitions, rank, size, group, func, layer):
         global run
         #lobal x1
         global ht
@@ -372,37 +263,34 @@ class GCNFunc(torch.autograd.Function):
         # func: sigma
 
         # adj_matrix = adj_matrix.to_dense()
-        ctx.save_for_backward(inputs, weight, adj_matrix)
         ctx.am_partitions = am_partitions
         ctx.rank = rank
         ctx.size = size
         ctx.group = group
         ctx.abcd = 1
         ctx.func = func
+        ctx.layer = layer
         #1 = 0
         z = 0
         if ht:
             if rank == 0: print('forw horizontal '+str(rank))
-            tstart_comp = start_time(group, rank)
+            tstart_comp = prof.start()
             z = torch.mm(inputs, weight)
-            dur = stop_time(group, rank, tstart_comp)
-            comp_time[run][rank] += dur
-            dcomp_time[run][rank] += dur
-            z = broad_func(adj_matrix.size(0), am_partitions, z, rank, size, group, ht)
+            prof.stop(tstart_comp, "comp_time", "dcomp_time")
+            z = broad_func(adj_matrix.size(0), am_partitions, z, rank, size, group, ht, (layer, "fwd"))
 
         else:
             global x1
             if rank == 0: print('forw vertical '+str(rank))
             # z = block_row(adj_matrix.t(), am_partitions, inputs, weight, rank, size)
-            x1 = broad_func(adj_matrix.size(0), am_partitions, inputs, rank, size, group, ht)
-            tstart_comp = start_time(group, rank)
+            x1 = broad_func(adj_matrix.size(0), am_partitions, inputs, rank, size, group, ht, (layer, "fwd"))
+            tstart_comp = prof.start()
             z = torch.mm(x1, weight)
-            dur = stop_time(group, rank, tstart_comp)
-            comp_time[run][rank] += dur
-            dcomp_time[run][rank] += dur
+            prof.stop(tstart_comp, "comp_time", "dcomp_time")
 
-        z.requires_grad = True
-        ctx.z = z
+        if not recompute:
+            z.requires_grad = True
+            ctx.z = z
         #ht = not ht
 
         if activations:
@@ -412,31 +300,39 @@ class GCNFunc(torch.autograd.Function):
                 h = func(z)
             else:
                 h = z
+        else:
+            h = z
 
-            return h
+        # x1 is already redistributed and is reused by backward in both modes
+        if recompute:
+            # Keep the output instead of z: it is the next layer's input anyway
+            ctx.save_for_backward(inputs, weight, adj_matrix, h)
         else:
-            return z
+            ctx.save_for_backward(inputs, weight, adj_matrix)
+        return h
 
     @staticmethod
     def backward(ctx, grad_output):
-        global comm_time
-        global comp_time
-        global dcomp_time
         global run
         global ht
         global x1
 
         #if ctx.rank == 0: print('grad back '+str(grad_output))
-        inputs, weight, adj_matrix = ctx.saved_tensors
+        if recompute:
+            inputs, weight, adj_matrix, h = ctx.saved_tensors
+        else:
+            inputs, weight, adj_matrix = ctx.saved_tensors
         am_partitions = ctx.am_partitions
         rank = ctx.rank
         size = ctx.size
         group = ctx.group
 
         func = ctx.func
-        z = ctx.z
 
-        if activations:
+        if activations and recompute:
+            grad_output = activation_grad(func, h, grad_output)
+        elif activations:
+            z = ctx.z
             with torch.set_grad_enabled(True):
                 if func is F.log_softmax:
                     func_eval = func(z, dim=1)
@@ -453,35 +349,33 @@ class GCNFunc(torch.autograd.Function):
         grad_weight=None
         if ht:
             if rank == 0: print('hor back '+str(rank))
-            tstart_comp = start_time(group, rank)
+            tstart_comp = prof.start()
             x2 = torch.mm(grad_output, weight.t())
-            dur = stop_time(group, rank, tstart_comp)
-            comp_time[run][rank] += dur
-            dcomp_time[run][rank] += dur
-            grad_input = broad_func(adj_matrix.size(0), am_partitions, x2 , rank, size, group, ht)
+            prof.stop(tstart_comp, "comp_time", "dcomp_time")
+            grad_input = broad_func(adj_matrix.size(0), am_partitions, x2 , rank, size, group, ht,
+                                        (ctx.layer, "bwd"))
             # Second backprop equation (reuses the A * H^(l-1) computation)
-            grad_weight = outer_product2(x1.t(), grad_output, rank, size, group)
+            grad_weight = outer_product2(x1.t(), grad_output, rank, size, group, weight)
 
         else:
             if rank == 0: print('ver back '+str(rank))
-            ag = broad_func(adj_matrix.size(0), am_partitions, grad_output, rank, size, group, ht)
-            tstart_comp = start_time(group, rank)
+            ag = broad_func(adj_matrix.size(0), am_partitions, grad_output, rank, size, group, ht,
+                                (ctx.layer, "bwd"))
+            tstart_comp = prof.start()
             grad_input = torch.mm(ag, weight.t())
-            dur = stop_time(group, rank, tstart_comp)
-            comp_time[run][rank] += dur
-            dcomp_time[run][rank] += dur
+            prof.stop(tstart_comp, "comp_time", "dcomp_time")
             # Second backprop equation (reuses the A * G^l computation)
-            grad_weight = outer_product2(inputs.t(), ag, rank, size, group)
+            grad_weight = outer_product2(inputs.t(), ag, rank, size, group, weight)
 
         # print('grad input '+str(grad_input[0]) + ' rank ' + str(rank))
         # print('grad weight '+str(grad_weight[0]) + ' rank ' + str(rank))
-        return grad_input, grad_weight, None, None, None, None, None, None
+        return grad_input, grad_weight, None, None, None, None, None, None, None
 
 def train(inputs, weight1, weight2, adj_matrix, am_partitions, optimizer, data, rank, size, group, horizontal_tiled):
     global ht
     ht = horizontal_tiled
-    outputs = GCNFunc.apply(inputs, weight1, adj_matrix, am_partitions, rank, size, group, F.relu)
-    outputs = GCNFunc.apply(outputs, weight2, adj_matrix, am_partitions, rank, size, group, F.log_softmax)
+    outputs = GCNFunc.apply(inputs, weight1, adj_matrix, am_partitions, rank, size, group, F.relu, 0)
+    outputs = GCNFunc.apply(outputs, weight2, adj_matrix, am_partitions, rank, size, group, F.log_softmax, 1)
 
     #print(outputs)
     optimizer.zero_grad()
@@ -505,114 +399,15 @@ def train(inputs, weight1, weight2, adj_matrix, am_partitions, optimizer, data,
         # fake_loss = (outputs * torch.zeros(outputs.size())).sum()
         fake_loss.backward()
 
+    if grad_reducer is not None:
+        tstart_comm = prof.start()
+        grad_reducer.finish()
+        prof.stop(tstart_comm, "comm_time", "op2_comm_time")
+
     optimizer.step()
 
     return outputs
 
-def test(outputs, data, vertex_count, rank):
-    logits, accs = outputs, []
-    for _, mask in data('train_mask', 'val_mask', 'test_mask'):
-        pred = logits[mask.bool()].max(1)[1]
-        acc = pred.eq(data.y[mask.bool()]).sum().item() / mask.sum().item()
-        accs.append(acc)
-
-    if len(accs) == 1:
-        accs.append(0)
-        accs.append(0)
-
-    return accs
-    # logits, accs = outputs, []
-    # datay_rank = torch.split(data.y, vertex_count)[rank]
-    # for _, mask in data('train_mask', 'val_mask', 'test_mask'):
-    #     mask_rank = torch.split(mask, vertex_count)[rank]
-    #     count = mask_rank.nonzero().size(0)
-    #     if count > 0:
-    #         pred = logits[mask_rank].max(1)[1]
-    #         acc = pred.eq(datay_rank[mask_rank]).sum().item() / mask_rank.sum().item()
-    #         # pred = logits[mask].max(1)[1]
-    #         # acc = pred.eq(data.y[mask]).sum().item() / mask.sum().item()
-    #     else:
-    #         acc = -1
-    #     accs.append(acc)
-    # return accs
-
-
-# Split a COO into partitions of size n_per_proc
-# Basically torch.split but for Sparse Tensors since pytorch doesn't support that.
-def split_coo(adj_matrix, node_count, n_per_proc, dim):
-    vtx_indices = list(range(0, node_count, n_per_proc))
-    vtx_indices.append(node_count)
-
-    am_partitions = []
-    for i in range(len(vtx_indices) - 1):
-        am_part = adj_matrix[:,(adj_matrix[dim,:] >= vtx_indices[i]).nonzero().squeeze(1)]
-        am_part = am_part[:,(am_part[dim,:] < vtx_indices[i + 1]).nonzero().squeeze(1)]
-        am_part[dim] -= vtx_indices[i]
-        am_partitions.append(am_part)
-
-    return am_partitions, vtx_indices
-
-# Normalize all elements according to KW's normalization rule
-def scale_elements(adj_matrix, adj_part, node_count, row_vtx, col_vtx):
-    if not normalization:
-        return adj_part
-
-    # Scale each edge (u, v) by 1 / (sqrt(u) * sqrt(v))
-    # indices = adj_part._indices()
-    # values = adj_part._values()
-
-    # deg_map = dict()
-    # for i in range(adj_part._nnz()):
-    #     u = indices[0][i] + row_vtx
-    #     v = indices[1][i] + col_vtx
-
-    #     if u.item() in deg_map:
-    #         degu = deg_map[u.item()]
-    #     else:
-    #         degu = (adj_matrix[0] == u).sum().item()
-    #         deg_map[u.item()] = degu
-
-    #     if v.item() in deg_map:
-    #         degv = deg_map[v.item()]
-    #     else:
-    #         degv = (adj_matrix[0] == v).sum().item()
-    #         deg_map[v.item()] = degv
-
-    #     values[i] = values[i] / (math.sqrt(degu) * math.sqrt(degv))
-
-    adj_part = adj_part.coalesce()
-    deg = torch.histc(adj_matrix[0].double(), bins=node_count)
-    deg = deg.pow(-0.5)
-
-    row_len = adj_part.size(0)
-    col_len = adj_part.size(1)
-
-    dleft = torch.sparse_coo_tensor([np.arange(0, row_len).tolist(),
-                                     np.arange(0, row_len).tolist()],
-                                     deg[row_vtx:(row_vtx + row_len)].float(),
-                                     size=(row_len, row_len),
-                                     requires_grad=False, device=torch.device("cpu"))
-
-    dright = torch.sparse_coo_tensor([np.arange(0, col_len).tolist(),
-                                     np.arange(0, col_len).tolist()],
-                                     deg[col_vtx:(col_vtx + col_len)].float(),
-                                     size=(col_len, col_len),
-                                     requires_grad=False, device=torch.device("cpu"))
-    # adj_part = torch.sparse.mm(torch.sparse.mm(dleft, adj_part), dright)
-    ad_ind, ad_val = torch_sparse.spspmm(adj_part._indices(), adj_part._values(),
-                                            dright._indices(), dright._values(),
-                                            adj_part.size(0), adj_part.size(1), dright.size(1))
-
-    adj_part_ind, adj_part_val = torch_sparse.spspmm(dleft._indices(), dleft._values(),
-                                                        ad_ind, ad_val,
-                                                        dleft.size(0), dleft.size(1), adj_part.size(1))
-
-    adj_part = torch.sparse_coo_tensor(adj_part_ind, adj_part_val,
-                                                size=(adj_part.size(0), adj_part.size(1)),
-                                                requires_grad=False, device=torch.device("cpu"))
-
-    return adj_part
-
 def symmetric(adj_matrix):
     # print(adj_matrix)
     # not sure whether the following is needed
@@ -650,12 +445,15 @@ def oned_partition(rank, size, inputs, adj_matrix, data, features, classes, devi
     # Compute the adj_matrix and inputs partitions for this process
     # TODO: Maybe I do want grad here. Unsure.
     with torch.no_grad():
+        # Degrees are computed once for the whole graph, each block only gathers them
+        norm = norm_factors(adj_matrix, node_count, norm_type if normalization else "none")
+
         rankf = 0
-        # Column partitions
-        am_partitions, vtx_indices = split_coo(adj_matrix, node_count, n_per_proc, 1)
+        # Column partitions and the row blocks of this process' column in one bucket sort each
+        vtx_indices = vtx_boundaries(node_count, n_per_proc)
+        am_partitions, am_pbyp = split_coo_blocks(adj_matrix, vtx_indices, vtx_indices, rankf)
 
         proc_node_count = vtx_indices[rankf + 1] - vtx_indices[rankf]
-        am_pbyp, _ = split_coo(am_partitions[rankf], node_count, n_per_proc, 0)
         for i in range(len(am_pbyp)):
             if i == size - 1:
                 last_node_count = vtx_indices[i + 1] - vtx_indices[i]
@@ -663,15 +461,13 @@ def oned_partition(rank, size, inputs, adj_matrix, data, features, classes, devi
                                                         size=(last_node_count, proc_node_count),
                                                         requires_grad=False)
 
-                am_pbyp[i] = scale_elements(adj_matrix, am_pbyp[i], node_count, vtx_indices[i],
-                                                vtx_indices[rankf])
+                am_pbyp[i] = scale_elements(am_pbyp[i], norm, vtx_indices[i], vtx_indices[rankf])
             else:
                 am_pbyp[i] = torch.sparse_coo_tensor(am_pbyp[i], torch.ones(am_pbyp[i].size(1)),
                                                         size=(n_per_proc, proc_node_count),
                                                         requires_grad=False)
 
-                am_pbyp[i] = scale_elements(adj_matrix, am_pbyp[i], node_count, vtx_indices[i],
-                                                vtx_indices[rankf])
+                am_pbyp[i] = scale_elements(am_pbyp[i], norm, vtx_indices[i], vtx_indices[rankf])
 
         for i in range(len(am_partitions)):
             proc_node_count = vtx_indices[i + 1] - vtx_indices[i]
@@ -679,7 +475,7 @@ def oned_partition(rank, size, inputs, adj_matrix, data, features, classes, devi
                                                     torch.ones(am_partitions[i].size(1)),
                                                     size=(node_count, proc_node_count),
                                                     requires_grad=False)
-            am_partitions[i] = scale_elements(adj_matrix, am_partitions[i], node_count,  0, vtx_indices[i])
+            am_partitions[i] = scale_elements(am_partitions[i], norm, 0, vtx_indices[i])
 
         print(inputs.size(0))
         print(inputs.size(1))
@@ -707,9 +503,10 @@ def oned_partition(rank, size, inputs, adj_matrix, data, features, classes, devi
 
 def run(rank, size, inputs, adj_matrix, data, features, classes, device):
     global epochs
+    global row_count
+    global col_count
     global mid_layer
     global run
-    global timing
 
     best_val_acc = test_acc = 0
     outputs = None
@@ -723,14 +520,23 @@ def run(rank, size, inputs, adj_matrix, data, features, classes, device):
 
     # adj_matrix = symmetric(adj_matrix)
 
-    inputs_loc, adj_matrix_loc, am_pbyp, horizontal_tiled = oned_partition(rank, size, inputs, adj_matrix, data,
-                                                                features, classes, device)
+    # row_count/col_count are set as a side effect of oned_partition, so they are cached alongside
+    def partition():
+        return oned_partition(rank, size, inputs, adj_matrix, data, features, classes, device) + \
+                    (row_count, col_count)
+
+    inputs_loc, adj_matrix_loc, am_pbyp, horizontal_tiled, row_count, col_count = \
+            cached_partition(partition_cache, graphname, "rdm", rank, size, adj_matrix, inputs,
+                                partition, norm_type if normalization else "none")
 
     inputs_loc = inputs_loc.to(device)
     adj_matrix_loc = adj_matrix_loc.to(device)
     for i in range(len(am_pbyp)):
         am_pbyp[i] = am_pbyp[i].t().coalesce().to(device)
 
+    global comm
+    comm = CommPrecision(comm_dtype, comm_scale, workspace)
+
     for i in range(run_count):
         run = i
         torch.manual_seed(0)
@@ -746,39 +552,27 @@ def run(rank, size, inputs, adj_matrix, data, features, classes, device):
         weight2 = Parameter(weight2_nonleaf)
 
         optimizer = torch.optim.Adam([weight1, weight2], lr=0.01)
+
+        global grad_reducer
+        if async_grad:
+            grad_reducer = GradReducer([weight1, weight2], group, grad_bucket_mb, comm, workspace)
         dist.barrier(group)
 
         tstart = 0.0
         tstop = 0.0
 
         total_time[i] = dict()
-        comm_time[i] = dict()
-        comp_time[i] = dict()
-        scomp_time[i] = dict()
-        dcomp_time[i] = dict()
-        bcast_comm_time[i] = dict()
-        barrier_time[i] = dict()
-        barrier_subset_time[i] = dict()
-        op1_comm_time[i] = dict()
-        op2_comm_time[i] = dict()
-
         total_time[i][rank] = 0.0
-        comm_time[i][rank] = 0.0
-        comp_time[i][rank] = 0.0
-        scomp_time[i][rank] = 0.0
-        dcomp_time[i][rank] = 0.0
-        bcast_comm_time[i][rank] = 0.0
-        barrier_time[i][rank] = 0.0
-        barrier_subset_time[i][rank] = 0.0
-        op1_comm_time[i][rank] = 0.0
-        op2_comm_time[i][rank] = 0.0
-
-        timing_on = timing == True
-        timing = False
+        torch.cuda.reset_peak_memory_stats(device)
+
+        global prof
+        prof = Profiler(rank, device, enabled=False, trace=bool(profile_dir),
+                            sync_group=group if timing_sync else None)
+
+        # Warm-up epoch, not profiled
         outputs = train(inputs_loc, weight1, weight2, adj_matrix_loc, am_pbyp, optimizer, data,
                                 rank, size, group, horizontal_tiled)
-        if timing_on:
-            timing = True
+        prof.enabled = timing
 
         dist.barrier(group)
         tstart = time.time()
@@ -796,26 +590,8 @@ def run(rank, size, inputs, adj_matrix, data, features, classes, device):
             print("Epoch: {:03d}".format(epoch), flush=True)
             cumulative_time += time.time()-ep_s
             if len(args.acc_csv)>2:
-                # All-gather outputs to test accuracy
-                output_parts = []
-                n_per_proc = math.ceil(float(inputs.size(0)) / size)
-                # print(f"rows: {am_pbyp[-1].size(0)} cols: {classes}", flush=True)
-                for i in range(size):
-                    output_parts.append(torch.cuda.FloatTensor(n_per_proc, classes, device=device).fill_(0))
-
-                if outputs.size(0) != n_per_proc:
-                    pad_row = n_per_proc - outputs.size(0)
-                    outputs = torch.cat((outputs, torch.cuda.FloatTensor(pad_row, classes, device=device)), dim=0)
-
-                dist.all_gather(output_parts, outputs)
-                output_parts[rank] = outputs
-
-                padding = inputs.size(0) - n_per_proc * (size - 1)
-                output_parts[size - 1] = output_parts[size - 1][:padding,:]
-
-                outputs = torch.cat(output_parts, dim=0)
-
-                train_acc, val_acc, tmp_test_acc = test(outputs, data, am_pbyp[0].size(1), rank)
+                # Each rank counts its own rows, only the counts are all-reduced
+                train_acc, val_acc, tmp_test_acc = distributed_accuracy(outputs, data, sum(row_count[:rank]), group)
                 if val_acc > best_val_acc:
                     best_val_acc = val_acc
                     test_acc = tmp_test_acc
@@ -831,6 +607,12 @@ def run(rank, size, inputs, adj_matrix, data, features, classes, device):
         # dist.barrier(group)
         tstop = time.time()
         total_time[i][rank] = tstop - tstart
+        peak_memory[i] = torch.cuda.max_memory_allocated(device)
+
+        run_stats[run] = prof.summary()
+        if profile_dir:
+            prof.write_json(osp.join(profile_dir, f"run{run}", f"rank{rank}.json"))
+            prof.write_trace(osp.join(profile_dir, f"run{run}", f"rank{rank}.trace.json"))
 
     # Get median runtime according to rank0 and print that run's breakdown
     dist.barrier(group)
@@ -850,15 +632,19 @@ def run(rank, size, inputs, adj_matrix, data, features, classes, device):
     median_idx = median_idx.item()
     print(f"rank: {rank} median_run: {median_idx}")
     print(f"rank: {rank} total_time: {total_time[median_idx][rank]}")
-    print(f"rank: {rank} comm_time: {comm_time[median_idx][rank]}")
-    print(f"rank: {rank} comp_time: {comp_time[median_idx][rank]}")
-    print(f"rank: {rank} scomp_time: {scomp_time[median_idx][rank]}")
-    print(f"rank: {rank} dcomp_time: {dcomp_time[median_idx][rank]}")
-    print(f"rank: {rank} bcast_comm_time: {bcast_comm_time[median_idx][rank]}")
-    print(f"rank: {rank} barrier_time: {barrier_time[median_idx][rank]}")
-    print(f"rank: {rank} barrier_subset_time: {barrier_subset_time[median_idx][rank]}")
-    print(f"rank: {rank} op1_comm_time: {op1_comm_time[median_idx][rank]}")
-    print(f"rank: {rank} op2_comm_time: {op2_comm_time[median_idx][rank]}")
+    print(f"rank: {rank} peak_memory_bytes: {peak_memory[median_idx]} recompute: {recompute}")
+    print(f"rank: {rank} comm_precision: {comm}")
+    print(f"rank: {rank} async_grad: {async_grad} grad_bucket_mb: {grad_bucket_mb}")
+    totals = run_stats[median_idx]["totals"]
+    for name in ["comm_time", "comp_time", "scomp_time", "dcomp_time", "bcast_comm_time",
+                    "op1_comm_time", "op2_comm_time"]:
+        print(f"rank: {rank} {name}: {totals.get(name, 0.0)}")
+    workspace.report(rank)
+
+    # Cross-rank min/mean/max of the median run, one collective for the whole breakdown
+    _, stats = aggregate(run_stats[median_idx], group)
+    if rank == 0:
+        print_stats(stats)
     print(f"rank: {rank} {outputs}")
 
     if len(args.csv)>1 and rank==0:
@@ -873,26 +659,8 @@ def run(rank, size, inputs, adj_matrix, data, features, classes, device):
 
 
     if accuracy:
-        # All-gather outputs to test accuracy
-        output_parts = []
-        n_per_proc = math.ceil(float(inputs.size(0)) / size)
-        # print(f"rows: {am_pbyp[-1].size(0)} cols: {classes}", flush=True)
-        for i in range(size):
-            output_parts.append(torch.cuda.FloatTensor(n_per_proc, classes, device=device).fill_(0))
-
-        if outputs.size(0) != n_per_proc:
-            pad_row = n_per_proc - outputs.size(0)
-            outputs = torch.cat((outputs, torch.cuda.FloatTensor(pad_row, classes, device=device)), dim=0)
-
-        dist.all_gather(output_parts, outputs)
-        output_parts[rank] = outputs
-
-        padding = inputs.size(0) - n_per_proc * (size - 1)
-        output_parts[size - 1] = output_parts[size - 1][:padding,:]
-
-        outputs = torch.cat(output_parts, dim=0)
-
-        train_acc, val_acc, tmp_test_acc = test(outputs, data, am_pbyp[0].size(1), rank)
+        # Each rank counts its own rows, only the counts are all-reduced
+        train_acc, val_acc, tmp_test_acc = distributed_accuracy(outputs, data, sum(row_count[:rank]), group)
         if val_acc > best_val_acc:
             best_val_acc = val_acc
             test_acc = tmp_test_acc
@@ -1096,11 +864,20 @@ if __name__ == '__main__':
     parser.add_argument("--midlayer", type=int)
     parser.add_argument("--runcount", type=int)
     parser.add_argument("--normalization", type=str)
+    parser.add_argument("--normtype", type=str, default="sym")
+    parser.add_argument("--partcache", type=str, default="")
     parser.add_argument("--activations", type=str)
     parser.add_argument("--accuracy", type=str)
     parser.add_argument("--download", type=bool)
     parser.add_argument("--csv", type=str, default='')
     parser.add_argument("--acc_csv", type=str, default='')
+    parser.add_argument("--recompute", type=str, default="False")
+    parser.add_argument("--timingsync", type=str, default="False")
+    parser.add_argument("--profiledir", type=str, default="")
+    parser.add_argument("--commdtype", type=str, default="fp32")
+    parser.add_argument("--commscale", type=str, default="False")
+    parser.add_argument("--asyncgrad", type=str, default="False")
+    parser.add_argument("--gradbucket", type=float, default=25.0)
 
     args = parser.parse_args()
     print(args)
@@ -1113,9 +890,18 @@ if __name__ == '__main__':
     mid_layer = args.midlayer
     run_count = args.runcount
     normalization = args.normalization == "True"
+    norm_type = args.normtype
+    partition_cache = args.partcache
     activations = args.activations == "True"
     accuracy = args.accuracy == "True"
     download = args.download
+    recompute = args.recompute == "True"
+    timing_sync = args.timingsync == "True"
+    profile_dir = args.profiledir
+    comm_dtype = args.commdtype
+    comm_scale = args.commscale == "True"
+    async_grad = args.asyncgrad == "True"
+    grad_bucket_mb = args.gradbucket
 
     if not download:
         if (epochs is None) or (graphname is None) or (timing is None) or (mid_layer is None) or (run_count is None):
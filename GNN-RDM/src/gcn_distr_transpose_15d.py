@@ -26,6 +26,7 @@ from torch_scatter import scatter_add
 import torch_sparse
 
 from sparse_coo_tensor_cpp import sparse_coo_tensor_gpu, spmm_gpu
+from profiler import Profiler, aggregate, print_stats
 
 import socket
 import statistics
@@ -50,29 +51,18 @@ def gcn_norm(edge_index, edge_weight=None, num_nodes=None, improved=False,
     deg_inv_sqrt.masked_fill_(deg_inv_sqrt == float('inf'), 0)
     #print('normalized adj val:', deg_inv_sqrt[row] * edge_weight * deg_inv_sqrt[col])
     return edge_index, deg_inv_sqrt[row] * edge_weight * deg_inv_sqrt[col]
-# comp_time = 0.0
-# comm_time = 0.0
-# scomp_time = 0.0
-# dcomp_time = 0.0
-# bcast_comm_time = 0.0
-# bcast_words = 0
-# op1_comm_time = 0.0
-# op2_comm_time = 0.0
 total_time = dict()
-comp_time = dict()
-comm_time = dict()
-scomp_time = dict()
-dcomp_time = dict()
-bcast_comm_time = dict()
-barrier_time = dict()
-barrier_subset_time = dict()
-op1_comm_time = dict()
-op2_comm_time = dict()
+# Timers of the current run (comm_time, bcast_comm_time, ...), replaced in run();
+# per-run summaries are kept in run_stats for the median-run breakdown
+prof = Profiler(enabled=False)
+run_stats = dict()
 
 epochs = 0
 graphname = ""
 mid_layer = 0
 timing = True
+timing_sync = False
+profile_dir = ""
 normalization = False
 activations = False
 accuracy = False
@@ -84,37 +74,6 @@ download = False
 ht = True
 mmorder = "dsds"
 
-def start_time(group, rank, subset=False, src=None):
-    global barrier_time
-    global barrier_subset_time
-
-    if not timing:
-        return 0.0
-
-    barrier_tstart = time.time()
-
-    dist.barrier(group)
-    barrier_tstop = time.time()
-    barrier_time[run][rank] += barrier_tstop - barrier_tstart
-    #if rank == 0:        print(f'barrier_time {barrier_tstop - barrier_tstart:0.6f}')
-    if subset:
-        barrier_subset_time[run][rank] += barrier_tstop - barrier_tstart
-
-    tstart = 0.0
-    tstart = time.time()
-    return tstart
-
-def stop_time(group, rank, tstart):
-    if not timing:
-        return 0.0
-    dist.barrier(group)
-    devid = rank_to_devid(rank, acc_per_rank)
-    device = torch.device('cuda:{}'.format(devid))
-    # torch.cuda.synchronize(device=device)
-
-    tstop = time.time()
-    return tstop - tstart
-
 def normalize(adj_matrix):
     adj_matrix = adj_matrix + torch.eye(adj_matrix.size(0))
     d = torch.sum(adj_matrix, dim=1)
@@ -163,32 +122,24 @@ def block_row(adj_matrix, am_partitions, inputs, weight, rank, size):
     return z_loc
 
 def outer_product(adj_matrix, grad_output, rank, size, group):
-    global comm_time
-    global comp_time
-    global dcomp_time
-    global op1_comm_time
     global run
 
 
     n_per_proc = math.ceil(float(adj_matrix.size(0)) / size)
 
-    tstart_comp = start_time(group, rank)
+    tstart_comp = prof.start()
 
     # A * G^l
     ag = torch.mm(adj_matrix, grad_output)
 
-    dur = stop_time(group, rank, tstart_comp)
-    comp_time[run][rank] += dur
-    dcomp_time[run][rank] += dur
+    prof.stop(tstart_comp, "comp_time", "dcomp_time")
 
-    tstart_comm = start_time(group, rank)
+    tstart_comm = prof.start()
 
     # reduction on A * G^l low-rank matrices
     dist.all_reduce(ag, op=dist.ReduceOp.SUM, group=group)
 
-    dur = stop_time(group, rank, tstart_comm)
-    comm_time[run][rank] += dur
-    op1_comm_time[run][rank] += dur
+    prof.stop(tstart_comm, "comm_time", "op1_comm_time")
 
     # partition A * G^l by block rows and get block row for this process
     # TODO: this might not be space-efficient
@@ -198,39 +149,27 @@ def outer_product(adj_matrix, grad_output, rank, size, group):
     return grad_input
 
 def outer_product2(inputs, ag, rank, size, group):
-    global comm_time
-    global comp_time
-    global dcomp_time
-    global op2_comm_time
     global run
 
     #if rank == 0 : print('weight_compute ',end='')
-    tstart_comp = start_time(group, rank)
+    tstart_comp = prof.start()
     # (H^(l-1))^T * (A * G^l)
     grad_weight = torch.mm(inputs, ag)
 
-    dur = stop_time(group, rank, tstart_comp)
-    comp_time[run][rank] += dur
-    dcomp_time[run][rank] += dur
+    prof.stop(tstart_comp, "comp_time", "dcomp_time")
 
     #if rank == 0 : print('weight_reduce ',end='')
-    tstart_comm = start_time(group, rank)
+    tstart_comm = prof.start()
     # reduction on grad_weight low-rank matrices
     dist.all_reduce(grad_weight, op=dist.ReduceOp.SUM, group=group)
 
-    dur = stop_time(group, rank, tstart_comm)
-    comm_time[run][rank] += dur
-    op2_comm_time[run][rank] += dur
+    prof.stop(tstart_comm, "comm_time", "op2_comm_time")
 
     return grad_weight
 
 def transpose_input(inputs,rank,size,row_group,group,dim):
     #print('in transpose '+str(rank)+' at dim '+str(dim))
     global device
-    global comm_time
-    global comp_time
-    global scomp_time
-    global bcast_comm_time
     global run
     global ht
     global replication
@@ -272,7 +211,7 @@ def transpose_input(inputs,rank,size,row_group,group,dim):
                 exit()
 
     #print('\ndim is '+str(dim))
-    tstart_comm = start_time(group, rank)
+    tstart_comm = prof.start()
     for i in range(col_count):
         p_i = i^rank
         il = p_i & rank_mask
@@ -305,18 +244,12 @@ def transpose_input(inputs,rank,size,row_group,group,dim):
     #print('row_group '+str(row_group))
 
     inputs = torch.cat(recv,dim)
-    dur = stop_time(group, rank, tstart_comm)
-    comm_time[run][rank] += dur
-    bcast_comm_time[run][rank] += dur
+    prof.stop(tstart_comm, "comm_time", "bcast_comm_time")
     return inputs
 
 
 def spmm_func(am_partitions, inputs, rank, size, group, row_group, col_group, horizontal_tiled):
     global device
-    global comm_time
-    global comp_time
-    global scomp_time
-    global bcast_comm_time
     global run
     global replication
 
@@ -350,22 +283,18 @@ def spmm_func(am_partitions, inputs, rank, size, group, row_group, col_group, ho
             # could cause cuda oom
             inputs_recv = torch.cuda.FloatTensor(row_recv, inputs_.size(1), device=device).fill_(0)
         #if rank == 0: print('spmm_bcast ',end='')
-        tstart_comm = start_time(group, rank)
+        tstart_comm = prof.start()
         dist.broadcast(inputs_recv, src=tile_id, group=col_group)
-        dur = stop_time(group, rank, tstart_comm)
-        comm_time[run][rank] += dur
-        bcast_comm_time[run][rank] += dur
+        prof.stop(tstart_comm, "comm_time", "bcast_comm_time")
         #if rank == 0: print('spmm_compute ',end='')
-        tstart_comp = start_time(group, rank)
+        tstart_comp = prof.start()
         #print('SpMM input '+str(inputs_recv.size())+" output "+str(z_loc.size()) + ' at rank '+str(rank))
         #print(am_partitions[i].size())
         spmm_gpu(am_partitions[i].indices()[0].int(), am_partitions[i].indices()[1].int(),
                             am_partitions[i].values(), am_partitions[i].size(0),
                             am_partitions[i].size(1), inputs_recv, z_loc)
 
-        dur = stop_time(group, rank, tstart_comp)
-        comp_time[run][rank] += dur
-        scomp_time[run][rank] += dur
+        prof.stop(tstart_comp, "comp_time", "scomp_time")
 
     #dist.barrier(col_group)
     return z_loc
@@ -373,10 +302,6 @@ def spmm_func(am_partitions, inputs, rank, size, group, row_group, col_group, ho
 
 def gemm_func(inputs, weight, rank, size, group, row_group, col_group, horizontal_tiled):
     global device
-    global comm_time
-    global comp_time
-    global scomp_time
-    global bcast_comm_time
     global run
 
     #dist.barrier(row_group)
@@ -391,12 +316,10 @@ def gemm_func(inputs, weight, rank, size, group, row_group, col_group, horizonta
         inputs_recv = transpose_input(inputs,rank,size,row_group,1)
 
     #if rank == 0:    print('3->',end='')
-    tstart_comp = start_time(group, rank)
+    tstart_comp = prof.start()
     #if rank == 0:    print('4->',end='')
     z = torch.mm(inputs_recv, weight)
-    dur = stop_time(group, rank, tstart_comp)
-    comp_time[run][rank] += dur
-    dcomp_time[run][rank] += dur
+    prof.stop(tstart_comp, "comp_time", "dcomp_time")
     #if rank == 0:        print('5->',end='')
     dist.barrier(group)
     #dist.barrier(row_group)
@@ -434,9 +357,6 @@ def dist_log_softmax(z, rank, size, group):
 class GCNFunc(torch.autograd.Function):
     @staticmethod
     def forward(ctx, inputs, weight, adj_matrix, am_partitions, rank, size, group, row_groups, col_groups, order, last_layer, func):
-        global comm_time
-        global comp_time
-        global dcomp_time
         global run
         global ht
         global replication
@@ -526,9 +446,6 @@ class GCNFunc(torch.autograd.Function):
 
     @staticmethod
     def backward(ctx, grad_output):
-        global comm_time
-        global comp_time
-        global dcomp_time
         global run
         global ht
         global x1
@@ -1017,7 +934,6 @@ def run(rank, size, inputs, adj_matrix, data, features, classes, device):
     global epochs
     global mid_layer
     global run
-    global timing
     global ht
 
     best_val_acc = test_acc = 0
@@ -1071,29 +987,14 @@ def run(rank, size, inputs, adj_matrix, data, features, classes, device):
         tstop = 0.0
 
         total_time[i] = dict()
-        comm_time[i] = dict()
-        comp_time[i] = dict()
-        scomp_time[i] = dict()
-        dcomp_time[i] = dict()
-        bcast_comm_time[i] = dict()
-        barrier_time[i] = dict()
-        barrier_subset_time[i] = dict()
-        op1_comm_time[i] = dict()
-        op2_comm_time[i] = dict()
 
         total_time[i][rank] = 0.0
-        comm_time[i][rank] = 0.0
-        comp_time[i][rank] = 0.0
-        scomp_time[i][rank] = 0.0
-        dcomp_time[i][rank] = 0.0
-        bcast_comm_time[i][rank] = 0.0
-        barrier_time[i][rank] = 0.0
-        barrier_subset_time[i][rank] = 0.0
-        op1_comm_time[i][rank] = 0.0
-        op2_comm_time[i][rank] = 0.0
-
-        timing_on = timing == True
-        timing = False
+
+        global prof
+        prof = Profiler(rank, device, enabled=False, trace=bool(profile_dir),
+                            sync_group=group if timing_sync else None)
+
+        # Warm-up epoch, not profiled
 
         candidate_order = [mmorder]
         #candidate_order = find_candidates(features,mid_layer,classes,2)
@@ -1112,8 +1013,7 @@ def run(rank, size, inputs, adj_matrix, data, features, classes, device):
         order_time += [ep_time]
         best_mmorder = -1
 
-        if timing_on:
-            timing = True
+        prof.enabled = timing
 
         dist.barrier(group)
         tstart = time.time()
@@ -1177,6 +1077,11 @@ def run(rank, size, inputs, adj_matrix, data, features, classes, device):
         tstop = time.time()
         total_time[i][rank] = tstop - tstart + ep_time
 
+        run_stats[run] = prof.summary()
+        if profile_dir:
+            prof.write_json(osp.join(profile_dir, f"run{run}", f"rank{rank}.json"))
+            prof.write_trace(osp.join(profile_dir, f"run{run}", f"rank{rank}.trace.json"))
+
     # Get median runtime according to rank0 and print that run's breakdown
     dist.barrier(group)
     if rank == 0:
@@ -1193,29 +1098,26 @@ def run(rank, size, inputs, adj_matrix, data, features, classes, device):
 
     dist.broadcast(median_idx, src=0, group=group)
     median_idx = median_idx.item()
+    # Cross-rank min/mean/max of the median run, one collective for the whole breakdown
+    _, run_agg = aggregate(run_stats[median_idx], group)
     if rank == 0:
         print(f"rank: {rank} median_run: {median_idx}")
         print(f"rank: {rank} total_time: {total_time[median_idx][rank]}")
-        print(f"rank: {rank} comm_time: {comm_time[median_idx][rank]}")
-        print(f"rank: {rank} comp_time: {comp_time[median_idx][rank]}")
-        print(f"rank: {rank} scomp_time: {scomp_time[median_idx][rank]}")
-        print(f"rank: {rank} dcomp_time: {dcomp_time[median_idx][rank]}")
-        print(f"rank: {rank} bcast_comm_time: {bcast_comm_time[median_idx][rank]}")
-        print(f"rank: {rank} barrier_time: {barrier_time[median_idx][rank]}")
-        print(f"rank: {rank} barrier_subset_time: {barrier_subset_time[median_idx][rank]}")
-        print(f"rank: {rank} op1_comm_time: {op1_comm_time[median_idx][rank]}")
-        print(f"rank: {rank} op2_comm_time: {op2_comm_time[median_idx][rank]}")
+        totals = run_stats[median_idx]["totals"]
+        for name in ["comm_time", "comp_time", "scomp_time", "dcomp_time", "bcast_comm_time", "op1_comm_time", "op2_comm_time"]:
+            print(f"rank: {rank} {name}: {totals.get(name, 0.0)}")
+        print_stats(run_agg)
         print(f"rank: {rank} {outputs}")
         # total,comm,comp,scomp,dcomp,bcast,reduce,opcomm,barrier
         total = total_time[median_idx][rank] / 10
-        comm = comm_time[median_idx][rank]/10
-        comp = comp_time[median_idx][rank]/10
-        scomp = scomp_time[median_idx][rank]/10
-        dcomp = dcomp_time[median_idx][rank]/10
-        bcast = bcast_comm_time[median_idx][rank]/10
+        comm = totals.get("comm_time", 0.0)/10
+        comp = totals.get("comp_time", 0.0)/10
+        scomp = totals.get("scomp_time", 0.0)/10
+        dcomp = totals.get("dcomp_time", 0.0)/10
+        bcast = totals.get("bcast_comm_time", 0.0)/10
         red = -1#reduce_comm_time[median_idx][rank]/10
         opcomm = -1# op_comm_time[median_idx][rank]/10
-        bar = barrier_time[median_idx][rank]/10
+        bar = -1# barriers are no longer timed separately
         ws = os.environ['WORLD_SIZE']
         stats = f'RDM,{graphname},{mmorder},{mid_layer},{ws},{1.0/total},{total},{comm},{comp},{scomp},{dcomp},{bcast},{red},{opcomm},{bar}\n'
         #with open('stats_3.csv','a') as f:
@@ -1527,6 +1429,8 @@ if __name__ == '__main__':
     parser.add_argument("--stats", type=str)
 
 
+    parser.add_argument("--timingsync", type=str, default="False")
+    parser.add_argument("--profiledir", type=str, default="")
     args = parser.parse_args()
     print(args)
 
@@ -1535,6 +1439,8 @@ if __name__ == '__main__':
     epochs = args.epochs
     graphname = args.graphname
     timing = args.timing == "True"
+    timing_sync = args.timingsync == "True"
+    profile_dir = args.profiledir
     mid_layer = args.midlayer
     run_count = args.runcount
     normalization = args.normalization == "True"
@@ -26,36 +26,35 @@ from torch_scatter import scatter_add
 import torch_sparse
 
 from sparse_coo_tensor_cpp import sparse_coo_tensor_gpu, spmm_gpu
+from partition_utils import vtx_boundaries, split_coo_blocks, norm_factors, scale_elements
+from partition_cache import cached_partition
+from workspace import Workspace
+from redistribute import alltoall_transpose
+from mmorder_plan import rank_orders, plan_key, load_plan, save_plan
+from profiler import Profiler, aggregate, print_stats
 
 import socket
 import statistics
 import time
 import numpy as np
 
-# comp_time = 0.0
-# comm_time = 0.0
-# scomp_time = 0.0
-# dcomp_time = 0.0
-# bcast_comm_time = 0.0
-# bcast_words = 0
-# op1_comm_time = 0.0
-# op2_comm_time = 0.0
 total_time = dict()
-comp_time = dict()
-comm_time = dict()
-scomp_time = dict()
-dcomp_time = dict()
-bcast_comm_time = dict()
-barrier_time = dict()
-barrier_subset_time = dict()
-op1_comm_time = dict()
-op2_comm_time = dict()
+# Timers of the current run (comm_time, bcast_comm_time, ...), replaced in run(); disabled
+# outside of it, so the --mmorder auto calibration steps book nothing. Per-run summaries
+# are kept in run_stats for the median-run breakdown
+prof = Profiler(enabled=False)
+run_stats = dict()
+
+# Staging buffers for transpose_input, reused across layers and epochs
+workspace = Workspace()
 
 epochs = 0
 graphname = ""
 mid_layer = 0
 timing = True
 normalization = False
+norm_type = "sym"
+partition_cache = ""
 activations = False
 accuracy = False
 device = None
@@ -65,36 +64,11 @@ run = 0
 download = False
 ht = True
 mmorder = "dsds"
-
-def start_time(group, rank, subset=False, src=None):
-    global barrier_time
-    global barrier_subset_time
-
-    if not timing:
-        return 0.0
-    
-    barrier_tstart = time.time()
-
-    dist.barrier(group)
-    barrier_tstop = time.time()
-    barrier_time[run][rank] += barrier_tstop - barrier_tstart
-    if subset:
-        barrier_subset_time[run][rank] += barrier_tstop - barrier_tstart
-
-    tstart = 0.0
-    tstart = time.time()
-    return tstart
-
-def stop_time(group, rank, tstart):
-    if not timing:
-        return 0.0
-    dist.barrier(group)
-    devid = rank_to_devid(rank, acc_per_rank)
-    device = torch.device('cuda:{}'.format(devid))
-    # torch.cuda.synchronize(device=device)
-
-    tstop = time.time()
-    return tstop - tstart
+# --mmorder auto: training steps timed per candidate (0 = cost model only) and the plan cache file
+mmorder_calibrate = 0
+mmplan_path = ""
+timing_sync = False
+profile_dir = ""
 
 def normalize(adj_matrix):
     adj_matrix = adj_matrix + torch.eye(adj_matrix.size(0))
@@ -144,32 +118,24 @@ def block_row(adj_matrix, am_partitions, inputs, weight, rank, size):
     return z_loc
 
 def outer_product(adj_matrix, grad_output, rank, size, group):
-    global comm_time
-    global comp_time
-    global dcomp_time
-    global op1_comm_time
     global run
 
 
     n_per_proc = math.ceil(float(adj_matrix.size(0)) / size)
     
-    tstart_comp = start_time(group, rank)
+    tstart_comp = prof.start()
 
     # A * G^l
     ag = torch.mm(adj_matrix, grad_output)
 
-    dur = stop_time(group, rank, tstart_comp)
-    comp_time[run][rank] += dur
-    dcomp_time[run][rank] += dur
+    prof.stop(tstart_comp, "comp_time", "dcomp_time")
 
-    tstart_comm = start_time(group, rank)
+    tstart_comm = prof.start()
 
     # reduction on A * G^l low-rank matrices
     dist.all_reduce(ag, op=dist.reduce_op.SUM, group=group)
 
-    dur = stop_time(group, rank, tstart_comm)
-    comm_time[run][rank] += dur
-    op1_comm_time[run][rank] += dur
+    prof.stop(tstart_comm, "comm_time", "op1_comm_time")
 
     # partition A * G^l by block rows and get block row for this process
     # TODO: this might not be space-efficient
@@ -179,166 +145,68 @@ def outer_product(adj_matrix, grad_output, rank, size, group):
     return grad_input
 
 def outer_product2(inputs, ag, rank, size, group):
-    global comm_time
-    global comp_time
-    global dcomp_time
-    global op2_comm_time
     global run
 
-    tstart_comp = start_time(group, rank)
+    tstart_comp = prof.start()
     # (H^(l-1))^T * (A * G^l)
     grad_weight = torch.mm(inputs, ag)
 
-    dur = stop_time(group, rank, tstart_comp)
-    comp_time[run][rank] += dur
-    dcomp_time[run][rank] += dur
+    prof.stop(tstart_comp, "comp_time", "dcomp_time")
     
-    tstart_comm = start_time(group, rank)
+    tstart_comm = prof.start()
     # reduction on grad_weight low-rank matrices
     dist.all_reduce(grad_weight, op=dist.reduce_op.SUM, group=group)
 
-    dur = stop_time(group, rank, tstart_comm)
-    comm_time[run][rank] += dur
-    op2_comm_time[run][rank] += dur
+    prof.stop(tstart_comm, "comm_time", "op2_comm_time")
 
     return grad_weight
 
 def transpose_input(inputs,rank,size,dim):
-    #print('in transpose '+str(rank)+' at dim '+str(dim))
-    global device
-    global comm_time
-    global comp_time
-    global scomp_time
-    global bcast_comm_time
-    global run
     global ht
 
     ht = not ht
-    if dim == 0:
-        #horizontal_tiled = False
-        # Horizontal to Vertical
-        input_2d = torch.split(inputs, math.ceil(float(inputs.size(1-dim)) / size), dim=1-dim)
-        #if len(col_count) == 0:  for i in input_2d:    col_count += [input_2d[rank].size(1)]
-        recv = [0]*size
-        for i in range(size):
-            col_count[i] = input_2d[i].size(1)
-        for ii in range(size):
-            i = ii^rank
-            if i == rank:
-                recv[i] = input_2d[rank]
-                continue
-            '''
-            print('inside h2v transpose')
-            print(size)
-            print(i)
-            print(rank)
-            print(inputs.size())
-            '''
-            input_recv = torch.zeros(row_count[i], col_count[rank], device=device)
-         
-            #print('buffer size '+str(input_recv.size()))
-            if i < rank :
-                dist.send(tensor=input_2d[i].contiguous(), dst=i)
-                dist.recv(tensor=input_recv, src=i)
-            else:
-                dist.recv(tensor=input_recv, src=i)
-                dist.send(tensor=input_2d[i].contiguous(), dst=i)
-            
-            recv[i] = input_recv
-        inputs = torch.cat(recv,0)
-        #print('size after transpose')
-        #print(inputs.size())
-        #print('after tp ht: '+str(horizontal_tiled)+' in rank '+str(rank))
-        return inputs
-    elif dim == 1:
-        # Vertical to Horizontal
-        #horizontal_tiled = True
-        # print('Transpose '+str(inputs.size()))
-        # print(row_count)
-        input_2d = torch.split(inputs, math.ceil(float(inputs.size(1-dim)) / size), dim=1-dim)
-        recv = [0]*size
-        for ii in range(size):
-            i = ii ^ rank
-            if i == rank:
-                recv[i] = input_2d[rank]
-                continue
-            '''
-            print('inside v2h transpose')
-            print(size)
-            print(i)
-            print(rank)
-            print(inputs.size())
-            '''
-            input_recv = torch.zeros(row_count[rank], col_count[i], device=device)
-            #print('buffer size '+str(input_recv.size()))
-            if i < rank :
-                dist.send(tensor=input_2d[i].contiguous(), dst=i)
-                dist.recv(tensor=input_recv, src=i)
-            else:
-                dist.recv(tensor=input_recv, src=i)
-                dist.send(tensor=input_2d[i].contiguous(), dst=i)
-            recv[i] = input_recv
-        #for t in recv:            print('concat tensors '+str(t.size()))
-        inputs = torch.cat(recv,1)
-        #print('size after transpose')
-        #print(inputs.size())
-        return inputs
+    # One all-to-all with row_count/col_count split sizes instead of P - 1 pairwise send/recv rounds
+    return alltoall_transpose(inputs, row_count, col_count, rank, size, dim, workspace)
 
 def spmm_func(am_partitions, inputs, rank, size, group, horizontal_tiled):
     global device
-    global comm_time
-    global comp_time
-    global scomp_time
-    global bcast_comm_time
     global run
 
     inputs_recv = torch.cuda.FloatTensor(am_partitions[0].size(0), inputs.size(1), device=device).fill_(0)
     
     if horizontal_tiled:
-        tstart_comm = start_time(group, rank)        
+        tstart_comm = prof.start()        
         inputs_recv = transpose_input(inputs,rank,size,0)       
-        dur = stop_time(group, rank, tstart_comm)
-        comm_time[run][rank] += dur
-        bcast_comm_time[run][rank] += dur
+        prof.stop(tstart_comm, "comm_time", "bcast_comm_time")
     else:
         inputs_recv = inputs.detach().contiguous()
 
     z_loc = torch.cuda.FloatTensor(am_partitions[0].size(0), inputs_recv.size(1), device=device).fill_(0)
     # print('size of output '+ str(z_loc.size()))
-    tstart_comp = start_time(group, rank)
+    tstart_comp = prof.start()
         
     spmm_gpu(am_partitions[0].indices()[0].int(), am_partitions[0].indices()[1].int(), 
                         am_partitions[0].values(), am_partitions[0].size(0), 
                         am_partitions[0].size(1), inputs_recv, z_loc)
 
-    dur = stop_time(group, rank, tstart_comp)
-    comp_time[run][rank] += dur
-    scomp_time[run][rank] += dur
+    prof.stop(tstart_comp, "comp_time", "scomp_time")
 
     return z_loc
 
 
 def gemm_func(inputs, weight, rank, size, group, horizontal_tiled):
     global device
-    global comm_time
-    global comp_time
-    global scomp_time
-    global bcast_comm_time
     global run
 
     inputs_recv = inputs 
     if not horizontal_tiled:
-        tstart_comm = start_time(group, rank)
+        tstart_comm = prof.start()
         inputs_recv = transpose_input(inputs,rank,size,1)
-        dur = stop_time(group, rank, tstart_comm)
-        comm_time[run][rank] += dur
-        bcast_comm_time[run][rank] += dur
+        prof.stop(tstart_comm, "comm_time", "bcast_comm_time")
 
-    tstart_comp = start_time(group, rank)
+    tstart_comp = prof.start()
     z = torch.mm(inputs_recv, weight)
-    dur = stop_time(group, rank, tstart_comp)
-    comp_time[run][rank] += dur
-    dcomp_time[run][rank] += dur
+    prof.stop(tstart_comp, "comp_time", "dcomp_time")
 
     return z
 
@@ -359,9 +227,6 @@ def dist_log_softmax(z, rank, size, group):
 class GCNFunc(torch.autograd.Function):
     @staticmethod
     def forward(ctx, inputs, weight, adj_matrix, am_partitions, rank, size, group, order, func):
-        global comm_time
-        global comp_time
-        global dcomp_time
         global run
         #lobal x1
         global ht
@@ -389,11 +254,9 @@ class GCNFunc(torch.autograd.Function):
         if order[0] == 'd':
             if rank == 0: print('forw horizontal '+str(rank))
             '''
-            tstart_comp = start_time(group, rank)
+            tstart_comp = prof.start()
             z = torch.mm(inputs, weight)
-            dur = stop_time(group, rank, tstart_comp)
-            comp_time[run][rank] += dur
-            dcomp_time[run][rank] += dur
+            prof.stop(tstart_comp, "comp_time", "dcomp_time")
             '''
             z = gemm_func(inputs, weight, rank, size, group, ht)
             z = spmm_func(am_partitions, z, rank, size, group, ht)
@@ -404,19 +267,15 @@ class GCNFunc(torch.autograd.Function):
             y1 = spmm_func( am_partitions, inputs, rank, size, group, ht)
             
             # Convert y1 to x1
-            tstart_comm = start_time(group, rank)
+            tstart_comm = prof.start()
             x1 = transpose_input(y1,rank,size,1)
-            dur = stop_time(group, rank, tstart_comm)
-            comm_time[run][rank] += dur
-            bcast_comm_time[run][rank] += dur
+            prof.stop(tstart_comm, "comm_time", "bcast_comm_time")
             ctx.x1 = x1
             z = gemm_func(x1, weight, rank, size, group, ht)
             '''
-            tstart_comp = start_time(group, rank)
+            tstart_comp = prof.start()
             z = torch.mm(x1, weight)
-            dur = stop_time(group, rank, tstart_comp)
-            comp_time[run][rank] += dur
-            dcomp_time[run][rank] += dur
+            prof.stop(tstart_comp, "comp_time", "dcomp_time")
             '''
 
         z.requires_grad = True
@@ -441,9 +300,6 @@ class GCNFunc(torch.autograd.Function):
 
     @staticmethod
     def backward(ctx, grad_output):
-        global comm_time
-        global comp_time
-        global dcomp_time
         global run
         global ht
         global x1
@@ -484,11 +340,9 @@ class GCNFunc(torch.autograd.Function):
         if order[1] == 'd':
             if rank == 0: print('back horizontal '+str(rank))
             '''
-            tstart_comp = start_time(group, rank)
+            tstart_comp = prof.start()
             x2 = torch.mm(grad_output, weight.t())
-            dur = stop_time(group, rank, tstart_comp)
-            comp_time[run][rank] += dur
-            dcomp_time[run][rank] += dur
+            prof.stop(tstart_comp, "comp_time", "dcomp_time")
             '''
             x2 = gemm_func(grad_output, weight.t(), rank, size, group, ht)
             grad_input = spmm_func(am_partitions, x2 , rank, size, group, ht)
@@ -504,20 +358,16 @@ class GCNFunc(torch.autograd.Function):
             ag = spmm_func(am_partitions, grad_output, rank, size, group, ht)            
 
             # Convert ag to horizontal tiling
-            tstart_comm = start_time(group, rank)
+            tstart_comm = prof.start()
             ag = transpose_input(ag,rank,size,1)
-            dur = stop_time(group, rank, tstart_comm)
-            comm_time[run][rank] += dur
-            bcast_comm_time[run][rank] += dur
+            prof.stop(tstart_comm, "comm_time", "bcast_comm_time")
 
             print('here')
             grad_input = gemm_func(ag, weight.t(), rank, size, group, ht)
             '''
-            tstart_comp = start_time(group, rank)
+            tstart_comp = prof.start()
             grad_input = torch.mm(ag, weight.t())
-            dur = stop_time(group, rank, tstart_comp)
-            comp_time[run][rank] += dur
-            dcomp_time[run][rank] += dur
+            prof.stop(tstart_comp, "comp_time", "dcomp_time")
             '''
             # Second backprop equation (reuses the A * G^l computation)
             # Convert tiling of input if it is vertically tiled
@@ -525,23 +375,19 @@ class GCNFunc(torch.autograd.Function):
             inputs_h = inputs
             if inputs.size(0) != ag.size(0):
                 #print('transpose')
-                tstart_comm = start_time(group, rank)
+                tstart_comm = prof.start()
                 inputs_h = transpose_input(inputs,rank,size,1)
-                dur = stop_time(group, rank, tstart_comm)
-                comm_time[run][rank] += dur
-                bcast_comm_time[run][rank] += dur
+                prof.stop(tstart_comm, "comm_time", "bcast_comm_time")
             ht = True
             grad_weight = outer_product2(inputs_h.t(), ag, rank, size, group)
 
         if inputs.size(1) != grad_input.size(1) :
-            tstart_comm = start_time(group, rank)
+            tstart_comm = prof.start()
             #print('dim '+str(0 if inputs.size(1) < grad_input.size(1) else 1))
             #print(str(inputs.size()) + ' but got ' + str(grad_input.size()))
             grad_input = transpose_input(grad_input,rank,size,0 if inputs.size(1) < grad_input.size(1) else 1)
             #print(grad_input.size())
-            dur = stop_time(group, rank, tstart_comm)
-            comm_time[run][rank] += dur
-            bcast_comm_time[run][rank] += dur
+            prof.stop(tstart_comm, "comm_time", "bcast_comm_time")
 
         # print('grad input '+str(grad_input[0]) + ' rank ' + str(rank))
         # print('grad weight '+str(grad_weight[0]) + ' rank ' + str(rank))
@@ -566,14 +412,12 @@ def train(inputs, weight1, weight2, adj_matrix, am_partitions, optimizer, data,
         rank_train_mask = torch.split(data.train_mask.bool(), row_count, dim=0)[rank]
         datay_rank = torch.split(data.y, row_count, dim=0)[rank]
     else:
-        tstart_comm = start_time(group, rank)
+        tstart_comm = prof.start()
         #print('dim '+str(0 if inputs.size(1) < grad_input.size(1) else 1))
         #print(str(inputs.size()) + ' but got ' + str(grad_input.size()))
         outputs = transpose_input(outputs,rank,size, 1)
         #print(grad_input.size())
-        dur = stop_time(group, rank, tstart_comm)
-        comm_time[run][rank] += dur
-        bcast_comm_time[run][rank] += dur
+        prof.stop(tstart_comm, "comm_time", "bcast_comm_time")
         rank_train_mask = torch.split(data.train_mask.bool(), row_count[0], dim=0)[rank]
         datay_rank = torch.split(data.y, row_count[0], dim=0)[rank]
 
@@ -627,82 +471,6 @@ def test(outputs, data, vertex_count, rank):
     # return accs
 
 
-# Split a COO into partitions of size n_per_proc
-# Basically torch.split but for Sparse Tensors since pytorch doesn't support that.
-def split_coo(adj_matrix, node_count, n_per_proc, dim):
-    vtx_indices = list(range(0, node_count, n_per_proc))
-    vtx_indices.append(node_count)
-
-    am_partitions = []
-    for i in range(len(vtx_indices) - 1):
-        am_part = adj_matrix[:,(adj_matrix[dim,:] >= vtx_indices[i]).nonzero().squeeze(1)]
-        am_part = am_part[:,(am_part[dim,:] < vtx_indices[i + 1]).nonzero().squeeze(1)]
-        am_part[dim] -= vtx_indices[i]
-        am_partitions.append(am_part)
-
-    return am_partitions, vtx_indices
-
-# Normalize all elements according to KW's normalization rule
-def scale_elements(adj_matrix, adj_part, node_count, row_vtx, col_vtx):
-    if not normalization:
-        return adj_part
-
-    # Scale each edge (u, v) by 1 / (sqrt(u) * sqrt(v))
-    # indices = adj_part._indices()
-    # values = adj_part._values()
-
-    # deg_map = dict()
-    # for i in range(adj_part._nnz()):
-    #     u = indices[0][i] + row_vtx
-    #     v = indices[1][i] + col_vtx
-
-    #     if u.item() in deg_map:
-    #         degu = deg_map[u.item()]
-    #     else:
-    #         degu = (adj_matrix[0] == u).sum().item()
-    #         deg_map[u.item()] = degu
-
-    #     if v.item() in deg_map:
-    #         degv = deg_map[v.item()]
-    #     else:
-    #         degv = (adj_matrix[0] == v).sum().item()
-    #         deg_map[v.item()] = degv
-
-    #     values[i] = values[i] / (math.sqrt(degu) * math.sqrt(degv))
-    
-    adj_part = adj_part.coalesce()
-    deg = torch.histc(adj_matrix[0].double(), bins=node_count)
-    deg = deg.pow(-0.5)
-
-    row_len = adj_part.size(0)
-    col_len = adj_part.size(1)
-
-    dleft = torch.sparse_coo_tensor([np.arange(0, row_len).tolist(),
-                                     np.arange(0, row_len).tolist()],
-                                     deg[row_vtx:(row_vtx + row_len)].float(),
-                                     size=(row_len, row_len),
-                                     requires_grad=False, device=torch.device("cpu"))
-
-    dright = torch.sparse_coo_tensor([np.arange(0, col_len).tolist(),
-                                     np.arange(0, col_len).tolist()],
-                                     deg[col_vtx:(col_vtx + col_len)].float(),
-                                     size=(col_len, col_len),
-                                     requires_grad=False, device=torch.device("cpu"))
-    # adj_part = torch.sparse.mm(torch.sparse.mm(dleft, adj_part), dright)
-    ad_ind, ad_val = torch_sparse.spspmm(adj_part._indices(), adj_part._values(), 
-                                            dright._indices(), dright._values(),
-                                            adj_part.size(0), adj_part.size(1), dright.size(1))
-
-    adj_part_ind, adj_part_val = torch_sparse.spspmm(dleft._indices(), dleft._values(), 
-                                                        ad_ind, ad_val,
-                                                        dleft.size(0), dleft.size(1), adj_part.size(1))
-
-    adj_part = torch.sparse_coo_tensor(adj_part_ind, adj_part_val, 
-                                                size=(adj_part.size(0), adj_part.size(1)),
-                                                requires_grad=False, device=torch.device("cpu"))
-
-    return adj_part
-
 def symmetric(adj_matrix):
     # print(adj_matrix)
     # not sure whether the following is needed
@@ -740,12 +508,15 @@ def oned_partition(rank, size, inputs, adj_matrix, data, features, classes, devi
     # Compute the adj_matrix and inputs partitions for this process
     # TODO: Maybe I do want grad here. Unsure.
     with torch.no_grad():
+        # Degrees are computed once for the whole graph, each block only gathers them
+        norm = norm_factors(adj_matrix, node_count, norm_type if normalization else "none")
+
         rankf = 0
-        # Column partitions
-        am_partitions, vtx_indices = split_coo(adj_matrix, node_count, n_per_proc, 1)
+        # Column partitions and the row blocks of this process' column in one bucket sort each
+        vtx_indices = vtx_boundaries(node_count, n_per_proc)
+        am_partitions, am_pbyp = split_coo_blocks(adj_matrix, vtx_indices, vtx_indices, rankf)
 
         proc_node_count = vtx_indices[rankf + 1] - vtx_indices[rankf]
-        am_pbyp, _ = split_coo(am_partitions[rankf], node_count, n_per_proc, 0)
         for i in range(len(am_pbyp)):
             if i == size - 1:
                 last_node_count = vtx_indices[i + 1] - vtx_indices[i]
@@ -753,15 +524,13 @@ def oned_partition(rank, size, inputs, adj_matrix, data, features, classes, devi
                                                         size=(last_node_count, proc_node_count),
                                                         requires_grad=False)
 
-                am_pbyp[i] = scale_elements(adj_matrix, am_pbyp[i], node_count, vtx_indices[i], 
-                                                vtx_indices[rankf])
+                am_pbyp[i] = scale_elements(am_pbyp[i], norm, vtx_indices[i], vtx_indices[rankf])
             else:
                 am_pbyp[i] = torch.sparse_coo_tensor(am_pbyp[i], torch.ones(am_pbyp[i].size(1)), 
                                                         size=(n_per_proc, proc_node_count),
                                                         requires_grad=False)
 
-                am_pbyp[i] = scale_elements(adj_matrix, am_pbyp[i], node_count, vtx_indices[i], 
-                                                vtx_indices[rankf])
+                am_pbyp[i] = scale_elements(am_pbyp[i], norm, vtx_indices[i], vtx_indices[rankf])
 
         for i in range(len(am_partitions)):
             proc_node_count = vtx_indices[i + 1] - vtx_indices[i]
@@ -769,7 +538,7 @@ def oned_partition(rank, size, inputs, adj_matrix, data, features, classes, devi
                                                     torch.ones(am_partitions[i].size(1)), 
                                                     size=(node_count, proc_node_count), 
                                                     requires_grad=False)
-            am_partitions[i] = scale_elements(adj_matrix, am_partitions[i], node_count,  0, vtx_indices[i])
+            am_partitions[i] = scale_elements(am_partitions[i], norm, 0, vtx_indices[i])
 
         print(inputs.size(0))
         print(inputs.size(1))
@@ -799,12 +568,100 @@ def oned_partition(rank, size, inputs, adj_matrix, data, features, classes, devi
     print(f"rank: {rankf} inputs.size: {inputs.size()}", flush=True)
     return inputs_loc, adj_matrix_loc, am_pbyp, ht
 
+def load_partition(rank, size, inputs, adj_matrix, data, features, classes, device):
+    global row_count
+    global col_count
+
+    # row_count/col_count are set as a side effect of oned_partition, so they are cached alongside
+    def partition():
+        return oned_partition(rank, size, inputs, adj_matrix, data, features, classes, device) + \
+                    (row_count, col_count)
+
+    inputs_loc, adj_matrix_loc, am_pbyp, horizontal_tiled, row_count, col_count = \
+            cached_partition(partition_cache, graphname, "rdm-auto", rank, size, adj_matrix, inputs,
+                                partition, norm_type if normalization else "none", mmorder[0])
+
+    inputs_loc = inputs_loc.to(device)
+    adj_matrix_loc = adj_matrix_loc.to(device)
+    for i in range(len(am_pbyp)):
+        am_pbyp[i] = am_pbyp[i].t().coalesce().to(device)
+
+    return inputs_loc, adj_matrix_loc, am_pbyp, horizontal_tiled
+
+def select_mmorder(rank, size, inputs, adj_matrix, data, features, classes, device, group):
+    """
+    Pick the SpMM/GEMM order for --mmorder auto.
+
+    A plan cached in mmplan_path for this (graph, dims, world size) is used
+    as is, unless calibration is asked for and the cached plan only comes
+    from the cost model. Otherwise the orders are ranked by the cost model in
+    mmorder_plan.py and, with mmorder_calibrate > 0, the three cheapest are
+    timed for that many training steps and the fastest (slowest rank) wins.
+    Rank 0 writes the choice back to the plan cache.
+    """
+    global mmorder
+    global ht
+
+    node_count = inputs.size(0)
+    nnz = adj_matrix.size(1)
+    dims = [features, mid_layer, classes]
+    key = plan_key(graphname, node_count, nnz, dims, size)
+
+    plan = load_plan(mmplan_path, key)
+    if plan is not None and (mmorder_calibrate == 0 or plan.get("source") == "calibrated"):
+        print(f"rank: {rank} cached mmorder plan {key}: {plan}", flush=True)
+        return plan["mmorder"]
+
+    ranked = rank_orders(node_count, nnz, dims, size)
+    if rank == 0:
+        for est, order, cost in ranked:
+            print(f"mmorder: {order} modeled_time: {est:.4f} words: {cost['words']:.0f} "
+                    f"spmm_flops: {cost['spmm_flops']:.0f} gemm_flops: {cost['gemm_flops']:.0f}")
+    plan = dict(mmorder=ranked[0][1], modeled_time=ranked[0][0], source="model")
+
+    if mmorder_calibrate > 0:
+        measured = dict()
+        for _, order, _ in ranked[:3]:
+            mmorder = order
+            inputs_loc, adj_matrix_loc, am_pbyp, horizontal_tiled = \
+                    load_partition(rank, size, inputs, adj_matrix, data, features, classes, device)
+            ht = horizontal_tiled
+
+            torch.manual_seed(0)
+            weight1 = Parameter(torch.rand(features, mid_layer).to(device))
+            weight2 = Parameter(torch.rand(mid_layer, classes).to(device))
+            optimizer = torch.optim.Adam([weight1, weight2], lr=0.01)
+
+            # One untimed step to warm up, as in run()
+            train(inputs_loc, weight1, weight2, adj_matrix_loc, am_pbyp, optimizer, data,
+                        rank, size, group, ht)
+            dist.barrier(group)
+            tstart = time.time()
+            for _ in range(mmorder_calibrate):
+                train(inputs_loc, weight1, weight2, adj_matrix_loc, am_pbyp, optimizer, data,
+                            rank, size, group, ht)
+            dist.barrier(group)
+            step_time = torch.tensor([(time.time() - tstart) / mmorder_calibrate], device=device)
+            dist.all_reduce(step_time, op=dist.ReduceOp.MAX, group=group)
+            measured[order] = step_time.item()
+            if rank == 0:
+                print(f"mmorder: {order} measured_step_time: {measured[order]:.4f}", flush=True)
+
+        best = min(measured, key=measured.get)
+        plan = dict(mmorder=best, measured_step_time=measured[best], measured=measured, source="calibrated")
+
+    if rank == 0 and mmplan_path:
+        save_plan(mmplan_path, key, plan)
+    return plan["mmorder"]
+
 def run(rank, size, inputs, adj_matrix, data, features, classes, device):
     global epochs
+    global row_count
+    global col_count
     global mid_layer
     global run
-    global timing
     global ht
+    global mmorder
 
     best_val_acc = test_acc = 0
     outputs = None
@@ -818,13 +675,13 @@ def run(rank, size, inputs, adj_matrix, data, features, classes, device):
 
     # adj_matrix = symmetric(adj_matrix)
    
-    inputs_loc, adj_matrix_loc, am_pbyp, horizontal_tiled = oned_partition(rank, size, inputs, adj_matrix, data, 
-                                                                features, classes, device)
+    if mmorder == "auto":
+        mmorder = select_mmorder(rank, size, inputs, adj_matrix, data, features, classes, device, group)
+        print(f"rank: {rank} mmorder: {mmorder}", flush=True)
 
-    inputs_loc = inputs_loc.to(device)
-    adj_matrix_loc = adj_matrix_loc.to(device)
-    for i in range(len(am_pbyp)):
-        am_pbyp[i] = am_pbyp[i].t().coalesce().to(device)
+    inputs_loc, adj_matrix_loc, am_pbyp, horizontal_tiled = \
+            load_partition(rank, size, inputs, adj_matrix, data, features, classes, device)
+    ht = horizontal_tiled
 
     for i in range(run_count):
         run = i
@@ -847,33 +704,16 @@ def run(rank, size, inputs, adj_matrix, data, features, classes, device):
         tstop = 0.0
 
         total_time[i] = dict()
-        comm_time[i] = dict()
-        comp_time[i] = dict()
-        scomp_time[i] = dict()
-        dcomp_time[i] = dict()
-        bcast_comm_time[i] = dict()
-        barrier_time[i] = dict()
-        barrier_subset_time[i] = dict()
-        op1_comm_time[i] = dict()
-        op2_comm_time[i] = dict()
-
         total_time[i][rank] = 0.0
-        comm_time[i][rank] = 0.0
-        comp_time[i][rank] = 0.0
-        scomp_time[i][rank] = 0.0
-        dcomp_time[i][rank] = 0.0
-        bcast_comm_time[i][rank] = 0.0
-        barrier_time[i][rank] = 0.0
-        barrier_subset_time[i][rank] = 0.0
-        op1_comm_time[i][rank] = 0.0
-        op2_comm_time[i][rank] = 0.0
-
-        timing_on = timing == True
-        timing = False
+
+        global prof
+        prof = Profiler(rank, device, enabled=False, trace=bool(profile_dir),
+                            sync_group=group if timing_sync else None)
+
+        # Warm-up epoch, not profiled
         outputs = train(inputs_loc, weight1, weight2, adj_matrix_loc, am_pbyp, optimizer, data, 
                                 rank, size, group, ht)
-        if timing_on:
-            timing = True
+        prof.enabled = timing
 
         dist.barrier(group)
         tstart = time.time()
@@ -889,6 +729,11 @@ def run(rank, size, inputs, adj_matrix, data, features, classes, device):
         tstop = time.time()
         total_time[i][rank] = tstop - tstart
 
+        run_stats[run] = prof.summary()
+        if profile_dir:
+            prof.write_json(osp.join(profile_dir, f"run{run}", f"rank{rank}.json"))
+            prof.write_trace(osp.join(profile_dir, f"run{run}", f"rank{rank}.trace.json"))
+
     # Get median runtime according to rank0 and print that run's breakdown
     dist.barrier(group)
     if rank == 0:
@@ -907,15 +752,15 @@ def run(rank, size, inputs, adj_matrix, data, features, classes, device):
     median_idx = median_idx.item()
     print(f"rank: {rank} median_run: {median_idx}")
     print(f"rank: {rank} total_time: {total_time[median_idx][rank]}")
-    print(f"rank: {rank} comm_time: {comm_time[median_idx][rank]}")
-    print(f"rank: {rank} comp_time: {comp_time[median_idx][rank]}")
-    print(f"rank: {rank} scomp_time: {scomp_time[median_idx][rank]}")
-    print(f"rank: {rank} dcomp_time: {dcomp_time[median_idx][rank]}")
-    print(f"rank: {rank} bcast_comm_time: {bcast_comm_time[median_idx][rank]}")
-    print(f"rank: {rank} barrier_time: {barrier_time[median_idx][rank]}")
-    print(f"rank: {rank} barrier_subset_time: {barrier_subset_time[median_idx][rank]}")
-    print(f"rank: {rank} op1_comm_time: {op1_comm_time[median_idx][rank]}")
-    print(f"rank: {rank} op2_comm_time: {op2_comm_time[median_idx][rank]}")
+    totals = run_stats[median_idx]["totals"]
+    for name in ["comm_time", "comp_time", "scomp_time", "dcomp_time", "bcast_comm_time",
+                    "op1_comm_time", "op2_comm_time"]:
+        print(f"rank: {rank} {name}: {totals.get(name, 0.0)}")
+
+    # Cross-rank min/mean/max of the median run, one collective for the whole breakdown
+    _, stats = aggregate(run_stats[median_idx], group)
+    if rank == 0:
+        print_stats(stats)
     print(f"rank: {rank} {outputs}")
     
     
@@ -1139,10 +984,16 @@ if __name__ == '__main__':
     parser.add_argument("--midlayer", type=int)
     parser.add_argument("--runcount", type=int)
     parser.add_argument("--normalization", type=str)
+    parser.add_argument("--normtype", type=str, default="sym")
+    parser.add_argument("--partcache", type=str, default="")
     parser.add_argument("--activations", type=str)
     parser.add_argument("--accuracy", type=str)
     parser.add_argument("--download", type=bool)
     parser.add_argument("--mmorder", type=str)
+    parser.add_argument("--mmcalibrate", type=int, default=0)
+    parser.add_argument("--mmplan", type=str, default="")
+    parser.add_argument("--timingsync", type=str, default="False")
+    parser.add_argument("--profiledir", type=str, default="")
 
 
     args = parser.parse_args()
@@ -1156,10 +1007,16 @@ if __name__ == '__main__':
     mid_layer = args.midlayer
     run_count = args.runcount
     normalization = args.normalization == "True"
+    norm_type = args.normtype
+    partition_cache = args.partcache
     activations = args.activations == "True"
     accuracy = args.accuracy == "True"
     download = args.download
     mmorder = args.mmorder
+    mmorder_calibrate = args.mmcalibrate
+    mmplan_path = args.mmplan
+    timing_sync = args.timingsync == "True"
+    profile_dir = args.profiledir
    
     if mmorder == None or mmorder == "":
         mmorder = "dsds"
@@ -0,0 +1,123 @@
+import torch
+import torch.distributed as dist
+
+
+class _Bucket:
+    def __init__(self, params, offsets, numel):
+        self.params = params
+        self.offsets = offsets
+        self.numel = numel
+        self.flat = None
+        self.ready = set()
+        self.work = None
+
+
+class GradReducer:
+    """
+    Bucketed, asynchronous sum of the weight gradients over `group`.
+
+    The backward passes hand their local grad_weight to push() instead of
+    all-reducing it. Gradients are copied into persistent flat buffers, one
+    per bucket, and a bucket's all-reduce is launched as soon as its last
+    gradient arrives, so it runs while the remaining layers are still doing
+    their SpMMs and transposes. finish(), called right before
+    optimizer.step(), waits for the reductions and writes the sums into the
+    parameters' .grad.
+
+    Buckets are filled in the order backward produces the gradients (the
+    reverse of `params`) and closed once they hold `bucket_mb` megabytes;
+    bucket_mb=0 gives one bucket per weight, the most overlap. With a
+    CommPrecision the buckets travel in its wire format. Buffers come from
+    `workspace` when one is given.
+    """
+    def __init__(self, params, group=None, bucket_mb=25.0, comm=None, workspace=None):
+        self.params = list(params)
+        self.group = group
+        self.comm = comm
+        self.workspace = workspace
+        self.index = {p.data_ptr(): i for i, p in enumerate(self.params)}
+
+        cap = int(bucket_mb * 1024 * 1024)
+        self.buckets = []
+        self.slot = dict()
+        pending = []
+        pending_bytes = 0
+        for i in reversed(range(len(self.params))):
+            pending.append(i)
+            pending_bytes += self.params[i].numel() * self.params[i].element_size()
+            if pending_bytes >= cap:
+                self._add_bucket(pending)
+                pending = []
+                pending_bytes = 0
+        if pending:
+            self._add_bucket(pending)
+
+    def _add_bucket(self, indices):
+        offsets = []
+        numel = 0
+        for i in indices:
+            self.slot[i] = (len(self.buckets), numel)
+            offsets.append(numel)
+            numel += self.params[i].numel()
+        self.buckets.append(_Bucket(indices, offsets, numel))
+
+    def _flat(self, bucket_id):
+        bucket = self.buckets[bucket_id]
+        if bucket.flat is None:
+            device = self.params[bucket.params[0]].device
+            if self.workspace is not None:
+                bucket.flat = self.workspace.get(("grad_bucket", bucket_id), (bucket.numel,), device)
+            else:
+                bucket.flat = torch.empty(bucket.numel, device=device)
+        return bucket.flat
+
+    def view(self, param):
+        """
+        This rank's slot for `param`'s gradient in its bucket, shaped like
+        param, so that a gradient can be assembled there in place.
+        """
+        i = self.index[param.data_ptr()]
+        bucket_id, offset = self.slot[i]
+        return self._flat(bucket_id)[offset:offset + param.numel()].view_as(param)
+
+    def push(self, param, grad):
+        # grad is this rank's contribution to param's gradient, the sum over group ends up in param.grad
+        i = self.index[param.data_ptr()]
+        bucket_id, _ = self.slot[i]
+        bucket = self.buckets[bucket_id]
+        slot = self.view(param)
+        if grad.data_ptr() != slot.data_ptr():
+            slot.copy_(grad)
+        bucket.ready.add(i)
+        if len(bucket.ready) == len(bucket.params):
+            self._launch(bucket_id)
+
+    def _launch(self, bucket_id):
+        bucket = self.buckets[bucket_id]
+        flat = self._flat(bucket_id)
+        if self.comm is not None:
+            bucket.work = self.comm.all_reduce(flat, group=self.group, key=("grad_bucket", bucket_id),
+                                                async_op=True)
+        else:
+            bucket.work = dist.all_reduce(flat, op=dist.ReduceOp.SUM, group=self.group, async_op=True)
+
+    def finish(self):
+        for bucket_id, bucket in enumerate(self.buckets):
+            if bucket.work is None:
+                # Weights that got no gradient this step contribute zeros, so every rank still reduces every bucket
+                for i in bucket.params:
+                    if i not in bucket.ready:
+                        self.view(self.params[i]).zero_()
+                self._launch(bucket_id)
+
+        for bucket in self.buckets:
+            bucket.work.wait()
+            bucket.work = None
+            bucket.ready.clear()
+
+        for p in self.params:
+            grad = self.view(p)
+            if p.grad is None:
+                p.grad = grad.clone()
+            else:
+                p.grad.copy_(grad)
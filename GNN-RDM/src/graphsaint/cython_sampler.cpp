@@ -1,15606 +0,0 @@
-/* Generated by Cython 0.29.28 */
-
-/* BEGIN: Cython Metadata
-{
-    "distutils": {
-        "depends": [],
-        "extra_compile_args": [
-            "-fopenmp",
-            "-std=c++11"
-        ],
-        "extra_link_args": [
-            "-fopenmp"
-        ],
-        "language": "c++",
-        "name": "graphsaint.cython_sampler",
-        "sources": [
-            "graphsaint/cython_sampler.pyx"
-        ]
-    },
-    "module_name": "graphsaint.cython_sampler"
-}
-END: Cython Metadata */
-
-#ifndef PY_SSIZE_T_CLEAN
-#define PY_SSIZE_T_CLEAN
-#endif /* PY_SSIZE_T_CLEAN */
-#include "Python.h"
-#ifndef Py_PYTHON_H
-    #error Python headers needed to compile C extensions, please install development version of Python.
-#elif PY_VERSION_HEX < 0x02060000 || (0x03000000 <= PY_VERSION_HEX && PY_VERSION_HEX < 0x03030000)
-    #error Cython requires Python 2.6+ or Python 3.3+.
-#else
-#define CYTHON_ABI "0_29_28"
-#define CYTHON_HEX_VERSION 0x001D1CF0
-#define CYTHON_FUTURE_DIVISION 1
-#include <stddef.h>
-#ifndef offsetof
-  #define offsetof(type, member) ( (size_t) & ((type*)0) -> member )
-#endif
-#if !defined(WIN32) && !defined(MS_WINDOWS)
-  #ifndef __stdcall
-    #define __stdcall
-  #endif
-  #ifndef __cdecl
-    #define __cdecl
-  #endif
-  #ifndef __fastcall
-    #define __fastcall
-  #endif
-#endif
-#ifndef DL_IMPORT
-  #define DL_IMPORT(t) t
-#endif
-#ifndef DL_EXPORT
-  #define DL_EXPORT(t) t
-#endif
-#define __PYX_COMMA ,
-#ifndef HAVE_LONG_LONG
-  #if PY_VERSION_HEX >= 0x02070000
-    #define HAVE_LONG_LONG
-  #endif
-#endif
-#ifndef PY_LONG_LONG
-  #define PY_LONG_LONG LONG_LONG
-#endif
-#ifndef Py_HUGE_VAL
-  #define Py_HUGE_VAL HUGE_VAL
-#endif
-#ifdef PYPY_VERSION
-  #define CYTHON_COMPILING_IN_PYPY 1
-  #define CYTHON_COMPILING_IN_PYSTON 0
-  #define CYTHON_COMPILING_IN_CPYTHON 0
-  #undef CYTHON_USE_TYPE_SLOTS
-  #define CYTHON_USE_TYPE_SLOTS 0
-  #undef CYTHON_USE_PYTYPE_LOOKUP
-  #define CYTHON_USE_PYTYPE_LOOKUP 0
-  #if PY_VERSION_HEX < 0x03050000
-    #undef CYTHON_USE_ASYNC_SLOTS
-    #define CYTHON_USE_ASYNC_SLOTS 0
-  #elif !defined(CYTHON_USE_ASYNC_SLOTS)
-    #define CYTHON_USE_ASYNC_SLOTS 1
-  #endif
-  #undef CYTHON_USE_PYLIST_INTERNALS
-  #define CYTHON_USE_PYLIST_INTERNALS 0
-  #undef CYTHON_USE_UNICODE_INTERNALS
-  #define CYTHON_USE_UNICODE_INTERNALS 0
-  #undef CYTHON_USE_UNICODE_WRITER
-  #define CYTHON_USE_UNICODE_WRITER 0
-  #undef CYTHON_USE_PYLONG_INTERNALS
-  #define CYTHON_USE_PYLONG_INTERNALS 0
-  #undef CYTHON_AVOID_BORROWED_REFS
-  #define CYTHON_AVOID_BORROWED_REFS 1
-  #undef CYTHON_ASSUME_SAFE_MACROS
-  #define CYTHON_ASSUME_SAFE_MACROS 0
-  #undef CYTHON_UNPACK_METHODS
-  #define CYTHON_UNPACK_METHODS 0
-  #undef CYTHON_FAST_THREAD_STATE
-  #define CYTHON_FAST_THREAD_STATE 0
-  #undef CYTHON_FAST_PYCALL
-  #define CYTHON_FAST_PYCALL 0
-  #undef CYTHON_PEP489_MULTI_PHASE_INIT
-  #define CYTHON_PEP489_MULTI_PHASE_INIT 0
-  #undef CYTHON_USE_TP_FINALIZE
-  #define CYTHON_USE_TP_FINALIZE 0
-  #undef CYTHON_USE_DICT_VERSIONS
-  #define CYTHON_USE_DICT_VERSIONS 0
-  #undef CYTHON_USE_EXC_INFO_STACK
-  #define CYTHON_USE_EXC_INFO_STACK 0
-#elif defined(PYSTON_VERSION)
-  #define CYTHON_COMPILING_IN_PYPY 0
-  #define CYTHON_COMPILING_IN_PYSTON 1
-  #define CYTHON_COMPILING_IN_CPYTHON 0
-  #ifndef CYTHON_USE_TYPE_SLOTS
-    #define CYTHON_USE_TYPE_SLOTS 1
-  #endif
-  #undef CYTHON_USE_PYTYPE_LOOKUP
-  #define CYTHON_USE_PYTYPE_LOOKUP 0
-  #undef CYTHON_USE_ASYNC_SLOTS
-  #define CYTHON_USE_ASYNC_SLOTS 0
-  #undef CYTHON_USE_PYLIST_INTERNALS
-  #define CYTHON_USE_PYLIST_INTERNALS 0
-  #ifndef CYTHON_USE_UNICODE_INTERNALS
-    #define CYTHON_USE_UNICODE_INTERNALS 1
-  #endif
-  #undef CYTHON_USE_UNICODE_WRITER
-  #define CYTHON_USE_UNICODE_WRITER 0
-  #undef CYTHON_USE_PYLONG_INTERNALS
-  #define CYTHON_USE_PYLONG_INTERNALS 0
-  #ifndef CYTHON_AVOID_BORROWED_REFS
-    #define CYTHON_AVOID_BORROWED_REFS 0
-  #endif
-  #ifndef CYTHON_ASSUME_SAFE_MACROS
-    #define CYTHON_ASSUME_SAFE_MACROS 1
-  #endif
-  #ifndef CYTHON_UNPACK_METHODS
-    #define CYTHON_UNPACK_METHODS 1
-  #endif
-  #undef CYTHON_FAST_THREAD_STATE
-  #define CYTHON_FAST_THREAD_STATE 0
-  #undef CYTHON_FAST_PYCALL
-  #define CYTHON_FAST_PYCALL 0
-  #undef CYTHON_PEP489_MULTI_PHASE_INIT
-  #define CYTHON_PEP489_MULTI_PHASE_INIT 0
-  #undef CYTHON_USE_TP_FINALIZE
-  #define CYTHON_USE_TP_FINALIZE 0
-  #undef CYTHON_USE_DICT_VERSIONS
-  #define CYTHON_USE_DICT_VERSIONS 0
-  #undef CYTHON_USE_EXC_INFO_STACK
-  #define CYTHON_USE_EXC_INFO_STACK 0
-#else
-  #define CYTHON_COMPILING_IN_PYPY 0
-  #define CYTHON_COMPILING_IN_PYSTON 0
-  #define CYTHON_COMPILING_IN_CPYTHON 1
-  #ifndef CYTHON_USE_TYPE_SLOTS
-    #define CYTHON_USE_TYPE_SLOTS 1
-  #endif
-  #if PY_VERSION_HEX < 0x02070000
-    #undef CYTHON_USE_PYTYPE_LOOKUP
-    #define CYTHON_USE_PYTYPE_LOOKUP 0
-  #elif !defined(CYTHON_USE_PYTYPE_LOOKUP)
-    #define CYTHON_USE_PYTYPE_LOOKUP 1
-  #endif
-  #if PY_MAJOR_VERSION < 3
-    #undef CYTHON_USE_ASYNC_SLOTS
-    #define CYTHON_USE_ASYNC_SLOTS 0
-  #elif !defined(CYTHON_USE_ASYNC_SLOTS)
-    #define CYTHON_USE_ASYNC_SLOTS 1
-  #endif
-  #if PY_VERSION_HEX < 0x02070000
-    #undef CYTHON_USE_PYLONG_INTERNALS
-    #define CYTHON_USE_PYLONG_INTERNALS 0
-  #elif !defined(CYTHON_USE_PYLONG_INTERNALS)
-    #define CYTHON_USE_PYLONG_INTERNALS 1
-  #endif
-  #ifndef CYTHON_USE_PYLIST_INTERNALS
-    #define CYTHON_USE_PYLIST_INTERNALS 1
-  #endif
-  #ifndef CYTHON_USE_UNICODE_INTERNALS
-    #define CYTHON_USE_UNICODE_INTERNALS 1
-  #endif
-  #if PY_VERSION_HEX < 0x030300F0 || PY_VERSION_HEX >= 0x030B00A2
-    #undef CYTHON_USE_UNICODE_WRITER
-    #define CYTHON_USE_UNICODE_WRITER 0
-  #elif !defined(CYTHON_USE_UNICODE_WRITER)
-    #define CYTHON_USE_UNICODE_WRITER 1
-  #endif
-  #ifndef CYTHON_AVOID_BORROWED_REFS
-    #define CYTHON_AVOID_BORROWED_REFS 0
-  #endif
-  #ifndef CYTHON_ASSUME_SAFE_MACROS
-    #define CYTHON_ASSUME_SAFE_MACROS 1
-  #endif
-  #ifndef CYTHON_UNPACK_METHODS
-    #define CYTHON_UNPACK_METHODS 1
-  #endif
-  #if PY_VERSION_HEX >= 0x030B00A4
-    #undef CYTHON_FAST_THREAD_STATE
-    #define CYTHON_FAST_THREAD_STATE 0
-  #elif !defined(CYTHON_FAST_THREAD_STATE)
-    #define CYTHON_FAST_THREAD_STATE 1
-  #endif
-  #ifndef CYTHON_FAST_PYCALL
-    #define CYTHON_FAST_PYCALL (PY_VERSION_HEX < 0x030B00A1)
-  #endif
-  #ifndef CYTHON_PEP489_MULTI_PHASE_INIT
-    #define CYTHON_PEP489_MULTI_PHASE_INIT (PY_VERSION_HEX >= 0x03050000)
-  #endif
-  #ifndef CYTHON_USE_TP_FINALIZE
-    #define CYTHON_USE_TP_FINALIZE (PY_VERSION_HEX >= 0x030400a1)
-  #endif
-  #ifndef CYTHON_USE_DICT_VERSIONS
-    #define CYTHON_USE_DICT_VERSIONS (PY_VERSION_HEX >= 0x030600B1)
-  #endif
-  #if PY_VERSION_HEX >= 0x030B00A4
-    #undef CYTHON_USE_EXC_INFO_STACK
-    #define CYTHON_USE_EXC_INFO_STACK 0
-  #elif !defined(CYTHON_USE_EXC_INFO_STACK)
-    #define CYTHON_USE_EXC_INFO_STACK (PY_VERSION_HEX >= 0x030700A3)
-  #endif
-#endif
-#if !defined(CYTHON_FAST_PYCCALL)
-#define CYTHON_FAST_PYCCALL  (CYTHON_FAST_PYCALL && PY_VERSION_HEX >= 0x030600B1)
-#endif
-#if CYTHON_USE_PYLONG_INTERNALS
-  #if PY_MAJOR_VERSION < 3
-    #include "longintrepr.h"
-  #endif
-  #undef SHIFT
-  #undef BASE
-  #undef MASK
-  #ifdef SIZEOF_VOID_P
-    enum { __pyx_check_sizeof_voidp = 1 / (int)(SIZEOF_VOID_P == sizeof(void*)) };
-  #endif
-#endif
-#ifndef __has_attribute
-  #define __has_attribute(x) 0
-#endif
-#ifndef __has_cpp_attribute
-  #define __has_cpp_attribute(x) 0
-#endif
-#ifndef CYTHON_RESTRICT
-  #if defined(__GNUC__)
-    #define CYTHON_RESTRICT __restrict__
-  #elif defined(_MSC_VER) && _MSC_VER >= 1400
-    #define CYTHON_RESTRICT __restrict
-  #elif defined (__STDC_VERSION__) && __STDC_VERSION__ >= 199901L
-    #define CYTHON_RESTRICT restrict
-  #else
-    #define CYTHON_RESTRICT
-  #endif
-#endif
-#ifndef CYTHON_UNUSED
-# if defined(__GNUC__)
-#   if !(defined(__cplusplus)) || (__GNUC__ > 3 || (__GNUC__ == 3 && __GNUC_MINOR__ >= 4))
-#     define CYTHON_UNUSED __attribute__ ((__unused__))
-#   else
-#     define CYTHON_UNUSED
-#   endif
-# elif defined(__ICC) || (defined(__INTEL_COMPILER) && !defined(_MSC_VER))
-#   define CYTHON_UNUSED __attribute__ ((__unused__))
-# else
-#   define CYTHON_UNUSED
-# endif
-#endif
-#ifndef CYTHON_MAYBE_UNUSED_VAR
-#  if defined(__cplusplus)
-     template<class T> void CYTHON_MAYBE_UNUSED_VAR( const T& ) { }
-#  else
-#    define CYTHON_MAYBE_UNUSED_VAR(x) (void)(x)
-#  endif
-#endif
-#ifndef CYTHON_NCP_UNUSED
-# if CYTHON_COMPILING_IN_CPYTHON
-#  define CYTHON_NCP_UNUSED
-# else
-#  define CYTHON_NCP_UNUSED CYTHON_UNUSED
-# endif
-#endif
-#define __Pyx_void_to_None(void_result) ((void)(void_result), Py_INCREF(Py_None), Py_None)
-#ifdef _MSC_VER
-    #ifndef _MSC_STDINT_H_
-        #if _MSC_VER < 1300
-           typedef unsigned char     uint8_t;
-           typedef unsigned int      uint32_t;
-        #else
-           typedef unsigned __int8   uint8_t;
-           typedef unsigned __int32  uint32_t;
-        #endif
-    #endif
-#else
-   #include <stdint.h>
-#endif
-#ifndef CYTHON_FALLTHROUGH
-  #if defined(__cplusplus) && __cplusplus >= 201103L
-    #if __has_cpp_attribute(fallthrough)
-      #define CYTHON_FALLTHROUGH [[fallthrough]]
-    #elif __has_cpp_attribute(clang::fallthrough)
-      #define CYTHON_FALLTHROUGH [[clang::fallthrough]]
-    #elif __has_cpp_attribute(gnu::fallthrough)
-      #define CYTHON_FALLTHROUGH [[gnu::fallthrough]]
-    #endif
-  #endif
-  #ifndef CYTHON_FALLTHROUGH
-    #if __has_attribute(fallthrough)
-      #define CYTHON_FALLTHROUGH __attribute__((fallthrough))
-    #else
-      #define CYTHON_FALLTHROUGH
-    #endif
-  #endif
-  #if defined(__clang__ ) && defined(__apple_build_version__)
-    #if __apple_build_version__ < 7000000
-      #undef  CYTHON_FALLTHROUGH
-      #define CYTHON_FALLTHROUGH
-    #endif
-  #endif
-#endif
-
-#ifndef __cplusplus
-  #error "Cython files generated with the C++ option must be compiled with a C++ compiler."
-#endif
-#ifndef CYTHON_INLINE
-  #if defined(__clang__)
-    #define CYTHON_INLINE __inline__ __attribute__ ((__unused__))
-  #else
-    #define CYTHON_INLINE inline
-  #endif
-#endif
-template<typename T>
-void __Pyx_call_destructor(T& x) {
-    x.~T();
-}
-template<typename T>
-class __Pyx_FakeReference {
-  public:
-    __Pyx_FakeReference() : ptr(NULL) { }
-    __Pyx_FakeReference(const T& ref) : ptr(const_cast<T*>(&ref)) { }
-    T *operator->() { return ptr; }
-    T *operator&() { return ptr; }
-    operator T&() { return *ptr; }
-    template<typename U> bool operator ==(U other) { return *ptr == other; }
-    template<typename U> bool operator !=(U other) { return *ptr != other; }
-  private:
-    T *ptr;
-};
-
-#if CYTHON_COMPILING_IN_PYPY && PY_VERSION_HEX < 0x02070600 && !defined(Py_OptimizeFlag)
-  #define Py_OptimizeFlag 0
-#endif
-#define __PYX_BUILD_PY_SSIZE_T "n"
-#define CYTHON_FORMAT_SSIZE_T "z"
-#if PY_MAJOR_VERSION < 3
-  #define __Pyx_BUILTIN_MODULE_NAME "__builtin__"
-  #define __Pyx_PyCode_New(a, k, l, s, f, code, c, n, v, fv, cell, fn, name, fline, lnos)\
-          PyCode_New(a+k, l, s, f, code, c, n, v, fv, cell, fn, name, fline, lnos)
-  #define __Pyx_DefaultClassType PyClass_Type
-#else
-  #define __Pyx_BUILTIN_MODULE_NAME "builtins"
-  #define __Pyx_DefaultClassType PyType_Type
-#if PY_VERSION_HEX >= 0x030B00A1
-    static CYTHON_INLINE PyCodeObject* __Pyx_PyCode_New(int a, int k, int l, int s, int f,
-                                                    PyObject *code, PyObject *c, PyObject* n, PyObject *v,
-                                                    PyObject *fv, PyObject *cell, PyObject* fn,
-                                                    PyObject *name, int fline, PyObject *lnos) {
-        PyObject *kwds=NULL, *argcount=NULL, *posonlyargcount=NULL, *kwonlyargcount=NULL;
-        PyObject *nlocals=NULL, *stacksize=NULL, *flags=NULL, *replace=NULL, *call_result=NULL, *empty=NULL;
-        const char *fn_cstr=NULL;
-        const char *name_cstr=NULL;
-        PyCodeObject* co=NULL;
-        PyObject *type, *value, *traceback;
-        PyErr_Fetch(&type, &value, &traceback);
-        if (!(kwds=PyDict_New())) goto end;
-        if (!(argcount=PyLong_FromLong(a))) goto end;
-        if (PyDict_SetItemString(kwds, "co_argcount", argcount) != 0) goto end;
-        if (!(posonlyargcount=PyLong_FromLong(0))) goto end;
-        if (PyDict_SetItemString(kwds, "co_posonlyargcount", posonlyargcount) != 0) goto end;
-        if (!(kwonlyargcount=PyLong_FromLong(k))) goto end;
-        if (PyDict_SetItemString(kwds, "co_kwonlyargcount", kwonlyargcount) != 0) goto end;
-        if (!(nlocals=PyLong_FromLong(l))) goto end;
-        if (PyDict_SetItemString(kwds, "co_nlocals", nlocals) != 0) goto end;
-        if (!(stacksize=PyLong_FromLong(s))) goto end;
-        if (PyDict_SetItemString(kwds, "co_stacksize", stacksize) != 0) goto end;
-        if (!(flags=PyLong_FromLong(f))) goto end;
-        if (PyDict_SetItemString(kwds, "co_flags", flags) != 0) goto end;
-        if (PyDict_SetItemString(kwds, "co_code", code) != 0) goto end;
-        if (PyDict_SetItemString(kwds, "co_consts", c) != 0) goto end;
-        if (PyDict_SetItemString(kwds, "co_names", n) != 0) goto end;
-        if (PyDict_SetItemString(kwds, "co_varnames", v) != 0) goto end;
-        if (PyDict_SetItemString(kwds, "co_freevars", fv) != 0) goto end;
-        if (PyDict_SetItemString(kwds, "co_cellvars", cell) != 0) goto end;
-        if (PyDict_SetItemString(kwds, "co_linetable", lnos) != 0) goto end;
-        if (!(fn_cstr=PyUnicode_AsUTF8AndSize(fn, NULL))) goto end;
-        if (!(name_cstr=PyUnicode_AsUTF8AndSize(name, NULL))) goto end;
-        if (!(co = PyCode_NewEmpty(fn_cstr, name_cstr, fline))) goto end;
-        if (!(replace = PyObject_GetAttrString((PyObject*)co, "replace"))) goto cleanup_code_too;
-        if (!(empty = PyTuple_New(0))) goto cleanup_code_too; // unfortunately __pyx_empty_tuple isn't available here
-        if (!(call_result = PyObject_Call(replace, empty, kwds))) goto cleanup_code_too;
-        Py_XDECREF((PyObject*)co);
-        co = (PyCodeObject*)call_result;
-        call_result = NULL;
-        if (0) {
-            cleanup_code_too:
-            Py_XDECREF((PyObject*)co);
-            co = NULL;
-        }
-        end:
-        Py_XDECREF(kwds);
-        Py_XDECREF(argcount);
-        Py_XDECREF(posonlyargcount);
-        Py_XDECREF(kwonlyargcount);
-        Py_XDECREF(nlocals);
-        Py_XDECREF(stacksize);
-        Py_XDECREF(replace);
-        Py_XDECREF(call_result);
-        Py_XDECREF(empty);
-        if (type) {
-            PyErr_Restore(type, value, traceback);
-        }
-        return co;
-    }
-#else
-  #define __Pyx_PyCode_New(a, k, l, s, f, code, c, n, v, fv, cell, fn, name, fline, lnos)\
-          PyCode_New(a, k, l, s, f, code, c, n, v, fv, cell, fn, name, fline, lnos)
-#endif
-  #define __Pyx_DefaultClassType PyType_Type
-#endif
-#ifndef Py_TPFLAGS_CHECKTYPES
-  #define Py_TPFLAGS_CHECKTYPES 0
-#endif
-#ifndef Py_TPFLAGS_HAVE_INDEX
-  #define Py_TPFLAGS_HAVE_INDEX 0
-#endif
-#ifndef Py_TPFLAGS_HAVE_NEWBUFFER
-  #define Py_TPFLAGS_HAVE_NEWBUFFER 0
-#endif
-#ifndef Py_TPFLAGS_HAVE_FINALIZE
-  #define Py_TPFLAGS_HAVE_FINALIZE 0
-#endif
-#ifndef METH_STACKLESS
-  #define METH_STACKLESS 0
-#endif
-#if PY_VERSION_HEX <= 0x030700A3 || !defined(METH_FASTCALL)
-  #ifndef METH_FASTCALL
-     #define METH_FASTCALL 0x80
-  #endif
-  typedef PyObject *(*__Pyx_PyCFunctionFast) (PyObject *self, PyObject *const *args, Py_ssize_t nargs);
-  typedef PyObject *(*__Pyx_PyCFunctionFastWithKeywords) (PyObject *self, PyObject *const *args,
-                                                          Py_ssize_t nargs, PyObject *kwnames);
-#else
-  #define __Pyx_PyCFunctionFast _PyCFunctionFast
-  #define __Pyx_PyCFunctionFastWithKeywords _PyCFunctionFastWithKeywords
-#endif
-#if CYTHON_FAST_PYCCALL
-#define __Pyx_PyFastCFunction_Check(func)\
-    ((PyCFunction_Check(func) && (METH_FASTCALL == (PyCFunction_GET_FLAGS(func) & ~(METH_CLASS | METH_STATIC | METH_COEXIST | METH_KEYWORDS | METH_STACKLESS)))))
-#else
-#define __Pyx_PyFastCFunction_Check(func) 0
-#endif
-#if CYTHON_COMPILING_IN_PYPY && !defined(PyObject_Malloc)
-  #define PyObject_Malloc(s)   PyMem_Malloc(s)
-  #define PyObject_Free(p)     PyMem_Free(p)
-  #define PyObject_Realloc(p)  PyMem_Realloc(p)
-#endif
-#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX < 0x030400A1
-  #define PyMem_RawMalloc(n)           PyMem_Malloc(n)
-  #define PyMem_RawRealloc(p, n)       PyMem_Realloc(p, n)
-  #define PyMem_RawFree(p)             PyMem_Free(p)
-#endif
-#if CYTHON_COMPILING_IN_PYSTON
-  #define __Pyx_PyCode_HasFreeVars(co)  PyCode_HasFreeVars(co)
-  #define __Pyx_PyFrame_SetLineNumber(frame, lineno) PyFrame_SetLineNumber(frame, lineno)
-#else
-  #define __Pyx_PyCode_HasFreeVars(co)  (PyCode_GetNumFree(co) > 0)
-  #define __Pyx_PyFrame_SetLineNumber(frame, lineno)  (frame)->f_lineno = (lineno)
-#endif
-#if !CYTHON_FAST_THREAD_STATE || PY_VERSION_HEX < 0x02070000
-  #define __Pyx_PyThreadState_Current PyThreadState_GET()
-#elif PY_VERSION_HEX >= 0x03060000
-  #define __Pyx_PyThreadState_Current _PyThreadState_UncheckedGet()
-#elif PY_VERSION_HEX >= 0x03000000
-  #define __Pyx_PyThreadState_Current PyThreadState_GET()
-#else
-  #define __Pyx_PyThreadState_Current _PyThreadState_Current
-#endif
-#if PY_VERSION_HEX < 0x030700A2 && !defined(PyThread_tss_create) && !defined(Py_tss_NEEDS_INIT)
-#include "pythread.h"
-#define Py_tss_NEEDS_INIT 0
-typedef int Py_tss_t;
-static CYTHON_INLINE int PyThread_tss_create(Py_tss_t *key) {
-  *key = PyThread_create_key();
-  return 0;
-}
-static CYTHON_INLINE Py_tss_t * PyThread_tss_alloc(void) {
-  Py_tss_t *key = (Py_tss_t *)PyObject_Malloc(sizeof(Py_tss_t));
-  *key = Py_tss_NEEDS_INIT;
-  return key;
-}
-static CYTHON_INLINE void PyThread_tss_free(Py_tss_t *key) {
-  PyObject_Free(key);
-}
-static CYTHON_INLINE int PyThread_tss_is_created(Py_tss_t *key) {
-  return *key != Py_tss_NEEDS_INIT;
-}
-static CYTHON_INLINE void PyThread_tss_delete(Py_tss_t *key) {
-  PyThread_delete_key(*key);
-  *key = Py_tss_NEEDS_INIT;
-}
-static CYTHON_INLINE int PyThread_tss_set(Py_tss_t *key, void *value) {
-  return PyThread_set_key_value(*key, value);
-}
-static CYTHON_INLINE void * PyThread_tss_get(Py_tss_t *key) {
-  return PyThread_get_key_value(*key);
-}
-#endif
-#if CYTHON_COMPILING_IN_CPYTHON || defined(_PyDict_NewPresized)
-#define __Pyx_PyDict_NewPresized(n)  ((n <= 8) ? PyDict_New() : _PyDict_NewPresized(n))
-#else
-#define __Pyx_PyDict_NewPresized(n)  PyDict_New()
-#endif
-#if PY_MAJOR_VERSION >= 3 || CYTHON_FUTURE_DIVISION
-  #define __Pyx_PyNumber_Divide(x,y)         PyNumber_TrueDivide(x,y)
-  #define __Pyx_PyNumber_InPlaceDivide(x,y)  PyNumber_InPlaceTrueDivide(x,y)
-#else
-  #define __Pyx_PyNumber_Divide(x,y)         PyNumber_Divide(x,y)
-  #define __Pyx_PyNumber_InPlaceDivide(x,y)  PyNumber_InPlaceDivide(x,y)
-#endif
-#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030500A1 && CYTHON_USE_UNICODE_INTERNALS
-#define __Pyx_PyDict_GetItemStr(dict, name)  _PyDict_GetItem_KnownHash(dict, name, ((PyASCIIObject *) name)->hash)
-#else
-#define __Pyx_PyDict_GetItemStr(dict, name)  PyDict_GetItem(dict, name)
-#endif
-#if PY_VERSION_HEX > 0x03030000 && defined(PyUnicode_KIND)
-  #define CYTHON_PEP393_ENABLED 1
-  #if defined(PyUnicode_IS_READY)
-  #define __Pyx_PyUnicode_READY(op)       (likely(PyUnicode_IS_READY(op)) ?\
-                                              0 : _PyUnicode_Ready((PyObject *)(op)))
-  #else
-  #define __Pyx_PyUnicode_READY(op)       (0)
-  #endif
-  #define __Pyx_PyUnicode_GET_LENGTH(u)   PyUnicode_GET_LENGTH(u)
-  #define __Pyx_PyUnicode_READ_CHAR(u, i) PyUnicode_READ_CHAR(u, i)
-  #define __Pyx_PyUnicode_MAX_CHAR_VALUE(u)   PyUnicode_MAX_CHAR_VALUE(u)
-  #define __Pyx_PyUnicode_KIND(u)         PyUnicode_KIND(u)
-  #define __Pyx_PyUnicode_DATA(u)         PyUnicode_DATA(u)
-  #define __Pyx_PyUnicode_READ(k, d, i)   PyUnicode_READ(k, d, i)
-  #define __Pyx_PyUnicode_WRITE(k, d, i, ch)  PyUnicode_WRITE(k, d, i, ch)
-  #if defined(PyUnicode_IS_READY) && defined(PyUnicode_GET_SIZE)
-  #if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x03090000
-  #define __Pyx_PyUnicode_IS_TRUE(u)      (0 != (likely(PyUnicode_IS_READY(u)) ? PyUnicode_GET_LENGTH(u) : ((PyCompactUnicodeObject *)(u))->wstr_length))
-  #else
-  #define __Pyx_PyUnicode_IS_TRUE(u)      (0 != (likely(PyUnicode_IS_READY(u)) ? PyUnicode_GET_LENGTH(u) : PyUnicode_GET_SIZE(u)))
-  #endif
-  #else
-  #define __Pyx_PyUnicode_IS_TRUE(u)      (0 != PyUnicode_GET_LENGTH(u))
-  #endif
-#else
-  #define CYTHON_PEP393_ENABLED 0
-  #define PyUnicode_1BYTE_KIND  1
-  #define PyUnicode_2BYTE_KIND  2
-  #define PyUnicode_4BYTE_KIND  4
-  #define __Pyx_PyUnicode_READY(op)       (0)
-  #define __Pyx_PyUnicode_GET_LENGTH(u)   PyUnicode_GET_SIZE(u)
-  #define __Pyx_PyUnicode_READ_CHAR(u, i) ((Py_UCS4)(PyUnicode_AS_UNICODE(u)[i]))
-  #define __Pyx_PyUnicode_MAX_CHAR_VALUE(u)   ((sizeof(Py_UNICODE) == 2) ? 65535 : 1114111)
-  #define __Pyx_PyUnicode_KIND(u)         (sizeof(Py_UNICODE))
-  #define __Pyx_PyUnicode_DATA(u)         ((void*)PyUnicode_AS_UNICODE(u))
-  #define __Pyx_PyUnicode_READ(k, d, i)   ((void)(k), (Py_UCS4)(((Py_UNICODE*)d)[i]))
-  #define __Pyx_PyUnicode_WRITE(k, d, i, ch)  (((void)(k)), ((Py_UNICODE*)d)[i] = ch)
-  #define __Pyx_PyUnicode_IS_TRUE(u)      (0 != PyUnicode_GET_SIZE(u))
-#endif
-#if CYTHON_COMPILING_IN_PYPY
-  #define __Pyx_PyUnicode_Concat(a, b)      PyNumber_Add(a, b)
-  #define __Pyx_PyUnicode_ConcatSafe(a, b)  PyNumber_Add(a, b)
-#else
-  #define __Pyx_PyUnicode_Concat(a, b)      PyUnicode_Concat(a, b)
-  #define __Pyx_PyUnicode_ConcatSafe(a, b)  ((unlikely((a) == Py_None) || unlikely((b) == Py_None)) ?\
-      PyNumber_Add(a, b) : __Pyx_PyUnicode_Concat(a, b))
-#endif
-#if CYTHON_COMPILING_IN_PYPY && !defined(PyUnicode_Contains)
-  #define PyUnicode_Contains(u, s)  PySequence_Contains(u, s)
-#endif
-#if CYTHON_COMPILING_IN_PYPY && !defined(PyByteArray_Check)
-  #define PyByteArray_Check(obj)  PyObject_TypeCheck(obj, &PyByteArray_Type)
-#endif
-#if CYTHON_COMPILING_IN_PYPY && !defined(PyObject_Format)
-  #define PyObject_Format(obj, fmt)  PyObject_CallMethod(obj, "__format__", "O", fmt)
-#endif
-#define __Pyx_PyString_FormatSafe(a, b)   ((unlikely((a) == Py_None || (PyString_Check(b) && !PyString_CheckExact(b)))) ? PyNumber_Remainder(a, b) : __Pyx_PyString_Format(a, b))
-#define __Pyx_PyUnicode_FormatSafe(a, b)  ((unlikely((a) == Py_None || (PyUnicode_Check(b) && !PyUnicode_CheckExact(b)))) ? PyNumber_Remainder(a, b) : PyUnicode_Format(a, b))
-#if PY_MAJOR_VERSION >= 3
-  #define __Pyx_PyString_Format(a, b)  PyUnicode_Format(a, b)
-#else
-  #define __Pyx_PyString_Format(a, b)  PyString_Format(a, b)
-#endif
-#if PY_MAJOR_VERSION < 3 && !defined(PyObject_ASCII)
-  #define PyObject_ASCII(o)            PyObject_Repr(o)
-#endif
-#if PY_MAJOR_VERSION >= 3
-  #define PyBaseString_Type            PyUnicode_Type
-  #define PyStringObject               PyUnicodeObject
-  #define PyString_Type                PyUnicode_Type
-  #define PyString_Check               PyUnicode_Check
-  #define PyString_CheckExact          PyUnicode_CheckExact
-#ifndef PyObject_Unicode
-  #define PyObject_Unicode             PyObject_Str
-#endif
-#endif
-#if PY_MAJOR_VERSION >= 3
-  #define __Pyx_PyBaseString_Check(obj) PyUnicode_Check(obj)
-  #define __Pyx_PyBaseString_CheckExact(obj) PyUnicode_CheckExact(obj)
-#else
-  #define __Pyx_PyBaseString_Check(obj) (PyString_Check(obj) || PyUnicode_Check(obj))
-  #define __Pyx_PyBaseString_CheckExact(obj) (PyString_CheckExact(obj) || PyUnicode_CheckExact(obj))
-#endif
-#ifndef PySet_CheckExact
-  #define PySet_CheckExact(obj)        (Py_TYPE(obj) == &PySet_Type)
-#endif
-#if PY_VERSION_HEX >= 0x030900A4
-  #define __Pyx_SET_REFCNT(obj, refcnt) Py_SET_REFCNT(obj, refcnt)
-  #define __Pyx_SET_SIZE(obj, size) Py_SET_SIZE(obj, size)
-#else
-  #define __Pyx_SET_REFCNT(obj, refcnt) Py_REFCNT(obj) = (refcnt)
-  #define __Pyx_SET_SIZE(obj, size) Py_SIZE(obj) = (size)
-#endif
-#if CYTHON_ASSUME_SAFE_MACROS
-  #define __Pyx_PySequence_SIZE(seq)  Py_SIZE(seq)
-#else
-  #define __Pyx_PySequence_SIZE(seq)  PySequence_Size(seq)
-#endif
-#if PY_MAJOR_VERSION >= 3
-  #define PyIntObject                  PyLongObject
-  #define PyInt_Type                   PyLong_Type
-  #define PyInt_Check(op)              PyLong_Check(op)
-  #define PyInt_CheckExact(op)         PyLong_CheckExact(op)
-  #define PyInt_FromString             PyLong_FromString
-  #define PyInt_FromUnicode            PyLong_FromUnicode
-  #define PyInt_FromLong               PyLong_FromLong
-  #define PyInt_FromSize_t             PyLong_FromSize_t
-  #define PyInt_FromSsize_t            PyLong_FromSsize_t
-  #define PyInt_AsLong                 PyLong_AsLong
-  #define PyInt_AS_LONG                PyLong_AS_LONG
-  #define PyInt_AsSsize_t              PyLong_AsSsize_t
-  #define PyInt_AsUnsignedLongMask     PyLong_AsUnsignedLongMask
-  #define PyInt_AsUnsignedLongLongMask PyLong_AsUnsignedLongLongMask
-  #define PyNumber_Int                 PyNumber_Long
-#endif
-#if PY_MAJOR_VERSION >= 3
-  #define PyBoolObject                 PyLongObject
-#endif
-#if PY_MAJOR_VERSION >= 3 && CYTHON_COMPILING_IN_PYPY
-  #ifndef PyUnicode_InternFromString
-    #define PyUnicode_InternFromString(s) PyUnicode_FromString(s)
-  #endif
-#endif
-#if PY_VERSION_HEX < 0x030200A4
-  typedef long Py_hash_t;
-  #define __Pyx_PyInt_FromHash_t PyInt_FromLong
-  #define __Pyx_PyInt_AsHash_t   __Pyx_PyIndex_AsHash_t
-#else
-  #define __Pyx_PyInt_FromHash_t PyInt_FromSsize_t
-  #define __Pyx_PyInt_AsHash_t   __Pyx_PyIndex_AsSsize_t
-#endif
-#if PY_MAJOR_VERSION >= 3
-  #define __Pyx_PyMethod_New(func, self, klass) ((self) ? ((void)(klass), PyMethod_New(func, self)) : __Pyx_NewRef(func))
-#else
-  #define __Pyx_PyMethod_New(func, self, klass) PyMethod_New(func, self, klass)
-#endif
-#if CYTHON_USE_ASYNC_SLOTS
-  #if PY_VERSION_HEX >= 0x030500B1
-    #define __Pyx_PyAsyncMethodsStruct PyAsyncMethods
-    #define __Pyx_PyType_AsAsync(obj) (Py_TYPE(obj)->tp_as_async)
-  #else
-    #define __Pyx_PyType_AsAsync(obj) ((__Pyx_PyAsyncMethodsStruct*) (Py_TYPE(obj)->tp_reserved))
-  #endif
-#else
-  #define __Pyx_PyType_AsAsync(obj) NULL
-#endif
-#ifndef __Pyx_PyAsyncMethodsStruct
-    typedef struct {
-        unaryfunc am_await;
-        unaryfunc am_aiter;
-        unaryfunc am_anext;
-    } __Pyx_PyAsyncMethodsStruct;
-#endif
-
-#if defined(WIN32) || defined(MS_WINDOWS)
-  #define _USE_MATH_DEFINES
-#endif
-#include <math.h>
-#ifdef NAN
-#define __PYX_NAN() ((float) NAN)
-#else
-static CYTHON_INLINE float __PYX_NAN() {
-  float value;
-  memset(&value, 0xFF, sizeof(value));
-  return value;
-}
-#endif
-#if defined(__CYGWIN__) && defined(_LDBL_EQ_DBL)
-#define __Pyx_truncl trunc
-#else
-#define __Pyx_truncl truncl
-#endif
-
-#define __PYX_MARK_ERR_POS(f_index, lineno) \
-    { __pyx_filename = __pyx_f[f_index]; (void)__pyx_filename; __pyx_lineno = lineno; (void)__pyx_lineno; __pyx_clineno = __LINE__; (void)__pyx_clineno; }
-#define __PYX_ERR(f_index, lineno, Ln_error) \
-    { __PYX_MARK_ERR_POS(f_index, lineno) goto Ln_error; }
-
-#ifndef __PYX_EXTERN_C
-  #ifdef __cplusplus
-    #define __PYX_EXTERN_C extern "C"
-  #else
-    #define __PYX_EXTERN_C extern
-  #endif
-#endif
-
-#define __PYX_HAVE__graphsaint__cython_sampler
-#define __PYX_HAVE_API__graphsaint__cython_sampler
-/* Early includes */
-#include "ios"
-#include "new"
-#include "stdexcept"
-#include "typeinfo"
-#include <vector>
-#include <algorithm>
-#include <utility>
-
-    #if __cplusplus >= 201103L || (defined(_MSC_VER) && _MSC_VER >= 1600)
-    // move should be defined for these versions of MSVC, but __cplusplus isn't set usefully
-    #include <type_traits>
-
-    namespace cython_std {
-    template <typename T> typename std::remove_reference<T>::type&& move(T& t) noexcept { return std::move(t); }
-    template <typename T> typename std::remove_reference<T>::type&& move(T&& t) noexcept { return std::move(t); }
-    }
-
-    #endif
-    
-#include <map>
-#include <unordered_map>
-#include <string.h>
-#include <stdio.h>
-#include "numpy/arrayobject.h"
-#include "numpy/ndarrayobject.h"
-#include "numpy/ndarraytypes.h"
-#include "numpy/arrayscalars.h"
-#include "numpy/ufuncobject.h"
-
-    /* NumPy API declarations from "numpy/__init__.pxd" */
-    
-#include <stdlib.h>
-#include "stdlib.h"
-#ifdef _OPENMP
-#include <omp.h>
-#endif /* _OPENMP */
-
-#if defined(PYREX_WITHOUT_ASSERTIONS) && !defined(CYTHON_WITHOUT_ASSERTIONS)
-#define CYTHON_WITHOUT_ASSERTIONS
-#endif
-
-typedef struct {PyObject **p; const char *s; const Py_ssize_t n; const char* encoding;
-                const char is_unicode; const char is_str; const char intern; } __Pyx_StringTabEntry;
-
-#define __PYX_DEFAULT_STRING_ENCODING_IS_ASCII 0
-#define __PYX_DEFAULT_STRING_ENCODING_IS_UTF8 0
-#define __PYX_DEFAULT_STRING_ENCODING_IS_DEFAULT (PY_MAJOR_VERSION >= 3 && __PYX_DEFAULT_STRING_ENCODING_IS_UTF8)
-#define __PYX_DEFAULT_STRING_ENCODING ""
-#define __Pyx_PyObject_FromString __Pyx_PyBytes_FromString
-#define __Pyx_PyObject_FromStringAndSize __Pyx_PyBytes_FromStringAndSize
-#define __Pyx_uchar_cast(c) ((unsigned char)c)
-#define __Pyx_long_cast(x) ((long)x)
-#define __Pyx_fits_Py_ssize_t(v, type, is_signed)  (\
-    (sizeof(type) < sizeof(Py_ssize_t))  ||\
-    (sizeof(type) > sizeof(Py_ssize_t) &&\
-          likely(v < (type)PY_SSIZE_T_MAX ||\
-                 v == (type)PY_SSIZE_T_MAX)  &&\
-          (!is_signed || likely(v > (type)PY_SSIZE_T_MIN ||\
-                                v == (type)PY_SSIZE_T_MIN)))  ||\
-    (sizeof(type) == sizeof(Py_ssize_t) &&\
-          (is_signed || likely(v < (type)PY_SSIZE_T_MAX ||\
-                               v == (type)PY_SSIZE_T_MAX)))  )
-static CYTHON_INLINE int __Pyx_is_valid_index(Py_ssize_t i, Py_ssize_t limit) {
-    return (size_t) i < (size_t) limit;
-}
-#if defined (__cplusplus) && __cplusplus >= 201103L
-    #include <cstdlib>
-    #define __Pyx_sst_abs(value) std::abs(value)
-#elif SIZEOF_INT >= SIZEOF_SIZE_T
-    #define __Pyx_sst_abs(value) abs(value)
-#elif SIZEOF_LONG >= SIZEOF_SIZE_T
-    #define __Pyx_sst_abs(value) labs(value)
-#elif defined (_MSC_VER)
-    #define __Pyx_sst_abs(value) ((Py_ssize_t)_abs64(value))
-#elif defined (__STDC_VERSION__) && __STDC_VERSION__ >= 199901L
-    #define __Pyx_sst_abs(value) llabs(value)
-#elif defined (__GNUC__)
-    #define __Pyx_sst_abs(value) __builtin_llabs(value)
-#else
-    #define __Pyx_sst_abs(value) ((value<0) ? -value : value)
-#endif
-static CYTHON_INLINE const char* __Pyx_PyObject_AsString(PyObject*);
-static CYTHON_INLINE const char* __Pyx_PyObject_AsStringAndSize(PyObject*, Py_ssize_t* length);
-#define __Pyx_PyByteArray_FromString(s) PyByteArray_FromStringAndSize((const char*)s, strlen((const char*)s))
-#define __Pyx_PyByteArray_FromStringAndSize(s, l) PyByteArray_FromStringAndSize((const char*)s, l)
-#define __Pyx_PyBytes_FromString        PyBytes_FromString
-#define __Pyx_PyBytes_FromStringAndSize PyBytes_FromStringAndSize
-static CYTHON_INLINE PyObject* __Pyx_PyUnicode_FromString(const char*);
-#if PY_MAJOR_VERSION < 3
-    #define __Pyx_PyStr_FromString        __Pyx_PyBytes_FromString
-    #define __Pyx_PyStr_FromStringAndSize __Pyx_PyBytes_FromStringAndSize
-#else
-    #define __Pyx_PyStr_FromString        __Pyx_PyUnicode_FromString
-    #define __Pyx_PyStr_FromStringAndSize __Pyx_PyUnicode_FromStringAndSize
-#endif
-#define __Pyx_PyBytes_AsWritableString(s)     ((char*) PyBytes_AS_STRING(s))
-#define __Pyx_PyBytes_AsWritableSString(s)    ((signed char*) PyBytes_AS_STRING(s))
-#define __Pyx_PyBytes_AsWritableUString(s)    ((unsigned char*) PyBytes_AS_STRING(s))
-#define __Pyx_PyBytes_AsString(s)     ((const char*) PyBytes_AS_STRING(s))
-#define __Pyx_PyBytes_AsSString(s)    ((const signed char*) PyBytes_AS_STRING(s))
-#define __Pyx_PyBytes_AsUString(s)    ((const unsigned char*) PyBytes_AS_STRING(s))
-#define __Pyx_PyObject_AsWritableString(s)    ((char*) __Pyx_PyObject_AsString(s))
-#define __Pyx_PyObject_AsWritableSString(s)    ((signed char*) __Pyx_PyObject_AsString(s))
-#define __Pyx_PyObject_AsWritableUString(s)    ((unsigned char*) __Pyx_PyObject_AsString(s))
-#define __Pyx_PyObject_AsSString(s)    ((const signed char*) __Pyx_PyObject_AsString(s))
-#define __Pyx_PyObject_AsUString(s)    ((const unsigned char*) __Pyx_PyObject_AsString(s))
-#define __Pyx_PyObject_FromCString(s)  __Pyx_PyObject_FromString((const char*)s)
-#define __Pyx_PyBytes_FromCString(s)   __Pyx_PyBytes_FromString((const char*)s)
-#define __Pyx_PyByteArray_FromCString(s)   __Pyx_PyByteArray_FromString((const char*)s)
-#define __Pyx_PyStr_FromCString(s)     __Pyx_PyStr_FromString((const char*)s)
-#define __Pyx_PyUnicode_FromCString(s) __Pyx_PyUnicode_FromString((const char*)s)
-static CYTHON_INLINE size_t __Pyx_Py_UNICODE_strlen(const Py_UNICODE *u) {
-    const Py_UNICODE *u_end = u;
-    while (*u_end++) ;
-    return (size_t)(u_end - u - 1);
-}
-#define __Pyx_PyUnicode_FromUnicode(u)       PyUnicode_FromUnicode(u, __Pyx_Py_UNICODE_strlen(u))
-#define __Pyx_PyUnicode_FromUnicodeAndLength PyUnicode_FromUnicode
-#define __Pyx_PyUnicode_AsUnicode            PyUnicode_AsUnicode
-#define __Pyx_NewRef(obj) (Py_INCREF(obj), obj)
-#define __Pyx_Owned_Py_None(b) __Pyx_NewRef(Py_None)
-static CYTHON_INLINE PyObject * __Pyx_PyBool_FromLong(long b);
-static CYTHON_INLINE int __Pyx_PyObject_IsTrue(PyObject*);
-static CYTHON_INLINE int __Pyx_PyObject_IsTrueAndDecref(PyObject*);
-static CYTHON_INLINE PyObject* __Pyx_PyNumber_IntOrLong(PyObject* x);
-#define __Pyx_PySequence_Tuple(obj)\
-    (likely(PyTuple_CheckExact(obj)) ? __Pyx_NewRef(obj) : PySequence_Tuple(obj))
-static CYTHON_INLINE Py_ssize_t __Pyx_PyIndex_AsSsize_t(PyObject*);
-static CYTHON_INLINE PyObject * __Pyx_PyInt_FromSize_t(size_t);
-static CYTHON_INLINE Py_hash_t __Pyx_PyIndex_AsHash_t(PyObject*);
-#if CYTHON_ASSUME_SAFE_MACROS
-#define __pyx_PyFloat_AsDouble(x) (PyFloat_CheckExact(x) ? PyFloat_AS_DOUBLE(x) : PyFloat_AsDouble(x))
-#else
-#define __pyx_PyFloat_AsDouble(x) PyFloat_AsDouble(x)
-#endif
-#define __pyx_PyFloat_AsFloat(x) ((float) __pyx_PyFloat_AsDouble(x))
-#if PY_MAJOR_VERSION >= 3
-#define __Pyx_PyNumber_Int(x) (PyLong_CheckExact(x) ? __Pyx_NewRef(x) : PyNumber_Long(x))
-#else
-#define __Pyx_PyNumber_Int(x) (PyInt_CheckExact(x) ? __Pyx_NewRef(x) : PyNumber_Int(x))
-#endif
-#define __Pyx_PyNumber_Float(x) (PyFloat_CheckExact(x) ? __Pyx_NewRef(x) : PyNumber_Float(x))
-#if PY_MAJOR_VERSION < 3 && __PYX_DEFAULT_STRING_ENCODING_IS_ASCII
-static int __Pyx_sys_getdefaultencoding_not_ascii;
-static int __Pyx_init_sys_getdefaultencoding_params(void) {
-    PyObject* sys;
-    PyObject* default_encoding = NULL;
-    PyObject* ascii_chars_u = NULL;
-    PyObject* ascii_chars_b = NULL;
-    const char* default_encoding_c;
-    sys = PyImport_ImportModule("sys");
-    if (!sys) goto bad;
-    default_encoding = PyObject_CallMethod(sys, (char*) "getdefaultencoding", NULL);
-    Py_DECREF(sys);
-    if (!default_encoding) goto bad;
-    default_encoding_c = PyBytes_AsString(default_encoding);
-    if (!default_encoding_c) goto bad;
-    if (strcmp(default_encoding_c, "ascii") == 0) {
-        __Pyx_sys_getdefaultencoding_not_ascii = 0;
-    } else {
-        char ascii_chars[128];
-        int c;
-        for (c = 0; c < 128; c++) {
-            ascii_chars[c] = c;
-        }
-        __Pyx_sys_getdefaultencoding_not_ascii = 1;
-        ascii_chars_u = PyUnicode_DecodeASCII(ascii_chars, 128, NULL);
-        if (!ascii_chars_u) goto bad;
-        ascii_chars_b = PyUnicode_AsEncodedString(ascii_chars_u, default_encoding_c, NULL);
-        if (!ascii_chars_b || !PyBytes_Check(ascii_chars_b) || memcmp(ascii_chars, PyBytes_AS_STRING(ascii_chars_b), 128) != 0) {
-            PyErr_Format(
-                PyExc_ValueError,
-                "This module compiled with c_string_encoding=ascii, but default encoding '%.200s' is not a superset of ascii.",
-                default_encoding_c);
-            goto bad;
-        }
-        Py_DECREF(ascii_chars_u);
-        Py_DECREF(ascii_chars_b);
-    }
-    Py_DECREF(default_encoding);
-    return 0;
-bad:
-    Py_XDECREF(default_encoding);
-    Py_XDECREF(ascii_chars_u);
-    Py_XDECREF(ascii_chars_b);
-    return -1;
-}
-#endif
-#if __PYX_DEFAULT_STRING_ENCODING_IS_DEFAULT && PY_MAJOR_VERSION >= 3
-#define __Pyx_PyUnicode_FromStringAndSize(c_str, size) PyUnicode_DecodeUTF8(c_str, size, NULL)
-#else
-#define __Pyx_PyUnicode_FromStringAndSize(c_str, size) PyUnicode_Decode(c_str, size, __PYX_DEFAULT_STRING_ENCODING, NULL)
-#if __PYX_DEFAULT_STRING_ENCODING_IS_DEFAULT
-static char* __PYX_DEFAULT_STRING_ENCODING;
-static int __Pyx_init_sys_getdefaultencoding_params(void) {
-    PyObject* sys;
-    PyObject* default_encoding = NULL;
-    char* default_encoding_c;
-    sys = PyImport_ImportModule("sys");
-    if (!sys) goto bad;
-    default_encoding = PyObject_CallMethod(sys, (char*) (const char*) "getdefaultencoding", NULL);
-    Py_DECREF(sys);
-    if (!default_encoding) goto bad;
-    default_encoding_c = PyBytes_AsString(default_encoding);
-    if (!default_encoding_c) goto bad;
-    __PYX_DEFAULT_STRING_ENCODING = (char*) malloc(strlen(default_encoding_c) + 1);
-    if (!__PYX_DEFAULT_STRING_ENCODING) goto bad;
-    strcpy(__PYX_DEFAULT_STRING_ENCODING, default_encoding_c);
-    Py_DECREF(default_encoding);
-    return 0;
-bad:
-    Py_XDECREF(default_encoding);
-    return -1;
-}
-#endif
-#endif
-
-
-/* Test for GCC > 2.95 */
-#if defined(__GNUC__)     && (__GNUC__ > 2 || (__GNUC__ == 2 && (__GNUC_MINOR__ > 95)))
-  #define likely(x)   __builtin_expect(!!(x), 1)
-  #define unlikely(x) __builtin_expect(!!(x), 0)
-#else /* !__GNUC__ or GCC < 2.95 */
-  #define likely(x)   (x)
-  #define unlikely(x) (x)
-#endif /* __GNUC__ */
-static CYTHON_INLINE void __Pyx_pretend_to_initialize(void* ptr) { (void)ptr; }
-
-static PyObject *__pyx_m = NULL;
-static PyObject *__pyx_d;
-static PyObject *__pyx_b;
-static PyObject *__pyx_cython_runtime = NULL;
-static PyObject *__pyx_empty_tuple;
-static PyObject *__pyx_empty_bytes;
-static PyObject *__pyx_empty_unicode;
-static int __pyx_lineno;
-static int __pyx_clineno = 0;
-static const char * __pyx_cfilenm= __FILE__;
-static const char *__pyx_filename;
-
-/* Header.proto */
-#if !defined(CYTHON_CCOMPLEX)
-  #if defined(__cplusplus)
-    #define CYTHON_CCOMPLEX 1
-  #elif defined(_Complex_I)
-    #define CYTHON_CCOMPLEX 1
-  #else
-    #define CYTHON_CCOMPLEX 0
-  #endif
-#endif
-#if CYTHON_CCOMPLEX
-  #ifdef __cplusplus
-    #include <complex>
-  #else
-    #include <complex.h>
-  #endif
-#endif
-#if CYTHON_CCOMPLEX && !defined(__cplusplus) && defined(__sun__) && defined(__GNUC__)
-  #undef _Complex_I
-  #define _Complex_I 1.0fj
-#endif
-
-
-static const char *__pyx_f[] = {
-  "graphsaint/cython_sampler.pyx",
-  "stringsource",
-  "__init__.pxd",
-  "graphsaint/cython_utils.pxd",
-  "type.pxd",
-};
-/* BufferFormatStructs.proto */
-#define IS_UNSIGNED(type) (((type) -1) > 0)
-struct __Pyx_StructField_;
-#define __PYX_BUF_FLAGS_PACKED_STRUCT (1 << 0)
-typedef struct {
-  const char* name;
-  struct __Pyx_StructField_* fields;
-  size_t size;
-  size_t arraysize[8];
-  int ndim;
-  char typegroup;
-  char is_unsigned;
-  int flags;
-} __Pyx_TypeInfo;
-typedef struct __Pyx_StructField_ {
-  __Pyx_TypeInfo* type;
-  const char* name;
-  size_t offset;
-} __Pyx_StructField;
-typedef struct {
-  __Pyx_StructField* field;
-  size_t parent_offset;
-} __Pyx_BufFmt_StackElem;
-typedef struct {
-  __Pyx_StructField root;
-  __Pyx_BufFmt_StackElem* head;
-  size_t fmt_offset;
-  size_t new_count, enc_count;
-  size_t struct_alignment;
-  int is_complex;
-  char enc_type;
-  char new_packmode;
-  char enc_packmode;
-  char is_valid_array;
-} __Pyx_BufFmt_Context;
-
-/* ForceInitThreads.proto */
-#ifndef __PYX_FORCE_INIT_THREADS
-  #define __PYX_FORCE_INIT_THREADS 0
-#endif
-
-/* NoFastGil.proto */
-#define __Pyx_PyGILState_Ensure PyGILState_Ensure
-#define __Pyx_PyGILState_Release PyGILState_Release
-#define __Pyx_FastGIL_Remember()
-#define __Pyx_FastGIL_Forget()
-#define __Pyx_FastGilFuncInit()
-
-
-/* "../anaconda3/envs/ogb/lib/python3.7/site-packages/numpy/__init__.pxd":690
- * # in Cython to enable them only on the right systems.
- * 
- * ctypedef npy_int8       int8_t             # <<<<<<<<<<<<<<
- * ctypedef npy_int16      int16_t
- * ctypedef npy_int32      int32_t
- */
-typedef npy_int8 __pyx_t_5numpy_int8_t;
-
-/* "../anaconda3/envs/ogb/lib/python3.7/site-packages/numpy/__init__.pxd":691
- * 
- * ctypedef npy_int8       int8_t
- * ctypedef npy_int16      int16_t             # <<<<<<<<<<<<<<
- * ctypedef npy_int32      int32_t
- * ctypedef npy_int64      int64_t
- */
-typedef npy_int16 __pyx_t_5numpy_int16_t;
-
-/* "../anaconda3/envs/ogb/lib/python3.7/site-packages/numpy/__init__.pxd":692
- * ctypedef npy_int8       int8_t
- * ctypedef npy_int16      int16_t
- * ctypedef npy_int32      int32_t             # <<<<<<<<<<<<<<
- * ctypedef npy_int64      int64_t
- * #ctypedef npy_int96      int96_t
- */
-typedef npy_int32 __pyx_t_5numpy_int32_t;
-
-/* "../anaconda3/envs/ogb/lib/python3.7/site-packages/numpy/__init__.pxd":693
- * ctypedef npy_int16      int16_t
- * ctypedef npy_int32      int32_t
- * ctypedef npy_int64      int64_t             # <<<<<<<<<<<<<<
- * #ctypedef npy_int96      int96_t
- * #ctypedef npy_int128     int128_t
- */
-typedef npy_int64 __pyx_t_5numpy_int64_t;
-
-/* "../anaconda3/envs/ogb/lib/python3.7/site-packages/numpy/__init__.pxd":697
- * #ctypedef npy_int128     int128_t
- * 
- * ctypedef npy_uint8      uint8_t             # <<<<<<<<<<<<<<
- * ctypedef npy_uint16     uint16_t
- * ctypedef npy_uint32     uint32_t
- */
-typedef npy_uint8 __pyx_t_5numpy_uint8_t;
-
-/* "../anaconda3/envs/ogb/lib/python3.7/site-packages/numpy/__init__.pxd":698
- * 
- * ctypedef npy_uint8      uint8_t
- * ctypedef npy_uint16     uint16_t             # <<<<<<<<<<<<<<
- * ctypedef npy_uint32     uint32_t
- * ctypedef npy_uint64     uint64_t
- */
-typedef npy_uint16 __pyx_t_5numpy_uint16_t;
-
-/* "../anaconda3/envs/ogb/lib/python3.7/site-packages/numpy/__init__.pxd":699
- * ctypedef npy_uint8      uint8_t
- * ctypedef npy_uint16     uint16_t
- * ctypedef npy_uint32     uint32_t             # <<<<<<<<<<<<<<
- * ctypedef npy_uint64     uint64_t
- * #ctypedef npy_uint96     uint96_t
- */
-typedef npy_uint32 __pyx_t_5numpy_uint32_t;
-
-/* "../anaconda3/envs/ogb/lib/python3.7/site-packages/numpy/__init__.pxd":700
- * ctypedef npy_uint16     uint16_t
- * ctypedef npy_uint32     uint32_t
- * ctypedef npy_uint64     uint64_t             # <<<<<<<<<<<<<<
- * #ctypedef npy_uint96     uint96_t
- * #ctypedef npy_uint128    uint128_t
- */
-typedef npy_uint64 __pyx_t_5numpy_uint64_t;
-
-/* "../anaconda3/envs/ogb/lib/python3.7/site-packages/numpy/__init__.pxd":704
- * #ctypedef npy_uint128    uint128_t
- * 
- * ctypedef npy_float32    float32_t             # <<<<<<<<<<<<<<
- * ctypedef npy_float64    float64_t
- * #ctypedef npy_float80    float80_t
- */
-typedef npy_float32 __pyx_t_5numpy_float32_t;
-
-/* "../anaconda3/envs/ogb/lib/python3.7/site-packages/numpy/__init__.pxd":705
- * 
- * ctypedef npy_float32    float32_t
- * ctypedef npy_float64    float64_t             # <<<<<<<<<<<<<<
- * #ctypedef npy_float80    float80_t
- * #ctypedef npy_float128   float128_t
- */
-typedef npy_float64 __pyx_t_5numpy_float64_t;
-
-/* "../anaconda3/envs/ogb/lib/python3.7/site-packages/numpy/__init__.pxd":714
- * # The int types are mapped a bit surprising --
- * # numpy.int corresponds to 'l' and numpy.long to 'q'
- * ctypedef npy_long       int_t             # <<<<<<<<<<<<<<
- * ctypedef npy_longlong   long_t
- * ctypedef npy_longlong   longlong_t
- */
-typedef npy_long __pyx_t_5numpy_int_t;
-
-/* "../anaconda3/envs/ogb/lib/python3.7/site-packages/numpy/__init__.pxd":715
- * # numpy.int corresponds to 'l' and numpy.long to 'q'
- * ctypedef npy_long       int_t
- * ctypedef npy_longlong   long_t             # <<<<<<<<<<<<<<
- * ctypedef npy_longlong   longlong_t
- * 
- */
-typedef npy_longlong __pyx_t_5numpy_long_t;
-
-/* "../anaconda3/envs/ogb/lib/python3.7/site-packages/numpy/__init__.pxd":716
- * ctypedef npy_long       int_t
- * ctypedef npy_longlong   long_t
- * ctypedef npy_longlong   longlong_t             # <<<<<<<<<<<<<<
- * 
- * ctypedef npy_ulong      uint_t
- */
-typedef npy_longlong __pyx_t_5numpy_longlong_t;
-
-/* "../anaconda3/envs/ogb/lib/python3.7/site-packages/numpy/__init__.pxd":718
- * ctypedef npy_longlong   longlong_t
- * 
- * ctypedef npy_ulong      uint_t             # <<<<<<<<<<<<<<
- * ctypedef npy_ulonglong  ulong_t
- * ctypedef npy_ulonglong  ulonglong_t
- */
-typedef npy_ulong __pyx_t_5numpy_uint_t;
-
-/* "../anaconda3/envs/ogb/lib/python3.7/site-packages/numpy/__init__.pxd":719
- * 
- * ctypedef npy_ulong      uint_t
- * ctypedef npy_ulonglong  ulong_t             # <<<<<<<<<<<<<<
- * ctypedef npy_ulonglong  ulonglong_t
- * 
- */
-typedef npy_ulonglong __pyx_t_5numpy_ulong_t;
-
-/* "../anaconda3/envs/ogb/lib/python3.7/site-packages/numpy/__init__.pxd":720
- * ctypedef npy_ulong      uint_t
- * ctypedef npy_ulonglong  ulong_t
- * ctypedef npy_ulonglong  ulonglong_t             # <<<<<<<<<<<<<<
- * 
- * ctypedef npy_intp       intp_t
- */
-typedef npy_ulonglong __pyx_t_5numpy_ulonglong_t;
-
-/* "../anaconda3/envs/ogb/lib/python3.7/site-packages/numpy/__init__.pxd":722
- * ctypedef npy_ulonglong  ulonglong_t
- * 
- * ctypedef npy_intp       intp_t             # <<<<<<<<<<<<<<
- * ctypedef npy_uintp      uintp_t
- * 
- */
-typedef npy_intp __pyx_t_5numpy_intp_t;
-
-/* "../anaconda3/envs/ogb/lib/python3.7/site-packages/numpy/__init__.pxd":723
- * 
- * ctypedef npy_intp       intp_t
- * ctypedef npy_uintp      uintp_t             # <<<<<<<<<<<<<<
- * 
- * ctypedef npy_double     float_t
- */
-typedef npy_uintp __pyx_t_5numpy_uintp_t;
-
-/* "../anaconda3/envs/ogb/lib/python3.7/site-packages/numpy/__init__.pxd":725
- * ctypedef npy_uintp      uintp_t
- * 
- * ctypedef npy_double     float_t             # <<<<<<<<<<<<<<
- * ctypedef npy_double     double_t
- * ctypedef npy_longdouble longdouble_t
- */
-typedef npy_double __pyx_t_5numpy_float_t;
-
-/* "../anaconda3/envs/ogb/lib/python3.7/site-packages/numpy/__init__.pxd":726
- * 
- * ctypedef npy_double     float_t
- * ctypedef npy_double     double_t             # <<<<<<<<<<<<<<
- * ctypedef npy_longdouble longdouble_t
- * 
- */
-typedef npy_double __pyx_t_5numpy_double_t;
-
-/* "../anaconda3/envs/ogb/lib/python3.7/site-packages/numpy/__init__.pxd":727
- * ctypedef npy_double     float_t
- * ctypedef npy_double     double_t
- * ctypedef npy_longdouble longdouble_t             # <<<<<<<<<<<<<<
- * 
- * ctypedef npy_cfloat      cfloat_t
- */
-typedef npy_longdouble __pyx_t_5numpy_longdouble_t;
-/* Declarations.proto */
-#if CYTHON_CCOMPLEX
-  #ifdef __cplusplus
-    typedef ::std::complex< float > __pyx_t_float_complex;
-  #else
-    typedef float _Complex __pyx_t_float_complex;
-  #endif
-#else
-    typedef struct { float real, imag; } __pyx_t_float_complex;
-#endif
-static CYTHON_INLINE __pyx_t_float_complex __pyx_t_float_complex_from_parts(float, float);
-
-/* Declarations.proto */
-#if CYTHON_CCOMPLEX
-  #ifdef __cplusplus
-    typedef ::std::complex< double > __pyx_t_double_complex;
-  #else
-    typedef double _Complex __pyx_t_double_complex;
-  #endif
-#else
-    typedef struct { double real, imag; } __pyx_t_double_complex;
-#endif
-static CYTHON_INLINE __pyx_t_double_complex __pyx_t_double_complex_from_parts(double, double);
-
-
-/*--- Type declarations ---*/
-struct __pyx_obj_10graphsaint_12cython_utils_array_wrapper_float;
-struct __pyx_obj_10graphsaint_12cython_utils_array_wrapper_int;
-struct __pyx_obj_10graphsaint_14cython_sampler_Sampler;
-struct __pyx_obj_10graphsaint_14cython_sampler_MRW;
-struct __pyx_obj_10graphsaint_14cython_sampler_RW;
-struct __pyx_obj_10graphsaint_14cython_sampler_Edge;
-struct __pyx_obj_10graphsaint_14cython_sampler_Edge2;
-struct __pyx_obj_10graphsaint_14cython_sampler_Node;
-struct __pyx_obj_10graphsaint_14cython_sampler_FullBatch;
-
-/* "../anaconda3/envs/ogb/lib/python3.7/site-packages/numpy/__init__.pxd":729
- * ctypedef npy_longdouble longdouble_t
- * 
- * ctypedef npy_cfloat      cfloat_t             # <<<<<<<<<<<<<<
- * ctypedef npy_cdouble     cdouble_t
- * ctypedef npy_clongdouble clongdouble_t
- */
-typedef npy_cfloat __pyx_t_5numpy_cfloat_t;
-
-/* "../anaconda3/envs/ogb/lib/python3.7/site-packages/numpy/__init__.pxd":730
- * 
- * ctypedef npy_cfloat      cfloat_t
- * ctypedef npy_cdouble     cdouble_t             # <<<<<<<<<<<<<<
- * ctypedef npy_clongdouble clongdouble_t
- * 
- */
-typedef npy_cdouble __pyx_t_5numpy_cdouble_t;
-
-/* "../anaconda3/envs/ogb/lib/python3.7/site-packages/numpy/__init__.pxd":731
- * ctypedef npy_cfloat      cfloat_t
- * ctypedef npy_cdouble     cdouble_t
- * ctypedef npy_clongdouble clongdouble_t             # <<<<<<<<<<<<<<
- * 
- * ctypedef npy_cdouble     complex_t
- */
-typedef npy_clongdouble __pyx_t_5numpy_clongdouble_t;
-
-/* "../anaconda3/envs/ogb/lib/python3.7/site-packages/numpy/__init__.pxd":733
- * ctypedef npy_clongdouble clongdouble_t
- * 
- * ctypedef npy_cdouble     complex_t             # <<<<<<<<<<<<<<
- * 
- * cdef inline object PyArray_MultiIterNew1(a):
- */
-typedef npy_cdouble __pyx_t_5numpy_complex_t;
-
-/* "graphsaint/cython_utils.pxd":16
- * 
- * 
- * cdef class array_wrapper_float:             # <<<<<<<<<<<<<<
- *     cdef vector[float] vec
- *     cdef Py_ssize_t shape[1]
- */
-struct __pyx_obj_10graphsaint_12cython_utils_array_wrapper_float {
-  PyObject_HEAD
-  struct __pyx_vtabstruct_10graphsaint_12cython_utils_array_wrapper_float *__pyx_vtab;
-  std::vector<float>  vec;
-  Py_ssize_t shape[1];
-  Py_ssize_t strides[1];
-};
-
-
-/* "graphsaint/cython_utils.pxd":22
- *     cdef void set_data(self,vector[float]& data)
- * 
- * cdef class array_wrapper_int:             # <<<<<<<<<<<<<<
- *     cdef vector[int] vec
- *     cdef Py_ssize_t shape[1]
- */
-struct __pyx_obj_10graphsaint_12cython_utils_array_wrapper_int {
-  PyObject_HEAD
-  struct __pyx_vtabstruct_10graphsaint_12cython_utils_array_wrapper_int *__pyx_vtab;
-  std::vector<int>  vec;
-  Py_ssize_t shape[1];
-  Py_ssize_t strides[1];
-};
-
-
-/* "graphsaint/cython_sampler.pyx":29
- * 
- * 
- * cdef class Sampler:             # <<<<<<<<<<<<<<
- *     cdef int num_proc,num_sample_per_proc
- *     cdef vector[int] adj_indptr_vec
- */
-struct __pyx_obj_10graphsaint_14cython_sampler_Sampler {
-  PyObject_HEAD
-  struct __pyx_vtabstruct_10graphsaint_14cython_sampler_Sampler *__pyx_vtab;
-  int num_proc;
-  int num_sample_per_proc;
-  std::vector<int>  adj_indptr_vec;
-  std::vector<int>  adj_indices_vec;
-  std::vector<int>  node_train_vec;
-  std::vector<std::vector<int> >  node_sampled;
-  std::vector<std::vector<int> >  ret_indptr;
-  std::vector<std::vector<int> >  ret_indices;
-  std::vector<std::vector<int> >  ret_indices_orig;
-  std::vector<std::vector<float> >  ret_data;
-  std::vector<std::vector<int> >  ret_edge_index;
-};
-
-
-/* "graphsaint/cython_sampler.pyx":226
- * # ----------------------------------------------------
- * 
- * cdef class MRW(Sampler):             # <<<<<<<<<<<<<<
- *     cdef int size_frontier,size_subg
- *     cdef int avg_deg
- */
-struct __pyx_obj_10graphsaint_14cython_sampler_MRW {
-  struct __pyx_obj_10graphsaint_14cython_sampler_Sampler __pyx_base;
-  int size_frontier;
-  int size_subg;
-  int avg_deg;
-  std::vector<int>  arr_deg_vec;
-};
-
-
-/* "graphsaint/cython_sampler.pyx":324
- * # ----------------------------------------------------
- * 
- * cdef class RW(Sampler):             # <<<<<<<<<<<<<<
- *     cdef int size_root, size_depth
- *     def __cinit__(self, np.ndarray[int,ndim=1,mode='c'] adj_indptr,
- */
-struct __pyx_obj_10graphsaint_14cython_sampler_RW {
-  struct __pyx_obj_10graphsaint_14cython_sampler_Sampler __pyx_base;
-  int size_root;
-  int size_depth;
-};
-
-
-/* "graphsaint/cython_sampler.pyx":365
- * # ----------------------------------------------------
- * 
- * cdef class Edge(Sampler):             # <<<<<<<<<<<<<<
- *     cdef vector[int] row_train_vec
- *     cdef vector[int] col_train_vec
- */
-struct __pyx_obj_10graphsaint_14cython_sampler_Edge {
-  struct __pyx_obj_10graphsaint_14cython_sampler_Sampler __pyx_base;
-  std::vector<int>  row_train_vec;
-  std::vector<int>  col_train_vec;
-  std::vector<float>  prob_edge_vec;
-};
-
-
-/* "graphsaint/cython_sampler.pyx":403
- * 
- * 
- * cdef class Edge2(Sampler):             # <<<<<<<<<<<<<<
- *     """
- *     approximate version of the above Edge class
- */
-struct __pyx_obj_10graphsaint_14cython_sampler_Edge2 {
-  struct __pyx_obj_10graphsaint_14cython_sampler_Sampler __pyx_base;
-  std::vector<int>  row_train_vec;
-  std::vector<int>  col_train_vec;
-  std::vector<float>  p_dist_cumsum_vec;
-  int size_subg_e;
-};
-
-
-/* "graphsaint/cython_sampler.pyx":446
- * # ----------------------------------------------------
- * 
- * cdef class Node(Sampler):             # <<<<<<<<<<<<<<
- *     cdef int size_subg
- *     cdef vector[int] p_dist_cumsum_vec
- */
-struct __pyx_obj_10graphsaint_14cython_sampler_Node {
-  struct __pyx_obj_10graphsaint_14cython_sampler_Sampler __pyx_base;
-  int size_subg;
-  std::vector<int>  p_dist_cumsum_vec;
-};
-
-
-/* "graphsaint/cython_sampler.pyx":477
- * # -----------------------------------------------------
- * 
- * cdef class FullBatch(Sampler):             # <<<<<<<<<<<<<<
- *     def __cinit__(self, np.ndarray[int,ndim=1,mode='c'] adj_indptr,
- *                         np.ndarray[int,ndim=1,mode='c'] adj_indices,
- */
-struct __pyx_obj_10graphsaint_14cython_sampler_FullBatch {
-  struct __pyx_obj_10graphsaint_14cython_sampler_Sampler __pyx_base;
-};
-
-
-
-/* "graphsaint/cython_utils.pxd":16
- * 
- * 
- * cdef class array_wrapper_float:             # <<<<<<<<<<<<<<
- *     cdef vector[float] vec
- *     cdef Py_ssize_t shape[1]
- */
-
-struct __pyx_vtabstruct_10graphsaint_12cython_utils_array_wrapper_float {
-  void (*set_data)(struct __pyx_obj_10graphsaint_12cython_utils_array_wrapper_float *, std::vector<float>  &);
-};
-static struct __pyx_vtabstruct_10graphsaint_12cython_utils_array_wrapper_float *__pyx_vtabptr_10graphsaint_12cython_utils_array_wrapper_float;
-
-
-/* "graphsaint/cython_utils.pxd":22
- *     cdef void set_data(self,vector[float]& data)
- * 
- * cdef class array_wrapper_int:             # <<<<<<<<<<<<<<
- *     cdef vector[int] vec
- *     cdef Py_ssize_t shape[1]
- */
-
-struct __pyx_vtabstruct_10graphsaint_12cython_utils_array_wrapper_int {
-  void (*set_data)(struct __pyx_obj_10graphsaint_12cython_utils_array_wrapper_int *, std::vector<int>  &);
-};
-static struct __pyx_vtabstruct_10graphsaint_12cython_utils_array_wrapper_int *__pyx_vtabptr_10graphsaint_12cython_utils_array_wrapper_int;
-
-
-/* "graphsaint/cython_sampler.pyx":29
- * 
- * 
- * cdef class Sampler:             # <<<<<<<<<<<<<<
- *     cdef int num_proc,num_sample_per_proc
- *     cdef vector[int] adj_indptr_vec
- */
-
-struct __pyx_vtabstruct_10graphsaint_14cython_sampler_Sampler {
-  void (*adj_extract)(struct __pyx_obj_10graphsaint_14cython_sampler_Sampler *, int);
-  void (*sample)(struct __pyx_obj_10graphsaint_14cython_sampler_Sampler *, int);
-};
-static struct __pyx_vtabstruct_10graphsaint_14cython_sampler_Sampler *__pyx_vtabptr_10graphsaint_14cython_sampler_Sampler;
-
-
-/* "graphsaint/cython_sampler.pyx":226
- * # ----------------------------------------------------
- * 
- * cdef class MRW(Sampler):             # <<<<<<<<<<<<<<
- *     cdef int size_frontier,size_subg
- *     cdef int avg_deg
- */
-
-struct __pyx_vtabstruct_10graphsaint_14cython_sampler_MRW {
-  struct __pyx_vtabstruct_10graphsaint_14cython_sampler_Sampler __pyx_base;
-};
-static struct __pyx_vtabstruct_10graphsaint_14cython_sampler_MRW *__pyx_vtabptr_10graphsaint_14cython_sampler_MRW;
-
-
-/* "graphsaint/cython_sampler.pyx":324
- * # ----------------------------------------------------
- * 
- * cdef class RW(Sampler):             # <<<<<<<<<<<<<<
- *     cdef int size_root, size_depth
- *     def __cinit__(self, np.ndarray[int,ndim=1,mode='c'] adj_indptr,
- */
-
-struct __pyx_vtabstruct_10graphsaint_14cython_sampler_RW {
-  struct __pyx_vtabstruct_10graphsaint_14cython_sampler_Sampler __pyx_base;
-};
-static struct __pyx_vtabstruct_10graphsaint_14cython_sampler_RW *__pyx_vtabptr_10graphsaint_14cython_sampler_RW;
-
-
-/* "graphsaint/cython_sampler.pyx":365
- * # ----------------------------------------------------
- * 
- * cdef class Edge(Sampler):             # <<<<<<<<<<<<<<
- *     cdef vector[int] row_train_vec
- *     cdef vector[int] col_train_vec
- */
-
-struct __pyx_vtabstruct_10graphsaint_14cython_sampler_Edge {
-  struct __pyx_vtabstruct_10graphsaint_14cython_sampler_Sampler __pyx_base;
-};
-static struct __pyx_vtabstruct_10graphsaint_14cython_sampler_Edge *__pyx_vtabptr_10graphsaint_14cython_sampler_Edge;
-
-
-/* "graphsaint/cython_sampler.pyx":403
- * 
- * 
- * cdef class Edge2(Sampler):             # <<<<<<<<<<<<<<
- *     """
- *     approximate version of the above Edge class
- */
-
-struct __pyx_vtabstruct_10graphsaint_14cython_sampler_Edge2 {
-  struct __pyx_vtabstruct_10graphsaint_14cython_sampler_Sampler __pyx_base;
-};
-static struct __pyx_vtabstruct_10graphsaint_14cython_sampler_Edge2 *__pyx_vtabptr_10graphsaint_14cython_sampler_Edge2;
-
-
-/* "graphsaint/cython_sampler.pyx":446
- * # ----------------------------------------------------
- * 
- * cdef class Node(Sampler):             # <<<<<<<<<<<<<<
- *     cdef int size_subg
- *     cdef vector[int] p_dist_cumsum_vec
- */
-
-struct __pyx_vtabstruct_10graphsaint_14cython_sampler_Node {
-  struct __pyx_vtabstruct_10graphsaint_14cython_sampler_Sampler __pyx_base;
-};
-static struct __pyx_vtabstruct_10graphsaint_14cython_sampler_Node *__pyx_vtabptr_10graphsaint_14cython_sampler_Node;
-
-
-/* "graphsaint/cython_sampler.pyx":477
- * # -----------------------------------------------------
- * 
- * cdef class FullBatch(Sampler):             # <<<<<<<<<<<<<<
- *     def __cinit__(self, np.ndarray[int,ndim=1,mode='c'] adj_indptr,
- *                         np.ndarray[int,ndim=1,mode='c'] adj_indices,
- */
-
-struct __pyx_vtabstruct_10graphsaint_14cython_sampler_FullBatch {
-  struct __pyx_vtabstruct_10graphsaint_14cython_sampler_Sampler __pyx_base;
-};
-static struct __pyx_vtabstruct_10graphsaint_14cython_sampler_FullBatch *__pyx_vtabptr_10graphsaint_14cython_sampler_FullBatch;
-
-/* --- Runtime support code (head) --- */
-/* Refnanny.proto */
-#ifndef CYTHON_REFNANNY
-  #define CYTHON_REFNANNY 0
-#endif
-#if CYTHON_REFNANNY
-  typedef struct {
-    void (*INCREF)(void*, PyObject*, int);
-    void (*DECREF)(void*, PyObject*, int);
-    void (*GOTREF)(void*, PyObject*, int);
-    void (*GIVEREF)(void*, PyObject*, int);
-    void* (*SetupContext)(const char*, int, const char*);
-    void (*FinishContext)(void**);
-  } __Pyx_RefNannyAPIStruct;
-  static __Pyx_RefNannyAPIStruct *__Pyx_RefNanny = NULL;
-  static __Pyx_RefNannyAPIStruct *__Pyx_RefNannyImportAPI(const char *modname);
-  #define __Pyx_RefNannyDeclarations void *__pyx_refnanny = NULL;
-#ifdef WITH_THREAD
-  #define __Pyx_RefNannySetupContext(name, acquire_gil)\
-          if (acquire_gil) {\
-              PyGILState_STATE __pyx_gilstate_save = PyGILState_Ensure();\
-              __pyx_refnanny = __Pyx_RefNanny->SetupContext((name), __LINE__, __FILE__);\
-              PyGILState_Release(__pyx_gilstate_save);\
-          } else {\
-              __pyx_refnanny = __Pyx_RefNanny->SetupContext((name), __LINE__, __FILE__);\
-          }
-#else
-  #define __Pyx_RefNannySetupContext(name, acquire_gil)\
-          __pyx_refnanny = __Pyx_RefNanny->SetupContext((name), __LINE__, __FILE__)
-#endif
-  #define __Pyx_RefNannyFinishContext()\
-          __Pyx_RefNanny->FinishContext(&__pyx_refnanny)
-  #define __Pyx_INCREF(r)  __Pyx_RefNanny->INCREF(__pyx_refnanny, (PyObject *)(r), __LINE__)
-  #define __Pyx_DECREF(r)  __Pyx_RefNanny->DECREF(__pyx_refnanny, (PyObject *)(r), __LINE__)
-  #define __Pyx_GOTREF(r)  __Pyx_RefNanny->GOTREF(__pyx_refnanny, (PyObject *)(r), __LINE__)
-  #define __Pyx_GIVEREF(r) __Pyx_RefNanny->GIVEREF(__pyx_refnanny, (PyObject *)(r), __LINE__)
-  #define __Pyx_XINCREF(r)  do { if((r) != NULL) {__Pyx_INCREF(r); }} while(0)
-  #define __Pyx_XDECREF(r)  do { if((r) != NULL) {__Pyx_DECREF(r); }} while(0)
-  #define __Pyx_XGOTREF(r)  do { if((r) != NULL) {__Pyx_GOTREF(r); }} while(0)
-  #define __Pyx_XGIVEREF(r) do { if((r) != NULL) {__Pyx_GIVEREF(r);}} while(0)
-#else
-  #define __Pyx_RefNannyDeclarations
-  #define __Pyx_RefNannySetupContext(name, acquire_gil)
-  #define __Pyx_RefNannyFinishContext()
-  #define __Pyx_INCREF(r) Py_INCREF(r)
-  #define __Pyx_DECREF(r) Py_DECREF(r)
-  #define __Pyx_GOTREF(r)
-  #define __Pyx_GIVEREF(r)
-  #define __Pyx_XINCREF(r) Py_XINCREF(r)
-  #define __Pyx_XDECREF(r) Py_XDECREF(r)
-  #define __Pyx_XGOTREF(r)
-  #define __Pyx_XGIVEREF(r)
-#endif
-#define __Pyx_XDECREF_SET(r, v) do {\
-        PyObject *tmp = (PyObject *) r;\
-        r = v; __Pyx_XDECREF(tmp);\
-    } while (0)
-#define __Pyx_DECREF_SET(r, v) do {\
-        PyObject *tmp = (PyObject *) r;\
-        r = v; __Pyx_DECREF(tmp);\
-    } while (0)
-#define __Pyx_CLEAR(r)    do { PyObject* tmp = ((PyObject*)(r)); r = NULL; __Pyx_DECREF(tmp);} while(0)
-#define __Pyx_XCLEAR(r)   do { if((r) != NULL) {PyObject* tmp = ((PyObject*)(r)); r = NULL; __Pyx_DECREF(tmp);}} while(0)
-
-/* PyObjectGetAttrStr.proto */
-#if CYTHON_USE_TYPE_SLOTS
-static CYTHON_INLINE PyObject* __Pyx_PyObject_GetAttrStr(PyObject* obj, PyObject* attr_name);
-#else
-#define __Pyx_PyObject_GetAttrStr(o,n) PyObject_GetAttr(o,n)
-#endif
-
-/* GetBuiltinName.proto */
-static PyObject *__Pyx_GetBuiltinName(PyObject *name);
-
-/* RaiseArgTupleInvalid.proto */
-static void __Pyx_RaiseArgtupleInvalid(const char* func_name, int exact,
-    Py_ssize_t num_min, Py_ssize_t num_max, Py_ssize_t num_found);
-
-/* RaiseDoubleKeywords.proto */
-static void __Pyx_RaiseDoubleKeywordsError(const char* func_name, PyObject* kw_name);
-
-/* ParseKeywords.proto */
-static int __Pyx_ParseOptionalKeywords(PyObject *kwds, PyObject **argnames[],\
-    PyObject *kwds2, PyObject *values[], Py_ssize_t num_pos_args,\
-    const char* function_name);
-
-/* ArgTypeTest.proto */
-#define __Pyx_ArgTypeTest(obj, type, none_allowed, name, exact)\
-    ((likely((Py_TYPE(obj) == type) | (none_allowed && (obj == Py_None)))) ? 1 :\
-        __Pyx__ArgTypeTest(obj, type, name, exact))
-static int __Pyx__ArgTypeTest(PyObject *obj, PyTypeObject *type, const char *name, int exact);
-
-/* IsLittleEndian.proto */
-static CYTHON_INLINE int __Pyx_Is_Little_Endian(void);
-
-/* BufferFormatCheck.proto */
-static const char* __Pyx_BufFmt_CheckString(__Pyx_BufFmt_Context* ctx, const char* ts);
-static void __Pyx_BufFmt_Init(__Pyx_BufFmt_Context* ctx,
-                              __Pyx_BufFmt_StackElem* stack,
-                              __Pyx_TypeInfo* type);
-
-/* BufferGetAndValidate.proto */
-#define __Pyx_GetBufferAndValidate(buf, obj, dtype, flags, nd, cast, stack)\
-    ((obj == Py_None || obj == NULL) ?\
-    (__Pyx_ZeroBuffer(buf), 0) :\
-    __Pyx__GetBufferAndValidate(buf, obj, dtype, flags, nd, cast, stack))
-static int  __Pyx__GetBufferAndValidate(Py_buffer* buf, PyObject* obj,
-    __Pyx_TypeInfo* dtype, int flags, int nd, int cast, __Pyx_BufFmt_StackElem* stack);
-static void __Pyx_ZeroBuffer(Py_buffer* buf);
-static CYTHON_INLINE void __Pyx_SafeReleaseBuffer(Py_buffer* info);
-static Py_ssize_t __Pyx_minusones[] = { -1, -1, -1, -1, -1, -1, -1, -1 };
-static Py_ssize_t __Pyx_zeros[] = { 0, 0, 0, 0, 0, 0, 0, 0 };
-
-/* PyThreadStateGet.proto */
-#if CYTHON_FAST_THREAD_STATE
-#define __Pyx_PyThreadState_declare  PyThreadState *__pyx_tstate;
-#define __Pyx_PyThreadState_assign  __pyx_tstate = __Pyx_PyThreadState_Current;
-#define __Pyx_PyErr_Occurred()  __pyx_tstate->curexc_type
-#else
-#define __Pyx_PyThreadState_declare
-#define __Pyx_PyThreadState_assign
-#define __Pyx_PyErr_Occurred()  PyErr_Occurred()
-#endif
-
-/* PyErrFetchRestore.proto */
-#if CYTHON_FAST_THREAD_STATE
-#define __Pyx_PyErr_Clear() __Pyx_ErrRestore(NULL, NULL, NULL)
-#define __Pyx_ErrRestoreWithState(type, value, tb)  __Pyx_ErrRestoreInState(PyThreadState_GET(), type, value, tb)
-#define __Pyx_ErrFetchWithState(type, value, tb)    __Pyx_ErrFetchInState(PyThreadState_GET(), type, value, tb)
-#define __Pyx_ErrRestore(type, value, tb)  __Pyx_ErrRestoreInState(__pyx_tstate, type, value, tb)
-#define __Pyx_ErrFetch(type, value, tb)    __Pyx_ErrFetchInState(__pyx_tstate, type, value, tb)
-static CYTHON_INLINE void __Pyx_ErrRestoreInState(PyThreadState *tstate, PyObject *type, PyObject *value, PyObject *tb);
-static CYTHON_INLINE void __Pyx_ErrFetchInState(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb);
-#if CYTHON_COMPILING_IN_CPYTHON
-#define __Pyx_PyErr_SetNone(exc) (Py_INCREF(exc), __Pyx_ErrRestore((exc), NULL, NULL))
-#else
-#define __Pyx_PyErr_SetNone(exc) PyErr_SetNone(exc)
-#endif
-#else
-#define __Pyx_PyErr_Clear() PyErr_Clear()
-#define __Pyx_PyErr_SetNone(exc) PyErr_SetNone(exc)
-#define __Pyx_ErrRestoreWithState(type, value, tb)  PyErr_Restore(type, value, tb)
-#define __Pyx_ErrFetchWithState(type, value, tb)  PyErr_Fetch(type, value, tb)
-#define __Pyx_ErrRestoreInState(tstate, type, value, tb)  PyErr_Restore(type, value, tb)
-#define __Pyx_ErrFetchInState(tstate, type, value, tb)  PyErr_Fetch(type, value, tb)
-#define __Pyx_ErrRestore(type, value, tb)  PyErr_Restore(type, value, tb)
-#define __Pyx_ErrFetch(type, value, tb)  PyErr_Fetch(type, value, tb)
-#endif
-
-/* WriteUnraisableException.proto */
-static void __Pyx_WriteUnraisable(const char *name, int clineno,
-                                  int lineno, const char *filename,
-                                  int full_traceback, int nogil);
-
-/* PyCFunctionFastCall.proto */
-#if CYTHON_FAST_PYCCALL
-static CYTHON_INLINE PyObject *__Pyx_PyCFunction_FastCall(PyObject *func, PyObject **args, Py_ssize_t nargs);
-#else
-#define __Pyx_PyCFunction_FastCall(func, args, nargs)  (assert(0), NULL)
-#endif
-
-/* PyFunctionFastCall.proto */
-#if CYTHON_FAST_PYCALL
-#define __Pyx_PyFunction_FastCall(func, args, nargs)\
-    __Pyx_PyFunction_FastCallDict((func), (args), (nargs), NULL)
-#if 1 || PY_VERSION_HEX < 0x030600B1
-static PyObject *__Pyx_PyFunction_FastCallDict(PyObject *func, PyObject **args, Py_ssize_t nargs, PyObject *kwargs);
-#else
-#define __Pyx_PyFunction_FastCallDict(func, args, nargs, kwargs) _PyFunction_FastCallDict(func, args, nargs, kwargs)
-#endif
-#define __Pyx_BUILD_ASSERT_EXPR(cond)\
-    (sizeof(char [1 - 2*!(cond)]) - 1)
-#ifndef Py_MEMBER_SIZE
-#define Py_MEMBER_SIZE(type, member) sizeof(((type *)0)->member)
-#endif
-#if CYTHON_FAST_PYCALL
-  static size_t __pyx_pyframe_localsplus_offset = 0;
-  #include "frameobject.h"
-  #define __Pxy_PyFrame_Initialize_Offsets()\
-    ((void)__Pyx_BUILD_ASSERT_EXPR(sizeof(PyFrameObject) == offsetof(PyFrameObject, f_localsplus) + Py_MEMBER_SIZE(PyFrameObject, f_localsplus)),\
-     (void)(__pyx_pyframe_localsplus_offset = ((size_t)PyFrame_Type.tp_basicsize) - Py_MEMBER_SIZE(PyFrameObject, f_localsplus)))
-  #define __Pyx_PyFrame_GetLocalsplus(frame)\
-    (assert(__pyx_pyframe_localsplus_offset), (PyObject **)(((char *)(frame)) + __pyx_pyframe_localsplus_offset))
-#endif // CYTHON_FAST_PYCALL
-#endif
-
-/* PyObjectCall.proto */
-#if CYTHON_COMPILING_IN_CPYTHON
-static CYTHON_INLINE PyObject* __Pyx_PyObject_Call(PyObject *func, PyObject *arg, PyObject *kw);
-#else
-#define __Pyx_PyObject_Call(func, arg, kw) PyObject_Call(func, arg, kw)
-#endif
-
-/* PyObjectCallMethO.proto */
-#if CYTHON_COMPILING_IN_CPYTHON
-static CYTHON_INLINE PyObject* __Pyx_PyObject_CallMethO(PyObject *func, PyObject *arg);
-#endif
-
-/* PyObjectCallOneArg.proto */
-static CYTHON_INLINE PyObject* __Pyx_PyObject_CallOneArg(PyObject *func, PyObject *arg);
-
-/* ListAppend.proto */
-#if CYTHON_USE_PYLIST_INTERNALS && CYTHON_ASSUME_SAFE_MACROS
-static CYTHON_INLINE int __Pyx_PyList_Append(PyObject* list, PyObject* x) {
-    PyListObject* L = (PyListObject*) list;
-    Py_ssize_t len = Py_SIZE(list);
-    if (likely(L->allocated > len) & likely(len > (L->allocated >> 1))) {
-        Py_INCREF(x);
-        PyList_SET_ITEM(list, len, x);
-        __Pyx_SET_SIZE(list, len + 1);
-        return 0;
-    }
-    return PyList_Append(list, x);
-}
-#else
-#define __Pyx_PyList_Append(L,x) PyList_Append(L,x)
-#endif
-
-/* GetItemInt.proto */
-#define __Pyx_GetItemInt(o, i, type, is_signed, to_py_func, is_list, wraparound, boundscheck)\
-    (__Pyx_fits_Py_ssize_t(i, type, is_signed) ?\
-    __Pyx_GetItemInt_Fast(o, (Py_ssize_t)i, is_list, wraparound, boundscheck) :\
-    (is_list ? (PyErr_SetString(PyExc_IndexError, "list index out of range"), (PyObject*)NULL) :\
-               __Pyx_GetItemInt_Generic(o, to_py_func(i))))
-#define __Pyx_GetItemInt_List(o, i, type, is_signed, to_py_func, is_list, wraparound, boundscheck)\
-    (__Pyx_fits_Py_ssize_t(i, type, is_signed) ?\
-    __Pyx_GetItemInt_List_Fast(o, (Py_ssize_t)i, wraparound, boundscheck) :\
-    (PyErr_SetString(PyExc_IndexError, "list index out of range"), (PyObject*)NULL))
-static CYTHON_INLINE PyObject *__Pyx_GetItemInt_List_Fast(PyObject *o, Py_ssize_t i,
-                                                              int wraparound, int boundscheck);
-#define __Pyx_GetItemInt_Tuple(o, i, type, is_signed, to_py_func, is_list, wraparound, boundscheck)\
-    (__Pyx_fits_Py_ssize_t(i, type, is_signed) ?\
-    __Pyx_GetItemInt_Tuple_Fast(o, (Py_ssize_t)i, wraparound, boundscheck) :\
-    (PyErr_SetString(PyExc_IndexError, "tuple index out of range"), (PyObject*)NULL))
-static CYTHON_INLINE PyObject *__Pyx_GetItemInt_Tuple_Fast(PyObject *o, Py_ssize_t i,
-                                                              int wraparound, int boundscheck);
-static PyObject *__Pyx_GetItemInt_Generic(PyObject *o, PyObject* j);
-static CYTHON_INLINE PyObject *__Pyx_GetItemInt_Fast(PyObject *o, Py_ssize_t i,
-                                                     int is_list, int wraparound, int boundscheck);
-
-/* ObjectGetItem.proto */
-#if CYTHON_USE_TYPE_SLOTS
-static CYTHON_INLINE PyObject *__Pyx_PyObject_GetItem(PyObject *obj, PyObject* key);
-#else
-#define __Pyx_PyObject_GetItem(obj, key)  PyObject_GetItem(obj, key)
-#endif
-
-/* PyObjectCallNoArg.proto */
-#if CYTHON_COMPILING_IN_CPYTHON
-static CYTHON_INLINE PyObject* __Pyx_PyObject_CallNoArg(PyObject *func);
-#else
-#define __Pyx_PyObject_CallNoArg(func) __Pyx_PyObject_Call(func, __pyx_empty_tuple, NULL)
-#endif
-
-/* PyDictVersioning.proto */
-#if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_TYPE_SLOTS
-#define __PYX_DICT_VERSION_INIT  ((PY_UINT64_T) -1)
-#define __PYX_GET_DICT_VERSION(dict)  (((PyDictObject*)(dict))->ma_version_tag)
-#define __PYX_UPDATE_DICT_CACHE(dict, value, cache_var, version_var)\
-    (version_var) = __PYX_GET_DICT_VERSION(dict);\
-    (cache_var) = (value);
-#define __PYX_PY_DICT_LOOKUP_IF_MODIFIED(VAR, DICT, LOOKUP) {\
-    static PY_UINT64_T __pyx_dict_version = 0;\
-    static PyObject *__pyx_dict_cached_value = NULL;\
-    if (likely(__PYX_GET_DICT_VERSION(DICT) == __pyx_dict_version)) {\
-        (VAR) = __pyx_dict_cached_value;\
-    } else {\
-        (VAR) = __pyx_dict_cached_value = (LOOKUP);\
-        __pyx_dict_version = __PYX_GET_DICT_VERSION(DICT);\
-    }\
-}
-static CYTHON_INLINE PY_UINT64_T __Pyx_get_tp_dict_version(PyObject *obj);
-static CYTHON_INLINE PY_UINT64_T __Pyx_get_object_dict_version(PyObject *obj);
-static CYTHON_INLINE int __Pyx_object_dict_version_matches(PyObject* obj, PY_UINT64_T tp_dict_version, PY_UINT64_T obj_dict_version);
-#else
-#define __PYX_GET_DICT_VERSION(dict)  (0)
-#define __PYX_UPDATE_DICT_CACHE(dict, value, cache_var, version_var)
-#define __PYX_PY_DICT_LOOKUP_IF_MODIFIED(VAR, DICT, LOOKUP)  (VAR) = (LOOKUP);
-#endif
-
-/* GetModuleGlobalName.proto */
-#if CYTHON_USE_DICT_VERSIONS
-#define __Pyx_GetModuleGlobalName(var, name)  {\
-    static PY_UINT64_T __pyx_dict_version = 0;\
-    static PyObject *__pyx_dict_cached_value = NULL;\
-    (var) = (likely(__pyx_dict_version == __PYX_GET_DICT_VERSION(__pyx_d))) ?\
-        (likely(__pyx_dict_cached_value) ? __Pyx_NewRef(__pyx_dict_cached_value) : __Pyx_GetBuiltinName(name)) :\
-        __Pyx__GetModuleGlobalName(name, &__pyx_dict_version, &__pyx_dict_cached_value);\
-}
-#define __Pyx_GetModuleGlobalNameUncached(var, name)  {\
-    PY_UINT64_T __pyx_dict_version;\
-    PyObject *__pyx_dict_cached_value;\
-    (var) = __Pyx__GetModuleGlobalName(name, &__pyx_dict_version, &__pyx_dict_cached_value);\
-}
-static PyObject *__Pyx__GetModuleGlobalName(PyObject *name, PY_UINT64_T *dict_version, PyObject **dict_cached_value);
-#else
-#define __Pyx_GetModuleGlobalName(var, name)  (var) = __Pyx__GetModuleGlobalName(name)
-#define __Pyx_GetModuleGlobalNameUncached(var, name)  (var) = __Pyx__GetModuleGlobalName(name)
-static CYTHON_INLINE PyObject *__Pyx__GetModuleGlobalName(PyObject *name);
-#endif
-
-/* PyIntBinop.proto */
-#if !CYTHON_COMPILING_IN_PYPY
-static PyObject* __Pyx_PyInt_AddObjC(PyObject *op1, PyObject *op2, long intval, int inplace, int zerodivision_check);
-#else
-#define __Pyx_PyInt_AddObjC(op1, op2, intval, inplace, zerodivision_check)\
-    (inplace ? PyNumber_InPlaceAdd(op1, op2) : PyNumber_Add(op1, op2))
-#endif
-
-/* SliceObject.proto */
-static CYTHON_INLINE PyObject* __Pyx_PyObject_GetSlice(
-        PyObject* obj, Py_ssize_t cstart, Py_ssize_t cstop,
-        PyObject** py_start, PyObject** py_stop, PyObject** py_slice,
-        int has_cstart, int has_cstop, int wraparound);
-
-/* RaiseException.proto */
-static void __Pyx_Raise(PyObject *type, PyObject *value, PyObject *tb, PyObject *cause);
-
-/* ExtTypeTest.proto */
-static CYTHON_INLINE int __Pyx_TypeTest(PyObject *obj, PyTypeObject *type);
-
-/* ModInt[int].proto */
-static CYTHON_INLINE int __Pyx_mod_int(int, int);
-
-/* GetTopmostException.proto */
-#if CYTHON_USE_EXC_INFO_STACK
-static _PyErr_StackItem * __Pyx_PyErr_GetTopmostException(PyThreadState *tstate);
-#endif
-
-/* SaveResetException.proto */
-#if CYTHON_FAST_THREAD_STATE
-#define __Pyx_ExceptionSave(type, value, tb)  __Pyx__ExceptionSave(__pyx_tstate, type, value, tb)
-static CYTHON_INLINE void __Pyx__ExceptionSave(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb);
-#define __Pyx_ExceptionReset(type, value, tb)  __Pyx__ExceptionReset(__pyx_tstate, type, value, tb)
-static CYTHON_INLINE void __Pyx__ExceptionReset(PyThreadState *tstate, PyObject *type, PyObject *value, PyObject *tb);
-#else
-#define __Pyx_ExceptionSave(type, value, tb)   PyErr_GetExcInfo(type, value, tb)
-#define __Pyx_ExceptionReset(type, value, tb)  PyErr_SetExcInfo(type, value, tb)
-#endif
-
-/* PyErrExceptionMatches.proto */
-#if CYTHON_FAST_THREAD_STATE
-#define __Pyx_PyErr_ExceptionMatches(err) __Pyx_PyErr_ExceptionMatchesInState(__pyx_tstate, err)
-static CYTHON_INLINE int __Pyx_PyErr_ExceptionMatchesInState(PyThreadState* tstate, PyObject* err);
-#else
-#define __Pyx_PyErr_ExceptionMatches(err)  PyErr_ExceptionMatches(err)
-#endif
-
-/* GetException.proto */
-#if CYTHON_FAST_THREAD_STATE
-#define __Pyx_GetException(type, value, tb)  __Pyx__GetException(__pyx_tstate, type, value, tb)
-static int __Pyx__GetException(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb);
-#else
-static int __Pyx_GetException(PyObject **type, PyObject **value, PyObject **tb);
-#endif
-
-/* BufferIndexError.proto */
-static void __Pyx_RaiseBufferIndexError(int axis);
-
-#define __Pyx_BufPtrCContig1d(type, buf, i0, s0) ((type)buf + i0)
-/* PyObject_GenericGetAttrNoDict.proto */
-#if CYTHON_USE_TYPE_SLOTS && CYTHON_USE_PYTYPE_LOOKUP && PY_VERSION_HEX < 0x03070000
-static CYTHON_INLINE PyObject* __Pyx_PyObject_GenericGetAttrNoDict(PyObject* obj, PyObject* attr_name);
-#else
-#define __Pyx_PyObject_GenericGetAttrNoDict PyObject_GenericGetAttr
-#endif
-
-/* PyObject_GenericGetAttr.proto */
-#if CYTHON_USE_TYPE_SLOTS && CYTHON_USE_PYTYPE_LOOKUP && PY_VERSION_HEX < 0x03070000
-static PyObject* __Pyx_PyObject_GenericGetAttr(PyObject* obj, PyObject* attr_name);
-#else
-#define __Pyx_PyObject_GenericGetAttr PyObject_GenericGetAttr
-#endif
-
-/* SetVTable.proto */
-static int __Pyx_SetVtable(PyObject *dict, void *vtable);
-
-/* PyObjectGetAttrStrNoError.proto */
-static CYTHON_INLINE PyObject* __Pyx_PyObject_GetAttrStrNoError(PyObject* obj, PyObject* attr_name);
-
-/* SetupReduce.proto */
-static int __Pyx_setup_reduce(PyObject* type_obj);
-
-/* TypeImport.proto */
-#ifndef __PYX_HAVE_RT_ImportType_proto
-#define __PYX_HAVE_RT_ImportType_proto
-enum __Pyx_ImportType_CheckSize {
-   __Pyx_ImportType_CheckSize_Error = 0,
-   __Pyx_ImportType_CheckSize_Warn = 1,
-   __Pyx_ImportType_CheckSize_Ignore = 2
-};
-static PyTypeObject *__Pyx_ImportType(PyObject* module, const char *module_name, const char *class_name, size_t size, enum __Pyx_ImportType_CheckSize check_size);
-#endif
-
-/* GetVTable.proto */
-static void* __Pyx_GetVtable(PyObject *dict);
-
-/* Import.proto */
-static PyObject *__Pyx_Import(PyObject *name, PyObject *from_list, int level);
-
-/* CLineInTraceback.proto */
-#ifdef CYTHON_CLINE_IN_TRACEBACK
-#define __Pyx_CLineForTraceback(tstate, c_line)  (((CYTHON_CLINE_IN_TRACEBACK)) ? c_line : 0)
-#else
-static int __Pyx_CLineForTraceback(PyThreadState *tstate, int c_line);
-#endif
-
-/* CodeObjectCache.proto */
-typedef struct {
-    PyCodeObject* code_object;
-    int code_line;
-} __Pyx_CodeObjectCacheEntry;
-struct __Pyx_CodeObjectCache {
-    int count;
-    int max_count;
-    __Pyx_CodeObjectCacheEntry* entries;
-};
-static struct __Pyx_CodeObjectCache __pyx_code_cache = {0,0,NULL};
-static int __pyx_bisect_code_objects(__Pyx_CodeObjectCacheEntry* entries, int count, int code_line);
-static PyCodeObject *__pyx_find_code_object(int code_line);
-static void __pyx_insert_code_object(int code_line, PyCodeObject* code_object);
-
-/* AddTraceback.proto */
-static void __Pyx_AddTraceback(const char *funcname, int c_line,
-                               int py_line, const char *filename);
-
-/* None.proto */
-#include <new>
-
-/* BufferStructDeclare.proto */
-typedef struct {
-  Py_ssize_t shape, strides, suboffsets;
-} __Pyx_Buf_DimInfo;
-typedef struct {
-  size_t refcount;
-  Py_buffer pybuffer;
-} __Pyx_Buffer;
-typedef struct {
-  __Pyx_Buffer *rcbuffer;
-  char *data;
-  __Pyx_Buf_DimInfo diminfo[8];
-} __Pyx_LocalBuf_ND;
-
-#if PY_MAJOR_VERSION < 3
-    static int __Pyx_GetBuffer(PyObject *obj, Py_buffer *view, int flags);
-    static void __Pyx_ReleaseBuffer(Py_buffer *view);
-#else
-    #define __Pyx_GetBuffer PyObject_GetBuffer
-    #define __Pyx_ReleaseBuffer PyBuffer_Release
-#endif
-
-
-/* GCCDiagnostics.proto */
-#if defined(__GNUC__) && (__GNUC__ > 4 || (__GNUC__ == 4 && __GNUC_MINOR__ >= 6))
-#define __Pyx_HAS_GCC_DIAGNOSTIC
-#endif
-
-/* CppExceptionConversion.proto */
-#ifndef __Pyx_CppExn2PyErr
-#include <new>
-#include <typeinfo>
-#include <stdexcept>
-#include <ios>
-static void __Pyx_CppExn2PyErr() {
-  try {
-    if (PyErr_Occurred())
-      ; // let the latest Python exn pass through and ignore the current one
-    else
-      throw;
-  } catch (const std::bad_alloc& exn) {
-    PyErr_SetString(PyExc_MemoryError, exn.what());
-  } catch (const std::bad_cast& exn) {
-    PyErr_SetString(PyExc_TypeError, exn.what());
-  } catch (const std::bad_typeid& exn) {
-    PyErr_SetString(PyExc_TypeError, exn.what());
-  } catch (const std::domain_error& exn) {
-    PyErr_SetString(PyExc_ValueError, exn.what());
-  } catch (const std::invalid_argument& exn) {
-    PyErr_SetString(PyExc_ValueError, exn.what());
-  } catch (const std::ios_base::failure& exn) {
-    PyErr_SetString(PyExc_IOError, exn.what());
-  } catch (const std::out_of_range& exn) {
-    PyErr_SetString(PyExc_IndexError, exn.what());
-  } catch (const std::overflow_error& exn) {
-    PyErr_SetString(PyExc_OverflowError, exn.what());
-  } catch (const std::range_error& exn) {
-    PyErr_SetString(PyExc_ArithmeticError, exn.what());
-  } catch (const std::underflow_error& exn) {
-    PyErr_SetString(PyExc_ArithmeticError, exn.what());
-  } catch (const std::exception& exn) {
-    PyErr_SetString(PyExc_RuntimeError, exn.what());
-  }
-  catch (...)
-  {
-    PyErr_SetString(PyExc_RuntimeError, "Unknown exception");
-  }
-}
-#endif
-
-/* RealImag.proto */
-#if CYTHON_CCOMPLEX
-  #ifdef __cplusplus
-    #define __Pyx_CREAL(z) ((z).real())
-    #define __Pyx_CIMAG(z) ((z).imag())
-  #else
-    #define __Pyx_CREAL(z) (__real__(z))
-    #define __Pyx_CIMAG(z) (__imag__(z))
-  #endif
-#else
-    #define __Pyx_CREAL(z) ((z).real)
-    #define __Pyx_CIMAG(z) ((z).imag)
-#endif
-#if defined(__cplusplus) && CYTHON_CCOMPLEX\
-        && (defined(_WIN32) || defined(__clang__) || (defined(__GNUC__) && (__GNUC__ >= 5 || __GNUC__ == 4 && __GNUC_MINOR__ >= 4 )) || __cplusplus >= 201103)
-    #define __Pyx_SET_CREAL(z,x) ((z).real(x))
-    #define __Pyx_SET_CIMAG(z,y) ((z).imag(y))
-#else
-    #define __Pyx_SET_CREAL(z,x) __Pyx_CREAL(z) = (x)
-    #define __Pyx_SET_CIMAG(z,y) __Pyx_CIMAG(z) = (y)
-#endif
-
-/* Arithmetic.proto */
-#if CYTHON_CCOMPLEX
-    #define __Pyx_c_eq_float(a, b)   ((a)==(b))
-    #define __Pyx_c_sum_float(a, b)  ((a)+(b))
-    #define __Pyx_c_diff_float(a, b) ((a)-(b))
-    #define __Pyx_c_prod_float(a, b) ((a)*(b))
-    #define __Pyx_c_quot_float(a, b) ((a)/(b))
-    #define __Pyx_c_neg_float(a)     (-(a))
-  #ifdef __cplusplus
-    #define __Pyx_c_is_zero_float(z) ((z)==(float)0)
-    #define __Pyx_c_conj_float(z)    (::std::conj(z))
-    #if 1
-        #define __Pyx_c_abs_float(z)     (::std::abs(z))
-        #define __Pyx_c_pow_float(a, b)  (::std::pow(a, b))
-    #endif
-  #else
-    #define __Pyx_c_is_zero_float(z) ((z)==0)
-    #define __Pyx_c_conj_float(z)    (conjf(z))
-    #if 1
-        #define __Pyx_c_abs_float(z)     (cabsf(z))
-        #define __Pyx_c_pow_float(a, b)  (cpowf(a, b))
-    #endif
- #endif
-#else
-    static CYTHON_INLINE int __Pyx_c_eq_float(__pyx_t_float_complex, __pyx_t_float_complex);
-    static CYTHON_INLINE __pyx_t_float_complex __Pyx_c_sum_float(__pyx_t_float_complex, __pyx_t_float_complex);
-    static CYTHON_INLINE __pyx_t_float_complex __Pyx_c_diff_float(__pyx_t_float_complex, __pyx_t_float_complex);
-    static CYTHON_INLINE __pyx_t_float_complex __Pyx_c_prod_float(__pyx_t_float_complex, __pyx_t_float_complex);
-    static CYTHON_INLINE __pyx_t_float_complex __Pyx_c_quot_float(__pyx_t_float_complex, __pyx_t_float_complex);
-    static CYTHON_INLINE __pyx_t_float_complex __Pyx_c_neg_float(__pyx_t_float_complex);
-    static CYTHON_INLINE int __Pyx_c_is_zero_float(__pyx_t_float_complex);
-    static CYTHON_INLINE __pyx_t_float_complex __Pyx_c_conj_float(__pyx_t_float_complex);
-    #if 1
-        static CYTHON_INLINE float __Pyx_c_abs_float(__pyx_t_float_complex);
-        static CYTHON_INLINE __pyx_t_float_complex __Pyx_c_pow_float(__pyx_t_float_complex, __pyx_t_float_complex);
-    #endif
-#endif
-
-/* Arithmetic.proto */
-#if CYTHON_CCOMPLEX
-    #define __Pyx_c_eq_double(a, b)   ((a)==(b))
-    #define __Pyx_c_sum_double(a, b)  ((a)+(b))
-    #define __Pyx_c_diff_double(a, b) ((a)-(b))
-    #define __Pyx_c_prod_double(a, b) ((a)*(b))
-    #define __Pyx_c_quot_double(a, b) ((a)/(b))
-    #define __Pyx_c_neg_double(a)     (-(a))
-  #ifdef __cplusplus
-    #define __Pyx_c_is_zero_double(z) ((z)==(double)0)
-    #define __Pyx_c_conj_double(z)    (::std::conj(z))
-    #if 1
-        #define __Pyx_c_abs_double(z)     (::std::abs(z))
-        #define __Pyx_c_pow_double(a, b)  (::std::pow(a, b))
-    #endif
-  #else
-    #define __Pyx_c_is_zero_double(z) ((z)==0)
-    #define __Pyx_c_conj_double(z)    (conj(z))
-    #if 1
-        #define __Pyx_c_abs_double(z)     (cabs(z))
-        #define __Pyx_c_pow_double(a, b)  (cpow(a, b))
-    #endif
- #endif
-#else
-    static CYTHON_INLINE int __Pyx_c_eq_double(__pyx_t_double_complex, __pyx_t_double_complex);
-    static CYTHON_INLINE __pyx_t_double_complex __Pyx_c_sum_double(__pyx_t_double_complex, __pyx_t_double_complex);
-    static CYTHON_INLINE __pyx_t_double_complex __Pyx_c_diff_double(__pyx_t_double_complex, __pyx_t_double_complex);
-    static CYTHON_INLINE __pyx_t_double_complex __Pyx_c_prod_double(__pyx_t_double_complex, __pyx_t_double_complex);
-    static CYTHON_INLINE __pyx_t_double_complex __Pyx_c_quot_double(__pyx_t_double_complex, __pyx_t_double_complex);
-    static CYTHON_INLINE __pyx_t_double_complex __Pyx_c_neg_double(__pyx_t_double_complex);
-    static CYTHON_INLINE int __Pyx_c_is_zero_double(__pyx_t_double_complex);
-    static CYTHON_INLINE __pyx_t_double_complex __Pyx_c_conj_double(__pyx_t_double_complex);
-    #if 1
-        static CYTHON_INLINE double __Pyx_c_abs_double(__pyx_t_double_complex);
-        static CYTHON_INLINE __pyx_t_double_complex __Pyx_c_pow_double(__pyx_t_double_complex, __pyx_t_double_complex);
-    #endif
-#endif
-
-/* CIntFromPy.proto */
-static CYTHON_INLINE int __Pyx_PyInt_As_int(PyObject *);
-
-/* CIntToPy.proto */
-static CYTHON_INLINE PyObject* __Pyx_PyInt_From_int(int value);
-
-/* CIntFromPy.proto */
-static CYTHON_INLINE size_t __Pyx_PyInt_As_size_t(PyObject *);
-
-/* CIntToPy.proto */
-static CYTHON_INLINE PyObject* __Pyx_PyInt_From_long(long value);
-
-/* CIntFromPy.proto */
-static CYTHON_INLINE long __Pyx_PyInt_As_long(PyObject *);
-
-/* FastTypeChecks.proto */
-#if CYTHON_COMPILING_IN_CPYTHON
-#define __Pyx_TypeCheck(obj, type) __Pyx_IsSubtype(Py_TYPE(obj), (PyTypeObject *)type)
-static CYTHON_INLINE int __Pyx_IsSubtype(PyTypeObject *a, PyTypeObject *b);
-static CYTHON_INLINE int __Pyx_PyErr_GivenExceptionMatches(PyObject *err, PyObject *type);
-static CYTHON_INLINE int __Pyx_PyErr_GivenExceptionMatches2(PyObject *err, PyObject *type1, PyObject *type2);
-#else
-#define __Pyx_TypeCheck(obj, type) PyObject_TypeCheck(obj, (PyTypeObject *)type)
-#define __Pyx_PyErr_GivenExceptionMatches(err, type) PyErr_GivenExceptionMatches(err, type)
-#define __Pyx_PyErr_GivenExceptionMatches2(err, type1, type2) (PyErr_GivenExceptionMatches(err, type1) || PyErr_GivenExceptionMatches(err, type2))
-#endif
-#define __Pyx_PyException_Check(obj) __Pyx_TypeCheck(obj, PyExc_Exception)
-
-/* CheckBinaryVersion.proto */
-static int __Pyx_check_binary_version(void);
-
-/* InitStrings.proto */
-static int __Pyx_InitStrings(__Pyx_StringTabEntry *t);
-
-static void __pyx_f_10graphsaint_14cython_sampler_7Sampler_adj_extract(struct __pyx_obj_10graphsaint_14cython_sampler_Sampler *__pyx_v_self, int __pyx_v_p); /* proto*/
-static void __pyx_f_10graphsaint_14cython_sampler_7Sampler_sample(CYTHON_UNUSED struct __pyx_obj_10graphsaint_14cython_sampler_Sampler *__pyx_v_self, CYTHON_UNUSED int __pyx_v_p); /* proto*/
-static void __pyx_f_10graphsaint_14cython_sampler_3MRW_sample(struct __pyx_obj_10graphsaint_14cython_sampler_MRW *__pyx_v_self, int __pyx_v_p); /* proto*/
-static void __pyx_f_10graphsaint_14cython_sampler_2RW_sample(struct __pyx_obj_10graphsaint_14cython_sampler_RW *__pyx_v_self, int __pyx_v_p); /* proto*/
-static void __pyx_f_10graphsaint_14cython_sampler_4Edge_sample(struct __pyx_obj_10graphsaint_14cython_sampler_Edge *__pyx_v_self, int __pyx_v_p); /* proto*/
-static void __pyx_f_10graphsaint_14cython_sampler_5Edge2_sample(struct __pyx_obj_10graphsaint_14cython_sampler_Edge2 *__pyx_v_self, int __pyx_v_p); /* proto*/
-static void __pyx_f_10graphsaint_14cython_sampler_4Node_sample(struct __pyx_obj_10graphsaint_14cython_sampler_Node *__pyx_v_self, int __pyx_v_p); /* proto*/
-static void __pyx_f_10graphsaint_14cython_sampler_9FullBatch_sample(struct __pyx_obj_10graphsaint_14cython_sampler_FullBatch *__pyx_v_self, int __pyx_v_p); /* proto*/
-
-/* Module declarations from 'cython' */
-
-/* Module declarations from 'libcpp.vector' */
-
-/* Module declarations from 'libcpp' */
-
-/* Module declarations from 'libcpp.algorithm' */
-
-/* Module declarations from 'libcpp.utility' */
-
-/* Module declarations from 'libcpp.map' */
-
-/* Module declarations from 'libcpp.unordered_map' */
-
-/* Module declarations from 'cpython.buffer' */
-
-/* Module declarations from 'libc.string' */
-
-/* Module declarations from 'libc.stdio' */
-
-/* Module declarations from '__builtin__' */
-
-/* Module declarations from 'cpython.type' */
-static PyTypeObject *__pyx_ptype_7cpython_4type_type = 0;
-
-/* Module declarations from 'cpython' */
-
-/* Module declarations from 'cpython.object' */
-
-/* Module declarations from 'cpython.ref' */
-
-/* Module declarations from 'cpython.mem' */
-
-/* Module declarations from 'numpy' */
-
-/* Module declarations from 'numpy' */
-static PyTypeObject *__pyx_ptype_5numpy_dtype = 0;
-static PyTypeObject *__pyx_ptype_5numpy_flatiter = 0;
-static PyTypeObject *__pyx_ptype_5numpy_broadcast = 0;
-static PyTypeObject *__pyx_ptype_5numpy_ndarray = 0;
-static PyTypeObject *__pyx_ptype_5numpy_generic = 0;
-static PyTypeObject *__pyx_ptype_5numpy_number = 0;
-static PyTypeObject *__pyx_ptype_5numpy_integer = 0;
-static PyTypeObject *__pyx_ptype_5numpy_signedinteger = 0;
-static PyTypeObject *__pyx_ptype_5numpy_unsignedinteger = 0;
-static PyTypeObject *__pyx_ptype_5numpy_inexact = 0;
-static PyTypeObject *__pyx_ptype_5numpy_floating = 0;
-static PyTypeObject *__pyx_ptype_5numpy_complexfloating = 0;
-static PyTypeObject *__pyx_ptype_5numpy_flexible = 0;
-static PyTypeObject *__pyx_ptype_5numpy_character = 0;
-static PyTypeObject *__pyx_ptype_5numpy_ufunc = 0;
-
-/* Module declarations from 'libc.stdlib' */
-
-/* Module declarations from 'graphsaint.cython_utils' */
-static PyTypeObject *__pyx_ptype_10graphsaint_12cython_utils_array_wrapper_float = 0;
-static PyTypeObject *__pyx_ptype_10graphsaint_12cython_utils_array_wrapper_int = 0;
-static CYTHON_INLINE void __pyx_f_10graphsaint_12cython_utils_npy2vec_int(PyArrayObject *, std::vector<int>  &); /*proto*/
-static CYTHON_INLINE void __pyx_f_10graphsaint_12cython_utils_npy2vec_float(PyArrayObject *, std::vector<float>  &); /*proto*/
-
-/* Module declarations from 'graphsaint.cython_sampler' */
-static PyTypeObject *__pyx_ptype_10graphsaint_14cython_sampler_Sampler = 0;
-static PyTypeObject *__pyx_ptype_10graphsaint_14cython_sampler_MRW = 0;
-static PyTypeObject *__pyx_ptype_10graphsaint_14cython_sampler_RW = 0;
-static PyTypeObject *__pyx_ptype_10graphsaint_14cython_sampler_Edge = 0;
-static PyTypeObject *__pyx_ptype_10graphsaint_14cython_sampler_Edge2 = 0;
-static PyTypeObject *__pyx_ptype_10graphsaint_14cython_sampler_Node = 0;
-static PyTypeObject *__pyx_ptype_10graphsaint_14cython_sampler_FullBatch = 0;
-static __Pyx_TypeInfo __Pyx_TypeInfo_int = { "int", NULL, sizeof(int), { 0 }, 0, IS_UNSIGNED(int) ? 'U' : 'I', IS_UNSIGNED(int), 0 };
-static __Pyx_TypeInfo __Pyx_TypeInfo_float = { "float", NULL, sizeof(float), { 0 }, 0, 'R', 0, 0 };
-#define __Pyx_MODULE_NAME "graphsaint.cython_sampler"
-extern int __pyx_module_is_main_graphsaint__cython_sampler;
-int __pyx_module_is_main_graphsaint__cython_sampler = 0;
-
-/* Implementation of 'graphsaint.cython_sampler' */
-static PyObject *__pyx_builtin_range;
-static PyObject *__pyx_builtin_TypeError;
-static PyObject *__pyx_builtin_ImportError;
-static const char __pyx_k_RW[] = "RW";
-static const char __pyx_k_np[] = "np";
-static const char __pyx_k_MRW[] = "MRW";
-static const char __pyx_k__17[] = "*";
-static const char __pyx_k_Edge[] = "Edge";
-static const char __pyx_k_Node[] = "Node";
-static const char __pyx_k_clip[] = "clip";
-static const char __pyx_k_main[] = "__main__";
-static const char __pyx_k_math[] = "math";
-static const char __pyx_k_mean[] = "mean";
-static const char __pyx_k_name[] = "__name__";
-static const char __pyx_k_size[] = "size";
-static const char __pyx_k_test[] = "__test__";
-static const char __pyx_k_time[] = "time";
-static const char __pyx_k_Edge2[] = "Edge2";
-static const char __pyx_k_dtype[] = "dtype";
-static const char __pyx_k_int32[] = "int32";
-static const char __pyx_k_numpy[] = "numpy";
-static const char __pyx_k_range[] = "range";
-static const char __pyx_k_cutils[] = "cutils";
-static const char __pyx_k_import[] = "__import__";
-static const char __pyx_k_p_dist[] = "p_dist";
-static const char __pyx_k_random[] = "random";
-static const char __pyx_k_reduce[] = "__reduce__";
-static const char __pyx_k_Sampler[] = "Sampler";
-static const char __pyx_k_float32[] = "float32";
-static const char __pyx_k_max_deg[] = "max_deg";
-static const char __pyx_k_getstate[] = "__getstate__";
-static const char __pyx_k_num_proc[] = "num_proc";
-static const char __pyx_k_setstate[] = "__setstate__";
-static const char __pyx_k_FullBatch[] = "FullBatch";
-static const char __pyx_k_TypeError[] = "TypeError";
-static const char __pyx_k_col_train[] = "col_train";
-static const char __pyx_k_prob_edge[] = "prob_edge";
-static const char __pyx_k_reduce_ex[] = "__reduce_ex__";
-static const char __pyx_k_row_train[] = "row_train";
-static const char __pyx_k_size_root[] = "size_root";
-static const char __pyx_k_size_subg[] = "size_subg";
-static const char __pyx_k_adj_indptr[] = "adj_indptr";
-static const char __pyx_k_frombuffer[] = "frombuffer";
-static const char __pyx_k_get_return[] = "get_return";
-static const char __pyx_k_node_train[] = "node_train";
-static const char __pyx_k_pyx_vtable[] = "__pyx_vtable__";
-static const char __pyx_k_size_depth[] = "size_depth";
-static const char __pyx_k_ImportError[] = "ImportError";
-static const char __pyx_k_adj_indices[] = "adj_indices";
-static const char __pyx_k_size_subg_e[] = "size_subg_e";
-static const char __pyx_k_p_dist_cumsum[] = "p_dist_cumsum";
-static const char __pyx_k_reduce_cython[] = "__reduce_cython__";
-static const char __pyx_k_size_frontier[] = "size_frontier";
-static const char __pyx_k_setstate_cython[] = "__setstate_cython__";
-static const char __pyx_k_cline_in_traceback[] = "cline_in_traceback";
-static const char __pyx_k_num_sample_per_proc[] = "num_sample_per_proc";
-static const char __pyx_k_graphsaint_cython_utils[] = "graphsaint.cython_utils";
-static const char __pyx_k_numpy_core_multiarray_failed_to[] = "numpy.core.multiarray failed to import";
-static const char __pyx_k_no_default___reduce___due_to_non[] = "no default __reduce__ due to non-trivial __cinit__";
-static const char __pyx_k_numpy_core_umath_failed_to_impor[] = "numpy.core.umath failed to import";
-static PyObject *__pyx_n_s_Edge;
-static PyObject *__pyx_n_s_Edge2;
-static PyObject *__pyx_n_s_FullBatch;
-static PyObject *__pyx_n_s_ImportError;
-static PyObject *__pyx_n_s_MRW;
-static PyObject *__pyx_n_s_Node;
-static PyObject *__pyx_n_s_RW;
-static PyObject *__pyx_n_s_Sampler;
-static PyObject *__pyx_n_s_TypeError;
-static PyObject *__pyx_n_s__17;
-static PyObject *__pyx_n_s_adj_indices;
-static PyObject *__pyx_n_s_adj_indptr;
-static PyObject *__pyx_n_s_cline_in_traceback;
-static PyObject *__pyx_n_s_clip;
-static PyObject *__pyx_n_s_col_train;
-static PyObject *__pyx_n_s_cutils;
-static PyObject *__pyx_n_s_dtype;
-static PyObject *__pyx_n_s_float32;
-static PyObject *__pyx_n_s_frombuffer;
-static PyObject *__pyx_n_s_get_return;
-static PyObject *__pyx_n_s_getstate;
-static PyObject *__pyx_n_s_graphsaint_cython_utils;
-static PyObject *__pyx_n_s_import;
-static PyObject *__pyx_n_s_int32;
-static PyObject *__pyx_n_s_main;
-static PyObject *__pyx_n_s_math;
-static PyObject *__pyx_n_s_max_deg;
-static PyObject *__pyx_n_s_mean;
-static PyObject *__pyx_n_s_name;
-static PyObject *__pyx_kp_s_no_default___reduce___due_to_non;
-static PyObject *__pyx_n_s_node_train;
-static PyObject *__pyx_n_s_np;
-static PyObject *__pyx_n_s_num_proc;
-static PyObject *__pyx_n_s_num_sample_per_proc;
-static PyObject *__pyx_n_s_numpy;
-static PyObject *__pyx_kp_u_numpy_core_multiarray_failed_to;
-static PyObject *__pyx_kp_u_numpy_core_umath_failed_to_impor;
-static PyObject *__pyx_n_s_p_dist;
-static PyObject *__pyx_n_s_p_dist_cumsum;
-static PyObject *__pyx_n_s_prob_edge;
-static PyObject *__pyx_n_s_pyx_vtable;
-static PyObject *__pyx_n_s_random;
-static PyObject *__pyx_n_s_range;
-static PyObject *__pyx_n_s_reduce;
-static PyObject *__pyx_n_s_reduce_cython;
-static PyObject *__pyx_n_s_reduce_ex;
-static PyObject *__pyx_n_s_row_train;
-static PyObject *__pyx_n_s_setstate;
-static PyObject *__pyx_n_s_setstate_cython;
-static PyObject *__pyx_n_s_size;
-static PyObject *__pyx_n_s_size_depth;
-static PyObject *__pyx_n_s_size_frontier;
-static PyObject *__pyx_n_s_size_root;
-static PyObject *__pyx_n_s_size_subg;
-static PyObject *__pyx_n_s_size_subg_e;
-static PyObject *__pyx_n_s_test;
-static PyObject *__pyx_n_s_time;
-static int __pyx_pf_10graphsaint_14cython_sampler_7Sampler___cinit__(struct __pyx_obj_10graphsaint_14cython_sampler_Sampler *__pyx_v_self, PyArrayObject *__pyx_v_adj_indptr, PyArrayObject *__pyx_v_adj_indices, PyArrayObject *__pyx_v_node_train, int __pyx_v_num_proc, int __pyx_v_num_sample_per_proc, CYTHON_UNUSED PyObject *__pyx_v_argv); /* proto */
-static PyObject *__pyx_pf_10graphsaint_14cython_sampler_7Sampler_2get_return(struct __pyx_obj_10graphsaint_14cython_sampler_Sampler *__pyx_v_self); /* proto */
-static PyObject *__pyx_pf_10graphsaint_14cython_sampler_7Sampler_4par_sample(struct __pyx_obj_10graphsaint_14cython_sampler_Sampler *__pyx_v_self); /* proto */
-static PyObject *__pyx_pf_10graphsaint_14cython_sampler_7Sampler_6__reduce_cython__(CYTHON_UNUSED struct __pyx_obj_10graphsaint_14cython_sampler_Sampler *__pyx_v_self); /* proto */
-static PyObject *__pyx_pf_10graphsaint_14cython_sampler_7Sampler_8__setstate_cython__(CYTHON_UNUSED struct __pyx_obj_10graphsaint_14cython_sampler_Sampler *__pyx_v_self, CYTHON_UNUSED PyObject *__pyx_v___pyx_state); /* proto */
-static int __pyx_pf_10graphsaint_14cython_sampler_3MRW___cinit__(struct __pyx_obj_10graphsaint_14cython_sampler_MRW *__pyx_v_self, CYTHON_UNUSED PyArrayObject *__pyx_v_adj_indptr, CYTHON_UNUSED PyArrayObject *__pyx_v_adj_indices, CYTHON_UNUSED PyArrayObject *__pyx_v_node_train, CYTHON_UNUSED int __pyx_v_num_proc, CYTHON_UNUSED int __pyx_v_num_sample_per_proc, PyArrayObject *__pyx_v_p_dist, int __pyx_v_max_deg, int __pyx_v_size_frontier, int __pyx_v_size_subg); /* proto */
-static PyObject *__pyx_pf_10graphsaint_14cython_sampler_3MRW_2__reduce_cython__(CYTHON_UNUSED struct __pyx_obj_10graphsaint_14cython_sampler_MRW *__pyx_v_self); /* proto */
-static PyObject *__pyx_pf_10graphsaint_14cython_sampler_3MRW_4__setstate_cython__(CYTHON_UNUSED struct __pyx_obj_10graphsaint_14cython_sampler_MRW *__pyx_v_self, CYTHON_UNUSED PyObject *__pyx_v___pyx_state); /* proto */
-static int __pyx_pf_10graphsaint_14cython_sampler_2RW___cinit__(struct __pyx_obj_10graphsaint_14cython_sampler_RW *__pyx_v_self, CYTHON_UNUSED PyArrayObject *__pyx_v_adj_indptr, CYTHON_UNUSED PyArrayObject *__pyx_v_adj_indices, CYTHON_UNUSED PyArrayObject *__pyx_v_node_train, CYTHON_UNUSED int __pyx_v_num_proc, CYTHON_UNUSED int __pyx_v_num_sample_per_proc, int __pyx_v_size_root, int __pyx_v_size_depth); /* proto */
-static PyObject *__pyx_pf_10graphsaint_14cython_sampler_2RW_2__reduce_cython__(CYTHON_UNUSED struct __pyx_obj_10graphsaint_14cython_sampler_RW *__pyx_v_self); /* proto */
-static PyObject *__pyx_pf_10graphsaint_14cython_sampler_2RW_4__setstate_cython__(CYTHON_UNUSED struct __pyx_obj_10graphsaint_14cython_sampler_RW *__pyx_v_self, CYTHON_UNUSED PyObject *__pyx_v___pyx_state); /* proto */
-static int __pyx_pf_10graphsaint_14cython_sampler_4Edge___cinit__(struct __pyx_obj_10graphsaint_14cython_sampler_Edge *__pyx_v_self, CYTHON_UNUSED PyArrayObject *__pyx_v_adj_indptr, CYTHON_UNUSED PyArrayObject *__pyx_v_adj_indices, CYTHON_UNUSED PyArrayObject *__pyx_v_node_train, CYTHON_UNUSED int __pyx_v_num_proc, CYTHON_UNUSED int __pyx_v_num_sample_per_proc, PyArrayObject *__pyx_v_row_train, PyArrayObject *__pyx_v_col_train, PyArrayObject *__pyx_v_prob_edge, CYTHON_UNUSED PyObject *__pyx_v_argv); /* proto */
-static PyObject *__pyx_pf_10graphsaint_14cython_sampler_4Edge_2__reduce_cython__(CYTHON_UNUSED struct __pyx_obj_10graphsaint_14cython_sampler_Edge *__pyx_v_self); /* proto */
-static PyObject *__pyx_pf_10graphsaint_14cython_sampler_4Edge_4__setstate_cython__(CYTHON_UNUSED struct __pyx_obj_10graphsaint_14cython_sampler_Edge *__pyx_v_self, CYTHON_UNUSED PyObject *__pyx_v___pyx_state); /* proto */
-static int __pyx_pf_10graphsaint_14cython_sampler_5Edge2___cinit__(struct __pyx_obj_10graphsaint_14cython_sampler_Edge2 *__pyx_v_self, CYTHON_UNUSED PyArrayObject *__pyx_v_adj_indptr, CYTHON_UNUSED PyArrayObject *__pyx_v_adj_indices, CYTHON_UNUSED PyArrayObject *__pyx_v_node_train, CYTHON_UNUSED int __pyx_v_num_proc, CYTHON_UNUSED int __pyx_v_num_sample_per_proc, PyArrayObject *__pyx_v_row_train, PyArrayObject *__pyx_v_col_train, PyArrayObject *__pyx_v_p_dist_cumsum, int __pyx_v_size_subg_e); /* proto */
-static PyObject *__pyx_pf_10graphsaint_14cython_sampler_5Edge2_2__reduce_cython__(CYTHON_UNUSED struct __pyx_obj_10graphsaint_14cython_sampler_Edge2 *__pyx_v_self); /* proto */
-static PyObject *__pyx_pf_10graphsaint_14cython_sampler_5Edge2_4__setstate_cython__(CYTHON_UNUSED struct __pyx_obj_10graphsaint_14cython_sampler_Edge2 *__pyx_v_self, CYTHON_UNUSED PyObject *__pyx_v___pyx_state); /* proto */
-static int __pyx_pf_10graphsaint_14cython_sampler_4Node___cinit__(struct __pyx_obj_10graphsaint_14cython_sampler_Node *__pyx_v_self, CYTHON_UNUSED PyArrayObject *__pyx_v_adj_indptr, CYTHON_UNUSED PyArrayObject *__pyx_v_adj_indices, CYTHON_UNUSED PyArrayObject *__pyx_v_node_train, CYTHON_UNUSED int __pyx_v_num_proc, CYTHON_UNUSED int __pyx_v_num_sample_per_proc, PyArrayObject *__pyx_v_p_dist_cumsum, int __pyx_v_size_subg); /* proto */
-static PyObject *__pyx_pf_10graphsaint_14cython_sampler_4Node_2__reduce_cython__(CYTHON_UNUSED struct __pyx_obj_10graphsaint_14cython_sampler_Node *__pyx_v_self); /* proto */
-static PyObject *__pyx_pf_10graphsaint_14cython_sampler_4Node_4__setstate_cython__(CYTHON_UNUSED struct __pyx_obj_10graphsaint_14cython_sampler_Node *__pyx_v_self, CYTHON_UNUSED PyObject *__pyx_v___pyx_state); /* proto */
-static int __pyx_pf_10graphsaint_14cython_sampler_9FullBatch___cinit__(CYTHON_UNUSED struct __pyx_obj_10graphsaint_14cython_sampler_FullBatch *__pyx_v_self, CYTHON_UNUSED PyArrayObject *__pyx_v_adj_indptr, CYTHON_UNUSED PyArrayObject *__pyx_v_adj_indices, CYTHON_UNUSED PyArrayObject *__pyx_v_node_train, CYTHON_UNUSED int __pyx_v_num_proc, CYTHON_UNUSED int __pyx_v_num_sample_per_proc); /* proto */
-static PyObject *__pyx_pf_10graphsaint_14cython_sampler_9FullBatch_2__reduce_cython__(CYTHON_UNUSED struct __pyx_obj_10graphsaint_14cython_sampler_FullBatch *__pyx_v_self); /* proto */
-static PyObject *__pyx_pf_10graphsaint_14cython_sampler_9FullBatch_4__setstate_cython__(CYTHON_UNUSED struct __pyx_obj_10graphsaint_14cython_sampler_FullBatch *__pyx_v_self, CYTHON_UNUSED PyObject *__pyx_v___pyx_state); /* proto */
-static PyObject *__pyx_tp_new_10graphsaint_14cython_sampler_Sampler(PyTypeObject *t, PyObject *a, PyObject *k); /*proto*/
-static PyObject *__pyx_tp_new_10graphsaint_14cython_sampler_MRW(PyTypeObject *t, PyObject *a, PyObject *k); /*proto*/
-static PyObject *__pyx_tp_new_10graphsaint_14cython_sampler_RW(PyTypeObject *t, PyObject *a, PyObject *k); /*proto*/
-static PyObject *__pyx_tp_new_10graphsaint_14cython_sampler_Edge(PyTypeObject *t, PyObject *a, PyObject *k); /*proto*/
-static PyObject *__pyx_tp_new_10graphsaint_14cython_sampler_Edge2(PyTypeObject *t, PyObject *a, PyObject *k); /*proto*/
-static PyObject *__pyx_tp_new_10graphsaint_14cython_sampler_Node(PyTypeObject *t, PyObject *a, PyObject *k); /*proto*/
-static PyObject *__pyx_tp_new_10graphsaint_14cython_sampler_FullBatch(PyTypeObject *t, PyObject *a, PyObject *k); /*proto*/
-static PyObject *__pyx_int_0;
-static PyObject *__pyx_int_1;
-static PyObject *__pyx_tuple_;
-static PyObject *__pyx_tuple__2;
-static PyObject *__pyx_tuple__3;
-static PyObject *__pyx_tuple__4;
-static PyObject *__pyx_tuple__5;
-static PyObject *__pyx_tuple__6;
-static PyObject *__pyx_tuple__7;
-static PyObject *__pyx_tuple__8;
-static PyObject *__pyx_tuple__9;
-static PyObject *__pyx_tuple__10;
-static PyObject *__pyx_tuple__11;
-static PyObject *__pyx_tuple__12;
-static PyObject *__pyx_tuple__13;
-static PyObject *__pyx_tuple__14;
-static PyObject *__pyx_tuple__15;
-static PyObject *__pyx_tuple__16;
-/* Late includes */
-
-/* "graphsaint/cython_sampler.pyx":41
- *     cdef vector[vector[int]] ret_edge_index
- * 
- *     def __cinit__(self, np.ndarray[int,ndim=1,mode='c'] adj_indptr,             # <<<<<<<<<<<<<<
- *                         np.ndarray[int,ndim=1,mode='c'] adj_indices,
- *                         np.ndarray[int,ndim=1,mode='c'] node_train,
- */
-
-/* Python wrapper */
-static int __pyx_pw_10graphsaint_14cython_sampler_7Sampler_1__cinit__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static int __pyx_pw_10graphsaint_14cython_sampler_7Sampler_1__cinit__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
-  PyArrayObject *__pyx_v_adj_indptr = 0;
-  PyArrayObject *__pyx_v_adj_indices = 0;
-  PyArrayObject *__pyx_v_node_train = 0;
-  int __pyx_v_num_proc;
-  int __pyx_v_num_sample_per_proc;
-  CYTHON_UNUSED PyObject *__pyx_v_argv = 0;
-  int __pyx_lineno = 0;
-  const char *__pyx_filename = NULL;
-  int __pyx_clineno = 0;
-  int __pyx_r;
-  __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("__cinit__ (wrapper)", 0);
-  if (PyTuple_GET_SIZE(__pyx_args) > 5) {
-    __pyx_v_argv = PyTuple_GetSlice(__pyx_args, 5, PyTuple_GET_SIZE(__pyx_args));
-    if (unlikely(!__pyx_v_argv)) {
-      __Pyx_RefNannyFinishContext();
-      return -1;
-    }
-    __Pyx_GOTREF(__pyx_v_argv);
-  } else {
-    __pyx_v_argv = __pyx_empty_tuple; __Pyx_INCREF(__pyx_empty_tuple);
-  }
-  {
-    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_adj_indptr,&__pyx_n_s_adj_indices,&__pyx_n_s_node_train,&__pyx_n_s_num_proc,&__pyx_n_s_num_sample_per_proc,0};
-    PyObject* values[5] = {0,0,0,0,0};
-    if (unlikely(__pyx_kwds)) {
-      Py_ssize_t kw_args;
-      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
-      switch (pos_args) {
-        default:
-        case  5: values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
-        CYTHON_FALLTHROUGH;
-        case  4: values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
-        CYTHON_FALLTHROUGH;
-        case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
-        CYTHON_FALLTHROUGH;
-        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
-        CYTHON_FALLTHROUGH;
-        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
-        CYTHON_FALLTHROUGH;
-        case  0: break;
-      }
-      kw_args = PyDict_Size(__pyx_kwds);
-      switch (pos_args) {
-        case  0:
-        if (likely((values[0] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_adj_indptr)) != 0)) kw_args--;
-        else goto __pyx_L5_argtuple_error;
-        CYTHON_FALLTHROUGH;
-        case  1:
-        if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_adj_indices)) != 0)) kw_args--;
-        else {
-          __Pyx_RaiseArgtupleInvalid("__cinit__", 0, 5, 5, 1); __PYX_ERR(0, 41, __pyx_L3_error)
-        }
-        CYTHON_FALLTHROUGH;
-        case  2:
-        if (likely((values[2] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_node_train)) != 0)) kw_args--;
-        else {
-          __Pyx_RaiseArgtupleInvalid("__cinit__", 0, 5, 5, 2); __PYX_ERR(0, 41, __pyx_L3_error)
-        }
-        CYTHON_FALLTHROUGH;
-        case  3:
-        if (likely((values[3] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_num_proc)) != 0)) kw_args--;
-        else {
-          __Pyx_RaiseArgtupleInvalid("__cinit__", 0, 5, 5, 3); __PYX_ERR(0, 41, __pyx_L3_error)
-        }
-        CYTHON_FALLTHROUGH;
-        case  4:
-        if (likely((values[4] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_num_sample_per_proc)) != 0)) kw_args--;
-        else {
-          __Pyx_RaiseArgtupleInvalid("__cinit__", 0, 5, 5, 4); __PYX_ERR(0, 41, __pyx_L3_error)
-        }
-      }
-      if (unlikely(kw_args > 0)) {
-        const Py_ssize_t used_pos_args = (pos_args < 5) ? pos_args : 5;
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, used_pos_args, "__cinit__") < 0)) __PYX_ERR(0, 41, __pyx_L3_error)
-      }
-    } else if (PyTuple_GET_SIZE(__pyx_args) < 5) {
-      goto __pyx_L5_argtuple_error;
-    } else {
-      values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
-      values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
-      values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
-      values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
-      values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
-    }
-    __pyx_v_adj_indptr = ((PyArrayObject *)values[0]);
-    __pyx_v_adj_indices = ((PyArrayObject *)values[1]);
-    __pyx_v_node_train = ((PyArrayObject *)values[2]);
-    __pyx_v_num_proc = __Pyx_PyInt_As_int(values[3]); if (unlikely((__pyx_v_num_proc == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 44, __pyx_L3_error)
-    __pyx_v_num_sample_per_proc = __Pyx_PyInt_As_int(values[4]); if (unlikely((__pyx_v_num_sample_per_proc == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 44, __pyx_L3_error)
-  }
-  goto __pyx_L4_argument_unpacking_done;
-  __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("__cinit__", 0, 5, 5, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 41, __pyx_L3_error)
-  __pyx_L3_error:;
-  __Pyx_DECREF(__pyx_v_argv); __pyx_v_argv = 0;
-  __Pyx_AddTraceback("graphsaint.cython_sampler.Sampler.__cinit__", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __Pyx_RefNannyFinishContext();
-  return -1;
-  __pyx_L4_argument_unpacking_done:;
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_adj_indptr), __pyx_ptype_5numpy_ndarray, 1, "adj_indptr", 0))) __PYX_ERR(0, 41, __pyx_L1_error)
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_adj_indices), __pyx_ptype_5numpy_ndarray, 1, "adj_indices", 0))) __PYX_ERR(0, 42, __pyx_L1_error)
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_node_train), __pyx_ptype_5numpy_ndarray, 1, "node_train", 0))) __PYX_ERR(0, 43, __pyx_L1_error)
-  __pyx_r = __pyx_pf_10graphsaint_14cython_sampler_7Sampler___cinit__(((struct __pyx_obj_10graphsaint_14cython_sampler_Sampler *)__pyx_v_self), __pyx_v_adj_indptr, __pyx_v_adj_indices, __pyx_v_node_train, __pyx_v_num_proc, __pyx_v_num_sample_per_proc, __pyx_v_argv);
-
-  /* function exit code */
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __pyx_r = -1;
-  __pyx_L0:;
-  __Pyx_XDECREF(__pyx_v_argv);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-static int __pyx_pf_10graphsaint_14cython_sampler_7Sampler___cinit__(struct __pyx_obj_10graphsaint_14cython_sampler_Sampler *__pyx_v_self, PyArrayObject *__pyx_v_adj_indptr, PyArrayObject *__pyx_v_adj_indices, PyArrayObject *__pyx_v_node_train, int __pyx_v_num_proc, int __pyx_v_num_sample_per_proc, CYTHON_UNUSED PyObject *__pyx_v_argv) {
-  __Pyx_LocalBuf_ND __pyx_pybuffernd_adj_indices;
-  __Pyx_Buffer __pyx_pybuffer_adj_indices;
-  __Pyx_LocalBuf_ND __pyx_pybuffernd_adj_indptr;
-  __Pyx_Buffer __pyx_pybuffer_adj_indptr;
-  __Pyx_LocalBuf_ND __pyx_pybuffernd_node_train;
-  __Pyx_Buffer __pyx_pybuffer_node_train;
-  int __pyx_r;
-  __Pyx_RefNannyDeclarations
-  std::vector<std::vector<int> >  __pyx_t_1;
-  std::vector<std::vector<float> >  __pyx_t_2;
-  int __pyx_lineno = 0;
-  const char *__pyx_filename = NULL;
-  int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("__cinit__", 0);
-  __pyx_pybuffer_adj_indptr.pybuffer.buf = NULL;
-  __pyx_pybuffer_adj_indptr.refcount = 0;
-  __pyx_pybuffernd_adj_indptr.data = NULL;
-  __pyx_pybuffernd_adj_indptr.rcbuffer = &__pyx_pybuffer_adj_indptr;
-  __pyx_pybuffer_adj_indices.pybuffer.buf = NULL;
-  __pyx_pybuffer_adj_indices.refcount = 0;
-  __pyx_pybuffernd_adj_indices.data = NULL;
-  __pyx_pybuffernd_adj_indices.rcbuffer = &__pyx_pybuffer_adj_indices;
-  __pyx_pybuffer_node_train.pybuffer.buf = NULL;
-  __pyx_pybuffer_node_train.refcount = 0;
-  __pyx_pybuffernd_node_train.data = NULL;
-  __pyx_pybuffernd_node_train.rcbuffer = &__pyx_pybuffer_node_train;
-  {
-    __Pyx_BufFmt_StackElem __pyx_stack[1];
-    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_adj_indptr.rcbuffer->pybuffer, (PyObject*)__pyx_v_adj_indptr, &__Pyx_TypeInfo_int, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 41, __pyx_L1_error)
-  }
-  __pyx_pybuffernd_adj_indptr.diminfo[0].strides = __pyx_pybuffernd_adj_indptr.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_adj_indptr.diminfo[0].shape = __pyx_pybuffernd_adj_indptr.rcbuffer->pybuffer.shape[0];
-  {
-    __Pyx_BufFmt_StackElem __pyx_stack[1];
-    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_adj_indices.rcbuffer->pybuffer, (PyObject*)__pyx_v_adj_indices, &__Pyx_TypeInfo_int, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 41, __pyx_L1_error)
-  }
-  __pyx_pybuffernd_adj_indices.diminfo[0].strides = __pyx_pybuffernd_adj_indices.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_adj_indices.diminfo[0].shape = __pyx_pybuffernd_adj_indices.rcbuffer->pybuffer.shape[0];
-  {
-    __Pyx_BufFmt_StackElem __pyx_stack[1];
-    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_node_train.rcbuffer->pybuffer, (PyObject*)__pyx_v_node_train, &__Pyx_TypeInfo_int, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 41, __pyx_L1_error)
-  }
-  __pyx_pybuffernd_node_train.diminfo[0].strides = __pyx_pybuffernd_node_train.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_node_train.diminfo[0].shape = __pyx_pybuffernd_node_train.rcbuffer->pybuffer.shape[0];
-
-  /* "graphsaint/cython_sampler.pyx":45
- *                         np.ndarray[int,ndim=1,mode='c'] node_train,
- *                         int num_proc, int num_sample_per_proc,*argv):
- *         cutils.npy2vec_int(adj_indptr,self.adj_indptr_vec)             # <<<<<<<<<<<<<<
- *         cutils.npy2vec_int(adj_indices,self.adj_indices_vec)
- *         cutils.npy2vec_int(node_train,self.node_train_vec)
- */
-  __pyx_f_10graphsaint_12cython_utils_npy2vec_int(((PyArrayObject *)__pyx_v_adj_indptr), __pyx_v_self->adj_indptr_vec);
-
-  /* "graphsaint/cython_sampler.pyx":46
- *                         int num_proc, int num_sample_per_proc,*argv):
- *         cutils.npy2vec_int(adj_indptr,self.adj_indptr_vec)
- *         cutils.npy2vec_int(adj_indices,self.adj_indices_vec)             # <<<<<<<<<<<<<<
- *         cutils.npy2vec_int(node_train,self.node_train_vec)
- *         self.num_proc = num_proc
- */
-  __pyx_f_10graphsaint_12cython_utils_npy2vec_int(((PyArrayObject *)__pyx_v_adj_indices), __pyx_v_self->adj_indices_vec);
-
-  /* "graphsaint/cython_sampler.pyx":47
- *         cutils.npy2vec_int(adj_indptr,self.adj_indptr_vec)
- *         cutils.npy2vec_int(adj_indices,self.adj_indices_vec)
- *         cutils.npy2vec_int(node_train,self.node_train_vec)             # <<<<<<<<<<<<<<
- *         self.num_proc = num_proc
- *         self.num_sample_per_proc = num_sample_per_proc
- */
-  __pyx_f_10graphsaint_12cython_utils_npy2vec_int(((PyArrayObject *)__pyx_v_node_train), __pyx_v_self->node_train_vec);
-
-  /* "graphsaint/cython_sampler.pyx":48
- *         cutils.npy2vec_int(adj_indices,self.adj_indices_vec)
- *         cutils.npy2vec_int(node_train,self.node_train_vec)
- *         self.num_proc = num_proc             # <<<<<<<<<<<<<<
- *         self.num_sample_per_proc = num_sample_per_proc
- *         self.node_sampled = vector[vector[int]](num_proc*num_sample_per_proc)
- */
-  __pyx_v_self->num_proc = __pyx_v_num_proc;
-
-  /* "graphsaint/cython_sampler.pyx":49
- *         cutils.npy2vec_int(node_train,self.node_train_vec)
- *         self.num_proc = num_proc
- *         self.num_sample_per_proc = num_sample_per_proc             # <<<<<<<<<<<<<<
- *         self.node_sampled = vector[vector[int]](num_proc*num_sample_per_proc)
- *         self.ret_indptr = vector[vector[int]](num_proc*num_sample_per_proc)
- */
-  __pyx_v_self->num_sample_per_proc = __pyx_v_num_sample_per_proc;
-
-  /* "graphsaint/cython_sampler.pyx":50
- *         self.num_proc = num_proc
- *         self.num_sample_per_proc = num_sample_per_proc
- *         self.node_sampled = vector[vector[int]](num_proc*num_sample_per_proc)             # <<<<<<<<<<<<<<
- *         self.ret_indptr = vector[vector[int]](num_proc*num_sample_per_proc)
- *         self.ret_indices = vector[vector[int]](num_proc*num_sample_per_proc)
- */
-  try {
-    __pyx_t_1 = std::vector<std::vector<int> > ((__pyx_v_num_proc * __pyx_v_num_sample_per_proc));
-  } catch(...) {
-    __Pyx_CppExn2PyErr();
-    __PYX_ERR(0, 50, __pyx_L1_error)
-  }
-  __pyx_v_self->node_sampled = __pyx_t_1;
-
-  /* "graphsaint/cython_sampler.pyx":51
- *         self.num_sample_per_proc = num_sample_per_proc
- *         self.node_sampled = vector[vector[int]](num_proc*num_sample_per_proc)
- *         self.ret_indptr = vector[vector[int]](num_proc*num_sample_per_proc)             # <<<<<<<<<<<<<<
- *         self.ret_indices = vector[vector[int]](num_proc*num_sample_per_proc)
- *         self.ret_indices_orig = vector[vector[int]](num_proc*num_sample_per_proc)
- */
-  try {
-    __pyx_t_1 = std::vector<std::vector<int> > ((__pyx_v_num_proc * __pyx_v_num_sample_per_proc));
-  } catch(...) {
-    __Pyx_CppExn2PyErr();
-    __PYX_ERR(0, 51, __pyx_L1_error)
-  }
-  __pyx_v_self->ret_indptr = __pyx_t_1;
-
-  /* "graphsaint/cython_sampler.pyx":52
- *         self.node_sampled = vector[vector[int]](num_proc*num_sample_per_proc)
- *         self.ret_indptr = vector[vector[int]](num_proc*num_sample_per_proc)
- *         self.ret_indices = vector[vector[int]](num_proc*num_sample_per_proc)             # <<<<<<<<<<<<<<
- *         self.ret_indices_orig = vector[vector[int]](num_proc*num_sample_per_proc)
- *         self.ret_data = vector[vector[float]](num_proc*num_sample_per_proc)
- */
-  try {
-    __pyx_t_1 = std::vector<std::vector<int> > ((__pyx_v_num_proc * __pyx_v_num_sample_per_proc));
-  } catch(...) {
-    __Pyx_CppExn2PyErr();
-    __PYX_ERR(0, 52, __pyx_L1_error)
-  }
-  __pyx_v_self->ret_indices = __pyx_t_1;
-
-  /* "graphsaint/cython_sampler.pyx":53
- *         self.ret_indptr = vector[vector[int]](num_proc*num_sample_per_proc)
- *         self.ret_indices = vector[vector[int]](num_proc*num_sample_per_proc)
- *         self.ret_indices_orig = vector[vector[int]](num_proc*num_sample_per_proc)             # <<<<<<<<<<<<<<
- *         self.ret_data = vector[vector[float]](num_proc*num_sample_per_proc)
- *         self.ret_edge_index = vector[vector[int]](num_proc*num_sample_per_proc)
- */
-  try {
-    __pyx_t_1 = std::vector<std::vector<int> > ((__pyx_v_num_proc * __pyx_v_num_sample_per_proc));
-  } catch(...) {
-    __Pyx_CppExn2PyErr();
-    __PYX_ERR(0, 53, __pyx_L1_error)
-  }
-  __pyx_v_self->ret_indices_orig = __pyx_t_1;
-
-  /* "graphsaint/cython_sampler.pyx":54
- *         self.ret_indices = vector[vector[int]](num_proc*num_sample_per_proc)
- *         self.ret_indices_orig = vector[vector[int]](num_proc*num_sample_per_proc)
- *         self.ret_data = vector[vector[float]](num_proc*num_sample_per_proc)             # <<<<<<<<<<<<<<
- *         self.ret_edge_index = vector[vector[int]](num_proc*num_sample_per_proc)
- * 
- */
-  try {
-    __pyx_t_2 = std::vector<std::vector<float> > ((__pyx_v_num_proc * __pyx_v_num_sample_per_proc));
-  } catch(...) {
-    __Pyx_CppExn2PyErr();
-    __PYX_ERR(0, 54, __pyx_L1_error)
-  }
-  __pyx_v_self->ret_data = __pyx_t_2;
-
-  /* "graphsaint/cython_sampler.pyx":55
- *         self.ret_indices_orig = vector[vector[int]](num_proc*num_sample_per_proc)
- *         self.ret_data = vector[vector[float]](num_proc*num_sample_per_proc)
- *         self.ret_edge_index = vector[vector[int]](num_proc*num_sample_per_proc)             # <<<<<<<<<<<<<<
- * 
- *     cdef void adj_extract(self, int p) nogil:
- */
-  try {
-    __pyx_t_1 = std::vector<std::vector<int> > ((__pyx_v_num_proc * __pyx_v_num_sample_per_proc));
-  } catch(...) {
-    __Pyx_CppExn2PyErr();
-    __PYX_ERR(0, 55, __pyx_L1_error)
-  }
-  __pyx_v_self->ret_edge_index = __pyx_t_1;
-
-  /* "graphsaint/cython_sampler.pyx":41
- *     cdef vector[vector[int]] ret_edge_index
- * 
- *     def __cinit__(self, np.ndarray[int,ndim=1,mode='c'] adj_indptr,             # <<<<<<<<<<<<<<
- *                         np.ndarray[int,ndim=1,mode='c'] adj_indices,
- *                         np.ndarray[int,ndim=1,mode='c'] node_train,
- */
-
-  /* function exit code */
-  __pyx_r = 0;
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  { PyObject *__pyx_type, *__pyx_value, *__pyx_tb;
-    __Pyx_PyThreadState_declare
-    __Pyx_PyThreadState_assign
-    __Pyx_ErrFetch(&__pyx_type, &__pyx_value, &__pyx_tb);
-    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_adj_indices.rcbuffer->pybuffer);
-    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_adj_indptr.rcbuffer->pybuffer);
-    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_node_train.rcbuffer->pybuffer);
-  __Pyx_ErrRestore(__pyx_type, __pyx_value, __pyx_tb);}
-  __Pyx_AddTraceback("graphsaint.cython_sampler.Sampler.__cinit__", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __pyx_r = -1;
-  goto __pyx_L2;
-  __pyx_L0:;
-  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_adj_indices.rcbuffer->pybuffer);
-  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_adj_indptr.rcbuffer->pybuffer);
-  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_node_train.rcbuffer->pybuffer);
-  __pyx_L2:;
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "graphsaint/cython_sampler.pyx":57
- *         self.ret_edge_index = vector[vector[int]](num_proc*num_sample_per_proc)
- * 
- *     cdef void adj_extract(self, int p) nogil:             # <<<<<<<<<<<<<<
- *         """
- *         Extract a subg adj matrix from the original training adj matrix
- */
-
-static void __pyx_f_10graphsaint_14cython_sampler_7Sampler_adj_extract(struct __pyx_obj_10graphsaint_14cython_sampler_Sampler *__pyx_v_self, int __pyx_v_p) {
-  int __pyx_v_r;
-  int __pyx_v_idx_g;
-  int __pyx_v_i;
-  int __pyx_v_i_end;
-  int __pyx_v_v;
-  int __pyx_v_j;
-  int __pyx_v_num_v_orig;
-  int __pyx_v_num_v_sub;
-  int __pyx_v_start_neigh;
-  int __pyx_v_end_neigh;
-  std::vector<int>  __pyx_v__arr_bit;
-  int __pyx_v_cumsum;
-  int __pyx_t_1;
-  std::vector<int>  __pyx_t_2;
-  std::vector<float>  __pyx_t_3;
-  int __pyx_lineno = 0;
-  const char *__pyx_filename = NULL;
-  int __pyx_clineno = 0;
-
-  /* "graphsaint/cython_sampler.pyx":62
- *         ret_indices_orig:   the indices vector corresponding to node id in original G.
- *         """
- *         cdef int r = 0             # <<<<<<<<<<<<<<
- *         cdef int idx_g = 0
- *         cdef int i, i_end, v, j
- */
-  __pyx_v_r = 0;
-
-  /* "graphsaint/cython_sampler.pyx":63
- *         """
- *         cdef int r = 0
- *         cdef int idx_g = 0             # <<<<<<<<<<<<<<
- *         cdef int i, i_end, v, j
- *         cdef int num_v_orig, num_v_sub
- */
-  __pyx_v_idx_g = 0;
-
-  /* "graphsaint/cython_sampler.pyx":69
- *         cdef vector[int] _arr_bit
- *         cdef int cumsum
- *         num_v_orig = self.adj_indptr_vec.size()-1             # <<<<<<<<<<<<<<
- *         while r < self.num_sample_per_proc:
- *             _arr_bit = vector[int](num_v_orig,-1)
- */
-  __pyx_v_num_v_orig = (__pyx_v_self->adj_indptr_vec.size() - 1);
-
-  /* "graphsaint/cython_sampler.pyx":70
- *         cdef int cumsum
- *         num_v_orig = self.adj_indptr_vec.size()-1
- *         while r < self.num_sample_per_proc:             # <<<<<<<<<<<<<<
- *             _arr_bit = vector[int](num_v_orig,-1)
- *             idx_g = p*self.num_sample_per_proc+r
- */
-  while (1) {
-    __pyx_t_1 = ((__pyx_v_r < __pyx_v_self->num_sample_per_proc) != 0);
-    if (!__pyx_t_1) break;
-
-    /* "graphsaint/cython_sampler.pyx":71
- *         num_v_orig = self.adj_indptr_vec.size()-1
- *         while r < self.num_sample_per_proc:
- *             _arr_bit = vector[int](num_v_orig,-1)             # <<<<<<<<<<<<<<
- *             idx_g = p*self.num_sample_per_proc+r
- *             num_v_sub = self.node_sampled[idx_g].size()
- */
-    try {
-      __pyx_t_2 = std::vector<int> (__pyx_v_num_v_orig, -1);
-    } catch(...) {
-      #ifdef WITH_THREAD
-      PyGILState_STATE __pyx_gilstate_save = __Pyx_PyGILState_Ensure();
-      #endif
-      __Pyx_CppExn2PyErr();
-      #ifdef WITH_THREAD
-      __Pyx_PyGILState_Release(__pyx_gilstate_save);
-      #endif
-      __PYX_ERR(0, 71, __pyx_L1_error)
-    }
-    __pyx_v__arr_bit = __pyx_t_2;
-
-    /* "graphsaint/cython_sampler.pyx":72
- *         while r < self.num_sample_per_proc:
- *             _arr_bit = vector[int](num_v_orig,-1)
- *             idx_g = p*self.num_sample_per_proc+r             # <<<<<<<<<<<<<<
- *             num_v_sub = self.node_sampled[idx_g].size()
- *             self.ret_indptr[idx_g] = vector[int](num_v_sub+1,0)
- */
-    __pyx_v_idx_g = ((__pyx_v_p * __pyx_v_self->num_sample_per_proc) + __pyx_v_r);
-
-    /* "graphsaint/cython_sampler.pyx":73
- *             _arr_bit = vector[int](num_v_orig,-1)
- *             idx_g = p*self.num_sample_per_proc+r
- *             num_v_sub = self.node_sampled[idx_g].size()             # <<<<<<<<<<<<<<
- *             self.ret_indptr[idx_g] = vector[int](num_v_sub+1,0)
- *             self.ret_indices[idx_g] = vector[int]()
- */
-    __pyx_v_num_v_sub = (__pyx_v_self->node_sampled[__pyx_v_idx_g]).size();
-
-    /* "graphsaint/cython_sampler.pyx":74
- *             idx_g = p*self.num_sample_per_proc+r
- *             num_v_sub = self.node_sampled[idx_g].size()
- *             self.ret_indptr[idx_g] = vector[int](num_v_sub+1,0)             # <<<<<<<<<<<<<<
- *             self.ret_indices[idx_g] = vector[int]()
- *             self.ret_indices_orig[idx_g] = vector[int]()
- */
-    try {
-      __pyx_t_2 = std::vector<int> ((__pyx_v_num_v_sub + 1), 0);
-    } catch(...) {
-      #ifdef WITH_THREAD
-      PyGILState_STATE __pyx_gilstate_save = __Pyx_PyGILState_Ensure();
-      #endif
-      __Pyx_CppExn2PyErr();
-      #ifdef WITH_THREAD
-      __Pyx_PyGILState_Release(__pyx_gilstate_save);
-      #endif
-      __PYX_ERR(0, 74, __pyx_L1_error)
-    }
-    (__pyx_v_self->ret_indptr[__pyx_v_idx_g]) = __pyx_t_2;
-
-    /* "graphsaint/cython_sampler.pyx":75
- *             num_v_sub = self.node_sampled[idx_g].size()
- *             self.ret_indptr[idx_g] = vector[int](num_v_sub+1,0)
- *             self.ret_indices[idx_g] = vector[int]()             # <<<<<<<<<<<<<<
- *             self.ret_indices_orig[idx_g] = vector[int]()
- *             self.ret_data[idx_g] = vector[float]()
- */
-    try {
-      __pyx_t_2 = std::vector<int> ();
-    } catch(...) {
-      #ifdef WITH_THREAD
-      PyGILState_STATE __pyx_gilstate_save = __Pyx_PyGILState_Ensure();
-      #endif
-      __Pyx_CppExn2PyErr();
-      #ifdef WITH_THREAD
-      __Pyx_PyGILState_Release(__pyx_gilstate_save);
-      #endif
-      __PYX_ERR(0, 75, __pyx_L1_error)
-    }
-    (__pyx_v_self->ret_indices[__pyx_v_idx_g]) = __pyx_t_2;
-
-    /* "graphsaint/cython_sampler.pyx":76
- *             self.ret_indptr[idx_g] = vector[int](num_v_sub+1,0)
- *             self.ret_indices[idx_g] = vector[int]()
- *             self.ret_indices_orig[idx_g] = vector[int]()             # <<<<<<<<<<<<<<
- *             self.ret_data[idx_g] = vector[float]()
- *             self.ret_edge_index[idx_g]=vector[int]()
- */
-    try {
-      __pyx_t_2 = std::vector<int> ();
-    } catch(...) {
-      #ifdef WITH_THREAD
-      PyGILState_STATE __pyx_gilstate_save = __Pyx_PyGILState_Ensure();
-      #endif
-      __Pyx_CppExn2PyErr();
-      #ifdef WITH_THREAD
-      __Pyx_PyGILState_Release(__pyx_gilstate_save);
-      #endif
-      __PYX_ERR(0, 76, __pyx_L1_error)
-    }
-    (__pyx_v_self->ret_indices_orig[__pyx_v_idx_g]) = __pyx_t_2;
-
-    /* "graphsaint/cython_sampler.pyx":77
- *             self.ret_indices[idx_g] = vector[int]()
- *             self.ret_indices_orig[idx_g] = vector[int]()
- *             self.ret_data[idx_g] = vector[float]()             # <<<<<<<<<<<<<<
- *             self.ret_edge_index[idx_g]=vector[int]()
- *             i_end = num_v_sub
- */
-    try {
-      __pyx_t_3 = std::vector<float> ();
-    } catch(...) {
-      #ifdef WITH_THREAD
-      PyGILState_STATE __pyx_gilstate_save = __Pyx_PyGILState_Ensure();
-      #endif
-      __Pyx_CppExn2PyErr();
-      #ifdef WITH_THREAD
-      __Pyx_PyGILState_Release(__pyx_gilstate_save);
-      #endif
-      __PYX_ERR(0, 77, __pyx_L1_error)
-    }
-    (__pyx_v_self->ret_data[__pyx_v_idx_g]) = __pyx_t_3;
-
-    /* "graphsaint/cython_sampler.pyx":78
- *             self.ret_indices_orig[idx_g] = vector[int]()
- *             self.ret_data[idx_g] = vector[float]()
- *             self.ret_edge_index[idx_g]=vector[int]()             # <<<<<<<<<<<<<<
- *             i_end = num_v_sub
- *             i = 0
- */
-    try {
-      __pyx_t_2 = std::vector<int> ();
-    } catch(...) {
-      #ifdef WITH_THREAD
-      PyGILState_STATE __pyx_gilstate_save = __Pyx_PyGILState_Ensure();
-      #endif
-      __Pyx_CppExn2PyErr();
-      #ifdef WITH_THREAD
-      __Pyx_PyGILState_Release(__pyx_gilstate_save);
-      #endif
-      __PYX_ERR(0, 78, __pyx_L1_error)
-    }
-    (__pyx_v_self->ret_edge_index[__pyx_v_idx_g]) = __pyx_t_2;
-
-    /* "graphsaint/cython_sampler.pyx":79
- *             self.ret_data[idx_g] = vector[float]()
- *             self.ret_edge_index[idx_g]=vector[int]()
- *             i_end = num_v_sub             # <<<<<<<<<<<<<<
- *             i = 0
- *             while i < i_end:
- */
-    __pyx_v_i_end = __pyx_v_num_v_sub;
-
-    /* "graphsaint/cython_sampler.pyx":80
- *             self.ret_edge_index[idx_g]=vector[int]()
- *             i_end = num_v_sub
- *             i = 0             # <<<<<<<<<<<<<<
- *             while i < i_end:
- *                 _arr_bit[self.node_sampled[idx_g][i]] = i
- */
-    __pyx_v_i = 0;
-
-    /* "graphsaint/cython_sampler.pyx":81
- *             i_end = num_v_sub
- *             i = 0
- *             while i < i_end:             # <<<<<<<<<<<<<<
- *                 _arr_bit[self.node_sampled[idx_g][i]] = i
- *                 i = i + 1
- */
-    while (1) {
-      __pyx_t_1 = ((__pyx_v_i < __pyx_v_i_end) != 0);
-      if (!__pyx_t_1) break;
-
-      /* "graphsaint/cython_sampler.pyx":82
- *             i = 0
- *             while i < i_end:
- *                 _arr_bit[self.node_sampled[idx_g][i]] = i             # <<<<<<<<<<<<<<
- *                 i = i + 1
- *             i = 0
- */
-      (__pyx_v__arr_bit[((__pyx_v_self->node_sampled[__pyx_v_idx_g])[__pyx_v_i])]) = __pyx_v_i;
-
-      /* "graphsaint/cython_sampler.pyx":83
- *             while i < i_end:
- *                 _arr_bit[self.node_sampled[idx_g][i]] = i
- *                 i = i + 1             # <<<<<<<<<<<<<<
- *             i = 0
- *             while i < i_end:
- */
-      __pyx_v_i = (__pyx_v_i + 1);
-    }
-
-    /* "graphsaint/cython_sampler.pyx":84
- *                 _arr_bit[self.node_sampled[idx_g][i]] = i
- *                 i = i + 1
- *             i = 0             # <<<<<<<<<<<<<<
- *             while i < i_end:
- *                 v = self.node_sampled[idx_g][i]
- */
-    __pyx_v_i = 0;
-
-    /* "graphsaint/cython_sampler.pyx":85
- *                 i = i + 1
- *             i = 0
- *             while i < i_end:             # <<<<<<<<<<<<<<
- *                 v = self.node_sampled[idx_g][i]
- *                 start_neigh = self.adj_indptr_vec[v]
- */
-    while (1) {
-      __pyx_t_1 = ((__pyx_v_i < __pyx_v_i_end) != 0);
-      if (!__pyx_t_1) break;
-
-      /* "graphsaint/cython_sampler.pyx":86
- *             i = 0
- *             while i < i_end:
- *                 v = self.node_sampled[idx_g][i]             # <<<<<<<<<<<<<<
- *                 start_neigh = self.adj_indptr_vec[v]
- *                 end_neigh = self.adj_indptr_vec[v+1]
- */
-      __pyx_v_v = ((__pyx_v_self->node_sampled[__pyx_v_idx_g])[__pyx_v_i]);
-
-      /* "graphsaint/cython_sampler.pyx":87
- *             while i < i_end:
- *                 v = self.node_sampled[idx_g][i]
- *                 start_neigh = self.adj_indptr_vec[v]             # <<<<<<<<<<<<<<
- *                 end_neigh = self.adj_indptr_vec[v+1]
- *                 j = start_neigh
- */
-      __pyx_v_start_neigh = (__pyx_v_self->adj_indptr_vec[__pyx_v_v]);
-
-      /* "graphsaint/cython_sampler.pyx":88
- *                 v = self.node_sampled[idx_g][i]
- *                 start_neigh = self.adj_indptr_vec[v]
- *                 end_neigh = self.adj_indptr_vec[v+1]             # <<<<<<<<<<<<<<
- *                 j = start_neigh
- *                 while j < end_neigh:
- */
-      __pyx_v_end_neigh = (__pyx_v_self->adj_indptr_vec[(__pyx_v_v + 1)]);
-
-      /* "graphsaint/cython_sampler.pyx":89
- *                 start_neigh = self.adj_indptr_vec[v]
- *                 end_neigh = self.adj_indptr_vec[v+1]
- *                 j = start_neigh             # <<<<<<<<<<<<<<
- *                 while j < end_neigh:
- *                     if _arr_bit[self.adj_indices_vec[j]] > -1:
- */
-      __pyx_v_j = __pyx_v_start_neigh;
-
-      /* "graphsaint/cython_sampler.pyx":90
- *                 end_neigh = self.adj_indptr_vec[v+1]
- *                 j = start_neigh
- *                 while j < end_neigh:             # <<<<<<<<<<<<<<
- *                     if _arr_bit[self.adj_indices_vec[j]] > -1:
- *                         self.ret_indices[idx_g].push_back(_arr_bit[self.adj_indices_vec[j]])
- */
-      while (1) {
-        __pyx_t_1 = ((__pyx_v_j < __pyx_v_end_neigh) != 0);
-        if (!__pyx_t_1) break;
-
-        /* "graphsaint/cython_sampler.pyx":91
- *                 j = start_neigh
- *                 while j < end_neigh:
- *                     if _arr_bit[self.adj_indices_vec[j]] > -1:             # <<<<<<<<<<<<<<
- *                         self.ret_indices[idx_g].push_back(_arr_bit[self.adj_indices_vec[j]])
- *                         self.ret_indices_orig[idx_g].push_back(self.adj_indices_vec[j])
- */
-        __pyx_t_1 = (((__pyx_v__arr_bit[(__pyx_v_self->adj_indices_vec[__pyx_v_j])]) > -1L) != 0);
-        if (__pyx_t_1) {
-
-          /* "graphsaint/cython_sampler.pyx":92
- *                 while j < end_neigh:
- *                     if _arr_bit[self.adj_indices_vec[j]] > -1:
- *                         self.ret_indices[idx_g].push_back(_arr_bit[self.adj_indices_vec[j]])             # <<<<<<<<<<<<<<
- *                         self.ret_indices_orig[idx_g].push_back(self.adj_indices_vec[j])
- *                         self.ret_edge_index[idx_g].push_back(j)
- */
-          try {
-            (__pyx_v_self->ret_indices[__pyx_v_idx_g]).push_back((__pyx_v__arr_bit[(__pyx_v_self->adj_indices_vec[__pyx_v_j])]));
-          } catch(...) {
-            #ifdef WITH_THREAD
-            PyGILState_STATE __pyx_gilstate_save = __Pyx_PyGILState_Ensure();
-            #endif
-            __Pyx_CppExn2PyErr();
-            #ifdef WITH_THREAD
-            __Pyx_PyGILState_Release(__pyx_gilstate_save);
-            #endif
-            __PYX_ERR(0, 92, __pyx_L1_error)
-          }
-
-          /* "graphsaint/cython_sampler.pyx":93
- *                     if _arr_bit[self.adj_indices_vec[j]] > -1:
- *                         self.ret_indices[idx_g].push_back(_arr_bit[self.adj_indices_vec[j]])
- *                         self.ret_indices_orig[idx_g].push_back(self.adj_indices_vec[j])             # <<<<<<<<<<<<<<
- *                         self.ret_edge_index[idx_g].push_back(j)
- *                         self.ret_indptr[idx_g][_arr_bit[v]+1] = self.ret_indptr[idx_g][_arr_bit[v]+1] + 1
- */
-          try {
-            (__pyx_v_self->ret_indices_orig[__pyx_v_idx_g]).push_back((__pyx_v_self->adj_indices_vec[__pyx_v_j]));
-          } catch(...) {
-            #ifdef WITH_THREAD
-            PyGILState_STATE __pyx_gilstate_save = __Pyx_PyGILState_Ensure();
-            #endif
-            __Pyx_CppExn2PyErr();
-            #ifdef WITH_THREAD
-            __Pyx_PyGILState_Release(__pyx_gilstate_save);
-            #endif
-            __PYX_ERR(0, 93, __pyx_L1_error)
-          }
-
-          /* "graphsaint/cython_sampler.pyx":94
- *                         self.ret_indices[idx_g].push_back(_arr_bit[self.adj_indices_vec[j]])
- *                         self.ret_indices_orig[idx_g].push_back(self.adj_indices_vec[j])
- *                         self.ret_edge_index[idx_g].push_back(j)             # <<<<<<<<<<<<<<
- *                         self.ret_indptr[idx_g][_arr_bit[v]+1] = self.ret_indptr[idx_g][_arr_bit[v]+1] + 1
- *                         self.ret_data[idx_g].push_back(1.)
- */
-          try {
-            (__pyx_v_self->ret_edge_index[__pyx_v_idx_g]).push_back(__pyx_v_j);
-          } catch(...) {
-            #ifdef WITH_THREAD
-            PyGILState_STATE __pyx_gilstate_save = __Pyx_PyGILState_Ensure();
-            #endif
-            __Pyx_CppExn2PyErr();
-            #ifdef WITH_THREAD
-            __Pyx_PyGILState_Release(__pyx_gilstate_save);
-            #endif
-            __PYX_ERR(0, 94, __pyx_L1_error)
-          }
-
-          /* "graphsaint/cython_sampler.pyx":95
- *                         self.ret_indices_orig[idx_g].push_back(self.adj_indices_vec[j])
- *                         self.ret_edge_index[idx_g].push_back(j)
- *                         self.ret_indptr[idx_g][_arr_bit[v]+1] = self.ret_indptr[idx_g][_arr_bit[v]+1] + 1             # <<<<<<<<<<<<<<
- *                         self.ret_data[idx_g].push_back(1.)
- *                     j = j + 1
- */
-          ((__pyx_v_self->ret_indptr[__pyx_v_idx_g])[((__pyx_v__arr_bit[__pyx_v_v]) + 1)]) = (((__pyx_v_self->ret_indptr[__pyx_v_idx_g])[((__pyx_v__arr_bit[__pyx_v_v]) + 1)]) + 1);
-
-          /* "graphsaint/cython_sampler.pyx":96
- *                         self.ret_edge_index[idx_g].push_back(j)
- *                         self.ret_indptr[idx_g][_arr_bit[v]+1] = self.ret_indptr[idx_g][_arr_bit[v]+1] + 1
- *                         self.ret_data[idx_g].push_back(1.)             # <<<<<<<<<<<<<<
- *                     j = j + 1
- *                 i = i + 1
- */
-          try {
-            (__pyx_v_self->ret_data[__pyx_v_idx_g]).push_back(1.);
-          } catch(...) {
-            #ifdef WITH_THREAD
-            PyGILState_STATE __pyx_gilstate_save = __Pyx_PyGILState_Ensure();
-            #endif
-            __Pyx_CppExn2PyErr();
-            #ifdef WITH_THREAD
-            __Pyx_PyGILState_Release(__pyx_gilstate_save);
-            #endif
-            __PYX_ERR(0, 96, __pyx_L1_error)
-          }
-
-          /* "graphsaint/cython_sampler.pyx":91
- *                 j = start_neigh
- *                 while j < end_neigh:
- *                     if _arr_bit[self.adj_indices_vec[j]] > -1:             # <<<<<<<<<<<<<<
- *                         self.ret_indices[idx_g].push_back(_arr_bit[self.adj_indices_vec[j]])
- *                         self.ret_indices_orig[idx_g].push_back(self.adj_indices_vec[j])
- */
-        }
-
-        /* "graphsaint/cython_sampler.pyx":97
- *                         self.ret_indptr[idx_g][_arr_bit[v]+1] = self.ret_indptr[idx_g][_arr_bit[v]+1] + 1
- *                         self.ret_data[idx_g].push_back(1.)
- *                     j = j + 1             # <<<<<<<<<<<<<<
- *                 i = i + 1
- *             cumsum = self.ret_indptr[idx_g][0]
- */
-        __pyx_v_j = (__pyx_v_j + 1);
-      }
-
-      /* "graphsaint/cython_sampler.pyx":98
- *                         self.ret_data[idx_g].push_back(1.)
- *                     j = j + 1
- *                 i = i + 1             # <<<<<<<<<<<<<<
- *             cumsum = self.ret_indptr[idx_g][0]
- *             i = 0
- */
-      __pyx_v_i = (__pyx_v_i + 1);
-    }
-
-    /* "graphsaint/cython_sampler.pyx":99
- *                     j = j + 1
- *                 i = i + 1
- *             cumsum = self.ret_indptr[idx_g][0]             # <<<<<<<<<<<<<<
- *             i = 0
- *             while i < i_end:
- */
-    __pyx_v_cumsum = ((__pyx_v_self->ret_indptr[__pyx_v_idx_g])[0]);
-
-    /* "graphsaint/cython_sampler.pyx":100
- *                 i = i + 1
- *             cumsum = self.ret_indptr[idx_g][0]
- *             i = 0             # <<<<<<<<<<<<<<
- *             while i < i_end:
- *                 cumsum = cumsum + self.ret_indptr[idx_g][i+1]
- */
-    __pyx_v_i = 0;
-
-    /* "graphsaint/cython_sampler.pyx":101
- *             cumsum = self.ret_indptr[idx_g][0]
- *             i = 0
- *             while i < i_end:             # <<<<<<<<<<<<<<
- *                 cumsum = cumsum + self.ret_indptr[idx_g][i+1]
- *                 self.ret_indptr[idx_g][i+1] = cumsum
- */
-    while (1) {
-      __pyx_t_1 = ((__pyx_v_i < __pyx_v_i_end) != 0);
-      if (!__pyx_t_1) break;
-
-      /* "graphsaint/cython_sampler.pyx":102
- *             i = 0
- *             while i < i_end:
- *                 cumsum = cumsum + self.ret_indptr[idx_g][i+1]             # <<<<<<<<<<<<<<
- *                 self.ret_indptr[idx_g][i+1] = cumsum
- *                 i = i + 1
- */
-      __pyx_v_cumsum = (__pyx_v_cumsum + ((__pyx_v_self->ret_indptr[__pyx_v_idx_g])[(__pyx_v_i + 1)]));
-
-      /* "graphsaint/cython_sampler.pyx":103
- *             while i < i_end:
- *                 cumsum = cumsum + self.ret_indptr[idx_g][i+1]
- *                 self.ret_indptr[idx_g][i+1] = cumsum             # <<<<<<<<<<<<<<
- *                 i = i + 1
- *             r = r + 1
- */
-      ((__pyx_v_self->ret_indptr[__pyx_v_idx_g])[(__pyx_v_i + 1)]) = __pyx_v_cumsum;
-
-      /* "graphsaint/cython_sampler.pyx":104
- *                 cumsum = cumsum + self.ret_indptr[idx_g][i+1]
- *                 self.ret_indptr[idx_g][i+1] = cumsum
- *                 i = i + 1             # <<<<<<<<<<<<<<
- *             r = r + 1
- * 
- */
-      __pyx_v_i = (__pyx_v_i + 1);
-    }
-
-    /* "graphsaint/cython_sampler.pyx":105
- *                 self.ret_indptr[idx_g][i+1] = cumsum
- *                 i = i + 1
- *             r = r + 1             # <<<<<<<<<<<<<<
- * 
- *     def get_return(self):
- */
-    __pyx_v_r = (__pyx_v_r + 1);
-  }
-
-  /* "graphsaint/cython_sampler.pyx":57
- *         self.ret_edge_index = vector[vector[int]](num_proc*num_sample_per_proc)
- * 
- *     cdef void adj_extract(self, int p) nogil:             # <<<<<<<<<<<<<<
- *         """
- *         Extract a subg adj matrix from the original training adj matrix
- */
-
-  /* function exit code */
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_WriteUnraisable("graphsaint.cython_sampler.Sampler.adj_extract", __pyx_clineno, __pyx_lineno, __pyx_filename, 1, 1);
-  __pyx_L0:;
-}
-
-/* "graphsaint/cython_sampler.pyx":107
- *             r = r + 1
- * 
- *     def get_return(self):             # <<<<<<<<<<<<<<
- *         """
- *         Convert the subgraph related data structures from C++ to python. So that cython
- */
-
-/* Python wrapper */
-static PyObject *__pyx_pw_10graphsaint_14cython_sampler_7Sampler_3get_return(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
-static char __pyx_doc_10graphsaint_14cython_sampler_7Sampler_2get_return[] = "\n        Convert the subgraph related data structures from C++ to python. So that cython\n        can return them to the PyTorch trainer.\n\n        Inputs:\n            None\n\n        Outputs:\n            see outputs of the `par_sample()` function.\n        ";
-static PyObject *__pyx_pw_10graphsaint_14cython_sampler_7Sampler_3get_return(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
-  PyObject *__pyx_r = 0;
-  __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("get_return (wrapper)", 0);
-  __pyx_r = __pyx_pf_10graphsaint_14cython_sampler_7Sampler_2get_return(((struct __pyx_obj_10graphsaint_14cython_sampler_Sampler *)__pyx_v_self));
-
-  /* function exit code */
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-static PyObject *__pyx_pf_10graphsaint_14cython_sampler_7Sampler_2get_return(struct __pyx_obj_10graphsaint_14cython_sampler_Sampler *__pyx_v_self) {
-  int __pyx_v_num_subg;
-  PyObject *__pyx_v_l_subg_indptr = NULL;
-  PyObject *__pyx_v_l_subg_indices = NULL;
-  PyObject *__pyx_v_l_subg_data = NULL;
-  PyObject *__pyx_v_l_subg_nodes = NULL;
-  PyObject *__pyx_v_l_subg_edge_index = NULL;
-  PyObject *__pyx_v_offset_nodes = NULL;
-  PyObject *__pyx_v_offset_indptr = NULL;
-  PyObject *__pyx_v_offset_indices = NULL;
-  PyObject *__pyx_v_offset_data = NULL;
-  PyObject *__pyx_v_offset_edge_index = NULL;
-  PyObject *__pyx_v_r = NULL;
-  std::vector<int>  __pyx_v_ret_nodes_vec;
-  std::vector<int>  __pyx_v_ret_indptr_vec;
-  std::vector<int>  __pyx_v_ret_indices_vec;
-  std::vector<int>  __pyx_v_ret_edge_index_vec;
-  std::vector<float>  __pyx_v_ret_data_vec;
-  struct __pyx_obj_10graphsaint_12cython_utils_array_wrapper_int *__pyx_v_wint_indptr = 0;
-  struct __pyx_obj_10graphsaint_12cython_utils_array_wrapper_int *__pyx_v_wint_indices = 0;
-  struct __pyx_obj_10graphsaint_12cython_utils_array_wrapper_int *__pyx_v_wint_nodes = 0;
-  struct __pyx_obj_10graphsaint_12cython_utils_array_wrapper_float *__pyx_v_wfloat_data = 0;
-  struct __pyx_obj_10graphsaint_12cython_utils_array_wrapper_int *__pyx_v_wint_edge_index = 0;
-  PyObject *__pyx_v_ret_indptr_np = NULL;
-  PyObject *__pyx_v_ret_indices_np = NULL;
-  PyObject *__pyx_v_ret_nodes_np = NULL;
-  PyObject *__pyx_v_ret_data_np = NULL;
-  PyObject *__pyx_v_ret_edge_index_np = NULL;
-  PyObject *__pyx_r = NULL;
-  __Pyx_RefNannyDeclarations
-  PyObject *__pyx_t_1 = NULL;
-  PyObject *__pyx_t_2 = NULL;
-  Py_ssize_t __pyx_t_3;
-  PyObject *(*__pyx_t_4)(PyObject *);
-  std::vector<std::vector<int> > ::size_type __pyx_t_5;
-  PyObject *__pyx_t_6 = NULL;
-  PyObject *__pyx_t_7 = NULL;
-  int __pyx_t_8;
-  std::vector<std::vector<float> > ::size_type __pyx_t_9;
-  std::vector<int>  __pyx_t_10;
-  std::vector<float>  __pyx_t_11;
-  std::vector<int> ::size_type __pyx_t_12;
-  std::vector<float> ::size_type __pyx_t_13;
-  std::vector<std::vector<int> > ::size_type __pyx_t_14;
-  std::vector<std::vector<float> > ::size_type __pyx_t_15;
-  PyObject *__pyx_t_16 = NULL;
-  int __pyx_lineno = 0;
-  const char *__pyx_filename = NULL;
-  int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("get_return", 0);
-
-  /* "graphsaint/cython_sampler.pyx":118
- *             see outputs of the `par_sample()` function.
- *         """
- *         num_subg = self.num_proc*self.num_sample_per_proc             # <<<<<<<<<<<<<<
- *         l_subg_indptr = []
- *         l_subg_indices = []
- */
-  __pyx_v_num_subg = (__pyx_v_self->num_proc * __pyx_v_self->num_sample_per_proc);
-
-  /* "graphsaint/cython_sampler.pyx":119
- *         """
- *         num_subg = self.num_proc*self.num_sample_per_proc
- *         l_subg_indptr = []             # <<<<<<<<<<<<<<
- *         l_subg_indices = []
- *         l_subg_data = []
- */
-  __pyx_t_1 = PyList_New(0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 119, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_v_l_subg_indptr = ((PyObject*)__pyx_t_1);
-  __pyx_t_1 = 0;
-
-  /* "graphsaint/cython_sampler.pyx":120
- *         num_subg = self.num_proc*self.num_sample_per_proc
- *         l_subg_indptr = []
- *         l_subg_indices = []             # <<<<<<<<<<<<<<
- *         l_subg_data = []
- *         l_subg_nodes = []
- */
-  __pyx_t_1 = PyList_New(0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 120, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_v_l_subg_indices = ((PyObject*)__pyx_t_1);
-  __pyx_t_1 = 0;
-
-  /* "graphsaint/cython_sampler.pyx":121
- *         l_subg_indptr = []
- *         l_subg_indices = []
- *         l_subg_data = []             # <<<<<<<<<<<<<<
- *         l_subg_nodes = []
- *         l_subg_edge_index = []
- */
-  __pyx_t_1 = PyList_New(0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 121, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_v_l_subg_data = ((PyObject*)__pyx_t_1);
-  __pyx_t_1 = 0;
-
-  /* "graphsaint/cython_sampler.pyx":122
- *         l_subg_indices = []
- *         l_subg_data = []
- *         l_subg_nodes = []             # <<<<<<<<<<<<<<
- *         l_subg_edge_index = []
- *         offset_nodes = [0]
- */
-  __pyx_t_1 = PyList_New(0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 122, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_v_l_subg_nodes = ((PyObject*)__pyx_t_1);
-  __pyx_t_1 = 0;
-
-  /* "graphsaint/cython_sampler.pyx":123
- *         l_subg_data = []
- *         l_subg_nodes = []
- *         l_subg_edge_index = []             # <<<<<<<<<<<<<<
- *         offset_nodes = [0]
- *         offset_indptr = [0]
- */
-  __pyx_t_1 = PyList_New(0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 123, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_v_l_subg_edge_index = ((PyObject*)__pyx_t_1);
-  __pyx_t_1 = 0;
-
-  /* "graphsaint/cython_sampler.pyx":124
- *         l_subg_nodes = []
- *         l_subg_edge_index = []
- *         offset_nodes = [0]             # <<<<<<<<<<<<<<
- *         offset_indptr = [0]
- *         offset_indices = [0]
- */
-  __pyx_t_1 = PyList_New(1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 124, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __Pyx_INCREF(__pyx_int_0);
-  __Pyx_GIVEREF(__pyx_int_0);
-  PyList_SET_ITEM(__pyx_t_1, 0, __pyx_int_0);
-  __pyx_v_offset_nodes = ((PyObject*)__pyx_t_1);
-  __pyx_t_1 = 0;
-
-  /* "graphsaint/cython_sampler.pyx":125
- *         l_subg_edge_index = []
- *         offset_nodes = [0]
- *         offset_indptr = [0]             # <<<<<<<<<<<<<<
- *         offset_indices = [0]
- *         offset_data = [0]
- */
-  __pyx_t_1 = PyList_New(1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 125, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __Pyx_INCREF(__pyx_int_0);
-  __Pyx_GIVEREF(__pyx_int_0);
-  PyList_SET_ITEM(__pyx_t_1, 0, __pyx_int_0);
-  __pyx_v_offset_indptr = ((PyObject*)__pyx_t_1);
-  __pyx_t_1 = 0;
-
-  /* "graphsaint/cython_sampler.pyx":126
- *         offset_nodes = [0]
- *         offset_indptr = [0]
- *         offset_indices = [0]             # <<<<<<<<<<<<<<
- *         offset_data = [0]
- *         offset_edge_index = [0]
- */
-  __pyx_t_1 = PyList_New(1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 126, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __Pyx_INCREF(__pyx_int_0);
-  __Pyx_GIVEREF(__pyx_int_0);
-  PyList_SET_ITEM(__pyx_t_1, 0, __pyx_int_0);
-  __pyx_v_offset_indices = ((PyObject*)__pyx_t_1);
-  __pyx_t_1 = 0;
-
-  /* "graphsaint/cython_sampler.pyx":127
- *         offset_indptr = [0]
- *         offset_indices = [0]
- *         offset_data = [0]             # <<<<<<<<<<<<<<
- *         offset_edge_index = [0]
- *         for r in range(num_subg):
- */
-  __pyx_t_1 = PyList_New(1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 127, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __Pyx_INCREF(__pyx_int_0);
-  __Pyx_GIVEREF(__pyx_int_0);
-  PyList_SET_ITEM(__pyx_t_1, 0, __pyx_int_0);
-  __pyx_v_offset_data = ((PyObject*)__pyx_t_1);
-  __pyx_t_1 = 0;
-
-  /* "graphsaint/cython_sampler.pyx":128
- *         offset_indices = [0]
- *         offset_data = [0]
- *         offset_edge_index = [0]             # <<<<<<<<<<<<<<
- *         for r in range(num_subg):
- *             offset_nodes.append(offset_nodes[r]+self.node_sampled[r].size())
- */
-  __pyx_t_1 = PyList_New(1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 128, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __Pyx_INCREF(__pyx_int_0);
-  __Pyx_GIVEREF(__pyx_int_0);
-  PyList_SET_ITEM(__pyx_t_1, 0, __pyx_int_0);
-  __pyx_v_offset_edge_index = ((PyObject*)__pyx_t_1);
-  __pyx_t_1 = 0;
-
-  /* "graphsaint/cython_sampler.pyx":129
- *         offset_data = [0]
- *         offset_edge_index = [0]
- *         for r in range(num_subg):             # <<<<<<<<<<<<<<
- *             offset_nodes.append(offset_nodes[r]+self.node_sampled[r].size())
- *             offset_indptr.append(offset_indptr[r]+self.ret_indptr[r].size())
- */
-  __pyx_t_1 = __Pyx_PyInt_From_int(__pyx_v_num_subg); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 129, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_2 = __Pyx_PyObject_CallOneArg(__pyx_builtin_range, __pyx_t_1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 129, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  if (likely(PyList_CheckExact(__pyx_t_2)) || PyTuple_CheckExact(__pyx_t_2)) {
-    __pyx_t_1 = __pyx_t_2; __Pyx_INCREF(__pyx_t_1); __pyx_t_3 = 0;
-    __pyx_t_4 = NULL;
-  } else {
-    __pyx_t_3 = -1; __pyx_t_1 = PyObject_GetIter(__pyx_t_2); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 129, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_1);
-    __pyx_t_4 = Py_TYPE(__pyx_t_1)->tp_iternext; if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 129, __pyx_L1_error)
-  }
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  for (;;) {
-    if (likely(!__pyx_t_4)) {
-      if (likely(PyList_CheckExact(__pyx_t_1))) {
-        if (__pyx_t_3 >= PyList_GET_SIZE(__pyx_t_1)) break;
-        #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
-        __pyx_t_2 = PyList_GET_ITEM(__pyx_t_1, __pyx_t_3); __Pyx_INCREF(__pyx_t_2); __pyx_t_3++; if (unlikely(0 < 0)) __PYX_ERR(0, 129, __pyx_L1_error)
-        #else
-        __pyx_t_2 = PySequence_ITEM(__pyx_t_1, __pyx_t_3); __pyx_t_3++; if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 129, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_2);
-        #endif
-      } else {
-        if (__pyx_t_3 >= PyTuple_GET_SIZE(__pyx_t_1)) break;
-        #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
-        __pyx_t_2 = PyTuple_GET_ITEM(__pyx_t_1, __pyx_t_3); __Pyx_INCREF(__pyx_t_2); __pyx_t_3++; if (unlikely(0 < 0)) __PYX_ERR(0, 129, __pyx_L1_error)
-        #else
-        __pyx_t_2 = PySequence_ITEM(__pyx_t_1, __pyx_t_3); __pyx_t_3++; if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 129, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_2);
-        #endif
-      }
-    } else {
-      __pyx_t_2 = __pyx_t_4(__pyx_t_1);
-      if (unlikely(!__pyx_t_2)) {
-        PyObject* exc_type = PyErr_Occurred();
-        if (exc_type) {
-          if (likely(__Pyx_PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration))) PyErr_Clear();
-          else __PYX_ERR(0, 129, __pyx_L1_error)
-        }
-        break;
-      }
-      __Pyx_GOTREF(__pyx_t_2);
-    }
-    __Pyx_XDECREF_SET(__pyx_v_r, __pyx_t_2);
-    __pyx_t_2 = 0;
-
-    /* "graphsaint/cython_sampler.pyx":130
- *         offset_edge_index = [0]
- *         for r in range(num_subg):
- *             offset_nodes.append(offset_nodes[r]+self.node_sampled[r].size())             # <<<<<<<<<<<<<<
- *             offset_indptr.append(offset_indptr[r]+self.ret_indptr[r].size())
- *             offset_indices.append(offset_indices[r]+self.ret_indices[r].size())
- */
-    __pyx_t_2 = __Pyx_PyObject_GetItem(__pyx_v_offset_nodes, __pyx_v_r); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 130, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_2);
-    __pyx_t_5 = __Pyx_PyInt_As_size_t(__pyx_v_r); if (unlikely((__pyx_t_5 == (size_t)-1) && PyErr_Occurred())) __PYX_ERR(0, 130, __pyx_L1_error)
-    __pyx_t_6 = __Pyx_PyInt_FromSize_t((__pyx_v_self->node_sampled[__pyx_t_5]).size()); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 130, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_6);
-    __pyx_t_7 = PyNumber_Add(__pyx_t_2, __pyx_t_6); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 130, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_7);
-    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-    __pyx_t_8 = __Pyx_PyList_Append(__pyx_v_offset_nodes, __pyx_t_7); if (unlikely(__pyx_t_8 == ((int)-1))) __PYX_ERR(0, 130, __pyx_L1_error)
-    __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
-
-    /* "graphsaint/cython_sampler.pyx":131
- *         for r in range(num_subg):
- *             offset_nodes.append(offset_nodes[r]+self.node_sampled[r].size())
- *             offset_indptr.append(offset_indptr[r]+self.ret_indptr[r].size())             # <<<<<<<<<<<<<<
- *             offset_indices.append(offset_indices[r]+self.ret_indices[r].size())
- *             offset_data.append(offset_data[r]+self.ret_data[r].size())
- */
-    __pyx_t_7 = __Pyx_PyObject_GetItem(__pyx_v_offset_indptr, __pyx_v_r); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 131, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_7);
-    __pyx_t_5 = __Pyx_PyInt_As_size_t(__pyx_v_r); if (unlikely((__pyx_t_5 == (size_t)-1) && PyErr_Occurred())) __PYX_ERR(0, 131, __pyx_L1_error)
-    __pyx_t_6 = __Pyx_PyInt_FromSize_t((__pyx_v_self->ret_indptr[__pyx_t_5]).size()); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 131, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_6);
-    __pyx_t_2 = PyNumber_Add(__pyx_t_7, __pyx_t_6); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 131, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_2);
-    __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
-    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-    __pyx_t_8 = __Pyx_PyList_Append(__pyx_v_offset_indptr, __pyx_t_2); if (unlikely(__pyx_t_8 == ((int)-1))) __PYX_ERR(0, 131, __pyx_L1_error)
-    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-
-    /* "graphsaint/cython_sampler.pyx":132
- *             offset_nodes.append(offset_nodes[r]+self.node_sampled[r].size())
- *             offset_indptr.append(offset_indptr[r]+self.ret_indptr[r].size())
- *             offset_indices.append(offset_indices[r]+self.ret_indices[r].size())             # <<<<<<<<<<<<<<
- *             offset_data.append(offset_data[r]+self.ret_data[r].size())
- *             offset_edge_index.append(offset_edge_index[r]+self.ret_edge_index[r].size())
- */
-    __pyx_t_2 = __Pyx_PyObject_GetItem(__pyx_v_offset_indices, __pyx_v_r); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 132, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_2);
-    __pyx_t_5 = __Pyx_PyInt_As_size_t(__pyx_v_r); if (unlikely((__pyx_t_5 == (size_t)-1) && PyErr_Occurred())) __PYX_ERR(0, 132, __pyx_L1_error)
-    __pyx_t_6 = __Pyx_PyInt_FromSize_t((__pyx_v_self->ret_indices[__pyx_t_5]).size()); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 132, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_6);
-    __pyx_t_7 = PyNumber_Add(__pyx_t_2, __pyx_t_6); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 132, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_7);
-    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-    __pyx_t_8 = __Pyx_PyList_Append(__pyx_v_offset_indices, __pyx_t_7); if (unlikely(__pyx_t_8 == ((int)-1))) __PYX_ERR(0, 132, __pyx_L1_error)
-    __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
-
-    /* "graphsaint/cython_sampler.pyx":133
- *             offset_indptr.append(offset_indptr[r]+self.ret_indptr[r].size())
- *             offset_indices.append(offset_indices[r]+self.ret_indices[r].size())
- *             offset_data.append(offset_data[r]+self.ret_data[r].size())             # <<<<<<<<<<<<<<
- *             offset_edge_index.append(offset_edge_index[r]+self.ret_edge_index[r].size())
- *         cdef vector[int] ret_nodes_vec = vector[int]()
- */
-    __pyx_t_7 = __Pyx_PyObject_GetItem(__pyx_v_offset_data, __pyx_v_r); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 133, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_7);
-    __pyx_t_9 = __Pyx_PyInt_As_size_t(__pyx_v_r); if (unlikely((__pyx_t_9 == (size_t)-1) && PyErr_Occurred())) __PYX_ERR(0, 133, __pyx_L1_error)
-    __pyx_t_6 = __Pyx_PyInt_FromSize_t((__pyx_v_self->ret_data[__pyx_t_9]).size()); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 133, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_6);
-    __pyx_t_2 = PyNumber_Add(__pyx_t_7, __pyx_t_6); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 133, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_2);
-    __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
-    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-    __pyx_t_8 = __Pyx_PyList_Append(__pyx_v_offset_data, __pyx_t_2); if (unlikely(__pyx_t_8 == ((int)-1))) __PYX_ERR(0, 133, __pyx_L1_error)
-    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-
-    /* "graphsaint/cython_sampler.pyx":134
- *             offset_indices.append(offset_indices[r]+self.ret_indices[r].size())
- *             offset_data.append(offset_data[r]+self.ret_data[r].size())
- *             offset_edge_index.append(offset_edge_index[r]+self.ret_edge_index[r].size())             # <<<<<<<<<<<<<<
- *         cdef vector[int] ret_nodes_vec = vector[int]()
- *         cdef vector[int] ret_indptr_vec = vector[int]()
- */
-    __pyx_t_2 = __Pyx_PyObject_GetItem(__pyx_v_offset_edge_index, __pyx_v_r); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 134, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_2);
-    __pyx_t_5 = __Pyx_PyInt_As_size_t(__pyx_v_r); if (unlikely((__pyx_t_5 == (size_t)-1) && PyErr_Occurred())) __PYX_ERR(0, 134, __pyx_L1_error)
-    __pyx_t_6 = __Pyx_PyInt_FromSize_t((__pyx_v_self->ret_edge_index[__pyx_t_5]).size()); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 134, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_6);
-    __pyx_t_7 = PyNumber_Add(__pyx_t_2, __pyx_t_6); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 134, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_7);
-    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-    __pyx_t_8 = __Pyx_PyList_Append(__pyx_v_offset_edge_index, __pyx_t_7); if (unlikely(__pyx_t_8 == ((int)-1))) __PYX_ERR(0, 134, __pyx_L1_error)
-    __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
-
-    /* "graphsaint/cython_sampler.pyx":129
- *         offset_data = [0]
- *         offset_edge_index = [0]
- *         for r in range(num_subg):             # <<<<<<<<<<<<<<
- *             offset_nodes.append(offset_nodes[r]+self.node_sampled[r].size())
- *             offset_indptr.append(offset_indptr[r]+self.ret_indptr[r].size())
- */
-  }
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-
-  /* "graphsaint/cython_sampler.pyx":135
- *             offset_data.append(offset_data[r]+self.ret_data[r].size())
- *             offset_edge_index.append(offset_edge_index[r]+self.ret_edge_index[r].size())
- *         cdef vector[int] ret_nodes_vec = vector[int]()             # <<<<<<<<<<<<<<
- *         cdef vector[int] ret_indptr_vec = vector[int]()
- *         cdef vector[int] ret_indices_vec = vector[int]()
- */
-  try {
-    __pyx_t_10 = std::vector<int> ();
-  } catch(...) {
-    __Pyx_CppExn2PyErr();
-    __PYX_ERR(0, 135, __pyx_L1_error)
-  }
-  __pyx_v_ret_nodes_vec = __pyx_t_10;
-
-  /* "graphsaint/cython_sampler.pyx":136
- *             offset_edge_index.append(offset_edge_index[r]+self.ret_edge_index[r].size())
- *         cdef vector[int] ret_nodes_vec = vector[int]()
- *         cdef vector[int] ret_indptr_vec = vector[int]()             # <<<<<<<<<<<<<<
- *         cdef vector[int] ret_indices_vec = vector[int]()
- *         cdef vector[int] ret_edge_index_vec = vector[int]()
- */
-  try {
-    __pyx_t_10 = std::vector<int> ();
-  } catch(...) {
-    __Pyx_CppExn2PyErr();
-    __PYX_ERR(0, 136, __pyx_L1_error)
-  }
-  __pyx_v_ret_indptr_vec = __pyx_t_10;
-
-  /* "graphsaint/cython_sampler.pyx":137
- *         cdef vector[int] ret_nodes_vec = vector[int]()
- *         cdef vector[int] ret_indptr_vec = vector[int]()
- *         cdef vector[int] ret_indices_vec = vector[int]()             # <<<<<<<<<<<<<<
- *         cdef vector[int] ret_edge_index_vec = vector[int]()
- *         cdef vector[float] ret_data_vec = vector[float]()
- */
-  try {
-    __pyx_t_10 = std::vector<int> ();
-  } catch(...) {
-    __Pyx_CppExn2PyErr();
-    __PYX_ERR(0, 137, __pyx_L1_error)
-  }
-  __pyx_v_ret_indices_vec = __pyx_t_10;
-
-  /* "graphsaint/cython_sampler.pyx":138
- *         cdef vector[int] ret_indptr_vec = vector[int]()
- *         cdef vector[int] ret_indices_vec = vector[int]()
- *         cdef vector[int] ret_edge_index_vec = vector[int]()             # <<<<<<<<<<<<<<
- *         cdef vector[float] ret_data_vec = vector[float]()
- *         ret_nodes_vec.reserve(offset_nodes[num_subg])
- */
-  try {
-    __pyx_t_10 = std::vector<int> ();
-  } catch(...) {
-    __Pyx_CppExn2PyErr();
-    __PYX_ERR(0, 138, __pyx_L1_error)
-  }
-  __pyx_v_ret_edge_index_vec = __pyx_t_10;
-
-  /* "graphsaint/cython_sampler.pyx":139
- *         cdef vector[int] ret_indices_vec = vector[int]()
- *         cdef vector[int] ret_edge_index_vec = vector[int]()
- *         cdef vector[float] ret_data_vec = vector[float]()             # <<<<<<<<<<<<<<
- *         ret_nodes_vec.reserve(offset_nodes[num_subg])
- *         ret_indptr_vec.reserve(offset_indptr[num_subg])
- */
-  try {
-    __pyx_t_11 = std::vector<float> ();
-  } catch(...) {
-    __Pyx_CppExn2PyErr();
-    __PYX_ERR(0, 139, __pyx_L1_error)
-  }
-  __pyx_v_ret_data_vec = __pyx_t_11;
-
-  /* "graphsaint/cython_sampler.pyx":140
- *         cdef vector[int] ret_edge_index_vec = vector[int]()
- *         cdef vector[float] ret_data_vec = vector[float]()
- *         ret_nodes_vec.reserve(offset_nodes[num_subg])             # <<<<<<<<<<<<<<
- *         ret_indptr_vec.reserve(offset_indptr[num_subg])
- *         ret_indices_vec.reserve(offset_indices[num_subg])
- */
-  __pyx_t_1 = __Pyx_GetItemInt_List(__pyx_v_offset_nodes, __pyx_v_num_subg, int, 1, __Pyx_PyInt_From_int, 1, 1, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 140, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_12 = __Pyx_PyInt_As_size_t(__pyx_t_1); if (unlikely((__pyx_t_12 == (size_t)-1) && PyErr_Occurred())) __PYX_ERR(0, 140, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __pyx_v_ret_nodes_vec.reserve(__pyx_t_12);
-
-  /* "graphsaint/cython_sampler.pyx":141
- *         cdef vector[float] ret_data_vec = vector[float]()
- *         ret_nodes_vec.reserve(offset_nodes[num_subg])
- *         ret_indptr_vec.reserve(offset_indptr[num_subg])             # <<<<<<<<<<<<<<
- *         ret_indices_vec.reserve(offset_indices[num_subg])
- *         ret_data_vec.reserve(offset_data[num_subg])
- */
-  __pyx_t_1 = __Pyx_GetItemInt_List(__pyx_v_offset_indptr, __pyx_v_num_subg, int, 1, __Pyx_PyInt_From_int, 1, 1, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 141, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_12 = __Pyx_PyInt_As_size_t(__pyx_t_1); if (unlikely((__pyx_t_12 == (size_t)-1) && PyErr_Occurred())) __PYX_ERR(0, 141, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __pyx_v_ret_indptr_vec.reserve(__pyx_t_12);
-
-  /* "graphsaint/cython_sampler.pyx":142
- *         ret_nodes_vec.reserve(offset_nodes[num_subg])
- *         ret_indptr_vec.reserve(offset_indptr[num_subg])
- *         ret_indices_vec.reserve(offset_indices[num_subg])             # <<<<<<<<<<<<<<
- *         ret_data_vec.reserve(offset_data[num_subg])
- *         ret_edge_index_vec.reserve(offset_edge_index[num_subg])
- */
-  __pyx_t_1 = __Pyx_GetItemInt_List(__pyx_v_offset_indices, __pyx_v_num_subg, int, 1, __Pyx_PyInt_From_int, 1, 1, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 142, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_12 = __Pyx_PyInt_As_size_t(__pyx_t_1); if (unlikely((__pyx_t_12 == (size_t)-1) && PyErr_Occurred())) __PYX_ERR(0, 142, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __pyx_v_ret_indices_vec.reserve(__pyx_t_12);
-
-  /* "graphsaint/cython_sampler.pyx":143
- *         ret_indptr_vec.reserve(offset_indptr[num_subg])
- *         ret_indices_vec.reserve(offset_indices[num_subg])
- *         ret_data_vec.reserve(offset_data[num_subg])             # <<<<<<<<<<<<<<
- *         ret_edge_index_vec.reserve(offset_edge_index[num_subg])
- *         for r in range(num_subg):
- */
-  __pyx_t_1 = __Pyx_GetItemInt_List(__pyx_v_offset_data, __pyx_v_num_subg, int, 1, __Pyx_PyInt_From_int, 1, 1, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 143, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_13 = __Pyx_PyInt_As_size_t(__pyx_t_1); if (unlikely((__pyx_t_13 == (size_t)-1) && PyErr_Occurred())) __PYX_ERR(0, 143, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __pyx_v_ret_data_vec.reserve(__pyx_t_13);
-
-  /* "graphsaint/cython_sampler.pyx":144
- *         ret_indices_vec.reserve(offset_indices[num_subg])
- *         ret_data_vec.reserve(offset_data[num_subg])
- *         ret_edge_index_vec.reserve(offset_edge_index[num_subg])             # <<<<<<<<<<<<<<
- *         for r in range(num_subg):
- *             ret_nodes_vec.insert(ret_nodes_vec.end(),self.node_sampled[r].begin(),self.node_sampled[r].end())
- */
-  __pyx_t_1 = __Pyx_GetItemInt_List(__pyx_v_offset_edge_index, __pyx_v_num_subg, int, 1, __Pyx_PyInt_From_int, 1, 1, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 144, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_12 = __Pyx_PyInt_As_size_t(__pyx_t_1); if (unlikely((__pyx_t_12 == (size_t)-1) && PyErr_Occurred())) __PYX_ERR(0, 144, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __pyx_v_ret_edge_index_vec.reserve(__pyx_t_12);
-
-  /* "graphsaint/cython_sampler.pyx":145
- *         ret_data_vec.reserve(offset_data[num_subg])
- *         ret_edge_index_vec.reserve(offset_edge_index[num_subg])
- *         for r in range(num_subg):             # <<<<<<<<<<<<<<
- *             ret_nodes_vec.insert(ret_nodes_vec.end(),self.node_sampled[r].begin(),self.node_sampled[r].end())
- *             ret_indptr_vec.insert(ret_indptr_vec.end(),self.ret_indptr[r].begin(),self.ret_indptr[r].end())
- */
-  __pyx_t_1 = __Pyx_PyInt_From_int(__pyx_v_num_subg); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 145, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_7 = __Pyx_PyObject_CallOneArg(__pyx_builtin_range, __pyx_t_1); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 145, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_7);
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  if (likely(PyList_CheckExact(__pyx_t_7)) || PyTuple_CheckExact(__pyx_t_7)) {
-    __pyx_t_1 = __pyx_t_7; __Pyx_INCREF(__pyx_t_1); __pyx_t_3 = 0;
-    __pyx_t_4 = NULL;
-  } else {
-    __pyx_t_3 = -1; __pyx_t_1 = PyObject_GetIter(__pyx_t_7); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 145, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_1);
-    __pyx_t_4 = Py_TYPE(__pyx_t_1)->tp_iternext; if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 145, __pyx_L1_error)
-  }
-  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
-  for (;;) {
-    if (likely(!__pyx_t_4)) {
-      if (likely(PyList_CheckExact(__pyx_t_1))) {
-        if (__pyx_t_3 >= PyList_GET_SIZE(__pyx_t_1)) break;
-        #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
-        __pyx_t_7 = PyList_GET_ITEM(__pyx_t_1, __pyx_t_3); __Pyx_INCREF(__pyx_t_7); __pyx_t_3++; if (unlikely(0 < 0)) __PYX_ERR(0, 145, __pyx_L1_error)
-        #else
-        __pyx_t_7 = PySequence_ITEM(__pyx_t_1, __pyx_t_3); __pyx_t_3++; if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 145, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_7);
-        #endif
-      } else {
-        if (__pyx_t_3 >= PyTuple_GET_SIZE(__pyx_t_1)) break;
-        #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
-        __pyx_t_7 = PyTuple_GET_ITEM(__pyx_t_1, __pyx_t_3); __Pyx_INCREF(__pyx_t_7); __pyx_t_3++; if (unlikely(0 < 0)) __PYX_ERR(0, 145, __pyx_L1_error)
-        #else
-        __pyx_t_7 = PySequence_ITEM(__pyx_t_1, __pyx_t_3); __pyx_t_3++; if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 145, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_7);
-        #endif
-      }
-    } else {
-      __pyx_t_7 = __pyx_t_4(__pyx_t_1);
-      if (unlikely(!__pyx_t_7)) {
-        PyObject* exc_type = PyErr_Occurred();
-        if (exc_type) {
-          if (likely(__Pyx_PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration))) PyErr_Clear();
-          else __PYX_ERR(0, 145, __pyx_L1_error)
-        }
-        break;
-      }
-      __Pyx_GOTREF(__pyx_t_7);
-    }
-    __Pyx_XDECREF_SET(__pyx_v_r, __pyx_t_7);
-    __pyx_t_7 = 0;
-
-    /* "graphsaint/cython_sampler.pyx":146
- *         ret_edge_index_vec.reserve(offset_edge_index[num_subg])
- *         for r in range(num_subg):
- *             ret_nodes_vec.insert(ret_nodes_vec.end(),self.node_sampled[r].begin(),self.node_sampled[r].end())             # <<<<<<<<<<<<<<
- *             ret_indptr_vec.insert(ret_indptr_vec.end(),self.ret_indptr[r].begin(),self.ret_indptr[r].end())
- *             ret_indices_vec.insert(ret_indices_vec.end(),self.ret_indices[r].begin(),self.ret_indices[r].end())
- */
-    __pyx_t_5 = __Pyx_PyInt_As_size_t(__pyx_v_r); if (unlikely((__pyx_t_5 == (size_t)-1) && PyErr_Occurred())) __PYX_ERR(0, 146, __pyx_L1_error)
-    __pyx_t_14 = __Pyx_PyInt_As_size_t(__pyx_v_r); if (unlikely((__pyx_t_14 == (size_t)-1) && PyErr_Occurred())) __PYX_ERR(0, 146, __pyx_L1_error)
-    try {
-      __pyx_v_ret_nodes_vec.insert(__pyx_v_ret_nodes_vec.end(), (__pyx_v_self->node_sampled[__pyx_t_5]).begin(), (__pyx_v_self->node_sampled[__pyx_t_14]).end());
-    } catch(...) {
-      __Pyx_CppExn2PyErr();
-      __PYX_ERR(0, 146, __pyx_L1_error)
-    }
-
-    /* "graphsaint/cython_sampler.pyx":147
- *         for r in range(num_subg):
- *             ret_nodes_vec.insert(ret_nodes_vec.end(),self.node_sampled[r].begin(),self.node_sampled[r].end())
- *             ret_indptr_vec.insert(ret_indptr_vec.end(),self.ret_indptr[r].begin(),self.ret_indptr[r].end())             # <<<<<<<<<<<<<<
- *             ret_indices_vec.insert(ret_indices_vec.end(),self.ret_indices[r].begin(),self.ret_indices[r].end())
- *             ret_edge_index_vec.insert(ret_edge_index_vec.end(),self.ret_edge_index[r].begin(),self.ret_edge_index[r].end())
- */
-    __pyx_t_14 = __Pyx_PyInt_As_size_t(__pyx_v_r); if (unlikely((__pyx_t_14 == (size_t)-1) && PyErr_Occurred())) __PYX_ERR(0, 147, __pyx_L1_error)
-    __pyx_t_5 = __Pyx_PyInt_As_size_t(__pyx_v_r); if (unlikely((__pyx_t_5 == (size_t)-1) && PyErr_Occurred())) __PYX_ERR(0, 147, __pyx_L1_error)
-    try {
-      __pyx_v_ret_indptr_vec.insert(__pyx_v_ret_indptr_vec.end(), (__pyx_v_self->ret_indptr[__pyx_t_14]).begin(), (__pyx_v_self->ret_indptr[__pyx_t_5]).end());
-    } catch(...) {
-      __Pyx_CppExn2PyErr();
-      __PYX_ERR(0, 147, __pyx_L1_error)
-    }
-
-    /* "graphsaint/cython_sampler.pyx":148
- *             ret_nodes_vec.insert(ret_nodes_vec.end(),self.node_sampled[r].begin(),self.node_sampled[r].end())
- *             ret_indptr_vec.insert(ret_indptr_vec.end(),self.ret_indptr[r].begin(),self.ret_indptr[r].end())
- *             ret_indices_vec.insert(ret_indices_vec.end(),self.ret_indices[r].begin(),self.ret_indices[r].end())             # <<<<<<<<<<<<<<
- *             ret_edge_index_vec.insert(ret_edge_index_vec.end(),self.ret_edge_index[r].begin(),self.ret_edge_index[r].end())
- *             ret_data_vec.insert(ret_data_vec.end(),self.ret_data[r].begin(),self.ret_data[r].end())
- */
-    __pyx_t_5 = __Pyx_PyInt_As_size_t(__pyx_v_r); if (unlikely((__pyx_t_5 == (size_t)-1) && PyErr_Occurred())) __PYX_ERR(0, 148, __pyx_L1_error)
-    __pyx_t_14 = __Pyx_PyInt_As_size_t(__pyx_v_r); if (unlikely((__pyx_t_14 == (size_t)-1) && PyErr_Occurred())) __PYX_ERR(0, 148, __pyx_L1_error)
-    try {
-      __pyx_v_ret_indices_vec.insert(__pyx_v_ret_indices_vec.end(), (__pyx_v_self->ret_indices[__pyx_t_5]).begin(), (__pyx_v_self->ret_indices[__pyx_t_14]).end());
-    } catch(...) {
-      __Pyx_CppExn2PyErr();
-      __PYX_ERR(0, 148, __pyx_L1_error)
-    }
-
-    /* "graphsaint/cython_sampler.pyx":149
- *             ret_indptr_vec.insert(ret_indptr_vec.end(),self.ret_indptr[r].begin(),self.ret_indptr[r].end())
- *             ret_indices_vec.insert(ret_indices_vec.end(),self.ret_indices[r].begin(),self.ret_indices[r].end())
- *             ret_edge_index_vec.insert(ret_edge_index_vec.end(),self.ret_edge_index[r].begin(),self.ret_edge_index[r].end())             # <<<<<<<<<<<<<<
- *             ret_data_vec.insert(ret_data_vec.end(),self.ret_data[r].begin(),self.ret_data[r].end())
- * 
- */
-    __pyx_t_14 = __Pyx_PyInt_As_size_t(__pyx_v_r); if (unlikely((__pyx_t_14 == (size_t)-1) && PyErr_Occurred())) __PYX_ERR(0, 149, __pyx_L1_error)
-    __pyx_t_5 = __Pyx_PyInt_As_size_t(__pyx_v_r); if (unlikely((__pyx_t_5 == (size_t)-1) && PyErr_Occurred())) __PYX_ERR(0, 149, __pyx_L1_error)
-    try {
-      __pyx_v_ret_edge_index_vec.insert(__pyx_v_ret_edge_index_vec.end(), (__pyx_v_self->ret_edge_index[__pyx_t_14]).begin(), (__pyx_v_self->ret_edge_index[__pyx_t_5]).end());
-    } catch(...) {
-      __Pyx_CppExn2PyErr();
-      __PYX_ERR(0, 149, __pyx_L1_error)
-    }
-
-    /* "graphsaint/cython_sampler.pyx":150
- *             ret_indices_vec.insert(ret_indices_vec.end(),self.ret_indices[r].begin(),self.ret_indices[r].end())
- *             ret_edge_index_vec.insert(ret_edge_index_vec.end(),self.ret_edge_index[r].begin(),self.ret_edge_index[r].end())
- *             ret_data_vec.insert(ret_data_vec.end(),self.ret_data[r].begin(),self.ret_data[r].end())             # <<<<<<<<<<<<<<
- * 
- *         cdef cutils.array_wrapper_int wint_indptr = cutils.array_wrapper_int()
- */
-    __pyx_t_9 = __Pyx_PyInt_As_size_t(__pyx_v_r); if (unlikely((__pyx_t_9 == (size_t)-1) && PyErr_Occurred())) __PYX_ERR(0, 150, __pyx_L1_error)
-    __pyx_t_15 = __Pyx_PyInt_As_size_t(__pyx_v_r); if (unlikely((__pyx_t_15 == (size_t)-1) && PyErr_Occurred())) __PYX_ERR(0, 150, __pyx_L1_error)
-    try {
-      __pyx_v_ret_data_vec.insert(__pyx_v_ret_data_vec.end(), (__pyx_v_self->ret_data[__pyx_t_9]).begin(), (__pyx_v_self->ret_data[__pyx_t_15]).end());
-    } catch(...) {
-      __Pyx_CppExn2PyErr();
-      __PYX_ERR(0, 150, __pyx_L1_error)
-    }
-
-    /* "graphsaint/cython_sampler.pyx":145
- *         ret_data_vec.reserve(offset_data[num_subg])
- *         ret_edge_index_vec.reserve(offset_edge_index[num_subg])
- *         for r in range(num_subg):             # <<<<<<<<<<<<<<
- *             ret_nodes_vec.insert(ret_nodes_vec.end(),self.node_sampled[r].begin(),self.node_sampled[r].end())
- *             ret_indptr_vec.insert(ret_indptr_vec.end(),self.ret_indptr[r].begin(),self.ret_indptr[r].end())
- */
-  }
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-
-  /* "graphsaint/cython_sampler.pyx":152
- *             ret_data_vec.insert(ret_data_vec.end(),self.ret_data[r].begin(),self.ret_data[r].end())
- * 
- *         cdef cutils.array_wrapper_int wint_indptr = cutils.array_wrapper_int()             # <<<<<<<<<<<<<<
- *         cdef cutils.array_wrapper_int wint_indices = cutils.array_wrapper_int()
- *         cdef cutils.array_wrapper_int wint_nodes = cutils.array_wrapper_int()
- */
-  __pyx_t_1 = __Pyx_PyObject_CallNoArg(((PyObject *)__pyx_ptype_10graphsaint_12cython_utils_array_wrapper_int)); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 152, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_v_wint_indptr = ((struct __pyx_obj_10graphsaint_12cython_utils_array_wrapper_int *)__pyx_t_1);
-  __pyx_t_1 = 0;
-
-  /* "graphsaint/cython_sampler.pyx":153
- * 
- *         cdef cutils.array_wrapper_int wint_indptr = cutils.array_wrapper_int()
- *         cdef cutils.array_wrapper_int wint_indices = cutils.array_wrapper_int()             # <<<<<<<<<<<<<<
- *         cdef cutils.array_wrapper_int wint_nodes = cutils.array_wrapper_int()
- *         cdef cutils.array_wrapper_float wfloat_data = cutils.array_wrapper_float()
- */
-  __pyx_t_1 = __Pyx_PyObject_CallNoArg(((PyObject *)__pyx_ptype_10graphsaint_12cython_utils_array_wrapper_int)); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 153, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_v_wint_indices = ((struct __pyx_obj_10graphsaint_12cython_utils_array_wrapper_int *)__pyx_t_1);
-  __pyx_t_1 = 0;
-
-  /* "graphsaint/cython_sampler.pyx":154
- *         cdef cutils.array_wrapper_int wint_indptr = cutils.array_wrapper_int()
- *         cdef cutils.array_wrapper_int wint_indices = cutils.array_wrapper_int()
- *         cdef cutils.array_wrapper_int wint_nodes = cutils.array_wrapper_int()             # <<<<<<<<<<<<<<
- *         cdef cutils.array_wrapper_float wfloat_data = cutils.array_wrapper_float()
- *         cdef cutils.array_wrapper_int wint_edge_index = cutils.array_wrapper_int()
- */
-  __pyx_t_1 = __Pyx_PyObject_CallNoArg(((PyObject *)__pyx_ptype_10graphsaint_12cython_utils_array_wrapper_int)); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 154, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_v_wint_nodes = ((struct __pyx_obj_10graphsaint_12cython_utils_array_wrapper_int *)__pyx_t_1);
-  __pyx_t_1 = 0;
-
-  /* "graphsaint/cython_sampler.pyx":155
- *         cdef cutils.array_wrapper_int wint_indices = cutils.array_wrapper_int()
- *         cdef cutils.array_wrapper_int wint_nodes = cutils.array_wrapper_int()
- *         cdef cutils.array_wrapper_float wfloat_data = cutils.array_wrapper_float()             # <<<<<<<<<<<<<<
- *         cdef cutils.array_wrapper_int wint_edge_index = cutils.array_wrapper_int()
- * 
- */
-  __pyx_t_1 = __Pyx_PyObject_CallNoArg(((PyObject *)__pyx_ptype_10graphsaint_12cython_utils_array_wrapper_float)); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 155, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_v_wfloat_data = ((struct __pyx_obj_10graphsaint_12cython_utils_array_wrapper_float *)__pyx_t_1);
-  __pyx_t_1 = 0;
-
-  /* "graphsaint/cython_sampler.pyx":156
- *         cdef cutils.array_wrapper_int wint_nodes = cutils.array_wrapper_int()
- *         cdef cutils.array_wrapper_float wfloat_data = cutils.array_wrapper_float()
- *         cdef cutils.array_wrapper_int wint_edge_index = cutils.array_wrapper_int()             # <<<<<<<<<<<<<<
- * 
- *         wint_indptr.set_data(ret_indptr_vec)
- */
-  __pyx_t_1 = __Pyx_PyObject_CallNoArg(((PyObject *)__pyx_ptype_10graphsaint_12cython_utils_array_wrapper_int)); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 156, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_v_wint_edge_index = ((struct __pyx_obj_10graphsaint_12cython_utils_array_wrapper_int *)__pyx_t_1);
-  __pyx_t_1 = 0;
-
-  /* "graphsaint/cython_sampler.pyx":158
- *         cdef cutils.array_wrapper_int wint_edge_index = cutils.array_wrapper_int()
- * 
- *         wint_indptr.set_data(ret_indptr_vec)             # <<<<<<<<<<<<<<
- *         ret_indptr_np = np.frombuffer(wint_indptr,dtype=np.int32)
- *         wint_indices.set_data(ret_indices_vec)
- */
-  ((struct __pyx_vtabstruct_10graphsaint_12cython_utils_array_wrapper_int *)__pyx_v_wint_indptr->__pyx_vtab)->set_data(__pyx_v_wint_indptr, __pyx_v_ret_indptr_vec);
-
-  /* "graphsaint/cython_sampler.pyx":159
- * 
- *         wint_indptr.set_data(ret_indptr_vec)
- *         ret_indptr_np = np.frombuffer(wint_indptr,dtype=np.int32)             # <<<<<<<<<<<<<<
- *         wint_indices.set_data(ret_indices_vec)
- *         ret_indices_np = np.frombuffer(wint_indices,dtype=np.int32)
- */
-  __Pyx_GetModuleGlobalName(__pyx_t_1, __pyx_n_s_np); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 159, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_7 = __Pyx_PyObject_GetAttrStr(__pyx_t_1, __pyx_n_s_frombuffer); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 159, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_7);
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __pyx_t_1 = PyTuple_New(1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 159, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __Pyx_INCREF(((PyObject *)__pyx_v_wint_indptr));
-  __Pyx_GIVEREF(((PyObject *)__pyx_v_wint_indptr));
-  PyTuple_SET_ITEM(__pyx_t_1, 0, ((PyObject *)__pyx_v_wint_indptr));
-  __pyx_t_6 = __Pyx_PyDict_NewPresized(1); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 159, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_6);
-  __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_np); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 159, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_16 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_n_s_int32); if (unlikely(!__pyx_t_16)) __PYX_ERR(0, 159, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_16);
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  if (PyDict_SetItem(__pyx_t_6, __pyx_n_s_dtype, __pyx_t_16) < 0) __PYX_ERR(0, 159, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_16); __pyx_t_16 = 0;
-  __pyx_t_16 = __Pyx_PyObject_Call(__pyx_t_7, __pyx_t_1, __pyx_t_6); if (unlikely(!__pyx_t_16)) __PYX_ERR(0, 159, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_16);
-  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-  __pyx_v_ret_indptr_np = __pyx_t_16;
-  __pyx_t_16 = 0;
-
-  /* "graphsaint/cython_sampler.pyx":160
- *         wint_indptr.set_data(ret_indptr_vec)
- *         ret_indptr_np = np.frombuffer(wint_indptr,dtype=np.int32)
- *         wint_indices.set_data(ret_indices_vec)             # <<<<<<<<<<<<<<
- *         ret_indices_np = np.frombuffer(wint_indices,dtype=np.int32)
- *         wint_nodes.set_data(ret_nodes_vec)
- */
-  ((struct __pyx_vtabstruct_10graphsaint_12cython_utils_array_wrapper_int *)__pyx_v_wint_indices->__pyx_vtab)->set_data(__pyx_v_wint_indices, __pyx_v_ret_indices_vec);
-
-  /* "graphsaint/cython_sampler.pyx":161
- *         ret_indptr_np = np.frombuffer(wint_indptr,dtype=np.int32)
- *         wint_indices.set_data(ret_indices_vec)
- *         ret_indices_np = np.frombuffer(wint_indices,dtype=np.int32)             # <<<<<<<<<<<<<<
- *         wint_nodes.set_data(ret_nodes_vec)
- *         ret_nodes_np = np.frombuffer(wint_nodes,dtype=np.int32)
- */
-  __Pyx_GetModuleGlobalName(__pyx_t_16, __pyx_n_s_np); if (unlikely(!__pyx_t_16)) __PYX_ERR(0, 161, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_16);
-  __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_t_16, __pyx_n_s_frombuffer); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 161, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_6);
-  __Pyx_DECREF(__pyx_t_16); __pyx_t_16 = 0;
-  __pyx_t_16 = PyTuple_New(1); if (unlikely(!__pyx_t_16)) __PYX_ERR(0, 161, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_16);
-  __Pyx_INCREF(((PyObject *)__pyx_v_wint_indices));
-  __Pyx_GIVEREF(((PyObject *)__pyx_v_wint_indices));
-  PyTuple_SET_ITEM(__pyx_t_16, 0, ((PyObject *)__pyx_v_wint_indices));
-  __pyx_t_1 = __Pyx_PyDict_NewPresized(1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 161, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __Pyx_GetModuleGlobalName(__pyx_t_7, __pyx_n_s_np); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 161, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_7);
-  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_t_7, __pyx_n_s_int32); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 161, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
-  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
-  if (PyDict_SetItem(__pyx_t_1, __pyx_n_s_dtype, __pyx_t_2) < 0) __PYX_ERR(0, 161, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __pyx_t_2 = __Pyx_PyObject_Call(__pyx_t_6, __pyx_t_16, __pyx_t_1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 161, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
-  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-  __Pyx_DECREF(__pyx_t_16); __pyx_t_16 = 0;
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __pyx_v_ret_indices_np = __pyx_t_2;
-  __pyx_t_2 = 0;
-
-  /* "graphsaint/cython_sampler.pyx":162
- *         wint_indices.set_data(ret_indices_vec)
- *         ret_indices_np = np.frombuffer(wint_indices,dtype=np.int32)
- *         wint_nodes.set_data(ret_nodes_vec)             # <<<<<<<<<<<<<<
- *         ret_nodes_np = np.frombuffer(wint_nodes,dtype=np.int32)
- *         wfloat_data.set_data(ret_data_vec)
- */
-  ((struct __pyx_vtabstruct_10graphsaint_12cython_utils_array_wrapper_int *)__pyx_v_wint_nodes->__pyx_vtab)->set_data(__pyx_v_wint_nodes, __pyx_v_ret_nodes_vec);
-
-  /* "graphsaint/cython_sampler.pyx":163
- *         ret_indices_np = np.frombuffer(wint_indices,dtype=np.int32)
- *         wint_nodes.set_data(ret_nodes_vec)
- *         ret_nodes_np = np.frombuffer(wint_nodes,dtype=np.int32)             # <<<<<<<<<<<<<<
- *         wfloat_data.set_data(ret_data_vec)
- *         ret_data_np = np.frombuffer(wfloat_data,dtype=np.float32)
- */
-  __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_np); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 163, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_n_s_frombuffer); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 163, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __pyx_t_2 = PyTuple_New(1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 163, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
-  __Pyx_INCREF(((PyObject *)__pyx_v_wint_nodes));
-  __Pyx_GIVEREF(((PyObject *)__pyx_v_wint_nodes));
-  PyTuple_SET_ITEM(__pyx_t_2, 0, ((PyObject *)__pyx_v_wint_nodes));
-  __pyx_t_16 = __Pyx_PyDict_NewPresized(1); if (unlikely(!__pyx_t_16)) __PYX_ERR(0, 163, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_16);
-  __Pyx_GetModuleGlobalName(__pyx_t_6, __pyx_n_s_np); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 163, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_6);
-  __pyx_t_7 = __Pyx_PyObject_GetAttrStr(__pyx_t_6, __pyx_n_s_int32); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 163, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_7);
-  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-  if (PyDict_SetItem(__pyx_t_16, __pyx_n_s_dtype, __pyx_t_7) < 0) __PYX_ERR(0, 163, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
-  __pyx_t_7 = __Pyx_PyObject_Call(__pyx_t_1, __pyx_t_2, __pyx_t_16); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 163, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_7);
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __Pyx_DECREF(__pyx_t_16); __pyx_t_16 = 0;
-  __pyx_v_ret_nodes_np = __pyx_t_7;
-  __pyx_t_7 = 0;
-
-  /* "graphsaint/cython_sampler.pyx":164
- *         wint_nodes.set_data(ret_nodes_vec)
- *         ret_nodes_np = np.frombuffer(wint_nodes,dtype=np.int32)
- *         wfloat_data.set_data(ret_data_vec)             # <<<<<<<<<<<<<<
- *         ret_data_np = np.frombuffer(wfloat_data,dtype=np.float32)
- *         wint_edge_index.set_data(ret_edge_index_vec)
- */
-  ((struct __pyx_vtabstruct_10graphsaint_12cython_utils_array_wrapper_float *)__pyx_v_wfloat_data->__pyx_vtab)->set_data(__pyx_v_wfloat_data, __pyx_v_ret_data_vec);
-
-  /* "graphsaint/cython_sampler.pyx":165
- *         ret_nodes_np = np.frombuffer(wint_nodes,dtype=np.int32)
- *         wfloat_data.set_data(ret_data_vec)
- *         ret_data_np = np.frombuffer(wfloat_data,dtype=np.float32)             # <<<<<<<<<<<<<<
- *         wint_edge_index.set_data(ret_edge_index_vec)
- *         ret_edge_index_np = np.frombuffer(wint_edge_index,dtype=np.int32)
- */
-  __Pyx_GetModuleGlobalName(__pyx_t_7, __pyx_n_s_np); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 165, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_7);
-  __pyx_t_16 = __Pyx_PyObject_GetAttrStr(__pyx_t_7, __pyx_n_s_frombuffer); if (unlikely(!__pyx_t_16)) __PYX_ERR(0, 165, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_16);
-  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
-  __pyx_t_7 = PyTuple_New(1); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 165, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_7);
-  __Pyx_INCREF(((PyObject *)__pyx_v_wfloat_data));
-  __Pyx_GIVEREF(((PyObject *)__pyx_v_wfloat_data));
-  PyTuple_SET_ITEM(__pyx_t_7, 0, ((PyObject *)__pyx_v_wfloat_data));
-  __pyx_t_2 = __Pyx_PyDict_NewPresized(1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 165, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
-  __Pyx_GetModuleGlobalName(__pyx_t_1, __pyx_n_s_np); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 165, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_t_1, __pyx_n_s_float32); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 165, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_6);
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  if (PyDict_SetItem(__pyx_t_2, __pyx_n_s_dtype, __pyx_t_6) < 0) __PYX_ERR(0, 165, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-  __pyx_t_6 = __Pyx_PyObject_Call(__pyx_t_16, __pyx_t_7, __pyx_t_2); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 165, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_6);
-  __Pyx_DECREF(__pyx_t_16); __pyx_t_16 = 0;
-  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __pyx_v_ret_data_np = __pyx_t_6;
-  __pyx_t_6 = 0;
-
-  /* "graphsaint/cython_sampler.pyx":166
- *         wfloat_data.set_data(ret_data_vec)
- *         ret_data_np = np.frombuffer(wfloat_data,dtype=np.float32)
- *         wint_edge_index.set_data(ret_edge_index_vec)             # <<<<<<<<<<<<<<
- *         ret_edge_index_np = np.frombuffer(wint_edge_index,dtype=np.int32)
- * 
- */
-  ((struct __pyx_vtabstruct_10graphsaint_12cython_utils_array_wrapper_int *)__pyx_v_wint_edge_index->__pyx_vtab)->set_data(__pyx_v_wint_edge_index, __pyx_v_ret_edge_index_vec);
-
-  /* "graphsaint/cython_sampler.pyx":167
- *         ret_data_np = np.frombuffer(wfloat_data,dtype=np.float32)
- *         wint_edge_index.set_data(ret_edge_index_vec)
- *         ret_edge_index_np = np.frombuffer(wint_edge_index,dtype=np.int32)             # <<<<<<<<<<<<<<
- * 
- *         for r in range(num_subg):
- */
-  __Pyx_GetModuleGlobalName(__pyx_t_6, __pyx_n_s_np); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 167, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_6);
-  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_t_6, __pyx_n_s_frombuffer); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 167, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
-  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-  __pyx_t_6 = PyTuple_New(1); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 167, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_6);
-  __Pyx_INCREF(((PyObject *)__pyx_v_wint_edge_index));
-  __Pyx_GIVEREF(((PyObject *)__pyx_v_wint_edge_index));
-  PyTuple_SET_ITEM(__pyx_t_6, 0, ((PyObject *)__pyx_v_wint_edge_index));
-  __pyx_t_7 = __Pyx_PyDict_NewPresized(1); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 167, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_7);
-  __Pyx_GetModuleGlobalName(__pyx_t_16, __pyx_n_s_np); if (unlikely(!__pyx_t_16)) __PYX_ERR(0, 167, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_16);
-  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_t_16, __pyx_n_s_int32); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 167, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __Pyx_DECREF(__pyx_t_16); __pyx_t_16 = 0;
-  if (PyDict_SetItem(__pyx_t_7, __pyx_n_s_dtype, __pyx_t_1) < 0) __PYX_ERR(0, 167, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_2, __pyx_t_6, __pyx_t_7); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 167, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
-  __pyx_v_ret_edge_index_np = __pyx_t_1;
-  __pyx_t_1 = 0;
-
-  /* "graphsaint/cython_sampler.pyx":169
- *         ret_edge_index_np = np.frombuffer(wint_edge_index,dtype=np.int32)
- * 
- *         for r in range(num_subg):             # <<<<<<<<<<<<<<
- *             l_subg_nodes.append(ret_nodes_np[offset_nodes[r]:offset_nodes[r+1]])
- *             l_subg_indptr.append(ret_indptr_np[offset_indptr[r]:offset_indptr[r+1]])
- */
-  __pyx_t_1 = __Pyx_PyInt_From_int(__pyx_v_num_subg); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 169, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_7 = __Pyx_PyObject_CallOneArg(__pyx_builtin_range, __pyx_t_1); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 169, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_7);
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  if (likely(PyList_CheckExact(__pyx_t_7)) || PyTuple_CheckExact(__pyx_t_7)) {
-    __pyx_t_1 = __pyx_t_7; __Pyx_INCREF(__pyx_t_1); __pyx_t_3 = 0;
-    __pyx_t_4 = NULL;
-  } else {
-    __pyx_t_3 = -1; __pyx_t_1 = PyObject_GetIter(__pyx_t_7); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 169, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_1);
-    __pyx_t_4 = Py_TYPE(__pyx_t_1)->tp_iternext; if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 169, __pyx_L1_error)
-  }
-  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
-  for (;;) {
-    if (likely(!__pyx_t_4)) {
-      if (likely(PyList_CheckExact(__pyx_t_1))) {
-        if (__pyx_t_3 >= PyList_GET_SIZE(__pyx_t_1)) break;
-        #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
-        __pyx_t_7 = PyList_GET_ITEM(__pyx_t_1, __pyx_t_3); __Pyx_INCREF(__pyx_t_7); __pyx_t_3++; if (unlikely(0 < 0)) __PYX_ERR(0, 169, __pyx_L1_error)
-        #else
-        __pyx_t_7 = PySequence_ITEM(__pyx_t_1, __pyx_t_3); __pyx_t_3++; if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 169, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_7);
-        #endif
-      } else {
-        if (__pyx_t_3 >= PyTuple_GET_SIZE(__pyx_t_1)) break;
-        #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
-        __pyx_t_7 = PyTuple_GET_ITEM(__pyx_t_1, __pyx_t_3); __Pyx_INCREF(__pyx_t_7); __pyx_t_3++; if (unlikely(0 < 0)) __PYX_ERR(0, 169, __pyx_L1_error)
-        #else
-        __pyx_t_7 = PySequence_ITEM(__pyx_t_1, __pyx_t_3); __pyx_t_3++; if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 169, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_7);
-        #endif
-      }
-    } else {
-      __pyx_t_7 = __pyx_t_4(__pyx_t_1);
-      if (unlikely(!__pyx_t_7)) {
-        PyObject* exc_type = PyErr_Occurred();
-        if (exc_type) {
-          if (likely(__Pyx_PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration))) PyErr_Clear();
-          else __PYX_ERR(0, 169, __pyx_L1_error)
-        }
-        break;
-      }
-      __Pyx_GOTREF(__pyx_t_7);
-    }
-    __Pyx_XDECREF_SET(__pyx_v_r, __pyx_t_7);
-    __pyx_t_7 = 0;
-
-    /* "graphsaint/cython_sampler.pyx":170
- * 
- *         for r in range(num_subg):
- *             l_subg_nodes.append(ret_nodes_np[offset_nodes[r]:offset_nodes[r+1]])             # <<<<<<<<<<<<<<
- *             l_subg_indptr.append(ret_indptr_np[offset_indptr[r]:offset_indptr[r+1]])
- *             l_subg_indices.append(ret_indices_np[offset_indices[r]:offset_indices[r+1]])
- */
-    __pyx_t_7 = __Pyx_PyObject_GetItem(__pyx_v_offset_nodes, __pyx_v_r); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 170, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_7);
-    __pyx_t_6 = __Pyx_PyInt_AddObjC(__pyx_v_r, __pyx_int_1, 1, 0, 0); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 170, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_6);
-    __pyx_t_2 = __Pyx_PyObject_GetItem(__pyx_v_offset_nodes, __pyx_t_6); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 170, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_2);
-    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-    __pyx_t_6 = __Pyx_PyObject_GetSlice(__pyx_v_ret_nodes_np, 0, 0, &__pyx_t_7, &__pyx_t_2, NULL, 0, 0, 1); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 170, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_6);
-    __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
-    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-    __pyx_t_8 = __Pyx_PyList_Append(__pyx_v_l_subg_nodes, __pyx_t_6); if (unlikely(__pyx_t_8 == ((int)-1))) __PYX_ERR(0, 170, __pyx_L1_error)
-    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-
-    /* "graphsaint/cython_sampler.pyx":171
- *         for r in range(num_subg):
- *             l_subg_nodes.append(ret_nodes_np[offset_nodes[r]:offset_nodes[r+1]])
- *             l_subg_indptr.append(ret_indptr_np[offset_indptr[r]:offset_indptr[r+1]])             # <<<<<<<<<<<<<<
- *             l_subg_indices.append(ret_indices_np[offset_indices[r]:offset_indices[r+1]])
- *             l_subg_data.append(ret_data_np[offset_data[r]:offset_data[r+1]])
- */
-    __pyx_t_6 = __Pyx_PyObject_GetItem(__pyx_v_offset_indptr, __pyx_v_r); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 171, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_6);
-    __pyx_t_2 = __Pyx_PyInt_AddObjC(__pyx_v_r, __pyx_int_1, 1, 0, 0); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 171, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_2);
-    __pyx_t_7 = __Pyx_PyObject_GetItem(__pyx_v_offset_indptr, __pyx_t_2); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 171, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_7);
-    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-    __pyx_t_2 = __Pyx_PyObject_GetSlice(__pyx_v_ret_indptr_np, 0, 0, &__pyx_t_6, &__pyx_t_7, NULL, 0, 0, 1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 171, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_2);
-    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-    __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
-    __pyx_t_8 = __Pyx_PyList_Append(__pyx_v_l_subg_indptr, __pyx_t_2); if (unlikely(__pyx_t_8 == ((int)-1))) __PYX_ERR(0, 171, __pyx_L1_error)
-    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-
-    /* "graphsaint/cython_sampler.pyx":172
- *             l_subg_nodes.append(ret_nodes_np[offset_nodes[r]:offset_nodes[r+1]])
- *             l_subg_indptr.append(ret_indptr_np[offset_indptr[r]:offset_indptr[r+1]])
- *             l_subg_indices.append(ret_indices_np[offset_indices[r]:offset_indices[r+1]])             # <<<<<<<<<<<<<<
- *             l_subg_data.append(ret_data_np[offset_data[r]:offset_data[r+1]])
- *             l_subg_edge_index.append(ret_edge_index_np[offset_indices[r]:offset_indices[r+1]])
- */
-    __pyx_t_2 = __Pyx_PyObject_GetItem(__pyx_v_offset_indices, __pyx_v_r); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 172, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_2);
-    __pyx_t_7 = __Pyx_PyInt_AddObjC(__pyx_v_r, __pyx_int_1, 1, 0, 0); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 172, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_7);
-    __pyx_t_6 = __Pyx_PyObject_GetItem(__pyx_v_offset_indices, __pyx_t_7); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 172, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_6);
-    __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
-    __pyx_t_7 = __Pyx_PyObject_GetSlice(__pyx_v_ret_indices_np, 0, 0, &__pyx_t_2, &__pyx_t_6, NULL, 0, 0, 1); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 172, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_7);
-    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-    __pyx_t_8 = __Pyx_PyList_Append(__pyx_v_l_subg_indices, __pyx_t_7); if (unlikely(__pyx_t_8 == ((int)-1))) __PYX_ERR(0, 172, __pyx_L1_error)
-    __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
-
-    /* "graphsaint/cython_sampler.pyx":173
- *             l_subg_indptr.append(ret_indptr_np[offset_indptr[r]:offset_indptr[r+1]])
- *             l_subg_indices.append(ret_indices_np[offset_indices[r]:offset_indices[r+1]])
- *             l_subg_data.append(ret_data_np[offset_data[r]:offset_data[r+1]])             # <<<<<<<<<<<<<<
- *             l_subg_edge_index.append(ret_edge_index_np[offset_indices[r]:offset_indices[r+1]])
- * 
- */
-    __pyx_t_7 = __Pyx_PyObject_GetItem(__pyx_v_offset_data, __pyx_v_r); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 173, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_7);
-    __pyx_t_6 = __Pyx_PyInt_AddObjC(__pyx_v_r, __pyx_int_1, 1, 0, 0); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 173, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_6);
-    __pyx_t_2 = __Pyx_PyObject_GetItem(__pyx_v_offset_data, __pyx_t_6); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 173, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_2);
-    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-    __pyx_t_6 = __Pyx_PyObject_GetSlice(__pyx_v_ret_data_np, 0, 0, &__pyx_t_7, &__pyx_t_2, NULL, 0, 0, 1); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 173, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_6);
-    __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
-    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-    __pyx_t_8 = __Pyx_PyList_Append(__pyx_v_l_subg_data, __pyx_t_6); if (unlikely(__pyx_t_8 == ((int)-1))) __PYX_ERR(0, 173, __pyx_L1_error)
-    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-
-    /* "graphsaint/cython_sampler.pyx":174
- *             l_subg_indices.append(ret_indices_np[offset_indices[r]:offset_indices[r+1]])
- *             l_subg_data.append(ret_data_np[offset_data[r]:offset_data[r+1]])
- *             l_subg_edge_index.append(ret_edge_index_np[offset_indices[r]:offset_indices[r+1]])             # <<<<<<<<<<<<<<
- * 
- *         return l_subg_indptr,l_subg_indices,l_subg_data,l_subg_nodes,l_subg_edge_index
- */
-    __pyx_t_6 = __Pyx_PyObject_GetItem(__pyx_v_offset_indices, __pyx_v_r); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 174, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_6);
-    __pyx_t_2 = __Pyx_PyInt_AddObjC(__pyx_v_r, __pyx_int_1, 1, 0, 0); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 174, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_2);
-    __pyx_t_7 = __Pyx_PyObject_GetItem(__pyx_v_offset_indices, __pyx_t_2); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 174, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_7);
-    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-    __pyx_t_2 = __Pyx_PyObject_GetSlice(__pyx_v_ret_edge_index_np, 0, 0, &__pyx_t_6, &__pyx_t_7, NULL, 0, 0, 1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 174, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_2);
-    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-    __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
-    __pyx_t_8 = __Pyx_PyList_Append(__pyx_v_l_subg_edge_index, __pyx_t_2); if (unlikely(__pyx_t_8 == ((int)-1))) __PYX_ERR(0, 174, __pyx_L1_error)
-    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-
-    /* "graphsaint/cython_sampler.pyx":169
- *         ret_edge_index_np = np.frombuffer(wint_edge_index,dtype=np.int32)
- * 
- *         for r in range(num_subg):             # <<<<<<<<<<<<<<
- *             l_subg_nodes.append(ret_nodes_np[offset_nodes[r]:offset_nodes[r+1]])
- *             l_subg_indptr.append(ret_indptr_np[offset_indptr[r]:offset_indptr[r+1]])
- */
-  }
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-
-  /* "graphsaint/cython_sampler.pyx":176
- *             l_subg_edge_index.append(ret_edge_index_np[offset_indices[r]:offset_indices[r+1]])
- * 
- *         return l_subg_indptr,l_subg_indices,l_subg_data,l_subg_nodes,l_subg_edge_index             # <<<<<<<<<<<<<<
- * 
- *     cdef void sample(self, int p) nogil:
- */
-  __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = PyTuple_New(5); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 176, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __Pyx_INCREF(__pyx_v_l_subg_indptr);
-  __Pyx_GIVEREF(__pyx_v_l_subg_indptr);
-  PyTuple_SET_ITEM(__pyx_t_1, 0, __pyx_v_l_subg_indptr);
-  __Pyx_INCREF(__pyx_v_l_subg_indices);
-  __Pyx_GIVEREF(__pyx_v_l_subg_indices);
-  PyTuple_SET_ITEM(__pyx_t_1, 1, __pyx_v_l_subg_indices);
-  __Pyx_INCREF(__pyx_v_l_subg_data);
-  __Pyx_GIVEREF(__pyx_v_l_subg_data);
-  PyTuple_SET_ITEM(__pyx_t_1, 2, __pyx_v_l_subg_data);
-  __Pyx_INCREF(__pyx_v_l_subg_nodes);
-  __Pyx_GIVEREF(__pyx_v_l_subg_nodes);
-  PyTuple_SET_ITEM(__pyx_t_1, 3, __pyx_v_l_subg_nodes);
-  __Pyx_INCREF(__pyx_v_l_subg_edge_index);
-  __Pyx_GIVEREF(__pyx_v_l_subg_edge_index);
-  PyTuple_SET_ITEM(__pyx_t_1, 4, __pyx_v_l_subg_edge_index);
-  __pyx_r = __pyx_t_1;
-  __pyx_t_1 = 0;
-  goto __pyx_L0;
-
-  /* "graphsaint/cython_sampler.pyx":107
- *             r = r + 1
- * 
- *     def get_return(self):             # <<<<<<<<<<<<<<
- *         """
- *         Convert the subgraph related data structures from C++ to python. So that cython
- */
-
-  /* function exit code */
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_XDECREF(__pyx_t_2);
-  __Pyx_XDECREF(__pyx_t_6);
-  __Pyx_XDECREF(__pyx_t_7);
-  __Pyx_XDECREF(__pyx_t_16);
-  __Pyx_AddTraceback("graphsaint.cython_sampler.Sampler.get_return", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __pyx_r = NULL;
-  __pyx_L0:;
-  __Pyx_XDECREF(__pyx_v_l_subg_indptr);
-  __Pyx_XDECREF(__pyx_v_l_subg_indices);
-  __Pyx_XDECREF(__pyx_v_l_subg_data);
-  __Pyx_XDECREF(__pyx_v_l_subg_nodes);
-  __Pyx_XDECREF(__pyx_v_l_subg_edge_index);
-  __Pyx_XDECREF(__pyx_v_offset_nodes);
-  __Pyx_XDECREF(__pyx_v_offset_indptr);
-  __Pyx_XDECREF(__pyx_v_offset_indices);
-  __Pyx_XDECREF(__pyx_v_offset_data);
-  __Pyx_XDECREF(__pyx_v_offset_edge_index);
-  __Pyx_XDECREF(__pyx_v_r);
-  __Pyx_XDECREF((PyObject *)__pyx_v_wint_indptr);
-  __Pyx_XDECREF((PyObject *)__pyx_v_wint_indices);
-  __Pyx_XDECREF((PyObject *)__pyx_v_wint_nodes);
-  __Pyx_XDECREF((PyObject *)__pyx_v_wfloat_data);
-  __Pyx_XDECREF((PyObject *)__pyx_v_wint_edge_index);
-  __Pyx_XDECREF(__pyx_v_ret_indptr_np);
-  __Pyx_XDECREF(__pyx_v_ret_indices_np);
-  __Pyx_XDECREF(__pyx_v_ret_nodes_np);
-  __Pyx_XDECREF(__pyx_v_ret_data_np);
-  __Pyx_XDECREF(__pyx_v_ret_edge_index_np);
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "graphsaint/cython_sampler.pyx":178
- *         return l_subg_indptr,l_subg_indices,l_subg_data,l_subg_nodes,l_subg_edge_index
- * 
- *     cdef void sample(self, int p) nogil:             # <<<<<<<<<<<<<<
- *         pass
- * 
- */
-
-static void __pyx_f_10graphsaint_14cython_sampler_7Sampler_sample(CYTHON_UNUSED struct __pyx_obj_10graphsaint_14cython_sampler_Sampler *__pyx_v_self, CYTHON_UNUSED int __pyx_v_p) {
-
-  /* function exit code */
-}
-
-/* "graphsaint/cython_sampler.pyx":183
- *     @cython.boundscheck(False)
- *     @cython.wraparound(False)
- *     def par_sample(self):             # <<<<<<<<<<<<<<
- *         """
- *         The main function for the sampler class. It launches multiple independent samplers
- */
-
-/* Python wrapper */
-static PyObject *__pyx_pw_10graphsaint_14cython_sampler_7Sampler_5par_sample(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
-static char __pyx_doc_10graphsaint_14cython_sampler_7Sampler_4par_sample[] = "\n        The main function for the sampler class. It launches multiple independent samplers\n        in parallel (task parallelism by openmp), where the serial sampling function is defined\n        in the corresponding sub-class. Then it returns node-induced subgraph by `_adj_extract()`,\n        and convert C++ vectors to python lists / numpy arrays by `_get_return()`.\n\n        Suppose we sample P subgraphs in parallel. Each subgraph has n nodes and e edges.\n\n        Inputs:\n            None\n\n        Outputs (elements in the list of `ret`):\n            l_subg_indptr       list of np array, length of list = P and length of each array is n+1\n            l_subg_indices      list of np array, length of list = P and length of each array is m.\n                                node IDs in the array are renamed to be subgraph ID (range: 0 ~ n-1)\n            l_subg_data         list of np array, length of list = P and length of each array is m.\n                                Normally, values in the array should be all 1.\n            l_subg_nodes        list of np array, length of list = P and length of each array is n.\n                                Element i in the array shows the training graph node ID of the i-th\n                                subgraph node.\n            l_subg_edge_index   list of np array, length of list = P and length of each array is m.\n                                Element i in the array shows the training graph edge index of the\n                                i-the subgraph edge.\n        ";
-static PyObject *__pyx_pw_10graphsaint_14cython_sampler_7Sampler_5par_sample(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
-  PyObject *__pyx_r = 0;
-  __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("par_sample (wrapper)", 0);
-  __pyx_r = __pyx_pf_10graphsaint_14cython_sampler_7Sampler_4par_sample(((struct __pyx_obj_10graphsaint_14cython_sampler_Sampler *)__pyx_v_self));
-
-  /* function exit code */
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-static PyObject *__pyx_pf_10graphsaint_14cython_sampler_7Sampler_4par_sample(struct __pyx_obj_10graphsaint_14cython_sampler_Sampler *__pyx_v_self) {
-  int __pyx_v_p;
-  PyObject *__pyx_v_ret = NULL;
-  int __pyx_v__len;
-  PyObject *__pyx_r = NULL;
-  __Pyx_RefNannyDeclarations
-  int __pyx_t_1;
-  int __pyx_t_2;
-  int __pyx_t_3;
-  PyObject *__pyx_t_4 = NULL;
-  PyObject *__pyx_t_5 = NULL;
-  PyObject *__pyx_t_6 = NULL;
-  std::vector<std::vector<int> >  __pyx_t_7;
-  std::vector<std::vector<float> >  __pyx_t_8;
-  int __pyx_lineno = 0;
-  const char *__pyx_filename = NULL;
-  int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("par_sample", 0);
-
-  /* "graphsaint/cython_sampler.pyx":208
- *                                 i-the subgraph edge.
- *         """
- *         cdef int p = 0             # <<<<<<<<<<<<<<
- *         with nogil, parallel(num_threads=self.num_proc):
- *             for p in prange(self.num_proc,schedule='dynamic'):
- */
-  __pyx_v_p = 0;
-
-  /* "graphsaint/cython_sampler.pyx":209
- *         """
- *         cdef int p = 0
- *         with nogil, parallel(num_threads=self.num_proc):             # <<<<<<<<<<<<<<
- *             for p in prange(self.num_proc,schedule='dynamic'):
- *                 self.sample(p)
- */
-  {
-      #ifdef WITH_THREAD
-      PyThreadState *_save;
-      Py_UNBLOCK_THREADS
-      __Pyx_FastGIL_Remember();
-      #endif
-      /*try:*/ {
-        {
-            #if ((defined(__APPLE__) || defined(__OSX__)) && (defined(__GNUC__) && (__GNUC__ > 2 || (__GNUC__ == 2 && (__GNUC_MINOR__ > 95)))))
-                #undef likely
-                #undef unlikely
-                #define likely(x)   (x)
-                #define unlikely(x) (x)
-            #endif
-            #ifdef _OPENMP
-            #pragma omp parallel  private(__pyx_t_1, __pyx_t_2, __pyx_t_3) num_threads(__pyx_v_self->num_proc)
-            #endif /* _OPENMP */
-            {
-
-                /* "graphsaint/cython_sampler.pyx":210
- *         cdef int p = 0
- *         with nogil, parallel(num_threads=self.num_proc):
- *             for p in prange(self.num_proc,schedule='dynamic'):             # <<<<<<<<<<<<<<
- *                 self.sample(p)
- *                 self.adj_extract(p)
- */
-                __pyx_t_1 = __pyx_v_self->num_proc;
-                if ((1 == 0)) abort();
-                {
-                    __pyx_t_3 = (__pyx_t_1 - 0 + 1 - 1/abs(1)) / 1;
-                    if (__pyx_t_3 > 0)
-                    {
-                        #ifdef _OPENMP
-                        #pragma omp for firstprivate(__pyx_v_p) lastprivate(__pyx_v_p) schedule(dynamic)
-                        #endif /* _OPENMP */
-                        for (__pyx_t_2 = 0; __pyx_t_2 < __pyx_t_3; __pyx_t_2++){
-                            {
-                                __pyx_v_p = (int)(0 + 1 * __pyx_t_2);
-
-                                /* "graphsaint/cython_sampler.pyx":211
- *         with nogil, parallel(num_threads=self.num_proc):
- *             for p in prange(self.num_proc,schedule='dynamic'):
- *                 self.sample(p)             # <<<<<<<<<<<<<<
- *                 self.adj_extract(p)
- *         ret = self.get_return()
- */
-                                ((struct __pyx_vtabstruct_10graphsaint_14cython_sampler_Sampler *)__pyx_v_self->__pyx_vtab)->sample(__pyx_v_self, __pyx_v_p);
-
-                                /* "graphsaint/cython_sampler.pyx":212
- *             for p in prange(self.num_proc,schedule='dynamic'):
- *                 self.sample(p)
- *                 self.adj_extract(p)             # <<<<<<<<<<<<<<
- *         ret = self.get_return()
- *         _len = self.num_proc*self.num_sample_per_proc
- */
-                                ((struct __pyx_vtabstruct_10graphsaint_14cython_sampler_Sampler *)__pyx_v_self->__pyx_vtab)->adj_extract(__pyx_v_self, __pyx_v_p);
-                            }
-                        }
-                    }
-                }
-            }
-        }
-        #if ((defined(__APPLE__) || defined(__OSX__)) && (defined(__GNUC__) && (__GNUC__ > 2 || (__GNUC__ == 2 && (__GNUC_MINOR__ > 95)))))
-            #undef likely
-            #undef unlikely
-            #define likely(x)   __builtin_expect(!!(x), 1)
-            #define unlikely(x) __builtin_expect(!!(x), 0)
-        #endif
-      }
-
-      /* "graphsaint/cython_sampler.pyx":209
- *         """
- *         cdef int p = 0
- *         with nogil, parallel(num_threads=self.num_proc):             # <<<<<<<<<<<<<<
- *             for p in prange(self.num_proc,schedule='dynamic'):
- *                 self.sample(p)
- */
-      /*finally:*/ {
-        /*normal exit:*/{
-          #ifdef WITH_THREAD
-          __Pyx_FastGIL_Forget();
-          Py_BLOCK_THREADS
-          #endif
-          goto __pyx_L5;
-        }
-        __pyx_L5:;
-      }
-  }
-
-  /* "graphsaint/cython_sampler.pyx":213
- *                 self.sample(p)
- *                 self.adj_extract(p)
- *         ret = self.get_return()             # <<<<<<<<<<<<<<
- *         _len = self.num_proc*self.num_sample_per_proc
- *         self.node_sampled.swap(vector[vector[int]](_len))
- */
-  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_get_return); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 213, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_5);
-  __pyx_t_6 = NULL;
-  if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_5))) {
-    __pyx_t_6 = PyMethod_GET_SELF(__pyx_t_5);
-    if (likely(__pyx_t_6)) {
-      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_5);
-      __Pyx_INCREF(__pyx_t_6);
-      __Pyx_INCREF(function);
-      __Pyx_DECREF_SET(__pyx_t_5, function);
-    }
-  }
-  __pyx_t_4 = (__pyx_t_6) ? __Pyx_PyObject_CallOneArg(__pyx_t_5, __pyx_t_6) : __Pyx_PyObject_CallNoArg(__pyx_t_5);
-  __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
-  if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 213, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_4);
-  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-  __pyx_v_ret = __pyx_t_4;
-  __pyx_t_4 = 0;
-
-  /* "graphsaint/cython_sampler.pyx":214
- *                 self.adj_extract(p)
- *         ret = self.get_return()
- *         _len = self.num_proc*self.num_sample_per_proc             # <<<<<<<<<<<<<<
- *         self.node_sampled.swap(vector[vector[int]](_len))
- *         self.ret_indptr.swap(vector[vector[int]](_len))
- */
-  __pyx_v__len = (__pyx_v_self->num_proc * __pyx_v_self->num_sample_per_proc);
-
-  /* "graphsaint/cython_sampler.pyx":215
- *         ret = self.get_return()
- *         _len = self.num_proc*self.num_sample_per_proc
- *         self.node_sampled.swap(vector[vector[int]](_len))             # <<<<<<<<<<<<<<
- *         self.ret_indptr.swap(vector[vector[int]](_len))
- *         self.ret_indices.swap(vector[vector[int]](_len))
- */
-  try {
-    __pyx_t_7 = std::vector<std::vector<int> > (__pyx_v__len);
-  } catch(...) {
-    __Pyx_CppExn2PyErr();
-    __PYX_ERR(0, 215, __pyx_L1_error)
-  }
-  __pyx_v_self->node_sampled.swap(__pyx_t_7);
-
-  /* "graphsaint/cython_sampler.pyx":216
- *         _len = self.num_proc*self.num_sample_per_proc
- *         self.node_sampled.swap(vector[vector[int]](_len))
- *         self.ret_indptr.swap(vector[vector[int]](_len))             # <<<<<<<<<<<<<<
- *         self.ret_indices.swap(vector[vector[int]](_len))
- *         self.ret_indices_orig.swap(vector[vector[int]](_len))
- */
-  try {
-    __pyx_t_7 = std::vector<std::vector<int> > (__pyx_v__len);
-  } catch(...) {
-    __Pyx_CppExn2PyErr();
-    __PYX_ERR(0, 216, __pyx_L1_error)
-  }
-  __pyx_v_self->ret_indptr.swap(__pyx_t_7);
-
-  /* "graphsaint/cython_sampler.pyx":217
- *         self.node_sampled.swap(vector[vector[int]](_len))
- *         self.ret_indptr.swap(vector[vector[int]](_len))
- *         self.ret_indices.swap(vector[vector[int]](_len))             # <<<<<<<<<<<<<<
- *         self.ret_indices_orig.swap(vector[vector[int]](_len))
- *         self.ret_data.swap(vector[vector[float]](_len))
- */
-  try {
-    __pyx_t_7 = std::vector<std::vector<int> > (__pyx_v__len);
-  } catch(...) {
-    __Pyx_CppExn2PyErr();
-    __PYX_ERR(0, 217, __pyx_L1_error)
-  }
-  __pyx_v_self->ret_indices.swap(__pyx_t_7);
-
-  /* "graphsaint/cython_sampler.pyx":218
- *         self.ret_indptr.swap(vector[vector[int]](_len))
- *         self.ret_indices.swap(vector[vector[int]](_len))
- *         self.ret_indices_orig.swap(vector[vector[int]](_len))             # <<<<<<<<<<<<<<
- *         self.ret_data.swap(vector[vector[float]](_len))
- *         self.ret_edge_index.swap(vector[vector[int]](_len))
- */
-  try {
-    __pyx_t_7 = std::vector<std::vector<int> > (__pyx_v__len);
-  } catch(...) {
-    __Pyx_CppExn2PyErr();
-    __PYX_ERR(0, 218, __pyx_L1_error)
-  }
-  __pyx_v_self->ret_indices_orig.swap(__pyx_t_7);
-
-  /* "graphsaint/cython_sampler.pyx":219
- *         self.ret_indices.swap(vector[vector[int]](_len))
- *         self.ret_indices_orig.swap(vector[vector[int]](_len))
- *         self.ret_data.swap(vector[vector[float]](_len))             # <<<<<<<<<<<<<<
- *         self.ret_edge_index.swap(vector[vector[int]](_len))
- *         return ret
- */
-  try {
-    __pyx_t_8 = std::vector<std::vector<float> > (__pyx_v__len);
-  } catch(...) {
-    __Pyx_CppExn2PyErr();
-    __PYX_ERR(0, 219, __pyx_L1_error)
-  }
-  __pyx_v_self->ret_data.swap(__pyx_t_8);
-
-  /* "graphsaint/cython_sampler.pyx":220
- *         self.ret_indices_orig.swap(vector[vector[int]](_len))
- *         self.ret_data.swap(vector[vector[float]](_len))
- *         self.ret_edge_index.swap(vector[vector[int]](_len))             # <<<<<<<<<<<<<<
- *         return ret
- * 
- */
-  try {
-    __pyx_t_7 = std::vector<std::vector<int> > (__pyx_v__len);
-  } catch(...) {
-    __Pyx_CppExn2PyErr();
-    __PYX_ERR(0, 220, __pyx_L1_error)
-  }
-  __pyx_v_self->ret_edge_index.swap(__pyx_t_7);
-
-  /* "graphsaint/cython_sampler.pyx":221
- *         self.ret_data.swap(vector[vector[float]](_len))
- *         self.ret_edge_index.swap(vector[vector[int]](_len))
- *         return ret             # <<<<<<<<<<<<<<
- * 
- * 
- */
-  __Pyx_XDECREF(__pyx_r);
-  __Pyx_INCREF(__pyx_v_ret);
-  __pyx_r = __pyx_v_ret;
-  goto __pyx_L0;
-
-  /* "graphsaint/cython_sampler.pyx":183
- *     @cython.boundscheck(False)
- *     @cython.wraparound(False)
- *     def par_sample(self):             # <<<<<<<<<<<<<<
- *         """
- *         The main function for the sampler class. It launches multiple independent samplers
- */
-
-  /* function exit code */
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_4);
-  __Pyx_XDECREF(__pyx_t_5);
-  __Pyx_XDECREF(__pyx_t_6);
-  __Pyx_AddTraceback("graphsaint.cython_sampler.Sampler.par_sample", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __pyx_r = NULL;
-  __pyx_L0:;
-  __Pyx_XDECREF(__pyx_v_ret);
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "(tree fragment)":1
- * def __reduce_cython__(self):             # <<<<<<<<<<<<<<
- *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
- * def __setstate_cython__(self, __pyx_state):
- */
-
-/* Python wrapper */
-static PyObject *__pyx_pw_10graphsaint_14cython_sampler_7Sampler_7__reduce_cython__(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
-static PyObject *__pyx_pw_10graphsaint_14cython_sampler_7Sampler_7__reduce_cython__(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
-  PyObject *__pyx_r = 0;
-  __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("__reduce_cython__ (wrapper)", 0);
-  __pyx_r = __pyx_pf_10graphsaint_14cython_sampler_7Sampler_6__reduce_cython__(((struct __pyx_obj_10graphsaint_14cython_sampler_Sampler *)__pyx_v_self));
-
-  /* function exit code */
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-static PyObject *__pyx_pf_10graphsaint_14cython_sampler_7Sampler_6__reduce_cython__(CYTHON_UNUSED struct __pyx_obj_10graphsaint_14cython_sampler_Sampler *__pyx_v_self) {
-  PyObject *__pyx_r = NULL;
-  __Pyx_RefNannyDeclarations
-  PyObject *__pyx_t_1 = NULL;
-  int __pyx_lineno = 0;
-  const char *__pyx_filename = NULL;
-  int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("__reduce_cython__", 0);
-
-  /* "(tree fragment)":2
- * def __reduce_cython__(self):
- *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")             # <<<<<<<<<<<<<<
- * def __setstate_cython__(self, __pyx_state):
- *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
- */
-  __pyx_t_1 = __Pyx_PyObject_Call(__pyx_builtin_TypeError, __pyx_tuple_, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 2, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __Pyx_Raise(__pyx_t_1, 0, 0, 0);
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __PYX_ERR(1, 2, __pyx_L1_error)
-
-  /* "(tree fragment)":1
- * def __reduce_cython__(self):             # <<<<<<<<<<<<<<
- *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
- * def __setstate_cython__(self, __pyx_state):
- */
-
-  /* function exit code */
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_AddTraceback("graphsaint.cython_sampler.Sampler.__reduce_cython__", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __pyx_r = NULL;
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "(tree fragment)":3
- * def __reduce_cython__(self):
- *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
- * def __setstate_cython__(self, __pyx_state):             # <<<<<<<<<<<<<<
- *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
- */
-
-/* Python wrapper */
-static PyObject *__pyx_pw_10graphsaint_14cython_sampler_7Sampler_9__setstate_cython__(PyObject *__pyx_v_self, PyObject *__pyx_v___pyx_state); /*proto*/
-static PyObject *__pyx_pw_10graphsaint_14cython_sampler_7Sampler_9__setstate_cython__(PyObject *__pyx_v_self, PyObject *__pyx_v___pyx_state) {
-  PyObject *__pyx_r = 0;
-  __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("__setstate_cython__ (wrapper)", 0);
-  __pyx_r = __pyx_pf_10graphsaint_14cython_sampler_7Sampler_8__setstate_cython__(((struct __pyx_obj_10graphsaint_14cython_sampler_Sampler *)__pyx_v_self), ((PyObject *)__pyx_v___pyx_state));
-
-  /* function exit code */
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-static PyObject *__pyx_pf_10graphsaint_14cython_sampler_7Sampler_8__setstate_cython__(CYTHON_UNUSED struct __pyx_obj_10graphsaint_14cython_sampler_Sampler *__pyx_v_self, CYTHON_UNUSED PyObject *__pyx_v___pyx_state) {
-  PyObject *__pyx_r = NULL;
-  __Pyx_RefNannyDeclarations
-  PyObject *__pyx_t_1 = NULL;
-  int __pyx_lineno = 0;
-  const char *__pyx_filename = NULL;
-  int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("__setstate_cython__", 0);
-
-  /* "(tree fragment)":4
- *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
- * def __setstate_cython__(self, __pyx_state):
- *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")             # <<<<<<<<<<<<<<
- */
-  __pyx_t_1 = __Pyx_PyObject_Call(__pyx_builtin_TypeError, __pyx_tuple__2, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 4, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __Pyx_Raise(__pyx_t_1, 0, 0, 0);
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __PYX_ERR(1, 4, __pyx_L1_error)
-
-  /* "(tree fragment)":3
- * def __reduce_cython__(self):
- *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
- * def __setstate_cython__(self, __pyx_state):             # <<<<<<<<<<<<<<
- *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
- */
-
-  /* function exit code */
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_AddTraceback("graphsaint.cython_sampler.Sampler.__setstate_cython__", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __pyx_r = NULL;
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "graphsaint/cython_sampler.pyx":230
- *     cdef int avg_deg
- *     cdef vector[int] arr_deg_vec
- *     def __cinit__(self, np.ndarray[int,ndim=1,mode='c'] adj_indptr,             # <<<<<<<<<<<<<<
- *                         np.ndarray[int,ndim=1,mode='c'] adj_indices,
- *                         np.ndarray[int,ndim=1,mode='c'] node_train,
- */
-
-/* Python wrapper */
-static int __pyx_pw_10graphsaint_14cython_sampler_3MRW_1__cinit__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static int __pyx_pw_10graphsaint_14cython_sampler_3MRW_1__cinit__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
-  CYTHON_UNUSED PyArrayObject *__pyx_v_adj_indptr = 0;
-  CYTHON_UNUSED PyArrayObject *__pyx_v_adj_indices = 0;
-  CYTHON_UNUSED PyArrayObject *__pyx_v_node_train = 0;
-  CYTHON_UNUSED int __pyx_v_num_proc;
-  CYTHON_UNUSED int __pyx_v_num_sample_per_proc;
-  PyArrayObject *__pyx_v_p_dist = 0;
-  int __pyx_v_max_deg;
-  int __pyx_v_size_frontier;
-  int __pyx_v_size_subg;
-  int __pyx_lineno = 0;
-  const char *__pyx_filename = NULL;
-  int __pyx_clineno = 0;
-  int __pyx_r;
-  __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("__cinit__ (wrapper)", 0);
-  {
-    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_adj_indptr,&__pyx_n_s_adj_indices,&__pyx_n_s_node_train,&__pyx_n_s_num_proc,&__pyx_n_s_num_sample_per_proc,&__pyx_n_s_p_dist,&__pyx_n_s_max_deg,&__pyx_n_s_size_frontier,&__pyx_n_s_size_subg,0};
-    PyObject* values[9] = {0,0,0,0,0,0,0,0,0};
-    if (unlikely(__pyx_kwds)) {
-      Py_ssize_t kw_args;
-      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
-      switch (pos_args) {
-        case  9: values[8] = PyTuple_GET_ITEM(__pyx_args, 8);
-        CYTHON_FALLTHROUGH;
-        case  8: values[7] = PyTuple_GET_ITEM(__pyx_args, 7);
-        CYTHON_FALLTHROUGH;
-        case  7: values[6] = PyTuple_GET_ITEM(__pyx_args, 6);
-        CYTHON_FALLTHROUGH;
-        case  6: values[5] = PyTuple_GET_ITEM(__pyx_args, 5);
-        CYTHON_FALLTHROUGH;
-        case  5: values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
-        CYTHON_FALLTHROUGH;
-        case  4: values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
-        CYTHON_FALLTHROUGH;
-        case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
-        CYTHON_FALLTHROUGH;
-        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
-        CYTHON_FALLTHROUGH;
-        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
-        CYTHON_FALLTHROUGH;
-        case  0: break;
-        default: goto __pyx_L5_argtuple_error;
-      }
-      kw_args = PyDict_Size(__pyx_kwds);
-      switch (pos_args) {
-        case  0:
-        if (likely((values[0] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_adj_indptr)) != 0)) kw_args--;
-        else goto __pyx_L5_argtuple_error;
-        CYTHON_FALLTHROUGH;
-        case  1:
-        if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_adj_indices)) != 0)) kw_args--;
-        else {
-          __Pyx_RaiseArgtupleInvalid("__cinit__", 1, 9, 9, 1); __PYX_ERR(0, 230, __pyx_L3_error)
-        }
-        CYTHON_FALLTHROUGH;
-        case  2:
-        if (likely((values[2] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_node_train)) != 0)) kw_args--;
-        else {
-          __Pyx_RaiseArgtupleInvalid("__cinit__", 1, 9, 9, 2); __PYX_ERR(0, 230, __pyx_L3_error)
-        }
-        CYTHON_FALLTHROUGH;
-        case  3:
-        if (likely((values[3] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_num_proc)) != 0)) kw_args--;
-        else {
-          __Pyx_RaiseArgtupleInvalid("__cinit__", 1, 9, 9, 3); __PYX_ERR(0, 230, __pyx_L3_error)
-        }
-        CYTHON_FALLTHROUGH;
-        case  4:
-        if (likely((values[4] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_num_sample_per_proc)) != 0)) kw_args--;
-        else {
-          __Pyx_RaiseArgtupleInvalid("__cinit__", 1, 9, 9, 4); __PYX_ERR(0, 230, __pyx_L3_error)
-        }
-        CYTHON_FALLTHROUGH;
-        case  5:
-        if (likely((values[5] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_p_dist)) != 0)) kw_args--;
-        else {
-          __Pyx_RaiseArgtupleInvalid("__cinit__", 1, 9, 9, 5); __PYX_ERR(0, 230, __pyx_L3_error)
-        }
-        CYTHON_FALLTHROUGH;
-        case  6:
-        if (likely((values[6] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_max_deg)) != 0)) kw_args--;
-        else {
-          __Pyx_RaiseArgtupleInvalid("__cinit__", 1, 9, 9, 6); __PYX_ERR(0, 230, __pyx_L3_error)
-        }
-        CYTHON_FALLTHROUGH;
-        case  7:
-        if (likely((values[7] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_size_frontier)) != 0)) kw_args--;
-        else {
-          __Pyx_RaiseArgtupleInvalid("__cinit__", 1, 9, 9, 7); __PYX_ERR(0, 230, __pyx_L3_error)
-        }
-        CYTHON_FALLTHROUGH;
-        case  8:
-        if (likely((values[8] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_size_subg)) != 0)) kw_args--;
-        else {
-          __Pyx_RaiseArgtupleInvalid("__cinit__", 1, 9, 9, 8); __PYX_ERR(0, 230, __pyx_L3_error)
-        }
-      }
-      if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "__cinit__") < 0)) __PYX_ERR(0, 230, __pyx_L3_error)
-      }
-    } else if (PyTuple_GET_SIZE(__pyx_args) != 9) {
-      goto __pyx_L5_argtuple_error;
-    } else {
-      values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
-      values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
-      values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
-      values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
-      values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
-      values[5] = PyTuple_GET_ITEM(__pyx_args, 5);
-      values[6] = PyTuple_GET_ITEM(__pyx_args, 6);
-      values[7] = PyTuple_GET_ITEM(__pyx_args, 7);
-      values[8] = PyTuple_GET_ITEM(__pyx_args, 8);
-    }
-    __pyx_v_adj_indptr = ((PyArrayObject *)values[0]);
-    __pyx_v_adj_indices = ((PyArrayObject *)values[1]);
-    __pyx_v_node_train = ((PyArrayObject *)values[2]);
-    __pyx_v_num_proc = __Pyx_PyInt_As_int(values[3]); if (unlikely((__pyx_v_num_proc == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 233, __pyx_L3_error)
-    __pyx_v_num_sample_per_proc = __Pyx_PyInt_As_int(values[4]); if (unlikely((__pyx_v_num_sample_per_proc == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 233, __pyx_L3_error)
-    __pyx_v_p_dist = ((PyArrayObject *)values[5]);
-    __pyx_v_max_deg = __Pyx_PyInt_As_int(values[6]); if (unlikely((__pyx_v_max_deg == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 235, __pyx_L3_error)
-    __pyx_v_size_frontier = __Pyx_PyInt_As_int(values[7]); if (unlikely((__pyx_v_size_frontier == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 235, __pyx_L3_error)
-    __pyx_v_size_subg = __Pyx_PyInt_As_int(values[8]); if (unlikely((__pyx_v_size_subg == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 235, __pyx_L3_error)
-  }
-  goto __pyx_L4_argument_unpacking_done;
-  __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("__cinit__", 1, 9, 9, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 230, __pyx_L3_error)
-  __pyx_L3_error:;
-  __Pyx_AddTraceback("graphsaint.cython_sampler.MRW.__cinit__", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __Pyx_RefNannyFinishContext();
-  return -1;
-  __pyx_L4_argument_unpacking_done:;
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_adj_indptr), __pyx_ptype_5numpy_ndarray, 1, "adj_indptr", 0))) __PYX_ERR(0, 230, __pyx_L1_error)
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_adj_indices), __pyx_ptype_5numpy_ndarray, 1, "adj_indices", 0))) __PYX_ERR(0, 231, __pyx_L1_error)
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_node_train), __pyx_ptype_5numpy_ndarray, 1, "node_train", 0))) __PYX_ERR(0, 232, __pyx_L1_error)
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_p_dist), __pyx_ptype_5numpy_ndarray, 1, "p_dist", 0))) __PYX_ERR(0, 234, __pyx_L1_error)
-  __pyx_r = __pyx_pf_10graphsaint_14cython_sampler_3MRW___cinit__(((struct __pyx_obj_10graphsaint_14cython_sampler_MRW *)__pyx_v_self), __pyx_v_adj_indptr, __pyx_v_adj_indices, __pyx_v_node_train, __pyx_v_num_proc, __pyx_v_num_sample_per_proc, __pyx_v_p_dist, __pyx_v_max_deg, __pyx_v_size_frontier, __pyx_v_size_subg);
-
-  /* function exit code */
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __pyx_r = -1;
-  __pyx_L0:;
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-static int __pyx_pf_10graphsaint_14cython_sampler_3MRW___cinit__(struct __pyx_obj_10graphsaint_14cython_sampler_MRW *__pyx_v_self, CYTHON_UNUSED PyArrayObject *__pyx_v_adj_indptr, CYTHON_UNUSED PyArrayObject *__pyx_v_adj_indices, CYTHON_UNUSED PyArrayObject *__pyx_v_node_train, CYTHON_UNUSED int __pyx_v_num_proc, CYTHON_UNUSED int __pyx_v_num_sample_per_proc, PyArrayObject *__pyx_v_p_dist, int __pyx_v_max_deg, int __pyx_v_size_frontier, int __pyx_v_size_subg) {
-  PyObject *__pyx_v__arr_deg = NULL;
-  __Pyx_LocalBuf_ND __pyx_pybuffernd_adj_indices;
-  __Pyx_Buffer __pyx_pybuffer_adj_indices;
-  __Pyx_LocalBuf_ND __pyx_pybuffernd_adj_indptr;
-  __Pyx_Buffer __pyx_pybuffer_adj_indptr;
-  __Pyx_LocalBuf_ND __pyx_pybuffernd_node_train;
-  __Pyx_Buffer __pyx_pybuffer_node_train;
-  __Pyx_LocalBuf_ND __pyx_pybuffernd_p_dist;
-  __Pyx_Buffer __pyx_pybuffer_p_dist;
-  int __pyx_r;
-  __Pyx_RefNannyDeclarations
-  PyObject *__pyx_t_1 = NULL;
-  PyObject *__pyx_t_2 = NULL;
-  PyObject *__pyx_t_3 = NULL;
-  PyObject *__pyx_t_4 = NULL;
-  int __pyx_t_5;
-  PyObject *__pyx_t_6 = NULL;
-  int __pyx_lineno = 0;
-  const char *__pyx_filename = NULL;
-  int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("__cinit__", 0);
-  __pyx_pybuffer_adj_indptr.pybuffer.buf = NULL;
-  __pyx_pybuffer_adj_indptr.refcount = 0;
-  __pyx_pybuffernd_adj_indptr.data = NULL;
-  __pyx_pybuffernd_adj_indptr.rcbuffer = &__pyx_pybuffer_adj_indptr;
-  __pyx_pybuffer_adj_indices.pybuffer.buf = NULL;
-  __pyx_pybuffer_adj_indices.refcount = 0;
-  __pyx_pybuffernd_adj_indices.data = NULL;
-  __pyx_pybuffernd_adj_indices.rcbuffer = &__pyx_pybuffer_adj_indices;
-  __pyx_pybuffer_node_train.pybuffer.buf = NULL;
-  __pyx_pybuffer_node_train.refcount = 0;
-  __pyx_pybuffernd_node_train.data = NULL;
-  __pyx_pybuffernd_node_train.rcbuffer = &__pyx_pybuffer_node_train;
-  __pyx_pybuffer_p_dist.pybuffer.buf = NULL;
-  __pyx_pybuffer_p_dist.refcount = 0;
-  __pyx_pybuffernd_p_dist.data = NULL;
-  __pyx_pybuffernd_p_dist.rcbuffer = &__pyx_pybuffer_p_dist;
-  {
-    __Pyx_BufFmt_StackElem __pyx_stack[1];
-    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_adj_indptr.rcbuffer->pybuffer, (PyObject*)__pyx_v_adj_indptr, &__Pyx_TypeInfo_int, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 230, __pyx_L1_error)
-  }
-  __pyx_pybuffernd_adj_indptr.diminfo[0].strides = __pyx_pybuffernd_adj_indptr.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_adj_indptr.diminfo[0].shape = __pyx_pybuffernd_adj_indptr.rcbuffer->pybuffer.shape[0];
-  {
-    __Pyx_BufFmt_StackElem __pyx_stack[1];
-    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_adj_indices.rcbuffer->pybuffer, (PyObject*)__pyx_v_adj_indices, &__Pyx_TypeInfo_int, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 230, __pyx_L1_error)
-  }
-  __pyx_pybuffernd_adj_indices.diminfo[0].strides = __pyx_pybuffernd_adj_indices.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_adj_indices.diminfo[0].shape = __pyx_pybuffernd_adj_indices.rcbuffer->pybuffer.shape[0];
-  {
-    __Pyx_BufFmt_StackElem __pyx_stack[1];
-    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_node_train.rcbuffer->pybuffer, (PyObject*)__pyx_v_node_train, &__Pyx_TypeInfo_int, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 230, __pyx_L1_error)
-  }
-  __pyx_pybuffernd_node_train.diminfo[0].strides = __pyx_pybuffernd_node_train.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_node_train.diminfo[0].shape = __pyx_pybuffernd_node_train.rcbuffer->pybuffer.shape[0];
-  {
-    __Pyx_BufFmt_StackElem __pyx_stack[1];
-    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_p_dist.rcbuffer->pybuffer, (PyObject*)__pyx_v_p_dist, &__Pyx_TypeInfo_int, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 230, __pyx_L1_error)
-  }
-  __pyx_pybuffernd_p_dist.diminfo[0].strides = __pyx_pybuffernd_p_dist.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_p_dist.diminfo[0].shape = __pyx_pybuffernd_p_dist.rcbuffer->pybuffer.shape[0];
-
-  /* "graphsaint/cython_sampler.pyx":236
- *                         np.ndarray[int,ndim=1,mode='c'] p_dist,
- *                         int max_deg, int size_frontier, int size_subg):
- *         self.size_frontier = size_frontier             # <<<<<<<<<<<<<<
- *         self.size_subg = size_subg
- *         _arr_deg = np.clip(p_dist,0,max_deg)
- */
-  __pyx_v_self->size_frontier = __pyx_v_size_frontier;
-
-  /* "graphsaint/cython_sampler.pyx":237
- *                         int max_deg, int size_frontier, int size_subg):
- *         self.size_frontier = size_frontier
- *         self.size_subg = size_subg             # <<<<<<<<<<<<<<
- *         _arr_deg = np.clip(p_dist,0,max_deg)
- *         cutils.npy2vec_int(_arr_deg,self.arr_deg_vec)
- */
-  __pyx_v_self->size_subg = __pyx_v_size_subg;
-
-  /* "graphsaint/cython_sampler.pyx":238
- *         self.size_frontier = size_frontier
- *         self.size_subg = size_subg
- *         _arr_deg = np.clip(p_dist,0,max_deg)             # <<<<<<<<<<<<<<
- *         cutils.npy2vec_int(_arr_deg,self.arr_deg_vec)
- *         self.avg_deg = _arr_deg.mean()
- */
-  __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_np); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 238, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_n_s_clip); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 238, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_3);
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __pyx_t_2 = __Pyx_PyInt_From_int(__pyx_v_max_deg); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 238, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_4 = NULL;
-  __pyx_t_5 = 0;
-  if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_3))) {
-    __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
-    if (likely(__pyx_t_4)) {
-      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
-      __Pyx_INCREF(__pyx_t_4);
-      __Pyx_INCREF(function);
-      __Pyx_DECREF_SET(__pyx_t_3, function);
-      __pyx_t_5 = 1;
-    }
-  }
-  #if CYTHON_FAST_PYCALL
-  if (PyFunction_Check(__pyx_t_3)) {
-    PyObject *__pyx_temp[4] = {__pyx_t_4, ((PyObject *)__pyx_v_p_dist), __pyx_int_0, __pyx_t_2};
-    __pyx_t_1 = __Pyx_PyFunction_FastCall(__pyx_t_3, __pyx_temp+1-__pyx_t_5, 3+__pyx_t_5); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 238, __pyx_L1_error)
-    __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
-    __Pyx_GOTREF(__pyx_t_1);
-    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  } else
-  #endif
-  #if CYTHON_FAST_PYCCALL
-  if (__Pyx_PyFastCFunction_Check(__pyx_t_3)) {
-    PyObject *__pyx_temp[4] = {__pyx_t_4, ((PyObject *)__pyx_v_p_dist), __pyx_int_0, __pyx_t_2};
-    __pyx_t_1 = __Pyx_PyCFunction_FastCall(__pyx_t_3, __pyx_temp+1-__pyx_t_5, 3+__pyx_t_5); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 238, __pyx_L1_error)
-    __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
-    __Pyx_GOTREF(__pyx_t_1);
-    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  } else
-  #endif
-  {
-    __pyx_t_6 = PyTuple_New(3+__pyx_t_5); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 238, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_6);
-    if (__pyx_t_4) {
-      __Pyx_GIVEREF(__pyx_t_4); PyTuple_SET_ITEM(__pyx_t_6, 0, __pyx_t_4); __pyx_t_4 = NULL;
-    }
-    __Pyx_INCREF(((PyObject *)__pyx_v_p_dist));
-    __Pyx_GIVEREF(((PyObject *)__pyx_v_p_dist));
-    PyTuple_SET_ITEM(__pyx_t_6, 0+__pyx_t_5, ((PyObject *)__pyx_v_p_dist));
-    __Pyx_INCREF(__pyx_int_0);
-    __Pyx_GIVEREF(__pyx_int_0);
-    PyTuple_SET_ITEM(__pyx_t_6, 1+__pyx_t_5, __pyx_int_0);
-    __Pyx_GIVEREF(__pyx_t_2);
-    PyTuple_SET_ITEM(__pyx_t_6, 2+__pyx_t_5, __pyx_t_2);
-    __pyx_t_2 = 0;
-    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_t_6, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 238, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_1);
-    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-  }
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  __pyx_v__arr_deg = __pyx_t_1;
-  __pyx_t_1 = 0;
-
-  /* "graphsaint/cython_sampler.pyx":239
- *         self.size_subg = size_subg
- *         _arr_deg = np.clip(p_dist,0,max_deg)
- *         cutils.npy2vec_int(_arr_deg,self.arr_deg_vec)             # <<<<<<<<<<<<<<
- *         self.avg_deg = _arr_deg.mean()
- * 
- */
-  if (!(likely(((__pyx_v__arr_deg) == Py_None) || likely(__Pyx_TypeTest(__pyx_v__arr_deg, __pyx_ptype_5numpy_ndarray))))) __PYX_ERR(0, 239, __pyx_L1_error)
-  __pyx_f_10graphsaint_12cython_utils_npy2vec_int(((PyArrayObject *)__pyx_v__arr_deg), __pyx_v_self->arr_deg_vec);
-
-  /* "graphsaint/cython_sampler.pyx":240
- *         _arr_deg = np.clip(p_dist,0,max_deg)
- *         cutils.npy2vec_int(_arr_deg,self.arr_deg_vec)
- *         self.avg_deg = _arr_deg.mean()             # <<<<<<<<<<<<<<
- * 
- *     cdef void sample(self, int p) nogil:
- */
-  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_v__arr_deg, __pyx_n_s_mean); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 240, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_3);
-  __pyx_t_6 = NULL;
-  if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_3))) {
-    __pyx_t_6 = PyMethod_GET_SELF(__pyx_t_3);
-    if (likely(__pyx_t_6)) {
-      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
-      __Pyx_INCREF(__pyx_t_6);
-      __Pyx_INCREF(function);
-      __Pyx_DECREF_SET(__pyx_t_3, function);
-    }
-  }
-  __pyx_t_1 = (__pyx_t_6) ? __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_t_6) : __Pyx_PyObject_CallNoArg(__pyx_t_3);
-  __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
-  if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 240, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  __pyx_t_5 = __Pyx_PyInt_As_int(__pyx_t_1); if (unlikely((__pyx_t_5 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 240, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __pyx_v_self->avg_deg = __pyx_t_5;
-
-  /* "graphsaint/cython_sampler.pyx":230
- *     cdef int avg_deg
- *     cdef vector[int] arr_deg_vec
- *     def __cinit__(self, np.ndarray[int,ndim=1,mode='c'] adj_indptr,             # <<<<<<<<<<<<<<
- *                         np.ndarray[int,ndim=1,mode='c'] adj_indices,
- *                         np.ndarray[int,ndim=1,mode='c'] node_train,
- */
-
-  /* function exit code */
-  __pyx_r = 0;
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_XDECREF(__pyx_t_2);
-  __Pyx_XDECREF(__pyx_t_3);
-  __Pyx_XDECREF(__pyx_t_4);
-  __Pyx_XDECREF(__pyx_t_6);
-  { PyObject *__pyx_type, *__pyx_value, *__pyx_tb;
-    __Pyx_PyThreadState_declare
-    __Pyx_PyThreadState_assign
-    __Pyx_ErrFetch(&__pyx_type, &__pyx_value, &__pyx_tb);
-    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_adj_indices.rcbuffer->pybuffer);
-    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_adj_indptr.rcbuffer->pybuffer);
-    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_node_train.rcbuffer->pybuffer);
-    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_p_dist.rcbuffer->pybuffer);
-  __Pyx_ErrRestore(__pyx_type, __pyx_value, __pyx_tb);}
-  __Pyx_AddTraceback("graphsaint.cython_sampler.MRW.__cinit__", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __pyx_r = -1;
-  goto __pyx_L2;
-  __pyx_L0:;
-  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_adj_indices.rcbuffer->pybuffer);
-  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_adj_indptr.rcbuffer->pybuffer);
-  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_node_train.rcbuffer->pybuffer);
-  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_p_dist.rcbuffer->pybuffer);
-  __pyx_L2:;
-  __Pyx_XDECREF(__pyx_v__arr_deg);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "graphsaint/cython_sampler.pyx":242
- *         self.avg_deg = _arr_deg.mean()
- * 
- *     cdef void sample(self, int p) nogil:             # <<<<<<<<<<<<<<
- *         cdef vector[int] frontier
- *         cdef int i = 0
- */
-
-static void __pyx_f_10graphsaint_14cython_sampler_3MRW_sample(struct __pyx_obj_10graphsaint_14cython_sampler_MRW *__pyx_v_self, int __pyx_v_p) {
-  std::vector<int>  __pyx_v_frontier;
-  int __pyx_v_i;
-  int __pyx_v_num_train_node;
-  int __pyx_v_r;
-  int __pyx_v_alpha;
-  std::vector<int>  __pyx_v_arr_ind0;
-  std::vector<int>  __pyx_v_arr_ind1;
-  std::vector<int> ::iterator __pyx_v_it;
-  int __pyx_v_c;
-  int __pyx_v_cnt;
-  int __pyx_v_j;
-  int __pyx_v_k;
-  int __pyx_v_v;
-  int __pyx_v_vidx;
-  int __pyx_v_vpop;
-  int __pyx_v_offset;
-  int __pyx_v_vnext;
-  int __pyx_v_idx_begin;
-  int __pyx_v_idx_end;
-  int __pyx_v_num_neighs_pop;
-  int __pyx_v_num_neighs_next;
-  int __pyx_t_1;
-  int __pyx_t_2;
-  std::vector<int> ::size_type __pyx_t_3;
-  int __pyx_lineno = 0;
-  const char *__pyx_filename = NULL;
-  int __pyx_clineno = 0;
-
-  /* "graphsaint/cython_sampler.pyx":244
- *     cdef void sample(self, int p) nogil:
- *         cdef vector[int] frontier
- *         cdef int i = 0             # <<<<<<<<<<<<<<
- *         cdef int num_train_node = self.node_train_vec.size()
- *         cdef int r = 0
- */
-  __pyx_v_i = 0;
-
-  /* "graphsaint/cython_sampler.pyx":245
- *         cdef vector[int] frontier
- *         cdef int i = 0
- *         cdef int num_train_node = self.node_train_vec.size()             # <<<<<<<<<<<<<<
- *         cdef int r = 0
- *         cdef int alpha = 2
- */
-  __pyx_v_num_train_node = __pyx_v_self->__pyx_base.node_train_vec.size();
-
-  /* "graphsaint/cython_sampler.pyx":246
- *         cdef int i = 0
- *         cdef int num_train_node = self.node_train_vec.size()
- *         cdef int r = 0             # <<<<<<<<<<<<<<
- *         cdef int alpha = 2
- *         cdef vector[int] arr_ind0
- */
-  __pyx_v_r = 0;
-
-  /* "graphsaint/cython_sampler.pyx":247
- *         cdef int num_train_node = self.node_train_vec.size()
- *         cdef int r = 0
- *         cdef int alpha = 2             # <<<<<<<<<<<<<<
- *         cdef vector[int] arr_ind0
- *         cdef vector[int] arr_ind1
- */
-  __pyx_v_alpha = 2;
-
-  /* "graphsaint/cython_sampler.pyx":251
- *         cdef vector[int] arr_ind1
- *         cdef vector[int].iterator it
- *         arr_ind0.reserve(alpha*self.avg_deg)             # <<<<<<<<<<<<<<
- *         arr_ind1.reserve(alpha*self.avg_deg)
- *         cdef int c, cnt, j, k
- */
-  __pyx_v_arr_ind0.reserve((__pyx_v_alpha * __pyx_v_self->avg_deg));
-
-  /* "graphsaint/cython_sampler.pyx":252
- *         cdef vector[int].iterator it
- *         arr_ind0.reserve(alpha*self.avg_deg)
- *         arr_ind1.reserve(alpha*self.avg_deg)             # <<<<<<<<<<<<<<
- *         cdef int c, cnt, j, k
- *         cdef int v, vidx, vpop, vneigh, offset, vnext
- */
-  __pyx_v_arr_ind1.reserve((__pyx_v_alpha * __pyx_v_self->avg_deg));
-
-  /* "graphsaint/cython_sampler.pyx":257
- *         cdef int idx_begin, idx_end
- *         cdef int num_neighs_pop, num_neighs_next
- *         while r < self.num_sample_per_proc:             # <<<<<<<<<<<<<<
- *             # prepare initial frontier
- *             arr_ind0.clear()
- */
-  while (1) {
-    __pyx_t_1 = ((__pyx_v_r < __pyx_v_self->__pyx_base.num_sample_per_proc) != 0);
-    if (!__pyx_t_1) break;
-
-    /* "graphsaint/cython_sampler.pyx":259
- *         while r < self.num_sample_per_proc:
- *             # prepare initial frontier
- *             arr_ind0.clear()             # <<<<<<<<<<<<<<
- *             arr_ind1.clear()
- *             frontier.clear()
- */
-    __pyx_v_arr_ind0.clear();
-
-    /* "graphsaint/cython_sampler.pyx":260
- *             # prepare initial frontier
- *             arr_ind0.clear()
- *             arr_ind1.clear()             # <<<<<<<<<<<<<<
- *             frontier.clear()
- *             i = 0
- */
-    __pyx_v_arr_ind1.clear();
-
-    /* "graphsaint/cython_sampler.pyx":261
- *             arr_ind0.clear()
- *             arr_ind1.clear()
- *             frontier.clear()             # <<<<<<<<<<<<<<
- *             i = 0
- *             while i < self.size_frontier:        # NB: here we don't care if a node appear twice
- */
-    __pyx_v_frontier.clear();
-
-    /* "graphsaint/cython_sampler.pyx":262
- *             arr_ind1.clear()
- *             frontier.clear()
- *             i = 0             # <<<<<<<<<<<<<<
- *             while i < self.size_frontier:        # NB: here we don't care if a node appear twice
- *                 frontier.push_back(self.node_train_vec[rand()%num_train_node])
- */
-    __pyx_v_i = 0;
-
-    /* "graphsaint/cython_sampler.pyx":263
- *             frontier.clear()
- *             i = 0
- *             while i < self.size_frontier:        # NB: here we don't care if a node appear twice             # <<<<<<<<<<<<<<
- *                 frontier.push_back(self.node_train_vec[rand()%num_train_node])
- *                 i = i + 1
- */
-    while (1) {
-      __pyx_t_1 = ((__pyx_v_i < __pyx_v_self->size_frontier) != 0);
-      if (!__pyx_t_1) break;
-
-      /* "graphsaint/cython_sampler.pyx":264
- *             i = 0
- *             while i < self.size_frontier:        # NB: here we don't care if a node appear twice
- *                 frontier.push_back(self.node_train_vec[rand()%num_train_node])             # <<<<<<<<<<<<<<
- *                 i = i + 1
- *             # init indicator array
- */
-      __pyx_t_2 = rand();
-      if (unlikely(__pyx_v_num_train_node == 0)) {
-        #ifdef WITH_THREAD
-        PyGILState_STATE __pyx_gilstate_save = __Pyx_PyGILState_Ensure();
-        #endif
-        PyErr_SetString(PyExc_ZeroDivisionError, "integer division or modulo by zero");
-        #ifdef WITH_THREAD
-        __Pyx_PyGILState_Release(__pyx_gilstate_save);
-        #endif
-        __PYX_ERR(0, 264, __pyx_L1_error)
-      }
-      try {
-        __pyx_v_frontier.push_back((__pyx_v_self->__pyx_base.node_train_vec[__Pyx_mod_int(__pyx_t_2, __pyx_v_num_train_node)]));
-      } catch(...) {
-        #ifdef WITH_THREAD
-        PyGILState_STATE __pyx_gilstate_save = __Pyx_PyGILState_Ensure();
-        #endif
-        __Pyx_CppExn2PyErr();
-        #ifdef WITH_THREAD
-        __Pyx_PyGILState_Release(__pyx_gilstate_save);
-        #endif
-        __PYX_ERR(0, 264, __pyx_L1_error)
-      }
-
-      /* "graphsaint/cython_sampler.pyx":265
- *             while i < self.size_frontier:        # NB: here we don't care if a node appear twice
- *                 frontier.push_back(self.node_train_vec[rand()%num_train_node])
- *                 i = i + 1             # <<<<<<<<<<<<<<
- *             # init indicator array
- *             it = frontier.begin()
- */
-      __pyx_v_i = (__pyx_v_i + 1);
-    }
-
-    /* "graphsaint/cython_sampler.pyx":267
- *                 i = i + 1
- *             # init indicator array
- *             it = frontier.begin()             # <<<<<<<<<<<<<<
- *             while it != frontier.end():
- *                 v = deref(it)
- */
-    __pyx_v_it = __pyx_v_frontier.begin();
-
-    /* "graphsaint/cython_sampler.pyx":268
- *             # init indicator array
- *             it = frontier.begin()
- *             while it != frontier.end():             # <<<<<<<<<<<<<<
- *                 v = deref(it)
- *                 cnt = arr_ind0.size()
- */
-    while (1) {
-      __pyx_t_1 = ((__pyx_v_it != __pyx_v_frontier.end()) != 0);
-      if (!__pyx_t_1) break;
-
-      /* "graphsaint/cython_sampler.pyx":269
- *             it = frontier.begin()
- *             while it != frontier.end():
- *                 v = deref(it)             # <<<<<<<<<<<<<<
- *                 cnt = arr_ind0.size()
- *                 c = cnt
- */
-      __pyx_v_v = (*__pyx_v_it);
-
-      /* "graphsaint/cython_sampler.pyx":270
- *             while it != frontier.end():
- *                 v = deref(it)
- *                 cnt = arr_ind0.size()             # <<<<<<<<<<<<<<
- *                 c = cnt
- *                 while c < cnt + self.arr_deg_vec[v]:
- */
-      __pyx_v_cnt = __pyx_v_arr_ind0.size();
-
-      /* "graphsaint/cython_sampler.pyx":271
- *                 v = deref(it)
- *                 cnt = arr_ind0.size()
- *                 c = cnt             # <<<<<<<<<<<<<<
- *                 while c < cnt + self.arr_deg_vec[v]:
- *                     arr_ind0.push_back(v)
- */
-      __pyx_v_c = __pyx_v_cnt;
-
-      /* "graphsaint/cython_sampler.pyx":272
- *                 cnt = arr_ind0.size()
- *                 c = cnt
- *                 while c < cnt + self.arr_deg_vec[v]:             # <<<<<<<<<<<<<<
- *                     arr_ind0.push_back(v)
- *                     arr_ind1.push_back(c-cnt)
- */
-      while (1) {
-        __pyx_t_1 = ((__pyx_v_c < (__pyx_v_cnt + (__pyx_v_self->arr_deg_vec[__pyx_v_v]))) != 0);
-        if (!__pyx_t_1) break;
-
-        /* "graphsaint/cython_sampler.pyx":273
- *                 c = cnt
- *                 while c < cnt + self.arr_deg_vec[v]:
- *                     arr_ind0.push_back(v)             # <<<<<<<<<<<<<<
- *                     arr_ind1.push_back(c-cnt)
- *                     c = c + 1
- */
-        try {
-          __pyx_v_arr_ind0.push_back(__pyx_v_v);
-        } catch(...) {
-          #ifdef WITH_THREAD
-          PyGILState_STATE __pyx_gilstate_save = __Pyx_PyGILState_Ensure();
-          #endif
-          __Pyx_CppExn2PyErr();
-          #ifdef WITH_THREAD
-          __Pyx_PyGILState_Release(__pyx_gilstate_save);
-          #endif
-          __PYX_ERR(0, 273, __pyx_L1_error)
-        }
-
-        /* "graphsaint/cython_sampler.pyx":274
- *                 while c < cnt + self.arr_deg_vec[v]:
- *                     arr_ind0.push_back(v)
- *                     arr_ind1.push_back(c-cnt)             # <<<<<<<<<<<<<<
- *                     c = c + 1
- *                 arr_ind1[cnt] = -self.arr_deg_vec[v]
- */
-        try {
-          __pyx_v_arr_ind1.push_back((__pyx_v_c - __pyx_v_cnt));
-        } catch(...) {
-          #ifdef WITH_THREAD
-          PyGILState_STATE __pyx_gilstate_save = __Pyx_PyGILState_Ensure();
-          #endif
-          __Pyx_CppExn2PyErr();
-          #ifdef WITH_THREAD
-          __Pyx_PyGILState_Release(__pyx_gilstate_save);
-          #endif
-          __PYX_ERR(0, 274, __pyx_L1_error)
-        }
-
-        /* "graphsaint/cython_sampler.pyx":275
- *                     arr_ind0.push_back(v)
- *                     arr_ind1.push_back(c-cnt)
- *                     c = c + 1             # <<<<<<<<<<<<<<
- *                 arr_ind1[cnt] = -self.arr_deg_vec[v]
- *                 inc(it)
- */
-        __pyx_v_c = (__pyx_v_c + 1);
-      }
-
-      /* "graphsaint/cython_sampler.pyx":276
- *                     arr_ind1.push_back(c-cnt)
- *                     c = c + 1
- *                 arr_ind1[cnt] = -self.arr_deg_vec[v]             # <<<<<<<<<<<<<<
- *                 inc(it)
- *             # iteratively update frontier
- */
-      (__pyx_v_arr_ind1[__pyx_v_cnt]) = (-(__pyx_v_self->arr_deg_vec[__pyx_v_v]));
-
-      /* "graphsaint/cython_sampler.pyx":277
- *                     c = c + 1
- *                 arr_ind1[cnt] = -self.arr_deg_vec[v]
- *                 inc(it)             # <<<<<<<<<<<<<<
- *             # iteratively update frontier
- *             j = self.size_frontier
- */
-      (void)((++__pyx_v_it));
-    }
-
-    /* "graphsaint/cython_sampler.pyx":279
- *                 inc(it)
- *             # iteratively update frontier
- *             j = self.size_frontier             # <<<<<<<<<<<<<<
- *             while j < self.size_subg:
- *                 # select next node to pop out of frontier
- */
-    __pyx_t_2 = __pyx_v_self->size_frontier;
-    __pyx_v_j = __pyx_t_2;
-
-    /* "graphsaint/cython_sampler.pyx":280
- *             # iteratively update frontier
- *             j = self.size_frontier
- *             while j < self.size_subg:             # <<<<<<<<<<<<<<
- *                 # select next node to pop out of frontier
- *                 while True:
- */
-    while (1) {
-      __pyx_t_1 = ((__pyx_v_j < __pyx_v_self->size_subg) != 0);
-      if (!__pyx_t_1) break;
-
-      /* "graphsaint/cython_sampler.pyx":282
- *             while j < self.size_subg:
- *                 # select next node to pop out of frontier
- *                 while True:             # <<<<<<<<<<<<<<
- *                     vidx = rand()%arr_ind0.size()
- *                     vpop = arr_ind0[vidx]
- */
-      while (1) {
-
-        /* "graphsaint/cython_sampler.pyx":283
- *                 # select next node to pop out of frontier
- *                 while True:
- *                     vidx = rand()%arr_ind0.size()             # <<<<<<<<<<<<<<
- *                     vpop = arr_ind0[vidx]
- *                     if vpop >= 0:
- */
-        __pyx_t_2 = rand();
-        __pyx_t_3 = __pyx_v_arr_ind0.size();
-        if (unlikely(__pyx_t_3 == 0)) {
-          #ifdef WITH_THREAD
-          PyGILState_STATE __pyx_gilstate_save = __Pyx_PyGILState_Ensure();
-          #endif
-          PyErr_SetString(PyExc_ZeroDivisionError, "integer division or modulo by zero");
-          #ifdef WITH_THREAD
-          __Pyx_PyGILState_Release(__pyx_gilstate_save);
-          #endif
-          __PYX_ERR(0, 283, __pyx_L1_error)
-        }
-        __pyx_v_vidx = (__pyx_t_2 % __pyx_t_3);
-
-        /* "graphsaint/cython_sampler.pyx":284
- *                 while True:
- *                     vidx = rand()%arr_ind0.size()
- *                     vpop = arr_ind0[vidx]             # <<<<<<<<<<<<<<
- *                     if vpop >= 0:
- *                         break
- */
-        __pyx_v_vpop = (__pyx_v_arr_ind0[__pyx_v_vidx]);
-
-        /* "graphsaint/cython_sampler.pyx":285
- *                     vidx = rand()%arr_ind0.size()
- *                     vpop = arr_ind0[vidx]
- *                     if vpop >= 0:             # <<<<<<<<<<<<<<
- *                         break
- *                 # prepare to update arr_ind*
- */
-        __pyx_t_1 = ((__pyx_v_vpop >= 0) != 0);
-        if (__pyx_t_1) {
-
-          /* "graphsaint/cython_sampler.pyx":286
- *                     vpop = arr_ind0[vidx]
- *                     if vpop >= 0:
- *                         break             # <<<<<<<<<<<<<<
- *                 # prepare to update arr_ind*
- *                 offset = arr_ind1[vidx]
- */
-          goto __pyx_L14_break;
-
-          /* "graphsaint/cython_sampler.pyx":285
- *                     vidx = rand()%arr_ind0.size()
- *                     vpop = arr_ind0[vidx]
- *                     if vpop >= 0:             # <<<<<<<<<<<<<<
- *                         break
- *                 # prepare to update arr_ind*
- */
-        }
-      }
-      __pyx_L14_break:;
-
-      /* "graphsaint/cython_sampler.pyx":288
- *                         break
- *                 # prepare to update arr_ind*
- *                 offset = arr_ind1[vidx]             # <<<<<<<<<<<<<<
- *                 if offset < 0:
- *                     idx_begin = vidx
- */
-      __pyx_v_offset = (__pyx_v_arr_ind1[__pyx_v_vidx]);
-
-      /* "graphsaint/cython_sampler.pyx":289
- *                 # prepare to update arr_ind*
- *                 offset = arr_ind1[vidx]
- *                 if offset < 0:             # <<<<<<<<<<<<<<
- *                     idx_begin = vidx
- *                     idx_end = idx_begin - offset
- */
-      __pyx_t_1 = ((__pyx_v_offset < 0) != 0);
-      if (__pyx_t_1) {
-
-        /* "graphsaint/cython_sampler.pyx":290
- *                 offset = arr_ind1[vidx]
- *                 if offset < 0:
- *                     idx_begin = vidx             # <<<<<<<<<<<<<<
- *                     idx_end = idx_begin - offset
- *                 else:
- */
-        __pyx_v_idx_begin = __pyx_v_vidx;
-
-        /* "graphsaint/cython_sampler.pyx":291
- *                 if offset < 0:
- *                     idx_begin = vidx
- *                     idx_end = idx_begin - offset             # <<<<<<<<<<<<<<
- *                 else:
- *                     idx_begin = vidx - offset
- */
-        __pyx_v_idx_end = (__pyx_v_idx_begin - __pyx_v_offset);
-
-        /* "graphsaint/cython_sampler.pyx":289
- *                 # prepare to update arr_ind*
- *                 offset = arr_ind1[vidx]
- *                 if offset < 0:             # <<<<<<<<<<<<<<
- *                     idx_begin = vidx
- *                     idx_end = idx_begin - offset
- */
-        goto __pyx_L16;
-      }
-
-      /* "graphsaint/cython_sampler.pyx":293
- *                     idx_end = idx_begin - offset
- *                 else:
- *                     idx_begin = vidx - offset             # <<<<<<<<<<<<<<
- *                     idx_end = idx_begin - arr_ind1[idx_begin]
- *                 # cleanup 1: invalidate entries
- */
-      /*else*/ {
-        __pyx_v_idx_begin = (__pyx_v_vidx - __pyx_v_offset);
-
-        /* "graphsaint/cython_sampler.pyx":294
- *                 else:
- *                     idx_begin = vidx - offset
- *                     idx_end = idx_begin - arr_ind1[idx_begin]             # <<<<<<<<<<<<<<
- *                 # cleanup 1: invalidate entries
- *                 k = idx_begin
- */
-        __pyx_v_idx_end = (__pyx_v_idx_begin - (__pyx_v_arr_ind1[__pyx_v_idx_begin]));
-      }
-      __pyx_L16:;
-
-      /* "graphsaint/cython_sampler.pyx":296
- *                     idx_end = idx_begin - arr_ind1[idx_begin]
- *                 # cleanup 1: invalidate entries
- *                 k = idx_begin             # <<<<<<<<<<<<<<
- *                 while k < idx_end:
- *                     arr_ind0[k] = -1
- */
-      __pyx_v_k = __pyx_v_idx_begin;
-
-      /* "graphsaint/cython_sampler.pyx":297
- *                 # cleanup 1: invalidate entries
- *                 k = idx_begin
- *                 while k < idx_end:             # <<<<<<<<<<<<<<
- *                     arr_ind0[k] = -1
- *                     arr_ind1[k] = 0
- */
-      while (1) {
-        __pyx_t_1 = ((__pyx_v_k < __pyx_v_idx_end) != 0);
-        if (!__pyx_t_1) break;
-
-        /* "graphsaint/cython_sampler.pyx":298
- *                 k = idx_begin
- *                 while k < idx_end:
- *                     arr_ind0[k] = -1             # <<<<<<<<<<<<<<
- *                     arr_ind1[k] = 0
- *                     k = k + 1
- */
-        (__pyx_v_arr_ind0[__pyx_v_k]) = -1;
-
-        /* "graphsaint/cython_sampler.pyx":299
- *                 while k < idx_end:
- *                     arr_ind0[k] = -1
- *                     arr_ind1[k] = 0             # <<<<<<<<<<<<<<
- *                     k = k + 1
- *                 # cleanup 2: add new entries
- */
-        (__pyx_v_arr_ind1[__pyx_v_k]) = 0;
-
-        /* "graphsaint/cython_sampler.pyx":300
- *                     arr_ind0[k] = -1
- *                     arr_ind1[k] = 0
- *                     k = k + 1             # <<<<<<<<<<<<<<
- *                 # cleanup 2: add new entries
- *                 num_neighs_pop = self.adj_indptr_vec[vpop+1] - self.adj_indptr_vec[vpop]
- */
-        __pyx_v_k = (__pyx_v_k + 1);
-      }
-
-      /* "graphsaint/cython_sampler.pyx":302
- *                     k = k + 1
- *                 # cleanup 2: add new entries
- *                 num_neighs_pop = self.adj_indptr_vec[vpop+1] - self.adj_indptr_vec[vpop]             # <<<<<<<<<<<<<<
- *                 vnext = self.adj_indices_vec[self.adj_indptr_vec[vpop]+rand()%num_neighs_pop]
- *                 self.node_sampled[p*self.num_sample_per_proc+r].push_back(vnext)
- */
-      __pyx_v_num_neighs_pop = ((__pyx_v_self->__pyx_base.adj_indptr_vec[(__pyx_v_vpop + 1)]) - (__pyx_v_self->__pyx_base.adj_indptr_vec[__pyx_v_vpop]));
-
-      /* "graphsaint/cython_sampler.pyx":303
- *                 # cleanup 2: add new entries
- *                 num_neighs_pop = self.adj_indptr_vec[vpop+1] - self.adj_indptr_vec[vpop]
- *                 vnext = self.adj_indices_vec[self.adj_indptr_vec[vpop]+rand()%num_neighs_pop]             # <<<<<<<<<<<<<<
- *                 self.node_sampled[p*self.num_sample_per_proc+r].push_back(vnext)
- *                 num_neighs_next = self.arr_deg_vec[vnext]
- */
-      __pyx_t_2 = rand();
-      if (unlikely(__pyx_v_num_neighs_pop == 0)) {
-        #ifdef WITH_THREAD
-        PyGILState_STATE __pyx_gilstate_save = __Pyx_PyGILState_Ensure();
-        #endif
-        PyErr_SetString(PyExc_ZeroDivisionError, "integer division or modulo by zero");
-        #ifdef WITH_THREAD
-        __Pyx_PyGILState_Release(__pyx_gilstate_save);
-        #endif
-        __PYX_ERR(0, 303, __pyx_L1_error)
-      }
-      __pyx_v_vnext = (__pyx_v_self->__pyx_base.adj_indices_vec[((__pyx_v_self->__pyx_base.adj_indptr_vec[__pyx_v_vpop]) + __Pyx_mod_int(__pyx_t_2, __pyx_v_num_neighs_pop))]);
-
-      /* "graphsaint/cython_sampler.pyx":304
- *                 num_neighs_pop = self.adj_indptr_vec[vpop+1] - self.adj_indptr_vec[vpop]
- *                 vnext = self.adj_indices_vec[self.adj_indptr_vec[vpop]+rand()%num_neighs_pop]
- *                 self.node_sampled[p*self.num_sample_per_proc+r].push_back(vnext)             # <<<<<<<<<<<<<<
- *                 num_neighs_next = self.arr_deg_vec[vnext]
- *                 cnt = arr_ind0.size()
- */
-      try {
-        (__pyx_v_self->__pyx_base.node_sampled[((__pyx_v_p * __pyx_v_self->__pyx_base.num_sample_per_proc) + __pyx_v_r)]).push_back(__pyx_v_vnext);
-      } catch(...) {
-        #ifdef WITH_THREAD
-        PyGILState_STATE __pyx_gilstate_save = __Pyx_PyGILState_Ensure();
-        #endif
-        __Pyx_CppExn2PyErr();
-        #ifdef WITH_THREAD
-        __Pyx_PyGILState_Release(__pyx_gilstate_save);
-        #endif
-        __PYX_ERR(0, 304, __pyx_L1_error)
-      }
-
-      /* "graphsaint/cython_sampler.pyx":305
- *                 vnext = self.adj_indices_vec[self.adj_indptr_vec[vpop]+rand()%num_neighs_pop]
- *                 self.node_sampled[p*self.num_sample_per_proc+r].push_back(vnext)
- *                 num_neighs_next = self.arr_deg_vec[vnext]             # <<<<<<<<<<<<<<
- *                 cnt = arr_ind0.size()
- *                 c = cnt
- */
-      __pyx_v_num_neighs_next = (__pyx_v_self->arr_deg_vec[__pyx_v_vnext]);
-
-      /* "graphsaint/cython_sampler.pyx":306
- *                 self.node_sampled[p*self.num_sample_per_proc+r].push_back(vnext)
- *                 num_neighs_next = self.arr_deg_vec[vnext]
- *                 cnt = arr_ind0.size()             # <<<<<<<<<<<<<<
- *                 c = cnt
- *                 while c < cnt + num_neighs_next:
- */
-      __pyx_v_cnt = __pyx_v_arr_ind0.size();
-
-      /* "graphsaint/cython_sampler.pyx":307
- *                 num_neighs_next = self.arr_deg_vec[vnext]
- *                 cnt = arr_ind0.size()
- *                 c = cnt             # <<<<<<<<<<<<<<
- *                 while c < cnt + num_neighs_next:
- *                     arr_ind0.push_back(vnext)
- */
-      __pyx_v_c = __pyx_v_cnt;
-
-      /* "graphsaint/cython_sampler.pyx":308
- *                 cnt = arr_ind0.size()
- *                 c = cnt
- *                 while c < cnt + num_neighs_next:             # <<<<<<<<<<<<<<
- *                     arr_ind0.push_back(vnext)
- *                     arr_ind1.push_back(c-cnt)
- */
-      while (1) {
-        __pyx_t_1 = ((__pyx_v_c < (__pyx_v_cnt + __pyx_v_num_neighs_next)) != 0);
-        if (!__pyx_t_1) break;
-
-        /* "graphsaint/cython_sampler.pyx":309
- *                 c = cnt
- *                 while c < cnt + num_neighs_next:
- *                     arr_ind0.push_back(vnext)             # <<<<<<<<<<<<<<
- *                     arr_ind1.push_back(c-cnt)
- *                     c = c + 1
- */
-        try {
-          __pyx_v_arr_ind0.push_back(__pyx_v_vnext);
-        } catch(...) {
-          #ifdef WITH_THREAD
-          PyGILState_STATE __pyx_gilstate_save = __Pyx_PyGILState_Ensure();
-          #endif
-          __Pyx_CppExn2PyErr();
-          #ifdef WITH_THREAD
-          __Pyx_PyGILState_Release(__pyx_gilstate_save);
-          #endif
-          __PYX_ERR(0, 309, __pyx_L1_error)
-        }
-
-        /* "graphsaint/cython_sampler.pyx":310
- *                 while c < cnt + num_neighs_next:
- *                     arr_ind0.push_back(vnext)
- *                     arr_ind1.push_back(c-cnt)             # <<<<<<<<<<<<<<
- *                     c = c + 1
- *                 arr_ind1[cnt] = -num_neighs_next
- */
-        try {
-          __pyx_v_arr_ind1.push_back((__pyx_v_c - __pyx_v_cnt));
-        } catch(...) {
-          #ifdef WITH_THREAD
-          PyGILState_STATE __pyx_gilstate_save = __Pyx_PyGILState_Ensure();
-          #endif
-          __Pyx_CppExn2PyErr();
-          #ifdef WITH_THREAD
-          __Pyx_PyGILState_Release(__pyx_gilstate_save);
-          #endif
-          __PYX_ERR(0, 310, __pyx_L1_error)
-        }
-
-        /* "graphsaint/cython_sampler.pyx":311
- *                     arr_ind0.push_back(vnext)
- *                     arr_ind1.push_back(c-cnt)
- *                     c = c + 1             # <<<<<<<<<<<<<<
- *                 arr_ind1[cnt] = -num_neighs_next
- *                 j = j + 1
- */
-        __pyx_v_c = (__pyx_v_c + 1);
-      }
-
-      /* "graphsaint/cython_sampler.pyx":312
- *                     arr_ind1.push_back(c-cnt)
- *                     c = c + 1
- *                 arr_ind1[cnt] = -num_neighs_next             # <<<<<<<<<<<<<<
- *                 j = j + 1
- *             self.node_sampled[p*self.num_sample_per_proc+r].insert(self.node_sampled[p*self.num_sample_per_proc+r].end(),frontier.begin(),frontier.end())
- */
-      (__pyx_v_arr_ind1[__pyx_v_cnt]) = (-__pyx_v_num_neighs_next);
-
-      /* "graphsaint/cython_sampler.pyx":313
- *                     c = c + 1
- *                 arr_ind1[cnt] = -num_neighs_next
- *                 j = j + 1             # <<<<<<<<<<<<<<
- *             self.node_sampled[p*self.num_sample_per_proc+r].insert(self.node_sampled[p*self.num_sample_per_proc+r].end(),frontier.begin(),frontier.end())
- *             sort(self.node_sampled[p*self.num_sample_per_proc+r].begin(),self.node_sampled[p*self.num_sample_per_proc+r].end())
- */
-      __pyx_v_j = (__pyx_v_j + 1);
-    }
-
-    /* "graphsaint/cython_sampler.pyx":314
- *                 arr_ind1[cnt] = -num_neighs_next
- *                 j = j + 1
- *             self.node_sampled[p*self.num_sample_per_proc+r].insert(self.node_sampled[p*self.num_sample_per_proc+r].end(),frontier.begin(),frontier.end())             # <<<<<<<<<<<<<<
- *             sort(self.node_sampled[p*self.num_sample_per_proc+r].begin(),self.node_sampled[p*self.num_sample_per_proc+r].end())
- *             self.node_sampled[p*self.num_sample_per_proc+r].erase(unique(self.node_sampled[p*self.num_sample_per_proc+r].begin(),\
- */
-    try {
-      (__pyx_v_self->__pyx_base.node_sampled[((__pyx_v_p * __pyx_v_self->__pyx_base.num_sample_per_proc) + __pyx_v_r)]).insert((__pyx_v_self->__pyx_base.node_sampled[((__pyx_v_p * __pyx_v_self->__pyx_base.num_sample_per_proc) + __pyx_v_r)]).end(), __pyx_v_frontier.begin(), __pyx_v_frontier.end());
-    } catch(...) {
-      #ifdef WITH_THREAD
-      PyGILState_STATE __pyx_gilstate_save = __Pyx_PyGILState_Ensure();
-      #endif
-      __Pyx_CppExn2PyErr();
-      #ifdef WITH_THREAD
-      __Pyx_PyGILState_Release(__pyx_gilstate_save);
-      #endif
-      __PYX_ERR(0, 314, __pyx_L1_error)
-    }
-
-    /* "graphsaint/cython_sampler.pyx":315
- *                 j = j + 1
- *             self.node_sampled[p*self.num_sample_per_proc+r].insert(self.node_sampled[p*self.num_sample_per_proc+r].end(),frontier.begin(),frontier.end())
- *             sort(self.node_sampled[p*self.num_sample_per_proc+r].begin(),self.node_sampled[p*self.num_sample_per_proc+r].end())             # <<<<<<<<<<<<<<
- *             self.node_sampled[p*self.num_sample_per_proc+r].erase(unique(self.node_sampled[p*self.num_sample_per_proc+r].begin(),\
- *                     self.node_sampled[p*self.num_sample_per_proc+r].end()),self.node_sampled[p*self.num_sample_per_proc+r].end())
- */
-    std::sort<std::vector<int> ::iterator>((__pyx_v_self->__pyx_base.node_sampled[((__pyx_v_p * __pyx_v_self->__pyx_base.num_sample_per_proc) + __pyx_v_r)]).begin(), (__pyx_v_self->__pyx_base.node_sampled[((__pyx_v_p * __pyx_v_self->__pyx_base.num_sample_per_proc) + __pyx_v_r)]).end());
-
-    /* "graphsaint/cython_sampler.pyx":316
- *             self.node_sampled[p*self.num_sample_per_proc+r].insert(self.node_sampled[p*self.num_sample_per_proc+r].end(),frontier.begin(),frontier.end())
- *             sort(self.node_sampled[p*self.num_sample_per_proc+r].begin(),self.node_sampled[p*self.num_sample_per_proc+r].end())
- *             self.node_sampled[p*self.num_sample_per_proc+r].erase(unique(self.node_sampled[p*self.num_sample_per_proc+r].begin(),\             # <<<<<<<<<<<<<<
- *                     self.node_sampled[p*self.num_sample_per_proc+r].end()),self.node_sampled[p*self.num_sample_per_proc+r].end())
- *             r = r + 1
- */
-    (void)((__pyx_v_self->__pyx_base.node_sampled[((__pyx_v_p * __pyx_v_self->__pyx_base.num_sample_per_proc) + __pyx_v_r)]).erase(std::unique<std::vector<int> ::iterator>((__pyx_v_self->__pyx_base.node_sampled[((__pyx_v_p * __pyx_v_self->__pyx_base.num_sample_per_proc) + __pyx_v_r)]).begin(), (__pyx_v_self->__pyx_base.node_sampled[((__pyx_v_p * __pyx_v_self->__pyx_base.num_sample_per_proc) + __pyx_v_r)]).end()), (__pyx_v_self->__pyx_base.node_sampled[((__pyx_v_p * __pyx_v_self->__pyx_base.num_sample_per_proc) + __pyx_v_r)]).end()));
-
-    /* "graphsaint/cython_sampler.pyx":318
- *             self.node_sampled[p*self.num_sample_per_proc+r].erase(unique(self.node_sampled[p*self.num_sample_per_proc+r].begin(),\
- *                     self.node_sampled[p*self.num_sample_per_proc+r].end()),self.node_sampled[p*self.num_sample_per_proc+r].end())
- *             r = r + 1             # <<<<<<<<<<<<<<
- * 
- * 
- */
-    __pyx_v_r = (__pyx_v_r + 1);
-  }
-
-  /* "graphsaint/cython_sampler.pyx":242
- *         self.avg_deg = _arr_deg.mean()
- * 
- *     cdef void sample(self, int p) nogil:             # <<<<<<<<<<<<<<
- *         cdef vector[int] frontier
- *         cdef int i = 0
- */
-
-  /* function exit code */
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_WriteUnraisable("graphsaint.cython_sampler.MRW.sample", __pyx_clineno, __pyx_lineno, __pyx_filename, 1, 1);
-  __pyx_L0:;
-}
-
-/* "(tree fragment)":1
- * def __reduce_cython__(self):             # <<<<<<<<<<<<<<
- *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
- * def __setstate_cython__(self, __pyx_state):
- */
-
-/* Python wrapper */
-static PyObject *__pyx_pw_10graphsaint_14cython_sampler_3MRW_3__reduce_cython__(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
-static PyObject *__pyx_pw_10graphsaint_14cython_sampler_3MRW_3__reduce_cython__(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
-  PyObject *__pyx_r = 0;
-  __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("__reduce_cython__ (wrapper)", 0);
-  __pyx_r = __pyx_pf_10graphsaint_14cython_sampler_3MRW_2__reduce_cython__(((struct __pyx_obj_10graphsaint_14cython_sampler_MRW *)__pyx_v_self));
-
-  /* function exit code */
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-static PyObject *__pyx_pf_10graphsaint_14cython_sampler_3MRW_2__reduce_cython__(CYTHON_UNUSED struct __pyx_obj_10graphsaint_14cython_sampler_MRW *__pyx_v_self) {
-  PyObject *__pyx_r = NULL;
-  __Pyx_RefNannyDeclarations
-  PyObject *__pyx_t_1 = NULL;
-  int __pyx_lineno = 0;
-  const char *__pyx_filename = NULL;
-  int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("__reduce_cython__", 0);
-
-  /* "(tree fragment)":2
- * def __reduce_cython__(self):
- *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")             # <<<<<<<<<<<<<<
- * def __setstate_cython__(self, __pyx_state):
- *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
- */
-  __pyx_t_1 = __Pyx_PyObject_Call(__pyx_builtin_TypeError, __pyx_tuple__3, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 2, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __Pyx_Raise(__pyx_t_1, 0, 0, 0);
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __PYX_ERR(1, 2, __pyx_L1_error)
-
-  /* "(tree fragment)":1
- * def __reduce_cython__(self):             # <<<<<<<<<<<<<<
- *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
- * def __setstate_cython__(self, __pyx_state):
- */
-
-  /* function exit code */
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_AddTraceback("graphsaint.cython_sampler.MRW.__reduce_cython__", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __pyx_r = NULL;
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "(tree fragment)":3
- * def __reduce_cython__(self):
- *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
- * def __setstate_cython__(self, __pyx_state):             # <<<<<<<<<<<<<<
- *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
- */
-
-/* Python wrapper */
-static PyObject *__pyx_pw_10graphsaint_14cython_sampler_3MRW_5__setstate_cython__(PyObject *__pyx_v_self, PyObject *__pyx_v___pyx_state); /*proto*/
-static PyObject *__pyx_pw_10graphsaint_14cython_sampler_3MRW_5__setstate_cython__(PyObject *__pyx_v_self, PyObject *__pyx_v___pyx_state) {
-  PyObject *__pyx_r = 0;
-  __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("__setstate_cython__ (wrapper)", 0);
-  __pyx_r = __pyx_pf_10graphsaint_14cython_sampler_3MRW_4__setstate_cython__(((struct __pyx_obj_10graphsaint_14cython_sampler_MRW *)__pyx_v_self), ((PyObject *)__pyx_v___pyx_state));
-
-  /* function exit code */
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-static PyObject *__pyx_pf_10graphsaint_14cython_sampler_3MRW_4__setstate_cython__(CYTHON_UNUSED struct __pyx_obj_10graphsaint_14cython_sampler_MRW *__pyx_v_self, CYTHON_UNUSED PyObject *__pyx_v___pyx_state) {
-  PyObject *__pyx_r = NULL;
-  __Pyx_RefNannyDeclarations
-  PyObject *__pyx_t_1 = NULL;
-  int __pyx_lineno = 0;
-  const char *__pyx_filename = NULL;
-  int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("__setstate_cython__", 0);
-
-  /* "(tree fragment)":4
- *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
- * def __setstate_cython__(self, __pyx_state):
- *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")             # <<<<<<<<<<<<<<
- */
-  __pyx_t_1 = __Pyx_PyObject_Call(__pyx_builtin_TypeError, __pyx_tuple__4, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 4, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __Pyx_Raise(__pyx_t_1, 0, 0, 0);
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __PYX_ERR(1, 4, __pyx_L1_error)
-
-  /* "(tree fragment)":3
- * def __reduce_cython__(self):
- *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
- * def __setstate_cython__(self, __pyx_state):             # <<<<<<<<<<<<<<
- *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
- */
-
-  /* function exit code */
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_AddTraceback("graphsaint.cython_sampler.MRW.__setstate_cython__", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __pyx_r = NULL;
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "graphsaint/cython_sampler.pyx":326
- * cdef class RW(Sampler):
- *     cdef int size_root, size_depth
- *     def __cinit__(self, np.ndarray[int,ndim=1,mode='c'] adj_indptr,             # <<<<<<<<<<<<<<
- *                         np.ndarray[int,ndim=1,mode='c'] adj_indices,
- *                         np.ndarray[int,ndim=1,mode='c'] node_train,
- */
-
-/* Python wrapper */
-static int __pyx_pw_10graphsaint_14cython_sampler_2RW_1__cinit__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static int __pyx_pw_10graphsaint_14cython_sampler_2RW_1__cinit__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
-  CYTHON_UNUSED PyArrayObject *__pyx_v_adj_indptr = 0;
-  CYTHON_UNUSED PyArrayObject *__pyx_v_adj_indices = 0;
-  CYTHON_UNUSED PyArrayObject *__pyx_v_node_train = 0;
-  CYTHON_UNUSED int __pyx_v_num_proc;
-  CYTHON_UNUSED int __pyx_v_num_sample_per_proc;
-  int __pyx_v_size_root;
-  int __pyx_v_size_depth;
-  int __pyx_lineno = 0;
-  const char *__pyx_filename = NULL;
-  int __pyx_clineno = 0;
-  int __pyx_r;
-  __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("__cinit__ (wrapper)", 0);
-  {
-    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_adj_indptr,&__pyx_n_s_adj_indices,&__pyx_n_s_node_train,&__pyx_n_s_num_proc,&__pyx_n_s_num_sample_per_proc,&__pyx_n_s_size_root,&__pyx_n_s_size_depth,0};
-    PyObject* values[7] = {0,0,0,0,0,0,0};
-    if (unlikely(__pyx_kwds)) {
-      Py_ssize_t kw_args;
-      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
-      switch (pos_args) {
-        case  7: values[6] = PyTuple_GET_ITEM(__pyx_args, 6);
-        CYTHON_FALLTHROUGH;
-        case  6: values[5] = PyTuple_GET_ITEM(__pyx_args, 5);
-        CYTHON_FALLTHROUGH;
-        case  5: values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
-        CYTHON_FALLTHROUGH;
-        case  4: values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
-        CYTHON_FALLTHROUGH;
-        case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
-        CYTHON_FALLTHROUGH;
-        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
-        CYTHON_FALLTHROUGH;
-        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
-        CYTHON_FALLTHROUGH;
-        case  0: break;
-        default: goto __pyx_L5_argtuple_error;
-      }
-      kw_args = PyDict_Size(__pyx_kwds);
-      switch (pos_args) {
-        case  0:
-        if (likely((values[0] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_adj_indptr)) != 0)) kw_args--;
-        else goto __pyx_L5_argtuple_error;
-        CYTHON_FALLTHROUGH;
-        case  1:
-        if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_adj_indices)) != 0)) kw_args--;
-        else {
-          __Pyx_RaiseArgtupleInvalid("__cinit__", 1, 7, 7, 1); __PYX_ERR(0, 326, __pyx_L3_error)
-        }
-        CYTHON_FALLTHROUGH;
-        case  2:
-        if (likely((values[2] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_node_train)) != 0)) kw_args--;
-        else {
-          __Pyx_RaiseArgtupleInvalid("__cinit__", 1, 7, 7, 2); __PYX_ERR(0, 326, __pyx_L3_error)
-        }
-        CYTHON_FALLTHROUGH;
-        case  3:
-        if (likely((values[3] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_num_proc)) != 0)) kw_args--;
-        else {
-          __Pyx_RaiseArgtupleInvalid("__cinit__", 1, 7, 7, 3); __PYX_ERR(0, 326, __pyx_L3_error)
-        }
-        CYTHON_FALLTHROUGH;
-        case  4:
-        if (likely((values[4] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_num_sample_per_proc)) != 0)) kw_args--;
-        else {
-          __Pyx_RaiseArgtupleInvalid("__cinit__", 1, 7, 7, 4); __PYX_ERR(0, 326, __pyx_L3_error)
-        }
-        CYTHON_FALLTHROUGH;
-        case  5:
-        if (likely((values[5] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_size_root)) != 0)) kw_args--;
-        else {
-          __Pyx_RaiseArgtupleInvalid("__cinit__", 1, 7, 7, 5); __PYX_ERR(0, 326, __pyx_L3_error)
-        }
-        CYTHON_FALLTHROUGH;
-        case  6:
-        if (likely((values[6] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_size_depth)) != 0)) kw_args--;
-        else {
-          __Pyx_RaiseArgtupleInvalid("__cinit__", 1, 7, 7, 6); __PYX_ERR(0, 326, __pyx_L3_error)
-        }
-      }
-      if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "__cinit__") < 0)) __PYX_ERR(0, 326, __pyx_L3_error)
-      }
-    } else if (PyTuple_GET_SIZE(__pyx_args) != 7) {
-      goto __pyx_L5_argtuple_error;
-    } else {
-      values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
-      values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
-      values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
-      values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
-      values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
-      values[5] = PyTuple_GET_ITEM(__pyx_args, 5);
-      values[6] = PyTuple_GET_ITEM(__pyx_args, 6);
-    }
-    __pyx_v_adj_indptr = ((PyArrayObject *)values[0]);
-    __pyx_v_adj_indices = ((PyArrayObject *)values[1]);
-    __pyx_v_node_train = ((PyArrayObject *)values[2]);
-    __pyx_v_num_proc = __Pyx_PyInt_As_int(values[3]); if (unlikely((__pyx_v_num_proc == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 329, __pyx_L3_error)
-    __pyx_v_num_sample_per_proc = __Pyx_PyInt_As_int(values[4]); if (unlikely((__pyx_v_num_sample_per_proc == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 329, __pyx_L3_error)
-    __pyx_v_size_root = __Pyx_PyInt_As_int(values[5]); if (unlikely((__pyx_v_size_root == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 330, __pyx_L3_error)
-    __pyx_v_size_depth = __Pyx_PyInt_As_int(values[6]); if (unlikely((__pyx_v_size_depth == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 330, __pyx_L3_error)
-  }
-  goto __pyx_L4_argument_unpacking_done;
-  __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("__cinit__", 1, 7, 7, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 326, __pyx_L3_error)
-  __pyx_L3_error:;
-  __Pyx_AddTraceback("graphsaint.cython_sampler.RW.__cinit__", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __Pyx_RefNannyFinishContext();
-  return -1;
-  __pyx_L4_argument_unpacking_done:;
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_adj_indptr), __pyx_ptype_5numpy_ndarray, 1, "adj_indptr", 0))) __PYX_ERR(0, 326, __pyx_L1_error)
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_adj_indices), __pyx_ptype_5numpy_ndarray, 1, "adj_indices", 0))) __PYX_ERR(0, 327, __pyx_L1_error)
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_node_train), __pyx_ptype_5numpy_ndarray, 1, "node_train", 0))) __PYX_ERR(0, 328, __pyx_L1_error)
-  __pyx_r = __pyx_pf_10graphsaint_14cython_sampler_2RW___cinit__(((struct __pyx_obj_10graphsaint_14cython_sampler_RW *)__pyx_v_self), __pyx_v_adj_indptr, __pyx_v_adj_indices, __pyx_v_node_train, __pyx_v_num_proc, __pyx_v_num_sample_per_proc, __pyx_v_size_root, __pyx_v_size_depth);
-
-  /* function exit code */
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __pyx_r = -1;
-  __pyx_L0:;
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-static int __pyx_pf_10graphsaint_14cython_sampler_2RW___cinit__(struct __pyx_obj_10graphsaint_14cython_sampler_RW *__pyx_v_self, CYTHON_UNUSED PyArrayObject *__pyx_v_adj_indptr, CYTHON_UNUSED PyArrayObject *__pyx_v_adj_indices, CYTHON_UNUSED PyArrayObject *__pyx_v_node_train, CYTHON_UNUSED int __pyx_v_num_proc, CYTHON_UNUSED int __pyx_v_num_sample_per_proc, int __pyx_v_size_root, int __pyx_v_size_depth) {
-  __Pyx_LocalBuf_ND __pyx_pybuffernd_adj_indices;
-  __Pyx_Buffer __pyx_pybuffer_adj_indices;
-  __Pyx_LocalBuf_ND __pyx_pybuffernd_adj_indptr;
-  __Pyx_Buffer __pyx_pybuffer_adj_indptr;
-  __Pyx_LocalBuf_ND __pyx_pybuffernd_node_train;
-  __Pyx_Buffer __pyx_pybuffer_node_train;
-  int __pyx_r;
-  __Pyx_RefNannyDeclarations
-  int __pyx_lineno = 0;
-  const char *__pyx_filename = NULL;
-  int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("__cinit__", 0);
-  __pyx_pybuffer_adj_indptr.pybuffer.buf = NULL;
-  __pyx_pybuffer_adj_indptr.refcount = 0;
-  __pyx_pybuffernd_adj_indptr.data = NULL;
-  __pyx_pybuffernd_adj_indptr.rcbuffer = &__pyx_pybuffer_adj_indptr;
-  __pyx_pybuffer_adj_indices.pybuffer.buf = NULL;
-  __pyx_pybuffer_adj_indices.refcount = 0;
-  __pyx_pybuffernd_adj_indices.data = NULL;
-  __pyx_pybuffernd_adj_indices.rcbuffer = &__pyx_pybuffer_adj_indices;
-  __pyx_pybuffer_node_train.pybuffer.buf = NULL;
-  __pyx_pybuffer_node_train.refcount = 0;
-  __pyx_pybuffernd_node_train.data = NULL;
-  __pyx_pybuffernd_node_train.rcbuffer = &__pyx_pybuffer_node_train;
-  {
-    __Pyx_BufFmt_StackElem __pyx_stack[1];
-    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_adj_indptr.rcbuffer->pybuffer, (PyObject*)__pyx_v_adj_indptr, &__Pyx_TypeInfo_int, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 326, __pyx_L1_error)
-  }
-  __pyx_pybuffernd_adj_indptr.diminfo[0].strides = __pyx_pybuffernd_adj_indptr.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_adj_indptr.diminfo[0].shape = __pyx_pybuffernd_adj_indptr.rcbuffer->pybuffer.shape[0];
-  {
-    __Pyx_BufFmt_StackElem __pyx_stack[1];
-    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_adj_indices.rcbuffer->pybuffer, (PyObject*)__pyx_v_adj_indices, &__Pyx_TypeInfo_int, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 326, __pyx_L1_error)
-  }
-  __pyx_pybuffernd_adj_indices.diminfo[0].strides = __pyx_pybuffernd_adj_indices.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_adj_indices.diminfo[0].shape = __pyx_pybuffernd_adj_indices.rcbuffer->pybuffer.shape[0];
-  {
-    __Pyx_BufFmt_StackElem __pyx_stack[1];
-    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_node_train.rcbuffer->pybuffer, (PyObject*)__pyx_v_node_train, &__Pyx_TypeInfo_int, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 326, __pyx_L1_error)
-  }
-  __pyx_pybuffernd_node_train.diminfo[0].strides = __pyx_pybuffernd_node_train.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_node_train.diminfo[0].shape = __pyx_pybuffernd_node_train.rcbuffer->pybuffer.shape[0];
-
-  /* "graphsaint/cython_sampler.pyx":331
- *                         int num_proc, int num_sample_per_proc,
- *                         int size_root, int size_depth):
- *         self.size_root = size_root             # <<<<<<<<<<<<<<
- *         self.size_depth = size_depth
- * 
- */
-  __pyx_v_self->size_root = __pyx_v_size_root;
-
-  /* "graphsaint/cython_sampler.pyx":332
- *                         int size_root, int size_depth):
- *         self.size_root = size_root
- *         self.size_depth = size_depth             # <<<<<<<<<<<<<<
- * 
- *     cdef void sample(self, int p) nogil:
- */
-  __pyx_v_self->size_depth = __pyx_v_size_depth;
-
-  /* "graphsaint/cython_sampler.pyx":326
- * cdef class RW(Sampler):
- *     cdef int size_root, size_depth
- *     def __cinit__(self, np.ndarray[int,ndim=1,mode='c'] adj_indptr,             # <<<<<<<<<<<<<<
- *                         np.ndarray[int,ndim=1,mode='c'] adj_indices,
- *                         np.ndarray[int,ndim=1,mode='c'] node_train,
- */
-
-  /* function exit code */
-  __pyx_r = 0;
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  { PyObject *__pyx_type, *__pyx_value, *__pyx_tb;
-    __Pyx_PyThreadState_declare
-    __Pyx_PyThreadState_assign
-    __Pyx_ErrFetch(&__pyx_type, &__pyx_value, &__pyx_tb);
-    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_adj_indices.rcbuffer->pybuffer);
-    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_adj_indptr.rcbuffer->pybuffer);
-    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_node_train.rcbuffer->pybuffer);
-  __Pyx_ErrRestore(__pyx_type, __pyx_value, __pyx_tb);}
-  __Pyx_AddTraceback("graphsaint.cython_sampler.RW.__cinit__", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __pyx_r = -1;
-  goto __pyx_L2;
-  __pyx_L0:;
-  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_adj_indices.rcbuffer->pybuffer);
-  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_adj_indptr.rcbuffer->pybuffer);
-  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_node_train.rcbuffer->pybuffer);
-  __pyx_L2:;
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "graphsaint/cython_sampler.pyx":334
- *         self.size_depth = size_depth
- * 
- *     cdef void sample(self, int p) nogil:             # <<<<<<<<<<<<<<
- *         cdef int iroot = 0
- *         cdef int idepth = 0
- */
-
-static void __pyx_f_10graphsaint_14cython_sampler_2RW_sample(struct __pyx_obj_10graphsaint_14cython_sampler_RW *__pyx_v_self, int __pyx_v_p) {
-  int __pyx_v_iroot;
-  int __pyx_v_idepth;
-  int __pyx_v_r;
-  int __pyx_v_idx_subg;
-  int __pyx_v_v;
-  int __pyx_v_num_train_node;
-  int __pyx_t_1;
-  int __pyx_t_2;
-  int __pyx_t_3;
-  int __pyx_lineno = 0;
-  const char *__pyx_filename = NULL;
-  int __pyx_clineno = 0;
-
-  /* "graphsaint/cython_sampler.pyx":335
- * 
- *     cdef void sample(self, int p) nogil:
- *         cdef int iroot = 0             # <<<<<<<<<<<<<<
- *         cdef int idepth = 0
- *         cdef int r = 0
- */
-  __pyx_v_iroot = 0;
-
-  /* "graphsaint/cython_sampler.pyx":336
- *     cdef void sample(self, int p) nogil:
- *         cdef int iroot = 0
- *         cdef int idepth = 0             # <<<<<<<<<<<<<<
- *         cdef int r = 0
- *         cdef int idx_subg
- */
-  __pyx_v_idepth = 0;
-
-  /* "graphsaint/cython_sampler.pyx":337
- *         cdef int iroot = 0
- *         cdef int idepth = 0
- *         cdef int r = 0             # <<<<<<<<<<<<<<
- *         cdef int idx_subg
- *         cdef int v
- */
-  __pyx_v_r = 0;
-
-  /* "graphsaint/cython_sampler.pyx":340
- *         cdef int idx_subg
- *         cdef int v
- *         cdef int num_train_node = self.node_train_vec.size()             # <<<<<<<<<<<<<<
- *         while r < self.num_sample_per_proc:
- *             idx_subg = p*self.num_sample_per_proc+r
- */
-  __pyx_v_num_train_node = __pyx_v_self->__pyx_base.node_train_vec.size();
-
-  /* "graphsaint/cython_sampler.pyx":341
- *         cdef int v
- *         cdef int num_train_node = self.node_train_vec.size()
- *         while r < self.num_sample_per_proc:             # <<<<<<<<<<<<<<
- *             idx_subg = p*self.num_sample_per_proc+r
- *             # sample root
- */
-  while (1) {
-    __pyx_t_1 = ((__pyx_v_r < __pyx_v_self->__pyx_base.num_sample_per_proc) != 0);
-    if (!__pyx_t_1) break;
-
-    /* "graphsaint/cython_sampler.pyx":342
- *         cdef int num_train_node = self.node_train_vec.size()
- *         while r < self.num_sample_per_proc:
- *             idx_subg = p*self.num_sample_per_proc+r             # <<<<<<<<<<<<<<
- *             # sample root
- *             iroot = 0
- */
-    __pyx_v_idx_subg = ((__pyx_v_p * __pyx_v_self->__pyx_base.num_sample_per_proc) + __pyx_v_r);
-
-    /* "graphsaint/cython_sampler.pyx":344
- *             idx_subg = p*self.num_sample_per_proc+r
- *             # sample root
- *             iroot = 0             # <<<<<<<<<<<<<<
- *             while iroot < self.size_root:
- *                 v = self.node_train_vec[rand()%num_train_node]
- */
-    __pyx_v_iroot = 0;
-
-    /* "graphsaint/cython_sampler.pyx":345
- *             # sample root
- *             iroot = 0
- *             while iroot < self.size_root:             # <<<<<<<<<<<<<<
- *                 v = self.node_train_vec[rand()%num_train_node]
- *                 self.node_sampled[idx_subg].push_back(v)
- */
-    while (1) {
-      __pyx_t_1 = ((__pyx_v_iroot < __pyx_v_self->size_root) != 0);
-      if (!__pyx_t_1) break;
-
-      /* "graphsaint/cython_sampler.pyx":346
- *             iroot = 0
- *             while iroot < self.size_root:
- *                 v = self.node_train_vec[rand()%num_train_node]             # <<<<<<<<<<<<<<
- *                 self.node_sampled[idx_subg].push_back(v)
- *                 # sample random walk
- */
-      __pyx_t_2 = rand();
-      if (unlikely(__pyx_v_num_train_node == 0)) {
-        #ifdef WITH_THREAD
-        PyGILState_STATE __pyx_gilstate_save = __Pyx_PyGILState_Ensure();
-        #endif
-        PyErr_SetString(PyExc_ZeroDivisionError, "integer division or modulo by zero");
-        #ifdef WITH_THREAD
-        __Pyx_PyGILState_Release(__pyx_gilstate_save);
-        #endif
-        __PYX_ERR(0, 346, __pyx_L1_error)
-      }
-      __pyx_v_v = (__pyx_v_self->__pyx_base.node_train_vec[__Pyx_mod_int(__pyx_t_2, __pyx_v_num_train_node)]);
-
-      /* "graphsaint/cython_sampler.pyx":347
- *             while iroot < self.size_root:
- *                 v = self.node_train_vec[rand()%num_train_node]
- *                 self.node_sampled[idx_subg].push_back(v)             # <<<<<<<<<<<<<<
- *                 # sample random walk
- *                 idepth = 0
- */
-      try {
-        (__pyx_v_self->__pyx_base.node_sampled[__pyx_v_idx_subg]).push_back(__pyx_v_v);
-      } catch(...) {
-        #ifdef WITH_THREAD
-        PyGILState_STATE __pyx_gilstate_save = __Pyx_PyGILState_Ensure();
-        #endif
-        __Pyx_CppExn2PyErr();
-        #ifdef WITH_THREAD
-        __Pyx_PyGILState_Release(__pyx_gilstate_save);
-        #endif
-        __PYX_ERR(0, 347, __pyx_L1_error)
-      }
-
-      /* "graphsaint/cython_sampler.pyx":349
- *                 self.node_sampled[idx_subg].push_back(v)
- *                 # sample random walk
- *                 idepth = 0             # <<<<<<<<<<<<<<
- *                 while idepth < self.size_depth:
- *                     if (self.adj_indptr_vec[v+1]-self.adj_indptr_vec[v]>0):
- */
-      __pyx_v_idepth = 0;
-
-      /* "graphsaint/cython_sampler.pyx":350
- *                 # sample random walk
- *                 idepth = 0
- *                 while idepth < self.size_depth:             # <<<<<<<<<<<<<<
- *                     if (self.adj_indptr_vec[v+1]-self.adj_indptr_vec[v]>0):
- *                         v = self.adj_indices_vec[self.adj_indptr_vec[v]+rand()%(self.adj_indptr_vec[v+1]-self.adj_indptr_vec[v])]
- */
-      while (1) {
-        __pyx_t_1 = ((__pyx_v_idepth < __pyx_v_self->size_depth) != 0);
-        if (!__pyx_t_1) break;
-
-        /* "graphsaint/cython_sampler.pyx":351
- *                 idepth = 0
- *                 while idepth < self.size_depth:
- *                     if (self.adj_indptr_vec[v+1]-self.adj_indptr_vec[v]>0):             # <<<<<<<<<<<<<<
- *                         v = self.adj_indices_vec[self.adj_indptr_vec[v]+rand()%(self.adj_indptr_vec[v+1]-self.adj_indptr_vec[v])]
- *                         self.node_sampled[idx_subg].push_back(v)
- */
-        __pyx_t_1 = ((((__pyx_v_self->__pyx_base.adj_indptr_vec[(__pyx_v_v + 1)]) - (__pyx_v_self->__pyx_base.adj_indptr_vec[__pyx_v_v])) > 0) != 0);
-        if (__pyx_t_1) {
-
-          /* "graphsaint/cython_sampler.pyx":352
- *                 while idepth < self.size_depth:
- *                     if (self.adj_indptr_vec[v+1]-self.adj_indptr_vec[v]>0):
- *                         v = self.adj_indices_vec[self.adj_indptr_vec[v]+rand()%(self.adj_indptr_vec[v+1]-self.adj_indptr_vec[v])]             # <<<<<<<<<<<<<<
- *                         self.node_sampled[idx_subg].push_back(v)
- *                     idepth = idepth + 1
- */
-          __pyx_t_2 = rand();
-          __pyx_t_3 = ((__pyx_v_self->__pyx_base.adj_indptr_vec[(__pyx_v_v + 1)]) - (__pyx_v_self->__pyx_base.adj_indptr_vec[__pyx_v_v]));
-          if (unlikely(__pyx_t_3 == 0)) {
-            #ifdef WITH_THREAD
-            PyGILState_STATE __pyx_gilstate_save = __Pyx_PyGILState_Ensure();
-            #endif
-            PyErr_SetString(PyExc_ZeroDivisionError, "integer division or modulo by zero");
-            #ifdef WITH_THREAD
-            __Pyx_PyGILState_Release(__pyx_gilstate_save);
-            #endif
-            __PYX_ERR(0, 352, __pyx_L1_error)
-          }
-          __pyx_v_v = (__pyx_v_self->__pyx_base.adj_indices_vec[((__pyx_v_self->__pyx_base.adj_indptr_vec[__pyx_v_v]) + __Pyx_mod_int(__pyx_t_2, __pyx_t_3))]);
-
-          /* "graphsaint/cython_sampler.pyx":353
- *                     if (self.adj_indptr_vec[v+1]-self.adj_indptr_vec[v]>0):
- *                         v = self.adj_indices_vec[self.adj_indptr_vec[v]+rand()%(self.adj_indptr_vec[v+1]-self.adj_indptr_vec[v])]
- *                         self.node_sampled[idx_subg].push_back(v)             # <<<<<<<<<<<<<<
- *                     idepth = idepth + 1
- *                 iroot = iroot + 1
- */
-          try {
-            (__pyx_v_self->__pyx_base.node_sampled[__pyx_v_idx_subg]).push_back(__pyx_v_v);
-          } catch(...) {
-            #ifdef WITH_THREAD
-            PyGILState_STATE __pyx_gilstate_save = __Pyx_PyGILState_Ensure();
-            #endif
-            __Pyx_CppExn2PyErr();
-            #ifdef WITH_THREAD
-            __Pyx_PyGILState_Release(__pyx_gilstate_save);
-            #endif
-            __PYX_ERR(0, 353, __pyx_L1_error)
-          }
-
-          /* "graphsaint/cython_sampler.pyx":351
- *                 idepth = 0
- *                 while idepth < self.size_depth:
- *                     if (self.adj_indptr_vec[v+1]-self.adj_indptr_vec[v]>0):             # <<<<<<<<<<<<<<
- *                         v = self.adj_indices_vec[self.adj_indptr_vec[v]+rand()%(self.adj_indptr_vec[v+1]-self.adj_indptr_vec[v])]
- *                         self.node_sampled[idx_subg].push_back(v)
- */
-        }
-
-        /* "graphsaint/cython_sampler.pyx":354
- *                         v = self.adj_indices_vec[self.adj_indptr_vec[v]+rand()%(self.adj_indptr_vec[v+1]-self.adj_indptr_vec[v])]
- *                         self.node_sampled[idx_subg].push_back(v)
- *                     idepth = idepth + 1             # <<<<<<<<<<<<<<
- *                 iroot = iroot + 1
- *             r = r + 1
- */
-        __pyx_v_idepth = (__pyx_v_idepth + 1);
-      }
-
-      /* "graphsaint/cython_sampler.pyx":355
- *                         self.node_sampled[idx_subg].push_back(v)
- *                     idepth = idepth + 1
- *                 iroot = iroot + 1             # <<<<<<<<<<<<<<
- *             r = r + 1
- *             sort(self.node_sampled[idx_subg].begin(),self.node_sampled[idx_subg].end())
- */
-      __pyx_v_iroot = (__pyx_v_iroot + 1);
-    }
-
-    /* "graphsaint/cython_sampler.pyx":356
- *                     idepth = idepth + 1
- *                 iroot = iroot + 1
- *             r = r + 1             # <<<<<<<<<<<<<<
- *             sort(self.node_sampled[idx_subg].begin(),self.node_sampled[idx_subg].end())
- *             self.node_sampled[idx_subg].erase(unique(self.node_sampled[idx_subg].begin(),self.node_sampled[idx_subg].end()),self.node_sampled[idx_subg].end())
- */
-    __pyx_v_r = (__pyx_v_r + 1);
-
-    /* "graphsaint/cython_sampler.pyx":357
- *                 iroot = iroot + 1
- *             r = r + 1
- *             sort(self.node_sampled[idx_subg].begin(),self.node_sampled[idx_subg].end())             # <<<<<<<<<<<<<<
- *             self.node_sampled[idx_subg].erase(unique(self.node_sampled[idx_subg].begin(),self.node_sampled[idx_subg].end()),self.node_sampled[idx_subg].end())
- * 
- */
-    std::sort<std::vector<int> ::iterator>((__pyx_v_self->__pyx_base.node_sampled[__pyx_v_idx_subg]).begin(), (__pyx_v_self->__pyx_base.node_sampled[__pyx_v_idx_subg]).end());
-
-    /* "graphsaint/cython_sampler.pyx":358
- *             r = r + 1
- *             sort(self.node_sampled[idx_subg].begin(),self.node_sampled[idx_subg].end())
- *             self.node_sampled[idx_subg].erase(unique(self.node_sampled[idx_subg].begin(),self.node_sampled[idx_subg].end()),self.node_sampled[idx_subg].end())             # <<<<<<<<<<<<<<
- * 
- * 
- */
-    (void)((__pyx_v_self->__pyx_base.node_sampled[__pyx_v_idx_subg]).erase(std::unique<std::vector<int> ::iterator>((__pyx_v_self->__pyx_base.node_sampled[__pyx_v_idx_subg]).begin(), (__pyx_v_self->__pyx_base.node_sampled[__pyx_v_idx_subg]).end()), (__pyx_v_self->__pyx_base.node_sampled[__pyx_v_idx_subg]).end()));
-  }
-
-  /* "graphsaint/cython_sampler.pyx":334
- *         self.size_depth = size_depth
- * 
- *     cdef void sample(self, int p) nogil:             # <<<<<<<<<<<<<<
- *         cdef int iroot = 0
- *         cdef int idepth = 0
- */
-
-  /* function exit code */
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_WriteUnraisable("graphsaint.cython_sampler.RW.sample", __pyx_clineno, __pyx_lineno, __pyx_filename, 1, 1);
-  __pyx_L0:;
-}
-
-/* "(tree fragment)":1
- * def __reduce_cython__(self):             # <<<<<<<<<<<<<<
- *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
- * def __setstate_cython__(self, __pyx_state):
- */
-
-/* Python wrapper */
-static PyObject *__pyx_pw_10graphsaint_14cython_sampler_2RW_3__reduce_cython__(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
-static PyObject *__pyx_pw_10graphsaint_14cython_sampler_2RW_3__reduce_cython__(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
-  PyObject *__pyx_r = 0;
-  __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("__reduce_cython__ (wrapper)", 0);
-  __pyx_r = __pyx_pf_10graphsaint_14cython_sampler_2RW_2__reduce_cython__(((struct __pyx_obj_10graphsaint_14cython_sampler_RW *)__pyx_v_self));
-
-  /* function exit code */
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-static PyObject *__pyx_pf_10graphsaint_14cython_sampler_2RW_2__reduce_cython__(CYTHON_UNUSED struct __pyx_obj_10graphsaint_14cython_sampler_RW *__pyx_v_self) {
-  PyObject *__pyx_r = NULL;
-  __Pyx_RefNannyDeclarations
-  PyObject *__pyx_t_1 = NULL;
-  int __pyx_lineno = 0;
-  const char *__pyx_filename = NULL;
-  int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("__reduce_cython__", 0);
-
-  /* "(tree fragment)":2
- * def __reduce_cython__(self):
- *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")             # <<<<<<<<<<<<<<
- * def __setstate_cython__(self, __pyx_state):
- *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
- */
-  __pyx_t_1 = __Pyx_PyObject_Call(__pyx_builtin_TypeError, __pyx_tuple__5, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 2, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __Pyx_Raise(__pyx_t_1, 0, 0, 0);
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __PYX_ERR(1, 2, __pyx_L1_error)
-
-  /* "(tree fragment)":1
- * def __reduce_cython__(self):             # <<<<<<<<<<<<<<
- *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
- * def __setstate_cython__(self, __pyx_state):
- */
-
-  /* function exit code */
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_AddTraceback("graphsaint.cython_sampler.RW.__reduce_cython__", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __pyx_r = NULL;
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "(tree fragment)":3
- * def __reduce_cython__(self):
- *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
- * def __setstate_cython__(self, __pyx_state):             # <<<<<<<<<<<<<<
- *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
- */
-
-/* Python wrapper */
-static PyObject *__pyx_pw_10graphsaint_14cython_sampler_2RW_5__setstate_cython__(PyObject *__pyx_v_self, PyObject *__pyx_v___pyx_state); /*proto*/
-static PyObject *__pyx_pw_10graphsaint_14cython_sampler_2RW_5__setstate_cython__(PyObject *__pyx_v_self, PyObject *__pyx_v___pyx_state) {
-  PyObject *__pyx_r = 0;
-  __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("__setstate_cython__ (wrapper)", 0);
-  __pyx_r = __pyx_pf_10graphsaint_14cython_sampler_2RW_4__setstate_cython__(((struct __pyx_obj_10graphsaint_14cython_sampler_RW *)__pyx_v_self), ((PyObject *)__pyx_v___pyx_state));
-
-  /* function exit code */
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-static PyObject *__pyx_pf_10graphsaint_14cython_sampler_2RW_4__setstate_cython__(CYTHON_UNUSED struct __pyx_obj_10graphsaint_14cython_sampler_RW *__pyx_v_self, CYTHON_UNUSED PyObject *__pyx_v___pyx_state) {
-  PyObject *__pyx_r = NULL;
-  __Pyx_RefNannyDeclarations
-  PyObject *__pyx_t_1 = NULL;
-  int __pyx_lineno = 0;
-  const char *__pyx_filename = NULL;
-  int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("__setstate_cython__", 0);
-
-  /* "(tree fragment)":4
- *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
- * def __setstate_cython__(self, __pyx_state):
- *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")             # <<<<<<<<<<<<<<
- */
-  __pyx_t_1 = __Pyx_PyObject_Call(__pyx_builtin_TypeError, __pyx_tuple__6, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 4, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __Pyx_Raise(__pyx_t_1, 0, 0, 0);
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __PYX_ERR(1, 4, __pyx_L1_error)
-
-  /* "(tree fragment)":3
- * def __reduce_cython__(self):
- *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
- * def __setstate_cython__(self, __pyx_state):             # <<<<<<<<<<<<<<
- *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
- */
-
-  /* function exit code */
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_AddTraceback("graphsaint.cython_sampler.RW.__setstate_cython__", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __pyx_r = NULL;
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "graphsaint/cython_sampler.pyx":369
- *     cdef vector[int] col_train_vec
- *     cdef vector[float] prob_edge_vec
- *     def __cinit__(self, np.ndarray[int,ndim=1,mode='c'] adj_indptr,             # <<<<<<<<<<<<<<
- *                         np.ndarray[int,ndim=1,mode='c'] adj_indices,
- *                         np.ndarray[int,ndim=1,mode='c'] node_train,
- */
-
-/* Python wrapper */
-static int __pyx_pw_10graphsaint_14cython_sampler_4Edge_1__cinit__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static int __pyx_pw_10graphsaint_14cython_sampler_4Edge_1__cinit__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
-  CYTHON_UNUSED PyArrayObject *__pyx_v_adj_indptr = 0;
-  CYTHON_UNUSED PyArrayObject *__pyx_v_adj_indices = 0;
-  CYTHON_UNUSED PyArrayObject *__pyx_v_node_train = 0;
-  CYTHON_UNUSED int __pyx_v_num_proc;
-  CYTHON_UNUSED int __pyx_v_num_sample_per_proc;
-  PyArrayObject *__pyx_v_row_train = 0;
-  PyArrayObject *__pyx_v_col_train = 0;
-  PyArrayObject *__pyx_v_prob_edge = 0;
-  CYTHON_UNUSED PyObject *__pyx_v_argv = 0;
-  int __pyx_lineno = 0;
-  const char *__pyx_filename = NULL;
-  int __pyx_clineno = 0;
-  int __pyx_r;
-  __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("__cinit__ (wrapper)", 0);
-  if (PyTuple_GET_SIZE(__pyx_args) > 8) {
-    __pyx_v_argv = PyTuple_GetSlice(__pyx_args, 8, PyTuple_GET_SIZE(__pyx_args));
-    if (unlikely(!__pyx_v_argv)) {
-      __Pyx_RefNannyFinishContext();
-      return -1;
-    }
-    __Pyx_GOTREF(__pyx_v_argv);
-  } else {
-    __pyx_v_argv = __pyx_empty_tuple; __Pyx_INCREF(__pyx_empty_tuple);
-  }
-  {
-    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_adj_indptr,&__pyx_n_s_adj_indices,&__pyx_n_s_node_train,&__pyx_n_s_num_proc,&__pyx_n_s_num_sample_per_proc,&__pyx_n_s_row_train,&__pyx_n_s_col_train,&__pyx_n_s_prob_edge,0};
-    PyObject* values[8] = {0,0,0,0,0,0,0,0};
-    if (unlikely(__pyx_kwds)) {
-      Py_ssize_t kw_args;
-      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
-      switch (pos_args) {
-        default:
-        case  8: values[7] = PyTuple_GET_ITEM(__pyx_args, 7);
-        CYTHON_FALLTHROUGH;
-        case  7: values[6] = PyTuple_GET_ITEM(__pyx_args, 6);
-        CYTHON_FALLTHROUGH;
-        case  6: values[5] = PyTuple_GET_ITEM(__pyx_args, 5);
-        CYTHON_FALLTHROUGH;
-        case  5: values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
-        CYTHON_FALLTHROUGH;
-        case  4: values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
-        CYTHON_FALLTHROUGH;
-        case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
-        CYTHON_FALLTHROUGH;
-        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
-        CYTHON_FALLTHROUGH;
-        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
-        CYTHON_FALLTHROUGH;
-        case  0: break;
-      }
-      kw_args = PyDict_Size(__pyx_kwds);
-      switch (pos_args) {
-        case  0:
-        if (likely((values[0] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_adj_indptr)) != 0)) kw_args--;
-        else goto __pyx_L5_argtuple_error;
-        CYTHON_FALLTHROUGH;
-        case  1:
-        if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_adj_indices)) != 0)) kw_args--;
-        else {
-          __Pyx_RaiseArgtupleInvalid("__cinit__", 0, 8, 8, 1); __PYX_ERR(0, 369, __pyx_L3_error)
-        }
-        CYTHON_FALLTHROUGH;
-        case  2:
-        if (likely((values[2] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_node_train)) != 0)) kw_args--;
-        else {
-          __Pyx_RaiseArgtupleInvalid("__cinit__", 0, 8, 8, 2); __PYX_ERR(0, 369, __pyx_L3_error)
-        }
-        CYTHON_FALLTHROUGH;
-        case  3:
-        if (likely((values[3] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_num_proc)) != 0)) kw_args--;
-        else {
-          __Pyx_RaiseArgtupleInvalid("__cinit__", 0, 8, 8, 3); __PYX_ERR(0, 369, __pyx_L3_error)
-        }
-        CYTHON_FALLTHROUGH;
-        case  4:
-        if (likely((values[4] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_num_sample_per_proc)) != 0)) kw_args--;
-        else {
-          __Pyx_RaiseArgtupleInvalid("__cinit__", 0, 8, 8, 4); __PYX_ERR(0, 369, __pyx_L3_error)
-        }
-        CYTHON_FALLTHROUGH;
-        case  5:
-        if (likely((values[5] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_row_train)) != 0)) kw_args--;
-        else {
-          __Pyx_RaiseArgtupleInvalid("__cinit__", 0, 8, 8, 5); __PYX_ERR(0, 369, __pyx_L3_error)
-        }
-        CYTHON_FALLTHROUGH;
-        case  6:
-        if (likely((values[6] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_col_train)) != 0)) kw_args--;
-        else {
-          __Pyx_RaiseArgtupleInvalid("__cinit__", 0, 8, 8, 6); __PYX_ERR(0, 369, __pyx_L3_error)
-        }
-        CYTHON_FALLTHROUGH;
-        case  7:
-        if (likely((values[7] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_prob_edge)) != 0)) kw_args--;
-        else {
-          __Pyx_RaiseArgtupleInvalid("__cinit__", 0, 8, 8, 7); __PYX_ERR(0, 369, __pyx_L3_error)
-        }
-      }
-      if (unlikely(kw_args > 0)) {
-        const Py_ssize_t used_pos_args = (pos_args < 8) ? pos_args : 8;
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, used_pos_args, "__cinit__") < 0)) __PYX_ERR(0, 369, __pyx_L3_error)
-      }
-    } else if (PyTuple_GET_SIZE(__pyx_args) < 8) {
-      goto __pyx_L5_argtuple_error;
-    } else {
-      values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
-      values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
-      values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
-      values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
-      values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
-      values[5] = PyTuple_GET_ITEM(__pyx_args, 5);
-      values[6] = PyTuple_GET_ITEM(__pyx_args, 6);
-      values[7] = PyTuple_GET_ITEM(__pyx_args, 7);
-    }
-    __pyx_v_adj_indptr = ((PyArrayObject *)values[0]);
-    __pyx_v_adj_indices = ((PyArrayObject *)values[1]);
-    __pyx_v_node_train = ((PyArrayObject *)values[2]);
-    __pyx_v_num_proc = __Pyx_PyInt_As_int(values[3]); if (unlikely((__pyx_v_num_proc == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 372, __pyx_L3_error)
-    __pyx_v_num_sample_per_proc = __Pyx_PyInt_As_int(values[4]); if (unlikely((__pyx_v_num_sample_per_proc == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 372, __pyx_L3_error)
-    __pyx_v_row_train = ((PyArrayObject *)values[5]);
-    __pyx_v_col_train = ((PyArrayObject *)values[6]);
-    __pyx_v_prob_edge = ((PyArrayObject *)values[7]);
-  }
-  goto __pyx_L4_argument_unpacking_done;
-  __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("__cinit__", 0, 8, 8, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 369, __pyx_L3_error)
-  __pyx_L3_error:;
-  __Pyx_DECREF(__pyx_v_argv); __pyx_v_argv = 0;
-  __Pyx_AddTraceback("graphsaint.cython_sampler.Edge.__cinit__", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __Pyx_RefNannyFinishContext();
-  return -1;
-  __pyx_L4_argument_unpacking_done:;
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_adj_indptr), __pyx_ptype_5numpy_ndarray, 1, "adj_indptr", 0))) __PYX_ERR(0, 369, __pyx_L1_error)
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_adj_indices), __pyx_ptype_5numpy_ndarray, 1, "adj_indices", 0))) __PYX_ERR(0, 370, __pyx_L1_error)
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_node_train), __pyx_ptype_5numpy_ndarray, 1, "node_train", 0))) __PYX_ERR(0, 371, __pyx_L1_error)
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_row_train), __pyx_ptype_5numpy_ndarray, 1, "row_train", 0))) __PYX_ERR(0, 373, __pyx_L1_error)
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_col_train), __pyx_ptype_5numpy_ndarray, 1, "col_train", 0))) __PYX_ERR(0, 374, __pyx_L1_error)
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_prob_edge), __pyx_ptype_5numpy_ndarray, 1, "prob_edge", 0))) __PYX_ERR(0, 375, __pyx_L1_error)
-  __pyx_r = __pyx_pf_10graphsaint_14cython_sampler_4Edge___cinit__(((struct __pyx_obj_10graphsaint_14cython_sampler_Edge *)__pyx_v_self), __pyx_v_adj_indptr, __pyx_v_adj_indices, __pyx_v_node_train, __pyx_v_num_proc, __pyx_v_num_sample_per_proc, __pyx_v_row_train, __pyx_v_col_train, __pyx_v_prob_edge, __pyx_v_argv);
-
-  /* function exit code */
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __pyx_r = -1;
-  __pyx_L0:;
-  __Pyx_XDECREF(__pyx_v_argv);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-static int __pyx_pf_10graphsaint_14cython_sampler_4Edge___cinit__(struct __pyx_obj_10graphsaint_14cython_sampler_Edge *__pyx_v_self, CYTHON_UNUSED PyArrayObject *__pyx_v_adj_indptr, CYTHON_UNUSED PyArrayObject *__pyx_v_adj_indices, CYTHON_UNUSED PyArrayObject *__pyx_v_node_train, CYTHON_UNUSED int __pyx_v_num_proc, CYTHON_UNUSED int __pyx_v_num_sample_per_proc, PyArrayObject *__pyx_v_row_train, PyArrayObject *__pyx_v_col_train, PyArrayObject *__pyx_v_prob_edge, CYTHON_UNUSED PyObject *__pyx_v_argv) {
-  __Pyx_LocalBuf_ND __pyx_pybuffernd_adj_indices;
-  __Pyx_Buffer __pyx_pybuffer_adj_indices;
-  __Pyx_LocalBuf_ND __pyx_pybuffernd_adj_indptr;
-  __Pyx_Buffer __pyx_pybuffer_adj_indptr;
-  __Pyx_LocalBuf_ND __pyx_pybuffernd_col_train;
-  __Pyx_Buffer __pyx_pybuffer_col_train;
-  __Pyx_LocalBuf_ND __pyx_pybuffernd_node_train;
-  __Pyx_Buffer __pyx_pybuffer_node_train;
-  __Pyx_LocalBuf_ND __pyx_pybuffernd_prob_edge;
-  __Pyx_Buffer __pyx_pybuffer_prob_edge;
-  __Pyx_LocalBuf_ND __pyx_pybuffernd_row_train;
-  __Pyx_Buffer __pyx_pybuffer_row_train;
-  int __pyx_r;
-  __Pyx_RefNannyDeclarations
-  int __pyx_lineno = 0;
-  const char *__pyx_filename = NULL;
-  int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("__cinit__", 0);
-  __pyx_pybuffer_adj_indptr.pybuffer.buf = NULL;
-  __pyx_pybuffer_adj_indptr.refcount = 0;
-  __pyx_pybuffernd_adj_indptr.data = NULL;
-  __pyx_pybuffernd_adj_indptr.rcbuffer = &__pyx_pybuffer_adj_indptr;
-  __pyx_pybuffer_adj_indices.pybuffer.buf = NULL;
-  __pyx_pybuffer_adj_indices.refcount = 0;
-  __pyx_pybuffernd_adj_indices.data = NULL;
-  __pyx_pybuffernd_adj_indices.rcbuffer = &__pyx_pybuffer_adj_indices;
-  __pyx_pybuffer_node_train.pybuffer.buf = NULL;
-  __pyx_pybuffer_node_train.refcount = 0;
-  __pyx_pybuffernd_node_train.data = NULL;
-  __pyx_pybuffernd_node_train.rcbuffer = &__pyx_pybuffer_node_train;
-  __pyx_pybuffer_row_train.pybuffer.buf = NULL;
-  __pyx_pybuffer_row_train.refcount = 0;
-  __pyx_pybuffernd_row_train.data = NULL;
-  __pyx_pybuffernd_row_train.rcbuffer = &__pyx_pybuffer_row_train;
-  __pyx_pybuffer_col_train.pybuffer.buf = NULL;
-  __pyx_pybuffer_col_train.refcount = 0;
-  __pyx_pybuffernd_col_train.data = NULL;
-  __pyx_pybuffernd_col_train.rcbuffer = &__pyx_pybuffer_col_train;
-  __pyx_pybuffer_prob_edge.pybuffer.buf = NULL;
-  __pyx_pybuffer_prob_edge.refcount = 0;
-  __pyx_pybuffernd_prob_edge.data = NULL;
-  __pyx_pybuffernd_prob_edge.rcbuffer = &__pyx_pybuffer_prob_edge;
-  {
-    __Pyx_BufFmt_StackElem __pyx_stack[1];
-    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_adj_indptr.rcbuffer->pybuffer, (PyObject*)__pyx_v_adj_indptr, &__Pyx_TypeInfo_int, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 369, __pyx_L1_error)
-  }
-  __pyx_pybuffernd_adj_indptr.diminfo[0].strides = __pyx_pybuffernd_adj_indptr.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_adj_indptr.diminfo[0].shape = __pyx_pybuffernd_adj_indptr.rcbuffer->pybuffer.shape[0];
-  {
-    __Pyx_BufFmt_StackElem __pyx_stack[1];
-    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_adj_indices.rcbuffer->pybuffer, (PyObject*)__pyx_v_adj_indices, &__Pyx_TypeInfo_int, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 369, __pyx_L1_error)
-  }
-  __pyx_pybuffernd_adj_indices.diminfo[0].strides = __pyx_pybuffernd_adj_indices.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_adj_indices.diminfo[0].shape = __pyx_pybuffernd_adj_indices.rcbuffer->pybuffer.shape[0];
-  {
-    __Pyx_BufFmt_StackElem __pyx_stack[1];
-    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_node_train.rcbuffer->pybuffer, (PyObject*)__pyx_v_node_train, &__Pyx_TypeInfo_int, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 369, __pyx_L1_error)
-  }
-  __pyx_pybuffernd_node_train.diminfo[0].strides = __pyx_pybuffernd_node_train.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_node_train.diminfo[0].shape = __pyx_pybuffernd_node_train.rcbuffer->pybuffer.shape[0];
-  {
-    __Pyx_BufFmt_StackElem __pyx_stack[1];
-    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_row_train.rcbuffer->pybuffer, (PyObject*)__pyx_v_row_train, &__Pyx_TypeInfo_int, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 369, __pyx_L1_error)
-  }
-  __pyx_pybuffernd_row_train.diminfo[0].strides = __pyx_pybuffernd_row_train.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_row_train.diminfo[0].shape = __pyx_pybuffernd_row_train.rcbuffer->pybuffer.shape[0];
-  {
-    __Pyx_BufFmt_StackElem __pyx_stack[1];
-    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_col_train.rcbuffer->pybuffer, (PyObject*)__pyx_v_col_train, &__Pyx_TypeInfo_int, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 369, __pyx_L1_error)
-  }
-  __pyx_pybuffernd_col_train.diminfo[0].strides = __pyx_pybuffernd_col_train.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_col_train.diminfo[0].shape = __pyx_pybuffernd_col_train.rcbuffer->pybuffer.shape[0];
-  {
-    __Pyx_BufFmt_StackElem __pyx_stack[1];
-    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_prob_edge.rcbuffer->pybuffer, (PyObject*)__pyx_v_prob_edge, &__Pyx_TypeInfo_float, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 369, __pyx_L1_error)
-  }
-  __pyx_pybuffernd_prob_edge.diminfo[0].strides = __pyx_pybuffernd_prob_edge.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_prob_edge.diminfo[0].shape = __pyx_pybuffernd_prob_edge.rcbuffer->pybuffer.shape[0];
-
-  /* "graphsaint/cython_sampler.pyx":376
- *                         np.ndarray[int,ndim=1,mode='c'] col_train,
- *                         np.ndarray[float,ndim=1,mode='c'] prob_edge,*argv):
- *         cutils.npy2vec_int(row_train,self.row_train_vec)             # <<<<<<<<<<<<<<
- *         cutils.npy2vec_int(col_train,self.col_train_vec)
- *         cutils.npy2vec_float(prob_edge,self.prob_edge_vec)
- */
-  __pyx_f_10graphsaint_12cython_utils_npy2vec_int(((PyArrayObject *)__pyx_v_row_train), __pyx_v_self->row_train_vec);
-
-  /* "graphsaint/cython_sampler.pyx":377
- *                         np.ndarray[float,ndim=1,mode='c'] prob_edge,*argv):
- *         cutils.npy2vec_int(row_train,self.row_train_vec)
- *         cutils.npy2vec_int(col_train,self.col_train_vec)             # <<<<<<<<<<<<<<
- *         cutils.npy2vec_float(prob_edge,self.prob_edge_vec)
- * 
- */
-  __pyx_f_10graphsaint_12cython_utils_npy2vec_int(((PyArrayObject *)__pyx_v_col_train), __pyx_v_self->col_train_vec);
-
-  /* "graphsaint/cython_sampler.pyx":378
- *         cutils.npy2vec_int(row_train,self.row_train_vec)
- *         cutils.npy2vec_int(col_train,self.col_train_vec)
- *         cutils.npy2vec_float(prob_edge,self.prob_edge_vec)             # <<<<<<<<<<<<<<
- * 
- *     cdef void sample(self, int p) nogil:
- */
-  __pyx_f_10graphsaint_12cython_utils_npy2vec_float(((PyArrayObject *)__pyx_v_prob_edge), __pyx_v_self->prob_edge_vec);
-
-  /* "graphsaint/cython_sampler.pyx":369
- *     cdef vector[int] col_train_vec
- *     cdef vector[float] prob_edge_vec
- *     def __cinit__(self, np.ndarray[int,ndim=1,mode='c'] adj_indptr,             # <<<<<<<<<<<<<<
- *                         np.ndarray[int,ndim=1,mode='c'] adj_indices,
- *                         np.ndarray[int,ndim=1,mode='c'] node_train,
- */
-
-  /* function exit code */
-  __pyx_r = 0;
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  { PyObject *__pyx_type, *__pyx_value, *__pyx_tb;
-    __Pyx_PyThreadState_declare
-    __Pyx_PyThreadState_assign
-    __Pyx_ErrFetch(&__pyx_type, &__pyx_value, &__pyx_tb);
-    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_adj_indices.rcbuffer->pybuffer);
-    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_adj_indptr.rcbuffer->pybuffer);
-    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_col_train.rcbuffer->pybuffer);
-    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_node_train.rcbuffer->pybuffer);
-    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_prob_edge.rcbuffer->pybuffer);
-    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_row_train.rcbuffer->pybuffer);
-  __Pyx_ErrRestore(__pyx_type, __pyx_value, __pyx_tb);}
-  __Pyx_AddTraceback("graphsaint.cython_sampler.Edge.__cinit__", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __pyx_r = -1;
-  goto __pyx_L2;
-  __pyx_L0:;
-  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_adj_indices.rcbuffer->pybuffer);
-  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_adj_indptr.rcbuffer->pybuffer);
-  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_col_train.rcbuffer->pybuffer);
-  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_node_train.rcbuffer->pybuffer);
-  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_prob_edge.rcbuffer->pybuffer);
-  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_row_train.rcbuffer->pybuffer);
-  __pyx_L2:;
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "graphsaint/cython_sampler.pyx":380
- *         cutils.npy2vec_float(prob_edge,self.prob_edge_vec)
- * 
- *     cdef void sample(self, int p) nogil:             # <<<<<<<<<<<<<<
- *         cdef int num_edge = self.row_train_vec.size()
- *         cdef int i=0
- */
-
-static void __pyx_f_10graphsaint_14cython_sampler_4Edge_sample(struct __pyx_obj_10graphsaint_14cython_sampler_Edge *__pyx_v_self, int __pyx_v_p) {
-  int __pyx_v_num_edge;
-  int __pyx_v_i;
-  float __pyx_v_ran;
-  int __pyx_v_g;
-  int __pyx_v_idx_subg;
-  int __pyx_t_1;
-  float __pyx_t_2;
-  int __pyx_lineno = 0;
-  const char *__pyx_filename = NULL;
-  int __pyx_clineno = 0;
-
-  /* "graphsaint/cython_sampler.pyx":381
- * 
- *     cdef void sample(self, int p) nogil:
- *         cdef int num_edge = self.row_train_vec.size()             # <<<<<<<<<<<<<<
- *         cdef int i=0
- *         cdef float ran=0.
- */
-  __pyx_v_num_edge = __pyx_v_self->row_train_vec.size();
-
-  /* "graphsaint/cython_sampler.pyx":382
- *     cdef void sample(self, int p) nogil:
- *         cdef int num_edge = self.row_train_vec.size()
- *         cdef int i=0             # <<<<<<<<<<<<<<
- *         cdef float ran=0.
- *         cdef int g=0
- */
-  __pyx_v_i = 0;
-
-  /* "graphsaint/cython_sampler.pyx":383
- *         cdef int num_edge = self.row_train_vec.size()
- *         cdef int i=0
- *         cdef float ran=0.             # <<<<<<<<<<<<<<
- *         cdef int g=0
- *         cdef int idx_subg
- */
-  __pyx_v_ran = 0.;
-
-  /* "graphsaint/cython_sampler.pyx":384
- *         cdef int i=0
- *         cdef float ran=0.
- *         cdef int g=0             # <<<<<<<<<<<<<<
- *         cdef int idx_subg
- *         while g < self.num_sample_per_proc:
- */
-  __pyx_v_g = 0;
-
-  /* "graphsaint/cython_sampler.pyx":386
- *         cdef int g=0
- *         cdef int idx_subg
- *         while g < self.num_sample_per_proc:             # <<<<<<<<<<<<<<
- *             idx_subg = p*self.num_sample_per_proc+g
- *             i = 0
- */
-  while (1) {
-    __pyx_t_1 = ((__pyx_v_g < __pyx_v_self->__pyx_base.num_sample_per_proc) != 0);
-    if (!__pyx_t_1) break;
-
-    /* "graphsaint/cython_sampler.pyx":387
- *         cdef int idx_subg
- *         while g < self.num_sample_per_proc:
- *             idx_subg = p*self.num_sample_per_proc+g             # <<<<<<<<<<<<<<
- *             i = 0
- *             while i < num_edge:
- */
-    __pyx_v_idx_subg = ((__pyx_v_p * __pyx_v_self->__pyx_base.num_sample_per_proc) + __pyx_v_g);
-
-    /* "graphsaint/cython_sampler.pyx":388
- *         while g < self.num_sample_per_proc:
- *             idx_subg = p*self.num_sample_per_proc+g
- *             i = 0             # <<<<<<<<<<<<<<
- *             while i < num_edge:
- *                 ran = (<float> rand()) / RAND_MAX
- */
-    __pyx_v_i = 0;
-
-    /* "graphsaint/cython_sampler.pyx":389
- *             idx_subg = p*self.num_sample_per_proc+g
- *             i = 0
- *             while i < num_edge:             # <<<<<<<<<<<<<<
- *                 ran = (<float> rand()) / RAND_MAX
- *                 if ran > self.prob_edge_vec[i]:
- */
-    while (1) {
-      __pyx_t_1 = ((__pyx_v_i < __pyx_v_num_edge) != 0);
-      if (!__pyx_t_1) break;
-
-      /* "graphsaint/cython_sampler.pyx":390
- *             i = 0
- *             while i < num_edge:
- *                 ran = (<float> rand()) / RAND_MAX             # <<<<<<<<<<<<<<
- *                 if ran > self.prob_edge_vec[i]:
- *                     # edge not selected
- */
-      __pyx_t_2 = ((float)rand());
-      if (unlikely(RAND_MAX == 0)) {
-        #ifdef WITH_THREAD
-        PyGILState_STATE __pyx_gilstate_save = __Pyx_PyGILState_Ensure();
-        #endif
-        PyErr_SetString(PyExc_ZeroDivisionError, "float division");
-        #ifdef WITH_THREAD
-        __Pyx_PyGILState_Release(__pyx_gilstate_save);
-        #endif
-        __PYX_ERR(0, 390, __pyx_L1_error)
-      }
-      __pyx_v_ran = (__pyx_t_2 / ((float)RAND_MAX));
-
-      /* "graphsaint/cython_sampler.pyx":391
- *             while i < num_edge:
- *                 ran = (<float> rand()) / RAND_MAX
- *                 if ran > self.prob_edge_vec[i]:             # <<<<<<<<<<<<<<
- *                     # edge not selected
- *                     i = i + 1
- */
-      __pyx_t_1 = ((__pyx_v_ran > (__pyx_v_self->prob_edge_vec[__pyx_v_i])) != 0);
-      if (__pyx_t_1) {
-
-        /* "graphsaint/cython_sampler.pyx":393
- *                 if ran > self.prob_edge_vec[i]:
- *                     # edge not selected
- *                     i = i + 1             # <<<<<<<<<<<<<<
- *                     continue
- *                 self.node_sampled[idx_subg].push_back(self.row_train_vec[i])
- */
-        __pyx_v_i = (__pyx_v_i + 1);
-
-        /* "graphsaint/cython_sampler.pyx":394
- *                     # edge not selected
- *                     i = i + 1
- *                     continue             # <<<<<<<<<<<<<<
- *                 self.node_sampled[idx_subg].push_back(self.row_train_vec[i])
- *                 self.node_sampled[idx_subg].push_back(self.col_train_vec[i])
- */
-        goto __pyx_L5_continue;
-
-        /* "graphsaint/cython_sampler.pyx":391
- *             while i < num_edge:
- *                 ran = (<float> rand()) / RAND_MAX
- *                 if ran > self.prob_edge_vec[i]:             # <<<<<<<<<<<<<<
- *                     # edge not selected
- *                     i = i + 1
- */
-      }
-
-      /* "graphsaint/cython_sampler.pyx":395
- *                     i = i + 1
- *                     continue
- *                 self.node_sampled[idx_subg].push_back(self.row_train_vec[i])             # <<<<<<<<<<<<<<
- *                 self.node_sampled[idx_subg].push_back(self.col_train_vec[i])
- *                 i = i + 1
- */
-      try {
-        (__pyx_v_self->__pyx_base.node_sampled[__pyx_v_idx_subg]).push_back((__pyx_v_self->row_train_vec[__pyx_v_i]));
-      } catch(...) {
-        #ifdef WITH_THREAD
-        PyGILState_STATE __pyx_gilstate_save = __Pyx_PyGILState_Ensure();
-        #endif
-        __Pyx_CppExn2PyErr();
-        #ifdef WITH_THREAD
-        __Pyx_PyGILState_Release(__pyx_gilstate_save);
-        #endif
-        __PYX_ERR(0, 395, __pyx_L1_error)
-      }
-
-      /* "graphsaint/cython_sampler.pyx":396
- *                     continue
- *                 self.node_sampled[idx_subg].push_back(self.row_train_vec[i])
- *                 self.node_sampled[idx_subg].push_back(self.col_train_vec[i])             # <<<<<<<<<<<<<<
- *                 i = i + 1
- *             sort(self.node_sampled[idx_subg].begin(),self.node_sampled[idx_subg].end())
- */
-      try {
-        (__pyx_v_self->__pyx_base.node_sampled[__pyx_v_idx_subg]).push_back((__pyx_v_self->col_train_vec[__pyx_v_i]));
-      } catch(...) {
-        #ifdef WITH_THREAD
-        PyGILState_STATE __pyx_gilstate_save = __Pyx_PyGILState_Ensure();
-        #endif
-        __Pyx_CppExn2PyErr();
-        #ifdef WITH_THREAD
-        __Pyx_PyGILState_Release(__pyx_gilstate_save);
-        #endif
-        __PYX_ERR(0, 396, __pyx_L1_error)
-      }
-
-      /* "graphsaint/cython_sampler.pyx":397
- *                 self.node_sampled[idx_subg].push_back(self.row_train_vec[i])
- *                 self.node_sampled[idx_subg].push_back(self.col_train_vec[i])
- *                 i = i + 1             # <<<<<<<<<<<<<<
- *             sort(self.node_sampled[idx_subg].begin(),self.node_sampled[idx_subg].end())
- *             self.node_sampled[idx_subg].erase(unique(self.node_sampled[idx_subg].begin(),self.node_sampled[idx_subg].end()),self.node_sampled[idx_subg].end())
- */
-      __pyx_v_i = (__pyx_v_i + 1);
-      __pyx_L5_continue:;
-    }
-
-    /* "graphsaint/cython_sampler.pyx":398
- *                 self.node_sampled[idx_subg].push_back(self.col_train_vec[i])
- *                 i = i + 1
- *             sort(self.node_sampled[idx_subg].begin(),self.node_sampled[idx_subg].end())             # <<<<<<<<<<<<<<
- *             self.node_sampled[idx_subg].erase(unique(self.node_sampled[idx_subg].begin(),self.node_sampled[idx_subg].end()),self.node_sampled[idx_subg].end())
- *             g = g + 1
- */
-    std::sort<std::vector<int> ::iterator>((__pyx_v_self->__pyx_base.node_sampled[__pyx_v_idx_subg]).begin(), (__pyx_v_self->__pyx_base.node_sampled[__pyx_v_idx_subg]).end());
-
-    /* "graphsaint/cython_sampler.pyx":399
- *                 i = i + 1
- *             sort(self.node_sampled[idx_subg].begin(),self.node_sampled[idx_subg].end())
- *             self.node_sampled[idx_subg].erase(unique(self.node_sampled[idx_subg].begin(),self.node_sampled[idx_subg].end()),self.node_sampled[idx_subg].end())             # <<<<<<<<<<<<<<
- *             g = g + 1
- * 
- */
-    (void)((__pyx_v_self->__pyx_base.node_sampled[__pyx_v_idx_subg]).erase(std::unique<std::vector<int> ::iterator>((__pyx_v_self->__pyx_base.node_sampled[__pyx_v_idx_subg]).begin(), (__pyx_v_self->__pyx_base.node_sampled[__pyx_v_idx_subg]).end()), (__pyx_v_self->__pyx_base.node_sampled[__pyx_v_idx_subg]).end()));
-
-    /* "graphsaint/cython_sampler.pyx":400
- *             sort(self.node_sampled[idx_subg].begin(),self.node_sampled[idx_subg].end())
- *             self.node_sampled[idx_subg].erase(unique(self.node_sampled[idx_subg].begin(),self.node_sampled[idx_subg].end()),self.node_sampled[idx_subg].end())
- *             g = g + 1             # <<<<<<<<<<<<<<
- * 
- * 
- */
-    __pyx_v_g = (__pyx_v_g + 1);
-  }
-
-  /* "graphsaint/cython_sampler.pyx":380
- *         cutils.npy2vec_float(prob_edge,self.prob_edge_vec)
- * 
- *     cdef void sample(self, int p) nogil:             # <<<<<<<<<<<<<<
- *         cdef int num_edge = self.row_train_vec.size()
- *         cdef int i=0
- */
-
-  /* function exit code */
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_WriteUnraisable("graphsaint.cython_sampler.Edge.sample", __pyx_clineno, __pyx_lineno, __pyx_filename, 1, 1);
-  __pyx_L0:;
-}
-
-/* "(tree fragment)":1
- * def __reduce_cython__(self):             # <<<<<<<<<<<<<<
- *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
- * def __setstate_cython__(self, __pyx_state):
- */
-
-/* Python wrapper */
-static PyObject *__pyx_pw_10graphsaint_14cython_sampler_4Edge_3__reduce_cython__(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
-static PyObject *__pyx_pw_10graphsaint_14cython_sampler_4Edge_3__reduce_cython__(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
-  PyObject *__pyx_r = 0;
-  __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("__reduce_cython__ (wrapper)", 0);
-  __pyx_r = __pyx_pf_10graphsaint_14cython_sampler_4Edge_2__reduce_cython__(((struct __pyx_obj_10graphsaint_14cython_sampler_Edge *)__pyx_v_self));
-
-  /* function exit code */
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-static PyObject *__pyx_pf_10graphsaint_14cython_sampler_4Edge_2__reduce_cython__(CYTHON_UNUSED struct __pyx_obj_10graphsaint_14cython_sampler_Edge *__pyx_v_self) {
-  PyObject *__pyx_r = NULL;
-  __Pyx_RefNannyDeclarations
-  PyObject *__pyx_t_1 = NULL;
-  int __pyx_lineno = 0;
-  const char *__pyx_filename = NULL;
-  int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("__reduce_cython__", 0);
-
-  /* "(tree fragment)":2
- * def __reduce_cython__(self):
- *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")             # <<<<<<<<<<<<<<
- * def __setstate_cython__(self, __pyx_state):
- *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
- */
-  __pyx_t_1 = __Pyx_PyObject_Call(__pyx_builtin_TypeError, __pyx_tuple__7, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 2, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __Pyx_Raise(__pyx_t_1, 0, 0, 0);
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __PYX_ERR(1, 2, __pyx_L1_error)
-
-  /* "(tree fragment)":1
- * def __reduce_cython__(self):             # <<<<<<<<<<<<<<
- *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
- * def __setstate_cython__(self, __pyx_state):
- */
-
-  /* function exit code */
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_AddTraceback("graphsaint.cython_sampler.Edge.__reduce_cython__", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __pyx_r = NULL;
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "(tree fragment)":3
- * def __reduce_cython__(self):
- *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
- * def __setstate_cython__(self, __pyx_state):             # <<<<<<<<<<<<<<
- *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
- */
-
-/* Python wrapper */
-static PyObject *__pyx_pw_10graphsaint_14cython_sampler_4Edge_5__setstate_cython__(PyObject *__pyx_v_self, PyObject *__pyx_v___pyx_state); /*proto*/
-static PyObject *__pyx_pw_10graphsaint_14cython_sampler_4Edge_5__setstate_cython__(PyObject *__pyx_v_self, PyObject *__pyx_v___pyx_state) {
-  PyObject *__pyx_r = 0;
-  __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("__setstate_cython__ (wrapper)", 0);
-  __pyx_r = __pyx_pf_10graphsaint_14cython_sampler_4Edge_4__setstate_cython__(((struct __pyx_obj_10graphsaint_14cython_sampler_Edge *)__pyx_v_self), ((PyObject *)__pyx_v___pyx_state));
-
-  /* function exit code */
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-static PyObject *__pyx_pf_10graphsaint_14cython_sampler_4Edge_4__setstate_cython__(CYTHON_UNUSED struct __pyx_obj_10graphsaint_14cython_sampler_Edge *__pyx_v_self, CYTHON_UNUSED PyObject *__pyx_v___pyx_state) {
-  PyObject *__pyx_r = NULL;
-  __Pyx_RefNannyDeclarations
-  PyObject *__pyx_t_1 = NULL;
-  int __pyx_lineno = 0;
-  const char *__pyx_filename = NULL;
-  int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("__setstate_cython__", 0);
-
-  /* "(tree fragment)":4
- *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
- * def __setstate_cython__(self, __pyx_state):
- *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")             # <<<<<<<<<<<<<<
- */
-  __pyx_t_1 = __Pyx_PyObject_Call(__pyx_builtin_TypeError, __pyx_tuple__8, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 4, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __Pyx_Raise(__pyx_t_1, 0, 0, 0);
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __PYX_ERR(1, 4, __pyx_L1_error)
-
-  /* "(tree fragment)":3
- * def __reduce_cython__(self):
- *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
- * def __setstate_cython__(self, __pyx_state):             # <<<<<<<<<<<<<<
- *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
- */
-
-  /* function exit code */
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_AddTraceback("graphsaint.cython_sampler.Edge.__setstate_cython__", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __pyx_r = NULL;
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "graphsaint/cython_sampler.pyx":411
- *     cdef vector[float] p_dist_cumsum_vec
- *     cdef int size_subg_e
- *     def __cinit__(self, np.ndarray[int,ndim=1,mode='c'] adj_indptr,             # <<<<<<<<<<<<<<
- *                         np.ndarray[int,ndim=1,mode='c'] adj_indices,
- *                         np.ndarray[int,ndim=1,mode='c'] node_train,
- */
-
-/* Python wrapper */
-static int __pyx_pw_10graphsaint_14cython_sampler_5Edge2_1__cinit__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static int __pyx_pw_10graphsaint_14cython_sampler_5Edge2_1__cinit__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
-  CYTHON_UNUSED PyArrayObject *__pyx_v_adj_indptr = 0;
-  CYTHON_UNUSED PyArrayObject *__pyx_v_adj_indices = 0;
-  CYTHON_UNUSED PyArrayObject *__pyx_v_node_train = 0;
-  CYTHON_UNUSED int __pyx_v_num_proc;
-  CYTHON_UNUSED int __pyx_v_num_sample_per_proc;
-  PyArrayObject *__pyx_v_row_train = 0;
-  PyArrayObject *__pyx_v_col_train = 0;
-  PyArrayObject *__pyx_v_p_dist_cumsum = 0;
-  int __pyx_v_size_subg_e;
-  int __pyx_lineno = 0;
-  const char *__pyx_filename = NULL;
-  int __pyx_clineno = 0;
-  int __pyx_r;
-  __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("__cinit__ (wrapper)", 0);
-  {
-    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_adj_indptr,&__pyx_n_s_adj_indices,&__pyx_n_s_node_train,&__pyx_n_s_num_proc,&__pyx_n_s_num_sample_per_proc,&__pyx_n_s_row_train,&__pyx_n_s_col_train,&__pyx_n_s_p_dist_cumsum,&__pyx_n_s_size_subg_e,0};
-    PyObject* values[9] = {0,0,0,0,0,0,0,0,0};
-    if (unlikely(__pyx_kwds)) {
-      Py_ssize_t kw_args;
-      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
-      switch (pos_args) {
-        case  9: values[8] = PyTuple_GET_ITEM(__pyx_args, 8);
-        CYTHON_FALLTHROUGH;
-        case  8: values[7] = PyTuple_GET_ITEM(__pyx_args, 7);
-        CYTHON_FALLTHROUGH;
-        case  7: values[6] = PyTuple_GET_ITEM(__pyx_args, 6);
-        CYTHON_FALLTHROUGH;
-        case  6: values[5] = PyTuple_GET_ITEM(__pyx_args, 5);
-        CYTHON_FALLTHROUGH;
-        case  5: values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
-        CYTHON_FALLTHROUGH;
-        case  4: values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
-        CYTHON_FALLTHROUGH;
-        case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
-        CYTHON_FALLTHROUGH;
-        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
-        CYTHON_FALLTHROUGH;
-        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
-        CYTHON_FALLTHROUGH;
-        case  0: break;
-        default: goto __pyx_L5_argtuple_error;
-      }
-      kw_args = PyDict_Size(__pyx_kwds);
-      switch (pos_args) {
-        case  0:
-        if (likely((values[0] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_adj_indptr)) != 0)) kw_args--;
-        else goto __pyx_L5_argtuple_error;
-        CYTHON_FALLTHROUGH;
-        case  1:
-        if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_adj_indices)) != 0)) kw_args--;
-        else {
-          __Pyx_RaiseArgtupleInvalid("__cinit__", 1, 9, 9, 1); __PYX_ERR(0, 411, __pyx_L3_error)
-        }
-        CYTHON_FALLTHROUGH;
-        case  2:
-        if (likely((values[2] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_node_train)) != 0)) kw_args--;
-        else {
-          __Pyx_RaiseArgtupleInvalid("__cinit__", 1, 9, 9, 2); __PYX_ERR(0, 411, __pyx_L3_error)
-        }
-        CYTHON_FALLTHROUGH;
-        case  3:
-        if (likely((values[3] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_num_proc)) != 0)) kw_args--;
-        else {
-          __Pyx_RaiseArgtupleInvalid("__cinit__", 1, 9, 9, 3); __PYX_ERR(0, 411, __pyx_L3_error)
-        }
-        CYTHON_FALLTHROUGH;
-        case  4:
-        if (likely((values[4] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_num_sample_per_proc)) != 0)) kw_args--;
-        else {
-          __Pyx_RaiseArgtupleInvalid("__cinit__", 1, 9, 9, 4); __PYX_ERR(0, 411, __pyx_L3_error)
-        }
-        CYTHON_FALLTHROUGH;
-        case  5:
-        if (likely((values[5] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_row_train)) != 0)) kw_args--;
-        else {
-          __Pyx_RaiseArgtupleInvalid("__cinit__", 1, 9, 9, 5); __PYX_ERR(0, 411, __pyx_L3_error)
-        }
-        CYTHON_FALLTHROUGH;
-        case  6:
-        if (likely((values[6] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_col_train)) != 0)) kw_args--;
-        else {
-          __Pyx_RaiseArgtupleInvalid("__cinit__", 1, 9, 9, 6); __PYX_ERR(0, 411, __pyx_L3_error)
-        }
-        CYTHON_FALLTHROUGH;
-        case  7:
-        if (likely((values[7] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_p_dist_cumsum)) != 0)) kw_args--;
-        else {
-          __Pyx_RaiseArgtupleInvalid("__cinit__", 1, 9, 9, 7); __PYX_ERR(0, 411, __pyx_L3_error)
-        }
-        CYTHON_FALLTHROUGH;
-        case  8:
-        if (likely((values[8] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_size_subg_e)) != 0)) kw_args--;
-        else {
-          __Pyx_RaiseArgtupleInvalid("__cinit__", 1, 9, 9, 8); __PYX_ERR(0, 411, __pyx_L3_error)
-        }
-      }
-      if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "__cinit__") < 0)) __PYX_ERR(0, 411, __pyx_L3_error)
-      }
-    } else if (PyTuple_GET_SIZE(__pyx_args) != 9) {
-      goto __pyx_L5_argtuple_error;
-    } else {
-      values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
-      values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
-      values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
-      values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
-      values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
-      values[5] = PyTuple_GET_ITEM(__pyx_args, 5);
-      values[6] = PyTuple_GET_ITEM(__pyx_args, 6);
-      values[7] = PyTuple_GET_ITEM(__pyx_args, 7);
-      values[8] = PyTuple_GET_ITEM(__pyx_args, 8);
-    }
-    __pyx_v_adj_indptr = ((PyArrayObject *)values[0]);
-    __pyx_v_adj_indices = ((PyArrayObject *)values[1]);
-    __pyx_v_node_train = ((PyArrayObject *)values[2]);
-    __pyx_v_num_proc = __Pyx_PyInt_As_int(values[3]); if (unlikely((__pyx_v_num_proc == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 414, __pyx_L3_error)
-    __pyx_v_num_sample_per_proc = __Pyx_PyInt_As_int(values[4]); if (unlikely((__pyx_v_num_sample_per_proc == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 414, __pyx_L3_error)
-    __pyx_v_row_train = ((PyArrayObject *)values[5]);
-    __pyx_v_col_train = ((PyArrayObject *)values[6]);
-    __pyx_v_p_dist_cumsum = ((PyArrayObject *)values[7]);
-    __pyx_v_size_subg_e = __Pyx_PyInt_As_int(values[8]); if (unlikely((__pyx_v_size_subg_e == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 418, __pyx_L3_error)
-  }
-  goto __pyx_L4_argument_unpacking_done;
-  __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("__cinit__", 1, 9, 9, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 411, __pyx_L3_error)
-  __pyx_L3_error:;
-  __Pyx_AddTraceback("graphsaint.cython_sampler.Edge2.__cinit__", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __Pyx_RefNannyFinishContext();
-  return -1;
-  __pyx_L4_argument_unpacking_done:;
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_adj_indptr), __pyx_ptype_5numpy_ndarray, 1, "adj_indptr", 0))) __PYX_ERR(0, 411, __pyx_L1_error)
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_adj_indices), __pyx_ptype_5numpy_ndarray, 1, "adj_indices", 0))) __PYX_ERR(0, 412, __pyx_L1_error)
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_node_train), __pyx_ptype_5numpy_ndarray, 1, "node_train", 0))) __PYX_ERR(0, 413, __pyx_L1_error)
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_row_train), __pyx_ptype_5numpy_ndarray, 1, "row_train", 0))) __PYX_ERR(0, 415, __pyx_L1_error)
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_col_train), __pyx_ptype_5numpy_ndarray, 1, "col_train", 0))) __PYX_ERR(0, 416, __pyx_L1_error)
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_p_dist_cumsum), __pyx_ptype_5numpy_ndarray, 1, "p_dist_cumsum", 0))) __PYX_ERR(0, 417, __pyx_L1_error)
-  __pyx_r = __pyx_pf_10graphsaint_14cython_sampler_5Edge2___cinit__(((struct __pyx_obj_10graphsaint_14cython_sampler_Edge2 *)__pyx_v_self), __pyx_v_adj_indptr, __pyx_v_adj_indices, __pyx_v_node_train, __pyx_v_num_proc, __pyx_v_num_sample_per_proc, __pyx_v_row_train, __pyx_v_col_train, __pyx_v_p_dist_cumsum, __pyx_v_size_subg_e);
-
-  /* function exit code */
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __pyx_r = -1;
-  __pyx_L0:;
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-static int __pyx_pf_10graphsaint_14cython_sampler_5Edge2___cinit__(struct __pyx_obj_10graphsaint_14cython_sampler_Edge2 *__pyx_v_self, CYTHON_UNUSED PyArrayObject *__pyx_v_adj_indptr, CYTHON_UNUSED PyArrayObject *__pyx_v_adj_indices, CYTHON_UNUSED PyArrayObject *__pyx_v_node_train, CYTHON_UNUSED int __pyx_v_num_proc, CYTHON_UNUSED int __pyx_v_num_sample_per_proc, PyArrayObject *__pyx_v_row_train, PyArrayObject *__pyx_v_col_train, PyArrayObject *__pyx_v_p_dist_cumsum, int __pyx_v_size_subg_e) {
-  __Pyx_LocalBuf_ND __pyx_pybuffernd_adj_indices;
-  __Pyx_Buffer __pyx_pybuffer_adj_indices;
-  __Pyx_LocalBuf_ND __pyx_pybuffernd_adj_indptr;
-  __Pyx_Buffer __pyx_pybuffer_adj_indptr;
-  __Pyx_LocalBuf_ND __pyx_pybuffernd_col_train;
-  __Pyx_Buffer __pyx_pybuffer_col_train;
-  __Pyx_LocalBuf_ND __pyx_pybuffernd_node_train;
-  __Pyx_Buffer __pyx_pybuffer_node_train;
-  __Pyx_LocalBuf_ND __pyx_pybuffernd_p_dist_cumsum;
-  __Pyx_Buffer __pyx_pybuffer_p_dist_cumsum;
-  __Pyx_LocalBuf_ND __pyx_pybuffernd_row_train;
-  __Pyx_Buffer __pyx_pybuffer_row_train;
-  int __pyx_r;
-  __Pyx_RefNannyDeclarations
-  int __pyx_lineno = 0;
-  const char *__pyx_filename = NULL;
-  int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("__cinit__", 0);
-  __pyx_pybuffer_adj_indptr.pybuffer.buf = NULL;
-  __pyx_pybuffer_adj_indptr.refcount = 0;
-  __pyx_pybuffernd_adj_indptr.data = NULL;
-  __pyx_pybuffernd_adj_indptr.rcbuffer = &__pyx_pybuffer_adj_indptr;
-  __pyx_pybuffer_adj_indices.pybuffer.buf = NULL;
-  __pyx_pybuffer_adj_indices.refcount = 0;
-  __pyx_pybuffernd_adj_indices.data = NULL;
-  __pyx_pybuffernd_adj_indices.rcbuffer = &__pyx_pybuffer_adj_indices;
-  __pyx_pybuffer_node_train.pybuffer.buf = NULL;
-  __pyx_pybuffer_node_train.refcount = 0;
-  __pyx_pybuffernd_node_train.data = NULL;
-  __pyx_pybuffernd_node_train.rcbuffer = &__pyx_pybuffer_node_train;
-  __pyx_pybuffer_row_train.pybuffer.buf = NULL;
-  __pyx_pybuffer_row_train.refcount = 0;
-  __pyx_pybuffernd_row_train.data = NULL;
-  __pyx_pybuffernd_row_train.rcbuffer = &__pyx_pybuffer_row_train;
-  __pyx_pybuffer_col_train.pybuffer.buf = NULL;
-  __pyx_pybuffer_col_train.refcount = 0;
-  __pyx_pybuffernd_col_train.data = NULL;
-  __pyx_pybuffernd_col_train.rcbuffer = &__pyx_pybuffer_col_train;
-  __pyx_pybuffer_p_dist_cumsum.pybuffer.buf = NULL;
-  __pyx_pybuffer_p_dist_cumsum.refcount = 0;
-  __pyx_pybuffernd_p_dist_cumsum.data = NULL;
-  __pyx_pybuffernd_p_dist_cumsum.rcbuffer = &__pyx_pybuffer_p_dist_cumsum;
-  {
-    __Pyx_BufFmt_StackElem __pyx_stack[1];
-    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_adj_indptr.rcbuffer->pybuffer, (PyObject*)__pyx_v_adj_indptr, &__Pyx_TypeInfo_int, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 411, __pyx_L1_error)
-  }
-  __pyx_pybuffernd_adj_indptr.diminfo[0].strides = __pyx_pybuffernd_adj_indptr.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_adj_indptr.diminfo[0].shape = __pyx_pybuffernd_adj_indptr.rcbuffer->pybuffer.shape[0];
-  {
-    __Pyx_BufFmt_StackElem __pyx_stack[1];
-    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_adj_indices.rcbuffer->pybuffer, (PyObject*)__pyx_v_adj_indices, &__Pyx_TypeInfo_int, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 411, __pyx_L1_error)
-  }
-  __pyx_pybuffernd_adj_indices.diminfo[0].strides = __pyx_pybuffernd_adj_indices.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_adj_indices.diminfo[0].shape = __pyx_pybuffernd_adj_indices.rcbuffer->pybuffer.shape[0];
-  {
-    __Pyx_BufFmt_StackElem __pyx_stack[1];
-    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_node_train.rcbuffer->pybuffer, (PyObject*)__pyx_v_node_train, &__Pyx_TypeInfo_int, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 411, __pyx_L1_error)
-  }
-  __pyx_pybuffernd_node_train.diminfo[0].strides = __pyx_pybuffernd_node_train.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_node_train.diminfo[0].shape = __pyx_pybuffernd_node_train.rcbuffer->pybuffer.shape[0];
-  {
-    __Pyx_BufFmt_StackElem __pyx_stack[1];
-    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_row_train.rcbuffer->pybuffer, (PyObject*)__pyx_v_row_train, &__Pyx_TypeInfo_int, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 411, __pyx_L1_error)
-  }
-  __pyx_pybuffernd_row_train.diminfo[0].strides = __pyx_pybuffernd_row_train.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_row_train.diminfo[0].shape = __pyx_pybuffernd_row_train.rcbuffer->pybuffer.shape[0];
-  {
-    __Pyx_BufFmt_StackElem __pyx_stack[1];
-    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_col_train.rcbuffer->pybuffer, (PyObject*)__pyx_v_col_train, &__Pyx_TypeInfo_int, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 411, __pyx_L1_error)
-  }
-  __pyx_pybuffernd_col_train.diminfo[0].strides = __pyx_pybuffernd_col_train.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_col_train.diminfo[0].shape = __pyx_pybuffernd_col_train.rcbuffer->pybuffer.shape[0];
-  {
-    __Pyx_BufFmt_StackElem __pyx_stack[1];
-    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_p_dist_cumsum.rcbuffer->pybuffer, (PyObject*)__pyx_v_p_dist_cumsum, &__Pyx_TypeInfo_float, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 411, __pyx_L1_error)
-  }
-  __pyx_pybuffernd_p_dist_cumsum.diminfo[0].strides = __pyx_pybuffernd_p_dist_cumsum.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_p_dist_cumsum.diminfo[0].shape = __pyx_pybuffernd_p_dist_cumsum.rcbuffer->pybuffer.shape[0];
-
-  /* "graphsaint/cython_sampler.pyx":419
- *                         np.ndarray[float,ndim=1,mode='c'] p_dist_cumsum,
- *                         int size_subg_e):
- *         self.size_subg_e = size_subg_e             # <<<<<<<<<<<<<<
- *         cutils.npy2vec_int(row_train,self.row_train_vec)
- *         cutils.npy2vec_int(col_train,self.col_train_vec)
- */
-  __pyx_v_self->size_subg_e = __pyx_v_size_subg_e;
-
-  /* "graphsaint/cython_sampler.pyx":420
- *                         int size_subg_e):
- *         self.size_subg_e = size_subg_e
- *         cutils.npy2vec_int(row_train,self.row_train_vec)             # <<<<<<<<<<<<<<
- *         cutils.npy2vec_int(col_train,self.col_train_vec)
- *         cutils.npy2vec_float(p_dist_cumsum,self.p_dist_cumsum_vec)
- */
-  __pyx_f_10graphsaint_12cython_utils_npy2vec_int(((PyArrayObject *)__pyx_v_row_train), __pyx_v_self->row_train_vec);
-
-  /* "graphsaint/cython_sampler.pyx":421
- *         self.size_subg_e = size_subg_e
- *         cutils.npy2vec_int(row_train,self.row_train_vec)
- *         cutils.npy2vec_int(col_train,self.col_train_vec)             # <<<<<<<<<<<<<<
- *         cutils.npy2vec_float(p_dist_cumsum,self.p_dist_cumsum_vec)
- * 
- */
-  __pyx_f_10graphsaint_12cython_utils_npy2vec_int(((PyArrayObject *)__pyx_v_col_train), __pyx_v_self->col_train_vec);
-
-  /* "graphsaint/cython_sampler.pyx":422
- *         cutils.npy2vec_int(row_train,self.row_train_vec)
- *         cutils.npy2vec_int(col_train,self.col_train_vec)
- *         cutils.npy2vec_float(p_dist_cumsum,self.p_dist_cumsum_vec)             # <<<<<<<<<<<<<<
- * 
- *     cdef void sample(self, int p) nogil:
- */
-  __pyx_f_10graphsaint_12cython_utils_npy2vec_float(((PyArrayObject *)__pyx_v_p_dist_cumsum), __pyx_v_self->p_dist_cumsum_vec);
-
-  /* "graphsaint/cython_sampler.pyx":411
- *     cdef vector[float] p_dist_cumsum_vec
- *     cdef int size_subg_e
- *     def __cinit__(self, np.ndarray[int,ndim=1,mode='c'] adj_indptr,             # <<<<<<<<<<<<<<
- *                         np.ndarray[int,ndim=1,mode='c'] adj_indices,
- *                         np.ndarray[int,ndim=1,mode='c'] node_train,
- */
-
-  /* function exit code */
-  __pyx_r = 0;
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  { PyObject *__pyx_type, *__pyx_value, *__pyx_tb;
-    __Pyx_PyThreadState_declare
-    __Pyx_PyThreadState_assign
-    __Pyx_ErrFetch(&__pyx_type, &__pyx_value, &__pyx_tb);
-    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_adj_indices.rcbuffer->pybuffer);
-    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_adj_indptr.rcbuffer->pybuffer);
-    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_col_train.rcbuffer->pybuffer);
-    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_node_train.rcbuffer->pybuffer);
-    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_p_dist_cumsum.rcbuffer->pybuffer);
-    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_row_train.rcbuffer->pybuffer);
-  __Pyx_ErrRestore(__pyx_type, __pyx_value, __pyx_tb);}
-  __Pyx_AddTraceback("graphsaint.cython_sampler.Edge2.__cinit__", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __pyx_r = -1;
-  goto __pyx_L2;
-  __pyx_L0:;
-  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_adj_indices.rcbuffer->pybuffer);
-  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_adj_indptr.rcbuffer->pybuffer);
-  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_col_train.rcbuffer->pybuffer);
-  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_node_train.rcbuffer->pybuffer);
-  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_p_dist_cumsum.rcbuffer->pybuffer);
-  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_row_train.rcbuffer->pybuffer);
-  __pyx_L2:;
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "graphsaint/cython_sampler.pyx":424
- *         cutils.npy2vec_float(p_dist_cumsum,self.p_dist_cumsum_vec)
- * 
- *     cdef void sample(self, int p) nogil:             # <<<<<<<<<<<<<<
- *         cdef int i = 0
- *         cdef int r = 0
- */
-
-static void __pyx_f_10graphsaint_14cython_sampler_5Edge2_sample(struct __pyx_obj_10graphsaint_14cython_sampler_Edge2 *__pyx_v_self, int __pyx_v_p) {
-  int __pyx_v_i;
-  int __pyx_v_r;
-  int __pyx_v_e;
-  int __pyx_v_idx_subg;
-  float __pyx_v_ran;
-  float __pyx_v_ran_range;
-  int __pyx_t_1;
-  float __pyx_t_2;
-  int __pyx_lineno = 0;
-  const char *__pyx_filename = NULL;
-  int __pyx_clineno = 0;
-
-  /* "graphsaint/cython_sampler.pyx":425
- * 
- *     cdef void sample(self, int p) nogil:
- *         cdef int i = 0             # <<<<<<<<<<<<<<
- *         cdef int r = 0
- *         cdef int e
- */
-  __pyx_v_i = 0;
-
-  /* "graphsaint/cython_sampler.pyx":426
- *     cdef void sample(self, int p) nogil:
- *         cdef int i = 0
- *         cdef int r = 0             # <<<<<<<<<<<<<<
- *         cdef int e
- *         cdef int idx_subg
- */
-  __pyx_v_r = 0;
-
-  /* "graphsaint/cython_sampler.pyx":429
- *         cdef int e
- *         cdef int idx_subg
- *         cdef float ran = 0.             # <<<<<<<<<<<<<<
- *         cdef float ran_range = self.p_dist_cumsum_vec[self.p_dist_cumsum_vec.size()-1]
- *         while r < self.num_sample_per_proc:
- */
-  __pyx_v_ran = 0.;
-
-  /* "graphsaint/cython_sampler.pyx":430
- *         cdef int idx_subg
- *         cdef float ran = 0.
- *         cdef float ran_range = self.p_dist_cumsum_vec[self.p_dist_cumsum_vec.size()-1]             # <<<<<<<<<<<<<<
- *         while r < self.num_sample_per_proc:
- *             idx_subg = p*self.num_sample_per_proc+r
- */
-  __pyx_v_ran_range = (__pyx_v_self->p_dist_cumsum_vec[(__pyx_v_self->p_dist_cumsum_vec.size() - 1)]);
-
-  /* "graphsaint/cython_sampler.pyx":431
- *         cdef float ran = 0.
- *         cdef float ran_range = self.p_dist_cumsum_vec[self.p_dist_cumsum_vec.size()-1]
- *         while r < self.num_sample_per_proc:             # <<<<<<<<<<<<<<
- *             idx_subg = p*self.num_sample_per_proc+r
- *             i = 0
- */
-  while (1) {
-    __pyx_t_1 = ((__pyx_v_r < __pyx_v_self->__pyx_base.num_sample_per_proc) != 0);
-    if (!__pyx_t_1) break;
-
-    /* "graphsaint/cython_sampler.pyx":432
- *         cdef float ran_range = self.p_dist_cumsum_vec[self.p_dist_cumsum_vec.size()-1]
- *         while r < self.num_sample_per_proc:
- *             idx_subg = p*self.num_sample_per_proc+r             # <<<<<<<<<<<<<<
- *             i = 0
- *             while i < self.size_subg_e:
- */
-    __pyx_v_idx_subg = ((__pyx_v_p * __pyx_v_self->__pyx_base.num_sample_per_proc) + __pyx_v_r);
-
-    /* "graphsaint/cython_sampler.pyx":433
- *         while r < self.num_sample_per_proc:
- *             idx_subg = p*self.num_sample_per_proc+r
- *             i = 0             # <<<<<<<<<<<<<<
- *             while i < self.size_subg_e:
- *                 ran = (<float> rand()) / RAND_MAX * ran_range
- */
-    __pyx_v_i = 0;
-
-    /* "graphsaint/cython_sampler.pyx":434
- *             idx_subg = p*self.num_sample_per_proc+r
- *             i = 0
- *             while i < self.size_subg_e:             # <<<<<<<<<<<<<<
- *                 ran = (<float> rand()) / RAND_MAX * ran_range
- *                 e = lower_bound(self.p_dist_cumsum_vec.begin(),self.p_dist_cumsum_vec.end(),ran)-self.p_dist_cumsum_vec.begin()
- */
-    while (1) {
-      __pyx_t_1 = ((__pyx_v_i < __pyx_v_self->size_subg_e) != 0);
-      if (!__pyx_t_1) break;
-
-      /* "graphsaint/cython_sampler.pyx":435
- *             i = 0
- *             while i < self.size_subg_e:
- *                 ran = (<float> rand()) / RAND_MAX * ran_range             # <<<<<<<<<<<<<<
- *                 e = lower_bound(self.p_dist_cumsum_vec.begin(),self.p_dist_cumsum_vec.end(),ran)-self.p_dist_cumsum_vec.begin()
- *                 self.node_sampled[idx_subg].push_back(self.row_train_vec[e])
- */
-      __pyx_t_2 = ((float)rand());
-      if (unlikely(RAND_MAX == 0)) {
-        #ifdef WITH_THREAD
-        PyGILState_STATE __pyx_gilstate_save = __Pyx_PyGILState_Ensure();
-        #endif
-        PyErr_SetString(PyExc_ZeroDivisionError, "float division");
-        #ifdef WITH_THREAD
-        __Pyx_PyGILState_Release(__pyx_gilstate_save);
-        #endif
-        __PYX_ERR(0, 435, __pyx_L1_error)
-      }
-      __pyx_v_ran = ((__pyx_t_2 / ((float)RAND_MAX)) * __pyx_v_ran_range);
-
-      /* "graphsaint/cython_sampler.pyx":436
- *             while i < self.size_subg_e:
- *                 ran = (<float> rand()) / RAND_MAX * ran_range
- *                 e = lower_bound(self.p_dist_cumsum_vec.begin(),self.p_dist_cumsum_vec.end(),ran)-self.p_dist_cumsum_vec.begin()             # <<<<<<<<<<<<<<
- *                 self.node_sampled[idx_subg].push_back(self.row_train_vec[e])
- *                 self.node_sampled[idx_subg].push_back(self.col_train_vec[e])
- */
-      __pyx_v_e = (std::lower_bound<std::vector<float> ::iterator,float>(__pyx_v_self->p_dist_cumsum_vec.begin(), __pyx_v_self->p_dist_cumsum_vec.end(), __pyx_v_ran) - __pyx_v_self->p_dist_cumsum_vec.begin());
-
-      /* "graphsaint/cython_sampler.pyx":437
- *                 ran = (<float> rand()) / RAND_MAX * ran_range
- *                 e = lower_bound(self.p_dist_cumsum_vec.begin(),self.p_dist_cumsum_vec.end(),ran)-self.p_dist_cumsum_vec.begin()
- *                 self.node_sampled[idx_subg].push_back(self.row_train_vec[e])             # <<<<<<<<<<<<<<
- *                 self.node_sampled[idx_subg].push_back(self.col_train_vec[e])
- *                 i = i + 1
- */
-      try {
-        (__pyx_v_self->__pyx_base.node_sampled[__pyx_v_idx_subg]).push_back((__pyx_v_self->row_train_vec[__pyx_v_e]));
-      } catch(...) {
-        #ifdef WITH_THREAD
-        PyGILState_STATE __pyx_gilstate_save = __Pyx_PyGILState_Ensure();
-        #endif
-        __Pyx_CppExn2PyErr();
-        #ifdef WITH_THREAD
-        __Pyx_PyGILState_Release(__pyx_gilstate_save);
-        #endif
-        __PYX_ERR(0, 437, __pyx_L1_error)
-      }
-
-      /* "graphsaint/cython_sampler.pyx":438
- *                 e = lower_bound(self.p_dist_cumsum_vec.begin(),self.p_dist_cumsum_vec.end(),ran)-self.p_dist_cumsum_vec.begin()
- *                 self.node_sampled[idx_subg].push_back(self.row_train_vec[e])
- *                 self.node_sampled[idx_subg].push_back(self.col_train_vec[e])             # <<<<<<<<<<<<<<
- *                 i = i + 1
- *             sort(self.node_sampled[idx_subg].begin(),self.node_sampled[idx_subg].end())
- */
-      try {
-        (__pyx_v_self->__pyx_base.node_sampled[__pyx_v_idx_subg]).push_back((__pyx_v_self->col_train_vec[__pyx_v_e]));
-      } catch(...) {
-        #ifdef WITH_THREAD
-        PyGILState_STATE __pyx_gilstate_save = __Pyx_PyGILState_Ensure();
-        #endif
-        __Pyx_CppExn2PyErr();
-        #ifdef WITH_THREAD
-        __Pyx_PyGILState_Release(__pyx_gilstate_save);
-        #endif
-        __PYX_ERR(0, 438, __pyx_L1_error)
-      }
-
-      /* "graphsaint/cython_sampler.pyx":439
- *                 self.node_sampled[idx_subg].push_back(self.row_train_vec[e])
- *                 self.node_sampled[idx_subg].push_back(self.col_train_vec[e])
- *                 i = i + 1             # <<<<<<<<<<<<<<
- *             sort(self.node_sampled[idx_subg].begin(),self.node_sampled[idx_subg].end())
- *             self.node_sampled[idx_subg].erase(unique(self.node_sampled[idx_subg].begin(),self.node_sampled[idx_subg].end()),self.node_sampled[idx_subg].end())
- */
-      __pyx_v_i = (__pyx_v_i + 1);
-    }
-
-    /* "graphsaint/cython_sampler.pyx":440
- *                 self.node_sampled[idx_subg].push_back(self.col_train_vec[e])
- *                 i = i + 1
- *             sort(self.node_sampled[idx_subg].begin(),self.node_sampled[idx_subg].end())             # <<<<<<<<<<<<<<
- *             self.node_sampled[idx_subg].erase(unique(self.node_sampled[idx_subg].begin(),self.node_sampled[idx_subg].end()),self.node_sampled[idx_subg].end())
- *             r = r + 1
- */
-    std::sort<std::vector<int> ::iterator>((__pyx_v_self->__pyx_base.node_sampled[__pyx_v_idx_subg]).begin(), (__pyx_v_self->__pyx_base.node_sampled[__pyx_v_idx_subg]).end());
-
-    /* "graphsaint/cython_sampler.pyx":441
- *                 i = i + 1
- *             sort(self.node_sampled[idx_subg].begin(),self.node_sampled[idx_subg].end())
- *             self.node_sampled[idx_subg].erase(unique(self.node_sampled[idx_subg].begin(),self.node_sampled[idx_subg].end()),self.node_sampled[idx_subg].end())             # <<<<<<<<<<<<<<
- *             r = r + 1
- * 
- */
-    (void)((__pyx_v_self->__pyx_base.node_sampled[__pyx_v_idx_subg]).erase(std::unique<std::vector<int> ::iterator>((__pyx_v_self->__pyx_base.node_sampled[__pyx_v_idx_subg]).begin(), (__pyx_v_self->__pyx_base.node_sampled[__pyx_v_idx_subg]).end()), (__pyx_v_self->__pyx_base.node_sampled[__pyx_v_idx_subg]).end()));
-
-    /* "graphsaint/cython_sampler.pyx":442
- *             sort(self.node_sampled[idx_subg].begin(),self.node_sampled[idx_subg].end())
- *             self.node_sampled[idx_subg].erase(unique(self.node_sampled[idx_subg].begin(),self.node_sampled[idx_subg].end()),self.node_sampled[idx_subg].end())
- *             r = r + 1             # <<<<<<<<<<<<<<
- * 
- * # ----------------------------------------------------
- */
-    __pyx_v_r = (__pyx_v_r + 1);
-  }
-
-  /* "graphsaint/cython_sampler.pyx":424
- *         cutils.npy2vec_float(p_dist_cumsum,self.p_dist_cumsum_vec)
- * 
- *     cdef void sample(self, int p) nogil:             # <<<<<<<<<<<<<<
- *         cdef int i = 0
- *         cdef int r = 0
- */
-
-  /* function exit code */
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_WriteUnraisable("graphsaint.cython_sampler.Edge2.sample", __pyx_clineno, __pyx_lineno, __pyx_filename, 1, 1);
-  __pyx_L0:;
-}
-
-/* "(tree fragment)":1
- * def __reduce_cython__(self):             # <<<<<<<<<<<<<<
- *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
- * def __setstate_cython__(self, __pyx_state):
- */
-
-/* Python wrapper */
-static PyObject *__pyx_pw_10graphsaint_14cython_sampler_5Edge2_3__reduce_cython__(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
-static PyObject *__pyx_pw_10graphsaint_14cython_sampler_5Edge2_3__reduce_cython__(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
-  PyObject *__pyx_r = 0;
-  __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("__reduce_cython__ (wrapper)", 0);
-  __pyx_r = __pyx_pf_10graphsaint_14cython_sampler_5Edge2_2__reduce_cython__(((struct __pyx_obj_10graphsaint_14cython_sampler_Edge2 *)__pyx_v_self));
-
-  /* function exit code */
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-static PyObject *__pyx_pf_10graphsaint_14cython_sampler_5Edge2_2__reduce_cython__(CYTHON_UNUSED struct __pyx_obj_10graphsaint_14cython_sampler_Edge2 *__pyx_v_self) {
-  PyObject *__pyx_r = NULL;
-  __Pyx_RefNannyDeclarations
-  PyObject *__pyx_t_1 = NULL;
-  int __pyx_lineno = 0;
-  const char *__pyx_filename = NULL;
-  int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("__reduce_cython__", 0);
-
-  /* "(tree fragment)":2
- * def __reduce_cython__(self):
- *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")             # <<<<<<<<<<<<<<
- * def __setstate_cython__(self, __pyx_state):
- *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
- */
-  __pyx_t_1 = __Pyx_PyObject_Call(__pyx_builtin_TypeError, __pyx_tuple__9, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 2, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __Pyx_Raise(__pyx_t_1, 0, 0, 0);
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __PYX_ERR(1, 2, __pyx_L1_error)
-
-  /* "(tree fragment)":1
- * def __reduce_cython__(self):             # <<<<<<<<<<<<<<
- *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
- * def __setstate_cython__(self, __pyx_state):
- */
-
-  /* function exit code */
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_AddTraceback("graphsaint.cython_sampler.Edge2.__reduce_cython__", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __pyx_r = NULL;
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "(tree fragment)":3
- * def __reduce_cython__(self):
- *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
- * def __setstate_cython__(self, __pyx_state):             # <<<<<<<<<<<<<<
- *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
- */
-
-/* Python wrapper */
-static PyObject *__pyx_pw_10graphsaint_14cython_sampler_5Edge2_5__setstate_cython__(PyObject *__pyx_v_self, PyObject *__pyx_v___pyx_state); /*proto*/
-static PyObject *__pyx_pw_10graphsaint_14cython_sampler_5Edge2_5__setstate_cython__(PyObject *__pyx_v_self, PyObject *__pyx_v___pyx_state) {
-  PyObject *__pyx_r = 0;
-  __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("__setstate_cython__ (wrapper)", 0);
-  __pyx_r = __pyx_pf_10graphsaint_14cython_sampler_5Edge2_4__setstate_cython__(((struct __pyx_obj_10graphsaint_14cython_sampler_Edge2 *)__pyx_v_self), ((PyObject *)__pyx_v___pyx_state));
-
-  /* function exit code */
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-static PyObject *__pyx_pf_10graphsaint_14cython_sampler_5Edge2_4__setstate_cython__(CYTHON_UNUSED struct __pyx_obj_10graphsaint_14cython_sampler_Edge2 *__pyx_v_self, CYTHON_UNUSED PyObject *__pyx_v___pyx_state) {
-  PyObject *__pyx_r = NULL;
-  __Pyx_RefNannyDeclarations
-  PyObject *__pyx_t_1 = NULL;
-  int __pyx_lineno = 0;
-  const char *__pyx_filename = NULL;
-  int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("__setstate_cython__", 0);
-
-  /* "(tree fragment)":4
- *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
- * def __setstate_cython__(self, __pyx_state):
- *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")             # <<<<<<<<<<<<<<
- */
-  __pyx_t_1 = __Pyx_PyObject_Call(__pyx_builtin_TypeError, __pyx_tuple__10, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 4, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __Pyx_Raise(__pyx_t_1, 0, 0, 0);
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __PYX_ERR(1, 4, __pyx_L1_error)
-
-  /* "(tree fragment)":3
- * def __reduce_cython__(self):
- *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
- * def __setstate_cython__(self, __pyx_state):             # <<<<<<<<<<<<<<
- *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
- */
-
-  /* function exit code */
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_AddTraceback("graphsaint.cython_sampler.Edge2.__setstate_cython__", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __pyx_r = NULL;
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "graphsaint/cython_sampler.pyx":449
- *     cdef int size_subg
- *     cdef vector[int] p_dist_cumsum_vec
- *     def __cinit__(self, np.ndarray[int,ndim=1,mode='c'] adj_indptr,             # <<<<<<<<<<<<<<
- *                         np.ndarray[int,ndim=1,mode='c'] adj_indices,
- *                         np.ndarray[int,ndim=1,mode='c'] node_train,
- */
-
-/* Python wrapper */
-static int __pyx_pw_10graphsaint_14cython_sampler_4Node_1__cinit__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static int __pyx_pw_10graphsaint_14cython_sampler_4Node_1__cinit__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
-  CYTHON_UNUSED PyArrayObject *__pyx_v_adj_indptr = 0;
-  CYTHON_UNUSED PyArrayObject *__pyx_v_adj_indices = 0;
-  CYTHON_UNUSED PyArrayObject *__pyx_v_node_train = 0;
-  CYTHON_UNUSED int __pyx_v_num_proc;
-  CYTHON_UNUSED int __pyx_v_num_sample_per_proc;
-  PyArrayObject *__pyx_v_p_dist_cumsum = 0;
-  int __pyx_v_size_subg;
-  int __pyx_lineno = 0;
-  const char *__pyx_filename = NULL;
-  int __pyx_clineno = 0;
-  int __pyx_r;
-  __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("__cinit__ (wrapper)", 0);
-  {
-    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_adj_indptr,&__pyx_n_s_adj_indices,&__pyx_n_s_node_train,&__pyx_n_s_num_proc,&__pyx_n_s_num_sample_per_proc,&__pyx_n_s_p_dist_cumsum,&__pyx_n_s_size_subg,0};
-    PyObject* values[7] = {0,0,0,0,0,0,0};
-    if (unlikely(__pyx_kwds)) {
-      Py_ssize_t kw_args;
-      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
-      switch (pos_args) {
-        case  7: values[6] = PyTuple_GET_ITEM(__pyx_args, 6);
-        CYTHON_FALLTHROUGH;
-        case  6: values[5] = PyTuple_GET_ITEM(__pyx_args, 5);
-        CYTHON_FALLTHROUGH;
-        case  5: values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
-        CYTHON_FALLTHROUGH;
-        case  4: values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
-        CYTHON_FALLTHROUGH;
-        case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
-        CYTHON_FALLTHROUGH;
-        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
-        CYTHON_FALLTHROUGH;
-        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
-        CYTHON_FALLTHROUGH;
-        case  0: break;
-        default: goto __pyx_L5_argtuple_error;
-      }
-      kw_args = PyDict_Size(__pyx_kwds);
-      switch (pos_args) {
-        case  0:
-        if (likely((values[0] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_adj_indptr)) != 0)) kw_args--;
-        else goto __pyx_L5_argtuple_error;
-        CYTHON_FALLTHROUGH;
-        case  1:
-        if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_adj_indices)) != 0)) kw_args--;
-        else {
-          __Pyx_RaiseArgtupleInvalid("__cinit__", 1, 7, 7, 1); __PYX_ERR(0, 449, __pyx_L3_error)
-        }
-        CYTHON_FALLTHROUGH;
-        case  2:
-        if (likely((values[2] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_node_train)) != 0)) kw_args--;
-        else {
-          __Pyx_RaiseArgtupleInvalid("__cinit__", 1, 7, 7, 2); __PYX_ERR(0, 449, __pyx_L3_error)
-        }
-        CYTHON_FALLTHROUGH;
-        case  3:
-        if (likely((values[3] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_num_proc)) != 0)) kw_args--;
-        else {
-          __Pyx_RaiseArgtupleInvalid("__cinit__", 1, 7, 7, 3); __PYX_ERR(0, 449, __pyx_L3_error)
-        }
-        CYTHON_FALLTHROUGH;
-        case  4:
-        if (likely((values[4] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_num_sample_per_proc)) != 0)) kw_args--;
-        else {
-          __Pyx_RaiseArgtupleInvalid("__cinit__", 1, 7, 7, 4); __PYX_ERR(0, 449, __pyx_L3_error)
-        }
-        CYTHON_FALLTHROUGH;
-        case  5:
-        if (likely((values[5] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_p_dist_cumsum)) != 0)) kw_args--;
-        else {
-          __Pyx_RaiseArgtupleInvalid("__cinit__", 1, 7, 7, 5); __PYX_ERR(0, 449, __pyx_L3_error)
-        }
-        CYTHON_FALLTHROUGH;
-        case  6:
-        if (likely((values[6] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_size_subg)) != 0)) kw_args--;
-        else {
-          __Pyx_RaiseArgtupleInvalid("__cinit__", 1, 7, 7, 6); __PYX_ERR(0, 449, __pyx_L3_error)
-        }
-      }
-      if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "__cinit__") < 0)) __PYX_ERR(0, 449, __pyx_L3_error)
-      }
-    } else if (PyTuple_GET_SIZE(__pyx_args) != 7) {
-      goto __pyx_L5_argtuple_error;
-    } else {
-      values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
-      values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
-      values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
-      values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
-      values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
-      values[5] = PyTuple_GET_ITEM(__pyx_args, 5);
-      values[6] = PyTuple_GET_ITEM(__pyx_args, 6);
-    }
-    __pyx_v_adj_indptr = ((PyArrayObject *)values[0]);
-    __pyx_v_adj_indices = ((PyArrayObject *)values[1]);
-    __pyx_v_node_train = ((PyArrayObject *)values[2]);
-    __pyx_v_num_proc = __Pyx_PyInt_As_int(values[3]); if (unlikely((__pyx_v_num_proc == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 452, __pyx_L3_error)
-    __pyx_v_num_sample_per_proc = __Pyx_PyInt_As_int(values[4]); if (unlikely((__pyx_v_num_sample_per_proc == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 452, __pyx_L3_error)
-    __pyx_v_p_dist_cumsum = ((PyArrayObject *)values[5]);
-    __pyx_v_size_subg = __Pyx_PyInt_As_int(values[6]); if (unlikely((__pyx_v_size_subg == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 454, __pyx_L3_error)
-  }
-  goto __pyx_L4_argument_unpacking_done;
-  __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("__cinit__", 1, 7, 7, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 449, __pyx_L3_error)
-  __pyx_L3_error:;
-  __Pyx_AddTraceback("graphsaint.cython_sampler.Node.__cinit__", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __Pyx_RefNannyFinishContext();
-  return -1;
-  __pyx_L4_argument_unpacking_done:;
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_adj_indptr), __pyx_ptype_5numpy_ndarray, 1, "adj_indptr", 0))) __PYX_ERR(0, 449, __pyx_L1_error)
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_adj_indices), __pyx_ptype_5numpy_ndarray, 1, "adj_indices", 0))) __PYX_ERR(0, 450, __pyx_L1_error)
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_node_train), __pyx_ptype_5numpy_ndarray, 1, "node_train", 0))) __PYX_ERR(0, 451, __pyx_L1_error)
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_p_dist_cumsum), __pyx_ptype_5numpy_ndarray, 1, "p_dist_cumsum", 0))) __PYX_ERR(0, 453, __pyx_L1_error)
-  __pyx_r = __pyx_pf_10graphsaint_14cython_sampler_4Node___cinit__(((struct __pyx_obj_10graphsaint_14cython_sampler_Node *)__pyx_v_self), __pyx_v_adj_indptr, __pyx_v_adj_indices, __pyx_v_node_train, __pyx_v_num_proc, __pyx_v_num_sample_per_proc, __pyx_v_p_dist_cumsum, __pyx_v_size_subg);
-
-  /* function exit code */
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __pyx_r = -1;
-  __pyx_L0:;
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-static int __pyx_pf_10graphsaint_14cython_sampler_4Node___cinit__(struct __pyx_obj_10graphsaint_14cython_sampler_Node *__pyx_v_self, CYTHON_UNUSED PyArrayObject *__pyx_v_adj_indptr, CYTHON_UNUSED PyArrayObject *__pyx_v_adj_indices, CYTHON_UNUSED PyArrayObject *__pyx_v_node_train, CYTHON_UNUSED int __pyx_v_num_proc, CYTHON_UNUSED int __pyx_v_num_sample_per_proc, PyArrayObject *__pyx_v_p_dist_cumsum, int __pyx_v_size_subg) {
-  __Pyx_LocalBuf_ND __pyx_pybuffernd_adj_indices;
-  __Pyx_Buffer __pyx_pybuffer_adj_indices;
-  __Pyx_LocalBuf_ND __pyx_pybuffernd_adj_indptr;
-  __Pyx_Buffer __pyx_pybuffer_adj_indptr;
-  __Pyx_LocalBuf_ND __pyx_pybuffernd_node_train;
-  __Pyx_Buffer __pyx_pybuffer_node_train;
-  __Pyx_LocalBuf_ND __pyx_pybuffernd_p_dist_cumsum;
-  __Pyx_Buffer __pyx_pybuffer_p_dist_cumsum;
-  int __pyx_r;
-  __Pyx_RefNannyDeclarations
-  int __pyx_lineno = 0;
-  const char *__pyx_filename = NULL;
-  int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("__cinit__", 0);
-  __pyx_pybuffer_adj_indptr.pybuffer.buf = NULL;
-  __pyx_pybuffer_adj_indptr.refcount = 0;
-  __pyx_pybuffernd_adj_indptr.data = NULL;
-  __pyx_pybuffernd_adj_indptr.rcbuffer = &__pyx_pybuffer_adj_indptr;
-  __pyx_pybuffer_adj_indices.pybuffer.buf = NULL;
-  __pyx_pybuffer_adj_indices.refcount = 0;
-  __pyx_pybuffernd_adj_indices.data = NULL;
-  __pyx_pybuffernd_adj_indices.rcbuffer = &__pyx_pybuffer_adj_indices;
-  __pyx_pybuffer_node_train.pybuffer.buf = NULL;
-  __pyx_pybuffer_node_train.refcount = 0;
-  __pyx_pybuffernd_node_train.data = NULL;
-  __pyx_pybuffernd_node_train.rcbuffer = &__pyx_pybuffer_node_train;
-  __pyx_pybuffer_p_dist_cumsum.pybuffer.buf = NULL;
-  __pyx_pybuffer_p_dist_cumsum.refcount = 0;
-  __pyx_pybuffernd_p_dist_cumsum.data = NULL;
-  __pyx_pybuffernd_p_dist_cumsum.rcbuffer = &__pyx_pybuffer_p_dist_cumsum;
-  {
-    __Pyx_BufFmt_StackElem __pyx_stack[1];
-    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_adj_indptr.rcbuffer->pybuffer, (PyObject*)__pyx_v_adj_indptr, &__Pyx_TypeInfo_int, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 449, __pyx_L1_error)
-  }
-  __pyx_pybuffernd_adj_indptr.diminfo[0].strides = __pyx_pybuffernd_adj_indptr.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_adj_indptr.diminfo[0].shape = __pyx_pybuffernd_adj_indptr.rcbuffer->pybuffer.shape[0];
-  {
-    __Pyx_BufFmt_StackElem __pyx_stack[1];
-    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_adj_indices.rcbuffer->pybuffer, (PyObject*)__pyx_v_adj_indices, &__Pyx_TypeInfo_int, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 449, __pyx_L1_error)
-  }
-  __pyx_pybuffernd_adj_indices.diminfo[0].strides = __pyx_pybuffernd_adj_indices.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_adj_indices.diminfo[0].shape = __pyx_pybuffernd_adj_indices.rcbuffer->pybuffer.shape[0];
-  {
-    __Pyx_BufFmt_StackElem __pyx_stack[1];
-    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_node_train.rcbuffer->pybuffer, (PyObject*)__pyx_v_node_train, &__Pyx_TypeInfo_int, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 449, __pyx_L1_error)
-  }
-  __pyx_pybuffernd_node_train.diminfo[0].strides = __pyx_pybuffernd_node_train.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_node_train.diminfo[0].shape = __pyx_pybuffernd_node_train.rcbuffer->pybuffer.shape[0];
-  {
-    __Pyx_BufFmt_StackElem __pyx_stack[1];
-    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_p_dist_cumsum.rcbuffer->pybuffer, (PyObject*)__pyx_v_p_dist_cumsum, &__Pyx_TypeInfo_int, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 449, __pyx_L1_error)
-  }
-  __pyx_pybuffernd_p_dist_cumsum.diminfo[0].strides = __pyx_pybuffernd_p_dist_cumsum.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_p_dist_cumsum.diminfo[0].shape = __pyx_pybuffernd_p_dist_cumsum.rcbuffer->pybuffer.shape[0];
-
-  /* "graphsaint/cython_sampler.pyx":455
- *                         np.ndarray[int,ndim=1,mode='c'] p_dist_cumsum,
- *                         int size_subg):
- *         self.size_subg = size_subg             # <<<<<<<<<<<<<<
- *         cutils.npy2vec_int(p_dist_cumsum,self.p_dist_cumsum_vec)
- * 
- */
-  __pyx_v_self->size_subg = __pyx_v_size_subg;
-
-  /* "graphsaint/cython_sampler.pyx":456
- *                         int size_subg):
- *         self.size_subg = size_subg
- *         cutils.npy2vec_int(p_dist_cumsum,self.p_dist_cumsum_vec)             # <<<<<<<<<<<<<<
- * 
- *     cdef void sample(self, int p) nogil:
- */
-  __pyx_f_10graphsaint_12cython_utils_npy2vec_int(((PyArrayObject *)__pyx_v_p_dist_cumsum), __pyx_v_self->p_dist_cumsum_vec);
-
-  /* "graphsaint/cython_sampler.pyx":449
- *     cdef int size_subg
- *     cdef vector[int] p_dist_cumsum_vec
- *     def __cinit__(self, np.ndarray[int,ndim=1,mode='c'] adj_indptr,             # <<<<<<<<<<<<<<
- *                         np.ndarray[int,ndim=1,mode='c'] adj_indices,
- *                         np.ndarray[int,ndim=1,mode='c'] node_train,
- */
-
-  /* function exit code */
-  __pyx_r = 0;
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  { PyObject *__pyx_type, *__pyx_value, *__pyx_tb;
-    __Pyx_PyThreadState_declare
-    __Pyx_PyThreadState_assign
-    __Pyx_ErrFetch(&__pyx_type, &__pyx_value, &__pyx_tb);
-    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_adj_indices.rcbuffer->pybuffer);
-    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_adj_indptr.rcbuffer->pybuffer);
-    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_node_train.rcbuffer->pybuffer);
-    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_p_dist_cumsum.rcbuffer->pybuffer);
-  __Pyx_ErrRestore(__pyx_type, __pyx_value, __pyx_tb);}
-  __Pyx_AddTraceback("graphsaint.cython_sampler.Node.__cinit__", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __pyx_r = -1;
-  goto __pyx_L2;
-  __pyx_L0:;
-  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_adj_indices.rcbuffer->pybuffer);
-  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_adj_indptr.rcbuffer->pybuffer);
-  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_node_train.rcbuffer->pybuffer);
-  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_p_dist_cumsum.rcbuffer->pybuffer);
-  __pyx_L2:;
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "graphsaint/cython_sampler.pyx":458
- *         cutils.npy2vec_int(p_dist_cumsum,self.p_dist_cumsum_vec)
- * 
- *     cdef void sample(self, int p) nogil:             # <<<<<<<<<<<<<<
- *         cdef int i = 0
- *         cdef int r = 0
- */
-
-static void __pyx_f_10graphsaint_14cython_sampler_4Node_sample(struct __pyx_obj_10graphsaint_14cython_sampler_Node *__pyx_v_self, int __pyx_v_p) {
-  int __pyx_v_i;
-  int __pyx_v_r;
-  int __pyx_v_idx_subg;
-  int __pyx_v_sample;
-  int __pyx_v_rand_range;
-  int __pyx_t_1;
-  int __pyx_t_2;
-  int __pyx_lineno = 0;
-  const char *__pyx_filename = NULL;
-  int __pyx_clineno = 0;
-
-  /* "graphsaint/cython_sampler.pyx":459
- * 
- *     cdef void sample(self, int p) nogil:
- *         cdef int i = 0             # <<<<<<<<<<<<<<
- *         cdef int r = 0
- *         cdef int idx_subg
- */
-  __pyx_v_i = 0;
-
-  /* "graphsaint/cython_sampler.pyx":460
- *     cdef void sample(self, int p) nogil:
- *         cdef int i = 0
- *         cdef int r = 0             # <<<<<<<<<<<<<<
- *         cdef int idx_subg
- *         cdef int sample
- */
-  __pyx_v_r = 0;
-
-  /* "graphsaint/cython_sampler.pyx":463
- *         cdef int idx_subg
- *         cdef int sample
- *         cdef int rand_range = self.p_dist_cumsum_vec[self.node_train_vec.size()-1]             # <<<<<<<<<<<<<<
- *         while r < self.num_sample_per_proc:
- *             idx_subg = p*self.num_sample_per_proc+r
- */
-  __pyx_v_rand_range = (__pyx_v_self->p_dist_cumsum_vec[(__pyx_v_self->__pyx_base.node_train_vec.size() - 1)]);
-
-  /* "graphsaint/cython_sampler.pyx":464
- *         cdef int sample
- *         cdef int rand_range = self.p_dist_cumsum_vec[self.node_train_vec.size()-1]
- *         while r < self.num_sample_per_proc:             # <<<<<<<<<<<<<<
- *             idx_subg = p*self.num_sample_per_proc+r
- *             i = 0
- */
-  while (1) {
-    __pyx_t_1 = ((__pyx_v_r < __pyx_v_self->__pyx_base.num_sample_per_proc) != 0);
-    if (!__pyx_t_1) break;
-
-    /* "graphsaint/cython_sampler.pyx":465
- *         cdef int rand_range = self.p_dist_cumsum_vec[self.node_train_vec.size()-1]
- *         while r < self.num_sample_per_proc:
- *             idx_subg = p*self.num_sample_per_proc+r             # <<<<<<<<<<<<<<
- *             i = 0
- *             while i < self.size_subg:
- */
-    __pyx_v_idx_subg = ((__pyx_v_p * __pyx_v_self->__pyx_base.num_sample_per_proc) + __pyx_v_r);
-
-    /* "graphsaint/cython_sampler.pyx":466
- *         while r < self.num_sample_per_proc:
- *             idx_subg = p*self.num_sample_per_proc+r
- *             i = 0             # <<<<<<<<<<<<<<
- *             while i < self.size_subg:
- *                 sample = rand()%rand_range
- */
-    __pyx_v_i = 0;
-
-    /* "graphsaint/cython_sampler.pyx":467
- *             idx_subg = p*self.num_sample_per_proc+r
- *             i = 0
- *             while i < self.size_subg:             # <<<<<<<<<<<<<<
- *                 sample = rand()%rand_range
- *                 self.node_sampled[idx_subg].push_back(self.node_train_vec[lower_bound(self.p_dist_cumsum_vec.begin(),self.p_dist_cumsum_vec.end(),sample)-self.p_dist_cumsum_vec.begin()])
- */
-    while (1) {
-      __pyx_t_1 = ((__pyx_v_i < __pyx_v_self->size_subg) != 0);
-      if (!__pyx_t_1) break;
-
-      /* "graphsaint/cython_sampler.pyx":468
- *             i = 0
- *             while i < self.size_subg:
- *                 sample = rand()%rand_range             # <<<<<<<<<<<<<<
- *                 self.node_sampled[idx_subg].push_back(self.node_train_vec[lower_bound(self.p_dist_cumsum_vec.begin(),self.p_dist_cumsum_vec.end(),sample)-self.p_dist_cumsum_vec.begin()])
- *                 i = i + 1
- */
-      __pyx_t_2 = rand();
-      if (unlikely(__pyx_v_rand_range == 0)) {
-        #ifdef WITH_THREAD
-        PyGILState_STATE __pyx_gilstate_save = __Pyx_PyGILState_Ensure();
-        #endif
-        PyErr_SetString(PyExc_ZeroDivisionError, "integer division or modulo by zero");
-        #ifdef WITH_THREAD
-        __Pyx_PyGILState_Release(__pyx_gilstate_save);
-        #endif
-        __PYX_ERR(0, 468, __pyx_L1_error)
-      }
-      __pyx_v_sample = __Pyx_mod_int(__pyx_t_2, __pyx_v_rand_range);
-
-      /* "graphsaint/cython_sampler.pyx":469
- *             while i < self.size_subg:
- *                 sample = rand()%rand_range
- *                 self.node_sampled[idx_subg].push_back(self.node_train_vec[lower_bound(self.p_dist_cumsum_vec.begin(),self.p_dist_cumsum_vec.end(),sample)-self.p_dist_cumsum_vec.begin()])             # <<<<<<<<<<<<<<
- *                 i = i + 1
- *             r = r + 1
- */
-      try {
-        (__pyx_v_self->__pyx_base.node_sampled[__pyx_v_idx_subg]).push_back((__pyx_v_self->__pyx_base.node_train_vec[(std::lower_bound<std::vector<int> ::iterator,int>(__pyx_v_self->p_dist_cumsum_vec.begin(), __pyx_v_self->p_dist_cumsum_vec.end(), __pyx_v_sample) - __pyx_v_self->p_dist_cumsum_vec.begin())]));
-      } catch(...) {
-        #ifdef WITH_THREAD
-        PyGILState_STATE __pyx_gilstate_save = __Pyx_PyGILState_Ensure();
-        #endif
-        __Pyx_CppExn2PyErr();
-        #ifdef WITH_THREAD
-        __Pyx_PyGILState_Release(__pyx_gilstate_save);
-        #endif
-        __PYX_ERR(0, 469, __pyx_L1_error)
-      }
-
-      /* "graphsaint/cython_sampler.pyx":470
- *                 sample = rand()%rand_range
- *                 self.node_sampled[idx_subg].push_back(self.node_train_vec[lower_bound(self.p_dist_cumsum_vec.begin(),self.p_dist_cumsum_vec.end(),sample)-self.p_dist_cumsum_vec.begin()])
- *                 i = i + 1             # <<<<<<<<<<<<<<
- *             r = r + 1
- *             sort(self.node_sampled[idx_subg].begin(),self.node_sampled[idx_subg].end())
- */
-      __pyx_v_i = (__pyx_v_i + 1);
-    }
-
-    /* "graphsaint/cython_sampler.pyx":471
- *                 self.node_sampled[idx_subg].push_back(self.node_train_vec[lower_bound(self.p_dist_cumsum_vec.begin(),self.p_dist_cumsum_vec.end(),sample)-self.p_dist_cumsum_vec.begin()])
- *                 i = i + 1
- *             r = r + 1             # <<<<<<<<<<<<<<
- *             sort(self.node_sampled[idx_subg].begin(),self.node_sampled[idx_subg].end())
- *             self.node_sampled[idx_subg].erase(unique(self.node_sampled[idx_subg].begin(),self.node_sampled[idx_subg].end()),self.node_sampled[idx_subg].end())
- */
-    __pyx_v_r = (__pyx_v_r + 1);
-
-    /* "graphsaint/cython_sampler.pyx":472
- *                 i = i + 1
- *             r = r + 1
- *             sort(self.node_sampled[idx_subg].begin(),self.node_sampled[idx_subg].end())             # <<<<<<<<<<<<<<
- *             self.node_sampled[idx_subg].erase(unique(self.node_sampled[idx_subg].begin(),self.node_sampled[idx_subg].end()),self.node_sampled[idx_subg].end())
- * 
- */
-    std::sort<std::vector<int> ::iterator>((__pyx_v_self->__pyx_base.node_sampled[__pyx_v_idx_subg]).begin(), (__pyx_v_self->__pyx_base.node_sampled[__pyx_v_idx_subg]).end());
-
-    /* "graphsaint/cython_sampler.pyx":473
- *             r = r + 1
- *             sort(self.node_sampled[idx_subg].begin(),self.node_sampled[idx_subg].end())
- *             self.node_sampled[idx_subg].erase(unique(self.node_sampled[idx_subg].begin(),self.node_sampled[idx_subg].end()),self.node_sampled[idx_subg].end())             # <<<<<<<<<<<<<<
- * 
- * # -----------------------------------------------------
- */
-    (void)((__pyx_v_self->__pyx_base.node_sampled[__pyx_v_idx_subg]).erase(std::unique<std::vector<int> ::iterator>((__pyx_v_self->__pyx_base.node_sampled[__pyx_v_idx_subg]).begin(), (__pyx_v_self->__pyx_base.node_sampled[__pyx_v_idx_subg]).end()), (__pyx_v_self->__pyx_base.node_sampled[__pyx_v_idx_subg]).end()));
-  }
-
-  /* "graphsaint/cython_sampler.pyx":458
- *         cutils.npy2vec_int(p_dist_cumsum,self.p_dist_cumsum_vec)
- * 
- *     cdef void sample(self, int p) nogil:             # <<<<<<<<<<<<<<
- *         cdef int i = 0
- *         cdef int r = 0
- */
-
-  /* function exit code */
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_WriteUnraisable("graphsaint.cython_sampler.Node.sample", __pyx_clineno, __pyx_lineno, __pyx_filename, 1, 1);
-  __pyx_L0:;
-}
-
-/* "(tree fragment)":1
- * def __reduce_cython__(self):             # <<<<<<<<<<<<<<
- *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
- * def __setstate_cython__(self, __pyx_state):
- */
-
-/* Python wrapper */
-static PyObject *__pyx_pw_10graphsaint_14cython_sampler_4Node_3__reduce_cython__(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
-static PyObject *__pyx_pw_10graphsaint_14cython_sampler_4Node_3__reduce_cython__(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
-  PyObject *__pyx_r = 0;
-  __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("__reduce_cython__ (wrapper)", 0);
-  __pyx_r = __pyx_pf_10graphsaint_14cython_sampler_4Node_2__reduce_cython__(((struct __pyx_obj_10graphsaint_14cython_sampler_Node *)__pyx_v_self));
-
-  /* function exit code */
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-static PyObject *__pyx_pf_10graphsaint_14cython_sampler_4Node_2__reduce_cython__(CYTHON_UNUSED struct __pyx_obj_10graphsaint_14cython_sampler_Node *__pyx_v_self) {
-  PyObject *__pyx_r = NULL;
-  __Pyx_RefNannyDeclarations
-  PyObject *__pyx_t_1 = NULL;
-  int __pyx_lineno = 0;
-  const char *__pyx_filename = NULL;
-  int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("__reduce_cython__", 0);
-
-  /* "(tree fragment)":2
- * def __reduce_cython__(self):
- *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")             # <<<<<<<<<<<<<<
- * def __setstate_cython__(self, __pyx_state):
- *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
- */
-  __pyx_t_1 = __Pyx_PyObject_Call(__pyx_builtin_TypeError, __pyx_tuple__11, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 2, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __Pyx_Raise(__pyx_t_1, 0, 0, 0);
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __PYX_ERR(1, 2, __pyx_L1_error)
-
-  /* "(tree fragment)":1
- * def __reduce_cython__(self):             # <<<<<<<<<<<<<<
- *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
- * def __setstate_cython__(self, __pyx_state):
- */
-
-  /* function exit code */
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_AddTraceback("graphsaint.cython_sampler.Node.__reduce_cython__", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __pyx_r = NULL;
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "(tree fragment)":3
- * def __reduce_cython__(self):
- *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
- * def __setstate_cython__(self, __pyx_state):             # <<<<<<<<<<<<<<
- *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
- */
-
-/* Python wrapper */
-static PyObject *__pyx_pw_10graphsaint_14cython_sampler_4Node_5__setstate_cython__(PyObject *__pyx_v_self, PyObject *__pyx_v___pyx_state); /*proto*/
-static PyObject *__pyx_pw_10graphsaint_14cython_sampler_4Node_5__setstate_cython__(PyObject *__pyx_v_self, PyObject *__pyx_v___pyx_state) {
-  PyObject *__pyx_r = 0;
-  __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("__setstate_cython__ (wrapper)", 0);
-  __pyx_r = __pyx_pf_10graphsaint_14cython_sampler_4Node_4__setstate_cython__(((struct __pyx_obj_10graphsaint_14cython_sampler_Node *)__pyx_v_self), ((PyObject *)__pyx_v___pyx_state));
-
-  /* function exit code */
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-static PyObject *__pyx_pf_10graphsaint_14cython_sampler_4Node_4__setstate_cython__(CYTHON_UNUSED struct __pyx_obj_10graphsaint_14cython_sampler_Node *__pyx_v_self, CYTHON_UNUSED PyObject *__pyx_v___pyx_state) {
-  PyObject *__pyx_r = NULL;
-  __Pyx_RefNannyDeclarations
-  PyObject *__pyx_t_1 = NULL;
-  int __pyx_lineno = 0;
-  const char *__pyx_filename = NULL;
-  int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("__setstate_cython__", 0);
-
-  /* "(tree fragment)":4
- *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
- * def __setstate_cython__(self, __pyx_state):
- *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")             # <<<<<<<<<<<<<<
- */
-  __pyx_t_1 = __Pyx_PyObject_Call(__pyx_builtin_TypeError, __pyx_tuple__12, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 4, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __Pyx_Raise(__pyx_t_1, 0, 0, 0);
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __PYX_ERR(1, 4, __pyx_L1_error)
-
-  /* "(tree fragment)":3
- * def __reduce_cython__(self):
- *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
- * def __setstate_cython__(self, __pyx_state):             # <<<<<<<<<<<<<<
- *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
- */
-
-  /* function exit code */
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_AddTraceback("graphsaint.cython_sampler.Node.__setstate_cython__", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __pyx_r = NULL;
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "graphsaint/cython_sampler.pyx":478
- * 
- * cdef class FullBatch(Sampler):
- *     def __cinit__(self, np.ndarray[int,ndim=1,mode='c'] adj_indptr,             # <<<<<<<<<<<<<<
- *                         np.ndarray[int,ndim=1,mode='c'] adj_indices,
- *                         np.ndarray[int,ndim=1,mode='c'] node_train,
- */
-
-/* Python wrapper */
-static int __pyx_pw_10graphsaint_14cython_sampler_9FullBatch_1__cinit__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static int __pyx_pw_10graphsaint_14cython_sampler_9FullBatch_1__cinit__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
-  CYTHON_UNUSED PyArrayObject *__pyx_v_adj_indptr = 0;
-  CYTHON_UNUSED PyArrayObject *__pyx_v_adj_indices = 0;
-  CYTHON_UNUSED PyArrayObject *__pyx_v_node_train = 0;
-  CYTHON_UNUSED int __pyx_v_num_proc;
-  CYTHON_UNUSED int __pyx_v_num_sample_per_proc;
-  int __pyx_lineno = 0;
-  const char *__pyx_filename = NULL;
-  int __pyx_clineno = 0;
-  int __pyx_r;
-  __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("__cinit__ (wrapper)", 0);
-  {
-    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_adj_indptr,&__pyx_n_s_adj_indices,&__pyx_n_s_node_train,&__pyx_n_s_num_proc,&__pyx_n_s_num_sample_per_proc,0};
-    PyObject* values[5] = {0,0,0,0,0};
-    if (unlikely(__pyx_kwds)) {
-      Py_ssize_t kw_args;
-      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
-      switch (pos_args) {
-        case  5: values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
-        CYTHON_FALLTHROUGH;
-        case  4: values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
-        CYTHON_FALLTHROUGH;
-        case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
-        CYTHON_FALLTHROUGH;
-        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
-        CYTHON_FALLTHROUGH;
-        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
-        CYTHON_FALLTHROUGH;
-        case  0: break;
-        default: goto __pyx_L5_argtuple_error;
-      }
-      kw_args = PyDict_Size(__pyx_kwds);
-      switch (pos_args) {
-        case  0:
-        if (likely((values[0] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_adj_indptr)) != 0)) kw_args--;
-        else goto __pyx_L5_argtuple_error;
-        CYTHON_FALLTHROUGH;
-        case  1:
-        if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_adj_indices)) != 0)) kw_args--;
-        else {
-          __Pyx_RaiseArgtupleInvalid("__cinit__", 1, 5, 5, 1); __PYX_ERR(0, 478, __pyx_L3_error)
-        }
-        CYTHON_FALLTHROUGH;
-        case  2:
-        if (likely((values[2] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_node_train)) != 0)) kw_args--;
-        else {
-          __Pyx_RaiseArgtupleInvalid("__cinit__", 1, 5, 5, 2); __PYX_ERR(0, 478, __pyx_L3_error)
-        }
-        CYTHON_FALLTHROUGH;
-        case  3:
-        if (likely((values[3] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_num_proc)) != 0)) kw_args--;
-        else {
-          __Pyx_RaiseArgtupleInvalid("__cinit__", 1, 5, 5, 3); __PYX_ERR(0, 478, __pyx_L3_error)
-        }
-        CYTHON_FALLTHROUGH;
-        case  4:
-        if (likely((values[4] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_num_sample_per_proc)) != 0)) kw_args--;
-        else {
-          __Pyx_RaiseArgtupleInvalid("__cinit__", 1, 5, 5, 4); __PYX_ERR(0, 478, __pyx_L3_error)
-        }
-      }
-      if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "__cinit__") < 0)) __PYX_ERR(0, 478, __pyx_L3_error)
-      }
-    } else if (PyTuple_GET_SIZE(__pyx_args) != 5) {
-      goto __pyx_L5_argtuple_error;
-    } else {
-      values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
-      values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
-      values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
-      values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
-      values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
-    }
-    __pyx_v_adj_indptr = ((PyArrayObject *)values[0]);
-    __pyx_v_adj_indices = ((PyArrayObject *)values[1]);
-    __pyx_v_node_train = ((PyArrayObject *)values[2]);
-    __pyx_v_num_proc = __Pyx_PyInt_As_int(values[3]); if (unlikely((__pyx_v_num_proc == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 481, __pyx_L3_error)
-    __pyx_v_num_sample_per_proc = __Pyx_PyInt_As_int(values[4]); if (unlikely((__pyx_v_num_sample_per_proc == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 481, __pyx_L3_error)
-  }
-  goto __pyx_L4_argument_unpacking_done;
-  __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("__cinit__", 1, 5, 5, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 478, __pyx_L3_error)
-  __pyx_L3_error:;
-  __Pyx_AddTraceback("graphsaint.cython_sampler.FullBatch.__cinit__", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __Pyx_RefNannyFinishContext();
-  return -1;
-  __pyx_L4_argument_unpacking_done:;
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_adj_indptr), __pyx_ptype_5numpy_ndarray, 1, "adj_indptr", 0))) __PYX_ERR(0, 478, __pyx_L1_error)
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_adj_indices), __pyx_ptype_5numpy_ndarray, 1, "adj_indices", 0))) __PYX_ERR(0, 479, __pyx_L1_error)
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_node_train), __pyx_ptype_5numpy_ndarray, 1, "node_train", 0))) __PYX_ERR(0, 480, __pyx_L1_error)
-  __pyx_r = __pyx_pf_10graphsaint_14cython_sampler_9FullBatch___cinit__(((struct __pyx_obj_10graphsaint_14cython_sampler_FullBatch *)__pyx_v_self), __pyx_v_adj_indptr, __pyx_v_adj_indices, __pyx_v_node_train, __pyx_v_num_proc, __pyx_v_num_sample_per_proc);
-
-  /* function exit code */
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __pyx_r = -1;
-  __pyx_L0:;
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-static int __pyx_pf_10graphsaint_14cython_sampler_9FullBatch___cinit__(CYTHON_UNUSED struct __pyx_obj_10graphsaint_14cython_sampler_FullBatch *__pyx_v_self, CYTHON_UNUSED PyArrayObject *__pyx_v_adj_indptr, CYTHON_UNUSED PyArrayObject *__pyx_v_adj_indices, CYTHON_UNUSED PyArrayObject *__pyx_v_node_train, CYTHON_UNUSED int __pyx_v_num_proc, CYTHON_UNUSED int __pyx_v_num_sample_per_proc) {
-  __Pyx_LocalBuf_ND __pyx_pybuffernd_adj_indices;
-  __Pyx_Buffer __pyx_pybuffer_adj_indices;
-  __Pyx_LocalBuf_ND __pyx_pybuffernd_adj_indptr;
-  __Pyx_Buffer __pyx_pybuffer_adj_indptr;
-  __Pyx_LocalBuf_ND __pyx_pybuffernd_node_train;
-  __Pyx_Buffer __pyx_pybuffer_node_train;
-  int __pyx_r;
-  __Pyx_RefNannyDeclarations
-  int __pyx_lineno = 0;
-  const char *__pyx_filename = NULL;
-  int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("__cinit__", 0);
-  __pyx_pybuffer_adj_indptr.pybuffer.buf = NULL;
-  __pyx_pybuffer_adj_indptr.refcount = 0;
-  __pyx_pybuffernd_adj_indptr.data = NULL;
-  __pyx_pybuffernd_adj_indptr.rcbuffer = &__pyx_pybuffer_adj_indptr;
-  __pyx_pybuffer_adj_indices.pybuffer.buf = NULL;
-  __pyx_pybuffer_adj_indices.refcount = 0;
-  __pyx_pybuffernd_adj_indices.data = NULL;
-  __pyx_pybuffernd_adj_indices.rcbuffer = &__pyx_pybuffer_adj_indices;
-  __pyx_pybuffer_node_train.pybuffer.buf = NULL;
-  __pyx_pybuffer_node_train.refcount = 0;
-  __pyx_pybuffernd_node_train.data = NULL;
-  __pyx_pybuffernd_node_train.rcbuffer = &__pyx_pybuffer_node_train;
-  {
-    __Pyx_BufFmt_StackElem __pyx_stack[1];
-    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_adj_indptr.rcbuffer->pybuffer, (PyObject*)__pyx_v_adj_indptr, &__Pyx_TypeInfo_int, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 478, __pyx_L1_error)
-  }
-  __pyx_pybuffernd_adj_indptr.diminfo[0].strides = __pyx_pybuffernd_adj_indptr.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_adj_indptr.diminfo[0].shape = __pyx_pybuffernd_adj_indptr.rcbuffer->pybuffer.shape[0];
-  {
-    __Pyx_BufFmt_StackElem __pyx_stack[1];
-    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_adj_indices.rcbuffer->pybuffer, (PyObject*)__pyx_v_adj_indices, &__Pyx_TypeInfo_int, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 478, __pyx_L1_error)
-  }
-  __pyx_pybuffernd_adj_indices.diminfo[0].strides = __pyx_pybuffernd_adj_indices.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_adj_indices.diminfo[0].shape = __pyx_pybuffernd_adj_indices.rcbuffer->pybuffer.shape[0];
-  {
-    __Pyx_BufFmt_StackElem __pyx_stack[1];
-    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_node_train.rcbuffer->pybuffer, (PyObject*)__pyx_v_node_train, &__Pyx_TypeInfo_int, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 478, __pyx_L1_error)
-  }
-  __pyx_pybuffernd_node_train.diminfo[0].strides = __pyx_pybuffernd_node_train.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_node_train.diminfo[0].shape = __pyx_pybuffernd_node_train.rcbuffer->pybuffer.shape[0];
-
-  /* function exit code */
-  __pyx_r = 0;
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  { PyObject *__pyx_type, *__pyx_value, *__pyx_tb;
-    __Pyx_PyThreadState_declare
-    __Pyx_PyThreadState_assign
-    __Pyx_ErrFetch(&__pyx_type, &__pyx_value, &__pyx_tb);
-    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_adj_indices.rcbuffer->pybuffer);
-    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_adj_indptr.rcbuffer->pybuffer);
-    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_node_train.rcbuffer->pybuffer);
-  __Pyx_ErrRestore(__pyx_type, __pyx_value, __pyx_tb);}
-  __Pyx_AddTraceback("graphsaint.cython_sampler.FullBatch.__cinit__", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __pyx_r = -1;
-  goto __pyx_L2;
-  __pyx_L0:;
-  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_adj_indices.rcbuffer->pybuffer);
-  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_adj_indptr.rcbuffer->pybuffer);
-  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_node_train.rcbuffer->pybuffer);
-  __pyx_L2:;
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "graphsaint/cython_sampler.pyx":484
- *         pass
- * 
- *     cdef void sample(self, int p) nogil:             # <<<<<<<<<<<<<<
- *         cdef int i = 0
- *         cdef int r = 0
- */
-
-static void __pyx_f_10graphsaint_14cython_sampler_9FullBatch_sample(struct __pyx_obj_10graphsaint_14cython_sampler_FullBatch *__pyx_v_self, int __pyx_v_p) {
-  int __pyx_v_i;
-  int __pyx_v_r;
-  int __pyx_v_idx_subg;
-  int __pyx_v_sample;
-  int __pyx_t_1;
-  int __pyx_lineno = 0;
-  const char *__pyx_filename = NULL;
-  int __pyx_clineno = 0;
-
-  /* "graphsaint/cython_sampler.pyx":485
- * 
- *     cdef void sample(self, int p) nogil:
- *         cdef int i = 0             # <<<<<<<<<<<<<<
- *         cdef int r = 0
- *         cdef int idx_subg
- */
-  __pyx_v_i = 0;
-
-  /* "graphsaint/cython_sampler.pyx":486
- *     cdef void sample(self, int p) nogil:
- *         cdef int i = 0
- *         cdef int r = 0             # <<<<<<<<<<<<<<
- *         cdef int idx_subg
- *         cdef int sample
- */
-  __pyx_v_r = 0;
-
-  /* "graphsaint/cython_sampler.pyx":489
- *         cdef int idx_subg
- *         cdef int sample
- *         while r < self.num_sample_per_proc:             # <<<<<<<<<<<<<<
- *             idx_subg = p*self.num_sample_per_proc+r
- *             i = 0
- */
-  while (1) {
-    __pyx_t_1 = ((__pyx_v_r < __pyx_v_self->__pyx_base.num_sample_per_proc) != 0);
-    if (!__pyx_t_1) break;
-
-    /* "graphsaint/cython_sampler.pyx":490
- *         cdef int sample
- *         while r < self.num_sample_per_proc:
- *             idx_subg = p*self.num_sample_per_proc+r             # <<<<<<<<<<<<<<
- *             i = 0
- *             while i < self.node_train_vec.size():
- */
-    __pyx_v_idx_subg = ((__pyx_v_p * __pyx_v_self->__pyx_base.num_sample_per_proc) + __pyx_v_r);
-
-    /* "graphsaint/cython_sampler.pyx":491
- *         while r < self.num_sample_per_proc:
- *             idx_subg = p*self.num_sample_per_proc+r
- *             i = 0             # <<<<<<<<<<<<<<
- *             while i < self.node_train_vec.size():
- *                 sample = i
- */
-    __pyx_v_i = 0;
-
-    /* "graphsaint/cython_sampler.pyx":492
- *             idx_subg = p*self.num_sample_per_proc+r
- *             i = 0
- *             while i < self.node_train_vec.size():             # <<<<<<<<<<<<<<
- *                 sample = i
- *                 self.node_sampled[idx_subg].push_back(self.node_train_vec[sample])
- */
-    while (1) {
-      __pyx_t_1 = ((__pyx_v_i < __pyx_v_self->__pyx_base.node_train_vec.size()) != 0);
-      if (!__pyx_t_1) break;
-
-      /* "graphsaint/cython_sampler.pyx":493
- *             i = 0
- *             while i < self.node_train_vec.size():
- *                 sample = i             # <<<<<<<<<<<<<<
- *                 self.node_sampled[idx_subg].push_back(self.node_train_vec[sample])
- *                 i = i + 1
- */
-      __pyx_v_sample = __pyx_v_i;
-
-      /* "graphsaint/cython_sampler.pyx":494
- *             while i < self.node_train_vec.size():
- *                 sample = i
- *                 self.node_sampled[idx_subg].push_back(self.node_train_vec[sample])             # <<<<<<<<<<<<<<
- *                 i = i + 1
- *             r = r + 1
- */
-      try {
-        (__pyx_v_self->__pyx_base.node_sampled[__pyx_v_idx_subg]).push_back((__pyx_v_self->__pyx_base.node_train_vec[__pyx_v_sample]));
-      } catch(...) {
-        #ifdef WITH_THREAD
-        PyGILState_STATE __pyx_gilstate_save = __Pyx_PyGILState_Ensure();
-        #endif
-        __Pyx_CppExn2PyErr();
-        #ifdef WITH_THREAD
-        __Pyx_PyGILState_Release(__pyx_gilstate_save);
-        #endif
-        __PYX_ERR(0, 494, __pyx_L1_error)
-      }
-
-      /* "graphsaint/cython_sampler.pyx":495
- *                 sample = i
- *                 self.node_sampled[idx_subg].push_back(self.node_train_vec[sample])
- *                 i = i + 1             # <<<<<<<<<<<<<<
- *             r = r + 1
- *             sort(self.node_sampled[idx_subg].begin(),self.node_sampled[idx_subg].end())
- */
-      __pyx_v_i = (__pyx_v_i + 1);
-    }
-
-    /* "graphsaint/cython_sampler.pyx":496
- *                 self.node_sampled[idx_subg].push_back(self.node_train_vec[sample])
- *                 i = i + 1
- *             r = r + 1             # <<<<<<<<<<<<<<
- *             sort(self.node_sampled[idx_subg].begin(),self.node_sampled[idx_subg].end())
- *             self.node_sampled[idx_subg].erase(unique(self.node_sampled[idx_subg].begin(),self.node_sampled[idx_subg].end()),self.node_sampled[idx_subg].end())
- */
-    __pyx_v_r = (__pyx_v_r + 1);
-
-    /* "graphsaint/cython_sampler.pyx":497
- *                 i = i + 1
- *             r = r + 1
- *             sort(self.node_sampled[idx_subg].begin(),self.node_sampled[idx_subg].end())             # <<<<<<<<<<<<<<
- *             self.node_sampled[idx_subg].erase(unique(self.node_sampled[idx_subg].begin(),self.node_sampled[idx_subg].end()),self.node_sampled[idx_subg].end())
- */
-    std::sort<std::vector<int> ::iterator>((__pyx_v_self->__pyx_base.node_sampled[__pyx_v_idx_subg]).begin(), (__pyx_v_self->__pyx_base.node_sampled[__pyx_v_idx_subg]).end());
-
-    /* "graphsaint/cython_sampler.pyx":498
- *             r = r + 1
- *             sort(self.node_sampled[idx_subg].begin(),self.node_sampled[idx_subg].end())
- *             self.node_sampled[idx_subg].erase(unique(self.node_sampled[idx_subg].begin(),self.node_sampled[idx_subg].end()),self.node_sampled[idx_subg].end())             # <<<<<<<<<<<<<<
- */
-    (void)((__pyx_v_self->__pyx_base.node_sampled[__pyx_v_idx_subg]).erase(std::unique<std::vector<int> ::iterator>((__pyx_v_self->__pyx_base.node_sampled[__pyx_v_idx_subg]).begin(), (__pyx_v_self->__pyx_base.node_sampled[__pyx_v_idx_subg]).end()), (__pyx_v_self->__pyx_base.node_sampled[__pyx_v_idx_subg]).end()));
-  }
-
-  /* "graphsaint/cython_sampler.pyx":484
- *         pass
- * 
- *     cdef void sample(self, int p) nogil:             # <<<<<<<<<<<<<<
- *         cdef int i = 0
- *         cdef int r = 0
- */
-
-  /* function exit code */
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_WriteUnraisable("graphsaint.cython_sampler.FullBatch.sample", __pyx_clineno, __pyx_lineno, __pyx_filename, 1, 1);
-  __pyx_L0:;
-}
-
-/* "(tree fragment)":1
- * def __reduce_cython__(self):             # <<<<<<<<<<<<<<
- *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
- * def __setstate_cython__(self, __pyx_state):
- */
-
-/* Python wrapper */
-static PyObject *__pyx_pw_10graphsaint_14cython_sampler_9FullBatch_3__reduce_cython__(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
-static PyObject *__pyx_pw_10graphsaint_14cython_sampler_9FullBatch_3__reduce_cython__(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
-  PyObject *__pyx_r = 0;
-  __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("__reduce_cython__ (wrapper)", 0);
-  __pyx_r = __pyx_pf_10graphsaint_14cython_sampler_9FullBatch_2__reduce_cython__(((struct __pyx_obj_10graphsaint_14cython_sampler_FullBatch *)__pyx_v_self));
-
-  /* function exit code */
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-static PyObject *__pyx_pf_10graphsaint_14cython_sampler_9FullBatch_2__reduce_cython__(CYTHON_UNUSED struct __pyx_obj_10graphsaint_14cython_sampler_FullBatch *__pyx_v_self) {
-  PyObject *__pyx_r = NULL;
-  __Pyx_RefNannyDeclarations
-  PyObject *__pyx_t_1 = NULL;
-  int __pyx_lineno = 0;
-  const char *__pyx_filename = NULL;
-  int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("__reduce_cython__", 0);
-
-  /* "(tree fragment)":2
- * def __reduce_cython__(self):
- *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")             # <<<<<<<<<<<<<<
- * def __setstate_cython__(self, __pyx_state):
- *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
- */
-  __pyx_t_1 = __Pyx_PyObject_Call(__pyx_builtin_TypeError, __pyx_tuple__13, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 2, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __Pyx_Raise(__pyx_t_1, 0, 0, 0);
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __PYX_ERR(1, 2, __pyx_L1_error)
-
-  /* "(tree fragment)":1
- * def __reduce_cython__(self):             # <<<<<<<<<<<<<<
- *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
- * def __setstate_cython__(self, __pyx_state):
- */
-
-  /* function exit code */
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_AddTraceback("graphsaint.cython_sampler.FullBatch.__reduce_cython__", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __pyx_r = NULL;
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "(tree fragment)":3
- * def __reduce_cython__(self):
- *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
- * def __setstate_cython__(self, __pyx_state):             # <<<<<<<<<<<<<<
- *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
- */
-
-/* Python wrapper */
-static PyObject *__pyx_pw_10graphsaint_14cython_sampler_9FullBatch_5__setstate_cython__(PyObject *__pyx_v_self, PyObject *__pyx_v___pyx_state); /*proto*/
-static PyObject *__pyx_pw_10graphsaint_14cython_sampler_9FullBatch_5__setstate_cython__(PyObject *__pyx_v_self, PyObject *__pyx_v___pyx_state) {
-  PyObject *__pyx_r = 0;
-  __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("__setstate_cython__ (wrapper)", 0);
-  __pyx_r = __pyx_pf_10graphsaint_14cython_sampler_9FullBatch_4__setstate_cython__(((struct __pyx_obj_10graphsaint_14cython_sampler_FullBatch *)__pyx_v_self), ((PyObject *)__pyx_v___pyx_state));
-
-  /* function exit code */
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-static PyObject *__pyx_pf_10graphsaint_14cython_sampler_9FullBatch_4__setstate_cython__(CYTHON_UNUSED struct __pyx_obj_10graphsaint_14cython_sampler_FullBatch *__pyx_v_self, CYTHON_UNUSED PyObject *__pyx_v___pyx_state) {
-  PyObject *__pyx_r = NULL;
-  __Pyx_RefNannyDeclarations
-  PyObject *__pyx_t_1 = NULL;
-  int __pyx_lineno = 0;
-  const char *__pyx_filename = NULL;
-  int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("__setstate_cython__", 0);
-
-  /* "(tree fragment)":4
- *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
- * def __setstate_cython__(self, __pyx_state):
- *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")             # <<<<<<<<<<<<<<
- */
-  __pyx_t_1 = __Pyx_PyObject_Call(__pyx_builtin_TypeError, __pyx_tuple__14, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 4, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __Pyx_Raise(__pyx_t_1, 0, 0, 0);
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __PYX_ERR(1, 4, __pyx_L1_error)
-
-  /* "(tree fragment)":3
- * def __reduce_cython__(self):
- *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
- * def __setstate_cython__(self, __pyx_state):             # <<<<<<<<<<<<<<
- *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
- */
-
-  /* function exit code */
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_AddTraceback("graphsaint.cython_sampler.FullBatch.__setstate_cython__", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __pyx_r = NULL;
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "../anaconda3/envs/ogb/lib/python3.7/site-packages/numpy/__init__.pxd":735
- * ctypedef npy_cdouble     complex_t
- * 
- * cdef inline object PyArray_MultiIterNew1(a):             # <<<<<<<<<<<<<<
- *     return PyArray_MultiIterNew(1, <void*>a)
- * 
- */
-
-static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyArray_MultiIterNew1(PyObject *__pyx_v_a) {
-  PyObject *__pyx_r = NULL;
-  __Pyx_RefNannyDeclarations
-  PyObject *__pyx_t_1 = NULL;
-  int __pyx_lineno = 0;
-  const char *__pyx_filename = NULL;
-  int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("PyArray_MultiIterNew1", 0);
-
-  /* "../anaconda3/envs/ogb/lib/python3.7/site-packages/numpy/__init__.pxd":736
- * 
- * cdef inline object PyArray_MultiIterNew1(a):
- *     return PyArray_MultiIterNew(1, <void*>a)             # <<<<<<<<<<<<<<
- * 
- * cdef inline object PyArray_MultiIterNew2(a, b):
- */
-  __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = PyArray_MultiIterNew(1, ((void *)__pyx_v_a)); if (unlikely(!__pyx_t_1)) __PYX_ERR(2, 736, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_r = __pyx_t_1;
-  __pyx_t_1 = 0;
-  goto __pyx_L0;
-
-  /* "../anaconda3/envs/ogb/lib/python3.7/site-packages/numpy/__init__.pxd":735
- * ctypedef npy_cdouble     complex_t
- * 
- * cdef inline object PyArray_MultiIterNew1(a):             # <<<<<<<<<<<<<<
- *     return PyArray_MultiIterNew(1, <void*>a)
- * 
- */
-
-  /* function exit code */
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_AddTraceback("numpy.PyArray_MultiIterNew1", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __pyx_r = 0;
-  __pyx_L0:;
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "../anaconda3/envs/ogb/lib/python3.7/site-packages/numpy/__init__.pxd":738
- *     return PyArray_MultiIterNew(1, <void*>a)
- * 
- * cdef inline object PyArray_MultiIterNew2(a, b):             # <<<<<<<<<<<<<<
- *     return PyArray_MultiIterNew(2, <void*>a, <void*>b)
- * 
- */
-
-static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyArray_MultiIterNew2(PyObject *__pyx_v_a, PyObject *__pyx_v_b) {
-  PyObject *__pyx_r = NULL;
-  __Pyx_RefNannyDeclarations
-  PyObject *__pyx_t_1 = NULL;
-  int __pyx_lineno = 0;
-  const char *__pyx_filename = NULL;
-  int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("PyArray_MultiIterNew2", 0);
-
-  /* "../anaconda3/envs/ogb/lib/python3.7/site-packages/numpy/__init__.pxd":739
- * 
- * cdef inline object PyArray_MultiIterNew2(a, b):
- *     return PyArray_MultiIterNew(2, <void*>a, <void*>b)             # <<<<<<<<<<<<<<
- * 
- * cdef inline object PyArray_MultiIterNew3(a, b, c):
- */
-  __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = PyArray_MultiIterNew(2, ((void *)__pyx_v_a), ((void *)__pyx_v_b)); if (unlikely(!__pyx_t_1)) __PYX_ERR(2, 739, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_r = __pyx_t_1;
-  __pyx_t_1 = 0;
-  goto __pyx_L0;
-
-  /* "../anaconda3/envs/ogb/lib/python3.7/site-packages/numpy/__init__.pxd":738
- *     return PyArray_MultiIterNew(1, <void*>a)
- * 
- * cdef inline object PyArray_MultiIterNew2(a, b):             # <<<<<<<<<<<<<<
- *     return PyArray_MultiIterNew(2, <void*>a, <void*>b)
- * 
- */
-
-  /* function exit code */
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_AddTraceback("numpy.PyArray_MultiIterNew2", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __pyx_r = 0;
-  __pyx_L0:;
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "../anaconda3/envs/ogb/lib/python3.7/site-packages/numpy/__init__.pxd":741
- *     return PyArray_MultiIterNew(2, <void*>a, <void*>b)
- * 
- * cdef inline object PyArray_MultiIterNew3(a, b, c):             # <<<<<<<<<<<<<<
- *     return PyArray_MultiIterNew(3, <void*>a, <void*>b, <void*> c)
- * 
- */
-
-static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyArray_MultiIterNew3(PyObject *__pyx_v_a, PyObject *__pyx_v_b, PyObject *__pyx_v_c) {
-  PyObject *__pyx_r = NULL;
-  __Pyx_RefNannyDeclarations
-  PyObject *__pyx_t_1 = NULL;
-  int __pyx_lineno = 0;
-  const char *__pyx_filename = NULL;
-  int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("PyArray_MultiIterNew3", 0);
-
-  /* "../anaconda3/envs/ogb/lib/python3.7/site-packages/numpy/__init__.pxd":742
- * 
- * cdef inline object PyArray_MultiIterNew3(a, b, c):
- *     return PyArray_MultiIterNew(3, <void*>a, <void*>b, <void*> c)             # <<<<<<<<<<<<<<
- * 
- * cdef inline object PyArray_MultiIterNew4(a, b, c, d):
- */
-  __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = PyArray_MultiIterNew(3, ((void *)__pyx_v_a), ((void *)__pyx_v_b), ((void *)__pyx_v_c)); if (unlikely(!__pyx_t_1)) __PYX_ERR(2, 742, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_r = __pyx_t_1;
-  __pyx_t_1 = 0;
-  goto __pyx_L0;
-
-  /* "../anaconda3/envs/ogb/lib/python3.7/site-packages/numpy/__init__.pxd":741
- *     return PyArray_MultiIterNew(2, <void*>a, <void*>b)
- * 
- * cdef inline object PyArray_MultiIterNew3(a, b, c):             # <<<<<<<<<<<<<<
- *     return PyArray_MultiIterNew(3, <void*>a, <void*>b, <void*> c)
- * 
- */
-
-  /* function exit code */
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_AddTraceback("numpy.PyArray_MultiIterNew3", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __pyx_r = 0;
-  __pyx_L0:;
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "../anaconda3/envs/ogb/lib/python3.7/site-packages/numpy/__init__.pxd":744
- *     return PyArray_MultiIterNew(3, <void*>a, <void*>b, <void*> c)
- * 
- * cdef inline object PyArray_MultiIterNew4(a, b, c, d):             # <<<<<<<<<<<<<<
- *     return PyArray_MultiIterNew(4, <void*>a, <void*>b, <void*>c, <void*> d)
- * 
- */
-
-static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyArray_MultiIterNew4(PyObject *__pyx_v_a, PyObject *__pyx_v_b, PyObject *__pyx_v_c, PyObject *__pyx_v_d) {
-  PyObject *__pyx_r = NULL;
-  __Pyx_RefNannyDeclarations
-  PyObject *__pyx_t_1 = NULL;
-  int __pyx_lineno = 0;
-  const char *__pyx_filename = NULL;
-  int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("PyArray_MultiIterNew4", 0);
-
-  /* "../anaconda3/envs/ogb/lib/python3.7/site-packages/numpy/__init__.pxd":745
- * 
- * cdef inline object PyArray_MultiIterNew4(a, b, c, d):
- *     return PyArray_MultiIterNew(4, <void*>a, <void*>b, <void*>c, <void*> d)             # <<<<<<<<<<<<<<
- * 
- * cdef inline object PyArray_MultiIterNew5(a, b, c, d, e):
- */
-  __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = PyArray_MultiIterNew(4, ((void *)__pyx_v_a), ((void *)__pyx_v_b), ((void *)__pyx_v_c), ((void *)__pyx_v_d)); if (unlikely(!__pyx_t_1)) __PYX_ERR(2, 745, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_r = __pyx_t_1;
-  __pyx_t_1 = 0;
-  goto __pyx_L0;
-
-  /* "../anaconda3/envs/ogb/lib/python3.7/site-packages/numpy/__init__.pxd":744
- *     return PyArray_MultiIterNew(3, <void*>a, <void*>b, <void*> c)
- * 
- * cdef inline object PyArray_MultiIterNew4(a, b, c, d):             # <<<<<<<<<<<<<<
- *     return PyArray_MultiIterNew(4, <void*>a, <void*>b, <void*>c, <void*> d)
- * 
- */
-
-  /* function exit code */
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_AddTraceback("numpy.PyArray_MultiIterNew4", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __pyx_r = 0;
-  __pyx_L0:;
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "../anaconda3/envs/ogb/lib/python3.7/site-packages/numpy/__init__.pxd":747
- *     return PyArray_MultiIterNew(4, <void*>a, <void*>b, <void*>c, <void*> d)
- * 
- * cdef inline object PyArray_MultiIterNew5(a, b, c, d, e):             # <<<<<<<<<<<<<<
- *     return PyArray_MultiIterNew(5, <void*>a, <void*>b, <void*>c, <void*> d, <void*> e)
- * 
- */
-
-static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyArray_MultiIterNew5(PyObject *__pyx_v_a, PyObject *__pyx_v_b, PyObject *__pyx_v_c, PyObject *__pyx_v_d, PyObject *__pyx_v_e) {
-  PyObject *__pyx_r = NULL;
-  __Pyx_RefNannyDeclarations
-  PyObject *__pyx_t_1 = NULL;
-  int __pyx_lineno = 0;
-  const char *__pyx_filename = NULL;
-  int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("PyArray_MultiIterNew5", 0);
-
-  /* "../anaconda3/envs/ogb/lib/python3.7/site-packages/numpy/__init__.pxd":748
- * 
- * cdef inline object PyArray_MultiIterNew5(a, b, c, d, e):
- *     return PyArray_MultiIterNew(5, <void*>a, <void*>b, <void*>c, <void*> d, <void*> e)             # <<<<<<<<<<<<<<
- * 
- * cdef inline tuple PyDataType_SHAPE(dtype d):
- */
-  __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = PyArray_MultiIterNew(5, ((void *)__pyx_v_a), ((void *)__pyx_v_b), ((void *)__pyx_v_c), ((void *)__pyx_v_d), ((void *)__pyx_v_e)); if (unlikely(!__pyx_t_1)) __PYX_ERR(2, 748, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_r = __pyx_t_1;
-  __pyx_t_1 = 0;
-  goto __pyx_L0;
-
-  /* "../anaconda3/envs/ogb/lib/python3.7/site-packages/numpy/__init__.pxd":747
- *     return PyArray_MultiIterNew(4, <void*>a, <void*>b, <void*>c, <void*> d)
- * 
- * cdef inline object PyArray_MultiIterNew5(a, b, c, d, e):             # <<<<<<<<<<<<<<
- *     return PyArray_MultiIterNew(5, <void*>a, <void*>b, <void*>c, <void*> d, <void*> e)
- * 
- */
-
-  /* function exit code */
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_AddTraceback("numpy.PyArray_MultiIterNew5", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __pyx_r = 0;
-  __pyx_L0:;
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "../anaconda3/envs/ogb/lib/python3.7/site-packages/numpy/__init__.pxd":750
- *     return PyArray_MultiIterNew(5, <void*>a, <void*>b, <void*>c, <void*> d, <void*> e)
- * 
- * cdef inline tuple PyDataType_SHAPE(dtype d):             # <<<<<<<<<<<<<<
- *     if PyDataType_HASSUBARRAY(d):
- *         return <tuple>d.subarray.shape
- */
-
-static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyDataType_SHAPE(PyArray_Descr *__pyx_v_d) {
-  PyObject *__pyx_r = NULL;
-  __Pyx_RefNannyDeclarations
-  int __pyx_t_1;
-  __Pyx_RefNannySetupContext("PyDataType_SHAPE", 0);
-
-  /* "../anaconda3/envs/ogb/lib/python3.7/site-packages/numpy/__init__.pxd":751
- * 
- * cdef inline tuple PyDataType_SHAPE(dtype d):
- *     if PyDataType_HASSUBARRAY(d):             # <<<<<<<<<<<<<<
- *         return <tuple>d.subarray.shape
- *     else:
- */
-  __pyx_t_1 = (PyDataType_HASSUBARRAY(__pyx_v_d) != 0);
-  if (__pyx_t_1) {
-
-    /* "../anaconda3/envs/ogb/lib/python3.7/site-packages/numpy/__init__.pxd":752
- * cdef inline tuple PyDataType_SHAPE(dtype d):
- *     if PyDataType_HASSUBARRAY(d):
- *         return <tuple>d.subarray.shape             # <<<<<<<<<<<<<<
- *     else:
- *         return ()
- */
-    __Pyx_XDECREF(__pyx_r);
-    __Pyx_INCREF(((PyObject*)__pyx_v_d->subarray->shape));
-    __pyx_r = ((PyObject*)__pyx_v_d->subarray->shape);
-    goto __pyx_L0;
-
-    /* "../anaconda3/envs/ogb/lib/python3.7/site-packages/numpy/__init__.pxd":751
- * 
- * cdef inline tuple PyDataType_SHAPE(dtype d):
- *     if PyDataType_HASSUBARRAY(d):             # <<<<<<<<<<<<<<
- *         return <tuple>d.subarray.shape
- *     else:
- */
-  }
-
-  /* "../anaconda3/envs/ogb/lib/python3.7/site-packages/numpy/__init__.pxd":754
- *         return <tuple>d.subarray.shape
- *     else:
- *         return ()             # <<<<<<<<<<<<<<
- * 
- * 
- */
-  /*else*/ {
-    __Pyx_XDECREF(__pyx_r);
-    __Pyx_INCREF(__pyx_empty_tuple);
-    __pyx_r = __pyx_empty_tuple;
-    goto __pyx_L0;
-  }
-
-  /* "../anaconda3/envs/ogb/lib/python3.7/site-packages/numpy/__init__.pxd":750
- *     return PyArray_MultiIterNew(5, <void*>a, <void*>b, <void*>c, <void*> d, <void*> e)
- * 
- * cdef inline tuple PyDataType_SHAPE(dtype d):             # <<<<<<<<<<<<<<
- *     if PyDataType_HASSUBARRAY(d):
- *         return <tuple>d.subarray.shape
- */
-
-  /* function exit code */
-  __pyx_L0:;
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "../anaconda3/envs/ogb/lib/python3.7/site-packages/numpy/__init__.pxd":931
- *     int _import_umath() except -1
- * 
- * cdef inline void set_array_base(ndarray arr, object base):             # <<<<<<<<<<<<<<
- *     Py_INCREF(base) # important to do this before stealing the reference below!
- *     PyArray_SetBaseObject(arr, base)
- */
-
-static CYTHON_INLINE void __pyx_f_5numpy_set_array_base(PyArrayObject *__pyx_v_arr, PyObject *__pyx_v_base) {
-  __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("set_array_base", 0);
-
-  /* "../anaconda3/envs/ogb/lib/python3.7/site-packages/numpy/__init__.pxd":932
- * 
- * cdef inline void set_array_base(ndarray arr, object base):
- *     Py_INCREF(base) # important to do this before stealing the reference below!             # <<<<<<<<<<<<<<
- *     PyArray_SetBaseObject(arr, base)
- * 
- */
-  Py_INCREF(__pyx_v_base);
-
-  /* "../anaconda3/envs/ogb/lib/python3.7/site-packages/numpy/__init__.pxd":933
- * cdef inline void set_array_base(ndarray arr, object base):
- *     Py_INCREF(base) # important to do this before stealing the reference below!
- *     PyArray_SetBaseObject(arr, base)             # <<<<<<<<<<<<<<
- * 
- * cdef inline object get_array_base(ndarray arr):
- */
-  (void)(PyArray_SetBaseObject(__pyx_v_arr, __pyx_v_base));
-
-  /* "../anaconda3/envs/ogb/lib/python3.7/site-packages/numpy/__init__.pxd":931
- *     int _import_umath() except -1
- * 
- * cdef inline void set_array_base(ndarray arr, object base):             # <<<<<<<<<<<<<<
- *     Py_INCREF(base) # important to do this before stealing the reference below!
- *     PyArray_SetBaseObject(arr, base)
- */
-
-  /* function exit code */
-  __Pyx_RefNannyFinishContext();
-}
-
-/* "../anaconda3/envs/ogb/lib/python3.7/site-packages/numpy/__init__.pxd":935
- *     PyArray_SetBaseObject(arr, base)
- * 
- * cdef inline object get_array_base(ndarray arr):             # <<<<<<<<<<<<<<
- *     base = PyArray_BASE(arr)
- *     if base is NULL:
- */
-
-static CYTHON_INLINE PyObject *__pyx_f_5numpy_get_array_base(PyArrayObject *__pyx_v_arr) {
-  PyObject *__pyx_v_base;
-  PyObject *__pyx_r = NULL;
-  __Pyx_RefNannyDeclarations
-  int __pyx_t_1;
-  __Pyx_RefNannySetupContext("get_array_base", 0);
-
-  /* "../anaconda3/envs/ogb/lib/python3.7/site-packages/numpy/__init__.pxd":936
- * 
- * cdef inline object get_array_base(ndarray arr):
- *     base = PyArray_BASE(arr)             # <<<<<<<<<<<<<<
- *     if base is NULL:
- *         return None
- */
-  __pyx_v_base = PyArray_BASE(__pyx_v_arr);
-
-  /* "../anaconda3/envs/ogb/lib/python3.7/site-packages/numpy/__init__.pxd":937
- * cdef inline object get_array_base(ndarray arr):
- *     base = PyArray_BASE(arr)
- *     if base is NULL:             # <<<<<<<<<<<<<<
- *         return None
- *     return <object>base
- */
-  __pyx_t_1 = ((__pyx_v_base == NULL) != 0);
-  if (__pyx_t_1) {
-
-    /* "../anaconda3/envs/ogb/lib/python3.7/site-packages/numpy/__init__.pxd":938
- *     base = PyArray_BASE(arr)
- *     if base is NULL:
- *         return None             # <<<<<<<<<<<<<<
- *     return <object>base
- * 
- */
-    __Pyx_XDECREF(__pyx_r);
-    __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-    goto __pyx_L0;
-
-    /* "../anaconda3/envs/ogb/lib/python3.7/site-packages/numpy/__init__.pxd":937
- * cdef inline object get_array_base(ndarray arr):
- *     base = PyArray_BASE(arr)
- *     if base is NULL:             # <<<<<<<<<<<<<<
- *         return None
- *     return <object>base
- */
-  }
-
-  /* "../anaconda3/envs/ogb/lib/python3.7/site-packages/numpy/__init__.pxd":939
- *     if base is NULL:
- *         return None
- *     return <object>base             # <<<<<<<<<<<<<<
- * 
- * # Versions of the import_* functions which are more suitable for
- */
-  __Pyx_XDECREF(__pyx_r);
-  __Pyx_INCREF(((PyObject *)__pyx_v_base));
-  __pyx_r = ((PyObject *)__pyx_v_base);
-  goto __pyx_L0;
-
-  /* "../anaconda3/envs/ogb/lib/python3.7/site-packages/numpy/__init__.pxd":935
- *     PyArray_SetBaseObject(arr, base)
- * 
- * cdef inline object get_array_base(ndarray arr):             # <<<<<<<<<<<<<<
- *     base = PyArray_BASE(arr)
- *     if base is NULL:
- */
-
-  /* function exit code */
-  __pyx_L0:;
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "../anaconda3/envs/ogb/lib/python3.7/site-packages/numpy/__init__.pxd":943
- * # Versions of the import_* functions which are more suitable for
- * # Cython code.
- * cdef inline int import_array() except -1:             # <<<<<<<<<<<<<<
- *     try:
- *         __pyx_import_array()
- */
-
-static CYTHON_INLINE int __pyx_f_5numpy_import_array(void) {
-  int __pyx_r;
-  __Pyx_RefNannyDeclarations
-  PyObject *__pyx_t_1 = NULL;
-  PyObject *__pyx_t_2 = NULL;
-  PyObject *__pyx_t_3 = NULL;
-  int __pyx_t_4;
-  PyObject *__pyx_t_5 = NULL;
-  PyObject *__pyx_t_6 = NULL;
-  PyObject *__pyx_t_7 = NULL;
-  PyObject *__pyx_t_8 = NULL;
-  int __pyx_lineno = 0;
-  const char *__pyx_filename = NULL;
-  int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("import_array", 0);
-
-  /* "../anaconda3/envs/ogb/lib/python3.7/site-packages/numpy/__init__.pxd":944
- * # Cython code.
- * cdef inline int import_array() except -1:
- *     try:             # <<<<<<<<<<<<<<
- *         __pyx_import_array()
- *     except Exception:
- */
-  {
-    __Pyx_PyThreadState_declare
-    __Pyx_PyThreadState_assign
-    __Pyx_ExceptionSave(&__pyx_t_1, &__pyx_t_2, &__pyx_t_3);
-    __Pyx_XGOTREF(__pyx_t_1);
-    __Pyx_XGOTREF(__pyx_t_2);
-    __Pyx_XGOTREF(__pyx_t_3);
-    /*try:*/ {
-
-      /* "../anaconda3/envs/ogb/lib/python3.7/site-packages/numpy/__init__.pxd":945
- * cdef inline int import_array() except -1:
- *     try:
- *         __pyx_import_array()             # <<<<<<<<<<<<<<
- *     except Exception:
- *         raise ImportError("numpy.core.multiarray failed to import")
- */
-      __pyx_t_4 = _import_array(); if (unlikely(__pyx_t_4 == ((int)-1))) __PYX_ERR(2, 945, __pyx_L3_error)
-
-      /* "../anaconda3/envs/ogb/lib/python3.7/site-packages/numpy/__init__.pxd":944
- * # Cython code.
- * cdef inline int import_array() except -1:
- *     try:             # <<<<<<<<<<<<<<
- *         __pyx_import_array()
- *     except Exception:
- */
-    }
-    __Pyx_XDECREF(__pyx_t_1); __pyx_t_1 = 0;
-    __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
-    __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
-    goto __pyx_L8_try_end;
-    __pyx_L3_error:;
-
-    /* "../anaconda3/envs/ogb/lib/python3.7/site-packages/numpy/__init__.pxd":946
- *     try:
- *         __pyx_import_array()
- *     except Exception:             # <<<<<<<<<<<<<<
- *         raise ImportError("numpy.core.multiarray failed to import")
- * 
- */
-    __pyx_t_4 = __Pyx_PyErr_ExceptionMatches(((PyObject *)(&((PyTypeObject*)PyExc_Exception)[0])));
-    if (__pyx_t_4) {
-      __Pyx_AddTraceback("numpy.import_array", __pyx_clineno, __pyx_lineno, __pyx_filename);
-      if (__Pyx_GetException(&__pyx_t_5, &__pyx_t_6, &__pyx_t_7) < 0) __PYX_ERR(2, 946, __pyx_L5_except_error)
-      __Pyx_GOTREF(__pyx_t_5);
-      __Pyx_GOTREF(__pyx_t_6);
-      __Pyx_GOTREF(__pyx_t_7);
-
-      /* "../anaconda3/envs/ogb/lib/python3.7/site-packages/numpy/__init__.pxd":947
- *         __pyx_import_array()
- *     except Exception:
- *         raise ImportError("numpy.core.multiarray failed to import")             # <<<<<<<<<<<<<<
- * 
- * cdef inline int import_umath() except -1:
- */
-      __pyx_t_8 = __Pyx_PyObject_Call(__pyx_builtin_ImportError, __pyx_tuple__15, NULL); if (unlikely(!__pyx_t_8)) __PYX_ERR(2, 947, __pyx_L5_except_error)
-      __Pyx_GOTREF(__pyx_t_8);
-      __Pyx_Raise(__pyx_t_8, 0, 0, 0);
-      __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
-      __PYX_ERR(2, 947, __pyx_L5_except_error)
-    }
-    goto __pyx_L5_except_error;
-    __pyx_L5_except_error:;
-
-    /* "../anaconda3/envs/ogb/lib/python3.7/site-packages/numpy/__init__.pxd":944
- * # Cython code.
- * cdef inline int import_array() except -1:
- *     try:             # <<<<<<<<<<<<<<
- *         __pyx_import_array()
- *     except Exception:
- */
-    __Pyx_XGIVEREF(__pyx_t_1);
-    __Pyx_XGIVEREF(__pyx_t_2);
-    __Pyx_XGIVEREF(__pyx_t_3);
-    __Pyx_ExceptionReset(__pyx_t_1, __pyx_t_2, __pyx_t_3);
-    goto __pyx_L1_error;
-    __pyx_L8_try_end:;
-  }
-
-  /* "../anaconda3/envs/ogb/lib/python3.7/site-packages/numpy/__init__.pxd":943
- * # Versions of the import_* functions which are more suitable for
- * # Cython code.
- * cdef inline int import_array() except -1:             # <<<<<<<<<<<<<<
- *     try:
- *         __pyx_import_array()
- */
-
-  /* function exit code */
-  __pyx_r = 0;
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_5);
-  __Pyx_XDECREF(__pyx_t_6);
-  __Pyx_XDECREF(__pyx_t_7);
-  __Pyx_XDECREF(__pyx_t_8);
-  __Pyx_AddTraceback("numpy.import_array", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __pyx_r = -1;
-  __pyx_L0:;
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "../anaconda3/envs/ogb/lib/python3.7/site-packages/numpy/__init__.pxd":949
- *         raise ImportError("numpy.core.multiarray failed to import")
- * 
- * cdef inline int import_umath() except -1:             # <<<<<<<<<<<<<<
- *     try:
- *         _import_umath()
- */
-
-static CYTHON_INLINE int __pyx_f_5numpy_import_umath(void) {
-  int __pyx_r;
-  __Pyx_RefNannyDeclarations
-  PyObject *__pyx_t_1 = NULL;
-  PyObject *__pyx_t_2 = NULL;
-  PyObject *__pyx_t_3 = NULL;
-  int __pyx_t_4;
-  PyObject *__pyx_t_5 = NULL;
-  PyObject *__pyx_t_6 = NULL;
-  PyObject *__pyx_t_7 = NULL;
-  PyObject *__pyx_t_8 = NULL;
-  int __pyx_lineno = 0;
-  const char *__pyx_filename = NULL;
-  int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("import_umath", 0);
-
-  /* "../anaconda3/envs/ogb/lib/python3.7/site-packages/numpy/__init__.pxd":950
- * 
- * cdef inline int import_umath() except -1:
- *     try:             # <<<<<<<<<<<<<<
- *         _import_umath()
- *     except Exception:
- */
-  {
-    __Pyx_PyThreadState_declare
-    __Pyx_PyThreadState_assign
-    __Pyx_ExceptionSave(&__pyx_t_1, &__pyx_t_2, &__pyx_t_3);
-    __Pyx_XGOTREF(__pyx_t_1);
-    __Pyx_XGOTREF(__pyx_t_2);
-    __Pyx_XGOTREF(__pyx_t_3);
-    /*try:*/ {
-
-      /* "../anaconda3/envs/ogb/lib/python3.7/site-packages/numpy/__init__.pxd":951
- * cdef inline int import_umath() except -1:
- *     try:
- *         _import_umath()             # <<<<<<<<<<<<<<
- *     except Exception:
- *         raise ImportError("numpy.core.umath failed to import")
- */
-      __pyx_t_4 = _import_umath(); if (unlikely(__pyx_t_4 == ((int)-1))) __PYX_ERR(2, 951, __pyx_L3_error)
-
-      /* "../anaconda3/envs/ogb/lib/python3.7/site-packages/numpy/__init__.pxd":950
- * 
- * cdef inline int import_umath() except -1:
- *     try:             # <<<<<<<<<<<<<<
- *         _import_umath()
- *     except Exception:
- */
-    }
-    __Pyx_XDECREF(__pyx_t_1); __pyx_t_1 = 0;
-    __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
-    __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
-    goto __pyx_L8_try_end;
-    __pyx_L3_error:;
-
-    /* "../anaconda3/envs/ogb/lib/python3.7/site-packages/numpy/__init__.pxd":952
- *     try:
- *         _import_umath()
- *     except Exception:             # <<<<<<<<<<<<<<
- *         raise ImportError("numpy.core.umath failed to import")
- * 
- */
-    __pyx_t_4 = __Pyx_PyErr_ExceptionMatches(((PyObject *)(&((PyTypeObject*)PyExc_Exception)[0])));
-    if (__pyx_t_4) {
-      __Pyx_AddTraceback("numpy.import_umath", __pyx_clineno, __pyx_lineno, __pyx_filename);
-      if (__Pyx_GetException(&__pyx_t_5, &__pyx_t_6, &__pyx_t_7) < 0) __PYX_ERR(2, 952, __pyx_L5_except_error)
-      __Pyx_GOTREF(__pyx_t_5);
-      __Pyx_GOTREF(__pyx_t_6);
-      __Pyx_GOTREF(__pyx_t_7);
-
-      /* "../anaconda3/envs/ogb/lib/python3.7/site-packages/numpy/__init__.pxd":953
- *         _import_umath()
- *     except Exception:
- *         raise ImportError("numpy.core.umath failed to import")             # <<<<<<<<<<<<<<
- * 
- * cdef inline int import_ufunc() except -1:
- */
-      __pyx_t_8 = __Pyx_PyObject_Call(__pyx_builtin_ImportError, __pyx_tuple__16, NULL); if (unlikely(!__pyx_t_8)) __PYX_ERR(2, 953, __pyx_L5_except_error)
-      __Pyx_GOTREF(__pyx_t_8);
-      __Pyx_Raise(__pyx_t_8, 0, 0, 0);
-      __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
-      __PYX_ERR(2, 953, __pyx_L5_except_error)
-    }
-    goto __pyx_L5_except_error;
-    __pyx_L5_except_error:;
-
-    /* "../anaconda3/envs/ogb/lib/python3.7/site-packages/numpy/__init__.pxd":950
- * 
- * cdef inline int import_umath() except -1:
- *     try:             # <<<<<<<<<<<<<<
- *         _import_umath()
- *     except Exception:
- */
-    __Pyx_XGIVEREF(__pyx_t_1);
-    __Pyx_XGIVEREF(__pyx_t_2);
-    __Pyx_XGIVEREF(__pyx_t_3);
-    __Pyx_ExceptionReset(__pyx_t_1, __pyx_t_2, __pyx_t_3);
-    goto __pyx_L1_error;
-    __pyx_L8_try_end:;
-  }
-
-  /* "../anaconda3/envs/ogb/lib/python3.7/site-packages/numpy/__init__.pxd":949
- *         raise ImportError("numpy.core.multiarray failed to import")
- * 
- * cdef inline int import_umath() except -1:             # <<<<<<<<<<<<<<
- *     try:
- *         _import_umath()
- */
-
-  /* function exit code */
-  __pyx_r = 0;
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_5);
-  __Pyx_XDECREF(__pyx_t_6);
-  __Pyx_XDECREF(__pyx_t_7);
-  __Pyx_XDECREF(__pyx_t_8);
-  __Pyx_AddTraceback("numpy.import_umath", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __pyx_r = -1;
-  __pyx_L0:;
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "../anaconda3/envs/ogb/lib/python3.7/site-packages/numpy/__init__.pxd":955
- *         raise ImportError("numpy.core.umath failed to import")
- * 
- * cdef inline int import_ufunc() except -1:             # <<<<<<<<<<<<<<
- *     try:
- *         _import_umath()
- */
-
-static CYTHON_INLINE int __pyx_f_5numpy_import_ufunc(void) {
-  int __pyx_r;
-  __Pyx_RefNannyDeclarations
-  PyObject *__pyx_t_1 = NULL;
-  PyObject *__pyx_t_2 = NULL;
-  PyObject *__pyx_t_3 = NULL;
-  int __pyx_t_4;
-  PyObject *__pyx_t_5 = NULL;
-  PyObject *__pyx_t_6 = NULL;
-  PyObject *__pyx_t_7 = NULL;
-  PyObject *__pyx_t_8 = NULL;
-  int __pyx_lineno = 0;
-  const char *__pyx_filename = NULL;
-  int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("import_ufunc", 0);
-
-  /* "../anaconda3/envs/ogb/lib/python3.7/site-packages/numpy/__init__.pxd":956
- * 
- * cdef inline int import_ufunc() except -1:
- *     try:             # <<<<<<<<<<<<<<
- *         _import_umath()
- *     except Exception:
- */
-  {
-    __Pyx_PyThreadState_declare
-    __Pyx_PyThreadState_assign
-    __Pyx_ExceptionSave(&__pyx_t_1, &__pyx_t_2, &__pyx_t_3);
-    __Pyx_XGOTREF(__pyx_t_1);
-    __Pyx_XGOTREF(__pyx_t_2);
-    __Pyx_XGOTREF(__pyx_t_3);
-    /*try:*/ {
-
-      /* "../anaconda3/envs/ogb/lib/python3.7/site-packages/numpy/__init__.pxd":957
- * cdef inline int import_ufunc() except -1:
- *     try:
- *         _import_umath()             # <<<<<<<<<<<<<<
- *     except Exception:
- *         raise ImportError("numpy.core.umath failed to import")
- */
-      __pyx_t_4 = _import_umath(); if (unlikely(__pyx_t_4 == ((int)-1))) __PYX_ERR(2, 957, __pyx_L3_error)
-
-      /* "../anaconda3/envs/ogb/lib/python3.7/site-packages/numpy/__init__.pxd":956
- * 
- * cdef inline int import_ufunc() except -1:
- *     try:             # <<<<<<<<<<<<<<
- *         _import_umath()
- *     except Exception:
- */
-    }
-    __Pyx_XDECREF(__pyx_t_1); __pyx_t_1 = 0;
-    __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
-    __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
-    goto __pyx_L8_try_end;
-    __pyx_L3_error:;
-
-    /* "../anaconda3/envs/ogb/lib/python3.7/site-packages/numpy/__init__.pxd":958
- *     try:
- *         _import_umath()
- *     except Exception:             # <<<<<<<<<<<<<<
- *         raise ImportError("numpy.core.umath failed to import")
- * 
- */
-    __pyx_t_4 = __Pyx_PyErr_ExceptionMatches(((PyObject *)(&((PyTypeObject*)PyExc_Exception)[0])));
-    if (__pyx_t_4) {
-      __Pyx_AddTraceback("numpy.import_ufunc", __pyx_clineno, __pyx_lineno, __pyx_filename);
-      if (__Pyx_GetException(&__pyx_t_5, &__pyx_t_6, &__pyx_t_7) < 0) __PYX_ERR(2, 958, __pyx_L5_except_error)
-      __Pyx_GOTREF(__pyx_t_5);
-      __Pyx_GOTREF(__pyx_t_6);
-      __Pyx_GOTREF(__pyx_t_7);
-
-      /* "../anaconda3/envs/ogb/lib/python3.7/site-packages/numpy/__init__.pxd":959
- *         _import_umath()
- *     except Exception:
- *         raise ImportError("numpy.core.umath failed to import")             # <<<<<<<<<<<<<<
- * 
- * cdef extern from *:
- */
-      __pyx_t_8 = __Pyx_PyObject_Call(__pyx_builtin_ImportError, __pyx_tuple__16, NULL); if (unlikely(!__pyx_t_8)) __PYX_ERR(2, 959, __pyx_L5_except_error)
-      __Pyx_GOTREF(__pyx_t_8);
-      __Pyx_Raise(__pyx_t_8, 0, 0, 0);
-      __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
-      __PYX_ERR(2, 959, __pyx_L5_except_error)
-    }
-    goto __pyx_L5_except_error;
-    __pyx_L5_except_error:;
-
-    /* "../anaconda3/envs/ogb/lib/python3.7/site-packages/numpy/__init__.pxd":956
- * 
- * cdef inline int import_ufunc() except -1:
- *     try:             # <<<<<<<<<<<<<<
- *         _import_umath()
- *     except Exception:
- */
-    __Pyx_XGIVEREF(__pyx_t_1);
-    __Pyx_XGIVEREF(__pyx_t_2);
-    __Pyx_XGIVEREF(__pyx_t_3);
-    __Pyx_ExceptionReset(__pyx_t_1, __pyx_t_2, __pyx_t_3);
-    goto __pyx_L1_error;
-    __pyx_L8_try_end:;
-  }
-
-  /* "../anaconda3/envs/ogb/lib/python3.7/site-packages/numpy/__init__.pxd":955
- *         raise ImportError("numpy.core.umath failed to import")
- * 
- * cdef inline int import_ufunc() except -1:             # <<<<<<<<<<<<<<
- *     try:
- *         _import_umath()
- */
-
-  /* function exit code */
-  __pyx_r = 0;
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_5);
-  __Pyx_XDECREF(__pyx_t_6);
-  __Pyx_XDECREF(__pyx_t_7);
-  __Pyx_XDECREF(__pyx_t_8);
-  __Pyx_AddTraceback("numpy.import_ufunc", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __pyx_r = -1;
-  __pyx_L0:;
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "../anaconda3/envs/ogb/lib/python3.7/site-packages/numpy/__init__.pxd":969
- * 
- * 
- * cdef inline bint is_timedelta64_object(object obj):             # <<<<<<<<<<<<<<
- *     """
- *     Cython equivalent of `isinstance(obj, np.timedelta64)`
- */
-
-static CYTHON_INLINE int __pyx_f_5numpy_is_timedelta64_object(PyObject *__pyx_v_obj) {
-  int __pyx_r;
-  __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("is_timedelta64_object", 0);
-
-  /* "../anaconda3/envs/ogb/lib/python3.7/site-packages/numpy/__init__.pxd":981
- *     bool
- *     """
- *     return PyObject_TypeCheck(obj, &PyTimedeltaArrType_Type)             # <<<<<<<<<<<<<<
- * 
- * 
- */
-  __pyx_r = PyObject_TypeCheck(__pyx_v_obj, (&PyTimedeltaArrType_Type));
-  goto __pyx_L0;
-
-  /* "../anaconda3/envs/ogb/lib/python3.7/site-packages/numpy/__init__.pxd":969
- * 
- * 
- * cdef inline bint is_timedelta64_object(object obj):             # <<<<<<<<<<<<<<
- *     """
- *     Cython equivalent of `isinstance(obj, np.timedelta64)`
- */
-
-  /* function exit code */
-  __pyx_L0:;
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "../anaconda3/envs/ogb/lib/python3.7/site-packages/numpy/__init__.pxd":984
- * 
- * 
- * cdef inline bint is_datetime64_object(object obj):             # <<<<<<<<<<<<<<
- *     """
- *     Cython equivalent of `isinstance(obj, np.datetime64)`
- */
-
-static CYTHON_INLINE int __pyx_f_5numpy_is_datetime64_object(PyObject *__pyx_v_obj) {
-  int __pyx_r;
-  __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("is_datetime64_object", 0);
-
-  /* "../anaconda3/envs/ogb/lib/python3.7/site-packages/numpy/__init__.pxd":996
- *     bool
- *     """
- *     return PyObject_TypeCheck(obj, &PyDatetimeArrType_Type)             # <<<<<<<<<<<<<<
- * 
- * 
- */
-  __pyx_r = PyObject_TypeCheck(__pyx_v_obj, (&PyDatetimeArrType_Type));
-  goto __pyx_L0;
-
-  /* "../anaconda3/envs/ogb/lib/python3.7/site-packages/numpy/__init__.pxd":984
- * 
- * 
- * cdef inline bint is_datetime64_object(object obj):             # <<<<<<<<<<<<<<
- *     """
- *     Cython equivalent of `isinstance(obj, np.datetime64)`
- */
-
-  /* function exit code */
-  __pyx_L0:;
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "../anaconda3/envs/ogb/lib/python3.7/site-packages/numpy/__init__.pxd":999
- * 
- * 
- * cdef inline npy_datetime get_datetime64_value(object obj) nogil:             # <<<<<<<<<<<<<<
- *     """
- *     returns the int64 value underlying scalar numpy datetime64 object
- */
-
-static CYTHON_INLINE npy_datetime __pyx_f_5numpy_get_datetime64_value(PyObject *__pyx_v_obj) {
-  npy_datetime __pyx_r;
-
-  /* "../anaconda3/envs/ogb/lib/python3.7/site-packages/numpy/__init__.pxd":1006
- *     also needed.  That can be found using `get_datetime64_unit`.
- *     """
- *     return (<PyDatetimeScalarObject*>obj).obval             # <<<<<<<<<<<<<<
- * 
- * 
- */
-  __pyx_r = ((PyDatetimeScalarObject *)__pyx_v_obj)->obval;
-  goto __pyx_L0;
-
-  /* "../anaconda3/envs/ogb/lib/python3.7/site-packages/numpy/__init__.pxd":999
- * 
- * 
- * cdef inline npy_datetime get_datetime64_value(object obj) nogil:             # <<<<<<<<<<<<<<
- *     """
- *     returns the int64 value underlying scalar numpy datetime64 object
- */
-
-  /* function exit code */
-  __pyx_L0:;
-  return __pyx_r;
-}
-
-/* "../anaconda3/envs/ogb/lib/python3.7/site-packages/numpy/__init__.pxd":1009
- * 
- * 
- * cdef inline npy_timedelta get_timedelta64_value(object obj) nogil:             # <<<<<<<<<<<<<<
- *     """
- *     returns the int64 value underlying scalar numpy timedelta64 object
- */
-
-static CYTHON_INLINE npy_timedelta __pyx_f_5numpy_get_timedelta64_value(PyObject *__pyx_v_obj) {
-  npy_timedelta __pyx_r;
-
-  /* "../anaconda3/envs/ogb/lib/python3.7/site-packages/numpy/__init__.pxd":1013
- *     returns the int64 value underlying scalar numpy timedelta64 object
- *     """
- *     return (<PyTimedeltaScalarObject*>obj).obval             # <<<<<<<<<<<<<<
- * 
- * 
- */
-  __pyx_r = ((PyTimedeltaScalarObject *)__pyx_v_obj)->obval;
-  goto __pyx_L0;
-
-  /* "../anaconda3/envs/ogb/lib/python3.7/site-packages/numpy/__init__.pxd":1009
- * 
- * 
- * cdef inline npy_timedelta get_timedelta64_value(object obj) nogil:             # <<<<<<<<<<<<<<
- *     """
- *     returns the int64 value underlying scalar numpy timedelta64 object
- */
-
-  /* function exit code */
-  __pyx_L0:;
-  return __pyx_r;
-}
-
-/* "../anaconda3/envs/ogb/lib/python3.7/site-packages/numpy/__init__.pxd":1016
- * 
- * 
- * cdef inline NPY_DATETIMEUNIT get_datetime64_unit(object obj) nogil:             # <<<<<<<<<<<<<<
- *     """
- *     returns the unit part of the dtype for a numpy datetime64 object.
- */
-
-static CYTHON_INLINE NPY_DATETIMEUNIT __pyx_f_5numpy_get_datetime64_unit(PyObject *__pyx_v_obj) {
-  NPY_DATETIMEUNIT __pyx_r;
-
-  /* "../anaconda3/envs/ogb/lib/python3.7/site-packages/numpy/__init__.pxd":1020
- *     returns the unit part of the dtype for a numpy datetime64 object.
- *     """
- *     return <NPY_DATETIMEUNIT>(<PyDatetimeScalarObject*>obj).obmeta.base             # <<<<<<<<<<<<<<
- */
-  __pyx_r = ((NPY_DATETIMEUNIT)((PyDatetimeScalarObject *)__pyx_v_obj)->obmeta.base);
-  goto __pyx_L0;
-
-  /* "../anaconda3/envs/ogb/lib/python3.7/site-packages/numpy/__init__.pxd":1016
- * 
- * 
- * cdef inline NPY_DATETIMEUNIT get_datetime64_unit(object obj) nogil:             # <<<<<<<<<<<<<<
- *     """
- *     returns the unit part of the dtype for a numpy datetime64 object.
- */
-
-  /* function exit code */
-  __pyx_L0:;
-  return __pyx_r;
-}
-
-/* "graphsaint/cython_utils.pxd":28
- *     cdef void set_data(self,vector[int]& data)
- * 
- * cdef inline void npy2vec_int(np.ndarray[int,ndim=1,mode='c'] nda, vector[int]& vec):             # <<<<<<<<<<<<<<
- *     cdef int size = nda.size
- *     cdef int* vec_c = &(nda[0])
- */
-
-static CYTHON_INLINE void __pyx_f_10graphsaint_12cython_utils_npy2vec_int(PyArrayObject *__pyx_v_nda, std::vector<int>  &__pyx_v_vec) {
-  int __pyx_v_size;
-  int *__pyx_v_vec_c;
-  __Pyx_LocalBuf_ND __pyx_pybuffernd_nda;
-  __Pyx_Buffer __pyx_pybuffer_nda;
-  __Pyx_RefNannyDeclarations
-  PyObject *__pyx_t_1 = NULL;
-  int __pyx_t_2;
-  Py_ssize_t __pyx_t_3;
-  int __pyx_lineno = 0;
-  const char *__pyx_filename = NULL;
-  int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("npy2vec_int", 0);
-  __pyx_pybuffer_nda.pybuffer.buf = NULL;
-  __pyx_pybuffer_nda.refcount = 0;
-  __pyx_pybuffernd_nda.data = NULL;
-  __pyx_pybuffernd_nda.rcbuffer = &__pyx_pybuffer_nda;
-  {
-    __Pyx_BufFmt_StackElem __pyx_stack[1];
-    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_nda.rcbuffer->pybuffer, (PyObject*)__pyx_v_nda, &__Pyx_TypeInfo_int, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) __PYX_ERR(3, 28, __pyx_L1_error)
-  }
-  __pyx_pybuffernd_nda.diminfo[0].strides = __pyx_pybuffernd_nda.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_nda.diminfo[0].shape = __pyx_pybuffernd_nda.rcbuffer->pybuffer.shape[0];
-
-  /* "graphsaint/cython_utils.pxd":29
- * 
- * cdef inline void npy2vec_int(np.ndarray[int,ndim=1,mode='c'] nda, vector[int]& vec):
- *     cdef int size = nda.size             # <<<<<<<<<<<<<<
- *     cdef int* vec_c = &(nda[0])
- *     vec.assign(vec_c,vec_c+size)
- */
-  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_nda), __pyx_n_s_size); if (unlikely(!__pyx_t_1)) __PYX_ERR(3, 29, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_2 = __Pyx_PyInt_As_int(__pyx_t_1); if (unlikely((__pyx_t_2 == (int)-1) && PyErr_Occurred())) __PYX_ERR(3, 29, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __pyx_v_size = __pyx_t_2;
-
-  /* "graphsaint/cython_utils.pxd":30
- * cdef inline void npy2vec_int(np.ndarray[int,ndim=1,mode='c'] nda, vector[int]& vec):
- *     cdef int size = nda.size
- *     cdef int* vec_c = &(nda[0])             # <<<<<<<<<<<<<<
- *     vec.assign(vec_c,vec_c+size)
- * 
- */
-  __pyx_t_3 = 0;
-  __pyx_t_2 = -1;
-  if (__pyx_t_3 < 0) {
-    __pyx_t_3 += __pyx_pybuffernd_nda.diminfo[0].shape;
-    if (unlikely(__pyx_t_3 < 0)) __pyx_t_2 = 0;
-  } else if (unlikely(__pyx_t_3 >= __pyx_pybuffernd_nda.diminfo[0].shape)) __pyx_t_2 = 0;
-  if (unlikely(__pyx_t_2 != -1)) {
-    __Pyx_RaiseBufferIndexError(__pyx_t_2);
-    __PYX_ERR(3, 30, __pyx_L1_error)
-  }
-  __pyx_v_vec_c = (&(*__Pyx_BufPtrCContig1d(int *, __pyx_pybuffernd_nda.rcbuffer->pybuffer.buf, __pyx_t_3, __pyx_pybuffernd_nda.diminfo[0].strides)));
-
-  /* "graphsaint/cython_utils.pxd":31
- *     cdef int size = nda.size
- *     cdef int* vec_c = &(nda[0])
- *     vec.assign(vec_c,vec_c+size)             # <<<<<<<<<<<<<<
- * 
- * cdef inline void npy2vec_float(np.ndarray[float,ndim=1,mode='c'] nda, vector[float]& vec):
- */
-  try {
-    __pyx_v_vec.assign(__pyx_v_vec_c, (__pyx_v_vec_c + __pyx_v_size));
-  } catch(...) {
-    __Pyx_CppExn2PyErr();
-    __PYX_ERR(3, 31, __pyx_L1_error)
-  }
-
-  /* "graphsaint/cython_utils.pxd":28
- *     cdef void set_data(self,vector[int]& data)
- * 
- * cdef inline void npy2vec_int(np.ndarray[int,ndim=1,mode='c'] nda, vector[int]& vec):             # <<<<<<<<<<<<<<
- *     cdef int size = nda.size
- *     cdef int* vec_c = &(nda[0])
- */
-
-  /* function exit code */
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  { PyObject *__pyx_type, *__pyx_value, *__pyx_tb;
-    __Pyx_PyThreadState_declare
-    __Pyx_PyThreadState_assign
-    __Pyx_ErrFetch(&__pyx_type, &__pyx_value, &__pyx_tb);
-    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_nda.rcbuffer->pybuffer);
-  __Pyx_ErrRestore(__pyx_type, __pyx_value, __pyx_tb);}
-  __Pyx_WriteUnraisable("graphsaint.cython_utils.npy2vec_int", __pyx_clineno, __pyx_lineno, __pyx_filename, 1, 0);
-  goto __pyx_L2;
-  __pyx_L0:;
-  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_nda.rcbuffer->pybuffer);
-  __pyx_L2:;
-  __Pyx_RefNannyFinishContext();
-}
-
-/* "graphsaint/cython_utils.pxd":33
- *     vec.assign(vec_c,vec_c+size)
- * 
- * cdef inline void npy2vec_float(np.ndarray[float,ndim=1,mode='c'] nda, vector[float]& vec):             # <<<<<<<<<<<<<<
- *     cdef int size = nda.size
- *     cdef float* vec_c = &(nda[0])
- */
-
-static CYTHON_INLINE void __pyx_f_10graphsaint_12cython_utils_npy2vec_float(PyArrayObject *__pyx_v_nda, std::vector<float>  &__pyx_v_vec) {
-  int __pyx_v_size;
-  float *__pyx_v_vec_c;
-  __Pyx_LocalBuf_ND __pyx_pybuffernd_nda;
-  __Pyx_Buffer __pyx_pybuffer_nda;
-  __Pyx_RefNannyDeclarations
-  PyObject *__pyx_t_1 = NULL;
-  int __pyx_t_2;
-  Py_ssize_t __pyx_t_3;
-  int __pyx_lineno = 0;
-  const char *__pyx_filename = NULL;
-  int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("npy2vec_float", 0);
-  __pyx_pybuffer_nda.pybuffer.buf = NULL;
-  __pyx_pybuffer_nda.refcount = 0;
-  __pyx_pybuffernd_nda.data = NULL;
-  __pyx_pybuffernd_nda.rcbuffer = &__pyx_pybuffer_nda;
-  {
-    __Pyx_BufFmt_StackElem __pyx_stack[1];
-    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_nda.rcbuffer->pybuffer, (PyObject*)__pyx_v_nda, &__Pyx_TypeInfo_float, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) __PYX_ERR(3, 33, __pyx_L1_error)
-  }
-  __pyx_pybuffernd_nda.diminfo[0].strides = __pyx_pybuffernd_nda.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_nda.diminfo[0].shape = __pyx_pybuffernd_nda.rcbuffer->pybuffer.shape[0];
-
-  /* "graphsaint/cython_utils.pxd":34
- * 
- * cdef inline void npy2vec_float(np.ndarray[float,ndim=1,mode='c'] nda, vector[float]& vec):
- *     cdef int size = nda.size             # <<<<<<<<<<<<<<
- *     cdef float* vec_c = &(nda[0])
- *     vec.assign(vec_c,vec_c+size)
- */
-  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_nda), __pyx_n_s_size); if (unlikely(!__pyx_t_1)) __PYX_ERR(3, 34, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_2 = __Pyx_PyInt_As_int(__pyx_t_1); if (unlikely((__pyx_t_2 == (int)-1) && PyErr_Occurred())) __PYX_ERR(3, 34, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __pyx_v_size = __pyx_t_2;
-
-  /* "graphsaint/cython_utils.pxd":35
- * cdef inline void npy2vec_float(np.ndarray[float,ndim=1,mode='c'] nda, vector[float]& vec):
- *     cdef int size = nda.size
- *     cdef float* vec_c = &(nda[0])             # <<<<<<<<<<<<<<
- *     vec.assign(vec_c,vec_c+size)
- * 
- */
-  __pyx_t_3 = 0;
-  __pyx_t_2 = -1;
-  if (__pyx_t_3 < 0) {
-    __pyx_t_3 += __pyx_pybuffernd_nda.diminfo[0].shape;
-    if (unlikely(__pyx_t_3 < 0)) __pyx_t_2 = 0;
-  } else if (unlikely(__pyx_t_3 >= __pyx_pybuffernd_nda.diminfo[0].shape)) __pyx_t_2 = 0;
-  if (unlikely(__pyx_t_2 != -1)) {
-    __Pyx_RaiseBufferIndexError(__pyx_t_2);
-    __PYX_ERR(3, 35, __pyx_L1_error)
-  }
-  __pyx_v_vec_c = (&(*__Pyx_BufPtrCContig1d(float *, __pyx_pybuffernd_nda.rcbuffer->pybuffer.buf, __pyx_t_3, __pyx_pybuffernd_nda.diminfo[0].strides)));
-
-  /* "graphsaint/cython_utils.pxd":36
- *     cdef int size = nda.size
- *     cdef float* vec_c = &(nda[0])
- *     vec.assign(vec_c,vec_c+size)             # <<<<<<<<<<<<<<
- * 
- */
-  try {
-    __pyx_v_vec.assign(__pyx_v_vec_c, (__pyx_v_vec_c + __pyx_v_size));
-  } catch(...) {
-    __Pyx_CppExn2PyErr();
-    __PYX_ERR(3, 36, __pyx_L1_error)
-  }
-
-  /* "graphsaint/cython_utils.pxd":33
- *     vec.assign(vec_c,vec_c+size)
- * 
- * cdef inline void npy2vec_float(np.ndarray[float,ndim=1,mode='c'] nda, vector[float]& vec):             # <<<<<<<<<<<<<<
- *     cdef int size = nda.size
- *     cdef float* vec_c = &(nda[0])
- */
-
-  /* function exit code */
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  { PyObject *__pyx_type, *__pyx_value, *__pyx_tb;
-    __Pyx_PyThreadState_declare
-    __Pyx_PyThreadState_assign
-    __Pyx_ErrFetch(&__pyx_type, &__pyx_value, &__pyx_tb);
-    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_nda.rcbuffer->pybuffer);
-  __Pyx_ErrRestore(__pyx_type, __pyx_value, __pyx_tb);}
-  __Pyx_WriteUnraisable("graphsaint.cython_utils.npy2vec_float", __pyx_clineno, __pyx_lineno, __pyx_filename, 1, 0);
-  goto __pyx_L2;
-  __pyx_L0:;
-  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_nda.rcbuffer->pybuffer);
-  __pyx_L2:;
-  __Pyx_RefNannyFinishContext();
-}
-static struct __pyx_vtabstruct_10graphsaint_14cython_sampler_Sampler __pyx_vtable_10graphsaint_14cython_sampler_Sampler;
-
-static PyObject *__pyx_tp_new_10graphsaint_14cython_sampler_Sampler(PyTypeObject *t, PyObject *a, PyObject *k) {
-  struct __pyx_obj_10graphsaint_14cython_sampler_Sampler *p;
-  PyObject *o;
-  if (likely((t->tp_flags & Py_TPFLAGS_IS_ABSTRACT) == 0)) {
-    o = (*t->tp_alloc)(t, 0);
-  } else {
-    o = (PyObject *) PyBaseObject_Type.tp_new(t, __pyx_empty_tuple, 0);
-  }
-  if (unlikely(!o)) return 0;
-  p = ((struct __pyx_obj_10graphsaint_14cython_sampler_Sampler *)o);
-  p->__pyx_vtab = __pyx_vtabptr_10graphsaint_14cython_sampler_Sampler;
-  new((void*)&(p->adj_indptr_vec)) std::vector<int> ();
-  new((void*)&(p->adj_indices_vec)) std::vector<int> ();
-  new((void*)&(p->node_train_vec)) std::vector<int> ();
-  new((void*)&(p->node_sampled)) std::vector<std::vector<int> > ();
-  new((void*)&(p->ret_indptr)) std::vector<std::vector<int> > ();
-  new((void*)&(p->ret_indices)) std::vector<std::vector<int> > ();
-  new((void*)&(p->ret_indices_orig)) std::vector<std::vector<int> > ();
-  new((void*)&(p->ret_data)) std::vector<std::vector<float> > ();
-  new((void*)&(p->ret_edge_index)) std::vector<std::vector<int> > ();
-  if (unlikely(__pyx_pw_10graphsaint_14cython_sampler_7Sampler_1__cinit__(o, a, k) < 0)) goto bad;
-  return o;
-  bad:
-  Py_DECREF(o); o = 0;
-  return NULL;
-}
-
-static void __pyx_tp_dealloc_10graphsaint_14cython_sampler_Sampler(PyObject *o) {
-  struct __pyx_obj_10graphsaint_14cython_sampler_Sampler *p = (struct __pyx_obj_10graphsaint_14cython_sampler_Sampler *)o;
-  #if CYTHON_USE_TP_FINALIZE
-  if (unlikely(PyType_HasFeature(Py_TYPE(o), Py_TPFLAGS_HAVE_FINALIZE) && Py_TYPE(o)->tp_finalize) && (!PyType_IS_GC(Py_TYPE(o)) || !_PyGC_FINALIZED(o))) {
-    if (PyObject_CallFinalizerFromDealloc(o)) return;
-  }
-  #endif
-  __Pyx_call_destructor(p->adj_indptr_vec);
-  __Pyx_call_destructor(p->adj_indices_vec);
-  __Pyx_call_destructor(p->node_train_vec);
-  __Pyx_call_destructor(p->node_sampled);
-  __Pyx_call_destructor(p->ret_indptr);
-  __Pyx_call_destructor(p->ret_indices);
-  __Pyx_call_destructor(p->ret_indices_orig);
-  __Pyx_call_destructor(p->ret_data);
-  __Pyx_call_destructor(p->ret_edge_index);
-  (*Py_TYPE(o)->tp_free)(o);
-}
-
-static PyMethodDef __pyx_methods_10graphsaint_14cython_sampler_Sampler[] = {
-  {"get_return", (PyCFunction)__pyx_pw_10graphsaint_14cython_sampler_7Sampler_3get_return, METH_NOARGS, __pyx_doc_10graphsaint_14cython_sampler_7Sampler_2get_return},
-  {"par_sample", (PyCFunction)__pyx_pw_10graphsaint_14cython_sampler_7Sampler_5par_sample, METH_NOARGS, __pyx_doc_10graphsaint_14cython_sampler_7Sampler_4par_sample},
-  {"__reduce_cython__", (PyCFunction)__pyx_pw_10graphsaint_14cython_sampler_7Sampler_7__reduce_cython__, METH_NOARGS, 0},
-  {"__setstate_cython__", (PyCFunction)__pyx_pw_10graphsaint_14cython_sampler_7Sampler_9__setstate_cython__, METH_O, 0},
-  {0, 0, 0, 0}
-};
-
-static PyTypeObject __pyx_type_10graphsaint_14cython_sampler_Sampler = {
-  PyVarObject_HEAD_INIT(0, 0)
-  "graphsaint.cython_sampler.Sampler", /*tp_name*/
-  sizeof(struct __pyx_obj_10graphsaint_14cython_sampler_Sampler), /*tp_basicsize*/
-  0, /*tp_itemsize*/
-  __pyx_tp_dealloc_10graphsaint_14cython_sampler_Sampler, /*tp_dealloc*/
-  #if PY_VERSION_HEX < 0x030800b4
-  0, /*tp_print*/
-  #endif
-  #if PY_VERSION_HEX >= 0x030800b4
-  0, /*tp_vectorcall_offset*/
-  #endif
-  0, /*tp_getattr*/
-  0, /*tp_setattr*/
-  #if PY_MAJOR_VERSION < 3
-  0, /*tp_compare*/
-  #endif
-  #if PY_MAJOR_VERSION >= 3
-  0, /*tp_as_async*/
-  #endif
-  0, /*tp_repr*/
-  0, /*tp_as_number*/
-  0, /*tp_as_sequence*/
-  0, /*tp_as_mapping*/
-  0, /*tp_hash*/
-  0, /*tp_call*/
-  0, /*tp_str*/
-  0, /*tp_getattro*/
-  0, /*tp_setattro*/
-  0, /*tp_as_buffer*/
-  Py_TPFLAGS_DEFAULT|Py_TPFLAGS_HAVE_VERSION_TAG|Py_TPFLAGS_CHECKTYPES|Py_TPFLAGS_HAVE_NEWBUFFER|Py_TPFLAGS_BASETYPE, /*tp_flags*/
-  0, /*tp_doc*/
-  0, /*tp_traverse*/
-  0, /*tp_clear*/
-  0, /*tp_richcompare*/
-  0, /*tp_weaklistoffset*/
-  0, /*tp_iter*/
-  0, /*tp_iternext*/
-  __pyx_methods_10graphsaint_14cython_sampler_Sampler, /*tp_methods*/
-  0, /*tp_members*/
-  0, /*tp_getset*/
-  0, /*tp_base*/
-  0, /*tp_dict*/
-  0, /*tp_descr_get*/
-  0, /*tp_descr_set*/
-  0, /*tp_dictoffset*/
-  0, /*tp_init*/
-  0, /*tp_alloc*/
-  __pyx_tp_new_10graphsaint_14cython_sampler_Sampler, /*tp_new*/
-  0, /*tp_free*/
-  0, /*tp_is_gc*/
-  0, /*tp_bases*/
-  0, /*tp_mro*/
-  0, /*tp_cache*/
-  0, /*tp_subclasses*/
-  0, /*tp_weaklist*/
-  0, /*tp_del*/
-  0, /*tp_version_tag*/
-  #if PY_VERSION_HEX >= 0x030400a1
-  0, /*tp_finalize*/
-  #endif
-  #if PY_VERSION_HEX >= 0x030800b1 && (!CYTHON_COMPILING_IN_PYPY || PYPY_VERSION_NUM >= 0x07030800)
-  0, /*tp_vectorcall*/
-  #endif
-  #if PY_VERSION_HEX >= 0x030800b4 && PY_VERSION_HEX < 0x03090000
-  0, /*tp_print*/
-  #endif
-  #if CYTHON_COMPILING_IN_PYPY && PY_VERSION_HEX >= 0x03090000
-  0, /*tp_pypy_flags*/
-  #endif
-};
-static struct __pyx_vtabstruct_10graphsaint_14cython_sampler_MRW __pyx_vtable_10graphsaint_14cython_sampler_MRW;
-
-static PyObject *__pyx_tp_new_10graphsaint_14cython_sampler_MRW(PyTypeObject *t, PyObject *a, PyObject *k) {
-  struct __pyx_obj_10graphsaint_14cython_sampler_MRW *p;
-  PyObject *o = __pyx_tp_new_10graphsaint_14cython_sampler_Sampler(t, a, k);
-  if (unlikely(!o)) return 0;
-  p = ((struct __pyx_obj_10graphsaint_14cython_sampler_MRW *)o);
-  p->__pyx_base.__pyx_vtab = (struct __pyx_vtabstruct_10graphsaint_14cython_sampler_Sampler*)__pyx_vtabptr_10graphsaint_14cython_sampler_MRW;
-  new((void*)&(p->arr_deg_vec)) std::vector<int> ();
-  if (unlikely(__pyx_pw_10graphsaint_14cython_sampler_3MRW_1__cinit__(o, a, k) < 0)) goto bad;
-  return o;
-  bad:
-  Py_DECREF(o); o = 0;
-  return NULL;
-}
-
-static void __pyx_tp_dealloc_10graphsaint_14cython_sampler_MRW(PyObject *o) {
-  struct __pyx_obj_10graphsaint_14cython_sampler_MRW *p = (struct __pyx_obj_10graphsaint_14cython_sampler_MRW *)o;
-  #if CYTHON_USE_TP_FINALIZE
-  if (unlikely(PyType_HasFeature(Py_TYPE(o), Py_TPFLAGS_HAVE_FINALIZE) && Py_TYPE(o)->tp_finalize) && (!PyType_IS_GC(Py_TYPE(o)) || !_PyGC_FINALIZED(o))) {
-    if (PyObject_CallFinalizerFromDealloc(o)) return;
-  }
-  #endif
-  __Pyx_call_destructor(p->arr_deg_vec);
-  __pyx_tp_dealloc_10graphsaint_14cython_sampler_Sampler(o);
-}
-
-static PyMethodDef __pyx_methods_10graphsaint_14cython_sampler_MRW[] = {
-  {"__reduce_cython__", (PyCFunction)__pyx_pw_10graphsaint_14cython_sampler_3MRW_3__reduce_cython__, METH_NOARGS, 0},
-  {"__setstate_cython__", (PyCFunction)__pyx_pw_10graphsaint_14cython_sampler_3MRW_5__setstate_cython__, METH_O, 0},
-  {0, 0, 0, 0}
-};
-
-static PyTypeObject __pyx_type_10graphsaint_14cython_sampler_MRW = {
-  PyVarObject_HEAD_INIT(0, 0)
-  "graphsaint.cython_sampler.MRW", /*tp_name*/
-  sizeof(struct __pyx_obj_10graphsaint_14cython_sampler_MRW), /*tp_basicsize*/
-  0, /*tp_itemsize*/
-  __pyx_tp_dealloc_10graphsaint_14cython_sampler_MRW, /*tp_dealloc*/
-  #if PY_VERSION_HEX < 0x030800b4
-  0, /*tp_print*/
-  #endif
-  #if PY_VERSION_HEX >= 0x030800b4
-  0, /*tp_vectorcall_offset*/
-  #endif
-  0, /*tp_getattr*/
-  0, /*tp_setattr*/
-  #if PY_MAJOR_VERSION < 3
-  0, /*tp_compare*/
-  #endif
-  #if PY_MAJOR_VERSION >= 3
-  0, /*tp_as_async*/
-  #endif
-  0, /*tp_repr*/
-  0, /*tp_as_number*/
-  0, /*tp_as_sequence*/
-  0, /*tp_as_mapping*/
-  0, /*tp_hash*/
-  0, /*tp_call*/
-  0, /*tp_str*/
-  0, /*tp_getattro*/
-  0, /*tp_setattro*/
-  0, /*tp_as_buffer*/
-  Py_TPFLAGS_DEFAULT|Py_TPFLAGS_HAVE_VERSION_TAG|Py_TPFLAGS_CHECKTYPES|Py_TPFLAGS_HAVE_NEWBUFFER|Py_TPFLAGS_BASETYPE, /*tp_flags*/
-  0, /*tp_doc*/
-  0, /*tp_traverse*/
-  0, /*tp_clear*/
-  0, /*tp_richcompare*/
-  0, /*tp_weaklistoffset*/
-  0, /*tp_iter*/
-  0, /*tp_iternext*/
-  __pyx_methods_10graphsaint_14cython_sampler_MRW, /*tp_methods*/
-  0, /*tp_members*/
-  0, /*tp_getset*/
-  0, /*tp_base*/
-  0, /*tp_dict*/
-  0, /*tp_descr_get*/
-  0, /*tp_descr_set*/
-  0, /*tp_dictoffset*/
-  0, /*tp_init*/
-  0, /*tp_alloc*/
-  __pyx_tp_new_10graphsaint_14cython_sampler_MRW, /*tp_new*/
-  0, /*tp_free*/
-  0, /*tp_is_gc*/
-  0, /*tp_bases*/
-  0, /*tp_mro*/
-  0, /*tp_cache*/
-  0, /*tp_subclasses*/
-  0, /*tp_weaklist*/
-  0, /*tp_del*/
-  0, /*tp_version_tag*/
-  #if PY_VERSION_HEX >= 0x030400a1
-  0, /*tp_finalize*/
-  #endif
-  #if PY_VERSION_HEX >= 0x030800b1 && (!CYTHON_COMPILING_IN_PYPY || PYPY_VERSION_NUM >= 0x07030800)
-  0, /*tp_vectorcall*/
-  #endif
-  #if PY_VERSION_HEX >= 0x030800b4 && PY_VERSION_HEX < 0x03090000
-  0, /*tp_print*/
-  #endif
-  #if CYTHON_COMPILING_IN_PYPY && PY_VERSION_HEX >= 0x03090000
-  0, /*tp_pypy_flags*/
-  #endif
-};
-static struct __pyx_vtabstruct_10graphsaint_14cython_sampler_RW __pyx_vtable_10graphsaint_14cython_sampler_RW;
-
-static PyObject *__pyx_tp_new_10graphsaint_14cython_sampler_RW(PyTypeObject *t, PyObject *a, PyObject *k) {
-  struct __pyx_obj_10graphsaint_14cython_sampler_RW *p;
-  PyObject *o = __pyx_tp_new_10graphsaint_14cython_sampler_Sampler(t, a, k);
-  if (unlikely(!o)) return 0;
-  p = ((struct __pyx_obj_10graphsaint_14cython_sampler_RW *)o);
-  p->__pyx_base.__pyx_vtab = (struct __pyx_vtabstruct_10graphsaint_14cython_sampler_Sampler*)__pyx_vtabptr_10graphsaint_14cython_sampler_RW;
-  if (unlikely(__pyx_pw_10graphsaint_14cython_sampler_2RW_1__cinit__(o, a, k) < 0)) goto bad;
-  return o;
-  bad:
-  Py_DECREF(o); o = 0;
-  return NULL;
-}
-
-static PyMethodDef __pyx_methods_10graphsaint_14cython_sampler_RW[] = {
-  {"__reduce_cython__", (PyCFunction)__pyx_pw_10graphsaint_14cython_sampler_2RW_3__reduce_cython__, METH_NOARGS, 0},
-  {"__setstate_cython__", (PyCFunction)__pyx_pw_10graphsaint_14cython_sampler_2RW_5__setstate_cython__, METH_O, 0},
-  {0, 0, 0, 0}
-};
-
-static PyTypeObject __pyx_type_10graphsaint_14cython_sampler_RW = {
-  PyVarObject_HEAD_INIT(0, 0)
-  "graphsaint.cython_sampler.RW", /*tp_name*/
-  sizeof(struct __pyx_obj_10graphsaint_14cython_sampler_RW), /*tp_basicsize*/
-  0, /*tp_itemsize*/
-  __pyx_tp_dealloc_10graphsaint_14cython_sampler_Sampler, /*tp_dealloc*/
-  #if PY_VERSION_HEX < 0x030800b4
-  0, /*tp_print*/
-  #endif
-  #if PY_VERSION_HEX >= 0x030800b4
-  0, /*tp_vectorcall_offset*/
-  #endif
-  0, /*tp_getattr*/
-  0, /*tp_setattr*/
-  #if PY_MAJOR_VERSION < 3
-  0, /*tp_compare*/
-  #endif
-  #if PY_MAJOR_VERSION >= 3
-  0, /*tp_as_async*/
-  #endif
-  0, /*tp_repr*/
-  0, /*tp_as_number*/
-  0, /*tp_as_sequence*/
-  0, /*tp_as_mapping*/
-  0, /*tp_hash*/
-  0, /*tp_call*/
-  0, /*tp_str*/
-  0, /*tp_getattro*/
-  0, /*tp_setattro*/
-  0, /*tp_as_buffer*/
-  Py_TPFLAGS_DEFAULT|Py_TPFLAGS_HAVE_VERSION_TAG|Py_TPFLAGS_CHECKTYPES|Py_TPFLAGS_HAVE_NEWBUFFER|Py_TPFLAGS_BASETYPE, /*tp_flags*/
-  0, /*tp_doc*/
-  0, /*tp_traverse*/
-  0, /*tp_clear*/
-  0, /*tp_richcompare*/
-  0, /*tp_weaklistoffset*/
-  0, /*tp_iter*/
-  0, /*tp_iternext*/
-  __pyx_methods_10graphsaint_14cython_sampler_RW, /*tp_methods*/
-  0, /*tp_members*/
-  0, /*tp_getset*/
-  0, /*tp_base*/
-  0, /*tp_dict*/
-  0, /*tp_descr_get*/
-  0, /*tp_descr_set*/
-  0, /*tp_dictoffset*/
-  0, /*tp_init*/
-  0, /*tp_alloc*/
-  __pyx_tp_new_10graphsaint_14cython_sampler_RW, /*tp_new*/
-  0, /*tp_free*/
-  0, /*tp_is_gc*/
-  0, /*tp_bases*/
-  0, /*tp_mro*/
-  0, /*tp_cache*/
-  0, /*tp_subclasses*/
-  0, /*tp_weaklist*/
-  0, /*tp_del*/
-  0, /*tp_version_tag*/
-  #if PY_VERSION_HEX >= 0x030400a1
-  0, /*tp_finalize*/
-  #endif
-  #if PY_VERSION_HEX >= 0x030800b1 && (!CYTHON_COMPILING_IN_PYPY || PYPY_VERSION_NUM >= 0x07030800)
-  0, /*tp_vectorcall*/
-  #endif
-  #if PY_VERSION_HEX >= 0x030800b4 && PY_VERSION_HEX < 0x03090000
-  0, /*tp_print*/
-  #endif
-  #if CYTHON_COMPILING_IN_PYPY && PY_VERSION_HEX >= 0x03090000
-  0, /*tp_pypy_flags*/
-  #endif
-};
-static struct __pyx_vtabstruct_10graphsaint_14cython_sampler_Edge __pyx_vtable_10graphsaint_14cython_sampler_Edge;
-
-static PyObject *__pyx_tp_new_10graphsaint_14cython_sampler_Edge(PyTypeObject *t, PyObject *a, PyObject *k) {
-  struct __pyx_obj_10graphsaint_14cython_sampler_Edge *p;
-  PyObject *o = __pyx_tp_new_10graphsaint_14cython_sampler_Sampler(t, a, k);
-  if (unlikely(!o)) return 0;
-  p = ((struct __pyx_obj_10graphsaint_14cython_sampler_Edge *)o);
-  p->__pyx_base.__pyx_vtab = (struct __pyx_vtabstruct_10graphsaint_14cython_sampler_Sampler*)__pyx_vtabptr_10graphsaint_14cython_sampler_Edge;
-  new((void*)&(p->row_train_vec)) std::vector<int> ();
-  new((void*)&(p->col_train_vec)) std::vector<int> ();
-  new((void*)&(p->prob_edge_vec)) std::vector<float> ();
-  if (unlikely(__pyx_pw_10graphsaint_14cython_sampler_4Edge_1__cinit__(o, a, k) < 0)) goto bad;
-  return o;
-  bad:
-  Py_DECREF(o); o = 0;
-  return NULL;
-}
-
-static void __pyx_tp_dealloc_10graphsaint_14cython_sampler_Edge(PyObject *o) {
-  struct __pyx_obj_10graphsaint_14cython_sampler_Edge *p = (struct __pyx_obj_10graphsaint_14cython_sampler_Edge *)o;
-  #if CYTHON_USE_TP_FINALIZE
-  if (unlikely(PyType_HasFeature(Py_TYPE(o), Py_TPFLAGS_HAVE_FINALIZE) && Py_TYPE(o)->tp_finalize) && (!PyType_IS_GC(Py_TYPE(o)) || !_PyGC_FINALIZED(o))) {
-    if (PyObject_CallFinalizerFromDealloc(o)) return;
-  }
-  #endif
-  __Pyx_call_destructor(p->row_train_vec);
-  __Pyx_call_destructor(p->col_train_vec);
-  __Pyx_call_destructor(p->prob_edge_vec);
-  __pyx_tp_dealloc_10graphsaint_14cython_sampler_Sampler(o);
-}
-
-static PyMethodDef __pyx_methods_10graphsaint_14cython_sampler_Edge[] = {
-  {"__reduce_cython__", (PyCFunction)__pyx_pw_10graphsaint_14cython_sampler_4Edge_3__reduce_cython__, METH_NOARGS, 0},
-  {"__setstate_cython__", (PyCFunction)__pyx_pw_10graphsaint_14cython_sampler_4Edge_5__setstate_cython__, METH_O, 0},
-  {0, 0, 0, 0}
-};
-
-static PyTypeObject __pyx_type_10graphsaint_14cython_sampler_Edge = {
-  PyVarObject_HEAD_INIT(0, 0)
-  "graphsaint.cython_sampler.Edge", /*tp_name*/
-  sizeof(struct __pyx_obj_10graphsaint_14cython_sampler_Edge), /*tp_basicsize*/
-  0, /*tp_itemsize*/
-  __pyx_tp_dealloc_10graphsaint_14cython_sampler_Edge, /*tp_dealloc*/
-  #if PY_VERSION_HEX < 0x030800b4
-  0, /*tp_print*/
-  #endif
-  #if PY_VERSION_HEX >= 0x030800b4
-  0, /*tp_vectorcall_offset*/
-  #endif
-  0, /*tp_getattr*/
-  0, /*tp_setattr*/
-  #if PY_MAJOR_VERSION < 3
-  0, /*tp_compare*/
-  #endif
-  #if PY_MAJOR_VERSION >= 3
-  0, /*tp_as_async*/
-  #endif
-  0, /*tp_repr*/
-  0, /*tp_as_number*/
-  0, /*tp_as_sequence*/
-  0, /*tp_as_mapping*/
-  0, /*tp_hash*/
-  0, /*tp_call*/
-  0, /*tp_str*/
-  0, /*tp_getattro*/
-  0, /*tp_setattro*/
-  0, /*tp_as_buffer*/
-  Py_TPFLAGS_DEFAULT|Py_TPFLAGS_HAVE_VERSION_TAG|Py_TPFLAGS_CHECKTYPES|Py_TPFLAGS_HAVE_NEWBUFFER|Py_TPFLAGS_BASETYPE, /*tp_flags*/
-  0, /*tp_doc*/
-  0, /*tp_traverse*/
-  0, /*tp_clear*/
-  0, /*tp_richcompare*/
-  0, /*tp_weaklistoffset*/
-  0, /*tp_iter*/
-  0, /*tp_iternext*/
-  __pyx_methods_10graphsaint_14cython_sampler_Edge, /*tp_methods*/
-  0, /*tp_members*/
-  0, /*tp_getset*/
-  0, /*tp_base*/
-  0, /*tp_dict*/
-  0, /*tp_descr_get*/
-  0, /*tp_descr_set*/
-  0, /*tp_dictoffset*/
-  0, /*tp_init*/
-  0, /*tp_alloc*/
-  __pyx_tp_new_10graphsaint_14cython_sampler_Edge, /*tp_new*/
-  0, /*tp_free*/
-  0, /*tp_is_gc*/
-  0, /*tp_bases*/
-  0, /*tp_mro*/
-  0, /*tp_cache*/
-  0, /*tp_subclasses*/
-  0, /*tp_weaklist*/
-  0, /*tp_del*/
-  0, /*tp_version_tag*/
-  #if PY_VERSION_HEX >= 0x030400a1
-  0, /*tp_finalize*/
-  #endif
-  #if PY_VERSION_HEX >= 0x030800b1 && (!CYTHON_COMPILING_IN_PYPY || PYPY_VERSION_NUM >= 0x07030800)
-  0, /*tp_vectorcall*/
-  #endif
-  #if PY_VERSION_HEX >= 0x030800b4 && PY_VERSION_HEX < 0x03090000
-  0, /*tp_print*/
-  #endif
-  #if CYTHON_COMPILING_IN_PYPY && PY_VERSION_HEX >= 0x03090000
-  0, /*tp_pypy_flags*/
-  #endif
-};
-static struct __pyx_vtabstruct_10graphsaint_14cython_sampler_Edge2 __pyx_vtable_10graphsaint_14cython_sampler_Edge2;
-
-static PyObject *__pyx_tp_new_10graphsaint_14cython_sampler_Edge2(PyTypeObject *t, PyObject *a, PyObject *k) {
-  struct __pyx_obj_10graphsaint_14cython_sampler_Edge2 *p;
-  PyObject *o = __pyx_tp_new_10graphsaint_14cython_sampler_Sampler(t, a, k);
-  if (unlikely(!o)) return 0;
-  p = ((struct __pyx_obj_10graphsaint_14cython_sampler_Edge2 *)o);
-  p->__pyx_base.__pyx_vtab = (struct __pyx_vtabstruct_10graphsaint_14cython_sampler_Sampler*)__pyx_vtabptr_10graphsaint_14cython_sampler_Edge2;
-  new((void*)&(p->row_train_vec)) std::vector<int> ();
-  new((void*)&(p->col_train_vec)) std::vector<int> ();
-  new((void*)&(p->p_dist_cumsum_vec)) std::vector<float> ();
-  if (unlikely(__pyx_pw_10graphsaint_14cython_sampler_5Edge2_1__cinit__(o, a, k) < 0)) goto bad;
-  return o;
-  bad:
-  Py_DECREF(o); o = 0;
-  return NULL;
-}
-
-static void __pyx_tp_dealloc_10graphsaint_14cython_sampler_Edge2(PyObject *o) {
-  struct __pyx_obj_10graphsaint_14cython_sampler_Edge2 *p = (struct __pyx_obj_10graphsaint_14cython_sampler_Edge2 *)o;
-  #if CYTHON_USE_TP_FINALIZE
-  if (unlikely(PyType_HasFeature(Py_TYPE(o), Py_TPFLAGS_HAVE_FINALIZE) && Py_TYPE(o)->tp_finalize) && (!PyType_IS_GC(Py_TYPE(o)) || !_PyGC_FINALIZED(o))) {
-    if (PyObject_CallFinalizerFromDealloc(o)) return;
-  }
-  #endif
-  __Pyx_call_destructor(p->row_train_vec);
-  __Pyx_call_destructor(p->col_train_vec);
-  __Pyx_call_destructor(p->p_dist_cumsum_vec);
-  __pyx_tp_dealloc_10graphsaint_14cython_sampler_Sampler(o);
-}
-
-static PyMethodDef __pyx_methods_10graphsaint_14cython_sampler_Edge2[] = {
-  {"__reduce_cython__", (PyCFunction)__pyx_pw_10graphsaint_14cython_sampler_5Edge2_3__reduce_cython__, METH_NOARGS, 0},
-  {"__setstate_cython__", (PyCFunction)__pyx_pw_10graphsaint_14cython_sampler_5Edge2_5__setstate_cython__, METH_O, 0},
-  {0, 0, 0, 0}
-};
-
-static PyTypeObject __pyx_type_10graphsaint_14cython_sampler_Edge2 = {
-  PyVarObject_HEAD_INIT(0, 0)
-  "graphsaint.cython_sampler.Edge2", /*tp_name*/
-  sizeof(struct __pyx_obj_10graphsaint_14cython_sampler_Edge2), /*tp_basicsize*/
-  0, /*tp_itemsize*/
-  __pyx_tp_dealloc_10graphsaint_14cython_sampler_Edge2, /*tp_dealloc*/
-  #if PY_VERSION_HEX < 0x030800b4
-  0, /*tp_print*/
-  #endif
-  #if PY_VERSION_HEX >= 0x030800b4
-  0, /*tp_vectorcall_offset*/
-  #endif
-  0, /*tp_getattr*/
-  0, /*tp_setattr*/
-  #if PY_MAJOR_VERSION < 3
-  0, /*tp_compare*/
-  #endif
-  #if PY_MAJOR_VERSION >= 3
-  0, /*tp_as_async*/
-  #endif
-  0, /*tp_repr*/
-  0, /*tp_as_number*/
-  0, /*tp_as_sequence*/
-  0, /*tp_as_mapping*/
-  0, /*tp_hash*/
-  0, /*tp_call*/
-  0, /*tp_str*/
-  0, /*tp_getattro*/
-  0, /*tp_setattro*/
-  0, /*tp_as_buffer*/
-  Py_TPFLAGS_DEFAULT|Py_TPFLAGS_HAVE_VERSION_TAG|Py_TPFLAGS_CHECKTYPES|Py_TPFLAGS_HAVE_NEWBUFFER|Py_TPFLAGS_BASETYPE, /*tp_flags*/
-  "\n    approximate version of the above Edge class\n    ", /*tp_doc*/
-  0, /*tp_traverse*/
-  0, /*tp_clear*/
-  0, /*tp_richcompare*/
-  0, /*tp_weaklistoffset*/
-  0, /*tp_iter*/
-  0, /*tp_iternext*/
-  __pyx_methods_10graphsaint_14cython_sampler_Edge2, /*tp_methods*/
-  0, /*tp_members*/
-  0, /*tp_getset*/
-  0, /*tp_base*/
-  0, /*tp_dict*/
-  0, /*tp_descr_get*/
-  0, /*tp_descr_set*/
-  0, /*tp_dictoffset*/
-  0, /*tp_init*/
-  0, /*tp_alloc*/
-  __pyx_tp_new_10graphsaint_14cython_sampler_Edge2, /*tp_new*/
-  0, /*tp_free*/
-  0, /*tp_is_gc*/
-  0, /*tp_bases*/
-  0, /*tp_mro*/
-  0, /*tp_cache*/
-  0, /*tp_subclasses*/
-  0, /*tp_weaklist*/
-  0, /*tp_del*/
-  0, /*tp_version_tag*/
-  #if PY_VERSION_HEX >= 0x030400a1
-  0, /*tp_finalize*/
-  #endif
-  #if PY_VERSION_HEX >= 0x030800b1 && (!CYTHON_COMPILING_IN_PYPY || PYPY_VERSION_NUM >= 0x07030800)
-  0, /*tp_vectorcall*/
-  #endif
-  #if PY_VERSION_HEX >= 0x030800b4 && PY_VERSION_HEX < 0x03090000
-  0, /*tp_print*/
-  #endif
-  #if CYTHON_COMPILING_IN_PYPY && PY_VERSION_HEX >= 0x03090000
-  0, /*tp_pypy_flags*/
-  #endif
-};
-static struct __pyx_vtabstruct_10graphsaint_14cython_sampler_Node __pyx_vtable_10graphsaint_14cython_sampler_Node;
-
-static PyObject *__pyx_tp_new_10graphsaint_14cython_sampler_Node(PyTypeObject *t, PyObject *a, PyObject *k) {
-  struct __pyx_obj_10graphsaint_14cython_sampler_Node *p;
-  PyObject *o = __pyx_tp_new_10graphsaint_14cython_sampler_Sampler(t, a, k);
-  if (unlikely(!o)) return 0;
-  p = ((struct __pyx_obj_10graphsaint_14cython_sampler_Node *)o);
-  p->__pyx_base.__pyx_vtab = (struct __pyx_vtabstruct_10graphsaint_14cython_sampler_Sampler*)__pyx_vtabptr_10graphsaint_14cython_sampler_Node;
-  new((void*)&(p->p_dist_cumsum_vec)) std::vector<int> ();
-  if (unlikely(__pyx_pw_10graphsaint_14cython_sampler_4Node_1__cinit__(o, a, k) < 0)) goto bad;
-  return o;
-  bad:
-  Py_DECREF(o); o = 0;
-  return NULL;
-}
-
-static void __pyx_tp_dealloc_10graphsaint_14cython_sampler_Node(PyObject *o) {
-  struct __pyx_obj_10graphsaint_14cython_sampler_Node *p = (struct __pyx_obj_10graphsaint_14cython_sampler_Node *)o;
-  #if CYTHON_USE_TP_FINALIZE
-  if (unlikely(PyType_HasFeature(Py_TYPE(o), Py_TPFLAGS_HAVE_FINALIZE) && Py_TYPE(o)->tp_finalize) && (!PyType_IS_GC(Py_TYPE(o)) || !_PyGC_FINALIZED(o))) {
-    if (PyObject_CallFinalizerFromDealloc(o)) return;
-  }
-  #endif
-  __Pyx_call_destructor(p->p_dist_cumsum_vec);
-  __pyx_tp_dealloc_10graphsaint_14cython_sampler_Sampler(o);
-}
-
-static PyMethodDef __pyx_methods_10graphsaint_14cython_sampler_Node[] = {
-  {"__reduce_cython__", (PyCFunction)__pyx_pw_10graphsaint_14cython_sampler_4Node_3__reduce_cython__, METH_NOARGS, 0},
-  {"__setstate_cython__", (PyCFunction)__pyx_pw_10graphsaint_14cython_sampler_4Node_5__setstate_cython__, METH_O, 0},
-  {0, 0, 0, 0}
-};
-
-static PyTypeObject __pyx_type_10graphsaint_14cython_sampler_Node = {
-  PyVarObject_HEAD_INIT(0, 0)
-  "graphsaint.cython_sampler.Node", /*tp_name*/
-  sizeof(struct __pyx_obj_10graphsaint_14cython_sampler_Node), /*tp_basicsize*/
-  0, /*tp_itemsize*/
-  __pyx_tp_dealloc_10graphsaint_14cython_sampler_Node, /*tp_dealloc*/
-  #if PY_VERSION_HEX < 0x030800b4
-  0, /*tp_print*/
-  #endif
-  #if PY_VERSION_HEX >= 0x030800b4
-  0, /*tp_vectorcall_offset*/
-  #endif
-  0, /*tp_getattr*/
-  0, /*tp_setattr*/
-  #if PY_MAJOR_VERSION < 3
-  0, /*tp_compare*/
-  #endif
-  #if PY_MAJOR_VERSION >= 3
-  0, /*tp_as_async*/
-  #endif
-  0, /*tp_repr*/
-  0, /*tp_as_number*/
-  0, /*tp_as_sequence*/
-  0, /*tp_as_mapping*/
-  0, /*tp_hash*/
-  0, /*tp_call*/
-  0, /*tp_str*/
-  0, /*tp_getattro*/
-  0, /*tp_setattro*/
-  0, /*tp_as_buffer*/
-  Py_TPFLAGS_DEFAULT|Py_TPFLAGS_HAVE_VERSION_TAG|Py_TPFLAGS_CHECKTYPES|Py_TPFLAGS_HAVE_NEWBUFFER|Py_TPFLAGS_BASETYPE, /*tp_flags*/
-  0, /*tp_doc*/
-  0, /*tp_traverse*/
-  0, /*tp_clear*/
-  0, /*tp_richcompare*/
-  0, /*tp_weaklistoffset*/
-  0, /*tp_iter*/
-  0, /*tp_iternext*/
-  __pyx_methods_10graphsaint_14cython_sampler_Node, /*tp_methods*/
-  0, /*tp_members*/
-  0, /*tp_getset*/
-  0, /*tp_base*/
-  0, /*tp_dict*/
-  0, /*tp_descr_get*/
-  0, /*tp_descr_set*/
-  0, /*tp_dictoffset*/
-  0, /*tp_init*/
-  0, /*tp_alloc*/
-  __pyx_tp_new_10graphsaint_14cython_sampler_Node, /*tp_new*/
-  0, /*tp_free*/
-  0, /*tp_is_gc*/
-  0, /*tp_bases*/
-  0, /*tp_mro*/
-  0, /*tp_cache*/
-  0, /*tp_subclasses*/
-  0, /*tp_weaklist*/
-  0, /*tp_del*/
-  0, /*tp_version_tag*/
-  #if PY_VERSION_HEX >= 0x030400a1
-  0, /*tp_finalize*/
-  #endif
-  #if PY_VERSION_HEX >= 0x030800b1 && (!CYTHON_COMPILING_IN_PYPY || PYPY_VERSION_NUM >= 0x07030800)
-  0, /*tp_vectorcall*/
-  #endif
-  #if PY_VERSION_HEX >= 0x030800b4 && PY_VERSION_HEX < 0x03090000
-  0, /*tp_print*/
-  #endif
-  #if CYTHON_COMPILING_IN_PYPY && PY_VERSION_HEX >= 0x03090000
-  0, /*tp_pypy_flags*/
-  #endif
-};
-static struct __pyx_vtabstruct_10graphsaint_14cython_sampler_FullBatch __pyx_vtable_10graphsaint_14cython_sampler_FullBatch;
-
-static PyObject *__pyx_tp_new_10graphsaint_14cython_sampler_FullBatch(PyTypeObject *t, PyObject *a, PyObject *k) {
-  struct __pyx_obj_10graphsaint_14cython_sampler_FullBatch *p;
-  PyObject *o = __pyx_tp_new_10graphsaint_14cython_sampler_Sampler(t, a, k);
-  if (unlikely(!o)) return 0;
-  p = ((struct __pyx_obj_10graphsaint_14cython_sampler_FullBatch *)o);
-  p->__pyx_base.__pyx_vtab = (struct __pyx_vtabstruct_10graphsaint_14cython_sampler_Sampler*)__pyx_vtabptr_10graphsaint_14cython_sampler_FullBatch;
-  if (unlikely(__pyx_pw_10graphsaint_14cython_sampler_9FullBatch_1__cinit__(o, a, k) < 0)) goto bad;
-  return o;
-  bad:
-  Py_DECREF(o); o = 0;
-  return NULL;
-}
-
-static PyMethodDef __pyx_methods_10graphsaint_14cython_sampler_FullBatch[] = {
-  {"__reduce_cython__", (PyCFunction)__pyx_pw_10graphsaint_14cython_sampler_9FullBatch_3__reduce_cython__, METH_NOARGS, 0},
-  {"__setstate_cython__", (PyCFunction)__pyx_pw_10graphsaint_14cython_sampler_9FullBatch_5__setstate_cython__, METH_O, 0},
-  {0, 0, 0, 0}
-};
-
-static PyTypeObject __pyx_type_10graphsaint_14cython_sampler_FullBatch = {
-  PyVarObject_HEAD_INIT(0, 0)
-  "graphsaint.cython_sampler.FullBatch", /*tp_name*/
-  sizeof(struct __pyx_obj_10graphsaint_14cython_sampler_FullBatch), /*tp_basicsize*/
-  0, /*tp_itemsize*/
-  __pyx_tp_dealloc_10graphsaint_14cython_sampler_Sampler, /*tp_dealloc*/
-  #if PY_VERSION_HEX < 0x030800b4
-  0, /*tp_print*/
-  #endif
-  #if PY_VERSION_HEX >= 0x030800b4
-  0, /*tp_vectorcall_offset*/
-  #endif
-  0, /*tp_getattr*/
-  0, /*tp_setattr*/
-  #if PY_MAJOR_VERSION < 3
-  0, /*tp_compare*/
-  #endif
-  #if PY_MAJOR_VERSION >= 3
-  0, /*tp_as_async*/
-  #endif
-  0, /*tp_repr*/
-  0, /*tp_as_number*/
-  0, /*tp_as_sequence*/
-  0, /*tp_as_mapping*/
-  0, /*tp_hash*/
-  0, /*tp_call*/
-  0, /*tp_str*/
-  0, /*tp_getattro*/
-  0, /*tp_setattro*/
-  0, /*tp_as_buffer*/
-  Py_TPFLAGS_DEFAULT|Py_TPFLAGS_HAVE_VERSION_TAG|Py_TPFLAGS_CHECKTYPES|Py_TPFLAGS_HAVE_NEWBUFFER|Py_TPFLAGS_BASETYPE, /*tp_flags*/
-  0, /*tp_doc*/
-  0, /*tp_traverse*/
-  0, /*tp_clear*/
-  0, /*tp_richcompare*/
-  0, /*tp_weaklistoffset*/
-  0, /*tp_iter*/
-  0, /*tp_iternext*/
-  __pyx_methods_10graphsaint_14cython_sampler_FullBatch, /*tp_methods*/
-  0, /*tp_members*/
-  0, /*tp_getset*/
-  0, /*tp_base*/
-  0, /*tp_dict*/
-  0, /*tp_descr_get*/
-  0, /*tp_descr_set*/
-  0, /*tp_dictoffset*/
-  0, /*tp_init*/
-  0, /*tp_alloc*/
-  __pyx_tp_new_10graphsaint_14cython_sampler_FullBatch, /*tp_new*/
-  0, /*tp_free*/
-  0, /*tp_is_gc*/
-  0, /*tp_bases*/
-  0, /*tp_mro*/
-  0, /*tp_cache*/
-  0, /*tp_subclasses*/
-  0, /*tp_weaklist*/
-  0, /*tp_del*/
-  0, /*tp_version_tag*/
-  #if PY_VERSION_HEX >= 0x030400a1
-  0, /*tp_finalize*/
-  #endif
-  #if PY_VERSION_HEX >= 0x030800b1 && (!CYTHON_COMPILING_IN_PYPY || PYPY_VERSION_NUM >= 0x07030800)
-  0, /*tp_vectorcall*/
-  #endif
-  #if PY_VERSION_HEX >= 0x030800b4 && PY_VERSION_HEX < 0x03090000
-  0, /*tp_print*/
-  #endif
-  #if CYTHON_COMPILING_IN_PYPY && PY_VERSION_HEX >= 0x03090000
-  0, /*tp_pypy_flags*/
-  #endif
-};
-
-static PyMethodDef __pyx_methods[] = {
-  {0, 0, 0, 0}
-};
-
-#if PY_MAJOR_VERSION >= 3
-#if CYTHON_PEP489_MULTI_PHASE_INIT
-static PyObject* __pyx_pymod_create(PyObject *spec, PyModuleDef *def); /*proto*/
-static int __pyx_pymod_exec_cython_sampler(PyObject* module); /*proto*/
-static PyModuleDef_Slot __pyx_moduledef_slots[] = {
-  {Py_mod_create, (void*)__pyx_pymod_create},
-  {Py_mod_exec, (void*)__pyx_pymod_exec_cython_sampler},
-  {0, NULL}
-};
-#endif
-
-static struct PyModuleDef __pyx_moduledef = {
-    PyModuleDef_HEAD_INIT,
-    "cython_sampler",
-    0, /* m_doc */
-  #if CYTHON_PEP489_MULTI_PHASE_INIT
-    0, /* m_size */
-  #else
-    -1, /* m_size */
-  #endif
-    __pyx_methods /* m_methods */,
-  #if CYTHON_PEP489_MULTI_PHASE_INIT
-    __pyx_moduledef_slots, /* m_slots */
-  #else
-    NULL, /* m_reload */
-  #endif
-    NULL, /* m_traverse */
-    NULL, /* m_clear */
-    NULL /* m_free */
-};
-#endif
-#ifndef CYTHON_SMALL_CODE
-#if defined(__clang__)
-    #define CYTHON_SMALL_CODE
-#elif defined(__GNUC__) && (__GNUC__ > 4 || (__GNUC__ == 4 && __GNUC_MINOR__ >= 3))
-    #define CYTHON_SMALL_CODE __attribute__((cold))
-#else
-    #define CYTHON_SMALL_CODE
-#endif
-#endif
-
-static __Pyx_StringTabEntry __pyx_string_tab[] = {
-  {&__pyx_n_s_Edge, __pyx_k_Edge, sizeof(__pyx_k_Edge), 0, 0, 1, 1},
-  {&__pyx_n_s_Edge2, __pyx_k_Edge2, sizeof(__pyx_k_Edge2), 0, 0, 1, 1},
-  {&__pyx_n_s_FullBatch, __pyx_k_FullBatch, sizeof(__pyx_k_FullBatch), 0, 0, 1, 1},
-  {&__pyx_n_s_ImportError, __pyx_k_ImportError, sizeof(__pyx_k_ImportError), 0, 0, 1, 1},
-  {&__pyx_n_s_MRW, __pyx_k_MRW, sizeof(__pyx_k_MRW), 0, 0, 1, 1},
-  {&__pyx_n_s_Node, __pyx_k_Node, sizeof(__pyx_k_Node), 0, 0, 1, 1},
-  {&__pyx_n_s_RW, __pyx_k_RW, sizeof(__pyx_k_RW), 0, 0, 1, 1},
-  {&__pyx_n_s_Sampler, __pyx_k_Sampler, sizeof(__pyx_k_Sampler), 0, 0, 1, 1},
-  {&__pyx_n_s_TypeError, __pyx_k_TypeError, sizeof(__pyx_k_TypeError), 0, 0, 1, 1},
-  {&__pyx_n_s__17, __pyx_k__17, sizeof(__pyx_k__17), 0, 0, 1, 1},
-  {&__pyx_n_s_adj_indices, __pyx_k_adj_indices, sizeof(__pyx_k_adj_indices), 0, 0, 1, 1},
-  {&__pyx_n_s_adj_indptr, __pyx_k_adj_indptr, sizeof(__pyx_k_adj_indptr), 0, 0, 1, 1},
-  {&__pyx_n_s_cline_in_traceback, __pyx_k_cline_in_traceback, sizeof(__pyx_k_cline_in_traceback), 0, 0, 1, 1},
-  {&__pyx_n_s_clip, __pyx_k_clip, sizeof(__pyx_k_clip), 0, 0, 1, 1},
-  {&__pyx_n_s_col_train, __pyx_k_col_train, sizeof(__pyx_k_col_train), 0, 0, 1, 1},
-  {&__pyx_n_s_cutils, __pyx_k_cutils, sizeof(__pyx_k_cutils), 0, 0, 1, 1},
-  {&__pyx_n_s_dtype, __pyx_k_dtype, sizeof(__pyx_k_dtype), 0, 0, 1, 1},
-  {&__pyx_n_s_float32, __pyx_k_float32, sizeof(__pyx_k_float32), 0, 0, 1, 1},
-  {&__pyx_n_s_frombuffer, __pyx_k_frombuffer, sizeof(__pyx_k_frombuffer), 0, 0, 1, 1},
-  {&__pyx_n_s_get_return, __pyx_k_get_return, sizeof(__pyx_k_get_return), 0, 0, 1, 1},
-  {&__pyx_n_s_getstate, __pyx_k_getstate, sizeof(__pyx_k_getstate), 0, 0, 1, 1},
-  {&__pyx_n_s_graphsaint_cython_utils, __pyx_k_graphsaint_cython_utils, sizeof(__pyx_k_graphsaint_cython_utils), 0, 0, 1, 1},
-  {&__pyx_n_s_import, __pyx_k_import, sizeof(__pyx_k_import), 0, 0, 1, 1},
-  {&__pyx_n_s_int32, __pyx_k_int32, sizeof(__pyx_k_int32), 0, 0, 1, 1},
-  {&__pyx_n_s_main, __pyx_k_main, sizeof(__pyx_k_main), 0, 0, 1, 1},
-  {&__pyx_n_s_math, __pyx_k_math, sizeof(__pyx_k_math), 0, 0, 1, 1},
-  {&__pyx_n_s_max_deg, __pyx_k_max_deg, sizeof(__pyx_k_max_deg), 0, 0, 1, 1},
-  {&__pyx_n_s_mean, __pyx_k_mean, sizeof(__pyx_k_mean), 0, 0, 1, 1},
-  {&__pyx_n_s_name, __pyx_k_name, sizeof(__pyx_k_name), 0, 0, 1, 1},
-  {&__pyx_kp_s_no_default___reduce___due_to_non, __pyx_k_no_default___reduce___due_to_non, sizeof(__pyx_k_no_default___reduce___due_to_non), 0, 0, 1, 0},
-  {&__pyx_n_s_node_train, __pyx_k_node_train, sizeof(__pyx_k_node_train), 0, 0, 1, 1},
-  {&__pyx_n_s_np, __pyx_k_np, sizeof(__pyx_k_np), 0, 0, 1, 1},
-  {&__pyx_n_s_num_proc, __pyx_k_num_proc, sizeof(__pyx_k_num_proc), 0, 0, 1, 1},
-  {&__pyx_n_s_num_sample_per_proc, __pyx_k_num_sample_per_proc, sizeof(__pyx_k_num_sample_per_proc), 0, 0, 1, 1},
-  {&__pyx_n_s_numpy, __pyx_k_numpy, sizeof(__pyx_k_numpy), 0, 0, 1, 1},
-  {&__pyx_kp_u_numpy_core_multiarray_failed_to, __pyx_k_numpy_core_multiarray_failed_to, sizeof(__pyx_k_numpy_core_multiarray_failed_to), 0, 1, 0, 0},
-  {&__pyx_kp_u_numpy_core_umath_failed_to_impor, __pyx_k_numpy_core_umath_failed_to_impor, sizeof(__pyx_k_numpy_core_umath_failed_to_impor), 0, 1, 0, 0},
-  {&__pyx_n_s_p_dist, __pyx_k_p_dist, sizeof(__pyx_k_p_dist), 0, 0, 1, 1},
-  {&__pyx_n_s_p_dist_cumsum, __pyx_k_p_dist_cumsum, sizeof(__pyx_k_p_dist_cumsum), 0, 0, 1, 1},
-  {&__pyx_n_s_prob_edge, __pyx_k_prob_edge, sizeof(__pyx_k_prob_edge), 0, 0, 1, 1},
-  {&__pyx_n_s_pyx_vtable, __pyx_k_pyx_vtable, sizeof(__pyx_k_pyx_vtable), 0, 0, 1, 1},
-  {&__pyx_n_s_random, __pyx_k_random, sizeof(__pyx_k_random), 0, 0, 1, 1},
-  {&__pyx_n_s_range, __pyx_k_range, sizeof(__pyx_k_range), 0, 0, 1, 1},
-  {&__pyx_n_s_reduce, __pyx_k_reduce, sizeof(__pyx_k_reduce), 0, 0, 1, 1},
-  {&__pyx_n_s_reduce_cython, __pyx_k_reduce_cython, sizeof(__pyx_k_reduce_cython), 0, 0, 1, 1},
-  {&__pyx_n_s_reduce_ex, __pyx_k_reduce_ex, sizeof(__pyx_k_reduce_ex), 0, 0, 1, 1},
-  {&__pyx_n_s_row_train, __pyx_k_row_train, sizeof(__pyx_k_row_train), 0, 0, 1, 1},
-  {&__pyx_n_s_setstate, __pyx_k_setstate, sizeof(__pyx_k_setstate), 0, 0, 1, 1},
-  {&__pyx_n_s_setstate_cython, __pyx_k_setstate_cython, sizeof(__pyx_k_setstate_cython), 0, 0, 1, 1},
-  {&__pyx_n_s_size, __pyx_k_size, sizeof(__pyx_k_size), 0, 0, 1, 1},
-  {&__pyx_n_s_size_depth, __pyx_k_size_depth, sizeof(__pyx_k_size_depth), 0, 0, 1, 1},
-  {&__pyx_n_s_size_frontier, __pyx_k_size_frontier, sizeof(__pyx_k_size_frontier), 0, 0, 1, 1},
-  {&__pyx_n_s_size_root, __pyx_k_size_root, sizeof(__pyx_k_size_root), 0, 0, 1, 1},
-  {&__pyx_n_s_size_subg, __pyx_k_size_subg, sizeof(__pyx_k_size_subg), 0, 0, 1, 1},
-  {&__pyx_n_s_size_subg_e, __pyx_k_size_subg_e, sizeof(__pyx_k_size_subg_e), 0, 0, 1, 1},
-  {&__pyx_n_s_test, __pyx_k_test, sizeof(__pyx_k_test), 0, 0, 1, 1},
-  {&__pyx_n_s_time, __pyx_k_time, sizeof(__pyx_k_time), 0, 0, 1, 1},
-  {0, 0, 0, 0, 0, 0, 0}
-};
-static CYTHON_SMALL_CODE int __Pyx_InitCachedBuiltins(void) {
-  __pyx_builtin_range = __Pyx_GetBuiltinName(__pyx_n_s_range); if (!__pyx_builtin_range) __PYX_ERR(0, 129, __pyx_L1_error)
-  __pyx_builtin_TypeError = __Pyx_GetBuiltinName(__pyx_n_s_TypeError); if (!__pyx_builtin_TypeError) __PYX_ERR(1, 2, __pyx_L1_error)
-  __pyx_builtin_ImportError = __Pyx_GetBuiltinName(__pyx_n_s_ImportError); if (!__pyx_builtin_ImportError) __PYX_ERR(2, 947, __pyx_L1_error)
-  return 0;
-  __pyx_L1_error:;
-  return -1;
-}
-
-static CYTHON_SMALL_CODE int __Pyx_InitCachedConstants(void) {
-  __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("__Pyx_InitCachedConstants", 0);
-
-  /* "(tree fragment)":2
- * def __reduce_cython__(self):
- *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")             # <<<<<<<<<<<<<<
- * def __setstate_cython__(self, __pyx_state):
- *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
- */
-  __pyx_tuple_ = PyTuple_Pack(1, __pyx_kp_s_no_default___reduce___due_to_non); if (unlikely(!__pyx_tuple_)) __PYX_ERR(1, 2, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple_);
-  __Pyx_GIVEREF(__pyx_tuple_);
-
-  /* "(tree fragment)":4
- *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
- * def __setstate_cython__(self, __pyx_state):
- *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")             # <<<<<<<<<<<<<<
- */
-  __pyx_tuple__2 = PyTuple_Pack(1, __pyx_kp_s_no_default___reduce___due_to_non); if (unlikely(!__pyx_tuple__2)) __PYX_ERR(1, 4, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__2);
-  __Pyx_GIVEREF(__pyx_tuple__2);
-
-  /* "(tree fragment)":2
- * def __reduce_cython__(self):
- *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")             # <<<<<<<<<<<<<<
- * def __setstate_cython__(self, __pyx_state):
- *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
- */
-  __pyx_tuple__3 = PyTuple_Pack(1, __pyx_kp_s_no_default___reduce___due_to_non); if (unlikely(!__pyx_tuple__3)) __PYX_ERR(1, 2, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__3);
-  __Pyx_GIVEREF(__pyx_tuple__3);
-
-  /* "(tree fragment)":4
- *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
- * def __setstate_cython__(self, __pyx_state):
- *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")             # <<<<<<<<<<<<<<
- */
-  __pyx_tuple__4 = PyTuple_Pack(1, __pyx_kp_s_no_default___reduce___due_to_non); if (unlikely(!__pyx_tuple__4)) __PYX_ERR(1, 4, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__4);
-  __Pyx_GIVEREF(__pyx_tuple__4);
-
-  /* "(tree fragment)":2
- * def __reduce_cython__(self):
- *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")             # <<<<<<<<<<<<<<
- * def __setstate_cython__(self, __pyx_state):
- *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
- */
-  __pyx_tuple__5 = PyTuple_Pack(1, __pyx_kp_s_no_default___reduce___due_to_non); if (unlikely(!__pyx_tuple__5)) __PYX_ERR(1, 2, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__5);
-  __Pyx_GIVEREF(__pyx_tuple__5);
-
-  /* "(tree fragment)":4
- *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
- * def __setstate_cython__(self, __pyx_state):
- *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")             # <<<<<<<<<<<<<<
- */
-  __pyx_tuple__6 = PyTuple_Pack(1, __pyx_kp_s_no_default___reduce___due_to_non); if (unlikely(!__pyx_tuple__6)) __PYX_ERR(1, 4, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__6);
-  __Pyx_GIVEREF(__pyx_tuple__6);
-
-  /* "(tree fragment)":2
- * def __reduce_cython__(self):
- *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")             # <<<<<<<<<<<<<<
- * def __setstate_cython__(self, __pyx_state):
- *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
- */
-  __pyx_tuple__7 = PyTuple_Pack(1, __pyx_kp_s_no_default___reduce___due_to_non); if (unlikely(!__pyx_tuple__7)) __PYX_ERR(1, 2, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__7);
-  __Pyx_GIVEREF(__pyx_tuple__7);
-
-  /* "(tree fragment)":4
- *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
- * def __setstate_cython__(self, __pyx_state):
- *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")             # <<<<<<<<<<<<<<
- */
-  __pyx_tuple__8 = PyTuple_Pack(1, __pyx_kp_s_no_default___reduce___due_to_non); if (unlikely(!__pyx_tuple__8)) __PYX_ERR(1, 4, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__8);
-  __Pyx_GIVEREF(__pyx_tuple__8);
-
-  /* "(tree fragment)":2
- * def __reduce_cython__(self):
- *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")             # <<<<<<<<<<<<<<
- * def __setstate_cython__(self, __pyx_state):
- *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
- */
-  __pyx_tuple__9 = PyTuple_Pack(1, __pyx_kp_s_no_default___reduce___due_to_non); if (unlikely(!__pyx_tuple__9)) __PYX_ERR(1, 2, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__9);
-  __Pyx_GIVEREF(__pyx_tuple__9);
-
-  /* "(tree fragment)":4
- *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
- * def __setstate_cython__(self, __pyx_state):
- *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")             # <<<<<<<<<<<<<<
- */
-  __pyx_tuple__10 = PyTuple_Pack(1, __pyx_kp_s_no_default___reduce___due_to_non); if (unlikely(!__pyx_tuple__10)) __PYX_ERR(1, 4, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__10);
-  __Pyx_GIVEREF(__pyx_tuple__10);
-
-  /* "(tree fragment)":2
- * def __reduce_cython__(self):
- *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")             # <<<<<<<<<<<<<<
- * def __setstate_cython__(self, __pyx_state):
- *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
- */
-  __pyx_tuple__11 = PyTuple_Pack(1, __pyx_kp_s_no_default___reduce___due_to_non); if (unlikely(!__pyx_tuple__11)) __PYX_ERR(1, 2, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__11);
-  __Pyx_GIVEREF(__pyx_tuple__11);
-
-  /* "(tree fragment)":4
- *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
- * def __setstate_cython__(self, __pyx_state):
- *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")             # <<<<<<<<<<<<<<
- */
-  __pyx_tuple__12 = PyTuple_Pack(1, __pyx_kp_s_no_default___reduce___due_to_non); if (unlikely(!__pyx_tuple__12)) __PYX_ERR(1, 4, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__12);
-  __Pyx_GIVEREF(__pyx_tuple__12);
-
-  /* "(tree fragment)":2
- * def __reduce_cython__(self):
- *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")             # <<<<<<<<<<<<<<
- * def __setstate_cython__(self, __pyx_state):
- *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
- */
-  __pyx_tuple__13 = PyTuple_Pack(1, __pyx_kp_s_no_default___reduce___due_to_non); if (unlikely(!__pyx_tuple__13)) __PYX_ERR(1, 2, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__13);
-  __Pyx_GIVEREF(__pyx_tuple__13);
-
-  /* "(tree fragment)":4
- *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
- * def __setstate_cython__(self, __pyx_state):
- *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")             # <<<<<<<<<<<<<<
- */
-  __pyx_tuple__14 = PyTuple_Pack(1, __pyx_kp_s_no_default___reduce___due_to_non); if (unlikely(!__pyx_tuple__14)) __PYX_ERR(1, 4, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__14);
-  __Pyx_GIVEREF(__pyx_tuple__14);
-
-  /* "../anaconda3/envs/ogb/lib/python3.7/site-packages/numpy/__init__.pxd":947
- *         __pyx_import_array()
- *     except Exception:
- *         raise ImportError("numpy.core.multiarray failed to import")             # <<<<<<<<<<<<<<
- * 
- * cdef inline int import_umath() except -1:
- */
-  __pyx_tuple__15 = PyTuple_Pack(1, __pyx_kp_u_numpy_core_multiarray_failed_to); if (unlikely(!__pyx_tuple__15)) __PYX_ERR(2, 947, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__15);
-  __Pyx_GIVEREF(__pyx_tuple__15);
-
-  /* "../anaconda3/envs/ogb/lib/python3.7/site-packages/numpy/__init__.pxd":953
- *         _import_umath()
- *     except Exception:
- *         raise ImportError("numpy.core.umath failed to import")             # <<<<<<<<<<<<<<
- * 
- * cdef inline int import_ufunc() except -1:
- */
-  __pyx_tuple__16 = PyTuple_Pack(1, __pyx_kp_u_numpy_core_umath_failed_to_impor); if (unlikely(!__pyx_tuple__16)) __PYX_ERR(2, 953, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__16);
-  __Pyx_GIVEREF(__pyx_tuple__16);
-  __Pyx_RefNannyFinishContext();
-  return 0;
-  __pyx_L1_error:;
-  __Pyx_RefNannyFinishContext();
-  return -1;
-}
-
-static CYTHON_SMALL_CODE int __Pyx_InitGlobals(void) {
-  /* InitThreads.init */
-  #if defined(WITH_THREAD) && PY_VERSION_HEX < 0x030700F0
-PyEval_InitThreads();
-#endif
-
-if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 1, __pyx_L1_error)
-
-  if (__Pyx_InitStrings(__pyx_string_tab) < 0) __PYX_ERR(0, 1, __pyx_L1_error);
-  __pyx_int_0 = PyInt_FromLong(0); if (unlikely(!__pyx_int_0)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __pyx_int_1 = PyInt_FromLong(1); if (unlikely(!__pyx_int_1)) __PYX_ERR(0, 1, __pyx_L1_error)
-  return 0;
-  __pyx_L1_error:;
-  return -1;
-}
-
-static CYTHON_SMALL_CODE int __Pyx_modinit_global_init_code(void); /*proto*/
-static CYTHON_SMALL_CODE int __Pyx_modinit_variable_export_code(void); /*proto*/
-static CYTHON_SMALL_CODE int __Pyx_modinit_function_export_code(void); /*proto*/
-static CYTHON_SMALL_CODE int __Pyx_modinit_type_init_code(void); /*proto*/
-static CYTHON_SMALL_CODE int __Pyx_modinit_type_import_code(void); /*proto*/
-static CYTHON_SMALL_CODE int __Pyx_modinit_variable_import_code(void); /*proto*/
-static CYTHON_SMALL_CODE int __Pyx_modinit_function_import_code(void); /*proto*/
-
-static int __Pyx_modinit_global_init_code(void) {
-  __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("__Pyx_modinit_global_init_code", 0);
-  /*--- Global init code ---*/
-  __Pyx_RefNannyFinishContext();
-  return 0;
-}
-
-static int __Pyx_modinit_variable_export_code(void) {
-  __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("__Pyx_modinit_variable_export_code", 0);
-  /*--- Variable export code ---*/
-  __Pyx_RefNannyFinishContext();
-  return 0;
-}
-
-static int __Pyx_modinit_function_export_code(void) {
-  __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("__Pyx_modinit_function_export_code", 0);
-  /*--- Function export code ---*/
-  __Pyx_RefNannyFinishContext();
-  return 0;
-}
-
-static int __Pyx_modinit_type_init_code(void) {
-  __Pyx_RefNannyDeclarations
-  int __pyx_lineno = 0;
-  const char *__pyx_filename = NULL;
-  int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("__Pyx_modinit_type_init_code", 0);
-  /*--- Type init code ---*/
-  __pyx_vtabptr_10graphsaint_14cython_sampler_Sampler = &__pyx_vtable_10graphsaint_14cython_sampler_Sampler;
-  __pyx_vtable_10graphsaint_14cython_sampler_Sampler.adj_extract = (void (*)(struct __pyx_obj_10graphsaint_14cython_sampler_Sampler *, int))__pyx_f_10graphsaint_14cython_sampler_7Sampler_adj_extract;
-  __pyx_vtable_10graphsaint_14cython_sampler_Sampler.sample = (void (*)(struct __pyx_obj_10graphsaint_14cython_sampler_Sampler *, int))__pyx_f_10graphsaint_14cython_sampler_7Sampler_sample;
-  if (PyType_Ready(&__pyx_type_10graphsaint_14cython_sampler_Sampler) < 0) __PYX_ERR(0, 29, __pyx_L1_error)
-  #if PY_VERSION_HEX < 0x030800B1
-  __pyx_type_10graphsaint_14cython_sampler_Sampler.tp_print = 0;
-  #endif
-  if ((CYTHON_USE_TYPE_SLOTS && CYTHON_USE_PYTYPE_LOOKUP) && likely(!__pyx_type_10graphsaint_14cython_sampler_Sampler.tp_dictoffset && __pyx_type_10graphsaint_14cython_sampler_Sampler.tp_getattro == PyObject_GenericGetAttr)) {
-    __pyx_type_10graphsaint_14cython_sampler_Sampler.tp_getattro = __Pyx_PyObject_GenericGetAttr;
-  }
-  if (__Pyx_SetVtable(__pyx_type_10graphsaint_14cython_sampler_Sampler.tp_dict, __pyx_vtabptr_10graphsaint_14cython_sampler_Sampler) < 0) __PYX_ERR(0, 29, __pyx_L1_error)
-  if (PyObject_SetAttr(__pyx_m, __pyx_n_s_Sampler, (PyObject *)&__pyx_type_10graphsaint_14cython_sampler_Sampler) < 0) __PYX_ERR(0, 29, __pyx_L1_error)
-  if (__Pyx_setup_reduce((PyObject*)&__pyx_type_10graphsaint_14cython_sampler_Sampler) < 0) __PYX_ERR(0, 29, __pyx_L1_error)
-  __pyx_ptype_10graphsaint_14cython_sampler_Sampler = &__pyx_type_10graphsaint_14cython_sampler_Sampler;
-  __pyx_vtabptr_10graphsaint_14cython_sampler_MRW = &__pyx_vtable_10graphsaint_14cython_sampler_MRW;
-  __pyx_vtable_10graphsaint_14cython_sampler_MRW.__pyx_base = *__pyx_vtabptr_10graphsaint_14cython_sampler_Sampler;
-  __pyx_vtable_10graphsaint_14cython_sampler_MRW.__pyx_base.sample = (void (*)(struct __pyx_obj_10graphsaint_14cython_sampler_Sampler *, int))__pyx_f_10graphsaint_14cython_sampler_3MRW_sample;
-  __pyx_type_10graphsaint_14cython_sampler_MRW.tp_base = __pyx_ptype_10graphsaint_14cython_sampler_Sampler;
-  if (PyType_Ready(&__pyx_type_10graphsaint_14cython_sampler_MRW) < 0) __PYX_ERR(0, 226, __pyx_L1_error)
-  #if PY_VERSION_HEX < 0x030800B1
-  __pyx_type_10graphsaint_14cython_sampler_MRW.tp_print = 0;
-  #endif
-  if ((CYTHON_USE_TYPE_SLOTS && CYTHON_USE_PYTYPE_LOOKUP) && likely(!__pyx_type_10graphsaint_14cython_sampler_MRW.tp_dictoffset && __pyx_type_10graphsaint_14cython_sampler_MRW.tp_getattro == PyObject_GenericGetAttr)) {
-    __pyx_type_10graphsaint_14cython_sampler_MRW.tp_getattro = __Pyx_PyObject_GenericGetAttr;
-  }
-  if (__Pyx_SetVtable(__pyx_type_10graphsaint_14cython_sampler_MRW.tp_dict, __pyx_vtabptr_10graphsaint_14cython_sampler_MRW) < 0) __PYX_ERR(0, 226, __pyx_L1_error)
-  if (PyObject_SetAttr(__pyx_m, __pyx_n_s_MRW, (PyObject *)&__pyx_type_10graphsaint_14cython_sampler_MRW) < 0) __PYX_ERR(0, 226, __pyx_L1_error)
-  if (__Pyx_setup_reduce((PyObject*)&__pyx_type_10graphsaint_14cython_sampler_MRW) < 0) __PYX_ERR(0, 226, __pyx_L1_error)
-  __pyx_ptype_10graphsaint_14cython_sampler_MRW = &__pyx_type_10graphsaint_14cython_sampler_MRW;
-  __pyx_vtabptr_10graphsaint_14cython_sampler_RW = &__pyx_vtable_10graphsaint_14cython_sampler_RW;
-  __pyx_vtable_10graphsaint_14cython_sampler_RW.__pyx_base = *__pyx_vtabptr_10graphsaint_14cython_sampler_Sampler;
-  __pyx_vtable_10graphsaint_14cython_sampler_RW.__pyx_base.sample = (void (*)(struct __pyx_obj_10graphsaint_14cython_sampler_Sampler *, int))__pyx_f_10graphsaint_14cython_sampler_2RW_sample;
-  __pyx_type_10graphsaint_14cython_sampler_RW.tp_base = __pyx_ptype_10graphsaint_14cython_sampler_Sampler;
-  if (PyType_Ready(&__pyx_type_10graphsaint_14cython_sampler_RW) < 0) __PYX_ERR(0, 324, __pyx_L1_error)
-  #if PY_VERSION_HEX < 0x030800B1
-  __pyx_type_10graphsaint_14cython_sampler_RW.tp_print = 0;
-  #endif
-  if ((CYTHON_USE_TYPE_SLOTS && CYTHON_USE_PYTYPE_LOOKUP) && likely(!__pyx_type_10graphsaint_14cython_sampler_RW.tp_dictoffset && __pyx_type_10graphsaint_14cython_sampler_RW.tp_getattro == PyObject_GenericGetAttr)) {
-    __pyx_type_10graphsaint_14cython_sampler_RW.tp_getattro = __Pyx_PyObject_GenericGetAttr;
-  }
-  if (__Pyx_SetVtable(__pyx_type_10graphsaint_14cython_sampler_RW.tp_dict, __pyx_vtabptr_10graphsaint_14cython_sampler_RW) < 0) __PYX_ERR(0, 324, __pyx_L1_error)
-  if (PyObject_SetAttr(__pyx_m, __pyx_n_s_RW, (PyObject *)&__pyx_type_10graphsaint_14cython_sampler_RW) < 0) __PYX_ERR(0, 324, __pyx_L1_error)
-  if (__Pyx_setup_reduce((PyObject*)&__pyx_type_10graphsaint_14cython_sampler_RW) < 0) __PYX_ERR(0, 324, __pyx_L1_error)
-  __pyx_ptype_10graphsaint_14cython_sampler_RW = &__pyx_type_10graphsaint_14cython_sampler_RW;
-  __pyx_vtabptr_10graphsaint_14cython_sampler_Edge = &__pyx_vtable_10graphsaint_14cython_sampler_Edge;
-  __pyx_vtable_10graphsaint_14cython_sampler_Edge.__pyx_base = *__pyx_vtabptr_10graphsaint_14cython_sampler_Sampler;
-  __pyx_vtable_10graphsaint_14cython_sampler_Edge.__pyx_base.sample = (void (*)(struct __pyx_obj_10graphsaint_14cython_sampler_Sampler *, int))__pyx_f_10graphsaint_14cython_sampler_4Edge_sample;
-  __pyx_type_10graphsaint_14cython_sampler_Edge.tp_base = __pyx_ptype_10graphsaint_14cython_sampler_Sampler;
-  if (PyType_Ready(&__pyx_type_10graphsaint_14cython_sampler_Edge) < 0) __PYX_ERR(0, 365, __pyx_L1_error)
-  #if PY_VERSION_HEX < 0x030800B1
-  __pyx_type_10graphsaint_14cython_sampler_Edge.tp_print = 0;
-  #endif
-  if ((CYTHON_USE_TYPE_SLOTS && CYTHON_USE_PYTYPE_LOOKUP) && likely(!__pyx_type_10graphsaint_14cython_sampler_Edge.tp_dictoffset && __pyx_type_10graphsaint_14cython_sampler_Edge.tp_getattro == PyObject_GenericGetAttr)) {
-    __pyx_type_10graphsaint_14cython_sampler_Edge.tp_getattro = __Pyx_PyObject_GenericGetAttr;
-  }
-  if (__Pyx_SetVtable(__pyx_type_10graphsaint_14cython_sampler_Edge.tp_dict, __pyx_vtabptr_10graphsaint_14cython_sampler_Edge) < 0) __PYX_ERR(0, 365, __pyx_L1_error)
-  if (PyObject_SetAttr(__pyx_m, __pyx_n_s_Edge, (PyObject *)&__pyx_type_10graphsaint_14cython_sampler_Edge) < 0) __PYX_ERR(0, 365, __pyx_L1_error)
-  if (__Pyx_setup_reduce((PyObject*)&__pyx_type_10graphsaint_14cython_sampler_Edge) < 0) __PYX_ERR(0, 365, __pyx_L1_error)
-  __pyx_ptype_10graphsaint_14cython_sampler_Edge = &__pyx_type_10graphsaint_14cython_sampler_Edge;
-  __pyx_vtabptr_10graphsaint_14cython_sampler_Edge2 = &__pyx_vtable_10graphsaint_14cython_sampler_Edge2;
-  __pyx_vtable_10graphsaint_14cython_sampler_Edge2.__pyx_base = *__pyx_vtabptr_10graphsaint_14cython_sampler_Sampler;
-  __pyx_vtable_10graphsaint_14cython_sampler_Edge2.__pyx_base.sample = (void (*)(struct __pyx_obj_10graphsaint_14cython_sampler_Sampler *, int))__pyx_f_10graphsaint_14cython_sampler_5Edge2_sample;
-  __pyx_type_10graphsaint_14cython_sampler_Edge2.tp_base = __pyx_ptype_10graphsaint_14cython_sampler_Sampler;
-  if (PyType_Ready(&__pyx_type_10graphsaint_14cython_sampler_Edge2) < 0) __PYX_ERR(0, 403, __pyx_L1_error)
-  #if PY_VERSION_HEX < 0x030800B1
-  __pyx_type_10graphsaint_14cython_sampler_Edge2.tp_print = 0;
-  #endif
-  if ((CYTHON_USE_TYPE_SLOTS && CYTHON_USE_PYTYPE_LOOKUP) && likely(!__pyx_type_10graphsaint_14cython_sampler_Edge2.tp_dictoffset && __pyx_type_10graphsaint_14cython_sampler_Edge2.tp_getattro == PyObject_GenericGetAttr)) {
-    __pyx_type_10graphsaint_14cython_sampler_Edge2.tp_getattro = __Pyx_PyObject_GenericGetAttr;
-  }
-  if (__Pyx_SetVtable(__pyx_type_10graphsaint_14cython_sampler_Edge2.tp_dict, __pyx_vtabptr_10graphsaint_14cython_sampler_Edge2) < 0) __PYX_ERR(0, 403, __pyx_L1_error)
-  if (PyObject_SetAttr(__pyx_m, __pyx_n_s_Edge2, (PyObject *)&__pyx_type_10graphsaint_14cython_sampler_Edge2) < 0) __PYX_ERR(0, 403, __pyx_L1_error)
-  if (__Pyx_setup_reduce((PyObject*)&__pyx_type_10graphsaint_14cython_sampler_Edge2) < 0) __PYX_ERR(0, 403, __pyx_L1_error)
-  __pyx_ptype_10graphsaint_14cython_sampler_Edge2 = &__pyx_type_10graphsaint_14cython_sampler_Edge2;
-  __pyx_vtabptr_10graphsaint_14cython_sampler_Node = &__pyx_vtable_10graphsaint_14cython_sampler_Node;
-  __pyx_vtable_10graphsaint_14cython_sampler_Node.__pyx_base = *__pyx_vtabptr_10graphsaint_14cython_sampler_Sampler;
-  __pyx_vtable_10graphsaint_14cython_sampler_Node.__pyx_base.sample = (void (*)(struct __pyx_obj_10graphsaint_14cython_sampler_Sampler *, int))__pyx_f_10graphsaint_14cython_sampler_4Node_sample;
-  __pyx_type_10graphsaint_14cython_sampler_Node.tp_base = __pyx_ptype_10graphsaint_14cython_sampler_Sampler;
-  if (PyType_Ready(&__pyx_type_10graphsaint_14cython_sampler_Node) < 0) __PYX_ERR(0, 446, __pyx_L1_error)
-  #if PY_VERSION_HEX < 0x030800B1
-  __pyx_type_10graphsaint_14cython_sampler_Node.tp_print = 0;
-  #endif
-  if ((CYTHON_USE_TYPE_SLOTS && CYTHON_USE_PYTYPE_LOOKUP) && likely(!__pyx_type_10graphsaint_14cython_sampler_Node.tp_dictoffset && __pyx_type_10graphsaint_14cython_sampler_Node.tp_getattro == PyObject_GenericGetAttr)) {
-    __pyx_type_10graphsaint_14cython_sampler_Node.tp_getattro = __Pyx_PyObject_GenericGetAttr;
-  }
-  if (__Pyx_SetVtable(__pyx_type_10graphsaint_14cython_sampler_Node.tp_dict, __pyx_vtabptr_10graphsaint_14cython_sampler_Node) < 0) __PYX_ERR(0, 446, __pyx_L1_error)
-  if (PyObject_SetAttr(__pyx_m, __pyx_n_s_Node, (PyObject *)&__pyx_type_10graphsaint_14cython_sampler_Node) < 0) __PYX_ERR(0, 446, __pyx_L1_error)
-  if (__Pyx_setup_reduce((PyObject*)&__pyx_type_10graphsaint_14cython_sampler_Node) < 0) __PYX_ERR(0, 446, __pyx_L1_error)
-  __pyx_ptype_10graphsaint_14cython_sampler_Node = &__pyx_type_10graphsaint_14cython_sampler_Node;
-  __pyx_vtabptr_10graphsaint_14cython_sampler_FullBatch = &__pyx_vtable_10graphsaint_14cython_sampler_FullBatch;
-  __pyx_vtable_10graphsaint_14cython_sampler_FullBatch.__pyx_base = *__pyx_vtabptr_10graphsaint_14cython_sampler_Sampler;
-  __pyx_vtable_10graphsaint_14cython_sampler_FullBatch.__pyx_base.sample = (void (*)(struct __pyx_obj_10graphsaint_14cython_sampler_Sampler *, int))__pyx_f_10graphsaint_14cython_sampler_9FullBatch_sample;
-  __pyx_type_10graphsaint_14cython_sampler_FullBatch.tp_base = __pyx_ptype_10graphsaint_14cython_sampler_Sampler;
-  if (PyType_Ready(&__pyx_type_10graphsaint_14cython_sampler_FullBatch) < 0) __PYX_ERR(0, 477, __pyx_L1_error)
-  #if PY_VERSION_HEX < 0x030800B1
-  __pyx_type_10graphsaint_14cython_sampler_FullBatch.tp_print = 0;
-  #endif
-  if ((CYTHON_USE_TYPE_SLOTS && CYTHON_USE_PYTYPE_LOOKUP) && likely(!__pyx_type_10graphsaint_14cython_sampler_FullBatch.tp_dictoffset && __pyx_type_10graphsaint_14cython_sampler_FullBatch.tp_getattro == PyObject_GenericGetAttr)) {
-    __pyx_type_10graphsaint_14cython_sampler_FullBatch.tp_getattro = __Pyx_PyObject_GenericGetAttr;
-  }
-  if (__Pyx_SetVtable(__pyx_type_10graphsaint_14cython_sampler_FullBatch.tp_dict, __pyx_vtabptr_10graphsaint_14cython_sampler_FullBatch) < 0) __PYX_ERR(0, 477, __pyx_L1_error)
-  if (PyObject_SetAttr(__pyx_m, __pyx_n_s_FullBatch, (PyObject *)&__pyx_type_10graphsaint_14cython_sampler_FullBatch) < 0) __PYX_ERR(0, 477, __pyx_L1_error)
-  if (__Pyx_setup_reduce((PyObject*)&__pyx_type_10graphsaint_14cython_sampler_FullBatch) < 0) __PYX_ERR(0, 477, __pyx_L1_error)
-  __pyx_ptype_10graphsaint_14cython_sampler_FullBatch = &__pyx_type_10graphsaint_14cython_sampler_FullBatch;
-  __Pyx_RefNannyFinishContext();
-  return 0;
-  __pyx_L1_error:;
-  __Pyx_RefNannyFinishContext();
-  return -1;
-}
-
-static int __Pyx_modinit_type_import_code(void) {
-  __Pyx_RefNannyDeclarations
-  PyObject *__pyx_t_1 = NULL;
-  int __pyx_lineno = 0;
-  const char *__pyx_filename = NULL;
-  int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("__Pyx_modinit_type_import_code", 0);
-  /*--- Type import code ---*/
-  __pyx_t_1 = PyImport_ImportModule(__Pyx_BUILTIN_MODULE_NAME); if (unlikely(!__pyx_t_1)) __PYX_ERR(4, 9, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_ptype_7cpython_4type_type = __Pyx_ImportType(__pyx_t_1, __Pyx_BUILTIN_MODULE_NAME, "type", 
-  #if defined(PYPY_VERSION_NUM) && PYPY_VERSION_NUM < 0x050B0000
-  sizeof(PyTypeObject),
-  #else
-  sizeof(PyHeapTypeObject),
-  #endif
-  __Pyx_ImportType_CheckSize_Warn);
-   if (!__pyx_ptype_7cpython_4type_type) __PYX_ERR(4, 9, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __pyx_t_1 = PyImport_ImportModule("numpy"); if (unlikely(!__pyx_t_1)) __PYX_ERR(2, 200, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_ptype_5numpy_dtype = __Pyx_ImportType(__pyx_t_1, "numpy", "dtype", sizeof(PyArray_Descr), __Pyx_ImportType_CheckSize_Ignore);
-   if (!__pyx_ptype_5numpy_dtype) __PYX_ERR(2, 200, __pyx_L1_error)
-  __pyx_ptype_5numpy_flatiter = __Pyx_ImportType(__pyx_t_1, "numpy", "flatiter", sizeof(PyArrayIterObject), __Pyx_ImportType_CheckSize_Ignore);
-   if (!__pyx_ptype_5numpy_flatiter) __PYX_ERR(2, 223, __pyx_L1_error)
-  __pyx_ptype_5numpy_broadcast = __Pyx_ImportType(__pyx_t_1, "numpy", "broadcast", sizeof(PyArrayMultiIterObject), __Pyx_ImportType_CheckSize_Ignore);
-   if (!__pyx_ptype_5numpy_broadcast) __PYX_ERR(2, 227, __pyx_L1_error)
-  __pyx_ptype_5numpy_ndarray = __Pyx_ImportType(__pyx_t_1, "numpy", "ndarray", sizeof(PyArrayObject), __Pyx_ImportType_CheckSize_Ignore);
-   if (!__pyx_ptype_5numpy_ndarray) __PYX_ERR(2, 239, __pyx_L1_error)
-  __pyx_ptype_5numpy_generic = __Pyx_ImportType(__pyx_t_1, "numpy", "generic", sizeof(PyObject), __Pyx_ImportType_CheckSize_Warn);
-   if (!__pyx_ptype_5numpy_generic) __PYX_ERR(2, 771, __pyx_L1_error)
-  __pyx_ptype_5numpy_number = __Pyx_ImportType(__pyx_t_1, "numpy", "number", sizeof(PyObject), __Pyx_ImportType_CheckSize_Warn);
-   if (!__pyx_ptype_5numpy_number) __PYX_ERR(2, 773, __pyx_L1_error)
-  __pyx_ptype_5numpy_integer = __Pyx_ImportType(__pyx_t_1, "numpy", "integer", sizeof(PyObject), __Pyx_ImportType_CheckSize_Warn);
-   if (!__pyx_ptype_5numpy_integer) __PYX_ERR(2, 775, __pyx_L1_error)
-  __pyx_ptype_5numpy_signedinteger = __Pyx_ImportType(__pyx_t_1, "numpy", "signedinteger", sizeof(PyObject), __Pyx_ImportType_CheckSize_Warn);
-   if (!__pyx_ptype_5numpy_signedinteger) __PYX_ERR(2, 777, __pyx_L1_error)
-  __pyx_ptype_5numpy_unsignedinteger = __Pyx_ImportType(__pyx_t_1, "numpy", "unsignedinteger", sizeof(PyObject), __Pyx_ImportType_CheckSize_Warn);
-   if (!__pyx_ptype_5numpy_unsignedinteger) __PYX_ERR(2, 779, __pyx_L1_error)
-  __pyx_ptype_5numpy_inexact = __Pyx_ImportType(__pyx_t_1, "numpy", "inexact", sizeof(PyObject), __Pyx_ImportType_CheckSize_Warn);
-   if (!__pyx_ptype_5numpy_inexact) __PYX_ERR(2, 781, __pyx_L1_error)
-  __pyx_ptype_5numpy_floating = __Pyx_ImportType(__pyx_t_1, "numpy", "floating", sizeof(PyObject), __Pyx_ImportType_CheckSize_Warn);
-   if (!__pyx_ptype_5numpy_floating) __PYX_ERR(2, 783, __pyx_L1_error)
-  __pyx_ptype_5numpy_complexfloating = __Pyx_ImportType(__pyx_t_1, "numpy", "complexfloating", sizeof(PyObject), __Pyx_ImportType_CheckSize_Warn);
-   if (!__pyx_ptype_5numpy_complexfloating) __PYX_ERR(2, 785, __pyx_L1_error)
-  __pyx_ptype_5numpy_flexible = __Pyx_ImportType(__pyx_t_1, "numpy", "flexible", sizeof(PyObject), __Pyx_ImportType_CheckSize_Warn);
-   if (!__pyx_ptype_5numpy_flexible) __PYX_ERR(2, 787, __pyx_L1_error)
-  __pyx_ptype_5numpy_character = __Pyx_ImportType(__pyx_t_1, "numpy", "character", sizeof(PyObject), __Pyx_ImportType_CheckSize_Warn);
-   if (!__pyx_ptype_5numpy_character) __PYX_ERR(2, 789, __pyx_L1_error)
-  __pyx_ptype_5numpy_ufunc = __Pyx_ImportType(__pyx_t_1, "numpy", "ufunc", sizeof(PyUFuncObject), __Pyx_ImportType_CheckSize_Ignore);
-   if (!__pyx_ptype_5numpy_ufunc) __PYX_ERR(2, 827, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __pyx_t_1 = PyImport_ImportModule("graphsaint.cython_utils"); if (unlikely(!__pyx_t_1)) __PYX_ERR(3, 16, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_ptype_10graphsaint_12cython_utils_array_wrapper_float = __Pyx_ImportType(__pyx_t_1, "graphsaint.cython_utils", "array_wrapper_float", sizeof(struct __pyx_obj_10graphsaint_12cython_utils_array_wrapper_float), __Pyx_ImportType_CheckSize_Warn);
-   if (!__pyx_ptype_10graphsaint_12cython_utils_array_wrapper_float) __PYX_ERR(3, 16, __pyx_L1_error)
-  __pyx_vtabptr_10graphsaint_12cython_utils_array_wrapper_float = (struct __pyx_vtabstruct_10graphsaint_12cython_utils_array_wrapper_float*)__Pyx_GetVtable(__pyx_ptype_10graphsaint_12cython_utils_array_wrapper_float->tp_dict); if (unlikely(!__pyx_vtabptr_10graphsaint_12cython_utils_array_wrapper_float)) __PYX_ERR(3, 16, __pyx_L1_error)
-  __pyx_ptype_10graphsaint_12cython_utils_array_wrapper_int = __Pyx_ImportType(__pyx_t_1, "graphsaint.cython_utils", "array_wrapper_int", sizeof(struct __pyx_obj_10graphsaint_12cython_utils_array_wrapper_int), __Pyx_ImportType_CheckSize_Warn);
-   if (!__pyx_ptype_10graphsaint_12cython_utils_array_wrapper_int) __PYX_ERR(3, 22, __pyx_L1_error)
-  __pyx_vtabptr_10graphsaint_12cython_utils_array_wrapper_int = (struct __pyx_vtabstruct_10graphsaint_12cython_utils_array_wrapper_int*)__Pyx_GetVtable(__pyx_ptype_10graphsaint_12cython_utils_array_wrapper_int->tp_dict); if (unlikely(!__pyx_vtabptr_10graphsaint_12cython_utils_array_wrapper_int)) __PYX_ERR(3, 22, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __Pyx_RefNannyFinishContext();
-  return 0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_RefNannyFinishContext();
-  return -1;
-}
-
-static int __Pyx_modinit_variable_import_code(void) {
-  __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("__Pyx_modinit_variable_import_code", 0);
-  /*--- Variable import code ---*/
-  __Pyx_RefNannyFinishContext();
-  return 0;
-}
-
-static int __Pyx_modinit_function_import_code(void) {
-  __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("__Pyx_modinit_function_import_code", 0);
-  /*--- Function import code ---*/
-  __Pyx_RefNannyFinishContext();
-  return 0;
-}
-
-
-#ifndef CYTHON_NO_PYINIT_EXPORT
-#define __Pyx_PyMODINIT_FUNC PyMODINIT_FUNC
-#elif PY_MAJOR_VERSION < 3
-#ifdef __cplusplus
-#define __Pyx_PyMODINIT_FUNC extern "C" void
-#else
-#define __Pyx_PyMODINIT_FUNC void
-#endif
-#else
-#ifdef __cplusplus
-#define __Pyx_PyMODINIT_FUNC extern "C" PyObject *
-#else
-#define __Pyx_PyMODINIT_FUNC PyObject *
-#endif
-#endif
-
-
-#if PY_MAJOR_VERSION < 3
-__Pyx_PyMODINIT_FUNC initcython_sampler(void) CYTHON_SMALL_CODE; /*proto*/
-__Pyx_PyMODINIT_FUNC initcython_sampler(void)
-#else
-__Pyx_PyMODINIT_FUNC PyInit_cython_sampler(void) CYTHON_SMALL_CODE; /*proto*/
-__Pyx_PyMODINIT_FUNC PyInit_cython_sampler(void)
-#if CYTHON_PEP489_MULTI_PHASE_INIT
-{
-  return PyModuleDef_Init(&__pyx_moduledef);
-}
-static CYTHON_SMALL_CODE int __Pyx_check_single_interpreter(void) {
-    #if PY_VERSION_HEX >= 0x030700A1
-    static PY_INT64_T main_interpreter_id = -1;
-    PY_INT64_T current_id = PyInterpreterState_GetID(PyThreadState_Get()->interp);
-    if (main_interpreter_id == -1) {
-        main_interpreter_id = current_id;
-        return (unlikely(current_id == -1)) ? -1 : 0;
-    } else if (unlikely(main_interpreter_id != current_id))
-    #else
-    static PyInterpreterState *main_interpreter = NULL;
-    PyInterpreterState *current_interpreter = PyThreadState_Get()->interp;
-    if (!main_interpreter) {
-        main_interpreter = current_interpreter;
-    } else if (unlikely(main_interpreter != current_interpreter))
-    #endif
-    {
-        PyErr_SetString(
-            PyExc_ImportError,
-            "Interpreter change detected - this module can only be loaded into one interpreter per process.");
-        return -1;
-    }
-    return 0;
-}
-static CYTHON_SMALL_CODE int __Pyx_copy_spec_to_module(PyObject *spec, PyObject *moddict, const char* from_name, const char* to_name, int allow_none) {
-    PyObject *value = PyObject_GetAttrString(spec, from_name);
-    int result = 0;
-    if (likely(value)) {
-        if (allow_none || value != Py_None) {
-            result = PyDict_SetItemString(moddict, to_name, value);
-        }
-        Py_DECREF(value);
-    } else if (PyErr_ExceptionMatches(PyExc_AttributeError)) {
-        PyErr_Clear();
-    } else {
-        result = -1;
-    }
-    return result;
-}
-static CYTHON_SMALL_CODE PyObject* __pyx_pymod_create(PyObject *spec, CYTHON_UNUSED PyModuleDef *def) {
-    PyObject *module = NULL, *moddict, *modname;
-    if (__Pyx_check_single_interpreter())
-        return NULL;
-    if (__pyx_m)
-        return __Pyx_NewRef(__pyx_m);
-    modname = PyObject_GetAttrString(spec, "name");
-    if (unlikely(!modname)) goto bad;
-    module = PyModule_NewObject(modname);
-    Py_DECREF(modname);
-    if (unlikely(!module)) goto bad;
-    moddict = PyModule_GetDict(module);
-    if (unlikely(!moddict)) goto bad;
-    if (unlikely(__Pyx_copy_spec_to_module(spec, moddict, "loader", "__loader__", 1) < 0)) goto bad;
-    if (unlikely(__Pyx_copy_spec_to_module(spec, moddict, "origin", "__file__", 1) < 0)) goto bad;
-    if (unlikely(__Pyx_copy_spec_to_module(spec, moddict, "parent", "__package__", 1) < 0)) goto bad;
-    if (unlikely(__Pyx_copy_spec_to_module(spec, moddict, "submodule_search_locations", "__path__", 0) < 0)) goto bad;
-    return module;
-bad:
-    Py_XDECREF(module);
-    return NULL;
-}
-
-
-static CYTHON_SMALL_CODE int __pyx_pymod_exec_cython_sampler(PyObject *__pyx_pyinit_module)
-#endif
-#endif
-{
-  PyObject *__pyx_t_1 = NULL;
-  PyObject *__pyx_t_2 = NULL;
-  int __pyx_lineno = 0;
-  const char *__pyx_filename = NULL;
-  int __pyx_clineno = 0;
-  __Pyx_RefNannyDeclarations
-  #if CYTHON_PEP489_MULTI_PHASE_INIT
-  if (__pyx_m) {
-    if (__pyx_m == __pyx_pyinit_module) return 0;
-    PyErr_SetString(PyExc_RuntimeError, "Module 'cython_sampler' has already been imported. Re-initialisation is not supported.");
-    return -1;
-  }
-  #elif PY_MAJOR_VERSION >= 3
-  if (__pyx_m) return __Pyx_NewRef(__pyx_m);
-  #endif
-  #if CYTHON_REFNANNY
-__Pyx_RefNanny = __Pyx_RefNannyImportAPI("refnanny");
-if (!__Pyx_RefNanny) {
-  PyErr_Clear();
-  __Pyx_RefNanny = __Pyx_RefNannyImportAPI("Cython.Runtime.refnanny");
-  if (!__Pyx_RefNanny)
-      Py_FatalError("failed to import 'refnanny' module");
-}
-#endif
-  __Pyx_RefNannySetupContext("__Pyx_PyMODINIT_FUNC PyInit_cython_sampler(void)", 0);
-  if (__Pyx_check_binary_version() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
-  #ifdef __Pxy_PyFrame_Initialize_Offsets
-  __Pxy_PyFrame_Initialize_Offsets();
-  #endif
-  __pyx_empty_tuple = PyTuple_New(0); if (unlikely(!__pyx_empty_tuple)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __pyx_empty_bytes = PyBytes_FromStringAndSize("", 0); if (unlikely(!__pyx_empty_bytes)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __pyx_empty_unicode = PyUnicode_FromStringAndSize("", 0); if (unlikely(!__pyx_empty_unicode)) __PYX_ERR(0, 1, __pyx_L1_error)
-  #ifdef __Pyx_CyFunction_USED
-  if (__pyx_CyFunction_init() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
-  #endif
-  #ifdef __Pyx_FusedFunction_USED
-  if (__pyx_FusedFunction_init() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
-  #endif
-  #ifdef __Pyx_Coroutine_USED
-  if (__pyx_Coroutine_init() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
-  #endif
-  #ifdef __Pyx_Generator_USED
-  if (__pyx_Generator_init() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
-  #endif
-  #ifdef __Pyx_AsyncGen_USED
-  if (__pyx_AsyncGen_init() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
-  #endif
-  #ifdef __Pyx_StopAsyncIteration_USED
-  if (__pyx_StopAsyncIteration_init() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
-  #endif
-  /*--- Library function declarations ---*/
-  /*--- Threads initialization code ---*/
-  #if defined(WITH_THREAD) && PY_VERSION_HEX < 0x030700F0 && defined(__PYX_FORCE_INIT_THREADS) && __PYX_FORCE_INIT_THREADS
-  PyEval_InitThreads();
-  #endif
-  /*--- Module creation code ---*/
-  #if CYTHON_PEP489_MULTI_PHASE_INIT
-  __pyx_m = __pyx_pyinit_module;
-  Py_INCREF(__pyx_m);
-  #else
-  #if PY_MAJOR_VERSION < 3
-  __pyx_m = Py_InitModule4("cython_sampler", __pyx_methods, 0, 0, PYTHON_API_VERSION); Py_XINCREF(__pyx_m);
-  #else
-  __pyx_m = PyModule_Create(&__pyx_moduledef);
-  #endif
-  if (unlikely(!__pyx_m)) __PYX_ERR(0, 1, __pyx_L1_error)
-  #endif
-  __pyx_d = PyModule_GetDict(__pyx_m); if (unlikely(!__pyx_d)) __PYX_ERR(0, 1, __pyx_L1_error)
-  Py_INCREF(__pyx_d);
-  __pyx_b = PyImport_AddModule(__Pyx_BUILTIN_MODULE_NAME); if (unlikely(!__pyx_b)) __PYX_ERR(0, 1, __pyx_L1_error)
-  Py_INCREF(__pyx_b);
-  __pyx_cython_runtime = PyImport_AddModule((char *) "cython_runtime"); if (unlikely(!__pyx_cython_runtime)) __PYX_ERR(0, 1, __pyx_L1_error)
-  Py_INCREF(__pyx_cython_runtime);
-  if (PyObject_SetAttrString(__pyx_m, "__builtins__", __pyx_b) < 0) __PYX_ERR(0, 1, __pyx_L1_error);
-  /*--- Initialize various global constants etc. ---*/
-  if (__Pyx_InitGlobals() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
-  #if PY_MAJOR_VERSION < 3 && (__PYX_DEFAULT_STRING_ENCODING_IS_ASCII || __PYX_DEFAULT_STRING_ENCODING_IS_DEFAULT)
-  if (__Pyx_init_sys_getdefaultencoding_params() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
-  #endif
-  if (__pyx_module_is_main_graphsaint__cython_sampler) {
-    if (PyObject_SetAttr(__pyx_m, __pyx_n_s_name, __pyx_n_s_main) < 0) __PYX_ERR(0, 1, __pyx_L1_error)
-  }
-  #if PY_MAJOR_VERSION >= 3
-  {
-    PyObject *modules = PyImport_GetModuleDict(); if (unlikely(!modules)) __PYX_ERR(0, 1, __pyx_L1_error)
-    if (!PyDict_GetItemString(modules, "graphsaint.cython_sampler")) {
-      if (unlikely(PyDict_SetItemString(modules, "graphsaint.cython_sampler", __pyx_m) < 0)) __PYX_ERR(0, 1, __pyx_L1_error)
-    }
-  }
-  #endif
-  /*--- Builtin init code ---*/
-  if (__Pyx_InitCachedBuiltins() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
-  /*--- Constants init code ---*/
-  if (__Pyx_InitCachedConstants() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
-  /*--- Global type/function init code ---*/
-  (void)__Pyx_modinit_global_init_code();
-  (void)__Pyx_modinit_variable_export_code();
-  (void)__Pyx_modinit_function_export_code();
-  if (unlikely(__Pyx_modinit_type_init_code() < 0)) __PYX_ERR(0, 1, __pyx_L1_error)
-  if (unlikely(__Pyx_modinit_type_import_code() < 0)) __PYX_ERR(0, 1, __pyx_L1_error)
-  (void)__Pyx_modinit_variable_import_code();
-  (void)__Pyx_modinit_function_import_code();
-  /*--- Execution code ---*/
-  #if defined(__Pyx_Generator_USED) || defined(__Pyx_Coroutine_USED)
-  if (__Pyx_patch_abc() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
-  #endif
-
-  /* "graphsaint/cython_sampler.pyx":14
- * from libcpp.unordered_map cimport unordered_map
- * from libcpp.utility cimport pair
- * import numpy as np             # <<<<<<<<<<<<<<
- * cimport numpy as np
- * from libc.stdio cimport printf
- */
-  __pyx_t_1 = __Pyx_Import(__pyx_n_s_numpy, 0, 0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 14, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_np, __pyx_t_1) < 0) __PYX_ERR(0, 14, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-
-  /* "graphsaint/cython_sampler.pyx":18
- * from libc.stdio cimport printf
- * from libcpp cimport bool
- * import time,math             # <<<<<<<<<<<<<<
- * import random
- * from libc.stdlib cimport rand
- */
-  __pyx_t_1 = __Pyx_Import(__pyx_n_s_time, 0, 0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 18, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_time, __pyx_t_1) < 0) __PYX_ERR(0, 18, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __pyx_t_1 = __Pyx_Import(__pyx_n_s_math, 0, 0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 18, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_math, __pyx_t_1) < 0) __PYX_ERR(0, 18, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-
-  /* "graphsaint/cython_sampler.pyx":19
- * from libcpp cimport bool
- * import time,math
- * import random             # <<<<<<<<<<<<<<
- * from libc.stdlib cimport rand
- * cdef extern from "stdlib.h":
- */
-  __pyx_t_1 = __Pyx_Import(__pyx_n_s_random, 0, 0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 19, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_random, __pyx_t_1) < 0) __PYX_ERR(0, 19, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-
-  /* "graphsaint/cython_sampler.pyx":25
- * 
- * cimport graphsaint.cython_utils as cutils
- * import graphsaint.cython_utils as cutils             # <<<<<<<<<<<<<<
- * 
- * 
- */
-  __pyx_t_1 = PyList_New(1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 25, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __Pyx_INCREF(__pyx_n_s__17);
-  __Pyx_GIVEREF(__pyx_n_s__17);
-  PyList_SET_ITEM(__pyx_t_1, 0, __pyx_n_s__17);
-  __pyx_t_2 = __Pyx_Import(__pyx_n_s_graphsaint_cython_utils, __pyx_t_1, 0); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 25, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_cutils, __pyx_t_2) < 0) __PYX_ERR(0, 25, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-
-  /* "graphsaint/cython_sampler.pyx":1
- * # cython: language_level=3             # <<<<<<<<<<<<<<
- * # distutils: language=c++
- * # distutils: extra_compile_args = -fopenmp -std=c++11
- */
-  __pyx_t_2 = __Pyx_PyDict_NewPresized(0); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_test, __pyx_t_2) < 0) __PYX_ERR(0, 1, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-
-  /* "graphsaint/cython_utils.pxd":33
- *     vec.assign(vec_c,vec_c+size)
- * 
- * cdef inline void npy2vec_float(np.ndarray[float,ndim=1,mode='c'] nda, vector[float]& vec):             # <<<<<<<<<<<<<<
- *     cdef int size = nda.size
- *     cdef float* vec_c = &(nda[0])
- */
-
-  /*--- Wrapped vars code ---*/
-
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_XDECREF(__pyx_t_2);
-  if (__pyx_m) {
-    if (__pyx_d) {
-      __Pyx_AddTraceback("init graphsaint.cython_sampler", __pyx_clineno, __pyx_lineno, __pyx_filename);
-    }
-    Py_CLEAR(__pyx_m);
-  } else if (!PyErr_Occurred()) {
-    PyErr_SetString(PyExc_ImportError, "init graphsaint.cython_sampler");
-  }
-  __pyx_L0:;
-  __Pyx_RefNannyFinishContext();
-  #if CYTHON_PEP489_MULTI_PHASE_INIT
-  return (__pyx_m != NULL) ? 0 : -1;
-  #elif PY_MAJOR_VERSION >= 3
-  return __pyx_m;
-  #else
-  return;
-  #endif
-}
-
-/* --- Runtime support code --- */
-/* Refnanny */
-#if CYTHON_REFNANNY
-static __Pyx_RefNannyAPIStruct *__Pyx_RefNannyImportAPI(const char *modname) {
-    PyObject *m = NULL, *p = NULL;
-    void *r = NULL;
-    m = PyImport_ImportModule(modname);
-    if (!m) goto end;
-    p = PyObject_GetAttrString(m, "RefNannyAPI");
-    if (!p) goto end;
-    r = PyLong_AsVoidPtr(p);
-end:
-    Py_XDECREF(p);
-    Py_XDECREF(m);
-    return (__Pyx_RefNannyAPIStruct *)r;
-}
-#endif
-
-/* PyObjectGetAttrStr */
-#if CYTHON_USE_TYPE_SLOTS
-static CYTHON_INLINE PyObject* __Pyx_PyObject_GetAttrStr(PyObject* obj, PyObject* attr_name) {
-    PyTypeObject* tp = Py_TYPE(obj);
-    if (likely(tp->tp_getattro))
-        return tp->tp_getattro(obj, attr_name);
-#if PY_MAJOR_VERSION < 3
-    if (likely(tp->tp_getattr))
-        return tp->tp_getattr(obj, PyString_AS_STRING(attr_name));
-#endif
-    return PyObject_GetAttr(obj, attr_name);
-}
-#endif
-
-/* GetBuiltinName */
-static PyObject *__Pyx_GetBuiltinName(PyObject *name) {
-    PyObject* result = __Pyx_PyObject_GetAttrStr(__pyx_b, name);
-    if (unlikely(!result)) {
-        PyErr_Format(PyExc_NameError,
-#if PY_MAJOR_VERSION >= 3
-            "name '%U' is not defined", name);
-#else
-            "name '%.200s' is not defined", PyString_AS_STRING(name));
-#endif
-    }
-    return result;
-}
-
-/* RaiseArgTupleInvalid */
-static void __Pyx_RaiseArgtupleInvalid(
-    const char* func_name,
-    int exact,
-    Py_ssize_t num_min,
-    Py_ssize_t num_max,
-    Py_ssize_t num_found)
-{
-    Py_ssize_t num_expected;
-    const char *more_or_less;
-    if (num_found < num_min) {
-        num_expected = num_min;
-        more_or_less = "at least";
-    } else {
-        num_expected = num_max;
-        more_or_less = "at most";
-    }
-    if (exact) {
-        more_or_less = "exactly";
-    }
-    PyErr_Format(PyExc_TypeError,
-                 "%.200s() takes %.8s %" CYTHON_FORMAT_SSIZE_T "d positional argument%.1s (%" CYTHON_FORMAT_SSIZE_T "d given)",
-                 func_name, more_or_less, num_expected,
-                 (num_expected == 1) ? "" : "s", num_found);
-}
-
-/* RaiseDoubleKeywords */
-static void __Pyx_RaiseDoubleKeywordsError(
-    const char* func_name,
-    PyObject* kw_name)
-{
-    PyErr_Format(PyExc_TypeError,
-        #if PY_MAJOR_VERSION >= 3
-        "%s() got multiple values for keyword argument '%U'", func_name, kw_name);
-        #else
-        "%s() got multiple values for keyword argument '%s'", func_name,
-        PyString_AsString(kw_name));
-        #endif
-}
-
-/* ParseKeywords */
-static int __Pyx_ParseOptionalKeywords(
-    PyObject *kwds,
-    PyObject **argnames[],
-    PyObject *kwds2,
-    PyObject *values[],
-    Py_ssize_t num_pos_args,
-    const char* function_name)
-{
-    PyObject *key = 0, *value = 0;
-    Py_ssize_t pos = 0;
-    PyObject*** name;
-    PyObject*** first_kw_arg = argnames + num_pos_args;
-    while (PyDict_Next(kwds, &pos, &key, &value)) {
-        name = first_kw_arg;
-        while (*name && (**name != key)) name++;
-        if (*name) {
-            values[name-argnames] = value;
-            continue;
-        }
-        name = first_kw_arg;
-        #if PY_MAJOR_VERSION < 3
-        if (likely(PyString_Check(key))) {
-            while (*name) {
-                if ((CYTHON_COMPILING_IN_PYPY || PyString_GET_SIZE(**name) == PyString_GET_SIZE(key))
-                        && _PyString_Eq(**name, key)) {
-                    values[name-argnames] = value;
-                    break;
-                }
-                name++;
-            }
-            if (*name) continue;
-            else {
-                PyObject*** argname = argnames;
-                while (argname != first_kw_arg) {
-                    if ((**argname == key) || (
-                            (CYTHON_COMPILING_IN_PYPY || PyString_GET_SIZE(**argname) == PyString_GET_SIZE(key))
-                             && _PyString_Eq(**argname, key))) {
-                        goto arg_passed_twice;
-                    }
-                    argname++;
-                }
-            }
-        } else
-        #endif
-        if (likely(PyUnicode_Check(key))) {
-            while (*name) {
-                int cmp = (**name == key) ? 0 :
-                #if !CYTHON_COMPILING_IN_PYPY && PY_MAJOR_VERSION >= 3
-                    (__Pyx_PyUnicode_GET_LENGTH(**name) != __Pyx_PyUnicode_GET_LENGTH(key)) ? 1 :
-                #endif
-                    PyUnicode_Compare(**name, key);
-                if (cmp < 0 && unlikely(PyErr_Occurred())) goto bad;
-                if (cmp == 0) {
-                    values[name-argnames] = value;
-                    break;
-                }
-                name++;
-            }
-            if (*name) continue;
-            else {
-                PyObject*** argname = argnames;
-                while (argname != first_kw_arg) {
-                    int cmp = (**argname == key) ? 0 :
-                    #if !CYTHON_COMPILING_IN_PYPY && PY_MAJOR_VERSION >= 3
-                        (__Pyx_PyUnicode_GET_LENGTH(**argname) != __Pyx_PyUnicode_GET_LENGTH(key)) ? 1 :
-                    #endif
-                        PyUnicode_Compare(**argname, key);
-                    if (cmp < 0 && unlikely(PyErr_Occurred())) goto bad;
-                    if (cmp == 0) goto arg_passed_twice;
-                    argname++;
-                }
-            }
-        } else
-            goto invalid_keyword_type;
-        if (kwds2) {
-            if (unlikely(PyDict_SetItem(kwds2, key, value))) goto bad;
-        } else {
-            goto invalid_keyword;
-        }
-    }
-    return 0;
-arg_passed_twice:
-    __Pyx_RaiseDoubleKeywordsError(function_name, key);
-    goto bad;
-invalid_keyword_type:
-    PyErr_Format(PyExc_TypeError,
-        "%.200s() keywords must be strings", function_name);
-    goto bad;
-invalid_keyword:
-    PyErr_Format(PyExc_TypeError,
-    #if PY_MAJOR_VERSION < 3
-        "%.200s() got an unexpected keyword argument '%.200s'",
-        function_name, PyString_AsString(key));
-    #else
-        "%s() got an unexpected keyword argument '%U'",
-        function_name, key);
-    #endif
-bad:
-    return -1;
-}
-
-/* ArgTypeTest */
-static int __Pyx__ArgTypeTest(PyObject *obj, PyTypeObject *type, const char *name, int exact)
-{
-    if (unlikely(!type)) {
-        PyErr_SetString(PyExc_SystemError, "Missing type object");
-        return 0;
-    }
-    else if (exact) {
-        #if PY_MAJOR_VERSION == 2
-        if ((type == &PyBaseString_Type) && likely(__Pyx_PyBaseString_CheckExact(obj))) return 1;
-        #endif
-    }
-    else {
-        if (likely(__Pyx_TypeCheck(obj, type))) return 1;
-    }
-    PyErr_Format(PyExc_TypeError,
-        "Argument '%.200s' has incorrect type (expected %.200s, got %.200s)",
-        name, type->tp_name, Py_TYPE(obj)->tp_name);
-    return 0;
-}
-
-/* IsLittleEndian */
-static CYTHON_INLINE int __Pyx_Is_Little_Endian(void)
-{
-  union {
-    uint32_t u32;
-    uint8_t u8[4];
-  } S;
-  S.u32 = 0x01020304;
-  return S.u8[0] == 4;
-}
-
-/* BufferFormatCheck */
-static void __Pyx_BufFmt_Init(__Pyx_BufFmt_Context* ctx,
-                              __Pyx_BufFmt_StackElem* stack,
-                              __Pyx_TypeInfo* type) {
-  stack[0].field = &ctx->root;
-  stack[0].parent_offset = 0;
-  ctx->root.type = type;
-  ctx->root.name = "buffer dtype";
-  ctx->root.offset = 0;
-  ctx->head = stack;
-  ctx->head->field = &ctx->root;
-  ctx->fmt_offset = 0;
-  ctx->head->parent_offset = 0;
-  ctx->new_packmode = '@';
-  ctx->enc_packmode = '@';
-  ctx->new_count = 1;
-  ctx->enc_count = 0;
-  ctx->enc_type = 0;
-  ctx->is_complex = 0;
-  ctx->is_valid_array = 0;
-  ctx->struct_alignment = 0;
-  while (type->typegroup == 'S') {
-    ++ctx->head;
-    ctx->head->field = type->fields;
-    ctx->head->parent_offset = 0;
-    type = type->fields->type;
-  }
-}
-static int __Pyx_BufFmt_ParseNumber(const char** ts) {
-    int count;
-    const char* t = *ts;
-    if (*t < '0' || *t > '9') {
-      return -1;
-    } else {
-        count = *t++ - '0';
-        while (*t >= '0' && *t <= '9') {
-            count *= 10;
-            count += *t++ - '0';
-        }
-    }
-    *ts = t;
-    return count;
-}
-static int __Pyx_BufFmt_ExpectNumber(const char **ts) {
-    int number = __Pyx_BufFmt_ParseNumber(ts);
-    if (number == -1)
-        PyErr_Format(PyExc_ValueError,\
-                     "Does not understand character buffer dtype format string ('%c')", **ts);
-    return number;
-}
-static void __Pyx_BufFmt_RaiseUnexpectedChar(char ch) {
-  PyErr_Format(PyExc_ValueError,
-               "Unexpected format string character: '%c'", ch);
-}
-static const char* __Pyx_BufFmt_DescribeTypeChar(char ch, int is_complex) {
-  switch (ch) {
-    case '?': return "'bool'";
-    case 'c': return "'char'";
-    case 'b': return "'signed char'";
-    case 'B': return "'unsigned char'";
-    case 'h': return "'short'";
-    case 'H': return "'unsigned short'";
-    case 'i': return "'int'";
-    case 'I': return "'unsigned int'";
-    case 'l': return "'long'";
-    case 'L': return "'unsigned long'";
-    case 'q': return "'long long'";
-    case 'Q': return "'unsigned long long'";
-    case 'f': return (is_complex ? "'complex float'" : "'float'");
-    case 'd': return (is_complex ? "'complex double'" : "'double'");
-    case 'g': return (is_complex ? "'complex long double'" : "'long double'");
-    case 'T': return "a struct";
-    case 'O': return "Python object";
-    case 'P': return "a pointer";
-    case 's': case 'p': return "a string";
-    case 0: return "end";
-    default: return "unparseable format string";
-  }
-}
-static size_t __Pyx_BufFmt_TypeCharToStandardSize(char ch, int is_complex) {
-  switch (ch) {
-    case '?': case 'c': case 'b': case 'B': case 's': case 'p': return 1;
-    case 'h': case 'H': return 2;
-    case 'i': case 'I': case 'l': case 'L': return 4;
-    case 'q': case 'Q': return 8;
-    case 'f': return (is_complex ? 8 : 4);
-    case 'd': return (is_complex ? 16 : 8);
-    case 'g': {
-      PyErr_SetString(PyExc_ValueError, "Python does not define a standard format string size for long double ('g')..");
-      return 0;
-    }
-    case 'O': case 'P': return sizeof(void*);
-    default:
-      __Pyx_BufFmt_RaiseUnexpectedChar(ch);
-      return 0;
-    }
-}
-static size_t __Pyx_BufFmt_TypeCharToNativeSize(char ch, int is_complex) {
-  switch (ch) {
-    case '?': case 'c': case 'b': case 'B': case 's': case 'p': return 1;
-    case 'h': case 'H': return sizeof(short);
-    case 'i': case 'I': return sizeof(int);
-    case 'l': case 'L': return sizeof(long);
-    #ifdef HAVE_LONG_LONG
-    case 'q': case 'Q': return sizeof(PY_LONG_LONG);
-    #endif
-    case 'f': return sizeof(float) * (is_complex ? 2 : 1);
-    case 'd': return sizeof(double) * (is_complex ? 2 : 1);
-    case 'g': return sizeof(long double) * (is_complex ? 2 : 1);
-    case 'O': case 'P': return sizeof(void*);
-    default: {
-      __Pyx_BufFmt_RaiseUnexpectedChar(ch);
-      return 0;
-    }
-  }
-}
-typedef struct { char c; short x; } __Pyx_st_short;
-typedef struct { char c; int x; } __Pyx_st_int;
-typedef struct { char c; long x; } __Pyx_st_long;
-typedef struct { char c; float x; } __Pyx_st_float;
-typedef struct { char c; double x; } __Pyx_st_double;
-typedef struct { char c; long double x; } __Pyx_st_longdouble;
-typedef struct { char c; void *x; } __Pyx_st_void_p;
-#ifdef HAVE_LONG_LONG
-typedef struct { char c; PY_LONG_LONG x; } __Pyx_st_longlong;
-#endif
-static size_t __Pyx_BufFmt_TypeCharToAlignment(char ch, CYTHON_UNUSED int is_complex) {
-  switch (ch) {
-    case '?': case 'c': case 'b': case 'B': case 's': case 'p': return 1;
-    case 'h': case 'H': return sizeof(__Pyx_st_short) - sizeof(short);
-    case 'i': case 'I': return sizeof(__Pyx_st_int) - sizeof(int);
-    case 'l': case 'L': return sizeof(__Pyx_st_long) - sizeof(long);
-#ifdef HAVE_LONG_LONG
-    case 'q': case 'Q': return sizeof(__Pyx_st_longlong) - sizeof(PY_LONG_LONG);
-#endif
-    case 'f': return sizeof(__Pyx_st_float) - sizeof(float);
-    case 'd': return sizeof(__Pyx_st_double) - sizeof(double);
-    case 'g': return sizeof(__Pyx_st_longdouble) - sizeof(long double);
-    case 'P': case 'O': return sizeof(__Pyx_st_void_p) - sizeof(void*);
-    default:
-      __Pyx_BufFmt_RaiseUnexpectedChar(ch);
-      return 0;
-    }
-}
-/* These are for computing the padding at the end of the struct to align
-   on the first member of the struct. This will probably the same as above,
-   but we don't have any guarantees.
- */
-typedef struct { short x; char c; } __Pyx_pad_short;
-typedef struct { int x; char c; } __Pyx_pad_int;
-typedef struct { long x; char c; } __Pyx_pad_long;
-typedef struct { float x; char c; } __Pyx_pad_float;
-typedef struct { double x; char c; } __Pyx_pad_double;
-typedef struct { long double x; char c; } __Pyx_pad_longdouble;
-typedef struct { void *x; char c; } __Pyx_pad_void_p;
-#ifdef HAVE_LONG_LONG
-typedef struct { PY_LONG_LONG x; char c; } __Pyx_pad_longlong;
-#endif
-static size_t __Pyx_BufFmt_TypeCharToPadding(char ch, CYTHON_UNUSED int is_complex) {
-  switch (ch) {
-    case '?': case 'c': case 'b': case 'B': case 's': case 'p': return 1;
-    case 'h': case 'H': return sizeof(__Pyx_pad_short) - sizeof(short);
-    case 'i': case 'I': return sizeof(__Pyx_pad_int) - sizeof(int);
-    case 'l': case 'L': return sizeof(__Pyx_pad_long) - sizeof(long);
-#ifdef HAVE_LONG_LONG
-    case 'q': case 'Q': return sizeof(__Pyx_pad_longlong) - sizeof(PY_LONG_LONG);
-#endif
-    case 'f': return sizeof(__Pyx_pad_float) - sizeof(float);
-    case 'd': return sizeof(__Pyx_pad_double) - sizeof(double);
-    case 'g': return sizeof(__Pyx_pad_longdouble) - sizeof(long double);
-    case 'P': case 'O': return sizeof(__Pyx_pad_void_p) - sizeof(void*);
-    default:
-      __Pyx_BufFmt_RaiseUnexpectedChar(ch);
-      return 0;
-    }
-}
-static char __Pyx_BufFmt_TypeCharToGroup(char ch, int is_complex) {
-  switch (ch) {
-    case 'c':
-        return 'H';
-    case 'b': case 'h': case 'i':
-    case 'l': case 'q': case 's': case 'p':
-        return 'I';
-    case '?': case 'B': case 'H': case 'I': case 'L': case 'Q':
-        return 'U';
-    case 'f': case 'd': case 'g':
-        return (is_complex ? 'C' : 'R');
-    case 'O':
-        return 'O';
-    case 'P':
-        return 'P';
-    default: {
-      __Pyx_BufFmt_RaiseUnexpectedChar(ch);
-      return 0;
-    }
-  }
-}
-static void __Pyx_BufFmt_RaiseExpected(__Pyx_BufFmt_Context* ctx) {
-  if (ctx->head == NULL || ctx->head->field == &ctx->root) {
-    const char* expected;
-    const char* quote;
-    if (ctx->head == NULL) {
-      expected = "end";
-      quote = "";
-    } else {
-      expected = ctx->head->field->type->name;
-      quote = "'";
-    }
-    PyErr_Format(PyExc_ValueError,
-                 "Buffer dtype mismatch, expected %s%s%s but got %s",
-                 quote, expected, quote,
-                 __Pyx_BufFmt_DescribeTypeChar(ctx->enc_type, ctx->is_complex));
-  } else {
-    __Pyx_StructField* field = ctx->head->field;
-    __Pyx_StructField* parent = (ctx->head - 1)->field;
-    PyErr_Format(PyExc_ValueError,
-                 "Buffer dtype mismatch, expected '%s' but got %s in '%s.%s'",
-                 field->type->name, __Pyx_BufFmt_DescribeTypeChar(ctx->enc_type, ctx->is_complex),
-                 parent->type->name, field->name);
-  }
-}
-static int __Pyx_BufFmt_ProcessTypeChunk(__Pyx_BufFmt_Context* ctx) {
-  char group;
-  size_t size, offset, arraysize = 1;
-  if (ctx->enc_type == 0) return 0;
-  if (ctx->head->field->type->arraysize[0]) {
-    int i, ndim = 0;
-    if (ctx->enc_type == 's' || ctx->enc_type == 'p') {
-        ctx->is_valid_array = ctx->head->field->type->ndim == 1;
-        ndim = 1;
-        if (ctx->enc_count != ctx->head->field->type->arraysize[0]) {
-            PyErr_Format(PyExc_ValueError,
-                         "Expected a dimension of size %zu, got %zu",
-                         ctx->head->field->type->arraysize[0], ctx->enc_count);
-            return -1;
-        }
-    }
-    if (!ctx->is_valid_array) {
-      PyErr_Format(PyExc_ValueError, "Expected %d dimensions, got %d",
-                   ctx->head->field->type->ndim, ndim);
-      return -1;
-    }
-    for (i = 0; i < ctx->head->field->type->ndim; i++) {
-      arraysize *= ctx->head->field->type->arraysize[i];
-    }
-    ctx->is_valid_array = 0;
-    ctx->enc_count = 1;
-  }
-  group = __Pyx_BufFmt_TypeCharToGroup(ctx->enc_type, ctx->is_complex);
-  do {
-    __Pyx_StructField* field = ctx->head->field;
-    __Pyx_TypeInfo* type = field->type;
-    if (ctx->enc_packmode == '@' || ctx->enc_packmode == '^') {
-      size = __Pyx_BufFmt_TypeCharToNativeSize(ctx->enc_type, ctx->is_complex);
-    } else {
-      size = __Pyx_BufFmt_TypeCharToStandardSize(ctx->enc_type, ctx->is_complex);
-    }
-    if (ctx->enc_packmode == '@') {
-      size_t align_at = __Pyx_BufFmt_TypeCharToAlignment(ctx->enc_type, ctx->is_complex);
-      size_t align_mod_offset;
-      if (align_at == 0) return -1;
-      align_mod_offset = ctx->fmt_offset % align_at;
-      if (align_mod_offset > 0) ctx->fmt_offset += align_at - align_mod_offset;
-      if (ctx->struct_alignment == 0)
-          ctx->struct_alignment = __Pyx_BufFmt_TypeCharToPadding(ctx->enc_type,
-                                                                 ctx->is_complex);
-    }
-    if (type->size != size || type->typegroup != group) {
-      if (type->typegroup == 'C' && type->fields != NULL) {
-        size_t parent_offset = ctx->head->parent_offset + field->offset;
-        ++ctx->head;
-        ctx->head->field = type->fields;
-        ctx->head->parent_offset = parent_offset;
-        continue;
-      }
-      if ((type->typegroup == 'H' || group == 'H') && type->size == size) {
-      } else {
-          __Pyx_BufFmt_RaiseExpected(ctx);
-          return -1;
-      }
-    }
-    offset = ctx->head->parent_offset + field->offset;
-    if (ctx->fmt_offset != offset) {
-      PyErr_Format(PyExc_ValueError,
-                   "Buffer dtype mismatch; next field is at offset %" CYTHON_FORMAT_SSIZE_T "d but %" CYTHON_FORMAT_SSIZE_T "d expected",
-                   (Py_ssize_t)ctx->fmt_offset, (Py_ssize_t)offset);
-      return -1;
-    }
-    ctx->fmt_offset += size;
-    if (arraysize)
-      ctx->fmt_offset += (arraysize - 1) * size;
-    --ctx->enc_count;
-    while (1) {
-      if (field == &ctx->root) {
-        ctx->head = NULL;
-        if (ctx->enc_count != 0) {
-          __Pyx_BufFmt_RaiseExpected(ctx);
-          return -1;
-        }
-        break;
-      }
-      ctx->head->field = ++field;
-      if (field->type == NULL) {
-        --ctx->head;
-        field = ctx->head->field;
-        continue;
-      } else if (field->type->typegroup == 'S') {
-        size_t parent_offset = ctx->head->parent_offset + field->offset;
-        if (field->type->fields->type == NULL) continue;
-        field = field->type->fields;
-        ++ctx->head;
-        ctx->head->field = field;
-        ctx->head->parent_offset = parent_offset;
-        break;
-      } else {
-        break;
-      }
-    }
-  } while (ctx->enc_count);
-  ctx->enc_type = 0;
-  ctx->is_complex = 0;
-  return 0;
-}
-static PyObject *
-__pyx_buffmt_parse_array(__Pyx_BufFmt_Context* ctx, const char** tsp)
-{
-    const char *ts = *tsp;
-    int i = 0, number, ndim;
-    ++ts;
-    if (ctx->new_count != 1) {
-        PyErr_SetString(PyExc_ValueError,
-                        "Cannot handle repeated arrays in format string");
-        return NULL;
-    }
-    if (__Pyx_BufFmt_ProcessTypeChunk(ctx) == -1) return NULL;
-    ndim = ctx->head->field->type->ndim;
-    while (*ts && *ts != ')') {
-        switch (*ts) {
-            case ' ': case '\f': case '\r': case '\n': case '\t': case '\v':  continue;
-            default:  break;
-        }
-        number = __Pyx_BufFmt_ExpectNumber(&ts);
-        if (number == -1) return NULL;
-        if (i < ndim && (size_t) number != ctx->head->field->type->arraysize[i])
-            return PyErr_Format(PyExc_ValueError,
-                        "Expected a dimension of size %zu, got %d",
-                        ctx->head->field->type->arraysize[i], number);
-        if (*ts != ',' && *ts != ')')
-            return PyErr_Format(PyExc_ValueError,
-                                "Expected a comma in format string, got '%c'", *ts);
-        if (*ts == ',') ts++;
-        i++;
-    }
-    if (i != ndim)
-        return PyErr_Format(PyExc_ValueError, "Expected %d dimension(s), got %d",
-                            ctx->head->field->type->ndim, i);
-    if (!*ts) {
-        PyErr_SetString(PyExc_ValueError,
-                        "Unexpected end of format string, expected ')'");
-        return NULL;
-    }
-    ctx->is_valid_array = 1;
-    ctx->new_count = 1;
-    *tsp = ++ts;
-    return Py_None;
-}
-static const char* __Pyx_BufFmt_CheckString(__Pyx_BufFmt_Context* ctx, const char* ts) {
-  int got_Z = 0;
-  while (1) {
-    switch(*ts) {
-      case 0:
-        if (ctx->enc_type != 0 && ctx->head == NULL) {
-          __Pyx_BufFmt_RaiseExpected(ctx);
-          return NULL;
-        }
-        if (__Pyx_BufFmt_ProcessTypeChunk(ctx) == -1) return NULL;
-        if (ctx->head != NULL) {
-          __Pyx_BufFmt_RaiseExpected(ctx);
-          return NULL;
-        }
-        return ts;
-      case ' ':
-      case '\r':
-      case '\n':
-        ++ts;
-        break;
-      case '<':
-        if (!__Pyx_Is_Little_Endian()) {
-          PyErr_SetString(PyExc_ValueError, "Little-endian buffer not supported on big-endian compiler");
-          return NULL;
-        }
-        ctx->new_packmode = '=';
-        ++ts;
-        break;
-      case '>':
-      case '!':
-        if (__Pyx_Is_Little_Endian()) {
-          PyErr_SetString(PyExc_ValueError, "Big-endian buffer not supported on little-endian compiler");
-          return NULL;
-        }
-        ctx->new_packmode = '=';
-        ++ts;
-        break;
-      case '=':
-      case '@':
-      case '^':
-        ctx->new_packmode = *ts++;
-        break;
-      case 'T':
-        {
-          const char* ts_after_sub;
-          size_t i, struct_count = ctx->new_count;
-          size_t struct_alignment = ctx->struct_alignment;
-          ctx->new_count = 1;
-          ++ts;
-          if (*ts != '{') {
-            PyErr_SetString(PyExc_ValueError, "Buffer acquisition: Expected '{' after 'T'");
-            return NULL;
-          }
-          if (__Pyx_BufFmt_ProcessTypeChunk(ctx) == -1) return NULL;
-          ctx->enc_type = 0;
-          ctx->enc_count = 0;
-          ctx->struct_alignment = 0;
-          ++ts;
-          ts_after_sub = ts;
-          for (i = 0; i != struct_count; ++i) {
-            ts_after_sub = __Pyx_BufFmt_CheckString(ctx, ts);
-            if (!ts_after_sub) return NULL;
-          }
-          ts = ts_after_sub;
-          if (struct_alignment) ctx->struct_alignment = struct_alignment;
-        }
-        break;
-      case '}':
-        {
-          size_t alignment = ctx->struct_alignment;
-          ++ts;
-          if (__Pyx_BufFmt_ProcessTypeChunk(ctx) == -1) return NULL;
-          ctx->enc_type = 0;
-          if (alignment && ctx->fmt_offset % alignment) {
-            ctx->fmt_offset += alignment - (ctx->fmt_offset % alignment);
-          }
-        }
-        return ts;
-      case 'x':
-        if (__Pyx_BufFmt_ProcessTypeChunk(ctx) == -1) return NULL;
-        ctx->fmt_offset += ctx->new_count;
-        ctx->new_count = 1;
-        ctx->enc_count = 0;
-        ctx->enc_type = 0;
-        ctx->enc_packmode = ctx->new_packmode;
-        ++ts;
-        break;
-      case 'Z':
-        got_Z = 1;
-        ++ts;
-        if (*ts != 'f' && *ts != 'd' && *ts != 'g') {
-          __Pyx_BufFmt_RaiseUnexpectedChar('Z');
-          return NULL;
-        }
-        CYTHON_FALLTHROUGH;
-      case '?': case 'c': case 'b': case 'B': case 'h': case 'H': case 'i': case 'I':
-      case 'l': case 'L': case 'q': case 'Q':
-      case 'f': case 'd': case 'g':
-      case 'O': case 'p':
-        if ((ctx->enc_type == *ts) && (got_Z == ctx->is_complex) &&
-            (ctx->enc_packmode == ctx->new_packmode) && (!ctx->is_valid_array)) {
-          ctx->enc_count += ctx->new_count;
-          ctx->new_count = 1;
-          got_Z = 0;
-          ++ts;
-          break;
-        }
-        CYTHON_FALLTHROUGH;
-      case 's':
-        if (__Pyx_BufFmt_ProcessTypeChunk(ctx) == -1) return NULL;
-        ctx->enc_count = ctx->new_count;
-        ctx->enc_packmode = ctx->new_packmode;
-        ctx->enc_type = *ts;
-        ctx->is_complex = got_Z;
-        ++ts;
-        ctx->new_count = 1;
-        got_Z = 0;
-        break;
-      case ':':
-        ++ts;
-        while(*ts != ':') ++ts;
-        ++ts;
-        break;
-      case '(':
-        if (!__pyx_buffmt_parse_array(ctx, &ts)) return NULL;
-        break;
-      default:
-        {
-          int number = __Pyx_BufFmt_ExpectNumber(&ts);
-          if (number == -1) return NULL;
-          ctx->new_count = (size_t)number;
-        }
-    }
-  }
-}
-
-/* BufferGetAndValidate */
-  static CYTHON_INLINE void __Pyx_SafeReleaseBuffer(Py_buffer* info) {
-  if (unlikely(info->buf == NULL)) return;
-  if (info->suboffsets == __Pyx_minusones) info->suboffsets = NULL;
-  __Pyx_ReleaseBuffer(info);
-}
-static void __Pyx_ZeroBuffer(Py_buffer* buf) {
-  buf->buf = NULL;
-  buf->obj = NULL;
-  buf->strides = __Pyx_zeros;
-  buf->shape = __Pyx_zeros;
-  buf->suboffsets = __Pyx_minusones;
-}
-static int __Pyx__GetBufferAndValidate(
-        Py_buffer* buf, PyObject* obj,  __Pyx_TypeInfo* dtype, int flags,
-        int nd, int cast, __Pyx_BufFmt_StackElem* stack)
-{
-  buf->buf = NULL;
-  if (unlikely(__Pyx_GetBuffer(obj, buf, flags) == -1)) {
-    __Pyx_ZeroBuffer(buf);
-    return -1;
-  }
-  if (unlikely(buf->ndim != nd)) {
-    PyErr_Format(PyExc_ValueError,
-                 "Buffer has wrong number of dimensions (expected %d, got %d)",
-                 nd, buf->ndim);
-    goto fail;
-  }
-  if (!cast) {
-    __Pyx_BufFmt_Context ctx;
-    __Pyx_BufFmt_Init(&ctx, stack, dtype);
-    if (!__Pyx_BufFmt_CheckString(&ctx, buf->format)) goto fail;
-  }
-  if (unlikely((size_t)buf->itemsize != dtype->size)) {
-    PyErr_Format(PyExc_ValueError,
-      "Item size of buffer (%" CYTHON_FORMAT_SSIZE_T "d byte%s) does not match size of '%s' (%" CYTHON_FORMAT_SSIZE_T "d byte%s)",
-      buf->itemsize, (buf->itemsize > 1) ? "s" : "",
-      dtype->name, (Py_ssize_t)dtype->size, (dtype->size > 1) ? "s" : "");
-    goto fail;
-  }
-  if (buf->suboffsets == NULL) buf->suboffsets = __Pyx_minusones;
-  return 0;
-fail:;
-  __Pyx_SafeReleaseBuffer(buf);
-  return -1;
-}
-
-/* PyErrFetchRestore */
-  #if CYTHON_FAST_THREAD_STATE
-static CYTHON_INLINE void __Pyx_ErrRestoreInState(PyThreadState *tstate, PyObject *type, PyObject *value, PyObject *tb) {
-    PyObject *tmp_type, *tmp_value, *tmp_tb;
-    tmp_type = tstate->curexc_type;
-    tmp_value = tstate->curexc_value;
-    tmp_tb = tstate->curexc_traceback;
-    tstate->curexc_type = type;
-    tstate->curexc_value = value;
-    tstate->curexc_traceback = tb;
-    Py_XDECREF(tmp_type);
-    Py_XDECREF(tmp_value);
-    Py_XDECREF(tmp_tb);
-}
-static CYTHON_INLINE void __Pyx_ErrFetchInState(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb) {
-    *type = tstate->curexc_type;
-    *value = tstate->curexc_value;
-    *tb = tstate->curexc_traceback;
-    tstate->curexc_type = 0;
-    tstate->curexc_value = 0;
-    tstate->curexc_traceback = 0;
-}
-#endif
-
-/* WriteUnraisableException */
-  static void __Pyx_WriteUnraisable(const char *name, CYTHON_UNUSED int clineno,
-                                  CYTHON_UNUSED int lineno, CYTHON_UNUSED const char *filename,
-                                  int full_traceback, CYTHON_UNUSED int nogil) {
-    PyObject *old_exc, *old_val, *old_tb;
-    PyObject *ctx;
-    __Pyx_PyThreadState_declare
-#ifdef WITH_THREAD
-    PyGILState_STATE state;
-    if (nogil)
-        state = PyGILState_Ensure();
-#ifdef _MSC_VER
-    else state = (PyGILState_STATE)-1;
-#endif
-#endif
-    __Pyx_PyThreadState_assign
-    __Pyx_ErrFetch(&old_exc, &old_val, &old_tb);
-    if (full_traceback) {
-        Py_XINCREF(old_exc);
-        Py_XINCREF(old_val);
-        Py_XINCREF(old_tb);
-        __Pyx_ErrRestore(old_exc, old_val, old_tb);
-        PyErr_PrintEx(1);
-    }
-    #if PY_MAJOR_VERSION < 3
-    ctx = PyString_FromString(name);
-    #else
-    ctx = PyUnicode_FromString(name);
-    #endif
-    __Pyx_ErrRestore(old_exc, old_val, old_tb);
-    if (!ctx) {
-        PyErr_WriteUnraisable(Py_None);
-    } else {
-        PyErr_WriteUnraisable(ctx);
-        Py_DECREF(ctx);
-    }
-#ifdef WITH_THREAD
-    if (nogil)
-        PyGILState_Release(state);
-#endif
-}
-
-/* PyCFunctionFastCall */
-  #if CYTHON_FAST_PYCCALL
-static CYTHON_INLINE PyObject * __Pyx_PyCFunction_FastCall(PyObject *func_obj, PyObject **args, Py_ssize_t nargs) {
-    PyCFunctionObject *func = (PyCFunctionObject*)func_obj;
-    PyCFunction meth = PyCFunction_GET_FUNCTION(func);
-    PyObject *self = PyCFunction_GET_SELF(func);
-    int flags = PyCFunction_GET_FLAGS(func);
-    assert(PyCFunction_Check(func));
-    assert(METH_FASTCALL == (flags & ~(METH_CLASS | METH_STATIC | METH_COEXIST | METH_KEYWORDS | METH_STACKLESS)));
-    assert(nargs >= 0);
-    assert(nargs == 0 || args != NULL);
-    /* _PyCFunction_FastCallDict() must not be called with an exception set,
-       because it may clear it (directly or indirectly) and so the
-       caller loses its exception */
-    assert(!PyErr_Occurred());
-    if ((PY_VERSION_HEX < 0x030700A0) || unlikely(flags & METH_KEYWORDS)) {
-        return (*((__Pyx_PyCFunctionFastWithKeywords)(void*)meth)) (self, args, nargs, NULL);
-    } else {
-        return (*((__Pyx_PyCFunctionFast)(void*)meth)) (self, args, nargs);
-    }
-}
-#endif
-
-/* PyFunctionFastCall */
-  #if CYTHON_FAST_PYCALL
-static PyObject* __Pyx_PyFunction_FastCallNoKw(PyCodeObject *co, PyObject **args, Py_ssize_t na,
-                                               PyObject *globals) {
-    PyFrameObject *f;
-    PyThreadState *tstate = __Pyx_PyThreadState_Current;
-    PyObject **fastlocals;
-    Py_ssize_t i;
-    PyObject *result;
-    assert(globals != NULL);
-    /* XXX Perhaps we should create a specialized
-       PyFrame_New() that doesn't take locals, but does
-       take builtins without sanity checking them.
-       */
-    assert(tstate != NULL);
-    f = PyFrame_New(tstate, co, globals, NULL);
-    if (f == NULL) {
-        return NULL;
-    }
-    fastlocals = __Pyx_PyFrame_GetLocalsplus(f);
-    for (i = 0; i < na; i++) {
-        Py_INCREF(*args);
-        fastlocals[i] = *args++;
-    }
-    result = PyEval_EvalFrameEx(f,0);
-    ++tstate->recursion_depth;
-    Py_DECREF(f);
-    --tstate->recursion_depth;
-    return result;
-}
-#if 1 || PY_VERSION_HEX < 0x030600B1
-static PyObject *__Pyx_PyFunction_FastCallDict(PyObject *func, PyObject **args, Py_ssize_t nargs, PyObject *kwargs) {
-    PyCodeObject *co = (PyCodeObject *)PyFunction_GET_CODE(func);
-    PyObject *globals = PyFunction_GET_GLOBALS(func);
-    PyObject *argdefs = PyFunction_GET_DEFAULTS(func);
-    PyObject *closure;
-#if PY_MAJOR_VERSION >= 3
-    PyObject *kwdefs;
-#endif
-    PyObject *kwtuple, **k;
-    PyObject **d;
-    Py_ssize_t nd;
-    Py_ssize_t nk;
-    PyObject *result;
-    assert(kwargs == NULL || PyDict_Check(kwargs));
-    nk = kwargs ? PyDict_Size(kwargs) : 0;
-    if (Py_EnterRecursiveCall((char*)" while calling a Python object")) {
-        return NULL;
-    }
-    if (
-#if PY_MAJOR_VERSION >= 3
-            co->co_kwonlyargcount == 0 &&
-#endif
-            likely(kwargs == NULL || nk == 0) &&
-            co->co_flags == (CO_OPTIMIZED | CO_NEWLOCALS | CO_NOFREE)) {
-        if (argdefs == NULL && co->co_argcount == nargs) {
-            result = __Pyx_PyFunction_FastCallNoKw(co, args, nargs, globals);
-            goto done;
-        }
-        else if (nargs == 0 && argdefs != NULL
-                 && co->co_argcount == Py_SIZE(argdefs)) {
-            /* function called with no arguments, but all parameters have
-               a default value: use default values as arguments .*/
-            args = &PyTuple_GET_ITEM(argdefs, 0);
-            result =__Pyx_PyFunction_FastCallNoKw(co, args, Py_SIZE(argdefs), globals);
-            goto done;
-        }
-    }
-    if (kwargs != NULL) {
-        Py_ssize_t pos, i;
-        kwtuple = PyTuple_New(2 * nk);
-        if (kwtuple == NULL) {
-            result = NULL;
-            goto done;
-        }
-        k = &PyTuple_GET_ITEM(kwtuple, 0);
-        pos = i = 0;
-        while (PyDict_Next(kwargs, &pos, &k[i], &k[i+1])) {
-            Py_INCREF(k[i]);
-            Py_INCREF(k[i+1]);
-            i += 2;
-        }
-        nk = i / 2;
-    }
-    else {
-        kwtuple = NULL;
-        k = NULL;
-    }
-    closure = PyFunction_GET_CLOSURE(func);
-#if PY_MAJOR_VERSION >= 3
-    kwdefs = PyFunction_GET_KW_DEFAULTS(func);
-#endif
-    if (argdefs != NULL) {
-        d = &PyTuple_GET_ITEM(argdefs, 0);
-        nd = Py_SIZE(argdefs);
-    }
-    else {
-        d = NULL;
-        nd = 0;
-    }
-#if PY_MAJOR_VERSION >= 3
-    result = PyEval_EvalCodeEx((PyObject*)co, globals, (PyObject *)NULL,
-                               args, (int)nargs,
-                               k, (int)nk,
-                               d, (int)nd, kwdefs, closure);
-#else
-    result = PyEval_EvalCodeEx(co, globals, (PyObject *)NULL,
-                               args, (int)nargs,
-                               k, (int)nk,
-                               d, (int)nd, closure);
-#endif
-    Py_XDECREF(kwtuple);
-done:
-    Py_LeaveRecursiveCall();
-    return result;
-}
-#endif
-#endif
-
-/* PyObjectCall */
-  #if CYTHON_COMPILING_IN_CPYTHON
-static CYTHON_INLINE PyObject* __Pyx_PyObject_Call(PyObject *func, PyObject *arg, PyObject *kw) {
-    PyObject *result;
-    ternaryfunc call = Py_TYPE(func)->tp_call;
-    if (unlikely(!call))
-        return PyObject_Call(func, arg, kw);
-    if (unlikely(Py_EnterRecursiveCall((char*)" while calling a Python object")))
-        return NULL;
-    result = (*call)(func, arg, kw);
-    Py_LeaveRecursiveCall();
-    if (unlikely(!result) && unlikely(!PyErr_Occurred())) {
-        PyErr_SetString(
-            PyExc_SystemError,
-            "NULL result without error in PyObject_Call");
-    }
-    return result;
-}
-#endif
-
-/* PyObjectCallMethO */
-  #if CYTHON_COMPILING_IN_CPYTHON
-static CYTHON_INLINE PyObject* __Pyx_PyObject_CallMethO(PyObject *func, PyObject *arg) {
-    PyObject *self, *result;
-    PyCFunction cfunc;
-    cfunc = PyCFunction_GET_FUNCTION(func);
-    self = PyCFunction_GET_SELF(func);
-    if (unlikely(Py_EnterRecursiveCall((char*)" while calling a Python object")))
-        return NULL;
-    result = cfunc(self, arg);
-    Py_LeaveRecursiveCall();
-    if (unlikely(!result) && unlikely(!PyErr_Occurred())) {
-        PyErr_SetString(
-            PyExc_SystemError,
-            "NULL result without error in PyObject_Call");
-    }
-    return result;
-}
-#endif
-
-/* PyObjectCallOneArg */
-  #if CYTHON_COMPILING_IN_CPYTHON
-static PyObject* __Pyx__PyObject_CallOneArg(PyObject *func, PyObject *arg) {
-    PyObject *result;
-    PyObject *args = PyTuple_New(1);
-    if (unlikely(!args)) return NULL;
-    Py_INCREF(arg);
-    PyTuple_SET_ITEM(args, 0, arg);
-    result = __Pyx_PyObject_Call(func, args, NULL);
-    Py_DECREF(args);
-    return result;
-}
-static CYTHON_INLINE PyObject* __Pyx_PyObject_CallOneArg(PyObject *func, PyObject *arg) {
-#if CYTHON_FAST_PYCALL
-    if (PyFunction_Check(func)) {
-        return __Pyx_PyFunction_FastCall(func, &arg, 1);
-    }
-#endif
-    if (likely(PyCFunction_Check(func))) {
-        if (likely(PyCFunction_GET_FLAGS(func) & METH_O)) {
-            return __Pyx_PyObject_CallMethO(func, arg);
-#if CYTHON_FAST_PYCCALL
-        } else if (__Pyx_PyFastCFunction_Check(func)) {
-            return __Pyx_PyCFunction_FastCall(func, &arg, 1);
-#endif
-        }
-    }
-    return __Pyx__PyObject_CallOneArg(func, arg);
-}
-#else
-static CYTHON_INLINE PyObject* __Pyx_PyObject_CallOneArg(PyObject *func, PyObject *arg) {
-    PyObject *result;
-    PyObject *args = PyTuple_Pack(1, arg);
-    if (unlikely(!args)) return NULL;
-    result = __Pyx_PyObject_Call(func, args, NULL);
-    Py_DECREF(args);
-    return result;
-}
-#endif
-
-/* GetItemInt */
-  static PyObject *__Pyx_GetItemInt_Generic(PyObject *o, PyObject* j) {
-    PyObject *r;
-    if (!j) return NULL;
-    r = PyObject_GetItem(o, j);
-    Py_DECREF(j);
-    return r;
-}
-static CYTHON_INLINE PyObject *__Pyx_GetItemInt_List_Fast(PyObject *o, Py_ssize_t i,
-                                                              CYTHON_NCP_UNUSED int wraparound,
-                                                              CYTHON_NCP_UNUSED int boundscheck) {
-#if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
-    Py_ssize_t wrapped_i = i;
-    if (wraparound & unlikely(i < 0)) {
-        wrapped_i += PyList_GET_SIZE(o);
-    }
-    if ((!boundscheck) || likely(__Pyx_is_valid_index(wrapped_i, PyList_GET_SIZE(o)))) {
-        PyObject *r = PyList_GET_ITEM(o, wrapped_i);
-        Py_INCREF(r);
-        return r;
-    }
-    return __Pyx_GetItemInt_Generic(o, PyInt_FromSsize_t(i));
-#else
-    return PySequence_GetItem(o, i);
-#endif
-}
-static CYTHON_INLINE PyObject *__Pyx_GetItemInt_Tuple_Fast(PyObject *o, Py_ssize_t i,
-                                                              CYTHON_NCP_UNUSED int wraparound,
-                                                              CYTHON_NCP_UNUSED int boundscheck) {
-#if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
-    Py_ssize_t wrapped_i = i;
-    if (wraparound & unlikely(i < 0)) {
-        wrapped_i += PyTuple_GET_SIZE(o);
-    }
-    if ((!boundscheck) || likely(__Pyx_is_valid_index(wrapped_i, PyTuple_GET_SIZE(o)))) {
-        PyObject *r = PyTuple_GET_ITEM(o, wrapped_i);
-        Py_INCREF(r);
-        return r;
-    }
-    return __Pyx_GetItemInt_Generic(o, PyInt_FromSsize_t(i));
-#else
-    return PySequence_GetItem(o, i);
-#endif
-}
-static CYTHON_INLINE PyObject *__Pyx_GetItemInt_Fast(PyObject *o, Py_ssize_t i, int is_list,
-                                                     CYTHON_NCP_UNUSED int wraparound,
-                                                     CYTHON_NCP_UNUSED int boundscheck) {
-#if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS && CYTHON_USE_TYPE_SLOTS
-    if (is_list || PyList_CheckExact(o)) {
-        Py_ssize_t n = ((!wraparound) | likely(i >= 0)) ? i : i + PyList_GET_SIZE(o);
-        if ((!boundscheck) || (likely(__Pyx_is_valid_index(n, PyList_GET_SIZE(o))))) {
-            PyObject *r = PyList_GET_ITEM(o, n);
-            Py_INCREF(r);
-            return r;
-        }
-    }
-    else if (PyTuple_CheckExact(o)) {
-        Py_ssize_t n = ((!wraparound) | likely(i >= 0)) ? i : i + PyTuple_GET_SIZE(o);
-        if ((!boundscheck) || likely(__Pyx_is_valid_index(n, PyTuple_GET_SIZE(o)))) {
-            PyObject *r = PyTuple_GET_ITEM(o, n);
-            Py_INCREF(r);
-            return r;
-        }
-    } else {
-        PySequenceMethods *m = Py_TYPE(o)->tp_as_sequence;
-        if (likely(m && m->sq_item)) {
-            if (wraparound && unlikely(i < 0) && likely(m->sq_length)) {
-                Py_ssize_t l = m->sq_length(o);
-                if (likely(l >= 0)) {
-                    i += l;
-                } else {
-                    if (!PyErr_ExceptionMatches(PyExc_OverflowError))
-                        return NULL;
-                    PyErr_Clear();
-                }
-            }
-            return m->sq_item(o, i);
-        }
-    }
-#else
-    if (is_list || PySequence_Check(o)) {
-        return PySequence_GetItem(o, i);
-    }
-#endif
-    return __Pyx_GetItemInt_Generic(o, PyInt_FromSsize_t(i));
-}
-
-/* ObjectGetItem */
-  #if CYTHON_USE_TYPE_SLOTS
-static PyObject *__Pyx_PyObject_GetIndex(PyObject *obj, PyObject* index) {
-    PyObject *runerr;
-    Py_ssize_t key_value;
-    PySequenceMethods *m = Py_TYPE(obj)->tp_as_sequence;
-    if (unlikely(!(m && m->sq_item))) {
-        PyErr_Format(PyExc_TypeError, "'%.200s' object is not subscriptable", Py_TYPE(obj)->tp_name);
-        return NULL;
-    }
-    key_value = __Pyx_PyIndex_AsSsize_t(index);
-    if (likely(key_value != -1 || !(runerr = PyErr_Occurred()))) {
-        return __Pyx_GetItemInt_Fast(obj, key_value, 0, 1, 1);
-    }
-    if (PyErr_GivenExceptionMatches(runerr, PyExc_OverflowError)) {
-        PyErr_Clear();
-        PyErr_Format(PyExc_IndexError, "cannot fit '%.200s' into an index-sized integer", Py_TYPE(index)->tp_name);
-    }
-    return NULL;
-}
-static PyObject *__Pyx_PyObject_GetItem(PyObject *obj, PyObject* key) {
-    PyMappingMethods *m = Py_TYPE(obj)->tp_as_mapping;
-    if (likely(m && m->mp_subscript)) {
-        return m->mp_subscript(obj, key);
-    }
-    return __Pyx_PyObject_GetIndex(obj, key);
-}
-#endif
-
-/* PyObjectCallNoArg */
-  #if CYTHON_COMPILING_IN_CPYTHON
-static CYTHON_INLINE PyObject* __Pyx_PyObject_CallNoArg(PyObject *func) {
-#if CYTHON_FAST_PYCALL
-    if (PyFunction_Check(func)) {
-        return __Pyx_PyFunction_FastCall(func, NULL, 0);
-    }
-#endif
-#ifdef __Pyx_CyFunction_USED
-    if (likely(PyCFunction_Check(func) || __Pyx_CyFunction_Check(func)))
-#else
-    if (likely(PyCFunction_Check(func)))
-#endif
-    {
-        if (likely(PyCFunction_GET_FLAGS(func) & METH_NOARGS)) {
-            return __Pyx_PyObject_CallMethO(func, NULL);
-        }
-    }
-    return __Pyx_PyObject_Call(func, __pyx_empty_tuple, NULL);
-}
-#endif
-
-/* PyDictVersioning */
-  #if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_TYPE_SLOTS
-static CYTHON_INLINE PY_UINT64_T __Pyx_get_tp_dict_version(PyObject *obj) {
-    PyObject *dict = Py_TYPE(obj)->tp_dict;
-    return likely(dict) ? __PYX_GET_DICT_VERSION(dict) : 0;
-}
-static CYTHON_INLINE PY_UINT64_T __Pyx_get_object_dict_version(PyObject *obj) {
-    PyObject **dictptr = NULL;
-    Py_ssize_t offset = Py_TYPE(obj)->tp_dictoffset;
-    if (offset) {
-#if CYTHON_COMPILING_IN_CPYTHON
-        dictptr = (likely(offset > 0)) ? (PyObject **) ((char *)obj + offset) : _PyObject_GetDictPtr(obj);
-#else
-        dictptr = _PyObject_GetDictPtr(obj);
-#endif
-    }
-    return (dictptr && *dictptr) ? __PYX_GET_DICT_VERSION(*dictptr) : 0;
-}
-static CYTHON_INLINE int __Pyx_object_dict_version_matches(PyObject* obj, PY_UINT64_T tp_dict_version, PY_UINT64_T obj_dict_version) {
-    PyObject *dict = Py_TYPE(obj)->tp_dict;
-    if (unlikely(!dict) || unlikely(tp_dict_version != __PYX_GET_DICT_VERSION(dict)))
-        return 0;
-    return obj_dict_version == __Pyx_get_object_dict_version(obj);
-}
-#endif
-
-/* GetModuleGlobalName */
-  #if CYTHON_USE_DICT_VERSIONS
-static PyObject *__Pyx__GetModuleGlobalName(PyObject *name, PY_UINT64_T *dict_version, PyObject **dict_cached_value)
-#else
-static CYTHON_INLINE PyObject *__Pyx__GetModuleGlobalName(PyObject *name)
-#endif
-{
-    PyObject *result;
-#if !CYTHON_AVOID_BORROWED_REFS
-#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030500A1
-    result = _PyDict_GetItem_KnownHash(__pyx_d, name, ((PyASCIIObject *) name)->hash);
-    __PYX_UPDATE_DICT_CACHE(__pyx_d, result, *dict_cached_value, *dict_version)
-    if (likely(result)) {
-        return __Pyx_NewRef(result);
-    } else if (unlikely(PyErr_Occurred())) {
-        return NULL;
-    }
-#else
-    result = PyDict_GetItem(__pyx_d, name);
-    __PYX_UPDATE_DICT_CACHE(__pyx_d, result, *dict_cached_value, *dict_version)
-    if (likely(result)) {
-        return __Pyx_NewRef(result);
-    }
-#endif
-#else
-    result = PyObject_GetItem(__pyx_d, name);
-    __PYX_UPDATE_DICT_CACHE(__pyx_d, result, *dict_cached_value, *dict_version)
-    if (likely(result)) {
-        return __Pyx_NewRef(result);
-    }
-    PyErr_Clear();
-#endif
-    return __Pyx_GetBuiltinName(name);
-}
-
-/* PyIntBinop */
-  #if !CYTHON_COMPILING_IN_PYPY
-static PyObject* __Pyx_PyInt_AddObjC(PyObject *op1, PyObject *op2, CYTHON_UNUSED long intval, int inplace, int zerodivision_check) {
-    (void)inplace;
-    (void)zerodivision_check;
-    #if PY_MAJOR_VERSION < 3
-    if (likely(PyInt_CheckExact(op1))) {
-        const long b = intval;
-        long x;
-        long a = PyInt_AS_LONG(op1);
-            x = (long)((unsigned long)a + b);
-            if (likely((x^a) >= 0 || (x^b) >= 0))
-                return PyInt_FromLong(x);
-            return PyLong_Type.tp_as_number->nb_add(op1, op2);
-    }
-    #endif
-    #if CYTHON_USE_PYLONG_INTERNALS
-    if (likely(PyLong_CheckExact(op1))) {
-        const long b = intval;
-        long a, x;
-#ifdef HAVE_LONG_LONG
-        const PY_LONG_LONG llb = intval;
-        PY_LONG_LONG lla, llx;
-#endif
-        const digit* digits = ((PyLongObject*)op1)->ob_digit;
-        const Py_ssize_t size = Py_SIZE(op1);
-        if (likely(__Pyx_sst_abs(size) <= 1)) {
-            a = likely(size) ? digits[0] : 0;
-            if (size == -1) a = -a;
-        } else {
-            switch (size) {
-                case -2:
-                    if (8 * sizeof(long) - 1 > 2 * PyLong_SHIFT) {
-                        a = -(long) (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
-                        break;
-#ifdef HAVE_LONG_LONG
-                    } else if (8 * sizeof(PY_LONG_LONG) - 1 > 2 * PyLong_SHIFT) {
-                        lla = -(PY_LONG_LONG) (((((unsigned PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[0]));
-                        goto long_long;
-#endif
-                    }
-                    CYTHON_FALLTHROUGH;
-                case 2:
-                    if (8 * sizeof(long) - 1 > 2 * PyLong_SHIFT) {
-                        a = (long) (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
-                        break;
-#ifdef HAVE_LONG_LONG
-                    } else if (8 * sizeof(PY_LONG_LONG) - 1 > 2 * PyLong_SHIFT) {
-                        lla = (PY_LONG_LONG) (((((unsigned PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[0]));
-                        goto long_long;
-#endif
-                    }
-                    CYTHON_FALLTHROUGH;
-                case -3:
-                    if (8 * sizeof(long) - 1 > 3 * PyLong_SHIFT) {
-                        a = -(long) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
-                        break;
-#ifdef HAVE_LONG_LONG
-                    } else if (8 * sizeof(PY_LONG_LONG) - 1 > 3 * PyLong_SHIFT) {
-                        lla = -(PY_LONG_LONG) (((((((unsigned PY_LONG_LONG)digits[2]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[0]));
-                        goto long_long;
-#endif
-                    }
-                    CYTHON_FALLTHROUGH;
-                case 3:
-                    if (8 * sizeof(long) - 1 > 3 * PyLong_SHIFT) {
-                        a = (long) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
-                        break;
-#ifdef HAVE_LONG_LONG
-                    } else if (8 * sizeof(PY_LONG_LONG) - 1 > 3 * PyLong_SHIFT) {
-                        lla = (PY_LONG_LONG) (((((((unsigned PY_LONG_LONG)digits[2]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[0]));
-                        goto long_long;
-#endif
-                    }
-                    CYTHON_FALLTHROUGH;
-                case -4:
-                    if (8 * sizeof(long) - 1 > 4 * PyLong_SHIFT) {
-                        a = -(long) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
-                        break;
-#ifdef HAVE_LONG_LONG
-                    } else if (8 * sizeof(PY_LONG_LONG) - 1 > 4 * PyLong_SHIFT) {
-                        lla = -(PY_LONG_LONG) (((((((((unsigned PY_LONG_LONG)digits[3]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[2]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[0]));
-                        goto long_long;
-#endif
-                    }
-                    CYTHON_FALLTHROUGH;
-                case 4:
-                    if (8 * sizeof(long) - 1 > 4 * PyLong_SHIFT) {
-                        a = (long) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
-                        break;
-#ifdef HAVE_LONG_LONG
-                    } else if (8 * sizeof(PY_LONG_LONG) - 1 > 4 * PyLong_SHIFT) {
-                        lla = (PY_LONG_LONG) (((((((((unsigned PY_LONG_LONG)digits[3]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[2]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[0]));
-                        goto long_long;
-#endif
-                    }
-                    CYTHON_FALLTHROUGH;
-                default: return PyLong_Type.tp_as_number->nb_add(op1, op2);
-            }
-        }
-                x = a + b;
-            return PyLong_FromLong(x);
-#ifdef HAVE_LONG_LONG
-        long_long:
-                llx = lla + llb;
-            return PyLong_FromLongLong(llx);
-#endif
-        
-        
-    }
-    #endif
-    if (PyFloat_CheckExact(op1)) {
-        const long b = intval;
-        double a = PyFloat_AS_DOUBLE(op1);
-            double result;
-            PyFPE_START_PROTECT("add", return NULL)
-            result = ((double)a) + (double)b;
-            PyFPE_END_PROTECT(result)
-            return PyFloat_FromDouble(result);
-    }
-    return (inplace ? PyNumber_InPlaceAdd : PyNumber_Add)(op1, op2);
-}
-#endif
-
-/* SliceObject */
-  static CYTHON_INLINE PyObject* __Pyx_PyObject_GetSlice(PyObject* obj,
-        Py_ssize_t cstart, Py_ssize_t cstop,
-        PyObject** _py_start, PyObject** _py_stop, PyObject** _py_slice,
-        int has_cstart, int has_cstop, CYTHON_UNUSED int wraparound) {
-#if CYTHON_USE_TYPE_SLOTS
-    PyMappingMethods* mp;
-#if PY_MAJOR_VERSION < 3
-    PySequenceMethods* ms = Py_TYPE(obj)->tp_as_sequence;
-    if (likely(ms && ms->sq_slice)) {
-        if (!has_cstart) {
-            if (_py_start && (*_py_start != Py_None)) {
-                cstart = __Pyx_PyIndex_AsSsize_t(*_py_start);
-                if ((cstart == (Py_ssize_t)-1) && PyErr_Occurred()) goto bad;
-            } else
-                cstart = 0;
-        }
-        if (!has_cstop) {
-            if (_py_stop && (*_py_stop != Py_None)) {
-                cstop = __Pyx_PyIndex_AsSsize_t(*_py_stop);
-                if ((cstop == (Py_ssize_t)-1) && PyErr_Occurred()) goto bad;
-            } else
-                cstop = PY_SSIZE_T_MAX;
-        }
-        if (wraparound && unlikely((cstart < 0) | (cstop < 0)) && likely(ms->sq_length)) {
-            Py_ssize_t l = ms->sq_length(obj);
-            if (likely(l >= 0)) {
-                if (cstop < 0) {
-                    cstop += l;
-                    if (cstop < 0) cstop = 0;
-                }
-                if (cstart < 0) {
-                    cstart += l;
-                    if (cstart < 0) cstart = 0;
-                }
-            } else {
-                if (!PyErr_ExceptionMatches(PyExc_OverflowError))
-                    goto bad;
-                PyErr_Clear();
-            }
-        }
-        return ms->sq_slice(obj, cstart, cstop);
-    }
-#endif
-    mp = Py_TYPE(obj)->tp_as_mapping;
-    if (likely(mp && mp->mp_subscript))
-#endif
-    {
-        PyObject* result;
-        PyObject *py_slice, *py_start, *py_stop;
-        if (_py_slice) {
-            py_slice = *_py_slice;
-        } else {
-            PyObject* owned_start = NULL;
-            PyObject* owned_stop = NULL;
-            if (_py_start) {
-                py_start = *_py_start;
-            } else {
-                if (has_cstart) {
-                    owned_start = py_start = PyInt_FromSsize_t(cstart);
-                    if (unlikely(!py_start)) goto bad;
-                } else
-                    py_start = Py_None;
-            }
-            if (_py_stop) {
-                py_stop = *_py_stop;
-            } else {
-                if (has_cstop) {
-                    owned_stop = py_stop = PyInt_FromSsize_t(cstop);
-                    if (unlikely(!py_stop)) {
-                        Py_XDECREF(owned_start);
-                        goto bad;
-                    }
-                } else
-                    py_stop = Py_None;
-            }
-            py_slice = PySlice_New(py_start, py_stop, Py_None);
-            Py_XDECREF(owned_start);
-            Py_XDECREF(owned_stop);
-            if (unlikely(!py_slice)) goto bad;
-        }
-#if CYTHON_USE_TYPE_SLOTS
-        result = mp->mp_subscript(obj, py_slice);
-#else
-        result = PyObject_GetItem(obj, py_slice);
-#endif
-        if (!_py_slice) {
-            Py_DECREF(py_slice);
-        }
-        return result;
-    }
-    PyErr_Format(PyExc_TypeError,
-        "'%.200s' object is unsliceable", Py_TYPE(obj)->tp_name);
-bad:
-    return NULL;
-}
-
-/* RaiseException */
-  #if PY_MAJOR_VERSION < 3
-static void __Pyx_Raise(PyObject *type, PyObject *value, PyObject *tb,
-                        CYTHON_UNUSED PyObject *cause) {
-    __Pyx_PyThreadState_declare
-    Py_XINCREF(type);
-    if (!value || value == Py_None)
-        value = NULL;
-    else
-        Py_INCREF(value);
-    if (!tb || tb == Py_None)
-        tb = NULL;
-    else {
-        Py_INCREF(tb);
-        if (!PyTraceBack_Check(tb)) {
-            PyErr_SetString(PyExc_TypeError,
-                "raise: arg 3 must be a traceback or None");
-            goto raise_error;
-        }
-    }
-    if (PyType_Check(type)) {
-#if CYTHON_COMPILING_IN_PYPY
-        if (!value) {
-            Py_INCREF(Py_None);
-            value = Py_None;
-        }
-#endif
-        PyErr_NormalizeException(&type, &value, &tb);
-    } else {
-        if (value) {
-            PyErr_SetString(PyExc_TypeError,
-                "instance exception may not have a separate value");
-            goto raise_error;
-        }
-        value = type;
-        type = (PyObject*) Py_TYPE(type);
-        Py_INCREF(type);
-        if (!PyType_IsSubtype((PyTypeObject *)type, (PyTypeObject *)PyExc_BaseException)) {
-            PyErr_SetString(PyExc_TypeError,
-                "raise: exception class must be a subclass of BaseException");
-            goto raise_error;
-        }
-    }
-    __Pyx_PyThreadState_assign
-    __Pyx_ErrRestore(type, value, tb);
-    return;
-raise_error:
-    Py_XDECREF(value);
-    Py_XDECREF(type);
-    Py_XDECREF(tb);
-    return;
-}
-#else
-static void __Pyx_Raise(PyObject *type, PyObject *value, PyObject *tb, PyObject *cause) {
-    PyObject* owned_instance = NULL;
-    if (tb == Py_None) {
-        tb = 0;
-    } else if (tb && !PyTraceBack_Check(tb)) {
-        PyErr_SetString(PyExc_TypeError,
-            "raise: arg 3 must be a traceback or None");
-        goto bad;
-    }
-    if (value == Py_None)
-        value = 0;
-    if (PyExceptionInstance_Check(type)) {
-        if (value) {
-            PyErr_SetString(PyExc_TypeError,
-                "instance exception may not have a separate value");
-            goto bad;
-        }
-        value = type;
-        type = (PyObject*) Py_TYPE(value);
-    } else if (PyExceptionClass_Check(type)) {
-        PyObject *instance_class = NULL;
-        if (value && PyExceptionInstance_Check(value)) {
-            instance_class = (PyObject*) Py_TYPE(value);
-            if (instance_class != type) {
-                int is_subclass = PyObject_IsSubclass(instance_class, type);
-                if (!is_subclass) {
-                    instance_class = NULL;
-                } else if (unlikely(is_subclass == -1)) {
-                    goto bad;
-                } else {
-                    type = instance_class;
-                }
-            }
-        }
-        if (!instance_class) {
-            PyObject *args;
-            if (!value)
-                args = PyTuple_New(0);
-            else if (PyTuple_Check(value)) {
-                Py_INCREF(value);
-                args = value;
-            } else
-                args = PyTuple_Pack(1, value);
-            if (!args)
-                goto bad;
-            owned_instance = PyObject_Call(type, args, NULL);
-            Py_DECREF(args);
-            if (!owned_instance)
-                goto bad;
-            value = owned_instance;
-            if (!PyExceptionInstance_Check(value)) {
-                PyErr_Format(PyExc_TypeError,
-                             "calling %R should have returned an instance of "
-                             "BaseException, not %R",
-                             type, Py_TYPE(value));
-                goto bad;
-            }
-        }
-    } else {
-        PyErr_SetString(PyExc_TypeError,
-            "raise: exception class must be a subclass of BaseException");
-        goto bad;
-    }
-    if (cause) {
-        PyObject *fixed_cause;
-        if (cause == Py_None) {
-            fixed_cause = NULL;
-        } else if (PyExceptionClass_Check(cause)) {
-            fixed_cause = PyObject_CallObject(cause, NULL);
-            if (fixed_cause == NULL)
-                goto bad;
-        } else if (PyExceptionInstance_Check(cause)) {
-            fixed_cause = cause;
-            Py_INCREF(fixed_cause);
-        } else {
-            PyErr_SetString(PyExc_TypeError,
-                            "exception causes must derive from "
-                            "BaseException");
-            goto bad;
-        }
-        PyException_SetCause(value, fixed_cause);
-    }
-    PyErr_SetObject(type, value);
-    if (tb) {
-#if CYTHON_COMPILING_IN_PYPY
-        PyObject *tmp_type, *tmp_value, *tmp_tb;
-        PyErr_Fetch(&tmp_type, &tmp_value, &tmp_tb);
-        Py_INCREF(tb);
-        PyErr_Restore(tmp_type, tmp_value, tb);
-        Py_XDECREF(tmp_tb);
-#else
-        PyThreadState *tstate = __Pyx_PyThreadState_Current;
-        PyObject* tmp_tb = tstate->curexc_traceback;
-        if (tb != tmp_tb) {
-            Py_INCREF(tb);
-            tstate->curexc_traceback = tb;
-            Py_XDECREF(tmp_tb);
-        }
-#endif
-    }
-bad:
-    Py_XDECREF(owned_instance);
-    return;
-}
-#endif
-
-/* ExtTypeTest */
-  static CYTHON_INLINE int __Pyx_TypeTest(PyObject *obj, PyTypeObject *type) {
-    if (unlikely(!type)) {
-        PyErr_SetString(PyExc_SystemError, "Missing type object");
-        return 0;
-    }
-    if (likely(__Pyx_TypeCheck(obj, type)))
-        return 1;
-    PyErr_Format(PyExc_TypeError, "Cannot convert %.200s to %.200s",
-                 Py_TYPE(obj)->tp_name, type->tp_name);
-    return 0;
-}
-
-/* ModInt[int] */
-  static CYTHON_INLINE int __Pyx_mod_int(int a, int b) {
-    int r = a % b;
-    r += ((r != 0) & ((r ^ b) < 0)) * b;
-    return r;
-}
-
-/* GetTopmostException */
-  #if CYTHON_USE_EXC_INFO_STACK
-static _PyErr_StackItem *
-__Pyx_PyErr_GetTopmostException(PyThreadState *tstate)
-{
-    _PyErr_StackItem *exc_info = tstate->exc_info;
-    while ((exc_info->exc_type == NULL || exc_info->exc_type == Py_None) &&
-           exc_info->previous_item != NULL)
-    {
-        exc_info = exc_info->previous_item;
-    }
-    return exc_info;
-}
-#endif
-
-/* SaveResetException */
-  #if CYTHON_FAST_THREAD_STATE
-static CYTHON_INLINE void __Pyx__ExceptionSave(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb) {
-    #if CYTHON_USE_EXC_INFO_STACK
-    _PyErr_StackItem *exc_info = __Pyx_PyErr_GetTopmostException(tstate);
-    *type = exc_info->exc_type;
-    *value = exc_info->exc_value;
-    *tb = exc_info->exc_traceback;
-    #else
-    *type = tstate->exc_type;
-    *value = tstate->exc_value;
-    *tb = tstate->exc_traceback;
-    #endif
-    Py_XINCREF(*type);
-    Py_XINCREF(*value);
-    Py_XINCREF(*tb);
-}
-static CYTHON_INLINE void __Pyx__ExceptionReset(PyThreadState *tstate, PyObject *type, PyObject *value, PyObject *tb) {
-    PyObject *tmp_type, *tmp_value, *tmp_tb;
-    #if CYTHON_USE_EXC_INFO_STACK
-    _PyErr_StackItem *exc_info = tstate->exc_info;
-    tmp_type = exc_info->exc_type;
-    tmp_value = exc_info->exc_value;
-    tmp_tb = exc_info->exc_traceback;
-    exc_info->exc_type = type;
-    exc_info->exc_value = value;
-    exc_info->exc_traceback = tb;
-    #else
-    tmp_type = tstate->exc_type;
-    tmp_value = tstate->exc_value;
-    tmp_tb = tstate->exc_traceback;
-    tstate->exc_type = type;
-    tstate->exc_value = value;
-    tstate->exc_traceback = tb;
-    #endif
-    Py_XDECREF(tmp_type);
-    Py_XDECREF(tmp_value);
-    Py_XDECREF(tmp_tb);
-}
-#endif
-
-/* PyErrExceptionMatches */
-  #if CYTHON_FAST_THREAD_STATE
-static int __Pyx_PyErr_ExceptionMatchesTuple(PyObject *exc_type, PyObject *tuple) {
-    Py_ssize_t i, n;
-    n = PyTuple_GET_SIZE(tuple);
-#if PY_MAJOR_VERSION >= 3
-    for (i=0; i<n; i++) {
-        if (exc_type == PyTuple_GET_ITEM(tuple, i)) return 1;
-    }
-#endif
-    for (i=0; i<n; i++) {
-        if (__Pyx_PyErr_GivenExceptionMatches(exc_type, PyTuple_GET_ITEM(tuple, i))) return 1;
-    }
-    return 0;
-}
-static CYTHON_INLINE int __Pyx_PyErr_ExceptionMatchesInState(PyThreadState* tstate, PyObject* err) {
-    PyObject *exc_type = tstate->curexc_type;
-    if (exc_type == err) return 1;
-    if (unlikely(!exc_type)) return 0;
-    if (unlikely(PyTuple_Check(err)))
-        return __Pyx_PyErr_ExceptionMatchesTuple(exc_type, err);
-    return __Pyx_PyErr_GivenExceptionMatches(exc_type, err);
-}
-#endif
-
-/* GetException */
-  #if CYTHON_FAST_THREAD_STATE
-static int __Pyx__GetException(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb)
-#else
-static int __Pyx_GetException(PyObject **type, PyObject **value, PyObject **tb)
-#endif
-{
-    PyObject *local_type, *local_value, *local_tb;
-#if CYTHON_FAST_THREAD_STATE
-    PyObject *tmp_type, *tmp_value, *tmp_tb;
-    local_type = tstate->curexc_type;
-    local_value = tstate->curexc_value;
-    local_tb = tstate->curexc_traceback;
-    tstate->curexc_type = 0;
-    tstate->curexc_value = 0;
-    tstate->curexc_traceback = 0;
-#else
-    PyErr_Fetch(&local_type, &local_value, &local_tb);
-#endif
-    PyErr_NormalizeException(&local_type, &local_value, &local_tb);
-#if CYTHON_FAST_THREAD_STATE
-    if (unlikely(tstate->curexc_type))
-#else
-    if (unlikely(PyErr_Occurred()))
-#endif
-        goto bad;
-    #if PY_MAJOR_VERSION >= 3
-    if (local_tb) {
-        if (unlikely(PyException_SetTraceback(local_value, local_tb) < 0))
-            goto bad;
-    }
-    #endif
-    Py_XINCREF(local_tb);
-    Py_XINCREF(local_type);
-    Py_XINCREF(local_value);
-    *type = local_type;
-    *value = local_value;
-    *tb = local_tb;
-#if CYTHON_FAST_THREAD_STATE
-    #if CYTHON_USE_EXC_INFO_STACK
-    {
-        _PyErr_StackItem *exc_info = tstate->exc_info;
-        tmp_type = exc_info->exc_type;
-        tmp_value = exc_info->exc_value;
-        tmp_tb = exc_info->exc_traceback;
-        exc_info->exc_type = local_type;
-        exc_info->exc_value = local_value;
-        exc_info->exc_traceback = local_tb;
-    }
-    #else
-    tmp_type = tstate->exc_type;
-    tmp_value = tstate->exc_value;
-    tmp_tb = tstate->exc_traceback;
-    tstate->exc_type = local_type;
-    tstate->exc_value = local_value;
-    tstate->exc_traceback = local_tb;
-    #endif
-    Py_XDECREF(tmp_type);
-    Py_XDECREF(tmp_value);
-    Py_XDECREF(tmp_tb);
-#else
-    PyErr_SetExcInfo(local_type, local_value, local_tb);
-#endif
-    return 0;
-bad:
-    *type = 0;
-    *value = 0;
-    *tb = 0;
-    Py_XDECREF(local_type);
-    Py_XDECREF(local_value);
-    Py_XDECREF(local_tb);
-    return -1;
-}
-
-/* BufferIndexError */
-  static void __Pyx_RaiseBufferIndexError(int axis) {
-  PyErr_Format(PyExc_IndexError,
-     "Out of bounds on buffer access (axis %d)", axis);
-}
-
-/* PyObject_GenericGetAttrNoDict */
-  #if CYTHON_USE_TYPE_SLOTS && CYTHON_USE_PYTYPE_LOOKUP && PY_VERSION_HEX < 0x03070000
-static PyObject *__Pyx_RaiseGenericGetAttributeError(PyTypeObject *tp, PyObject *attr_name) {
-    PyErr_Format(PyExc_AttributeError,
-#if PY_MAJOR_VERSION >= 3
-                 "'%.50s' object has no attribute '%U'",
-                 tp->tp_name, attr_name);
-#else
-                 "'%.50s' object has no attribute '%.400s'",
-                 tp->tp_name, PyString_AS_STRING(attr_name));
-#endif
-    return NULL;
-}
-static CYTHON_INLINE PyObject* __Pyx_PyObject_GenericGetAttrNoDict(PyObject* obj, PyObject* attr_name) {
-    PyObject *descr;
-    PyTypeObject *tp = Py_TYPE(obj);
-    if (unlikely(!PyString_Check(attr_name))) {
-        return PyObject_GenericGetAttr(obj, attr_name);
-    }
-    assert(!tp->tp_dictoffset);
-    descr = _PyType_Lookup(tp, attr_name);
-    if (unlikely(!descr)) {
-        return __Pyx_RaiseGenericGetAttributeError(tp, attr_name);
-    }
-    Py_INCREF(descr);
-    #if PY_MAJOR_VERSION < 3
-    if (likely(PyType_HasFeature(Py_TYPE(descr), Py_TPFLAGS_HAVE_CLASS)))
-    #endif
-    {
-        descrgetfunc f = Py_TYPE(descr)->tp_descr_get;
-        if (unlikely(f)) {
-            PyObject *res = f(descr, obj, (PyObject *)tp);
-            Py_DECREF(descr);
-            return res;
-        }
-    }
-    return descr;
-}
-#endif
-
-/* PyObject_GenericGetAttr */
-  #if CYTHON_USE_TYPE_SLOTS && CYTHON_USE_PYTYPE_LOOKUP && PY_VERSION_HEX < 0x03070000
-static PyObject* __Pyx_PyObject_GenericGetAttr(PyObject* obj, PyObject* attr_name) {
-    if (unlikely(Py_TYPE(obj)->tp_dictoffset)) {
-        return PyObject_GenericGetAttr(obj, attr_name);
-    }
-    return __Pyx_PyObject_GenericGetAttrNoDict(obj, attr_name);
-}
-#endif
-
-/* SetVTable */
-  static int __Pyx_SetVtable(PyObject *dict, void *vtable) {
-#if PY_VERSION_HEX >= 0x02070000
-    PyObject *ob = PyCapsule_New(vtable, 0, 0);
-#else
-    PyObject *ob = PyCObject_FromVoidPtr(vtable, 0);
-#endif
-    if (!ob)
-        goto bad;
-    if (PyDict_SetItem(dict, __pyx_n_s_pyx_vtable, ob) < 0)
-        goto bad;
-    Py_DECREF(ob);
-    return 0;
-bad:
-    Py_XDECREF(ob);
-    return -1;
-}
-
-/* PyObjectGetAttrStrNoError */
-  static void __Pyx_PyObject_GetAttrStr_ClearAttributeError(void) {
-    __Pyx_PyThreadState_declare
-    __Pyx_PyThreadState_assign
-    if (likely(__Pyx_PyErr_ExceptionMatches(PyExc_AttributeError)))
-        __Pyx_PyErr_Clear();
-}
-static CYTHON_INLINE PyObject* __Pyx_PyObject_GetAttrStrNoError(PyObject* obj, PyObject* attr_name) {
-    PyObject *result;
-#if CYTHON_COMPILING_IN_CPYTHON && CYTHON_USE_TYPE_SLOTS && PY_VERSION_HEX >= 0x030700B1
-    PyTypeObject* tp = Py_TYPE(obj);
-    if (likely(tp->tp_getattro == PyObject_GenericGetAttr)) {
-        return _PyObject_GenericGetAttrWithDict(obj, attr_name, NULL, 1);
-    }
-#endif
-    result = __Pyx_PyObject_GetAttrStr(obj, attr_name);
-    if (unlikely(!result)) {
-        __Pyx_PyObject_GetAttrStr_ClearAttributeError();
-    }
-    return result;
-}
-
-/* SetupReduce */
-  static int __Pyx_setup_reduce_is_named(PyObject* meth, PyObject* name) {
-  int ret;
-  PyObject *name_attr;
-  name_attr = __Pyx_PyObject_GetAttrStr(meth, __pyx_n_s_name);
-  if (likely(name_attr)) {
-      ret = PyObject_RichCompareBool(name_attr, name, Py_EQ);
-  } else {
-      ret = -1;
-  }
-  if (unlikely(ret < 0)) {
-      PyErr_Clear();
-      ret = 0;
-  }
-  Py_XDECREF(name_attr);
-  return ret;
-}
-static int __Pyx_setup_reduce(PyObject* type_obj) {
-    int ret = 0;
-    PyObject *object_reduce = NULL;
-    PyObject *object_reduce_ex = NULL;
-    PyObject *reduce = NULL;
-    PyObject *reduce_ex = NULL;
-    PyObject *reduce_cython = NULL;
-    PyObject *setstate = NULL;
-    PyObject *setstate_cython = NULL;
-#if CYTHON_USE_PYTYPE_LOOKUP
-    if (_PyType_Lookup((PyTypeObject*)type_obj, __pyx_n_s_getstate)) goto __PYX_GOOD;
-#else
-    if (PyObject_HasAttr(type_obj, __pyx_n_s_getstate)) goto __PYX_GOOD;
-#endif
-#if CYTHON_USE_PYTYPE_LOOKUP
-    object_reduce_ex = _PyType_Lookup(&PyBaseObject_Type, __pyx_n_s_reduce_ex); if (!object_reduce_ex) goto __PYX_BAD;
-#else
-    object_reduce_ex = __Pyx_PyObject_GetAttrStr((PyObject*)&PyBaseObject_Type, __pyx_n_s_reduce_ex); if (!object_reduce_ex) goto __PYX_BAD;
-#endif
-    reduce_ex = __Pyx_PyObject_GetAttrStr(type_obj, __pyx_n_s_reduce_ex); if (unlikely(!reduce_ex)) goto __PYX_BAD;
-    if (reduce_ex == object_reduce_ex) {
-#if CYTHON_USE_PYTYPE_LOOKUP
-        object_reduce = _PyType_Lookup(&PyBaseObject_Type, __pyx_n_s_reduce); if (!object_reduce) goto __PYX_BAD;
-#else
-        object_reduce = __Pyx_PyObject_GetAttrStr((PyObject*)&PyBaseObject_Type, __pyx_n_s_reduce); if (!object_reduce) goto __PYX_BAD;
-#endif
-        reduce = __Pyx_PyObject_GetAttrStr(type_obj, __pyx_n_s_reduce); if (unlikely(!reduce)) goto __PYX_BAD;
-        if (reduce == object_reduce || __Pyx_setup_reduce_is_named(reduce, __pyx_n_s_reduce_cython)) {
-            reduce_cython = __Pyx_PyObject_GetAttrStrNoError(type_obj, __pyx_n_s_reduce_cython);
-            if (likely(reduce_cython)) {
-                ret = PyDict_SetItem(((PyTypeObject*)type_obj)->tp_dict, __pyx_n_s_reduce, reduce_cython); if (unlikely(ret < 0)) goto __PYX_BAD;
-                ret = PyDict_DelItem(((PyTypeObject*)type_obj)->tp_dict, __pyx_n_s_reduce_cython); if (unlikely(ret < 0)) goto __PYX_BAD;
-            } else if (reduce == object_reduce || PyErr_Occurred()) {
-                goto __PYX_BAD;
-            }
-            setstate = __Pyx_PyObject_GetAttrStr(type_obj, __pyx_n_s_setstate);
-            if (!setstate) PyErr_Clear();
-            if (!setstate || __Pyx_setup_reduce_is_named(setstate, __pyx_n_s_setstate_cython)) {
-                setstate_cython = __Pyx_PyObject_GetAttrStrNoError(type_obj, __pyx_n_s_setstate_cython);
-                if (likely(setstate_cython)) {
-                    ret = PyDict_SetItem(((PyTypeObject*)type_obj)->tp_dict, __pyx_n_s_setstate, setstate_cython); if (unlikely(ret < 0)) goto __PYX_BAD;
-                    ret = PyDict_DelItem(((PyTypeObject*)type_obj)->tp_dict, __pyx_n_s_setstate_cython); if (unlikely(ret < 0)) goto __PYX_BAD;
-                } else if (!setstate || PyErr_Occurred()) {
-                    goto __PYX_BAD;
-                }
-            }
-            PyType_Modified((PyTypeObject*)type_obj);
-        }
-    }
-    goto __PYX_GOOD;
-__PYX_BAD:
-    if (!PyErr_Occurred())
-        PyErr_Format(PyExc_RuntimeError, "Unable to initialize pickling for %s", ((PyTypeObject*)type_obj)->tp_name);
-    ret = -1;
-__PYX_GOOD:
-#if !CYTHON_USE_PYTYPE_LOOKUP
-    Py_XDECREF(object_reduce);
-    Py_XDECREF(object_reduce_ex);
-#endif
-    Py_XDECREF(reduce);
-    Py_XDECREF(reduce_ex);
-    Py_XDECREF(reduce_cython);
-    Py_XDECREF(setstate);
-    Py_XDECREF(setstate_cython);
-    return ret;
-}
-
-/* TypeImport */
-  #ifndef __PYX_HAVE_RT_ImportType
-#define __PYX_HAVE_RT_ImportType
-static PyTypeObject *__Pyx_ImportType(PyObject *module, const char *module_name, const char *class_name,
-    size_t size, enum __Pyx_ImportType_CheckSize check_size)
-{
-    PyObject *result = 0;
-    char warning[200];
-    Py_ssize_t basicsize;
-#ifdef Py_LIMITED_API
-    PyObject *py_basicsize;
-#endif
-    result = PyObject_GetAttrString(module, class_name);
-    if (!result)
-        goto bad;
-    if (!PyType_Check(result)) {
-        PyErr_Format(PyExc_TypeError,
-            "%.200s.%.200s is not a type object",
-            module_name, class_name);
-        goto bad;
-    }
-#ifndef Py_LIMITED_API
-    basicsize = ((PyTypeObject *)result)->tp_basicsize;
-#else
-    py_basicsize = PyObject_GetAttrString(result, "__basicsize__");
-    if (!py_basicsize)
-        goto bad;
-    basicsize = PyLong_AsSsize_t(py_basicsize);
-    Py_DECREF(py_basicsize);
-    py_basicsize = 0;
-    if (basicsize == (Py_ssize_t)-1 && PyErr_Occurred())
-        goto bad;
-#endif
-    if ((size_t)basicsize < size) {
-        PyErr_Format(PyExc_ValueError,
-            "%.200s.%.200s size changed, may indicate binary incompatibility. "
-            "Expected %zd from C header, got %zd from PyObject",
-            module_name, class_name, size, basicsize);
-        goto bad;
-    }
-    if (check_size == __Pyx_ImportType_CheckSize_Error && (size_t)basicsize != size) {
-        PyErr_Format(PyExc_ValueError,
-            "%.200s.%.200s size changed, may indicate binary incompatibility. "
-            "Expected %zd from C header, got %zd from PyObject",
-            module_name, class_name, size, basicsize);
-        goto bad;
-    }
-    else if (check_size == __Pyx_ImportType_CheckSize_Warn && (size_t)basicsize > size) {
-        PyOS_snprintf(warning, sizeof(warning),
-            "%s.%s size changed, may indicate binary incompatibility. "
-            "Expected %zd from C header, got %zd from PyObject",
-            module_name, class_name, size, basicsize);
-        if (PyErr_WarnEx(NULL, warning, 0) < 0) goto bad;
-    }
-    return (PyTypeObject *)result;
-bad:
-    Py_XDECREF(result);
-    return NULL;
-}
-#endif
-
-/* GetVTable */
-  static void* __Pyx_GetVtable(PyObject *dict) {
-    void* ptr;
-    PyObject *ob = PyObject_GetItem(dict, __pyx_n_s_pyx_vtable);
-    if (!ob)
-        goto bad;
-#if PY_VERSION_HEX >= 0x02070000
-    ptr = PyCapsule_GetPointer(ob, 0);
-#else
-    ptr = PyCObject_AsVoidPtr(ob);
-#endif
-    if (!ptr && !PyErr_Occurred())
-        PyErr_SetString(PyExc_RuntimeError, "invalid vtable found for imported type");
-    Py_DECREF(ob);
-    return ptr;
-bad:
-    Py_XDECREF(ob);
-    return NULL;
-}
-
-/* Import */
-  static PyObject *__Pyx_Import(PyObject *name, PyObject *from_list, int level) {
-    PyObject *empty_list = 0;
-    PyObject *module = 0;
-    PyObject *global_dict = 0;
-    PyObject *empty_dict = 0;
-    PyObject *list;
-    #if PY_MAJOR_VERSION < 3
-    PyObject *py_import;
-    py_import = __Pyx_PyObject_GetAttrStr(__pyx_b, __pyx_n_s_import);
-    if (!py_import)
-        goto bad;
-    #endif
-    if (from_list)
-        list = from_list;
-    else {
-        empty_list = PyList_New(0);
-        if (!empty_list)
-            goto bad;
-        list = empty_list;
-    }
-    global_dict = PyModule_GetDict(__pyx_m);
-    if (!global_dict)
-        goto bad;
-    empty_dict = PyDict_New();
-    if (!empty_dict)
-        goto bad;
-    {
-        #if PY_MAJOR_VERSION >= 3
-        if (level == -1) {
-            if ((1) && (strchr(__Pyx_MODULE_NAME, '.'))) {
-                module = PyImport_ImportModuleLevelObject(
-                    name, global_dict, empty_dict, list, 1);
-                if (!module) {
-                    if (!PyErr_ExceptionMatches(PyExc_ImportError))
-                        goto bad;
-                    PyErr_Clear();
-                }
-            }
-            level = 0;
-        }
-        #endif
-        if (!module) {
-            #if PY_MAJOR_VERSION < 3
-            PyObject *py_level = PyInt_FromLong(level);
-            if (!py_level)
-                goto bad;
-            module = PyObject_CallFunctionObjArgs(py_import,
-                name, global_dict, empty_dict, list, py_level, (PyObject *)NULL);
-            Py_DECREF(py_level);
-            #else
-            module = PyImport_ImportModuleLevelObject(
-                name, global_dict, empty_dict, list, level);
-            #endif
-        }
-    }
-bad:
-    #if PY_MAJOR_VERSION < 3
-    Py_XDECREF(py_import);
-    #endif
-    Py_XDECREF(empty_list);
-    Py_XDECREF(empty_dict);
-    return module;
-}
-
-/* CLineInTraceback */
-  #ifndef CYTHON_CLINE_IN_TRACEBACK
-static int __Pyx_CLineForTraceback(CYTHON_NCP_UNUSED PyThreadState *tstate, int c_line) {
-    PyObject *use_cline;
-    PyObject *ptype, *pvalue, *ptraceback;
-#if CYTHON_COMPILING_IN_CPYTHON
-    PyObject **cython_runtime_dict;
-#endif
-    if (unlikely(!__pyx_cython_runtime)) {
-        return c_line;
-    }
-    __Pyx_ErrFetchInState(tstate, &ptype, &pvalue, &ptraceback);
-#if CYTHON_COMPILING_IN_CPYTHON
-    cython_runtime_dict = _PyObject_GetDictPtr(__pyx_cython_runtime);
-    if (likely(cython_runtime_dict)) {
-        __PYX_PY_DICT_LOOKUP_IF_MODIFIED(
-            use_cline, *cython_runtime_dict,
-            __Pyx_PyDict_GetItemStr(*cython_runtime_dict, __pyx_n_s_cline_in_traceback))
-    } else
-#endif
-    {
-      PyObject *use_cline_obj = __Pyx_PyObject_GetAttrStr(__pyx_cython_runtime, __pyx_n_s_cline_in_traceback);
-      if (use_cline_obj) {
-        use_cline = PyObject_Not(use_cline_obj) ? Py_False : Py_True;
-        Py_DECREF(use_cline_obj);
-      } else {
-        PyErr_Clear();
-        use_cline = NULL;
-      }
-    }
-    if (!use_cline) {
-        c_line = 0;
-        (void) PyObject_SetAttr(__pyx_cython_runtime, __pyx_n_s_cline_in_traceback, Py_False);
-    }
-    else if (use_cline == Py_False || (use_cline != Py_True && PyObject_Not(use_cline) != 0)) {
-        c_line = 0;
-    }
-    __Pyx_ErrRestoreInState(tstate, ptype, pvalue, ptraceback);
-    return c_line;
-}
-#endif
-
-/* CodeObjectCache */
-  static int __pyx_bisect_code_objects(__Pyx_CodeObjectCacheEntry* entries, int count, int code_line) {
-    int start = 0, mid = 0, end = count - 1;
-    if (end >= 0 && code_line > entries[end].code_line) {
-        return count;
-    }
-    while (start < end) {
-        mid = start + (end - start) / 2;
-        if (code_line < entries[mid].code_line) {
-            end = mid;
-        } else if (code_line > entries[mid].code_line) {
-             start = mid + 1;
-        } else {
-            return mid;
-        }
-    }
-    if (code_line <= entries[mid].code_line) {
-        return mid;
-    } else {
-        return mid + 1;
-    }
-}
-static PyCodeObject *__pyx_find_code_object(int code_line) {
-    PyCodeObject* code_object;
-    int pos;
-    if (unlikely(!code_line) || unlikely(!__pyx_code_cache.entries)) {
-        return NULL;
-    }
-    pos = __pyx_bisect_code_objects(__pyx_code_cache.entries, __pyx_code_cache.count, code_line);
-    if (unlikely(pos >= __pyx_code_cache.count) || unlikely(__pyx_code_cache.entries[pos].code_line != code_line)) {
-        return NULL;
-    }
-    code_object = __pyx_code_cache.entries[pos].code_object;
-    Py_INCREF(code_object);
-    return code_object;
-}
-static void __pyx_insert_code_object(int code_line, PyCodeObject* code_object) {
-    int pos, i;
-    __Pyx_CodeObjectCacheEntry* entries = __pyx_code_cache.entries;
-    if (unlikely(!code_line)) {
-        return;
-    }
-    if (unlikely(!entries)) {
-        entries = (__Pyx_CodeObjectCacheEntry*)PyMem_Malloc(64*sizeof(__Pyx_CodeObjectCacheEntry));
-        if (likely(entries)) {
-            __pyx_code_cache.entries = entries;
-            __pyx_code_cache.max_count = 64;
-            __pyx_code_cache.count = 1;
-            entries[0].code_line = code_line;
-            entries[0].code_object = code_object;
-            Py_INCREF(code_object);
-        }
-        return;
-    }
-    pos = __pyx_bisect_code_objects(__pyx_code_cache.entries, __pyx_code_cache.count, code_line);
-    if ((pos < __pyx_code_cache.count) && unlikely(__pyx_code_cache.entries[pos].code_line == code_line)) {
-        PyCodeObject* tmp = entries[pos].code_object;
-        entries[pos].code_object = code_object;
-        Py_DECREF(tmp);
-        return;
-    }
-    if (__pyx_code_cache.count == __pyx_code_cache.max_count) {
-        int new_max = __pyx_code_cache.max_count + 64;
-        entries = (__Pyx_CodeObjectCacheEntry*)PyMem_Realloc(
-            __pyx_code_cache.entries, ((size_t)new_max) * sizeof(__Pyx_CodeObjectCacheEntry));
-        if (unlikely(!entries)) {
-            return;
-        }
-        __pyx_code_cache.entries = entries;
-        __pyx_code_cache.max_count = new_max;
-    }
-    for (i=__pyx_code_cache.count; i>pos; i--) {
-        entries[i] = entries[i-1];
-    }
-    entries[pos].code_line = code_line;
-    entries[pos].code_object = code_object;
-    __pyx_code_cache.count++;
-    Py_INCREF(code_object);
-}
-
-/* AddTraceback */
-  #include "compile.h"
-#include "frameobject.h"
-#include "traceback.h"
-static PyCodeObject* __Pyx_CreateCodeObjectForTraceback(
-            const char *funcname, int c_line,
-            int py_line, const char *filename) {
-    PyCodeObject *py_code = NULL;
-    PyObject *py_funcname = NULL;
-    #if PY_MAJOR_VERSION < 3
-    PyObject *py_srcfile = NULL;
-    py_srcfile = PyString_FromString(filename);
-    if (!py_srcfile) goto bad;
-    #endif
-    if (c_line) {
-        #if PY_MAJOR_VERSION < 3
-        py_funcname = PyString_FromFormat( "%s (%s:%d)", funcname, __pyx_cfilenm, c_line);
-        if (!py_funcname) goto bad;
-        #else
-        py_funcname = PyUnicode_FromFormat( "%s (%s:%d)", funcname, __pyx_cfilenm, c_line);
-        if (!py_funcname) goto bad;
-        funcname = PyUnicode_AsUTF8(py_funcname);
-        if (!funcname) goto bad;
-        #endif
-    }
-    else {
-        #if PY_MAJOR_VERSION < 3
-        py_funcname = PyString_FromString(funcname);
-        if (!py_funcname) goto bad;
-        #endif
-    }
-    #if PY_MAJOR_VERSION < 3
-    py_code = __Pyx_PyCode_New(
-        0,
-        0,
-        0,
-        0,
-        0,
-        __pyx_empty_bytes, /*PyObject *code,*/
-        __pyx_empty_tuple, /*PyObject *consts,*/
-        __pyx_empty_tuple, /*PyObject *names,*/
-        __pyx_empty_tuple, /*PyObject *varnames,*/
-        __pyx_empty_tuple, /*PyObject *freevars,*/
-        __pyx_empty_tuple, /*PyObject *cellvars,*/
-        py_srcfile,   /*PyObject *filename,*/
-        py_funcname,  /*PyObject *name,*/
-        py_line,
-        __pyx_empty_bytes  /*PyObject *lnotab*/
-    );
-    Py_DECREF(py_srcfile);
-    #else
-    py_code = PyCode_NewEmpty(filename, funcname, py_line);
-    #endif
-    Py_XDECREF(py_funcname);  // XDECREF since it's only set on Py3 if cline
-    return py_code;
-bad:
-    Py_XDECREF(py_funcname);
-    #if PY_MAJOR_VERSION < 3
-    Py_XDECREF(py_srcfile);
-    #endif
-    return NULL;
-}
-static void __Pyx_AddTraceback(const char *funcname, int c_line,
-                               int py_line, const char *filename) {
-    PyCodeObject *py_code = 0;
-    PyFrameObject *py_frame = 0;
-    PyThreadState *tstate = __Pyx_PyThreadState_Current;
-    if (c_line) {
-        c_line = __Pyx_CLineForTraceback(tstate, c_line);
-    }
-    py_code = __pyx_find_code_object(c_line ? -c_line : py_line);
-    if (!py_code) {
-        py_code = __Pyx_CreateCodeObjectForTraceback(
-            funcname, c_line, py_line, filename);
-        if (!py_code) goto bad;
-        __pyx_insert_code_object(c_line ? -c_line : py_line, py_code);
-    }
-    py_frame = PyFrame_New(
-        tstate,            /*PyThreadState *tstate,*/
-        py_code,           /*PyCodeObject *code,*/
-        __pyx_d,    /*PyObject *globals,*/
-        0                  /*PyObject *locals*/
-    );
-    if (!py_frame) goto bad;
-    __Pyx_PyFrame_SetLineNumber(py_frame, py_line);
-    PyTraceBack_Here(py_frame);
-bad:
-    Py_XDECREF(py_code);
-    Py_XDECREF(py_frame);
-}
-
-#if PY_MAJOR_VERSION < 3
-static int __Pyx_GetBuffer(PyObject *obj, Py_buffer *view, int flags) {
-    if (PyObject_CheckBuffer(obj)) return PyObject_GetBuffer(obj, view, flags);
-    PyErr_Format(PyExc_TypeError, "'%.200s' does not have the buffer interface", Py_TYPE(obj)->tp_name);
-    return -1;
-}
-static void __Pyx_ReleaseBuffer(Py_buffer *view) {
-    PyObject *obj = view->obj;
-    if (!obj) return;
-    if (PyObject_CheckBuffer(obj)) {
-        PyBuffer_Release(view);
-        return;
-    }
-    if ((0)) {}
-    view->obj = NULL;
-    Py_DECREF(obj);
-}
-#endif
-
-
-  /* CIntFromPyVerify */
-  #define __PYX_VERIFY_RETURN_INT(target_type, func_type, func_value)\
-    __PYX__VERIFY_RETURN_INT(target_type, func_type, func_value, 0)
-#define __PYX_VERIFY_RETURN_INT_EXC(target_type, func_type, func_value)\
-    __PYX__VERIFY_RETURN_INT(target_type, func_type, func_value, 1)
-#define __PYX__VERIFY_RETURN_INT(target_type, func_type, func_value, exc)\
-    {\
-        func_type value = func_value;\
-        if (sizeof(target_type) < sizeof(func_type)) {\
-            if (unlikely(value != (func_type) (target_type) value)) {\
-                func_type zero = 0;\
-                if (exc && unlikely(value == (func_type)-1 && PyErr_Occurred()))\
-                    return (target_type) -1;\
-                if (is_unsigned && unlikely(value < zero))\
-                    goto raise_neg_overflow;\
-                else\
-                    goto raise_overflow;\
-            }\
-        }\
-        return (target_type) value;\
-    }
-
-/* Declarations */
-  #if CYTHON_CCOMPLEX
-  #ifdef __cplusplus
-    static CYTHON_INLINE __pyx_t_float_complex __pyx_t_float_complex_from_parts(float x, float y) {
-      return ::std::complex< float >(x, y);
-    }
-  #else
-    static CYTHON_INLINE __pyx_t_float_complex __pyx_t_float_complex_from_parts(float x, float y) {
-      return x + y*(__pyx_t_float_complex)_Complex_I;
-    }
-  #endif
-#else
-    static CYTHON_INLINE __pyx_t_float_complex __pyx_t_float_complex_from_parts(float x, float y) {
-      __pyx_t_float_complex z;
-      z.real = x;
-      z.imag = y;
-      return z;
-    }
-#endif
-
-/* Arithmetic */
-  #if CYTHON_CCOMPLEX
-#else
-    static CYTHON_INLINE int __Pyx_c_eq_float(__pyx_t_float_complex a, __pyx_t_float_complex b) {
-       return (a.real == b.real) && (a.imag == b.imag);
-    }
-    static CYTHON_INLINE __pyx_t_float_complex __Pyx_c_sum_float(__pyx_t_float_complex a, __pyx_t_float_complex b) {
-        __pyx_t_float_complex z;
-        z.real = a.real + b.real;
-        z.imag = a.imag + b.imag;
-        return z;
-    }
-    static CYTHON_INLINE __pyx_t_float_complex __Pyx_c_diff_float(__pyx_t_float_complex a, __pyx_t_float_complex b) {
-        __pyx_t_float_complex z;
-        z.real = a.real - b.real;
-        z.imag = a.imag - b.imag;
-        return z;
-    }
-    static CYTHON_INLINE __pyx_t_float_complex __Pyx_c_prod_float(__pyx_t_float_complex a, __pyx_t_float_complex b) {
-        __pyx_t_float_complex z;
-        z.real = a.real * b.real - a.imag * b.imag;
-        z.imag = a.real * b.imag + a.imag * b.real;
-        return z;
-    }
-    #if 1
-    static CYTHON_INLINE __pyx_t_float_complex __Pyx_c_quot_float(__pyx_t_float_complex a, __pyx_t_float_complex b) {
-        if (b.imag == 0) {
-            return __pyx_t_float_complex_from_parts(a.real / b.real, a.imag / b.real);
-        } else if (fabsf(b.real) >= fabsf(b.imag)) {
-            if (b.real == 0 && b.imag == 0) {
-                return __pyx_t_float_complex_from_parts(a.real / b.real, a.imag / b.imag);
-            } else {
-                float r = b.imag / b.real;
-                float s = (float)(1.0) / (b.real + b.imag * r);
-                return __pyx_t_float_complex_from_parts(
-                    (a.real + a.imag * r) * s, (a.imag - a.real * r) * s);
-            }
-        } else {
-            float r = b.real / b.imag;
-            float s = (float)(1.0) / (b.imag + b.real * r);
-            return __pyx_t_float_complex_from_parts(
-                (a.real * r + a.imag) * s, (a.imag * r - a.real) * s);
-        }
-    }
-    #else
-    static CYTHON_INLINE __pyx_t_float_complex __Pyx_c_quot_float(__pyx_t_float_complex a, __pyx_t_float_complex b) {
-        if (b.imag == 0) {
-            return __pyx_t_float_complex_from_parts(a.real / b.real, a.imag / b.real);
-        } else {
-            float denom = b.real * b.real + b.imag * b.imag;
-            return __pyx_t_float_complex_from_parts(
-                (a.real * b.real + a.imag * b.imag) / denom,
-                (a.imag * b.real - a.real * b.imag) / denom);
-        }
-    }
-    #endif
-    static CYTHON_INLINE __pyx_t_float_complex __Pyx_c_neg_float(__pyx_t_float_complex a) {
-        __pyx_t_float_complex z;
-        z.real = -a.real;
-        z.imag = -a.imag;
-        return z;
-    }
-    static CYTHON_INLINE int __Pyx_c_is_zero_float(__pyx_t_float_complex a) {
-       return (a.real == 0) && (a.imag == 0);
-    }
-    static CYTHON_INLINE __pyx_t_float_complex __Pyx_c_conj_float(__pyx_t_float_complex a) {
-        __pyx_t_float_complex z;
-        z.real =  a.real;
-        z.imag = -a.imag;
-        return z;
-    }
-    #if 1
-        static CYTHON_INLINE float __Pyx_c_abs_float(__pyx_t_float_complex z) {
-          #if !defined(HAVE_HYPOT) || defined(_MSC_VER)
-            return sqrtf(z.real*z.real + z.imag*z.imag);
-          #else
-            return hypotf(z.real, z.imag);
-          #endif
-        }
-        static CYTHON_INLINE __pyx_t_float_complex __Pyx_c_pow_float(__pyx_t_float_complex a, __pyx_t_float_complex b) {
-            __pyx_t_float_complex z;
-            float r, lnr, theta, z_r, z_theta;
-            if (b.imag == 0 && b.real == (int)b.real) {
-                if (b.real < 0) {
-                    float denom = a.real * a.real + a.imag * a.imag;
-                    a.real = a.real / denom;
-                    a.imag = -a.imag / denom;
-                    b.real = -b.real;
-                }
-                switch ((int)b.real) {
-                    case 0:
-                        z.real = 1;
-                        z.imag = 0;
-                        return z;
-                    case 1:
-                        return a;
-                    case 2:
-                        return __Pyx_c_prod_float(a, a);
-                    case 3:
-                        z = __Pyx_c_prod_float(a, a);
-                        return __Pyx_c_prod_float(z, a);
-                    case 4:
-                        z = __Pyx_c_prod_float(a, a);
-                        return __Pyx_c_prod_float(z, z);
-                }
-            }
-            if (a.imag == 0) {
-                if (a.real == 0) {
-                    return a;
-                } else if (b.imag == 0) {
-                    z.real = powf(a.real, b.real);
-                    z.imag = 0;
-                    return z;
-                } else if (a.real > 0) {
-                    r = a.real;
-                    theta = 0;
-                } else {
-                    r = -a.real;
-                    theta = atan2f(0.0, -1.0);
-                }
-            } else {
-                r = __Pyx_c_abs_float(a);
-                theta = atan2f(a.imag, a.real);
-            }
-            lnr = logf(r);
-            z_r = expf(lnr * b.real - theta * b.imag);
-            z_theta = theta * b.real + lnr * b.imag;
-            z.real = z_r * cosf(z_theta);
-            z.imag = z_r * sinf(z_theta);
-            return z;
-        }
-    #endif
-#endif
-
-/* Declarations */
-  #if CYTHON_CCOMPLEX
-  #ifdef __cplusplus
-    static CYTHON_INLINE __pyx_t_double_complex __pyx_t_double_complex_from_parts(double x, double y) {
-      return ::std::complex< double >(x, y);
-    }
-  #else
-    static CYTHON_INLINE __pyx_t_double_complex __pyx_t_double_complex_from_parts(double x, double y) {
-      return x + y*(__pyx_t_double_complex)_Complex_I;
-    }
-  #endif
-#else
-    static CYTHON_INLINE __pyx_t_double_complex __pyx_t_double_complex_from_parts(double x, double y) {
-      __pyx_t_double_complex z;
-      z.real = x;
-      z.imag = y;
-      return z;
-    }
-#endif
-
-/* Arithmetic */
-  #if CYTHON_CCOMPLEX
-#else
-    static CYTHON_INLINE int __Pyx_c_eq_double(__pyx_t_double_complex a, __pyx_t_double_complex b) {
-       return (a.real == b.real) && (a.imag == b.imag);
-    }
-    static CYTHON_INLINE __pyx_t_double_complex __Pyx_c_sum_double(__pyx_t_double_complex a, __pyx_t_double_complex b) {
-        __pyx_t_double_complex z;
-        z.real = a.real + b.real;
-        z.imag = a.imag + b.imag;
-        return z;
-    }
-    static CYTHON_INLINE __pyx_t_double_complex __Pyx_c_diff_double(__pyx_t_double_complex a, __pyx_t_double_complex b) {
-        __pyx_t_double_complex z;
-        z.real = a.real - b.real;
-        z.imag = a.imag - b.imag;
-        return z;
-    }
-    static CYTHON_INLINE __pyx_t_double_complex __Pyx_c_prod_double(__pyx_t_double_complex a, __pyx_t_double_complex b) {
-        __pyx_t_double_complex z;
-        z.real = a.real * b.real - a.imag * b.imag;
-        z.imag = a.real * b.imag + a.imag * b.real;
-        return z;
-    }
-    #if 1
-    static CYTHON_INLINE __pyx_t_double_complex __Pyx_c_quot_double(__pyx_t_double_complex a, __pyx_t_double_complex b) {
-        if (b.imag == 0) {
-            return __pyx_t_double_complex_from_parts(a.real / b.real, a.imag / b.real);
-        } else if (fabs(b.real) >= fabs(b.imag)) {
-            if (b.real == 0 && b.imag == 0) {
-                return __pyx_t_double_complex_from_parts(a.real / b.real, a.imag / b.imag);
-            } else {
-                double r = b.imag / b.real;
-                double s = (double)(1.0) / (b.real + b.imag * r);
-                return __pyx_t_double_complex_from_parts(
-                    (a.real + a.imag * r) * s, (a.imag - a.real * r) * s);
-            }
-        } else {
-            double r = b.real / b.imag;
-            double s = (double)(1.0) / (b.imag + b.real * r);
-            return __pyx_t_double_complex_from_parts(
-                (a.real * r + a.imag) * s, (a.imag * r - a.real) * s);
-        }
-    }
-    #else
-    static CYTHON_INLINE __pyx_t_double_complex __Pyx_c_quot_double(__pyx_t_double_complex a, __pyx_t_double_complex b) {
-        if (b.imag == 0) {
-            return __pyx_t_double_complex_from_parts(a.real / b.real, a.imag / b.real);
-        } else {
-            double denom = b.real * b.real + b.imag * b.imag;
-            return __pyx_t_double_complex_from_parts(
-                (a.real * b.real + a.imag * b.imag) / denom,
-                (a.imag * b.real - a.real * b.imag) / denom);
-        }
-    }
-    #endif
-    static CYTHON_INLINE __pyx_t_double_complex __Pyx_c_neg_double(__pyx_t_double_complex a) {
-        __pyx_t_double_complex z;
-        z.real = -a.real;
-        z.imag = -a.imag;
-        return z;
-    }
-    static CYTHON_INLINE int __Pyx_c_is_zero_double(__pyx_t_double_complex a) {
-       return (a.real == 0) && (a.imag == 0);
-    }
-    static CYTHON_INLINE __pyx_t_double_complex __Pyx_c_conj_double(__pyx_t_double_complex a) {
-        __pyx_t_double_complex z;
-        z.real =  a.real;
-        z.imag = -a.imag;
-        return z;
-    }
-    #if 1
-        static CYTHON_INLINE double __Pyx_c_abs_double(__pyx_t_double_complex z) {
-          #if !defined(HAVE_HYPOT) || defined(_MSC_VER)
-            return sqrt(z.real*z.real + z.imag*z.imag);
-          #else
-            return hypot(z.real, z.imag);
-          #endif
-        }
-        static CYTHON_INLINE __pyx_t_double_complex __Pyx_c_pow_double(__pyx_t_double_complex a, __pyx_t_double_complex b) {
-            __pyx_t_double_complex z;
-            double r, lnr, theta, z_r, z_theta;
-            if (b.imag == 0 && b.real == (int)b.real) {
-                if (b.real < 0) {
-                    double denom = a.real * a.real + a.imag * a.imag;
-                    a.real = a.real / denom;
-                    a.imag = -a.imag / denom;
-                    b.real = -b.real;
-                }
-                switch ((int)b.real) {
-                    case 0:
-                        z.real = 1;
-                        z.imag = 0;
-                        return z;
-                    case 1:
-                        return a;
-                    case 2:
-                        return __Pyx_c_prod_double(a, a);
-                    case 3:
-                        z = __Pyx_c_prod_double(a, a);
-                        return __Pyx_c_prod_double(z, a);
-                    case 4:
-                        z = __Pyx_c_prod_double(a, a);
-                        return __Pyx_c_prod_double(z, z);
-                }
-            }
-            if (a.imag == 0) {
-                if (a.real == 0) {
-                    return a;
-                } else if (b.imag == 0) {
-                    z.real = pow(a.real, b.real);
-                    z.imag = 0;
-                    return z;
-                } else if (a.real > 0) {
-                    r = a.real;
-                    theta = 0;
-                } else {
-                    r = -a.real;
-                    theta = atan2(0.0, -1.0);
-                }
-            } else {
-                r = __Pyx_c_abs_double(a);
-                theta = atan2(a.imag, a.real);
-            }
-            lnr = log(r);
-            z_r = exp(lnr * b.real - theta * b.imag);
-            z_theta = theta * b.real + lnr * b.imag;
-            z.real = z_r * cos(z_theta);
-            z.imag = z_r * sin(z_theta);
-            return z;
-        }
-    #endif
-#endif
-
-/* CIntFromPy */
-  static CYTHON_INLINE int __Pyx_PyInt_As_int(PyObject *x) {
-#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
-#pragma GCC diagnostic push
-#pragma GCC diagnostic ignored "-Wconversion"
-#endif
-    const int neg_one = (int) -1, const_zero = (int) 0;
-#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
-#pragma GCC diagnostic pop
-#endif
-    const int is_unsigned = neg_one > const_zero;
-#if PY_MAJOR_VERSION < 3
-    if (likely(PyInt_Check(x))) {
-        if (sizeof(int) < sizeof(long)) {
-            __PYX_VERIFY_RETURN_INT(int, long, PyInt_AS_LONG(x))
-        } else {
-            long val = PyInt_AS_LONG(x);
-            if (is_unsigned && unlikely(val < 0)) {
-                goto raise_neg_overflow;
-            }
-            return (int) val;
-        }
-    } else
-#endif
-    if (likely(PyLong_Check(x))) {
-        if (is_unsigned) {
-#if CYTHON_USE_PYLONG_INTERNALS
-            const digit* digits = ((PyLongObject*)x)->ob_digit;
-            switch (Py_SIZE(x)) {
-                case  0: return (int) 0;
-                case  1: __PYX_VERIFY_RETURN_INT(int, digit, digits[0])
-                case 2:
-                    if (8 * sizeof(int) > 1 * PyLong_SHIFT) {
-                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
-                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if (8 * sizeof(int) >= 2 * PyLong_SHIFT) {
-                            return (int) (((((int)digits[1]) << PyLong_SHIFT) | (int)digits[0]));
-                        }
-                    }
-                    break;
-                case 3:
-                    if (8 * sizeof(int) > 2 * PyLong_SHIFT) {
-                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
-                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if (8 * sizeof(int) >= 3 * PyLong_SHIFT) {
-                            return (int) (((((((int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0]));
-                        }
-                    }
-                    break;
-                case 4:
-                    if (8 * sizeof(int) > 3 * PyLong_SHIFT) {
-                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
-                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if (8 * sizeof(int) >= 4 * PyLong_SHIFT) {
-                            return (int) (((((((((int)digits[3]) << PyLong_SHIFT) | (int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0]));
-                        }
-                    }
-                    break;
-            }
-#endif
-#if CYTHON_COMPILING_IN_CPYTHON
-            if (unlikely(Py_SIZE(x) < 0)) {
-                goto raise_neg_overflow;
-            }
-#else
-            {
-                int result = PyObject_RichCompareBool(x, Py_False, Py_LT);
-                if (unlikely(result < 0))
-                    return (int) -1;
-                if (unlikely(result == 1))
-                    goto raise_neg_overflow;
-            }
-#endif
-            if (sizeof(int) <= sizeof(unsigned long)) {
-                __PYX_VERIFY_RETURN_INT_EXC(int, unsigned long, PyLong_AsUnsignedLong(x))
-#ifdef HAVE_LONG_LONG
-            } else if (sizeof(int) <= sizeof(unsigned PY_LONG_LONG)) {
-                __PYX_VERIFY_RETURN_INT_EXC(int, unsigned PY_LONG_LONG, PyLong_AsUnsignedLongLong(x))
-#endif
-            }
-        } else {
-#if CYTHON_USE_PYLONG_INTERNALS
-            const digit* digits = ((PyLongObject*)x)->ob_digit;
-            switch (Py_SIZE(x)) {
-                case  0: return (int) 0;
-                case -1: __PYX_VERIFY_RETURN_INT(int, sdigit, (sdigit) (-(sdigit)digits[0]))
-                case  1: __PYX_VERIFY_RETURN_INT(int,  digit, +digits[0])
-                case -2:
-                    if (8 * sizeof(int) - 1 > 1 * PyLong_SHIFT) {
-                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
-                            __PYX_VERIFY_RETURN_INT(int, long, -(long) (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if (8 * sizeof(int) - 1 > 2 * PyLong_SHIFT) {
-                            return (int) (((int)-1)*(((((int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
-                        }
-                    }
-                    break;
-                case 2:
-                    if (8 * sizeof(int) > 1 * PyLong_SHIFT) {
-                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
-                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if (8 * sizeof(int) - 1 > 2 * PyLong_SHIFT) {
-                            return (int) ((((((int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
-                        }
-                    }
-                    break;
-                case -3:
-                    if (8 * sizeof(int) - 1 > 2 * PyLong_SHIFT) {
-                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
-                            __PYX_VERIFY_RETURN_INT(int, long, -(long) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if (8 * sizeof(int) - 1 > 3 * PyLong_SHIFT) {
-                            return (int) (((int)-1)*(((((((int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
-                        }
-                    }
-                    break;
-                case 3:
-                    if (8 * sizeof(int) > 2 * PyLong_SHIFT) {
-                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
-                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if (8 * sizeof(int) - 1 > 3 * PyLong_SHIFT) {
-                            return (int) ((((((((int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
-                        }
-                    }
-                    break;
-                case -4:
-                    if (8 * sizeof(int) - 1 > 3 * PyLong_SHIFT) {
-                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
-                            __PYX_VERIFY_RETURN_INT(int, long, -(long) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if (8 * sizeof(int) - 1 > 4 * PyLong_SHIFT) {
-                            return (int) (((int)-1)*(((((((((int)digits[3]) << PyLong_SHIFT) | (int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
-                        }
-                    }
-                    break;
-                case 4:
-                    if (8 * sizeof(int) > 3 * PyLong_SHIFT) {
-                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
-                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if (8 * sizeof(int) - 1 > 4 * PyLong_SHIFT) {
-                            return (int) ((((((((((int)digits[3]) << PyLong_SHIFT) | (int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
-                        }
-                    }
-                    break;
-            }
-#endif
-            if (sizeof(int) <= sizeof(long)) {
-                __PYX_VERIFY_RETURN_INT_EXC(int, long, PyLong_AsLong(x))
-#ifdef HAVE_LONG_LONG
-            } else if (sizeof(int) <= sizeof(PY_LONG_LONG)) {
-                __PYX_VERIFY_RETURN_INT_EXC(int, PY_LONG_LONG, PyLong_AsLongLong(x))
-#endif
-            }
-        }
-        {
-#if CYTHON_COMPILING_IN_PYPY && !defined(_PyLong_AsByteArray)
-            PyErr_SetString(PyExc_RuntimeError,
-                            "_PyLong_AsByteArray() not available in PyPy, cannot convert large numbers");
-#else
-            int val;
-            PyObject *v = __Pyx_PyNumber_IntOrLong(x);
- #if PY_MAJOR_VERSION < 3
-            if (likely(v) && !PyLong_Check(v)) {
-                PyObject *tmp = v;
-                v = PyNumber_Long(tmp);
-                Py_DECREF(tmp);
-            }
- #endif
-            if (likely(v)) {
-                int one = 1; int is_little = (int)*(unsigned char *)&one;
-                unsigned char *bytes = (unsigned char *)&val;
-                int ret = _PyLong_AsByteArray((PyLongObject *)v,
-                                              bytes, sizeof(val),
-                                              is_little, !is_unsigned);
-                Py_DECREF(v);
-                if (likely(!ret))
-                    return val;
-            }
-#endif
-            return (int) -1;
-        }
-    } else {
-        int val;
-        PyObject *tmp = __Pyx_PyNumber_IntOrLong(x);
-        if (!tmp) return (int) -1;
-        val = __Pyx_PyInt_As_int(tmp);
-        Py_DECREF(tmp);
-        return val;
-    }
-raise_overflow:
-    PyErr_SetString(PyExc_OverflowError,
-        "value too large to convert to int");
-    return (int) -1;
-raise_neg_overflow:
-    PyErr_SetString(PyExc_OverflowError,
-        "can't convert negative value to int");
-    return (int) -1;
-}
-
-/* CIntToPy */
-  static CYTHON_INLINE PyObject* __Pyx_PyInt_From_int(int value) {
-#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
-#pragma GCC diagnostic push
-#pragma GCC diagnostic ignored "-Wconversion"
-#endif
-    const int neg_one = (int) -1, const_zero = (int) 0;
-#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
-#pragma GCC diagnostic pop
-#endif
-    const int is_unsigned = neg_one > const_zero;
-    if (is_unsigned) {
-        if (sizeof(int) < sizeof(long)) {
-            return PyInt_FromLong((long) value);
-        } else if (sizeof(int) <= sizeof(unsigned long)) {
-            return PyLong_FromUnsignedLong((unsigned long) value);
-#ifdef HAVE_LONG_LONG
-        } else if (sizeof(int) <= sizeof(unsigned PY_LONG_LONG)) {
-            return PyLong_FromUnsignedLongLong((unsigned PY_LONG_LONG) value);
-#endif
-        }
-    } else {
-        if (sizeof(int) <= sizeof(long)) {
-            return PyInt_FromLong((long) value);
-#ifdef HAVE_LONG_LONG
-        } else if (sizeof(int) <= sizeof(PY_LONG_LONG)) {
-            return PyLong_FromLongLong((PY_LONG_LONG) value);
-#endif
-        }
-    }
-    {
-        int one = 1; int little = (int)*(unsigned char *)&one;
-        unsigned char *bytes = (unsigned char *)&value;
-        return _PyLong_FromByteArray(bytes, sizeof(int),
-                                     little, !is_unsigned);
-    }
-}
-
-/* CIntFromPy */
-  static CYTHON_INLINE size_t __Pyx_PyInt_As_size_t(PyObject *x) {
-#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
-#pragma GCC diagnostic push
-#pragma GCC diagnostic ignored "-Wconversion"
-#endif
-    const size_t neg_one = (size_t) -1, const_zero = (size_t) 0;
-#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
-#pragma GCC diagnostic pop
-#endif
-    const int is_unsigned = neg_one > const_zero;
-#if PY_MAJOR_VERSION < 3
-    if (likely(PyInt_Check(x))) {
-        if (sizeof(size_t) < sizeof(long)) {
-            __PYX_VERIFY_RETURN_INT(size_t, long, PyInt_AS_LONG(x))
-        } else {
-            long val = PyInt_AS_LONG(x);
-            if (is_unsigned && unlikely(val < 0)) {
-                goto raise_neg_overflow;
-            }
-            return (size_t) val;
-        }
-    } else
-#endif
-    if (likely(PyLong_Check(x))) {
-        if (is_unsigned) {
-#if CYTHON_USE_PYLONG_INTERNALS
-            const digit* digits = ((PyLongObject*)x)->ob_digit;
-            switch (Py_SIZE(x)) {
-                case  0: return (size_t) 0;
-                case  1: __PYX_VERIFY_RETURN_INT(size_t, digit, digits[0])
-                case 2:
-                    if (8 * sizeof(size_t) > 1 * PyLong_SHIFT) {
-                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
-                            __PYX_VERIFY_RETURN_INT(size_t, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if (8 * sizeof(size_t) >= 2 * PyLong_SHIFT) {
-                            return (size_t) (((((size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
-                        }
-                    }
-                    break;
-                case 3:
-                    if (8 * sizeof(size_t) > 2 * PyLong_SHIFT) {
-                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
-                            __PYX_VERIFY_RETURN_INT(size_t, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if (8 * sizeof(size_t) >= 3 * PyLong_SHIFT) {
-                            return (size_t) (((((((size_t)digits[2]) << PyLong_SHIFT) | (size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
-                        }
-                    }
-                    break;
-                case 4:
-                    if (8 * sizeof(size_t) > 3 * PyLong_SHIFT) {
-                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
-                            __PYX_VERIFY_RETURN_INT(size_t, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if (8 * sizeof(size_t) >= 4 * PyLong_SHIFT) {
-                            return (size_t) (((((((((size_t)digits[3]) << PyLong_SHIFT) | (size_t)digits[2]) << PyLong_SHIFT) | (size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
-                        }
-                    }
-                    break;
-            }
-#endif
-#if CYTHON_COMPILING_IN_CPYTHON
-            if (unlikely(Py_SIZE(x) < 0)) {
-                goto raise_neg_overflow;
-            }
-#else
-            {
-                int result = PyObject_RichCompareBool(x, Py_False, Py_LT);
-                if (unlikely(result < 0))
-                    return (size_t) -1;
-                if (unlikely(result == 1))
-                    goto raise_neg_overflow;
-            }
-#endif
-            if (sizeof(size_t) <= sizeof(unsigned long)) {
-                __PYX_VERIFY_RETURN_INT_EXC(size_t, unsigned long, PyLong_AsUnsignedLong(x))
-#ifdef HAVE_LONG_LONG
-            } else if (sizeof(size_t) <= sizeof(unsigned PY_LONG_LONG)) {
-                __PYX_VERIFY_RETURN_INT_EXC(size_t, unsigned PY_LONG_LONG, PyLong_AsUnsignedLongLong(x))
-#endif
-            }
-        } else {
-#if CYTHON_USE_PYLONG_INTERNALS
-            const digit* digits = ((PyLongObject*)x)->ob_digit;
-            switch (Py_SIZE(x)) {
-                case  0: return (size_t) 0;
-                case -1: __PYX_VERIFY_RETURN_INT(size_t, sdigit, (sdigit) (-(sdigit)digits[0]))
-                case  1: __PYX_VERIFY_RETURN_INT(size_t,  digit, +digits[0])
-                case -2:
-                    if (8 * sizeof(size_t) - 1 > 1 * PyLong_SHIFT) {
-                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
-                            __PYX_VERIFY_RETURN_INT(size_t, long, -(long) (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if (8 * sizeof(size_t) - 1 > 2 * PyLong_SHIFT) {
-                            return (size_t) (((size_t)-1)*(((((size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0])));
-                        }
-                    }
-                    break;
-                case 2:
-                    if (8 * sizeof(size_t) > 1 * PyLong_SHIFT) {
-                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
-                            __PYX_VERIFY_RETURN_INT(size_t, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if (8 * sizeof(size_t) - 1 > 2 * PyLong_SHIFT) {
-                            return (size_t) ((((((size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0])));
-                        }
-                    }
-                    break;
-                case -3:
-                    if (8 * sizeof(size_t) - 1 > 2 * PyLong_SHIFT) {
-                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
-                            __PYX_VERIFY_RETURN_INT(size_t, long, -(long) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if (8 * sizeof(size_t) - 1 > 3 * PyLong_SHIFT) {
-                            return (size_t) (((size_t)-1)*(((((((size_t)digits[2]) << PyLong_SHIFT) | (size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0])));
-                        }
-                    }
-                    break;
-                case 3:
-                    if (8 * sizeof(size_t) > 2 * PyLong_SHIFT) {
-                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
-                            __PYX_VERIFY_RETURN_INT(size_t, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if (8 * sizeof(size_t) - 1 > 3 * PyLong_SHIFT) {
-                            return (size_t) ((((((((size_t)digits[2]) << PyLong_SHIFT) | (size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0])));
-                        }
-                    }
-                    break;
-                case -4:
-                    if (8 * sizeof(size_t) - 1 > 3 * PyLong_SHIFT) {
-                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
-                            __PYX_VERIFY_RETURN_INT(size_t, long, -(long) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if (8 * sizeof(size_t) - 1 > 4 * PyLong_SHIFT) {
-                            return (size_t) (((size_t)-1)*(((((((((size_t)digits[3]) << PyLong_SHIFT) | (size_t)digits[2]) << PyLong_SHIFT) | (size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0])));
-                        }
-                    }
-                    break;
-                case 4:
-                    if (8 * sizeof(size_t) > 3 * PyLong_SHIFT) {
-                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
-                            __PYX_VERIFY_RETURN_INT(size_t, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if (8 * sizeof(size_t) - 1 > 4 * PyLong_SHIFT) {
-                            return (size_t) ((((((((((size_t)digits[3]) << PyLong_SHIFT) | (size_t)digits[2]) << PyLong_SHIFT) | (size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0])));
-                        }
-                    }
-                    break;
-            }
-#endif
-            if (sizeof(size_t) <= sizeof(long)) {
-                __PYX_VERIFY_RETURN_INT_EXC(size_t, long, PyLong_AsLong(x))
-#ifdef HAVE_LONG_LONG
-            } else if (sizeof(size_t) <= sizeof(PY_LONG_LONG)) {
-                __PYX_VERIFY_RETURN_INT_EXC(size_t, PY_LONG_LONG, PyLong_AsLongLong(x))
-#endif
-            }
-        }
-        {
-#if CYTHON_COMPILING_IN_PYPY && !defined(_PyLong_AsByteArray)
-            PyErr_SetString(PyExc_RuntimeError,
-                            "_PyLong_AsByteArray() not available in PyPy, cannot convert large numbers");
-#else
-            size_t val;
-            PyObject *v = __Pyx_PyNumber_IntOrLong(x);
- #if PY_MAJOR_VERSION < 3
-            if (likely(v) && !PyLong_Check(v)) {
-                PyObject *tmp = v;
-                v = PyNumber_Long(tmp);
-                Py_DECREF(tmp);
-            }
- #endif
-            if (likely(v)) {
-                int one = 1; int is_little = (int)*(unsigned char *)&one;
-                unsigned char *bytes = (unsigned char *)&val;
-                int ret = _PyLong_AsByteArray((PyLongObject *)v,
-                                              bytes, sizeof(val),
-                                              is_little, !is_unsigned);
-                Py_DECREF(v);
-                if (likely(!ret))
-                    return val;
-            }
-#endif
-            return (size_t) -1;
-        }
-    } else {
-        size_t val;
-        PyObject *tmp = __Pyx_PyNumber_IntOrLong(x);
-        if (!tmp) return (size_t) -1;
-        val = __Pyx_PyInt_As_size_t(tmp);
-        Py_DECREF(tmp);
-        return val;
-    }
-raise_overflow:
-    PyErr_SetString(PyExc_OverflowError,
-        "value too large to convert to size_t");
-    return (size_t) -1;
-raise_neg_overflow:
-    PyErr_SetString(PyExc_OverflowError,
-        "can't convert negative value to size_t");
-    return (size_t) -1;
-}
-
-/* CIntToPy */
-  static CYTHON_INLINE PyObject* __Pyx_PyInt_From_long(long value) {
-#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
-#pragma GCC diagnostic push
-#pragma GCC diagnostic ignored "-Wconversion"
-#endif
-    const long neg_one = (long) -1, const_zero = (long) 0;
-#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
-#pragma GCC diagnostic pop
-#endif
-    const int is_unsigned = neg_one > const_zero;
-    if (is_unsigned) {
-        if (sizeof(long) < sizeof(long)) {
-            return PyInt_FromLong((long) value);
-        } else if (sizeof(long) <= sizeof(unsigned long)) {
-            return PyLong_FromUnsignedLong((unsigned long) value);
-#ifdef HAVE_LONG_LONG
-        } else if (sizeof(long) <= sizeof(unsigned PY_LONG_LONG)) {
-            return PyLong_FromUnsignedLongLong((unsigned PY_LONG_LONG) value);
-#endif
-        }
-    } else {
-        if (sizeof(long) <= sizeof(long)) {
-            return PyInt_FromLong((long) value);
-#ifdef HAVE_LONG_LONG
-        } else if (sizeof(long) <= sizeof(PY_LONG_LONG)) {
-            return PyLong_FromLongLong((PY_LONG_LONG) value);
-#endif
-        }
-    }
-    {
-        int one = 1; int little = (int)*(unsigned char *)&one;
-        unsigned char *bytes = (unsigned char *)&value;
-        return _PyLong_FromByteArray(bytes, sizeof(long),
-                                     little, !is_unsigned);
-    }
-}
-
-/* CIntFromPy */
-  static CYTHON_INLINE long __Pyx_PyInt_As_long(PyObject *x) {
-#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
-#pragma GCC diagnostic push
-#pragma GCC diagnostic ignored "-Wconversion"
-#endif
-    const long neg_one = (long) -1, const_zero = (long) 0;
-#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
-#pragma GCC diagnostic pop
-#endif
-    const int is_unsigned = neg_one > const_zero;
-#if PY_MAJOR_VERSION < 3
-    if (likely(PyInt_Check(x))) {
-        if (sizeof(long) < sizeof(long)) {
-            __PYX_VERIFY_RETURN_INT(long, long, PyInt_AS_LONG(x))
-        } else {
-            long val = PyInt_AS_LONG(x);
-            if (is_unsigned && unlikely(val < 0)) {
-                goto raise_neg_overflow;
-            }
-            return (long) val;
-        }
-    } else
-#endif
-    if (likely(PyLong_Check(x))) {
-        if (is_unsigned) {
-#if CYTHON_USE_PYLONG_INTERNALS
-            const digit* digits = ((PyLongObject*)x)->ob_digit;
-            switch (Py_SIZE(x)) {
-                case  0: return (long) 0;
-                case  1: __PYX_VERIFY_RETURN_INT(long, digit, digits[0])
-                case 2:
-                    if (8 * sizeof(long) > 1 * PyLong_SHIFT) {
-                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
-                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if (8 * sizeof(long) >= 2 * PyLong_SHIFT) {
-                            return (long) (((((long)digits[1]) << PyLong_SHIFT) | (long)digits[0]));
-                        }
-                    }
-                    break;
-                case 3:
-                    if (8 * sizeof(long) > 2 * PyLong_SHIFT) {
-                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
-                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if (8 * sizeof(long) >= 3 * PyLong_SHIFT) {
-                            return (long) (((((((long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0]));
-                        }
-                    }
-                    break;
-                case 4:
-                    if (8 * sizeof(long) > 3 * PyLong_SHIFT) {
-                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
-                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if (8 * sizeof(long) >= 4 * PyLong_SHIFT) {
-                            return (long) (((((((((long)digits[3]) << PyLong_SHIFT) | (long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0]));
-                        }
-                    }
-                    break;
-            }
-#endif
-#if CYTHON_COMPILING_IN_CPYTHON
-            if (unlikely(Py_SIZE(x) < 0)) {
-                goto raise_neg_overflow;
-            }
-#else
-            {
-                int result = PyObject_RichCompareBool(x, Py_False, Py_LT);
-                if (unlikely(result < 0))
-                    return (long) -1;
-                if (unlikely(result == 1))
-                    goto raise_neg_overflow;
-            }
-#endif
-            if (sizeof(long) <= sizeof(unsigned long)) {
-                __PYX_VERIFY_RETURN_INT_EXC(long, unsigned long, PyLong_AsUnsignedLong(x))
-#ifdef HAVE_LONG_LONG
-            } else if (sizeof(long) <= sizeof(unsigned PY_LONG_LONG)) {
-                __PYX_VERIFY_RETURN_INT_EXC(long, unsigned PY_LONG_LONG, PyLong_AsUnsignedLongLong(x))
-#endif
-            }
-        } else {
-#if CYTHON_USE_PYLONG_INTERNALS
-            const digit* digits = ((PyLongObject*)x)->ob_digit;
-            switch (Py_SIZE(x)) {
-                case  0: return (long) 0;
-                case -1: __PYX_VERIFY_RETURN_INT(long, sdigit, (sdigit) (-(sdigit)digits[0]))
-                case  1: __PYX_VERIFY_RETURN_INT(long,  digit, +digits[0])
-                case -2:
-                    if (8 * sizeof(long) - 1 > 1 * PyLong_SHIFT) {
-                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
-                            __PYX_VERIFY_RETURN_INT(long, long, -(long) (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if (8 * sizeof(long) - 1 > 2 * PyLong_SHIFT) {
-                            return (long) (((long)-1)*(((((long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
-                        }
-                    }
-                    break;
-                case 2:
-                    if (8 * sizeof(long) > 1 * PyLong_SHIFT) {
-                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
-                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if (8 * sizeof(long) - 1 > 2 * PyLong_SHIFT) {
-                            return (long) ((((((long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
-                        }
-                    }
-                    break;
-                case -3:
-                    if (8 * sizeof(long) - 1 > 2 * PyLong_SHIFT) {
-                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
-                            __PYX_VERIFY_RETURN_INT(long, long, -(long) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if (8 * sizeof(long) - 1 > 3 * PyLong_SHIFT) {
-                            return (long) (((long)-1)*(((((((long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
-                        }
-                    }
-                    break;
-                case 3:
-                    if (8 * sizeof(long) > 2 * PyLong_SHIFT) {
-                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
-                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if (8 * sizeof(long) - 1 > 3 * PyLong_SHIFT) {
-                            return (long) ((((((((long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
-                        }
-                    }
-                    break;
-                case -4:
-                    if (8 * sizeof(long) - 1 > 3 * PyLong_SHIFT) {
-                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
-                            __PYX_VERIFY_RETURN_INT(long, long, -(long) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if (8 * sizeof(long) - 1 > 4 * PyLong_SHIFT) {
-                            return (long) (((long)-1)*(((((((((long)digits[3]) << PyLong_SHIFT) | (long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
-                        }
-                    }
-                    break;
-                case 4:
-                    if (8 * sizeof(long) > 3 * PyLong_SHIFT) {
-                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
-                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if (8 * sizeof(long) - 1 > 4 * PyLong_SHIFT) {
-                            return (long) ((((((((((long)digits[3]) << PyLong_SHIFT) | (long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
-                        }
-                    }
-                    break;
-            }
-#endif
-            if (sizeof(long) <= sizeof(long)) {
-                __PYX_VERIFY_RETURN_INT_EXC(long, long, PyLong_AsLong(x))
-#ifdef HAVE_LONG_LONG
-            } else if (sizeof(long) <= sizeof(PY_LONG_LONG)) {
-                __PYX_VERIFY_RETURN_INT_EXC(long, PY_LONG_LONG, PyLong_AsLongLong(x))
-#endif
-            }
-        }
-        {
-#if CYTHON_COMPILING_IN_PYPY && !defined(_PyLong_AsByteArray)
-            PyErr_SetString(PyExc_RuntimeError,
-                            "_PyLong_AsByteArray() not available in PyPy, cannot convert large numbers");
-#else
-            long val;
-            PyObject *v = __Pyx_PyNumber_IntOrLong(x);
- #if PY_MAJOR_VERSION < 3
-            if (likely(v) && !PyLong_Check(v)) {
-                PyObject *tmp = v;
-                v = PyNumber_Long(tmp);
-                Py_DECREF(tmp);
-            }
- #endif
-            if (likely(v)) {
-                int one = 1; int is_little = (int)*(unsigned char *)&one;
-                unsigned char *bytes = (unsigned char *)&val;
-                int ret = _PyLong_AsByteArray((PyLongObject *)v,
-                                              bytes, sizeof(val),
-                                              is_little, !is_unsigned);
-                Py_DECREF(v);
-                if (likely(!ret))
-                    return val;
-            }
-#endif
-            return (long) -1;
-        }
-    } else {
-        long val;
-        PyObject *tmp = __Pyx_PyNumber_IntOrLong(x);
-        if (!tmp) return (long) -1;
-        val = __Pyx_PyInt_As_long(tmp);
-        Py_DECREF(tmp);
-        return val;
-    }
-raise_overflow:
-    PyErr_SetString(PyExc_OverflowError,
-        "value too large to convert to long");
-    return (long) -1;
-raise_neg_overflow:
-    PyErr_SetString(PyExc_OverflowError,
-        "can't convert negative value to long");
-    return (long) -1;
-}
-
-/* FastTypeChecks */
-  #if CYTHON_COMPILING_IN_CPYTHON
-static int __Pyx_InBases(PyTypeObject *a, PyTypeObject *b) {
-    while (a) {
-        a = a->tp_base;
-        if (a == b)
-            return 1;
-    }
-    return b == &PyBaseObject_Type;
-}
-static CYTHON_INLINE int __Pyx_IsSubtype(PyTypeObject *a, PyTypeObject *b) {
-    PyObject *mro;
-    if (a == b) return 1;
-    mro = a->tp_mro;
-    if (likely(mro)) {
-        Py_ssize_t i, n;
-        n = PyTuple_GET_SIZE(mro);
-        for (i = 0; i < n; i++) {
-            if (PyTuple_GET_ITEM(mro, i) == (PyObject *)b)
-                return 1;
-        }
-        return 0;
-    }
-    return __Pyx_InBases(a, b);
-}
-#if PY_MAJOR_VERSION == 2
-static int __Pyx_inner_PyErr_GivenExceptionMatches2(PyObject *err, PyObject* exc_type1, PyObject* exc_type2) {
-    PyObject *exception, *value, *tb;
-    int res;
-    __Pyx_PyThreadState_declare
-    __Pyx_PyThreadState_assign
-    __Pyx_ErrFetch(&exception, &value, &tb);
-    res = exc_type1 ? PyObject_IsSubclass(err, exc_type1) : 0;
-    if (unlikely(res == -1)) {
-        PyErr_WriteUnraisable(err);
-        res = 0;
-    }
-    if (!res) {
-        res = PyObject_IsSubclass(err, exc_type2);
-        if (unlikely(res == -1)) {
-            PyErr_WriteUnraisable(err);
-            res = 0;
-        }
-    }
-    __Pyx_ErrRestore(exception, value, tb);
-    return res;
-}
-#else
-static CYTHON_INLINE int __Pyx_inner_PyErr_GivenExceptionMatches2(PyObject *err, PyObject* exc_type1, PyObject *exc_type2) {
-    int res = exc_type1 ? __Pyx_IsSubtype((PyTypeObject*)err, (PyTypeObject*)exc_type1) : 0;
-    if (!res) {
-        res = __Pyx_IsSubtype((PyTypeObject*)err, (PyTypeObject*)exc_type2);
-    }
-    return res;
-}
-#endif
-static int __Pyx_PyErr_GivenExceptionMatchesTuple(PyObject *exc_type, PyObject *tuple) {
-    Py_ssize_t i, n;
-    assert(PyExceptionClass_Check(exc_type));
-    n = PyTuple_GET_SIZE(tuple);
-#if PY_MAJOR_VERSION >= 3
-    for (i=0; i<n; i++) {
-        if (exc_type == PyTuple_GET_ITEM(tuple, i)) return 1;
-    }
-#endif
-    for (i=0; i<n; i++) {
-        PyObject *t = PyTuple_GET_ITEM(tuple, i);
-        #if PY_MAJOR_VERSION < 3
-        if (likely(exc_type == t)) return 1;
-        #endif
-        if (likely(PyExceptionClass_Check(t))) {
-            if (__Pyx_inner_PyErr_GivenExceptionMatches2(exc_type, NULL, t)) return 1;
-        } else {
-        }
-    }
-    return 0;
-}
-static CYTHON_INLINE int __Pyx_PyErr_GivenExceptionMatches(PyObject *err, PyObject* exc_type) {
-    if (likely(err == exc_type)) return 1;
-    if (likely(PyExceptionClass_Check(err))) {
-        if (likely(PyExceptionClass_Check(exc_type))) {
-            return __Pyx_inner_PyErr_GivenExceptionMatches2(err, NULL, exc_type);
-        } else if (likely(PyTuple_Check(exc_type))) {
-            return __Pyx_PyErr_GivenExceptionMatchesTuple(err, exc_type);
-        } else {
-        }
-    }
-    return PyErr_GivenExceptionMatches(err, exc_type);
-}
-static CYTHON_INLINE int __Pyx_PyErr_GivenExceptionMatches2(PyObject *err, PyObject *exc_type1, PyObject *exc_type2) {
-    assert(PyExceptionClass_Check(exc_type1));
-    assert(PyExceptionClass_Check(exc_type2));
-    if (likely(err == exc_type1 || err == exc_type2)) return 1;
-    if (likely(PyExceptionClass_Check(err))) {
-        return __Pyx_inner_PyErr_GivenExceptionMatches2(err, exc_type1, exc_type2);
-    }
-    return (PyErr_GivenExceptionMatches(err, exc_type1) || PyErr_GivenExceptionMatches(err, exc_type2));
-}
-#endif
-
-/* CheckBinaryVersion */
-  static int __Pyx_check_binary_version(void) {
-    char ctversion[4], rtversion[4];
-    PyOS_snprintf(ctversion, 4, "%d.%d", PY_MAJOR_VERSION, PY_MINOR_VERSION);
-    PyOS_snprintf(rtversion, 4, "%s", Py_GetVersion());
-    if (ctversion[0] != rtversion[0] || ctversion[2] != rtversion[2]) {
-        char message[200];
-        PyOS_snprintf(message, sizeof(message),
-                      "compiletime version %s of module '%.100s' "
-                      "does not match runtime version %s",
-                      ctversion, __Pyx_MODULE_NAME, rtversion);
-        return PyErr_WarnEx(NULL, message, 1);
-    }
-    return 0;
-}
-
-/* InitStrings */
-  static int __Pyx_InitStrings(__Pyx_StringTabEntry *t) {
-    while (t->p) {
-        #if PY_MAJOR_VERSION < 3
-        if (t->is_unicode) {
-            *t->p = PyUnicode_DecodeUTF8(t->s, t->n - 1, NULL);
-        } else if (t->intern) {
-            *t->p = PyString_InternFromString(t->s);
-        } else {
-            *t->p = PyString_FromStringAndSize(t->s, t->n - 1);
-        }
-        #else
-        if (t->is_unicode | t->is_str) {
-            if (t->intern) {
-                *t->p = PyUnicode_InternFromString(t->s);
-            } else if (t->encoding) {
-                *t->p = PyUnicode_Decode(t->s, t->n - 1, t->encoding, NULL);
-            } else {
-                *t->p = PyUnicode_FromStringAndSize(t->s, t->n - 1);
-            }
-        } else {
-            *t->p = PyBytes_FromStringAndSize(t->s, t->n - 1);
-        }
-        #endif
-        if (!*t->p)
-            return -1;
-        if (PyObject_Hash(*t->p) == -1)
-            return -1;
-        ++t;
-    }
-    return 0;
-}
-
-static CYTHON_INLINE PyObject* __Pyx_PyUnicode_FromString(const char* c_str) {
-    return __Pyx_PyUnicode_FromStringAndSize(c_str, (Py_ssize_t)strlen(c_str));
-}
-static CYTHON_INLINE const char* __Pyx_PyObject_AsString(PyObject* o) {
-    Py_ssize_t ignore;
-    return __Pyx_PyObject_AsStringAndSize(o, &ignore);
-}
-#if __PYX_DEFAULT_STRING_ENCODING_IS_ASCII || __PYX_DEFAULT_STRING_ENCODING_IS_DEFAULT
-#if !CYTHON_PEP393_ENABLED
-static const char* __Pyx_PyUnicode_AsStringAndSize(PyObject* o, Py_ssize_t *length) {
-    char* defenc_c;
-    PyObject* defenc = _PyUnicode_AsDefaultEncodedString(o, NULL);
-    if (!defenc) return NULL;
-    defenc_c = PyBytes_AS_STRING(defenc);
-#if __PYX_DEFAULT_STRING_ENCODING_IS_ASCII
-    {
-        char* end = defenc_c + PyBytes_GET_SIZE(defenc);
-        char* c;
-        for (c = defenc_c; c < end; c++) {
-            if ((unsigned char) (*c) >= 128) {
-                PyUnicode_AsASCIIString(o);
-                return NULL;
-            }
-        }
-    }
-#endif
-    *length = PyBytes_GET_SIZE(defenc);
-    return defenc_c;
-}
-#else
-static CYTHON_INLINE const char* __Pyx_PyUnicode_AsStringAndSize(PyObject* o, Py_ssize_t *length) {
-    if (unlikely(__Pyx_PyUnicode_READY(o) == -1)) return NULL;
-#if __PYX_DEFAULT_STRING_ENCODING_IS_ASCII
-    if (likely(PyUnicode_IS_ASCII(o))) {
-        *length = PyUnicode_GET_LENGTH(o);
-        return PyUnicode_AsUTF8(o);
-    } else {
-        PyUnicode_AsASCIIString(o);
-        return NULL;
-    }
-#else
-    return PyUnicode_AsUTF8AndSize(o, length);
-#endif
-}
-#endif
-#endif
-static CYTHON_INLINE const char* __Pyx_PyObject_AsStringAndSize(PyObject* o, Py_ssize_t *length) {
-#if __PYX_DEFAULT_STRING_ENCODING_IS_ASCII || __PYX_DEFAULT_STRING_ENCODING_IS_DEFAULT
-    if (
-#if PY_MAJOR_VERSION < 3 && __PYX_DEFAULT_STRING_ENCODING_IS_ASCII
-            __Pyx_sys_getdefaultencoding_not_ascii &&
-#endif
-            PyUnicode_Check(o)) {
-        return __Pyx_PyUnicode_AsStringAndSize(o, length);
-    } else
-#endif
-#if (!CYTHON_COMPILING_IN_PYPY) || (defined(PyByteArray_AS_STRING) && defined(PyByteArray_GET_SIZE))
-    if (PyByteArray_Check(o)) {
-        *length = PyByteArray_GET_SIZE(o);
-        return PyByteArray_AS_STRING(o);
-    } else
-#endif
-    {
-        char* result;
-        int r = PyBytes_AsStringAndSize(o, &result, length);
-        if (unlikely(r < 0)) {
-            return NULL;
-        } else {
-            return result;
-        }
-    }
-}
-static CYTHON_INLINE int __Pyx_PyObject_IsTrue(PyObject* x) {
-   int is_true = x == Py_True;
-   if (is_true | (x == Py_False) | (x == Py_None)) return is_true;
-   else return PyObject_IsTrue(x);
-}
-static CYTHON_INLINE int __Pyx_PyObject_IsTrueAndDecref(PyObject* x) {
-    int retval;
-    if (unlikely(!x)) return -1;
-    retval = __Pyx_PyObject_IsTrue(x);
-    Py_DECREF(x);
-    return retval;
-}
-static PyObject* __Pyx_PyNumber_IntOrLongWrongResultType(PyObject* result, const char* type_name) {
-#if PY_MAJOR_VERSION >= 3
-    if (PyLong_Check(result)) {
-        if (PyErr_WarnFormat(PyExc_DeprecationWarning, 1,
-                "__int__ returned non-int (type %.200s).  "
-                "The ability to return an instance of a strict subclass of int "
-                "is deprecated, and may be removed in a future version of Python.",
-                Py_TYPE(result)->tp_name)) {
-            Py_DECREF(result);
-            return NULL;
-        }
-        return result;
-    }
-#endif
-    PyErr_Format(PyExc_TypeError,
-                 "__%.4s__ returned non-%.4s (type %.200s)",
-                 type_name, type_name, Py_TYPE(result)->tp_name);
-    Py_DECREF(result);
-    return NULL;
-}
-static CYTHON_INLINE PyObject* __Pyx_PyNumber_IntOrLong(PyObject* x) {
-#if CYTHON_USE_TYPE_SLOTS
-  PyNumberMethods *m;
-#endif
-  const char *name = NULL;
-  PyObject *res = NULL;
-#if PY_MAJOR_VERSION < 3
-  if (likely(PyInt_Check(x) || PyLong_Check(x)))
-#else
-  if (likely(PyLong_Check(x)))
-#endif
-    return __Pyx_NewRef(x);
-#if CYTHON_USE_TYPE_SLOTS
-  m = Py_TYPE(x)->tp_as_number;
-  #if PY_MAJOR_VERSION < 3
-  if (m && m->nb_int) {
-    name = "int";
-    res = m->nb_int(x);
-  }
-  else if (m && m->nb_long) {
-    name = "long";
-    res = m->nb_long(x);
-  }
-  #else
-  if (likely(m && m->nb_int)) {
-    name = "int";
-    res = m->nb_int(x);
-  }
-  #endif
-#else
-  if (!PyBytes_CheckExact(x) && !PyUnicode_CheckExact(x)) {
-    res = PyNumber_Int(x);
-  }
-#endif
-  if (likely(res)) {
-#if PY_MAJOR_VERSION < 3
-    if (unlikely(!PyInt_Check(res) && !PyLong_Check(res))) {
-#else
-    if (unlikely(!PyLong_CheckExact(res))) {
-#endif
-        return __Pyx_PyNumber_IntOrLongWrongResultType(res, name);
-    }
-  }
-  else if (!PyErr_Occurred()) {
-    PyErr_SetString(PyExc_TypeError,
-                    "an integer is required");
-  }
-  return res;
-}
-static CYTHON_INLINE Py_ssize_t __Pyx_PyIndex_AsSsize_t(PyObject* b) {
-  Py_ssize_t ival;
-  PyObject *x;
-#if PY_MAJOR_VERSION < 3
-  if (likely(PyInt_CheckExact(b))) {
-    if (sizeof(Py_ssize_t) >= sizeof(long))
-        return PyInt_AS_LONG(b);
-    else
-        return PyInt_AsSsize_t(b);
-  }
-#endif
-  if (likely(PyLong_CheckExact(b))) {
-    #if CYTHON_USE_PYLONG_INTERNALS
-    const digit* digits = ((PyLongObject*)b)->ob_digit;
-    const Py_ssize_t size = Py_SIZE(b);
-    if (likely(__Pyx_sst_abs(size) <= 1)) {
-        ival = likely(size) ? digits[0] : 0;
-        if (size == -1) ival = -ival;
-        return ival;
-    } else {
-      switch (size) {
-         case 2:
-           if (8 * sizeof(Py_ssize_t) > 2 * PyLong_SHIFT) {
-             return (Py_ssize_t) (((((size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
-           }
-           break;
-         case -2:
-           if (8 * sizeof(Py_ssize_t) > 2 * PyLong_SHIFT) {
-             return -(Py_ssize_t) (((((size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
-           }
-           break;
-         case 3:
-           if (8 * sizeof(Py_ssize_t) > 3 * PyLong_SHIFT) {
-             return (Py_ssize_t) (((((((size_t)digits[2]) << PyLong_SHIFT) | (size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
-           }
-           break;
-         case -3:
-           if (8 * sizeof(Py_ssize_t) > 3 * PyLong_SHIFT) {
-             return -(Py_ssize_t) (((((((size_t)digits[2]) << PyLong_SHIFT) | (size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
-           }
-           break;
-         case 4:
-           if (8 * sizeof(Py_ssize_t) > 4 * PyLong_SHIFT) {
-             return (Py_ssize_t) (((((((((size_t)digits[3]) << PyLong_SHIFT) | (size_t)digits[2]) << PyLong_SHIFT) | (size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
-           }
-           break;
-         case -4:
-           if (8 * sizeof(Py_ssize_t) > 4 * PyLong_SHIFT) {
-             return -(Py_ssize_t) (((((((((size_t)digits[3]) << PyLong_SHIFT) | (size_t)digits[2]) << PyLong_SHIFT) | (size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
-           }
-           break;
-      }
-    }
-    #endif
-    return PyLong_AsSsize_t(b);
-  }
-  x = PyNumber_Index(b);
-  if (!x) return -1;
-  ival = PyInt_AsSsize_t(x);
-  Py_DECREF(x);
-  return ival;
-}
-static CYTHON_INLINE Py_hash_t __Pyx_PyIndex_AsHash_t(PyObject* o) {
-  if (sizeof(Py_hash_t) == sizeof(Py_ssize_t)) {
-    return (Py_hash_t) __Pyx_PyIndex_AsSsize_t(o);
-#if PY_MAJOR_VERSION < 3
-  } else if (likely(PyInt_CheckExact(o))) {
-    return PyInt_AS_LONG(o);
-#endif
-  } else {
-    Py_ssize_t ival;
-    PyObject *x;
-    x = PyNumber_Index(o);
-    if (!x) return -1;
-    ival = PyInt_AsLong(x);
-    Py_DECREF(x);
-    return ival;
-  }
-}
-static CYTHON_INLINE PyObject * __Pyx_PyBool_FromLong(long b) {
-  return b ? __Pyx_NewRef(Py_True) : __Pyx_NewRef(Py_False);
-}
-static CYTHON_INLINE PyObject * __Pyx_PyInt_FromSize_t(size_t ival) {
-    return PyInt_FromSize_t(ival);
-}
-
-
-#endif /* Py_PYTHON_H */
@@ -17,7 +17,8 @@ from libc.stdio cimport printf
 from libcpp cimport bool
 import time,math
 import random
-from libc.stdlib cimport rand
+from libc.stdlib cimport rand, srand
+from libc.limits cimport INT_MAX
 cdef extern from "stdlib.h":
     int RAND_MAX
 
@@ -25,6 +26,24 @@ cimport graphsaint.cython_utils as cutils
 import graphsaint.cython_utils as cutils
 
 
+def set_seed(unsigned int seed):
+    """
+    Seed rand(), which all the samplers below draw from. Every sampling
+    process starts from the same state, so concurrent producers need their
+    own seeds to sample different subgraphs.
+    """
+    srand(seed)
+
+cdef object vec2npy_int(vector[int]& vec):
+    cdef cutils.array_wrapper_int wrapper = cutils.array_wrapper_int()
+    wrapper.set_data(vec)
+    return np.frombuffer(wrapper,dtype=np.int32)
+
+cdef object vec2npy_float(vector[float]& vec):
+    cdef cutils.array_wrapper_float wrapper = cutils.array_wrapper_float()
+    wrapper.set_data(vec)
+    return np.frombuffer(wrapper,dtype=np.float32)
+
 
 cdef class Sampler:
     cdef int num_proc,num_sample_per_proc
@@ -34,9 +53,10 @@ cdef class Sampler:
     cdef vector[vector[int]] node_sampled
     cdef vector[vector[int]] ret_indptr
     cdef vector[vector[int]] ret_indices
-    cdef vector[vector[int]] ret_indices_orig
     cdef vector[vector[float]] ret_data
     cdef vector[vector[int]] ret_edge_index
+    cdef vector[vector[int]] marker
+    cdef vector[int] marker_gen
 
     def __cinit__(self, np.ndarray[int,ndim=1,mode='c'] adj_indptr,
                         np.ndarray[int,ndim=1,mode='c'] adj_indices,
@@ -50,36 +70,54 @@ cdef class Sampler:
         self.node_sampled = vector[vector[int]](num_proc*num_sample_per_proc)
         self.ret_indptr = vector[vector[int]](num_proc*num_sample_per_proc)
         self.ret_indices = vector[vector[int]](num_proc*num_sample_per_proc)
-        self.ret_indices_orig = vector[vector[int]](num_proc*num_sample_per_proc)
         self.ret_data = vector[vector[float]](num_proc*num_sample_per_proc)
         self.ret_edge_index = vector[vector[int]](num_proc*num_sample_per_proc)
+        self.marker = vector[vector[int]](num_proc)
+        self.marker_gen = vector[int](num_proc,0)
 
     cdef void adj_extract(self, int p) nogil:
         """
-        Extract a subg adj matrix from the original training adj matrix
-        ret_indices_orig:   the indices vector corresponding to node id in original G.
+        Extract a subg adj matrix from the original training adj matrix.
+
+        Subgraph ids are looked up in a marker array that belongs to thread p and
+        is allocated once, instead of a fresh array over all training graph nodes
+        for every sample. Entry 2*v holds the generation in which node v was last
+        marked and 2*v+1 its subgraph id (same cache line); each subgraph starts
+        a new generation, which unmarks the previous one in O(1), so extracting
+        a subgraph costs time proportional to the subgraph only.
         """
         cdef int r = 0
         cdef int idx_g = 0
-        cdef int i, i_end, v, j
+        cdef int i, i_end, v, j, u
         cdef int num_v_orig, num_v_sub
         cdef int start_neigh, end_neigh
-        cdef vector[int] _arr_bit
+        cdef int gen
+        cdef int* mark
         cdef int cumsum
         num_v_orig = self.adj_indptr_vec.size()-1
+        if self.marker[p].size() == 0:
+            self.marker[p].assign(2*num_v_orig,0)
+        mark = self.marker[p].data()
         while r < self.num_sample_per_proc:
-            _arr_bit = vector[int](num_v_orig,-1)
+            if self.marker_gen[p] == INT_MAX:
+                # Generations wrapped around, clear the marks once
+                self.marker[p].assign(2*num_v_orig,0)
+                self.marker_gen[p] = 0
+                mark = self.marker[p].data()
+            self.marker_gen[p] = self.marker_gen[p] + 1
+            gen = self.marker_gen[p]
             idx_g = p*self.num_sample_per_proc+r
             num_v_sub = self.node_sampled[idx_g].size()
             self.ret_indptr[idx_g] = vector[int](num_v_sub+1,0)
             self.ret_indices[idx_g] = vector[int]()
-            self.ret_indices_orig[idx_g] = vector[int]()
             self.ret_data[idx_g] = vector[float]()
             self.ret_edge_index[idx_g]=vector[int]()
             i_end = num_v_sub
             i = 0
             while i < i_end:
-                _arr_bit[self.node_sampled[idx_g][i]] = i
+                v = self.node_sampled[idx_g][i]
+                mark[2*v] = gen
+                mark[2*v+1] = i
                 i = i + 1
             i = 0
             while i < i_end:
@@ -88,11 +126,11 @@ cdef class Sampler:
                 end_neigh = self.adj_indptr_vec[v+1]
                 j = start_neigh
                 while j < end_neigh:
-                    if _arr_bit[self.adj_indices_vec[j]] > -1:
-                        self.ret_indices[idx_g].push_back(_arr_bit[self.adj_indices_vec[j]])
-                        self.ret_indices_orig[idx_g].push_back(self.adj_indices_vec[j])
+                    u = self.adj_indices_vec[j]
+                    if mark[2*u] == gen:
+                        self.ret_indices[idx_g].push_back(mark[2*u+1])
                         self.ret_edge_index[idx_g].push_back(j)
-                        self.ret_indptr[idx_g][_arr_bit[v]+1] = self.ret_indptr[idx_g][_arr_bit[v]+1] + 1
+                        self.ret_indptr[idx_g][i+1] = self.ret_indptr[idx_g][i+1] + 1
                         self.ret_data[idx_g].push_back(1.)
                     j = j + 1
                 i = i + 1
@@ -109,6 +147,10 @@ cdef class Sampler:
         Convert the subgraph related data structures from C++ to python. So that cython
         can return them to the PyTorch trainer.
 
+        Each subgraph's vectors are moved into numpy arrays that own their buffers,
+        so nothing is copied and every returned array is contiguous. The vectors of
+        the sampler are left empty.
+
         Inputs:
             None
 
@@ -121,57 +163,12 @@ cdef class Sampler:
         l_subg_data = []
         l_subg_nodes = []
         l_subg_edge_index = []
-        offset_nodes = [0]
-        offset_indptr = [0]
-        offset_indices = [0]
-        offset_data = [0]
-        offset_edge_index = [0]
-        for r in range(num_subg):
-            offset_nodes.append(offset_nodes[r]+self.node_sampled[r].size())
-            offset_indptr.append(offset_indptr[r]+self.ret_indptr[r].size())
-            offset_indices.append(offset_indices[r]+self.ret_indices[r].size())
-            offset_data.append(offset_data[r]+self.ret_data[r].size())
-            offset_edge_index.append(offset_edge_index[r]+self.ret_edge_index[r].size())
-        cdef vector[int] ret_nodes_vec = vector[int]()
-        cdef vector[int] ret_indptr_vec = vector[int]()
-        cdef vector[int] ret_indices_vec = vector[int]()
-        cdef vector[int] ret_edge_index_vec = vector[int]()
-        cdef vector[float] ret_data_vec = vector[float]()
-        ret_nodes_vec.reserve(offset_nodes[num_subg])
-        ret_indptr_vec.reserve(offset_indptr[num_subg])
-        ret_indices_vec.reserve(offset_indices[num_subg])
-        ret_data_vec.reserve(offset_data[num_subg])
-        ret_edge_index_vec.reserve(offset_edge_index[num_subg])
-        for r in range(num_subg):
-            ret_nodes_vec.insert(ret_nodes_vec.end(),self.node_sampled[r].begin(),self.node_sampled[r].end())
-            ret_indptr_vec.insert(ret_indptr_vec.end(),self.ret_indptr[r].begin(),self.ret_indptr[r].end())
-            ret_indices_vec.insert(ret_indices_vec.end(),self.ret_indices[r].begin(),self.ret_indices[r].end())
-            ret_edge_index_vec.insert(ret_edge_index_vec.end(),self.ret_edge_index[r].begin(),self.ret_edge_index[r].end())
-            ret_data_vec.insert(ret_data_vec.end(),self.ret_data[r].begin(),self.ret_data[r].end())
-
-        cdef cutils.array_wrapper_int wint_indptr = cutils.array_wrapper_int()
-        cdef cutils.array_wrapper_int wint_indices = cutils.array_wrapper_int()
-        cdef cutils.array_wrapper_int wint_nodes = cutils.array_wrapper_int()
-        cdef cutils.array_wrapper_float wfloat_data = cutils.array_wrapper_float()
-        cdef cutils.array_wrapper_int wint_edge_index = cutils.array_wrapper_int()
-
-        wint_indptr.set_data(ret_indptr_vec)
-        ret_indptr_np = np.frombuffer(wint_indptr,dtype=np.int32)
-        wint_indices.set_data(ret_indices_vec)
-        ret_indices_np = np.frombuffer(wint_indices,dtype=np.int32)
-        wint_nodes.set_data(ret_nodes_vec)
-        ret_nodes_np = np.frombuffer(wint_nodes,dtype=np.int32)
-        wfloat_data.set_data(ret_data_vec)
-        ret_data_np = np.frombuffer(wfloat_data,dtype=np.float32)
-        wint_edge_index.set_data(ret_edge_index_vec)
-        ret_edge_index_np = np.frombuffer(wint_edge_index,dtype=np.int32)
-
         for r in range(num_subg):
-            l_subg_nodes.append(ret_nodes_np[offset_nodes[r]:offset_nodes[r+1]])
-            l_subg_indptr.append(ret_indptr_np[offset_indptr[r]:offset_indptr[r+1]])
-            l_subg_indices.append(ret_indices_np[offset_indices[r]:offset_indices[r+1]])
-            l_subg_data.append(ret_data_np[offset_data[r]:offset_data[r+1]])
-            l_subg_edge_index.append(ret_edge_index_np[offset_indices[r]:offset_indices[r+1]])
+            l_subg_nodes.append(vec2npy_int(self.node_sampled[r]))
+            l_subg_indptr.append(vec2npy_int(self.ret_indptr[r]))
+            l_subg_indices.append(vec2npy_int(self.ret_indices[r]))
+            l_subg_data.append(vec2npy_float(self.ret_data[r]))
+            l_subg_edge_index.append(vec2npy_int(self.ret_edge_index[r]))
 
         return l_subg_indptr,l_subg_indices,l_subg_data,l_subg_nodes,l_subg_edge_index
 
@@ -215,7 +212,6 @@ cdef class Sampler:
         self.node_sampled.swap(vector[vector[int]](_len))
         self.ret_indptr.swap(vector[vector[int]](_len))
         self.ret_indices.swap(vector[vector[int]](_len))
-        self.ret_indices_orig.swap(vector[vector[int]](_len))
         self.ret_data.swap(vector[vector[float]](_len))
         self.ret_edge_index.swap(vector[vector[int]](_len))
         return ret
@@ -27,7 +27,7 @@ cdef class array_wrapper_float:
         cdef Py_ssize_t itemsize = sizeof(self.vec[0])
         self.shape[0] = self.vec.size()
         self.strides[0] = sizeof(float)
-        buffer.buf = <char *>&(self.vec[0])
+        buffer.buf = <char *>self.vec.data()
         buffer.format = 'f'
         buffer.internal = NULL
         buffer.itemsize = itemsize
@@ -53,7 +53,7 @@ cdef class array_wrapper_int:
         cdef Py_ssize_t itemsize = sizeof(self.vec[0])
         self.shape[0] = self.vec.size()
         self.strides[0] = sizeof(int)
-        buffer.buf = <char *>&(self.vec[0])
+        buffer.buf = <char *>self.vec.data()
         buffer.format = 'i'
         buffer.internal = NULL
         buffer.itemsize = itemsize
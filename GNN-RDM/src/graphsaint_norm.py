@@ -0,0 +1,42 @@
+import numpy as np
+
+# GraphSAINT normalization estimation, kept free of the compiled graphsaint
+# extensions so bench_graphsaint_norm.py runs on a plain checkout
+
+def estimate_norm(adj_train, node_train, node_val, node_test, subgraph_nodes, subgraph_edge_index):
+    """
+    Estimate the GraphSAINT loss / aggregation normalization coefficients from
+    the pre-sampled subgraphs, with whole-array operations only.
+
+    Inputs:
+        adj_train           scipy CSR, adj matrix of the training graph
+        node_train          np array, training node IDs (same for node_val / node_test)
+        subgraph_nodes      list of np arrays, node IDs of each sampled subgraph
+        subgraph_edge_index list of np arrays, positions in adj_train.indices of the
+                            edges of each sampled subgraph
+
+    Outputs:
+        norm_loss           np array (float64), lambda_v for every node
+        norm_aggr           np array (float32), alpha_(u,v) for every edge of adj_train
+
+    C_v and C_(u,v), the number of subgraphs containing each node / edge, are a
+    bincount over all subgraphs at once (duplicates are counted). Edge (v,u)
+    is stored in row v, so alpha is C_v repeated over the CSR row of v divided
+    by C_(v,u), clipped to [0, 1e4]; edges never sampled (0 / 0) get 0.1.
+    """
+    num_subg = len(subgraph_nodes)
+    node_count = np.bincount(np.concatenate(subgraph_nodes), minlength=adj_train.shape[0]).astype(np.float64)
+    edge_count = np.bincount(np.concatenate(subgraph_edge_index), minlength=adj_train.size)
+    assert node_count[node_val].sum() + node_count[node_test].sum() == 0
+
+    row_count = np.repeat(node_count, np.diff(adj_train.indptr))
+    with np.errstate(divide='ignore', invalid='ignore'):
+        norm_aggr = np.clip(row_count / edge_count, 0, 1e4)
+    norm_aggr[np.isnan(norm_aggr)] = 0.1
+
+    norm_loss = node_count
+    norm_loss[norm_loss == 0] = 0.1
+    norm_loss[node_val] = 0
+    norm_loss[node_test] = 0
+    norm_loss[node_train] = num_subg / norm_loss[node_train] / node_train.size
+    return norm_loss, norm_aggr.astype(np.float32)
@@ -7,9 +7,13 @@ import os
 import yaml
 import scipy.sparse as sp
 import math
+import queue
+import time
 import torch
+import torch.multiprocessing as mp
 from graphsaint.norm_aggr import *
 from graphsaint.graph_samplers import *
+from graphsaint_norm import estimate_norm
 def adj_norm(adj, deg=None, sort_indices=True):
     """
     Normalize adj according to the method of rw normalization.
@@ -114,6 +118,239 @@ def load_data(prefix, normalize=True):
     # -------------------------
     return adj_full, adj_train, feats, class_map, role
 
+def make_graph_sampler(adj_train, node_train, train_phases):
+    """
+    The graph sampler of train_phases['sampler'] over the training graph and
+    its subgraph budget (number of nodes per subgraph).
+    """
+    method_sample = train_phases['sampler']
+    if method_sample == 'mrw':
+        if 'deg_clip' in train_phases:
+            _deg_clip = int(train_phases['deg_clip'])
+        else:
+            _deg_clip = 100000      # setting this to a large number so essentially there is no clipping in probability
+        size_subg_budget = train_phases['size_subgraph']
+        graph_sampler = mrw_sampling(
+            adj_train,
+            node_train,
+            size_subg_budget,
+            train_phases['size_frontier'],
+            _deg_clip,
+        )
+    elif method_sample == 'rw':
+        size_subg_budget = train_phases['num_root'] * train_phases['depth']
+        graph_sampler = rw_sampling(
+            adj_train,
+            node_train,
+            size_subg_budget,
+            int(train_phases['num_root']),
+            int(train_phases['depth']),
+        )
+    elif method_sample == 'edge':
+        size_subg_budget = train_phases['size_subg_edge'] * 2
+        graph_sampler = edge_sampling(
+            adj_train,
+            node_train,
+            train_phases['size_subg_edge'],
+        )
+    elif method_sample == 'node':
+        size_subg_budget = train_phases['size_subgraph']
+        graph_sampler = node_sampling(
+            adj_train,
+            node_train,
+            size_subg_budget,
+        )
+    elif method_sample == 'full_batch':
+        size_subg_budget = node_train.size
+        graph_sampler = full_batch_sampling(
+            adj_train,
+            node_train,
+            size_subg_budget,
+        )
+    elif method_sample == "vanilla_node_python":
+        size_subg_budget = train_phases["size_subgraph"]
+        graph_sampler = NodeSamplingVanillaPython(
+            adj_train,
+            node_train,
+            size_subg_budget,
+        )
+    else:
+        raise NotImplementedError
+    return graph_sampler, size_subg_budget
+
+def subgraph_tensors(indptr, indices, data, node_subgraph, edge_index, norm_aggr_train, deg_train, norm_loss_train):
+    """
+    Turn one sampled subgraph (the CSR arrays returned by par_sample) into what
+    the trainer consumes: the subgraph adj with the aggregation normalization
+    applied, as (indices, values) of its COO, and the loss normalization of
+    its nodes.
+
+    Outputs:
+        node_subgraph       np array, training graph IDs of the subgraph nodes
+        adj                 torch tensor, 2 x m indices of the subgraph adj
+        edge_w              torch tensor, m values of the subgraph adj
+        norm_loss           torch tensor, loss normalization coefficients
+    """
+    size_subgraph = len(node_subgraph)
+    adj = sp.csr_matrix((data, indices, indptr), shape=(size_subgraph, size_subgraph))
+    norm_aggr(adj.data, edge_index, norm_aggr_train, num_proc=4)#args_global.num_cpu_core)
+    # adj.data[:] = norm_aggr_train[edge_index][:]      # this line is interchangable with the above line
+    adj = adj_norm(adj, deg=deg_train[node_subgraph])
+    (adj, edge_w) = coo_scipy2stack(adj.tocoo())
+    return node_subgraph, adj, edge_w, norm_loss_train[node_subgraph]
+
+
+def _fill_slot(slots, slot, batch):
+    """
+    Write a subgraph from subgraph_tensors into slot `slot` of the shared
+    buffers. A subgraph larger than the slots is sent inline instead.
+    """
+    node_subgraph, adj, edge_w, norm_loss = batch
+    n, m = len(node_subgraph), adj.size(1)
+    slot_nodes, slot_adj, slot_edge_w, slot_norm_loss = slots
+    if n > slot_nodes.size(1) or m > slot_adj.size(2):
+        return slot, n, m, (node_subgraph, adj.numpy(), edge_w.numpy(), norm_loss.numpy())
+    slot_nodes[slot, :n] = torch.from_numpy(node_subgraph)
+    slot_adj[slot, :, :m] = adj
+    slot_edge_w[slot, :m] = edge_w
+    slot_norm_loss[slot, :n] = norm_loss
+    return slot, n, m, None
+
+
+def _sampling_producer(seed, adj_parts, node_train, train_phase, norm_aggr_train, deg_train,
+                        norm_loss_train, slots, free_slots, ready, stop, produced, busy_time):
+    """
+    Body of a SamplingService worker process: sample subgraphs with its own
+    graph sampler, normalize them and write them into free slots of the
+    shared buffers until stop is set.
+    """
+    cy.set_seed(seed)
+    np.random.seed(seed)
+    adj_indptr, adj_indices, adj_data, shape = adj_parts
+    adj_train = sp.csr_matrix((adj_data.numpy(), adj_indices.numpy(), adj_indptr.numpy()), shape=shape)
+    graph_sampler, _ = make_graph_sampler(adj_train, node_train, train_phase)
+    norm_aggr_train = norm_aggr_train.numpy()
+    deg_train = deg_train.numpy()
+
+    tstart = time.time()
+    while not stop.is_set():
+        for subgraph in zip(*graph_sampler.par_sample('train')):
+            batch = subgraph_tensors(*subgraph, norm_aggr_train, deg_train, norm_loss_train)
+            with busy_time.get_lock():
+                busy_time.value += time.time() - tstart
+
+            slot = None
+            while slot is None:
+                if stop.is_set():
+                    return
+                try:
+                    slot = free_slots.get(timeout=0.1)
+                except queue.Empty:
+                    pass
+            ready.put(_fill_slot(slots, slot, batch))
+            with produced.get_lock():
+                produced.value += 1
+            tstart = time.time()
+
+
+class SamplingService:
+    """
+    Background producers of training subgraphs for a Minibatch whose sampler
+    and normalization coefficients are set (set_sampler).
+
+    Each of num_workers processes runs its own graph sampler (seeded
+    differently), does the aggregation / adj normalization and COO
+    conversion, and writes (node ids, adj indices, adj values, norm_loss)
+    into one of `depth` slots of buffers in shared memory. Only the slot
+    number goes through a queue, and a slot is reused once the trainer has
+    taken its subgraph, so at most `depth` subgraphs are ready ahead. Slots
+    hold up to max_nodes nodes and max_edges edges, and larger subgraphs
+    are sent through the queue instead. The training graph and the
+    normalization arrays reach the workers in shared memory as well.
+
+    stats() reports the queue depth, the producers' throughput (subgraphs per
+    second of wall time and of producer busy time) and the time the consumer
+    stalled waiting for a subgraph.
+    """
+    def __init__(self, minibatch, train_phase, max_nodes, max_edges, num_workers=2, depth=8, seed=0):
+        ctx = mp.get_context("spawn")
+        self.slots = (torch.zeros(depth, max_nodes, dtype=torch.int32).share_memory_(),
+                        torch.zeros(depth, 2, max_edges, dtype=torch.int32).share_memory_(),
+                        torch.zeros(depth, max_edges, dtype=torch.float64).share_memory_(),
+                        torch.zeros(depth, max_nodes, dtype=torch.float32).share_memory_())
+        self.free_slots = ctx.Queue()
+        for slot in range(depth):
+            self.free_slots.put(slot)
+        self.ready = ctx.Queue()
+        self.stop = ctx.Event()
+        self.produced = ctx.Value('l', 0)
+        self.busy_time = ctx.Value('d', 0.)
+        self.consumed = 0
+        self.stall_time = 0.
+        self.depth_sum = 0
+        self.start_time = time.time()
+
+        adj_train = minibatch.adj_train
+        adj_parts = (torch.from_numpy(adj_train.indptr).share_memory_(),
+                        torch.from_numpy(adj_train.indices).share_memory_(),
+                        torch.from_numpy(adj_train.data).share_memory_(),
+                        adj_train.shape)
+        norm_aggr_train = torch.from_numpy(minibatch.norm_aggr_train).share_memory_()
+        deg_train = torch.from_numpy(minibatch.deg_train).share_memory_()
+        norm_loss_train = minibatch.norm_loss_train.share_memory_()
+
+        self.workers = []
+        for i in range(num_workers):
+            worker = ctx.Process(target=_sampling_producer, daemon=True,
+                                    args=(seed + i + 1, adj_parts, minibatch.node_train, train_phase,
+                                            norm_aggr_train, deg_train, norm_loss_train, self.slots,
+                                            self.free_slots, self.ready, self.stop, self.produced,
+                                            self.busy_time))
+            worker.start()
+            self.workers.append(worker)
+
+    def get(self):
+        """
+        The next subgraph as (node ids, adj indices, adj values, norm_loss)
+        tensors of its own, blocking until a producer has one ready.
+        """
+        self.depth_sum += self.ready.qsize()
+        tstart = time.time()
+        slot, n, m, inline = self.ready.get()
+        self.stall_time += time.time() - tstart
+        if inline is None:
+            slot_nodes, slot_adj, slot_edge_w, slot_norm_loss = self.slots
+            batch = (slot_nodes[slot, :n].clone(), slot_adj[slot, :, :m].clone(),
+                        slot_edge_w[slot, :m].clone(), slot_norm_loss[slot, :n].clone())
+        else:
+            batch = tuple(torch.from_numpy(x) for x in inline)
+        self.free_slots.put(slot)
+        self.consumed += 1
+        return batch
+
+    def stats(self):
+        produced = self.produced.value
+        elapsed = time.time() - self.start_time
+        return dict(queue_depth=self.ready.qsize(),
+                    mean_queue_depth=self.depth_sum / max(self.consumed, 1),
+                    produced=produced,
+                    producer_throughput=produced / elapsed,
+                    producer_busy_throughput=produced / max(self.busy_time.value, 1e-9) * len(self.workers),
+                    consumed=self.consumed,
+                    consumer_stall_time=self.stall_time)
+
+    def close(self):
+        self.stop.set()
+        # Keep the queue drained until the producers are gone so none blocks flushing it
+        while any(worker.is_alive() for worker in self.workers):
+            try:
+                self.ready.get(timeout=0.1)
+            except queue.Empty:
+                pass
+        for worker in self.workers:
+            worker.join()
+        self.workers = []
+
 class Minibatch:
     """
     Provides minibatches for the trainer or evaluator. This class is responsible for
@@ -171,6 +408,8 @@ class Minibatch:
         self.batch_num = -1
 
         self.method_sample = None
+        self.train_phase = None
+        self.producer = None
         self.subgraphs_remaining_indptr = []
         self.subgraphs_remaining_indices = []
         self.subgraphs_remaining_data = []
@@ -211,61 +450,8 @@ class Minibatch:
         self.subgraphs_remaining_nodes = []
         self.subgraphs_remaining_edge_index = []
         self.method_sample = train_phases['sampler']
-        if self.method_sample == 'mrw':
-            if 'deg_clip' in train_phases:
-                _deg_clip = int(train_phases['deg_clip'])
-            else:
-                _deg_clip = 100000      # setting this to a large number so essentially there is no clipping in probability
-            self.size_subg_budget = train_phases['size_subgraph']
-            self.graph_sampler = mrw_sampling(
-                self.adj_train,
-                self.node_train,
-                self.size_subg_budget,
-                train_phases['size_frontier'],
-                _deg_clip,
-            )
-        elif self.method_sample == 'rw':
-            self.size_subg_budget = train_phases['num_root'] * train_phases['depth']
-            self.graph_sampler = rw_sampling(
-                self.adj_train,
-                self.node_train,
-                self.size_subg_budget,
-                int(train_phases['num_root']),
-                int(train_phases['depth']),
-            )
-        elif self.method_sample == 'edge':
-            self.size_subg_budget = train_phases['size_subg_edge'] * 2
-            self.graph_sampler = edge_sampling(
-                self.adj_train,
-                self.node_train,
-                train_phases['size_subg_edge'],
-            )
-        elif self.method_sample == 'node':
-            self.size_subg_budget = train_phases['size_subgraph']
-            self.graph_sampler = node_sampling(
-                self.adj_train,
-                self.node_train,
-                self.size_subg_budget,
-            )
-        elif self.method_sample == 'full_batch':
-            self.size_subg_budget = self.node_train.size
-            self.graph_sampler = full_batch_sampling(
-                self.adj_train,
-                self.node_train,
-                self.size_subg_budget,
-            )
-        elif self.method_sample == "vanilla_node_python":
-            self.size_subg_budget = train_phases["size_subgraph"]
-            self.graph_sampler = NodeSamplingVanillaPython(
-                self.adj_train,
-                self.node_train,
-                self.size_subg_budget,
-            )
-        else:
-            raise NotImplementedError
-
-        self.norm_loss_train = np.zeros(self.adj_train.shape[0])
-        self.norm_aggr_train = np.zeros(self.adj_train.size).astype(np.float32)
+        self.train_phase = train_phases
+        self.graph_sampler, self.size_subg_budget = make_graph_sampler(self.adj_train, self.node_train, train_phases)
 
         # -------------------------------------------------------------
         # BELOW: estimation of loss / aggregation normalization factors
@@ -284,21 +470,14 @@ class Minibatch:
             if tot_sampled_nodes > self.sample_coverage * self.node_train.size:
                 break
         print()
-        num_subg = len(self.subgraphs_remaining_nodes)
-        for i in range(num_subg):
-            self.norm_aggr_train[self.subgraphs_remaining_edge_index[i]] += 1
-            self.norm_loss_train[self.subgraphs_remaining_nodes[i]] += 1
-        assert self.norm_loss_train[self.node_val].sum() + self.norm_loss_train[self.node_test].sum() == 0
-        for v in range(self.adj_train.shape[0]):
-            i_s = self.adj_train.indptr[v]
-            i_e = self.adj_train.indptr[v + 1]
-            val = np.clip(self.norm_loss_train[v] / self.norm_aggr_train[i_s : i_e], 0, 1e4)
-            val[np.isnan(val)] = 0.1
-            self.norm_aggr_train[i_s : i_e] = val
-        self.norm_loss_train[np.where(self.norm_loss_train==0)[0]] = 0.1
-        self.norm_loss_train[self.node_val] = 0
-        self.norm_loss_train[self.node_test] = 0
-        self.norm_loss_train[self.node_train] = num_subg / self.norm_loss_train[self.node_train] / self.node_train.size
+        self.norm_loss_train, self.norm_aggr_train = estimate_norm(
+            self.adj_train,
+            self.node_train,
+            self.node_val,
+            self.node_test,
+            self.subgraphs_remaining_nodes,
+            self.subgraphs_remaining_edge_index,
+        )
         self.norm_loss_train = torch.from_numpy(self.norm_loss_train.astype(np.float32))
         if self.use_cuda:
             self.norm_loss_train = self.norm_loss_train.cuda()
@@ -339,35 +518,57 @@ class Minibatch:
             adj = self.adj_full_norm
         else:
             assert mode == 'train'
+            if len(self.subgraphs_remaining_nodes) == 0 and self.producer is not None:
+                # Sampled and normalized ahead by the producers, see start_producers
+                node_ids, adj, edge_w, norm_loss = self.producer.get()
+                self.node_subgraph = node_ids.numpy()
+                self.size_subgraph = len(self.node_subgraph)
+                if self.use_cuda:
+                    adj = adj.cuda()
+                self.batch_num += 1
+                return self.node_subgraph, adj, edge_w, norm_loss
             if len(self.subgraphs_remaining_nodes) == 0:
                 self.par_graph_sample('train')
                 print()
 
-            self.node_subgraph = self.subgraphs_remaining_nodes.pop()
-            self.size_subgraph = len(self.node_subgraph)
-            adj = sp.csr_matrix(
-                (
-                    self.subgraphs_remaining_data.pop(),
-                    self.subgraphs_remaining_indices.pop(),
-                    self.subgraphs_remaining_indptr.pop()),
-                    shape=(self.size_subgraph,self.size_subgraph,
-                )
+            self.node_subgraph, adj, edge_w, norm_loss = subgraph_tensors(
+                self.subgraphs_remaining_indptr.pop(),
+                self.subgraphs_remaining_indices.pop(),
+                self.subgraphs_remaining_data.pop(),
+                self.subgraphs_remaining_nodes.pop(),
+                self.subgraphs_remaining_edge_index.pop(),
+                self.norm_aggr_train,
+                self.deg_train,
+                self.norm_loss_train,
             )
-            adj_edge_index = self.subgraphs_remaining_edge_index.pop()
+            self.size_subgraph = len(self.node_subgraph)
             #print("{} nodes, {} edges, {} degree".format(self.node_subgraph.size,adj.size,adj.size/self.node_subgraph.size))
-            norm_aggr(adj.data, adj_edge_index, self.norm_aggr_train, num_proc=4)#args_global.num_cpu_core)
-            # adj.data[:] = self.norm_aggr_train[adj_edge_index][:]      # this line is interchangable with the above line
-            adj = adj_norm(adj, deg=self.deg_train[self.node_subgraph])
-            #adj = _coo_scipy2torch(adj.tocoo())
-            (adj, edge_w) = coo_scipy2stack(adj.tocoo())
             if self.use_cuda:
                 adj = adj.cuda()
             self.batch_num += 1
+            return self.node_subgraph, adj, edge_w, norm_loss
         norm_loss = self.norm_loss_test if mode in ['val','test', 'valtest'] else self.norm_loss_train
         norm_loss = norm_loss[self.node_subgraph]
         return self.node_subgraph, adj, edge_w, norm_loss
 
 
+    def start_producers(self, num_workers, depth=8, seed=0):
+        """
+        Sample training subgraphs on num_workers background processes (see
+        SamplingService) once the pre-sampled ones are used up, instead of
+        refilling synchronously on the training thread. Call after set_sampler.
+        The shared slots are sized to twice the largest pre-sampled subgraph.
+        """
+        max_nodes = 2 * max([len(n) for n in self.subgraphs_remaining_nodes], default=self.size_subg_budget)
+        max_edges = 2 * max([len(e) for e in self.subgraphs_remaining_indices],
+                                default=self.size_subg_budget * max(int(self.deg_train.mean()), 1))
+        self.producer = SamplingService(self, self.train_phase, max_nodes, max_edges, num_workers, depth, seed)
+
+    def stop_producers(self):
+        if self.producer is not None:
+            self.producer.close()
+            self.producer = None
+
     def num_training_batches(self):
         return math.ceil(self.node_train.shape[0] / float(self.size_subg_budget))
 
@@ -0,0 +1,133 @@
+import itertools
+import json
+import os
+import os.path as osp
+
+# Per-layer (forward, backward) orders GCNFunc in gcn_distr_trauto.py can run:
+# "dd" is rejected there and backward "d" needs the x1 that only forward "s" keeps
+LAYER_ORDERS = ("ds", "sd", "ss")
+
+# Effective per-rank rates used when nothing has been calibrated
+DEFAULT_RATES = dict(bandwidth=10e9,     # bytes/s through all_to_all_single
+                     spmm=20e9,          # flop/s of spmm_gpu
+                     gemm=5e12)          # flop/s of torch.mm
+
+def layer_orders(mmorder):
+    # Same pairing as train(): layer 1 uses characters 0 and 3, layer 2 uses 1 and 2
+    return [mmorder[0] + mmorder[3], mmorder[1] + mmorder[2]]
+
+def candidate_orders():
+    orders = []
+    for first, second in itertools.product(LAYER_ORDERS, repeat=2):
+        orders.append(first[0] + second[0] + second[1] + first[1])
+    return orders
+
+def order_cost(mmorder, node_count, nnz, dims, size):
+    """
+    Words redistributed and SpMM/GEMM flops per rank for one training step
+    with `mmorder`, for a two-layer GCN with widths dims = [in, hidden, out].
+
+    The tiling is tracked exactly as GCNFunc and train() change it: a
+    redistribution of an N x f operand moves N * f * (P - 1) / P^2 words per
+    rank, each rank's SpMM covers all nnz for f / P columns and each GEMM
+    N / P rows.
+    """
+    words = 0.0
+    spmm_flops = 0.0
+    gemm_flops = 0.0
+
+    def redistribute(f):
+        nonlocal words
+        words += node_count * f * (size - 1) / size ** 2
+
+    orders = layer_orders(mmorder)
+    ht = mmorder[0] == 'd'
+    input_ht = []
+
+    for l, order in enumerate(orders):
+        fin, fout = dims[l], dims[l + 1]
+        input_ht.append(ht)
+        if order[0] == 'd':
+            if not ht:
+                redistribute(fin)
+            gemm_flops += 2 * node_count * fin * fout / size
+            redistribute(fout)
+            spmm_flops += 2 * nnz * fout / size
+            ht = False
+        else:
+            if ht:
+                redistribute(fin)
+            spmm_flops += 2 * nnz * fin / size
+            redistribute(fin)
+            gemm_flops += 2 * node_count * fin * fout / size
+            ht = True
+
+    # The loss is computed on row-tiled outputs
+    if not ht:
+        redistribute(dims[-1])
+        ht = True
+
+    for l in reversed(range(len(orders))):
+        order = orders[l]
+        fin, fout = dims[l], dims[l + 1]
+        if order[1] == 'd':
+            if not ht:
+                redistribute(fout)
+            gemm_flops += 2 * node_count * fout * fin / size
+            redistribute(fin)
+            spmm_flops += 2 * nnz * fin / size
+            ht = False
+        else:
+            if ht:
+                redistribute(fout)
+            spmm_flops += 2 * nnz * fout / size
+            redistribute(fout)
+            gemm_flops += 2 * node_count * fout * fin / size
+            if not input_ht[l]:
+                redistribute(fin)
+            ht = True
+        # grad_weight
+        gemm_flops += 2 * node_count * fin * fout / size
+
+        # grad_input goes back to the tiling of this layer's input
+        if ht != input_ht[l]:
+            redistribute(fin)
+            ht = not ht
+
+    return dict(words=words, spmm_flops=spmm_flops, gemm_flops=gemm_flops)
+
+def estimate_time(cost, rates=DEFAULT_RATES):
+    return cost["words"] * 4 / rates["bandwidth"] + \
+                cost["spmm_flops"] / rates["spmm"] + cost["gemm_flops"] / rates["gemm"]
+
+def rank_orders(node_count, nnz, dims, size, rates=DEFAULT_RATES):
+    """
+    All candidate orders with their modeled cost, cheapest first.
+    """
+    ranked = []
+    for mmorder in candidate_orders():
+        cost = order_cost(mmorder, node_count, nnz, dims, size)
+        ranked.append((estimate_time(cost, rates), mmorder, cost))
+    ranked.sort(key=lambda x: x[0])
+    return ranked
+
+def plan_key(graphname, node_count, nnz, dims, size):
+    return f"{graphname}-n{node_count}-e{nnz}-d{'x'.join(str(d) for d in dims)}-p{size}"
+
+def load_plan(path, key):
+    if not path or not osp.exists(path):
+        return None
+    with open(path) as f:
+        return json.load(f).get(key)
+
+def save_plan(path, key, plan):
+    plans = dict()
+    if osp.exists(path):
+        with open(path) as f:
+            plans = json.load(f)
+    plans[key] = plan
+    os.makedirs(osp.dirname(path) or ".", exist_ok=True)
+    tmp_path = f"{path}.tmp{os.getpid()}"
+    with open(tmp_path, "w") as f:
+        json.dump(plans, f, indent=1)
+    os.replace(tmp_path, path)
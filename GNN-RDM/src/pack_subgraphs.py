@@ -0,0 +1,51 @@
+import argparse
+import glob
+import os
+import sys
+import os.path as osp
+
+import torch
+
+# subgraph_loader is shared by the RDM, PyG and DGL scripts and lives in common/ at the top of the repo
+sys.path.insert(0, osp.join(osp.dirname(osp.abspath(__file__)), "..", "..", "common"))
+from subgraph_loader import SubgraphPack, pack_path, write_pack
+
+# Convert a directory of saved subgraphs (adj_<i>.pt, x_<i>.pt, ..., adj_full.pt, ...)
+# into a single packed file that the GraphSAINT load drivers memory-map instead.
+#
+#   python pack_subgraphs.py /scratch/.../asplos/flickr_subgs/
+#
+# writes /scratch/.../asplos/flickr_subgs.pack, which open_subgraphs picks up
+# in place of the directory.
+
+def saved_tensors(files):
+    for path in files:
+        name = osp.splitext(osp.basename(path))[0]
+        tensor = torch.load(path)
+        if not isinstance(tensor, torch.Tensor):
+            print(f"skipping {path}: {type(tensor).__name__} is not a tensor", flush=True)
+            continue
+        yield name, tensor
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("dir", type=str)
+    parser.add_argument("--out", type=str, default=None)
+    parser.add_argument("--verify", action="store_true")
+    args = parser.parse_args()
+
+    files = sorted(glob.glob(osp.join(args.dir, "*.pt")))
+    out = args.out if args.out is not None else pack_path(args.dir)
+    index = write_pack(out, saved_tensors(files))
+
+    in_bytes = sum(os.path.getsize(path) for path in files)
+    print(f"{len(index)} tensors from {len(files)} files, {in_bytes} bytes -> {out}, {os.path.getsize(out)} bytes")
+
+    if args.verify:
+        pack = SubgraphPack(out)
+        for name, tensor in saved_tensors(files):
+            assert torch.equal(pack.get(name), tensor), name
+        print("verified")
+
+if __name__ == "__main__":
+    main()
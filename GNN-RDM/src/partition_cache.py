@@ -0,0 +1,90 @@
+import hashlib
+import os
+import os.path as osp
+
+import torch
+
+
+def _tensor_bytes(tensor):
+    tensor = tensor.detach().cpu().contiguous()
+    return memoryview(tensor.view(-1).view(torch.uint8).numpy())
+
+def graph_digest(adj_matrix, inputs, *extra):
+    """
+    Content hash of the edge list and the input features plus anything else
+    the partition depends on (normalization, replication, ...). The shards
+    hold the local feature rows as well as the local adjacency blocks, so a
+    change to either gives a new digest and therefore a new cache directory,
+    and stale shards are never read.
+    """
+    h = hashlib.sha1()
+    h.update(repr((tuple(adj_matrix.size()), tuple(inputs.size()), str(inputs.dtype)) + extra).encode())
+    h.update(_tensor_bytes(adj_matrix))
+    h.update(_tensor_bytes(inputs))
+    return h.hexdigest()[:16]
+
+def shard_path(cache_dir, graphname, digest, size, scheme, rank):
+    return osp.join(cache_dir, f"{graphname}-{digest}", f"{scheme}-p{size}", f"rank{rank}.pt")
+
+# Sparse tensors are stored as their coalesced indices/values and dense tensors
+# are copied out of their (possibly much larger) base storage before saving.
+def _pack(obj):
+    if isinstance(obj, torch.Tensor):
+        if obj.is_sparse:
+            obj = obj.detach().coalesce().cpu()
+            return ("sparse", obj._indices().clone(), obj._values().clone(), tuple(obj.size()))
+        return ("dense", obj.detach().cpu().clone())
+    if isinstance(obj, (list, tuple)):
+        return (type(obj).__name__, [_pack(x) for x in obj])
+    return ("obj", obj)
+
+def _unpack(obj):
+    kind = obj[0]
+    if kind == "sparse":
+        _, indices, values, size = obj
+        return torch.sparse_coo_tensor(indices, values, size=size, requires_grad=False).coalesce()
+    if kind == "dense":
+        return obj[1]
+    if kind == "list":
+        return [_unpack(x) for x in obj[1]]
+    if kind == "tuple":
+        return tuple(_unpack(x) for x in obj[1])
+    return obj[1]
+
+def save_partition(path, parts):
+    os.makedirs(osp.dirname(path), exist_ok=True)
+    # Write to a temporary file first so a killed job never leaves a truncated shard behind
+    tmp_path = f"{path}.tmp{os.getpid()}"
+    torch.save(_pack(parts), tmp_path)
+    os.replace(tmp_path, path)
+
+def load_partition(path):
+    try:
+        parts = torch.load(path, mmap=True)
+    except TypeError:
+        # torch < 2.1 has no mmap loading
+        parts = torch.load(path)
+    return _unpack(parts)
+
+def cached_partition(cache_dir, graphname, scheme, rank, size, adj_matrix, inputs,
+                        partition_fn, *extra):
+    """
+    Return partition_fn() for this rank, reading it from the shard cache in
+    cache_dir when present and writing it there otherwise. The key is
+    (graph and feature content hash, world size, partition scheme, rank), so each rank
+    only ever loads its own shard. An empty cache_dir disables the cache.
+    """
+    if not cache_dir:
+        return partition_fn()
+
+    digest = graph_digest(adj_matrix, inputs, *extra)
+    path = shard_path(cache_dir, graphname, digest, size, scheme, rank)
+
+    if osp.exists(path):
+        print(f"rank: {rank} loading cached partition {path}", flush=True)
+        return load_partition(path)
+
+    parts = partition_fn()
+    save_partition(path, parts)
+    print(f"rank: {rank} saved partition to {path}", flush=True)
+    return parts
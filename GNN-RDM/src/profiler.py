@@ -0,0 +1,148 @@
+import json
+import math
+import os
+import os.path as osp
+import time
+from collections import defaultdict
+
+import torch
+import torch.distributed as dist
+
+
+class Profiler:
+    """
+    Low-overhead per-rank profiler shared by the drivers.
+
+    start() / stop() never synchronize with other ranks. On GPUs a region is
+    a pair of CUDA events recorded on the current stream, so it measures the
+    work the stream actually did (including waits on NCCL) without blocking
+    the host; events are only resolved in flush(), once per run. On CPU the
+    regions are wall-clock. Passing sync_group brings back the old behaviour
+    of a barrier around every region, for comparing with earlier numbers;
+    regions inside pipelined code pass sync=False to keep their overlap.
+
+    stop() books one duration under every name it is given, so a region can
+    count towards e.g. comm_time and bcast_comm_time at once. Per name the
+    profiler keeps the total, the number of regions and a log2 histogram of
+    region lengths in microseconds. count() adds to plain counters (words,
+    bytes). With trace=True every region is also kept as a Chrome trace
+    event, see write_trace().
+    """
+    def __init__(self, rank=0, device=None, enabled=True, trace=False, sync_group=None):
+        self.rank = rank
+        self.enabled = enabled
+        self.trace = trace
+        self.sync_group = sync_group
+        self.use_events = device is not None and torch.device(device).type == "cuda"
+        self.device = device
+        self.reset()
+
+    def reset(self):
+        self.totals = defaultdict(float)
+        self.counts = defaultdict(int)
+        self.hists = defaultdict(lambda: defaultdict(int))
+        self.counters = defaultdict(int)
+        self.events = []
+        self.pending = []
+        self.t0 = time.perf_counter()
+        self.base_event = None
+        if self.use_events:
+            self.base_event = torch.cuda.Event(enable_timing=True)
+            self.base_event.record(torch.cuda.current_stream(self.device))
+
+    def _now(self):
+        if self.use_events:
+            event = torch.cuda.Event(enable_timing=True)
+            event.record(torch.cuda.current_stream(self.device))
+            return event
+        return time.perf_counter()
+
+    def start(self, sync=True):
+        if not self.enabled:
+            return None
+        if sync and self.sync_group is not None:
+            dist.barrier(self.sync_group)
+        return self._now()
+
+    def stop(self, tstart, *names, sync=True):
+        if not self.enabled or tstart is None:
+            return
+        if sync and self.sync_group is not None:
+            dist.barrier(self.sync_group)
+        self.pending.append((tstart, self._now(), names))
+        if not self.use_events:
+            self.flush()
+
+    def count(self, name, value):
+        if self.enabled:
+            self.counters[name] += value
+
+    def _book(self, names, ts, dur):
+        for name in names:
+            self.totals[name] += dur
+            self.counts[name] += 1
+            self.hists[name][int(math.log2(max(dur * 1e6, 1.0)))] += 1
+        if self.trace:
+            self.events.append(dict(name=names[-1], cat=names[0], ph="X", pid=self.rank, tid=0,
+                                    ts=ts * 1e6, dur=dur * 1e6))
+
+    def flush(self):
+        """
+        Resolve all pending regions. With CUDA events this synchronizes the
+        recorded events, so call it outside the timed loop.
+        """
+        for tstart, tstop, names in self.pending:
+            if self.use_events:
+                tstop.synchronize()
+                ts = self.base_event.elapsed_time(tstart) / 1e3
+                dur = tstart.elapsed_time(tstop) / 1e3
+            else:
+                ts = tstart - self.t0
+                dur = tstop - tstart
+            self._book(names, ts, dur)
+        self.pending = []
+
+    def summary(self):
+        self.flush()
+        return dict(rank=self.rank,
+                    totals=dict(self.totals),
+                    counts=dict(self.counts),
+                    hists={name: dict(hist) for name, hist in self.hists.items()},
+                    counters=dict(self.counters))
+
+    def write_json(self, path):
+        os.makedirs(osp.dirname(path) or ".", exist_ok=True)
+        with open(path, "w") as f:
+            json.dump(self.summary(), f, indent=1)
+
+    def write_trace(self, path):
+        """
+        Chrome trace (chrome://tracing, Perfetto) of this rank's regions,
+        one process per rank so the per-rank files can be concatenated.
+        """
+        self.flush()
+        os.makedirs(osp.dirname(path) or ".", exist_ok=True)
+        with open(path, "w") as f:
+            json.dump(dict(traceEvents=self.events, displayTimeUnit="ms"), f)
+
+
+def aggregate(summary, group=None):
+    """
+    Gather every rank's summary with a single collective at the end of the
+    run and reduce each timer and counter to min/mean/max over ranks.
+    Returns (per-rank summaries, reduced stats); call it on all ranks.
+    """
+    summaries = [None] * dist.get_world_size(group)
+    dist.all_gather_object(summaries, summary, group=group)
+
+    stats = dict()
+    for key in ("totals", "counters"):
+        names = sorted(set(name for s in summaries for name in s[key]))
+        for name in names:
+            values = [s[key].get(name, 0) for s in summaries]
+            stats[name] = dict(min=min(values), mean=sum(values) / len(values), max=max(values))
+    return summaries, stats
+
+def print_stats(stats):
+    for name, s in stats.items():
+        print(f"{name}: min {s['min']} mean {s['mean']} max {s['max']}")
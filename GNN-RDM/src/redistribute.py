@@ -0,0 +1,80 @@
+import math
+
+import torch
+import torch.distributed as dist
+
+
+def alltoall_transpose(inputs, row_count, col_count, rank, size, dim, workspace, key=None, group=None,
+                        comm=None):
+    """
+    Switch an RDM operand between row tiling (dim=0 input, rank holds
+    row_count[rank] x F) and column tiling (dim=1 input, rank holds
+    N x col_count[rank]) with one all_to_all_single.
+
+    For dim=0 the columns are cut into size blocks of ceil(F / size) and
+    col_count is updated in place with their widths, as transpose_input has
+    always done; dim=1 relies on col_count from the matching dim=0 call.
+
+    Every peer's block is a contiguous slice of a flat buffer, so the split
+    sizes are just row_count[i] * col_count[j] words. Row-tiled output comes
+    straight out of the collective; column-to-row output needs one strided
+    copy to interleave the received column blocks. Staging buffers come from
+    workspace.get_flex. The output is taken from the workspace under `key`
+    when one is given (it then stays valid until the next call with the
+    same key and dim) and is freshly allocated otherwise.
+
+    With a reduced-precision `comm` (comm_precision.CommPrecision) the
+    flat blocks are cast on the way out and upcast on the way in, the
+    output is fp32 either way.
+    """
+    device = inputs.device
+    dtype = inputs.dtype
+
+    def out_buffer(shape):
+        if key is None:
+            return torch.empty(shape, dtype=dtype, device=device)
+        return workspace.get_flex((key, "transpose", dim), shape, device, dtype)
+
+    if dim == 0:
+        # Horizontal to Vertical
+        rows = inputs.size(0)
+        input_2d = torch.split(inputs, math.ceil(float(inputs.size(1)) / size), dim=1)
+        for i in range(size):
+            col_count[i] = input_2d[i].size(1)
+
+        send_splits = [rows * col_count[i] for i in range(size)]
+        recv_splits = [row_count[i] * col_count[rank] for i in range(size)]
+
+        send_buf = workspace.get_flex(("transpose", dim, "send"), (sum(send_splits),), device, dtype)
+        offset = 0
+        for i in range(size):
+            send_buf[offset:offset + send_splits[i]].view(rows, col_count[i]).copy_(input_2d[i])
+            offset += send_splits[i]
+
+        outputs = out_buffer((sum(row_count), col_count[rank]))
+        if comm is not None and comm.enabled:
+            comm.all_to_all(outputs.view(-1), send_buf, recv_splits, send_splits, group=group,
+                                key=("transpose", dim))
+        else:
+            dist.all_to_all_single(outputs.view(-1), send_buf, recv_splits, send_splits, group=group)
+        return outputs
+
+    elif dim == 1:
+        # Vertical to Horizontal
+        cols = inputs.size(1)
+        send_splits = [row_count[i] * cols for i in range(size)]
+        recv_splits = [row_count[rank] * col_count[i] for i in range(size)]
+
+        recv_buf = workspace.get_flex(("transpose", dim, "recv"), (sum(recv_splits),), device, dtype)
+        if comm is not None and comm.enabled:
+            comm.all_to_all(recv_buf, inputs.contiguous().view(-1), recv_splits, send_splits, group=group,
+                                key=("transpose", dim))
+        else:
+            dist.all_to_all_single(recv_buf, inputs.contiguous().view(-1), recv_splits, send_splits,
+                                    group=group)
+
+        recv_parts = torch.split(recv_buf, recv_splits)
+        outputs = out_buffer((row_count[rank], sum(col_count)))
+        torch.cat([recv_parts[i].view(row_count[rank], col_count[i]) for i in range(size)], dim=1,
+                    out=outputs)
+        return outputs
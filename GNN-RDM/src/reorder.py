@@ -0,0 +1,146 @@
+import math
+
+import torch
+
+from partition_utils import vtx_boundaries
+
+REORDER_TYPES = ("none", "rcm", "degree", "labelprop")
+
+# Node-level attributes of data that follow the vertices when they are renumbered
+NODE_ATTRS = ("y", "train_mask", "val_mask", "test_mask")
+
+
+def rcm_order(adj_matrix, node_count):
+    # Reverse Cuthill-McKee on the symmetrized pattern, bandwidth-reducing so blocks keep their edges
+    import numpy as np
+    import scipy.sparse as sp
+    from scipy.sparse.csgraph import reverse_cuthill_mckee
+
+    row, col = adj_matrix.numpy()
+    graph = sp.csr_matrix((np.ones(row.shape[0], dtype=np.int8), (row, col)), shape=(node_count, node_count))
+    return torch.from_numpy(reverse_cuthill_mckee(graph, symmetric_mode=False).astype(np.int64))
+
+def degree_order(adj_matrix, node_count):
+    deg = torch.bincount(adj_matrix[0], minlength=node_count)
+    return torch.argsort(-deg, stable=True)
+
+def labelprop_order(adj_matrix, node_count, iterations=20, seed=0):
+    """
+    Group vertices by a few rounds of label propagation: every vertex takes
+    the most frequent label among its neighbors (ties to the larger label).
+    Half of the vertices, chosen at random, update in each round so that
+    synchronous updates do not oscillate. Vertices with the same final label
+    get consecutive ids, in their original order.
+    """
+    row, col = adj_matrix
+    labels = torch.arange(node_count)
+    has_edges = torch.bincount(row, minlength=node_count) > 0
+    g = torch.Generator().manual_seed(seed)
+
+    for _ in range(iterations):
+        # One (vertex, neighbor label) pair per key, counted with a single unique
+        keys, counts = torch.unique(row * node_count + labels[col], return_counts=True)
+        vtx = keys // node_count
+        lab = keys % node_count
+
+        # Sort by vertex then count, the last entry of each vertex is its most frequent label
+        order = torch.argsort(vtx * (int(counts.max()) + 1) + counts, stable=True)
+        last = torch.cumsum(torch.bincount(vtx, minlength=node_count), dim=0) - 1
+        best = labels.clone()
+        best[has_edges] = lab[order][last[has_edges]]
+
+        update = torch.rand(node_count, generator=g) < 0.5
+        labels = torch.where(update, best, labels)
+
+    return torch.argsort(labels, stable=True)
+
+def vertex_order(adj_matrix, node_count, method):
+    """
+    New vertex order as a permutation perm with perm[new_id] = old_id.
+    adj_matrix is the 2 x nnz edge list.
+    """
+    if method not in REORDER_TYPES:
+        raise ValueError(f"unknown reordering {method}, expected one of {REORDER_TYPES}")
+    adj_matrix = adj_matrix.cpu()
+    if method == "rcm":
+        return rcm_order(adj_matrix, node_count)
+    elif method == "degree":
+        return degree_order(adj_matrix, node_count)
+    elif method == "labelprop":
+        return labelprop_order(adj_matrix, node_count)
+    return torch.arange(node_count)
+
+def inverse_order(perm):
+    inv = torch.empty_like(perm)
+    inv[perm] = torch.arange(perm.size(0), device=perm.device)
+    return inv
+
+def restore_order(outputs, perm):
+    # Rows of outputs are in the new order, put each back at its original vertex id
+    if perm is None:
+        return outputs
+    restored = torch.empty_like(outputs)
+    restored[perm.to(outputs.device)] = outputs
+    return restored
+
+def cut_stats(adj_matrix, node_count, size):
+    """
+    Per-partition edge counts for the contiguous row blocks of
+    ceil(node_count / size) vertices the drivers cut: nnz in the block,
+    cut_nnz whose column lies in another block, and remote_vtx, the number
+    of distinct vertices of other blocks the block reads (rows that have to
+    be received in a sparsity-aware exchange).
+    """
+    adj_matrix = adj_matrix.cpu()
+    n_per_proc = math.ceil(float(node_count) / size)
+    bounds = torch.tensor(vtx_boundaries(node_count, n_per_proc), dtype=adj_matrix.dtype)
+    row_part = torch.bucketize(adj_matrix[0], bounds[1:-1], right=True)
+    col_part = torch.bucketize(adj_matrix[1], bounds[1:-1], right=True)
+    cut = row_part != col_part
+
+    parts = bounds.size(0) - 1
+    nnz = torch.bincount(row_part, minlength=parts)
+    cut_nnz = torch.bincount(row_part[cut], minlength=parts)
+    remote = torch.unique(row_part[cut] * node_count + adj_matrix[1][cut])
+    remote_vtx = torch.bincount(remote // node_count, minlength=parts)
+
+    return [dict(nnz=int(nnz[i]), cut_nnz=int(cut_nnz[i]), remote_vtx=int(remote_vtx[i]))
+                for i in range(parts)]
+
+def print_cut_stats(stats, label):
+    for i, s in enumerate(stats):
+        print(f"{label} part: {i} nnz: {s['nnz']} cut_nnz: {s['cut_nnz']} remote_vtx: {s['remote_vtx']}")
+    nnz = sum(s["nnz"] for s in stats)
+    cut_nnz = sum(s["cut_nnz"] for s in stats)
+    print(f"{label} cut_nnz: {cut_nnz} / {nnz} remote_vtx: {sum(s['remote_vtx'] for s in stats)}", flush=True)
+
+def reorder_graph(method, adj_matrix, inputs, data, size, rank=0):
+    """
+    Renumber the vertices with `method` before partitioning: the edge list,
+    the feature rows and the node attributes of data (labels, masks) are
+    permuted consistently. Returns the new edge list and features and perm
+    (perm[new_id] = old_id, None for "none"), which restore_order uses to put
+    outputs back in the original order. Rank 0 prints the cut statistics of
+    the row blocks before and after.
+    """
+    if method == "none":
+        return adj_matrix, inputs, None
+
+    node_count = inputs.size(0)
+    if rank == 0:
+        print_cut_stats(cut_stats(adj_matrix, node_count, size), "reorder: none")
+
+    perm = vertex_order(adj_matrix, node_count, method)
+    inv = inverse_order(perm)
+
+    adj_matrix = inv.to(adj_matrix.device)[adj_matrix]
+    requires_grad = inputs.requires_grad
+    inputs = inputs.detach()[perm.to(inputs.device)].requires_grad_(requires_grad)
+    for name in NODE_ATTRS:
+        attr = getattr(data, name, None)
+        if isinstance(attr, torch.Tensor) and attr.size(0) == node_count:
+            setattr(data, name, attr[perm.to(attr.device)])
+
+    if rank == 0:
+        print_cut_stats(cut_stats(adj_matrix, node_count, size), f"reorder: {method}")
+    return adj_matrix, inputs, perm
@@ -0,0 +1,139 @@
+import argparse
+
+import torch
+import torch.nn.functional as F
+from torch.nn import Parameter
+
+from comm_precision import CommPrecision, COMM_DTYPES
+
+# Single-process check of the comm dtypes against fp32 for the 1D algorithm.
+# Every block of H (forward) and of the gradient (backward) that broad_func
+# would receive from another rank goes through the same pack/unpack as on the
+# wire, the weight gradients through the all-reduce's round trip. Reports the
+# per-layer relative error of the first step and the accuracy after training.
+
+def synthetic_graph(node_count, degree, seed):
+    g = torch.Generator().manual_seed(seed)
+    edge_count = node_count * degree // 2
+    src = torch.randint(node_count, (edge_count,), generator=g)
+    dst = torch.randint(node_count, (edge_count,), generator=g)
+    loops = torch.arange(node_count)
+    row = torch.cat((src, dst, loops))
+    col = torch.cat((dst, src, loops))
+    adj = torch.sparse_coo_tensor(torch.stack((row, col)), torch.ones(row.size(0)),
+                                    size=(node_count, node_count)).coalesce()
+    # Symmetric normalization, as --normalization True --normtype sym
+    deg = torch.sparse.sum(adj, dim=1).to_dense()
+    indices = adj._indices()
+    values = adj._values() * deg[indices[0]].rsqrt() * deg[indices[1]].rsqrt()
+    return torch.sparse_coo_tensor(indices, values, size=adj.size()).coalesce()
+
+def split_local(adj, parts):
+    # Entries whose column lies in the row's own block are never communicated
+    n_per_proc = -(-adj.size(0) // parts)
+    indices = adj._indices()
+    local = (indices[0] // n_per_proc) == (indices[1] // n_per_proc)
+    def sub(mask):
+        return torch.sparse_coo_tensor(indices[:, mask], adj._values()[mask], size=adj.size()).coalesce()
+    return sub(local), sub(~local), n_per_proc
+
+def roundtrip(comm, x, n_per_proc):
+    if not comm.enabled:
+        return x
+    out = torch.empty_like(x)
+    for blk, blk_out in zip(torch.split(x, n_per_proc), torch.split(out, n_per_proc)):
+        comm.unpack(comm.pack(blk), blk_out)
+    return out
+
+class WireBlocks(torch.autograd.Function):
+    # Identity whose value and gradient are both seen through the wire format
+    @staticmethod
+    def forward(ctx, x, comm, n_per_proc):
+        ctx.comm = comm
+        ctx.n_per_proc = n_per_proc
+        return roundtrip(comm, x, n_per_proc)
+
+    @staticmethod
+    def backward(ctx, grad_output):
+        return roundtrip(ctx.comm, grad_output.contiguous(), ctx.n_per_proc), None, None
+
+def forward(adj_local, adj_remote, inputs, weights, comm, n_per_proc):
+    layers = []
+    h = inputs
+    for l, weight in enumerate(weights):
+        ah = torch.sparse.mm(adj_local, h) + torch.sparse.mm(adj_remote, WireBlocks.apply(h, comm, n_per_proc))
+        z = torch.mm(ah, weight)
+        h = F.log_softmax(z, dim=1) if l == len(weights) - 1 else F.relu(z)
+        layers.append(h)
+    return layers
+
+def train(args, comm, graph, inputs, labels, train_mask, test_mask):
+    adj_local, adj_remote, n_per_proc = graph
+    torch.manual_seed(0)
+    dims = [inputs.size(1), args.midlayer, args.classes]
+    weights = [Parameter(torch.rand(dims[l], dims[l + 1]) / dims[l] ** 0.5) for l in range(len(dims) - 1)]
+    optimizer = torch.optim.Adam(weights, lr=0.01)
+
+    first_step = None
+    for epoch in range(args.epochs):
+        optimizer.zero_grad()
+        layers = forward(adj_local, adj_remote, inputs, weights, comm, n_per_proc)
+        loss = F.nll_loss(layers[-1][train_mask], labels[train_mask])
+        loss.backward()
+        for weight in weights:
+            weight.grad = roundtrip(comm, weight.grad, weight.grad.size(0))
+        if first_step is None:
+            first_step = ([h.detach() for h in layers], [w.grad.clone() for w in weights])
+        optimizer.step()
+
+    with torch.no_grad():
+        pred = forward(adj_local, adj_remote, inputs, weights, comm, n_per_proc)[-1].max(1)[1]
+    accs = [pred[mask].eq(labels[mask]).float().mean().item() for mask in (train_mask, test_mask)]
+    return first_step, accs
+
+def rel_error(x, ref):
+    return ((x - ref).norm() / ref.norm().clamp_min(1e-30)).item()
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--nodes", type=int, default=4096)
+    parser.add_argument("--degree", type=int, default=16)
+    parser.add_argument("--features", type=int, default=128)
+    parser.add_argument("--midlayer", type=int, default=64)
+    parser.add_argument("--classes", type=int, default=16)
+    parser.add_argument("--parts", type=int, default=4)
+    parser.add_argument("--epochs", type=int, default=100)
+    # Feature magnitude, large values show where unscaled fp16 overflows
+    parser.add_argument("--featscale", type=float, default=1.0)
+    parser.add_argument("--commdtypes", type=str, default="fp16,bf16")
+    args = parser.parse_args()
+    print(args)
+
+    adj = synthetic_graph(args.nodes, args.degree, seed=0)
+    graph = split_local(adj, args.parts)
+
+    g = torch.Generator().manual_seed(1)
+    inputs = torch.randn(args.nodes, args.features, generator=g) * args.featscale
+    # Labels of a planted one-layer GCN, so the model has something to learn
+    planted = torch.randn(args.features, args.classes, generator=g)
+    labels = torch.sparse.mm(adj, inputs).mm(planted).max(1)[1]
+    train_mask = torch.rand(args.nodes, generator=g) < 0.7
+    test_mask = ~train_mask
+
+    (ref_layers, ref_grads), ref_accs = train(args, CommPrecision(), graph, inputs, labels, train_mask, test_mask)
+    print(f"fp32 train_acc: {ref_accs[0]:.4f} test_acc: {ref_accs[1]:.4f}")
+
+    for name in args.commdtypes.split(","):
+        if name not in COMM_DTYPES:
+            raise ValueError(f"unknown comm dtype {name}")
+        for scale in (False, True):
+            comm = CommPrecision(name, scale)
+            (layers, grads), accs = train(args, comm, graph, inputs, labels, train_mask, test_mask)
+            errs = [f"{rel_error(h, r):.2e}" for h, r in zip(layers, ref_layers)]
+            grad_errs = [f"{rel_error(w, r):.2e}" for w, r in zip(grads, ref_grads)]
+            print(f"{comm} layer_rel_err: {errs} weight_grad_rel_err: {grad_errs} "
+                    f"train_acc: {accs[0]:.4f} test_acc: {accs[1]:.4f} "
+                    f"test_acc_delta: {accs[1] - ref_accs[1]:+.4f}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,87 @@
+import torch
+
+
+class Workspace:
+    """
+    Pool of persistent dense buffers for the distributed kernels.
+
+    Buffers are keyed by the caller's (layer, phase, peer) tuple together with
+    shape, dtype and device, so every key always gets back the same storage
+    and a block with a different shape (e.g. the last, larger partition) gets
+    its own buffer. Only buffers that are accumulated into need zeroing, which
+    callers request with zero=True; receive buffers are overwritten in full by
+    the collective and are handed out as-is.
+
+    A buffer handed out for a key is only valid until the next get() with the
+    same key, so keys have to distinguish everything that is alive at once.
+
+    get_flex() is for buffers whose shape changes from call to call (e.g. the
+    per-minibatch redistributions of the GraphSAINT drivers): it keeps one
+    flat buffer per key, grows it when needed and returns a view of the
+    requested shape, so the pool does not grow with every new shape.
+    """
+    def __init__(self):
+        self.buffers = dict()
+        self.flex_buffers = dict()
+        self.alloc_bytes = 0
+        self.reused_bytes = 0
+        self.resident_bytes = 0
+        self.peak = 0
+
+    def _alloc(self, shape, device, dtype, zero):
+        if zero:
+            buf = torch.zeros(shape, dtype=dtype, device=device)
+        else:
+            buf = torch.empty(shape, dtype=dtype, device=device)
+        nbytes = buf.numel() * buf.element_size()
+        self.alloc_bytes += nbytes
+        self.resident_bytes += nbytes
+        self.peak = max(self.peak, self.resident_bytes)
+        return buf
+
+    def get(self, key, shape, device, dtype=torch.float, zero=False):
+        shape = tuple(shape)
+        full_key = (key, shape, dtype, str(device))
+        buf = self.buffers.get(full_key)
+        if buf is None:
+            buf = self._alloc(shape, device, dtype, zero)
+            self.buffers[full_key] = buf
+        else:
+            self.reused_bytes += buf.numel() * buf.element_size()
+            if zero:
+                buf.zero_()
+        return buf
+
+    def get_flex(self, key, shape, device, dtype=torch.float, zero=False):
+        shape = tuple(shape)
+        numel = 1
+        for s in shape:
+            numel *= s
+        full_key = (key, dtype, str(device))
+        buf = self.flex_buffers.get(full_key)
+        if buf is None or buf.numel() < numel:
+            if buf is not None:
+                self.resident_bytes -= buf.numel() * buf.element_size()
+            # Grow geometrically so slowly increasing sizes don't reallocate every call
+            capacity = numel if buf is None else max(numel, 2 * buf.numel())
+            buf = self._alloc((capacity,), device, dtype, False)
+            self.flex_buffers[full_key] = buf
+        else:
+            self.reused_bytes += numel * buf.element_size()
+        view = buf[:numel].view(shape)
+        if zero:
+            view.zero_()
+        return view
+
+    def clear(self):
+        self.buffers.clear()
+        self.flex_buffers.clear()
+        self.resident_bytes = 0
+
+    def peak_bytes(self):
+        return self.peak
+
+    def report(self, rank):
+        print(f"rank: {rank} workspace_buffers: {len(self.buffers) + len(self.flex_buffers)}")
+        print(f"rank: {rank} workspace_peak_bytes: {self.peak_bytes()}")
+        print(f"rank: {rank} workspace_reused_bytes: {self.reused_bytes}")
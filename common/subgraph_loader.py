@@ -0,0 +1,265 @@
+import json
+import os.path as osp
+import random
+import struct
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import torch
+
+# Per-subgraph files written by the GraphSAINT save scripts, <name>_<i>.pt in one directory
+SUBGRAPH_FILES = ("adj", "x", "y", "train_mask", "edge_weight")
+
+# Node-level tensors that the save scripts now leave out of the subgraphs. A
+# subgraph stores nid_<i>, the global ids of its nodes, and these are gathered
+# from the shared <name>_full tensors instead (see FeatureStore)
+STORE_FILES = ("x", "y")
+
+
+# Packed dataset: PACK_MAGIC, version, index offset and index length, then
+# the raw tensor bytes, each starting on a PACK_ALIGN boundary, then the
+# index, a JSON dict of name -> {dtype, shape, offset, nbytes}
+PACK_MAGIC = b"SUBGPACK"
+PACK_VERSION = 1
+PACK_ALIGN = 64
+_PACK_HEADER = struct.Struct("<8sQQQ")
+
+
+def pack_path(pref):
+    # The pack of the directory <...>/flickr_subgs/ is <...>/flickr_subgs.pack
+    return pref.rstrip("/") + ".pack"
+
+
+def write_pack(path, tensors):
+    """
+    Write the (name, tensor) pairs of `tensors` to the packed file `path`.
+    Tensors are written one at a time, so `tensors` can be a generator that
+    loads them lazily.
+    """
+    index = dict()
+    with open(path, "wb") as f:
+        f.write(b"\0" * _PACK_HEADER.size)
+        for name, tensor in tensors:
+            tensor = tensor.detach().cpu().contiguous()
+            f.write(b"\0" * (-f.tell() % PACK_ALIGN))
+            raw = tensor.view(-1).view(torch.uint8).numpy()
+            index[name] = dict(dtype=str(tensor.dtype).replace("torch.", ""), shape=list(tensor.shape),
+                                offset=f.tell(), nbytes=raw.nbytes)
+            f.write(memoryview(raw))
+
+        index_offset = f.tell()
+        index_bytes = json.dumps(index).encode()
+        f.write(index_bytes)
+        f.seek(0)
+        f.write(_PACK_HEADER.pack(PACK_MAGIC, PACK_VERSION, index_offset, len(index_bytes)))
+    return index
+
+
+class SubgraphPack:
+    """
+    Read side of write_pack. The file is memory-mapped once and get() returns
+    tensors that are views of the mapping: nothing is read until a tensor's
+    pages are touched and there is no unpickling. The mapping is
+    copy-on-write, so in-place updates of a returned tensor stay private to
+    the process and never reach the file.
+    """
+    def __init__(self, path):
+        self.path = path
+        with open(path, "rb") as f:
+            magic, version, index_offset, index_len = _PACK_HEADER.unpack(f.read(_PACK_HEADER.size))
+            if magic != PACK_MAGIC:
+                raise ValueError(f"{path} is not a subgraph pack")
+            if version != PACK_VERSION:
+                raise ValueError(f"{path} has pack version {version}, expected {PACK_VERSION}")
+            f.seek(index_offset)
+            self.index = json.loads(f.read(index_len).decode())
+        self.buffer = np.memmap(path, dtype=np.uint8, mode="c")
+
+    def __contains__(self, name):
+        return name in self.index
+
+    def names(self):
+        return list(self.index)
+
+    def get(self, name):
+        # A zero-copy view of tensor `name`, None if the pack does not have it
+        entry = self.index.get(name)
+        if entry is None:
+            return None
+        raw = self.buffer[entry["offset"]:entry["offset"] + entry["nbytes"]]
+        dtype = getattr(torch, entry["dtype"])
+        return torch.from_numpy(raw).view(dtype).view(entry["shape"])
+
+
+def open_subgraphs(pref):
+    """
+    Source of the tensors of the dataset directory `pref`: its pack (see
+    pack_subgraphs.py) if one exists next to the directory, else pref
+    itself, read file by file with torch.load.
+    """
+    if osp.exists(pack_path(pref)):
+        return SubgraphPack(pack_path(pref))
+    return pref
+
+
+def load_tensor(src, name):
+    """
+    Tensor `name` (e.g. "x_full", "adj_3") of a source from open_subgraphs,
+    None if it does not exist.
+    """
+    if isinstance(src, SubgraphPack):
+        return src.get(name)
+    path = f"{src}{name}.pt"
+    return torch.load(path) if osp.exists(path) else None
+
+
+class FeatureStore:
+    """
+    One shared copy of the full node feature and label matrices that the
+    subgraphs gather their rows from by node id, instead of every subgraph
+    storing its own copy.
+
+    `tensors` maps a name ("x", "y") to the full tensor, or to a callable that
+    loads it on first use (see open_feature_store), so that datasets whose
+    subgraphs still carry their own features never load the full matrix.
+    Backed by a SubgraphPack the full tensors are memory-mapped and a gather
+    only reads the pages of the rows it selects. With pin=True (and CUDA
+    available) rows are gathered into page-locked buffers so the copy to the
+    device can be asynchronous. Safe to share between prefetch threads.
+    """
+    def __init__(self, tensors, pin=False):
+        self.tensors = dict(tensors)
+        self.pin = pin and torch.cuda.is_available()
+        self.lock = threading.Lock()
+
+    def __contains__(self, name):
+        return name in self.tensors
+
+    def get(self, name):
+        tensor = self.tensors[name]
+        if callable(tensor):
+            with self.lock:
+                tensor = self.tensors[name]
+                if callable(tensor):
+                    tensor = tensor()
+                    if tensor is None:
+                        raise ValueError(f"feature store has no full {name} to gather subgraph rows from")
+                    self.tensors[name] = tensor
+        return tensor.detach()
+
+    def gather(self, node_ids, names=None):
+        # Rows node_ids of each full tensor in names (default all) as a dict
+        node_ids = node_ids.long()
+        parts = dict()
+        for name in (self.tensors if names is None else names):
+            full = self.get(name)
+            out = torch.empty((node_ids.size(0),) + tuple(full.shape[1:]), dtype=full.dtype,
+                                pin_memory=self.pin)
+            parts[name] = torch.index_select(full, 0, node_ids, out=out)
+        return parts
+
+
+def open_feature_store(src, names=STORE_FILES, pin=False):
+    # A FeatureStore over the <name>_full tensors of a source from open_subgraphs, loaded when first gathered
+    return FeatureStore({name: (lambda name=name: load_tensor(src, f"{name}_full")) for name in names}, pin)
+
+
+def load_subgraph(src, i, names=SUBGRAPH_FILES, store=None):
+    """
+    The saved tensors of subgraph i as a dict; tensors that do not exist
+    (edge weights are only saved for some datasets) map to None. src is a
+    directory prefix or a SubgraphPack, see open_subgraphs.
+
+    Names the subgraph does not store itself but `store` has (features and
+    labels of subgraphs saved as node ids) are gathered from the store by
+    the subgraph's nid_<i>.
+    """
+    parts = {name: load_tensor(src, f"{name}_{i}") for name in names}
+    if store is not None:
+        missing = [name for name in names if parts[name] is None and name in store]
+        node_ids = load_tensor(src, f"nid_{i}") if missing else None
+        if node_ids is not None:
+            parts.update(store.gather(node_ids, missing))
+    return parts
+
+
+class SubgraphPrefetcher:
+    """
+    Iterable over the subgraphs `ids`, each produced by load(i) on a
+    background thread pool.
+
+    At most `depth` subgraphs are loaded ahead of the one being consumed,
+    so deserialization and preprocessing of the next subgraphs overlap
+    with training on the current one, the first iteration only waits for
+    the first subgraph, and only depth + 1 subgraphs are resident at once.
+
+    With cache=True the items of the first complete pass are kept and
+    later passes iterate over them without reloading (e.g. partitioned
+    subgraphs already on the device); with cache=False every pass streams
+    from disk again. shuffle=True visits the subgraphs in a new random
+    order on every pass. wait_time accumulates the seconds the consumer was
+    blocked waiting for a subgraph.
+    """
+    def __init__(self, ids, load, depth=2, workers=2, cache=True, shuffle=False):
+        self.ids = list(ids)
+        self.load = load
+        self.depth = max(depth, 1)
+        self.workers = max(workers, 1)
+        self.cache = cache
+        self.shuffle = shuffle
+        self.cached = None
+        self.wait_time = 0.0
+        self.pool = None
+
+    def __len__(self):
+        return len(self.ids)
+
+    def map(self, fn, cache=None):
+        """
+        A prefetcher over the same ids whose items are fn(item), fn running
+        on the pool together with the load.
+        """
+        load = self.load
+        return SubgraphPrefetcher(self.ids, lambda i: fn(load(i)), self.depth, self.workers,
+                                    self.cache if cache is None else cache, self.shuffle)
+
+    def __iter__(self):
+        if self.cached is not None:
+            items = list(self.cached)
+            if self.shuffle:
+                random.shuffle(items)
+            yield from items
+            return
+
+        if self.pool is None:
+            self.pool = ThreadPoolExecutor(self.workers)
+
+        ids = list(self.ids)
+        if self.shuffle:
+            random.shuffle(ids)
+        pending = deque(self.pool.submit(self.load, i) for i in ids[:self.depth])
+        next_id = len(pending)
+        items = []
+        while pending:
+            tstart = time.time()
+            item = pending.popleft().result()
+            self.wait_time += time.time() - tstart
+
+            if next_id < len(ids):
+                pending.append(self.pool.submit(self.load, ids[next_id]))
+                next_id += 1
+            if self.cache:
+                items.append(item)
+            yield item
+
+        if self.cache:
+            self.cached = items
+            self.close()
+
+    def close(self):
+        if self.pool is not None:
+            self.pool.shutdown(wait=True)
+            self.pool = None
@@ -0,0 +1,66 @@
+import argparse
+import time
+
+import numpy as np
+import torch as th
+import dgl
+from dgl.sampling import random_walk, pack_traces
+
+from sampler import shared_csr, random_walk_batch
+
+# One subgraph per call, as SAINTRandomWalkSampler.__sample__ and the pre-sampling __getitem__ did before
+# random_walk_batch, kept here as the baseline
+def sample_rw_single(train_g, num_roots, length):
+    sampled_roots = th.randint(0, train_g.num_nodes(), (num_roots,))
+    traces, types = random_walk(train_g, nodes=sampled_roots, length=length)
+    sampled_nodes, _, _, _ = pack_traces(traces, types)
+    sampled_nodes = sampled_nodes.unique().numpy()
+    return sampled_nodes, dgl.node_subgraph(train_g, sampled_nodes).edata[dgl.EID]
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--nodes", type=int, default=200000)
+    parser.add_argument("--edges", type=int, default=5000000)
+    parser.add_argument("--num_roots", type=int, default=3000)
+    parser.add_argument("--length", type=int, default=2)
+    parser.add_argument("--subgraphs", type=int, default=200)
+    parser.add_argument("--batches", type=str, default="1,16,64,200")
+    args = parser.parse_args()
+
+    train_g = dgl.to_bidirected(dgl.rand_graph(args.nodes, args.edges))
+    print(f"nodes: {train_g.num_nodes()} edges: {train_g.num_edges()}", flush=True)
+
+    tstart = time.time()
+    old = [sample_rw_single(train_g, args.num_roots, args.length) for _ in range(args.subgraphs)]
+    old_rate = args.subgraphs / (time.time() - tstart)
+    print(f"single: {old_rate:.1f} subgraphs/s nodes/subgraph: {np.mean([len(n) for n, _ in old]):.0f} "
+            f"edges/subgraph: {np.mean([len(e) for _, e in old]):.0f}", flush=True)
+
+    tstart = time.time()
+    csr = shared_csr(train_g)
+    print(f"csr: {time.time() - tstart:.3f}s", flush=True)
+
+    rng = np.random.default_rng(0)
+    for batch in [int(b) for b in args.batches.split(',')]:
+        num_nodes = []
+        num_edges = []
+        tstart = time.time()
+        for first in range(0, args.subgraphs, batch):
+            nodes, node_offsets, edges, edge_offsets = random_walk_batch(csr, args.num_roots, args.length,
+                                                                         min(batch, args.subgraphs - first), rng)
+            num_nodes.append(np.diff(node_offsets))
+            num_edges.append(np.diff(edge_offsets))
+        new_rate = args.subgraphs / (time.time() - tstart)
+
+        # The edges of a batched subgraph are exactly the ones dgl.node_subgraph induces on its nodes
+        same = all(np.array_equal(np.sort(edges[edge_offsets[i]:edge_offsets[i + 1]]),
+                                    np.sort(dgl.node_subgraph(train_g, nodes[node_offsets[i]:node_offsets[i + 1]])
+                                            .edata[dgl.EID].numpy()))
+                    for i in range(min(len(node_offsets) - 1, 4)))
+
+        print(f"batch: {batch} batched: {new_rate:.1f} subgraphs/s speedup: {new_rate / old_rate:.2f}x "
+                f"nodes/subgraph: {np.concatenate(num_nodes).mean():.0f} "
+                f"edges/subgraph: {np.concatenate(num_edges).mean():.0f} identical: {same}", flush=True)
+
+if __name__ == '__main__':
+    main()
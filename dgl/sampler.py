@@ -7,10 +7,81 @@ import random
 import numpy as np
 import dgl.function as fn
 import dgl
-from dgl.sampling import random_walk, pack_traces
 import scipy
 
 
+
+def _sorted_unique(keys):
+    # np.unique of a flat int array without its hashing path, which is several times slower on large arrays
+    keys = np.sort(keys)
+    return keys[np.concatenate(([True], keys[1:] != keys[:-1]))]
+
+
+def shared_csr(g):
+    """
+    Out-edge CSR of g as (indptr, successors, edge ids) tensors in shared memory, so that forked
+    DataLoader workers walk the same copy. indptr and successors are int32 while the edge count fits, so
+    scipy can index rows of the CSR without copying it, edge ids are int64.
+    """
+    src, dst, eid = g.edges(form='all', order='srcdst')
+    index_dtype = th.int32 if max(g.num_nodes(), g.num_edges()) < 2 ** 31 else th.int64
+    indptr = th.zeros(g.num_nodes() + 1, dtype=th.int64)
+    indptr[1:] = th.cumsum(th.bincount(src, minlength=g.num_nodes()), 0)
+    return (indptr.to(index_dtype).share_memory_(), dst.to(index_dtype).share_memory_(),
+            eid.long().share_memory_())
+
+
+def random_walk_batch(csr, num_roots, length, num_subg, rng):
+    """
+    Sample num_subg GraphSAINT random-walk subgraphs at once over a CSR from shared_csr: num_roots walks
+    of the given length for each, all walked together one step at a time, as dgl.sampling.random_walk
+    does for one subgraph (uniform successors, a walk stops at a node without out-edges).
+
+    Returns flat buffers of the subgraphs' node ids and of the ids of the edges those nodes induce
+    (the edge ids dgl.node_subgraph would give), each with num_subg + 1 offsets:
+    subgraph i is nodes[node_offsets[i]:node_offsets[i + 1]] and edges[edge_offsets[i]:edge_offsets[i + 1]].
+    Node ids of a subgraph are sorted.
+
+    The walks and the node dedup are batched. The edges each subgraph induces are found one subgraph at a
+    time, from the out-edges of its nodes (one row selection of the CSR) whose successor is set in a
+    num_nodes membership mask, which costs the same number of edge visits as a batched lookup and keeps
+    the mask at num_nodes bytes whatever the graph size.
+    """
+    indptr, successors, eids = (t.numpy() for t in csr)
+    num_nodes = len(indptr) - 1
+
+    cur = rng.integers(0, num_nodes, num_subg * num_roots)
+    subg = np.repeat(np.arange(num_subg, dtype=np.int64), num_roots)
+    trace_nodes, trace_subg = [cur], [subg]
+    for _ in range(length):
+        start = indptr[cur]
+        deg = indptr[cur + 1] - start
+        alive = deg > 0
+        cur = successors[start[alive] + (rng.random(int(alive.sum())) * deg[alive]).astype(np.int64)]
+        subg = subg[alive]
+        trace_nodes.append(cur)
+        trace_subg.append(subg)
+
+    # A (subgraph, node) pair is one key, so one dedup gives every subgraph's node set
+    keys = _sorted_unique(np.concatenate(trace_subg) * num_nodes + np.concatenate(trace_nodes))
+    node_subg, nodes = np.divmod(keys, num_nodes)
+    node_offsets = np.zeros(num_subg + 1, dtype=np.int64)
+    node_offsets[1:] = np.cumsum(np.bincount(node_subg, minlength=num_subg))
+
+    adj = scipy.sparse.csr_matrix((eids, successors, indptr), shape=(num_nodes, num_nodes), copy=False)
+    mask = np.zeros(num_nodes, dtype=bool)
+    edges = []
+    edge_offsets = np.zeros(num_subg + 1, dtype=np.int64)
+    for i in range(num_subg):
+        subg_nodes = nodes[node_offsets[i]:node_offsets[i + 1]]
+        mask[subg_nodes] = True
+        rows = adj[subg_nodes]
+        edges.append(rows.data[mask[rows.indices]])
+        edge_offsets[i + 1] = edge_offsets[i] + len(edges[-1])
+        mask[subg_nodes] = False
+    return nodes, node_offsets, np.concatenate(edges), edge_offsets
+
+
 # The base class of sampler
 class SAINTSampler:
     """
@@ -76,6 +147,9 @@ class SAINTSampler:
         self.node_counter = th.zeros((self.train_g.num_nodes(),))
         self.edge_counter = th.zeros((self.train_g.num_edges(),))
         self.prob = None
+        self.rng = np.random.default_rng()
+        self.rng_pid = os.getpid()
+        self.sampled = []
         self.num_subg_sampler = num_subg_sampler
         self.batch_size_sampler = batch_size_sampler
         self.num_workers_sampler = num_workers_sampler
@@ -96,7 +170,9 @@ class SAINTSampler:
             self.N, sampled_nodes = 0, 0
             # N: the number of pre-sampled subgraphs
 
-            # Employ parallelism to speed up the sampling procedure
+            # Employ parallelism to speed up the sampling procedure. The sampling tables are built first, so that
+            # the forked workers share them instead of each building its own
+            self.__prepare__()
             loader = DataLoader(self, batch_size=self.batch_size_sampler, shuffle=True,
                                 num_workers=self.num_workers_sampler, collate_fn=self.__collate_fn__, drop_last=False)
 
@@ -135,6 +211,9 @@ class SAINTSampler:
 
         random.shuffle(self.subgraphs)
         self.__clear__()
+        if self.online:
+            # Online training samples in the workers of the training DataLoader, created after this
+            self.__prepare__()
         print("The number of subgraphs is: ", len(self.subgraphs))
 
         self.train = True
@@ -158,9 +237,8 @@ class SAINTSampler:
             else:
                 return dgl.node_subgraph(self.train_g, self.subgraphs[idx])
         else:
-            subgraph_nids = self.__sample__()
+            subgraph_nids, subgraph_eids = self.__sample_eids__()
             num_nodes = len(subgraph_nids)
-            subgraph_eids = dgl.node_subgraph(self.train_g, subgraph_nids).edata[dgl.EID]
             return num_nodes, subgraph_nids, subgraph_eids
 
     def __collate_fn__(self, batch):
@@ -177,7 +255,8 @@ class SAINTSampler:
             return sum_num_nodes, subgraphs_nids_list, subgraphs_eids_list
 
     def __clear__(self):
-        self.prob = None
+        if not self.online:
+            self.prob = None
         self.node_counter = None
         self.edge_counter = None
         self.g = None
@@ -207,9 +286,32 @@ class SAINTSampler:
         self.train_g.ndata['train_D_norm'] = 1. / self.train_g.in_degrees().float().clamp(min=1).unsqueeze(1)
         self.g.ndata['full_D_norm'] = 1. / self.g.in_degrees().float().clamp(min=1).unsqueeze(1)
 
+    def __prepare__(self):
+        # Build what __sample__ reads from the training graph, before any DataLoader forks
+        pass
+
     def __sample__(self):
         raise NotImplementedError
 
+    def __sample_eids__(self):
+        # Node ids of a new subgraph and the ids of the edges they induce, for pre-sampling
+        subgraph_nids = self.__sample__()
+        return subgraph_nids, dgl.node_subgraph(self.train_g, subgraph_nids).edata[dgl.EID]
+
+    def __sample_batch__(self, num_subg):
+        raise NotImplementedError
+
+    def __next_sampled__(self):
+        # Samplers that draw many subgraphs in one __sample_batch__ call hand them out one by one from here
+        if self.rng_pid != os.getpid():
+            # DataLoader workers start with copies of the parent's generator and subgraphs, give each its own
+            self.rng = np.random.default_rng(th.initial_seed())
+            self.rng_pid = os.getpid()
+            self.sampled = []
+        if not self.sampled:
+            self.sampled = self.__sample_batch__(self.batch_size_sampler)
+        return self.sampled.pop()
+
 
 class SAINTNodeSampler(SAINTSampler):
     """
@@ -234,10 +336,11 @@ class SAINTNodeSampler(SAINTSampler):
                                                                            self.num_subg))
         return graph_fn, norm_fn
 
-    def __sample__(self):
+    def __prepare__(self):
         if self.prob is None:
             self.prob = self.train_g.in_degrees().float().clamp(min=1)
 
+    def __sample__(self):
         sampled_nodes = th.multinomial(self.prob, num_samples=self.node_budget, replacement=True).unique()
         return sampled_nodes.numpy()
 
@@ -256,9 +359,6 @@ class SAINTEdgeSampler(SAINTSampler):
 
     def __init__(self, edge_budget, **kwargs):
         self.edge_budget = edge_budget
-        self.rng = np.random.default_rng()
-
-
         super(SAINTEdgeSampler, self).__init__(node_budget=edge_budget*2, **kwargs)
 
     def __generate_fn__(self):
@@ -268,27 +368,60 @@ class SAINTEdgeSampler(SAINTSampler):
                                                                            self.num_subg))
         return graph_fn, norm_fn
 
-    # TODO: only sample half edges, then add another half edges
-    # TODO: use numpy to implement cython sampling method
-    def __sample__(self):
+    def __prepare__(self):
         if self.prob is None:
-            src, dst = self.train_g.edges()
-            src_degrees, dst_degrees = self.train_g.in_degrees(src).float().clamp(min=1), \
-                                       self.train_g.in_degrees(dst).float().clamp(min=1)
-            prob_mat = 1. / src_degrees + 1. / dst_degrees
-            prob_mat = scipy.sparse.csr_matrix((prob_mat.numpy(), (src.numpy(), dst.numpy())))
-            # The edge probability here only contains that of edges in upper triangle adjacency matrix
-            # Because we assume the graph is undirected, that is, the adjacency matrix is symmetric. We only need
-            # to consider half of edges in the graph.
-            self.prob = th.tensor(scipy.sparse.triu(prob_mat).data)
-            self.prob /= self.prob.sum()
-            self.adj_nodes = np.stack(prob_mat.nonzero(), axis=1)
-
-        sampled_edges = np.unique(
-                    dgl.random.choice(len(self.prob), size=self.edge_budget, prob=self.prob, replace=False)
-                )
-        sampled_nodes = np.unique(self.adj_nodes[sampled_edges].flatten()).astype('long')
-        return sampled_nodes
+            self.__edge_table__()
+
+    def __edge_table__(self):
+        src, dst = self.train_g.edges()
+        src_degrees, dst_degrees = self.train_g.in_degrees(src).float().clamp(min=1), \
+                                   self.train_g.in_degrees(dst).float().clamp(min=1)
+        prob_mat = 1. / src_degrees + 1. / dst_degrees
+        prob_mat = scipy.sparse.csr_matrix((prob_mat.numpy(), (src.numpy(), dst.numpy())))
+        # The edge probability here only contains that of edges in upper triangle adjacency matrix
+        # Because we assume the graph is undirected, that is, the adjacency matrix is symmetric. We only need
+        # to consider half of edges in the graph.
+        prob_mat = scipy.sparse.triu(prob_mat, format='coo')
+        self.adj_nodes = np.stack((prob_mat.row, prob_mat.col), axis=1).astype('long')
+        # Cumulative edge probabilities, an edge is drawn by searching a uniform number in them
+        self.prob = np.cumsum(prob_mat.data, dtype=np.float64)
+        self.prob /= self.prob[-1]
+
+    def __sample_batch__(self, num_subg):
+        """
+        Node sets of num_subg subgraphs, each induced by edge_budget distinct edges drawn with the edge
+        probabilities, as dgl.random.choice(..., replace=False) per subgraph did.
+
+        The edges of all subgraphs are drawn in one searchsorted over the cumulative probabilities. A
+        (subgraph, edge) pair is one int64 key, so a single np.unique drops the repeated draws of every
+        subgraph at once; subgraphs that lost draws are topped up with as many new draws as they are short
+        until all have edge_budget edges, which is exactly sampling without replacement. Their endpoints
+        are deduplicated the same way.
+        """
+        num_edges = len(self.adj_nodes)
+        num_nodes = self.train_g.num_nodes()
+        budget = min(self.edge_budget, num_edges)
+
+        keys = np.empty(0, dtype=np.int64)
+        short = np.full(num_subg, budget)
+        while short.any():
+            subg = np.repeat(np.arange(num_subg, dtype=np.int64), short)
+            # Searching the draws in sorted order keeps the binary searches in cache
+            draws = self.rng.random(len(subg))
+            order = np.argsort(draws)
+            edges = np.empty(len(draws), dtype=np.int64)
+            edges[order] = np.searchsorted(self.prob, draws[order], side='right')
+            edges = np.minimum(edges, num_edges - 1)
+            keys = _sorted_unique(np.concatenate((keys, subg * num_edges + edges)))
+            short = budget - np.bincount(keys // num_edges, minlength=num_subg)
+
+        subg, edges = np.divmod(keys, num_edges)
+        keys = _sorted_unique(np.repeat(subg, 2) * num_nodes + self.adj_nodes[edges].ravel())
+        subg, nodes = np.divmod(keys, num_nodes)
+        return np.split(nodes, np.cumsum(np.bincount(subg, minlength=num_subg))[:-1])
+
+    def __sample__(self):
+        return self.__next_sampled__()
 
 
 class SAINTRandomWalkSampler(SAINTSampler):
@@ -308,6 +441,7 @@ class SAINTRandomWalkSampler(SAINTSampler):
 
     def __init__(self, num_roots, length, **kwargs):
         self.num_roots, self.length = num_roots, length
+        self.csr = None
         super(SAINTRandomWalkSampler, self).__init__(node_budget=num_roots * length, **kwargs)
 
     def __generate_fn__(self):
@@ -317,9 +451,17 @@ class SAINTRandomWalkSampler(SAINTSampler):
                                                                             self.length, self.num_subg))
         return graph_fn, norm_fn
 
+    def __prepare__(self):
+        if self.csr is None:
+            self.csr = shared_csr(self.train_g)
+
+    def __sample_batch__(self, num_subg):
+        nodes, node_offsets, edges, edge_offsets = random_walk_batch(self.csr, self.num_roots, self.length,
+                                                                     num_subg, self.rng)
+        return list(zip(np.split(nodes, node_offsets[1:-1]), np.split(edges, edge_offsets[1:-1])))
+
     def __sample__(self):
-        sampled_roots = th.randint(0, self.train_g.num_nodes(), (self.num_roots,))
-        traces, types = random_walk(self.train_g, nodes=sampled_roots, length=self.length)
-        sampled_nodes, _, _, _ = pack_traces(traces, types)
-        sampled_nodes = sampled_nodes.unique()
-        return sampled_nodes.numpy()
+        return self.__next_sampled__()[0]
+
+    def __sample_eids__(self):
+        return self.__next_sampled__()
@@ -1,5 +1,6 @@
 import argparse
 import os
+import sys
 from sys import prefix
 import time
 import dgl
@@ -10,6 +11,9 @@ from sampler import SAINTNodeSampler, SAINTEdgeSampler, SAINTRandomWalkSampler
 from config import CONFIG
 from modules import GCNNet
 from utils import Logger, evaluate, save_log_dir, load_data, calc_f1
+# subgraph_loader is shared by the RDM, PyG and DGL scripts and lives in common/ at the top of the repo
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "common"))
+from subgraph_loader import FeatureStore, SubgraphPrefetcher, load_subgraph, load_tensor, open_subgraphs
 import warnings
 from tqdm import tqdm
 import numpy as np
@@ -102,17 +106,19 @@ def main(args):
     # Load data
     #pref_reddit = '../../reddit_subgs/'.format(args.dataset)
     pref = '/scratch/general/nfs1/u1320844/dataset/asplos/{}_subgs/'.format(args.dataset)
+    # The packed file of the directory if pack_subgraphs.py made one, else the .pt files
+    src = open_subgraphs(pref)
     # Load subg data
-    subgraphs = []
     #if args.dataset == 'reddit':
     #    pref_tmp = pref
     #    pref = pref_reddit
-    for i in range(32):
+    def load_graph(i):
         # TODO use upper/lower/symmetric
-        adj_ = torch.load(pref+'adj_{}.pt'.format(i))
-        x_ = torch.load(pref+'x_{}.pt'.format(i))
-        y_ = torch.load(pref+'y_{}.pt'.format(i))
-        tm_ = torch.load(pref+'train_mask_{}.pt'.format(i))
+        parts = load_subgraph(src, i, ("adj", "x", "y", "train_mask"), store)
+        adj_ = parts['adj']
+        x_ = parts['x']
+        y_ = parts['y']
+        tm_ = parts['train_mask']
         if args.topo == 'lower':
             g = dgl.graph((adj_[1], adj_[0]))
             g = dgl.add_self_loop(g)
@@ -134,20 +140,22 @@ def main(args):
         g.ndata['feat'] = x_
         g.ndata['label'] = y_
         g.ndata['train_mask'] = tm_
-        if not args.dataset in ['meta', 'arctic25', 'oral']:
-            ew_ = torch.load(pref+'edge_weight_{}.pt'.format(i))
-            #g.edata['edge_weight'] = ew_
-        subgraphs.append(g)
+        #if not args.dataset in ['meta', 'arctic25', 'oral']:
+        #    ew_ = torch.load(pref+'edge_weight_{}.pt'.format(i))
+        #    g.edata['edge_weight'] = ew_
+        return g
 
     # load full graph
     #if args.dataset == 'reddit':
     #    pref = pref_tmp
-    adj_full = torch.load(pref+'adj_full.pt')
-    x_ = torch.load(pref+'x_full.pt')
-    y_ = torch.load(pref+'y_full.pt')
-    trm_ = torch.load(pref+'train_mask_full.pt')
-    vam_ = torch.load(pref+'val_mask_full.pt')
-    tem_ = torch.load(pref+'test_mask_full.pt')
+    adj_full = load_tensor(src, 'adj_full')
+    x_ = load_tensor(src, 'x_full')
+    y_ = load_tensor(src, 'y_full')
+    trm_ = load_tensor(src, 'train_mask_full')
+    vam_ = load_tensor(src, 'val_mask_full')
+    tem_ = load_tensor(src, 'test_mask_full')
+    # Subgraphs saved as node ids gather their features and labels from these
+    store = FeatureStore(dict(x=x_, y=y_), pin=args.gpu >= 0)
     g = dgl.graph((adj_full[0], adj_full[1]))
     #g = dgl.add_self_loop(g)
     if args.dataset == 'ogbn-arxiv':
@@ -198,19 +206,13 @@ def main(args):
            n_val_samples,
            n_test_samples))
     # load sampler
-    loader = subgraphs
-    chunk_size = len(loader)//ws
-    if rk == ws-1:
-        l = []
-        for j in range(chunk_size):
-            l.append(loader[rk+j*ws])
-        loader = l
-        #loader = loader[rk*chunk_size:]
+    # Every rank trains on subgraphs rk, rk + ws, ..., and only loads those
+    chunk_size = 32//ws
+    ids = [rk+j*ws for j in range(chunk_size)]
+    if args.prefetch > 0:
+        loader = SubgraphPrefetcher(ids, load_graph, args.prefetch, args.load_workers, cache=not args.stream)
     else:
-        l = []
-        for j in range(chunk_size):
-            l.append(loader[rk+j*ws])
-        loader = l
+        loader = [load_graph(i) for i in ids]
     # set device for dataset tensors
     if args.gpu < 0:
         cuda = False
@@ -363,6 +365,9 @@ if __name__ == '__main__':
     parser.add_argument("--csv", type=str, default='test.csv')
     parser.add_argument("--log_dir", type=str, default='test')
     parser.add_argument("--topo", type=str, default='upper')
+    parser.add_argument("--prefetch", type=int, default=0, help="subgraphs loaded ahead on a background pool, 0 loads all up front")
+    parser.add_argument("--load_workers", type=int, default=2)
+    parser.add_argument("--stream", action='store_true', help="with --prefetch, reload the subgraphs every epoch")
     args = parser.parse_args()
     #task = parser.parse_args().task
     #args = argparse.Namespace(**CONFIG[task])
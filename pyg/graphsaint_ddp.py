@@ -2,6 +2,7 @@ import argparse
 import enum
 from locale import normalize
 import os
+import sys
 import os.path as osp
 
 from tqdm import tqdm
@@ -21,6 +22,9 @@ from torch_geometric.loader import GraphSAINTRandomWalkSampler, NeighborSampler
 from torch_geometric.nn import GraphConv, SAGEConv, GCNConv
 from torch_geometric.utils import degree
 from ogb.nodeproppred import PygNodePropPredDataset
+# subgraph_loader is shared by the RDM, PyG and DGL scripts and lives in common/ at the top of the repo
+sys.path.insert(0, osp.join(osp.dirname(osp.abspath(__file__)), "..", "common"))
+from subgraph_loader import FeatureStore, SubgraphPrefetcher, load_subgraph, load_tensor, open_subgraphs
 
 def setup(rank, world_size):
     #os.environ['MASTER_ADDR'] = 'localhost'
@@ -40,6 +44,11 @@ parser.add_argument('--walk_length', type=int, default=3)
 parser.add_argument('--num_subgs', type=int, default=32)
 parser.add_argument('--sample_coverage', type=int, default=0)
 parser.add_argument('--log', type=str, default='jun28/log.csv')
+# With --load: load this many of the rank's subgraphs ahead on a background pool instead of all up front
+parser.add_argument('--prefetch', type=int, default=0)
+parser.add_argument('--load_workers', type=int, default=2)
+# With --prefetch: reload the subgraphs every epoch instead of keeping them in host memory
+parser.add_argument('--stream', action='store_true')
 args = parser.parse_args()
 
 rk = int(os.environ['RANK'])
@@ -93,12 +102,13 @@ elif args.dataset == 'ogbn-products':
     num_classes = dataset.num_classes
 elif args.dataset in ['meta', 'arctic25', 'oral']:
     pref = '/scratch/general/nfs1/u1320844/dataset/asplos/{}_subgs/'.format(args.dataset)
-    adj_full = torch.load(pref+'adj_full.pt')
-    x_full = torch.load(pref+'x_full.pt')
-    y_full = torch.load(pref+'y_full.pt')
-    train_mask_full = torch.load(pref+'train_mask_full.pt')
-    val_mask_full = torch.load(pref+'val_mask_full.pt')
-    test_mask_full = torch.load(pref+'test_mask_full.pt')
+    src = open_subgraphs(pref)
+    adj_full = load_tensor(src, 'adj_full')
+    x_full = load_tensor(src, 'x_full')
+    y_full = load_tensor(src, 'y_full')
+    train_mask_full = load_tensor(src, 'train_mask_full')
+    val_mask_full = load_tensor(src, 'val_mask_full')
+    test_mask_full = load_tensor(src, 'test_mask_full')
     data = Data()
     data.edge_index = adj_full
     data.x = x_full
@@ -120,38 +130,32 @@ elif args.dataset in ['meta', 'arctic25', 'oral']:
 row, col = data.edge_index
 data.edge_weight = 1. / degree(col, data.num_nodes)[col]  # Norm by in-degree.
 if args.load:
-    loader = [] 
     pref = '/scratch/general/nfs1/u1320844/dataset/asplos/{}_subgs/'.format(args.dataset)
-    for i in range(args.num_subgs):
-        adj = torch.load(pref+'adj_{}.pt'.format(i)) 
-        tm = torch.load(pref+'train_mask_{}.pt'.format(i)) 
-        x = torch.load(pref+'x_{}.pt'.format(i)) 
-        y = torch.load(pref+'y_{}.pt'.format(i)) 
+    src = open_subgraphs(pref)
+    # Subgraphs saved as node ids gather their features and labels from the full graph
+    store = FeatureStore(dict(x=data.x, y=data.y), pin=torch.cuda.is_available())
+
+    def load_data(i):
+        parts = load_subgraph(src, i, store=store)
         d = Data()
-        d.edge_index = adj
-        d.x = x 
-        d.y = y 
-        if osp.exists(pref+'edge_weight_{}.pt'.format(i)):
-            ew = torch.load(pref+'edge_weight_{}.pt'.format(i)) 
+        d.edge_index = parts['adj']
+        d.x = parts['x']
+        d.y = parts['y']
+        if parts['edge_weight'] is not None:
+            d.edge_weight = parts['edge_weight']
         else:
-            ew = torch.ones(adj[0].shape)
-
-        d.edge_weight = ew
-        d.train_mask = tm
-        loader.append(d)
-    chunk_size = len(loader)//ws
-    if rk == ws-1:
-        l = []
-        for j in range(chunk_size):
-            l.append(loader[rk+j*ws])
-        loader = l
-        #loader = loader[rk*chunk_size:]
+            d.edge_weight = torch.ones(parts['adj'][0].shape)
+        d.train_mask = parts['train_mask']
+        return d
+
+    # Every rank trains on subgraphs rk, rk + ws, ..., and only loads those
+    chunk_size = args.num_subgs//ws
+    ids = [rk+j*ws for j in range(chunk_size)]
+    if args.prefetch > 0:
+        loader = SubgraphPrefetcher(ids, load_data, args.prefetch, args.load_workers,
+                                        cache=not args.stream, shuffle=True)
     else:
-        l = []
-        for j in range(chunk_size):
-            l.append(loader[rk+j*ws])
-        loader = l
-        #loader = loader[rk*chunk_size:(rk+1)*chunk_size]
+        loader = [load_data(i) for i in ids]
 else:
     loader = GraphSAINTRandomWalkSampler(data, batch_size=args.batch_size, walk_length=args.walk_length,
                                      num_steps=args.num_subgs//ws, sample_coverage=args.sample_coverage,
@@ -314,7 +318,8 @@ def train():
     #model.set_aggr('add' if args.use_normalization else 'mean')
     total_loss = total_examples = 0
     loss_ = 0
-    shuffle(loader)
+    if isinstance(loader, list):
+        shuffle(loader)
     for i, data in enumerate(loader):
         #data = T.ToSparseTensor()(data)
         data = data.to(device)
@@ -1,5 +1,6 @@
 import argparse
 import os
+import sys
 import os.path as osp
 
 from tqdm import tqdm
@@ -17,11 +18,17 @@ from torch_geometric.nn import GraphConv, SAGEConv, GCNConv
 from torch_geometric.utils import degree
 from ogb.nodeproppred import PygNodePropPredDataset
 
+# subgraph_loader is shared by the RDM, PyG and DGL scripts and lives in common/ at the top of the repo
+sys.path.insert(0, osp.join(osp.dirname(osp.abspath(__file__)), "..", "common"))
+from subgraph_loader import FeatureStore, load_subgraph
+
 #from graphsaint_ddp import GCN
 
 parser = argparse.ArgumentParser()
 parser.add_argument('--use_normalization', action='store_true')
 parser.add_argument('--save', action='store_true')
+# With --save: also write each subgraph's x/y rows, by default only its node ids (nid_<i>.pt) are saved
+parser.add_argument('--save_features', action='store_true')
 parser.add_argument('--load', action='store_true')
 parser.add_argument('--dataset', type=str, default='flickr')
 parser.add_argument('--batch_size', type=int, default=3000)
@@ -121,21 +128,21 @@ if args.save:
 if args.load:
     loader = []
     pref = '{}_subgs/'.format(args.dataset)
+    store = FeatureStore(dict(x=data.x, y=data.y))
     for i in range(args.num_subgs):
-        adj = torch.load(pref+'adj_{}.pt'.format(i))
-        tm = torch.load(pref+'train_mask_{}.pt'.format(i))
-        x = torch.load(pref+'x_{}.pt'.format(i))
-        y = torch.load(pref+'y_{}.pt'.format(i))
-        ew = torch.load(pref+'edge_weight_{}.pt'.format(i))
+        parts = load_subgraph(pref, i, store=store)
         d = Data()
-        d.edge_index = adj
-        d.x = x
-        d.y = y
-        d.edge_weight = ew
-        d.train_mask = tm
+        d.edge_index = parts['adj']
+        d.x = parts['x']
+        d.y = parts['y']
+        d.edge_weight = parts['edge_weight']
+        d.train_mask = parts['train_mask']
         #d = T.ToSparseTensor()(d)
         loader.append(d)
 else:
+    if args.save:
+        # Global id of every node, the sampler slices it into each subgraph like x and y
+        data.n_id = torch.arange(data.num_nodes)
     loader = GraphSAINTRandomWalkSampler(data, batch_size=args.batch_size, walk_length=args.walk_length,
                                      num_steps=args.num_subgs, sample_coverage=args.sample_coverage,
                                      save_dir=dataset.processed_dir,
@@ -293,8 +300,10 @@ def train():
             if not osp.exists(dir_):
                 os.mkdir(dir_)
             torch.save(data.edge_index, '{}/adj_{}.pt'.format(dir_, i))
-            torch.save(data.x, '{}/x_{}.pt'.format(dir_, i))
-            torch.save(data.y, '{}/y_{}.pt'.format(dir_, i))
+            torch.save(data.n_id, '{}/nid_{}.pt'.format(dir_, i))
+            if args.save_features:
+                torch.save(data.x, '{}/x_{}.pt'.format(dir_, i))
+                torch.save(data.y, '{}/y_{}.pt'.format(dir_, i))
             torch.save(data.train_mask, '{}/train_mask_{}.pt'.format(dir_, i))
             #torch.save(data.node_norm, '{}/node_norm_{}.pt'.format(dir_, i))
             torch.save(data.edge_weight, '{}/edge_weight_{}.pt'.format(dir_, i))
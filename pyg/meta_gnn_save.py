@@ -329,8 +329,10 @@ def train():
         if not osp.exists(pref):
             os.mkdir(pref)
         torch.save(data.edge_index, pref+'adj_{}.pt'.format(i))
-        torch.save(data.y, pref+'y_{}.pt'.format(i))
-        torch.save(data.x, pref+'x_{}.pt'.format(i))
+        torch.save(data.n_id, pref+'nid_{}.pt'.format(i))
+        if args["save_features"]:
+            torch.save(data.y, pref+'y_{}.pt'.format(i))
+            torch.save(data.x, pref+'x_{}.pt'.format(i))
         torch.save(data.train_mask, pref+'train_mask{}.pt'.format(i))
         #data = data.to(device)
         ##print('*'*20)
@@ -446,6 +448,7 @@ ap.add_argument("-o", "--output", required=True, help="output directory")
 ap.add_argument("-l", "--loader", type=str, default='s')
 ap.add_argument("-b", "--batch_size", type=int, default=20000)
 ap.add_argument("-s", "--subgs", type=int, default=32)
+ap.add_argument("-f", "--save_features", action="store_true", help="also save x/y of every subgraph, not only its node ids")
 
 args = vars(ap.parse_args())
 
@@ -497,6 +500,8 @@ torch.save(data.x, pref+'x_{}.pt'.format(i))
 torch.save(data.train_mask, pref+'train_mask_{}.pt'.format(i))
 torch.save(data.val_mask, pref+'val_mask_{}.pt'.format(i))
 torch.save(data.test_mask, pref+'test_mask_{}.pt'.format(i))
+# Global id of every node, the loaders slice it into each subgraph like x and y
+data.n_id = torch.arange(data.num_nodes)
 
 #exit()
 logger.info("Graph construction done!")